@@ -0,0 +1,190 @@
+"""Partition content performance snapshots by month and add rollups
+
+Revision ID: 7c4e1a9b2d5f
+Revises: b94ff48a11e9
+Create Date: 2026-10-18 09:00:00.000000
+
+"""
+from datetime import datetime, timezone
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '7c4e1a9b2d5f'
+down_revision = 'b94ff48a11e9'
+branch_labels = None
+depends_on = None
+
+TABLE = 'content_performance_snapshots'
+SEQUENCE = 'content_performance_snapshots_id_seq'
+MONTHS_AHEAD = 3
+
+COLUMNS = (
+    'id, content_item_id, snapshot_time, likes_count, shares_count, comments_count, '
+    'reach_count, click_count, engagement_rate, likes_growth, shares_growth, '
+    'comments_growth, reach_growth, engagement_velocity, viral_coefficient, platform_metrics'
+)
+
+COLUMN_DDL = """
+    content_item_id VARCHAR NOT NULL REFERENCES content_items (id),
+    snapshot_time TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now(),
+    likes_count INTEGER,
+    shares_count INTEGER,
+    comments_count INTEGER,
+    reach_count INTEGER,
+    click_count INTEGER,
+    engagement_rate DOUBLE PRECISION,
+    likes_growth INTEGER,
+    shares_growth INTEGER,
+    comments_growth INTEGER,
+    reach_growth INTEGER,
+    engagement_velocity DOUBLE PRECISION,
+    viral_coefficient DOUBLE PRECISION,
+    platform_metrics JSON
+"""
+
+# Materialized views over the snapshot table; recreated by
+# db/performance_optimizations.create_partitioned_tables
+DEPENDENT_VIEWS = ('content_daily_metrics', 'content_weekly_metrics')
+
+
+def _add_months(value, months):
+    month_index = value.year * 12 + value.month - 1 + months
+    return value.replace(year=month_index // 12, month=month_index % 12 + 1)
+
+
+def _create_indexes():
+    op.create_index('idx_snapshot_content_time', TABLE, ['content_item_id', 'snapshot_time'])
+    op.create_index('ix_content_performance_snapshots_id', TABLE, ['id'])
+    op.create_index('ix_content_performance_snapshots_snapshot_time', TABLE, ['snapshot_time'])
+
+
+def _create_rollups_table():
+    op.create_table('content_performance_rollups',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('content_item_id', sa.String(), nullable=False),
+        sa.Column('granularity', sa.String(8), nullable=False),
+        sa.Column('bucket_start', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('likes_count', sa.Integer(), nullable=True),
+        sa.Column('shares_count', sa.Integer(), nullable=True),
+        sa.Column('comments_count', sa.Integer(), nullable=True),
+        sa.Column('reach_count', sa.Integer(), nullable=True),
+        sa.Column('click_count', sa.Integer(), nullable=True),
+        sa.Column('engagement_rate', sa.Float(), nullable=True),
+        sa.Column('engagement_velocity', sa.Float(), nullable=True),
+        sa.Column('viral_coefficient', sa.Float(), nullable=True),
+        sa.Column('max_engagement_rate', sa.Float(), nullable=True),
+        sa.Column('max_engagement_velocity', sa.Float(), nullable=True),
+        sa.Column('sample_count', sa.Integer(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(['content_item_id'], ['content_items.id']),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('content_item_id', 'granularity', 'bucket_start', name='uq_rollup_content_bucket')
+    )
+    op.create_index('ix_content_performance_rollups_id', 'content_performance_rollups', ['id'])
+    op.create_index('idx_rollup_granularity_bucket', 'content_performance_rollups', ['granularity', 'bucket_start'])
+
+
+def _backfill_rollups(granularity, since=None):
+    """Latest values and peaks per bucket from existing snapshots"""
+    bucket = f"date_trunc('{granularity}', snapshot_time)"
+    where = f"WHERE snapshot_time >= now() - interval '{since}'" if since else ""
+    op.execute(f"""
+        INSERT INTO content_performance_rollups (
+            content_item_id, granularity, bucket_start, likes_count, shares_count, comments_count,
+            reach_count, click_count, engagement_rate, engagement_velocity, viral_coefficient,
+            max_engagement_rate, max_engagement_velocity, sample_count, updated_at
+        )
+        SELECT DISTINCT ON (content_item_id, {bucket})
+            content_item_id, '{granularity}', {bucket},
+            COALESCE(likes_count, 0), COALESCE(shares_count, 0), COALESCE(comments_count, 0),
+            COALESCE(reach_count, 0), COALESCE(click_count, 0), COALESCE(engagement_rate, 0),
+            COALESCE(engagement_velocity, 0), COALESCE(viral_coefficient, 0),
+            COALESCE(MAX(engagement_rate) OVER w, 0), COALESCE(MAX(engagement_velocity) OVER w, 0),
+            COUNT(*) OVER w, snapshot_time
+        FROM {TABLE}
+        {where}
+        WINDOW w AS (PARTITION BY content_item_id, {bucket})
+        ORDER BY content_item_id, {bucket}, snapshot_time DESC
+    """)
+
+
+def upgrade() -> None:
+    """Range-partition snapshots by month on snapshot_time and add hourly/daily rollups"""
+    _create_rollups_table()
+
+    bind = op.get_bind()
+    if bind.dialect.name != 'postgresql':
+        return
+
+    for view in DEPENDENT_VIEWS:
+        op.execute(f"DROP MATERIALIZED VIEW IF EXISTS {view}")
+
+    # Partitioned tables need the partition key in the primary key
+    op.execute(f"""
+        CREATE TABLE {TABLE}_partitioned (
+            id INTEGER NOT NULL DEFAULT nextval('{SEQUENCE}'),
+            {COLUMN_DDL},
+            PRIMARY KEY (id, snapshot_time)
+        ) PARTITION BY RANGE (snapshot_time)
+    """)
+
+    # Monthly partitions from the oldest snapshot through the months ahead
+    oldest = bind.execute(sa.text(f"SELECT min(snapshot_time) FROM {TABLE}")).scalar()
+    now = datetime.now(timezone.utc)
+    month = (oldest or now).replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+    last_month = _add_months(now.replace(day=1, hour=0, minute=0, second=0, microsecond=0), MONTHS_AHEAD)
+    while month <= last_month:
+        next_month = _add_months(month, 1)
+        op.execute(
+            f"CREATE TABLE {TABLE}_y{month.year:04d}m{month.month:02d} "
+            f"PARTITION OF {TABLE}_partitioned "
+            f"FOR VALUES FROM ('{month:%Y-%m-%d}') TO ('{next_month:%Y-%m-%d}')"
+        )
+        month = next_month
+    op.execute(f"CREATE TABLE {TABLE}_default PARTITION OF {TABLE}_partitioned DEFAULT")
+
+    op.execute(f"""
+        INSERT INTO {TABLE}_partitioned ({COLUMNS})
+        SELECT id, content_item_id, COALESCE(snapshot_time, now()), likes_count, shares_count,
+               comments_count, reach_count, click_count, engagement_rate, likes_growth,
+               shares_growth, comments_growth, reach_growth, engagement_velocity,
+               viral_coefficient, platform_metrics
+        FROM {TABLE}
+    """)
+
+    op.execute(f"ALTER SEQUENCE {SEQUENCE} OWNED BY NONE")
+    op.execute(f"DROP TABLE {TABLE}")
+    op.execute(f"ALTER TABLE {TABLE}_partitioned RENAME TO {TABLE}")
+    op.execute(f"ALTER SEQUENCE {SEQUENCE} OWNED BY {TABLE}.id")
+    _create_indexes()
+
+    _backfill_rollups('day')
+    _backfill_rollups('hour', since='30 days')
+
+
+def downgrade() -> None:
+    """Move snapshots back into a plain table and drop rollups"""
+    bind = op.get_bind()
+    if bind.dialect.name == 'postgresql':
+        for view in DEPENDENT_VIEWS:
+            op.execute(f"DROP MATERIALIZED VIEW IF EXISTS {view}")
+
+        op.execute(f"""
+            CREATE TABLE {TABLE}_plain (
+                id INTEGER NOT NULL DEFAULT nextval('{SEQUENCE}') PRIMARY KEY,
+                {COLUMN_DDL.replace('NOT NULL DEFAULT now()', 'DEFAULT now()')}
+            )
+        """)
+        op.execute(f"INSERT INTO {TABLE}_plain ({COLUMNS}) SELECT {COLUMNS} FROM {TABLE}")
+        op.execute(f"ALTER SEQUENCE {SEQUENCE} OWNED BY NONE")
+        op.execute(f"DROP TABLE {TABLE}")
+        op.execute(f"ALTER TABLE {TABLE}_plain RENAME TO {TABLE}")
+        op.execute(f"ALTER SEQUENCE {SEQUENCE} OWNED BY {TABLE}.id")
+        _create_indexes()
+
+    op.drop_index('idx_rollup_granularity_bucket', table_name='content_performance_rollups')
+    op.drop_index('ix_content_performance_rollups_id', table_name='content_performance_rollups')
+    op.drop_table('content_performance_rollups')
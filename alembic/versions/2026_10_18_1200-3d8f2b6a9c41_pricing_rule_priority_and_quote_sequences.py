@@ -0,0 +1,79 @@
+"""Add pricing rule priority/business rules and per-org quote number sequences
+
+Revision ID: 3d8f2b6a9c41
+Revises: 7c4e1a9b2d5f
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+import re
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3d8f2b6a9c41'
+down_revision = '7c4e1a9b2d5f'
+branch_labels = None
+depends_on = None
+
+QUOTE_NUMBER_PATTERN = re.compile(r'^Q-(\d{6})-(\d+)$')
+
+
+def _pricing_rule_columns():
+    return {column['name'] for column in sa.inspect(op.get_bind()).get_columns('pricing_rules')}
+
+
+def _backfill_quote_sequences():
+    """Seed each (organization, month) counter from the highest existing quote number"""
+    bind = op.get_bind()
+    last_values = {}
+    for organization_id, quote_number in bind.execute(sa.text(
+        "SELECT organization_id, quote_number FROM quotes WHERE quote_number LIKE 'Q-%'"
+    )):
+        match = QUOTE_NUMBER_PATTERN.match(quote_number or '')
+        if not match:
+            continue
+        key = (organization_id, match.group(1))
+        last_values[key] = max(last_values.get(key, 0), int(match.group(2)))
+
+    if last_values:
+        sequences = sa.table(
+            'quote_number_sequences',
+            sa.column('organization_id', sa.String()),
+            sa.column('period', sa.String()),
+            sa.column('last_value', sa.Integer())
+        )
+        op.bulk_insert(sequences, [
+            {'organization_id': organization_id, 'period': period, 'last_value': last_value}
+            for (organization_id, period), last_value in last_values.items()
+        ])
+
+
+def upgrade() -> None:
+    """Align pricing_rules with the model and add quote number sequences"""
+    # Older databases were created from 041 (which has these columns), newer
+    # ones from 6fcba57ecf58 (which doesn't)
+    existing = _pricing_rule_columns()
+    if 'priority' not in existing:
+        op.add_column('pricing_rules', sa.Column('priority', sa.Integer(), nullable=False, server_default='0'))
+    if 'business_rules' not in existing:
+        op.add_column('pricing_rules', sa.Column('business_rules', sa.JSON(), nullable=False, server_default='{}'))
+    op.create_index('ix_pricing_rules_org_active_priority', 'pricing_rules',
+                    ['organization_id', 'is_active', 'priority'])
+
+    op.create_table('quote_number_sequences',
+        sa.Column('organization_id', sa.String(), nullable=False),
+        sa.Column('period', sa.String(6), nullable=False),
+        sa.Column('last_value', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.ForeignKeyConstraint(['organization_id'], ['organizations.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('organization_id', 'period')
+    )
+    _backfill_quote_sequences()
+
+
+def downgrade() -> None:
+    """Drop quote number sequences; pricing rule columns are left in place"""
+    op.drop_table('quote_number_sequences')
+    op.drop_index('ix_pricing_rules_org_active_priority', table_name='pricing_rules')
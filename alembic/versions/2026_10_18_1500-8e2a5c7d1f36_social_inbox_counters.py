@@ -0,0 +1,94 @@
+"""Denormalize organization onto social interactions and add inbox counters
+
+Revision ID: 8e2a5c7d1f36
+Revises: 3d8f2b6a9c41
+Create Date: 2026-10-18 15:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8e2a5c7d1f36'
+down_revision = '3d8f2b6a9c41'
+branch_labels = None
+depends_on = None
+
+HIGH_PRIORITY_THRESHOLD = 70
+
+
+def _backfill_interaction_organizations():
+    """Copy organization_id from each interaction's connection"""
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute(
+            "UPDATE social_interactions AS si "
+            "SET organization_id = spc.organization_id::text "
+            "FROM social_platform_connections AS spc "
+            "WHERE si.connection_id = spc.id AND si.organization_id IS NULL"
+        )
+    else:
+        op.execute(
+            "UPDATE social_interactions SET organization_id = ("
+            "SELECT CAST(spc.organization_id AS VARCHAR) FROM social_platform_connections AS spc "
+            "WHERE spc.id = social_interactions.connection_id"
+            ") WHERE organization_id IS NULL AND connection_id IS NOT NULL"
+        )
+    # Keyset pagination compares priority_score; NULLs would drop out of pages
+    op.execute("UPDATE social_interactions SET priority_score = 0 WHERE priority_score IS NULL")
+
+
+def _backfill_inbox_counters():
+    """Seed per-user and organization-wide (user_id 0) counters"""
+    for user_column, user_group in (('user_id', ', user_id'), ('0', '')):
+        op.execute(
+            "INSERT INTO social_inbox_counters "
+            "(organization_id, user_id, platform, status, is_high_priority, count) "
+            f"SELECT organization_id, {user_column}, platform, COALESCE(status, 'unread'), "
+            f"COALESCE(priority_score, 0) >= {HIGH_PRIORITY_THRESHOLD}, COUNT(*) "
+            "FROM social_interactions WHERE organization_id IS NOT NULL "
+            f"GROUP BY organization_id, platform, COALESCE(status, 'unread'), "
+            f"COALESCE(priority_score, 0) >= {HIGH_PRIORITY_THRESHOLD}{user_group}"
+        )
+
+
+def upgrade() -> None:
+    """Add social_interactions.organization_id, inbox indexes and counters"""
+    op.add_column('social_interactions', sa.Column('organization_id', sa.String(), nullable=True))
+    op.create_foreign_key(
+        'fk_social_interactions_organization_id', 'social_interactions', 'organizations',
+        ['organization_id'], ['id'], ondelete='CASCADE'
+    )
+    _backfill_interaction_organizations()
+
+    op.create_index(
+        'idx_social_interaction_org_inbox', 'social_interactions',
+        ['organization_id', 'priority_score', 'received_at', 'id'],
+        postgresql_include=['status', 'platform', 'user_id', 'intent']
+    )
+    op.create_index(
+        'idx_social_interaction_org_status_inbox', 'social_interactions',
+        ['organization_id', 'status', 'priority_score', 'received_at', 'id'],
+        postgresql_include=['platform', 'user_id', 'intent']
+    )
+
+    op.create_table('social_inbox_counters',
+        sa.Column('organization_id', sa.String(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('platform', sa.String(), nullable=False),
+        sa.Column('status', sa.String(), nullable=False),
+        sa.Column('is_high_priority', sa.Boolean(), nullable=False),
+        sa.Column('count', sa.Integer(), nullable=False, server_default='0'),
+        sa.ForeignKeyConstraint(['organization_id'], ['organizations.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('organization_id', 'user_id', 'platform', 'status', 'is_high_priority')
+    )
+    _backfill_inbox_counters()
+
+
+def downgrade() -> None:
+    """Drop inbox counters, indexes and social_interactions.organization_id"""
+    op.drop_table('social_inbox_counters')
+    op.drop_index('idx_social_interaction_org_status_inbox', table_name='social_interactions')
+    op.drop_index('idx_social_interaction_org_inbox', table_name='social_interactions')
+    op.drop_constraint('fk_social_interactions_organization_id', 'social_interactions', type_='foreignkey')
+    op.drop_column('social_interactions', 'organization_id')
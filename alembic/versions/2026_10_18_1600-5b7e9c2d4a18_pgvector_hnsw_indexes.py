@@ -0,0 +1,68 @@
+"""Index embeddings with HNSW over a halfvec cast
+
+Revision ID: 5b7e9c2d4a18
+Revises: 8e2a5c7d1f36
+Create Date: 2026-10-18 16:00:00.000000
+
+"""
+from alembic import op
+from sqlalchemy import text
+
+
+# revision identifiers, used by Alembic.
+revision = '5b7e9c2d4a18'
+down_revision = '8e2a5c7d1f36'
+branch_labels = None
+depends_on = None
+
+# text-embedding-3-large; HNSW only indexes vector columns up to 2000 dimensions
+EMBEDDING_DIMENSIONS = 3072
+HNSW_M = 16
+HNSW_EF_CONSTRUCTION = 64
+EMBEDDING_TABLES = ('content_embeddings', 'memory_embeddings')
+
+
+def _has_vector_column(bind, table: str) -> bool:
+    return bool(bind.execute(text(
+        "SELECT 1 FROM information_schema.columns "
+        "WHERE table_schema = current_schema() AND table_name = :table "
+        "AND column_name = 'embedding' AND udt_name = 'vector'"
+    ), {'table': table}).scalar())
+
+
+def upgrade() -> None:
+    """Replace the plain vector indexes with halfvec HNSW indexes"""
+    bind = op.get_bind()
+    if bind.dialect.name != 'postgresql':
+        return
+
+    # Building on a populated table takes a while; don't block writes meanwhile
+    with op.get_context().autocommit_block():
+        for table in EMBEDDING_TABLES:
+            if not _has_vector_column(bind, table):
+                continue
+            # From 009; cannot exist on 3072-dimension columns, drop in case it does
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {table}_embedding_idx")
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_{table}_embedding_hnsw ON {table} "
+                f"USING hnsw ((embedding::halfvec({EMBEDDING_DIMENSIONS})) halfvec_cosine_ops) "
+                f"WITH (m = {HNSW_M}, ef_construction = {HNSW_EF_CONSTRUCTION})"
+            )
+
+        if _has_vector_column(bind, 'memory_embeddings'):
+            op.execute(
+                "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_memory_embeddings_user_type "
+                "ON memory_embeddings (user_id, memory_type)"
+            )
+
+
+def downgrade() -> None:
+    """Drop the halfvec HNSW indexes"""
+    bind = op.get_bind()
+    if bind.dialect.name != 'postgresql':
+        return
+
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_memory_embeddings_user_type")
+        for table in EMBEDDING_TABLES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS ix_{table}_embedding_hnsw")
@@ -0,0 +1,34 @@
+"""Add retention cursors for chunked, resumable retention deletes
+
+Revision ID: 9a3c6e1f2b74
+Revises: 5b7e9c2d4a18
+Create Date: 2026-10-18 17:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9a3c6e1f2b74'
+down_revision = '5b7e9c2d4a18'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create retention_cursors"""
+    op.create_table('retention_cursors',
+        sa.Column('category', sa.String(50), nullable=False),
+        sa.Column('target', sa.String(100), nullable=False),
+        sa.Column('last_key', sa.String(), nullable=True),
+        sa.Column('rows_deleted', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('started_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.PrimaryKeyConstraint('category', 'target')
+    )
+
+
+def downgrade() -> None:
+    """Drop retention_cursors"""
+    op.drop_table('retention_cursors')
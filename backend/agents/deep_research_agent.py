@@ -15,6 +15,7 @@ from dataclasses import dataclass, asdict
 from pathlib import Path
 import hashlib
 import time
+import weakref
 
 from openai import OpenAI
 from backend.core.config import get_settings
@@ -32,6 +33,26 @@ except ImportError:
     from backend.core.vector_store_mock import VectorStoreMock as VectorStore
 
 from backend.agents.tools import web_scraper, openai_tool
+from backend.services.research_search_cache import get_research_search_cache, normalize_query, normalize_url
+
+# Topics researched at once within one industry run
+TOPIC_CONCURRENCY = 4
+# Requests in flight per external provider, shared by every run on the loop
+PROVIDER_CONCURRENCY = {
+    "openai": 4,
+    "serper": 5,
+    "scrape": 8,
+}
+
+
+def _is_json(text: Any) -> bool:
+    """True for an LLM reply that parses as JSON, so only usable analyses are cached"""
+    try:
+        json.loads(text)
+    except (TypeError, ValueError):
+        return False
+    return True
+
 
 @dataclass
 class ResearchTopic:
@@ -125,6 +146,10 @@ class DeepResearchAgent:
         # Create directories
         for path in [self.knowledge_base_path, self.research_cache_path, self.intelligence_reports_path]:
             path.mkdir(parents=True, exist_ok=True)
+        
+        # Shared across industries and tenants researched by this process
+        self.search_cache = get_research_search_cache()
+        self._provider_limits = weakref.WeakKeyDictionary()
             
         logger.info("Deep Research Agent initialized with GPT-5 and GPT-5 mini")
     
@@ -194,6 +219,19 @@ class DeepResearchAgent:
             logger.error(f"Failed to initialize research topics: {e}")
             return self._get_default_research_topics(industry)
     
+    def _provider_limit(self, provider: str) -> asyncio.Semaphore:
+        """Concurrency limit for an external provider on the running event loop"""
+        loop = asyncio.get_running_loop()
+        limits = self._provider_limits.setdefault(loop, {})
+        if provider not in limits:
+            limits[provider] = asyncio.Semaphore(PROVIDER_CONCURRENCY[provider])
+        return limits[provider]
+    
+    async def _call_provider(self, provider: str, func, *args, **kwargs):
+        """Run a blocking provider call in a thread under its concurrency limit"""
+        async with self._provider_limit(provider):
+            return await asyncio.to_thread(func, *args, **kwargs)
+    
     async def conduct_weekly_research(self, industry: str, topics: List[ResearchTopic]) -> IndustryIntelligence:
         """
         Conduct comprehensive weekly research across all topics
@@ -209,24 +247,25 @@ class DeepResearchAgent:
         start_time = datetime.utcnow()
         research_period = (start_time - timedelta(days=7), start_time)
         
-        all_findings = []
+        # Research topics concurrently; provider limits pace the external calls
+        topic_limit = asyncio.Semaphore(TOPIC_CONCURRENCY)
         
-        # Research each topic
-        for topic in topics:
-            try:
-                logger.info(f"Researching topic: {topic.name}")
-                findings = await self._research_topic(topic)
-                all_findings.extend(findings)
-                
-                # Update last researched timestamp
-                topic.last_researched = start_time
-                
-                # Brief pause to respect rate limits
-                await asyncio.sleep(1)
-                
-            except Exception as e:
-                logger.error(f"Failed to research topic {topic.name}: {e}")
-                continue
+        async def research(topic: ResearchTopic) -> List[ResearchFinding]:
+            async with topic_limit:
+                try:
+                    logger.info(f"Researching topic: {topic.name}")
+                    findings = await self._research_topic(topic)
+                    
+                    # Update last researched timestamp
+                    topic.last_researched = start_time
+                    return findings
+                    
+                except Exception as e:
+                    logger.error(f"Failed to research topic {topic.name}: {e}")
+                    return []
+        
+        topic_findings = await asyncio.gather(*(research(topic) for topic in topics))
+        all_findings = [finding for findings in topic_findings for finding in findings]
         
         # Analyze and synthesize findings
         intelligence_report = await self._synthesize_intelligence(
@@ -240,7 +279,10 @@ class DeepResearchAgent:
         # Generate actionable insights
         await self._generate_content_opportunities(intelligence_report)
         
-        logger.info(f"Weekly research completed. Found {len(all_findings)} insights.")
+        logger.info(
+            f"Weekly research completed. Found {len(all_findings)} insights. "
+            f"Search cache: {self.search_cache.get_stats()}"
+        )
         return intelligence_report
     
     async def _research_topic(self, topic: ResearchTopic) -> List[ResearchFinding]:
@@ -294,17 +336,21 @@ class DeepResearchAgent:
             return [f"{topic.name} {kw}" for kw in topic.keywords[:10]]
     
     async def _search_web(self, query: str) -> List[Dict[str, Any]]:
-        """Search the web using multiple sources"""
+        """Search the web using multiple sources, through the shared search cache"""
         results = []
         
         try:
             # Use Serper API if available
             if settings.serper_api_key and settings.serper_api_key != "your_serper_api_key_here":
-                serper_results = await self._search_serper(query)
+                serper_results = await self.search_cache.get_or_compute(
+                    "search:serper", normalize_query(query), lambda: self._search_serper(query)
+                )
                 results.extend(serper_results)
             else:
                 # Fallback to basic web scraping
-                basic_results = await self._basic_web_search(query)
+                basic_results = await self.search_cache.get_or_compute(
+                    "search:basic", normalize_query(query), lambda: self._basic_web_search(query)
+                )
                 results.extend(basic_results)
                 
         except Exception as e:
@@ -329,7 +375,7 @@ class DeepResearchAgent:
         }
         
         try:
-            response = requests.post(url, headers=headers, json=payload, timeout=10)
+            response = await self._call_provider("serper", requests.post, url, headers=headers, json=payload, timeout=10)
             response.raise_for_status()
             data = response.json()
             
@@ -376,8 +422,12 @@ class DeepResearchAgent:
     async def _process_search_result(self, result: Dict[str, Any], topic: ResearchTopic) -> Optional[ResearchFinding]:
         """Process and analyze a search result"""
         try:
-            # Scrape content
-            scraped_data = web_scraper.scrape_url(result["url"])
+            # Scrape content; failed scrapes are not cached so a later run retries
+            scraped_data = await self.search_cache.get_or_compute(
+                "page", normalize_url(result["url"]),
+                lambda: self._call_provider("scrape", web_scraper.scrape_url, result["url"]),
+                cacheable=lambda data: data.get("status") == "success"
+            )
             
             if scraped_data["status"] != "success":
                 return None
@@ -450,7 +500,13 @@ class DeepResearchAgent:
         """
         
         try:
-            response = await self._call_gpt5_mini_with_search(prompt, use_web_search=True)
+            # The same page comes up for the same topic across industries and tenants
+            analysis_key = f"{normalize_url(result.get('url', ''))}\n{topic.name}\n{','.join(topic.keywords)}"
+            response = await self.search_cache.get_or_compute(
+                "analysis", analysis_key,
+                lambda: self._call_gpt5_mini_with_search(prompt, use_web_search=True),
+                cacheable=_is_json
+            )
             analysis = json.loads(response)
             return analysis
         except Exception as e:
@@ -683,7 +739,8 @@ class DeepResearchAgent:
         try:
             if use_web_search:
                 # Use Responses API with web search
-                response = self.client.responses.create(
+                response = await self._call_provider(
+                    "openai", self.client.responses.create,
                     model=self.routine_research_model,
                     input=f"You are an expert research analyst. Use web search to provide current, thorough research on: {prompt}",
                     tools=[
@@ -695,7 +752,8 @@ class DeepResearchAgent:
                 return response.output_text if hasattr(response, 'output_text') else str(response)
             else:
                 # Fallback to Chat Completions without web search
-                response = self.client.chat.completions.create(
+                response = await self._call_provider(
+                    "openai", self.client.chat.completions.create,
                     model=self.routine_research_model,
                     messages=[
                         {"role": "system", "content": "You are an expert research analyst and industry intelligence specialist. Provide thorough, accurate, and actionable insights based on your knowledge."},
@@ -714,7 +772,8 @@ class DeepResearchAgent:
         """Call GPT-5 full model with enhanced reasoning and web search for deep research"""
         try:
             # Use Responses API with web search for deep research
-            response = self.client.responses.create(
+            response = await self._call_provider(
+                "openai", self.client.responses.create,
                 model=self.deep_research_model,
                 input=f"Conduct deep industry analysis with comprehensive web research on: {prompt}. Provide well-cited insights with strategic implications.",
                 tools=[
@@ -737,7 +796,8 @@ class DeepResearchAgent:
         """Fallback method for research calls without built-in web search"""
         try:
             # Use the old method as fallback
-            response = self.client.chat.completions.create(
+            response = await self._call_provider(
+                "openai", self.client.chat.completions.create,
                 model="gpt-5-mini",  # Fallback to GPT-5 mini model
                 messages=[
                     {"role": "system", "content": "You are an expert research analyst and industry intelligence specialist. Provide thorough, accurate, and actionable insights."},
@@ -780,7 +840,10 @@ class DeepResearchAgent:
         Return results as a JSON array of research findings with proper citations.
         """
         
-        response = await self._call_gpt5_mini_with_search(prompt, temperature=0.3, use_web_search=True)
+        response = await self.search_cache.get_or_compute(
+            "research:standard", normalize_query(prompt),
+            lambda: self._call_gpt5_mini_with_search(prompt, temperature=0.3, use_web_search=True)
+        )
         return await self._parse_research_response(response, topic)
     
     async def _research_topic_deep(self, topic: ResearchTopic) -> List[ResearchFinding]:
@@ -813,7 +876,10 @@ class DeepResearchAgent:
         Return as detailed JSON with extensive research findings and analysis.
         """
         
-        response = await self._call_gpt5_deep_research(prompt, temperature=0.2)
+        response = await self.search_cache.get_or_compute(
+            "research:deep", normalize_query(prompt),
+            lambda: self._call_gpt5_deep_research(prompt, temperature=0.2)
+        )
         return await self._parse_research_response(response, topic)
     
     async def _research_topic_fallback(self, topic: ResearchTopic) -> List[ResearchFinding]:
@@ -826,21 +892,28 @@ class DeepResearchAgent:
         # Multi-source research
         search_queries = await self._generate_search_queries(topic)
         
-        for query in search_queries[:config["sources"]]:
-            try:
-                # Web search and scraping
-                search_results = await self._search_web(query)
-                
-                for result in search_results[:5]:  # Top 5 results per query
-                    finding = await self._process_search_result(result, topic)
-                    if finding and finding.relevance_score >= self.min_relevance_threshold:
-                        findings.append(finding)
-                        
-                await asyncio.sleep(0.5)  # Rate limiting
-                
-            except Exception as e:
-                logger.warning(f"Search query failed: {query} - {e}")
+        queries = search_queries[:config["sources"]]
+        search_results = await asyncio.gather(
+            *(self._search_web(query) for query in queries), return_exceptions=True
+        )
+        
+        # Queries overlap, so the same page turns up several times; process it once
+        unique_results = {}
+        for query, results in zip(queries, search_results):
+            if isinstance(results, Exception):
+                logger.warning(f"Search query failed: {query} - {results}")
                 continue
+            for result in results[:5]:  # Top 5 results per query
+                if result.get("url"):
+                    unique_results.setdefault(normalize_url(result["url"]), result)
+        
+        processed = await asyncio.gather(
+            *(self._process_search_result(result, topic) for result in unique_results.values())
+        )
+        findings = [
+            finding for finding in processed
+            if finding and finding.relevance_score >= self.min_relevance_threshold
+        ]
         
         # Analyze and rank findings
         findings = await self._analyze_and_rank_findings(findings, topic)
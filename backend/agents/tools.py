@@ -6,6 +6,7 @@ import json
 import logging
 from typing import Dict, List, Any
 from backend.core.config import get_settings
+from backend.core.exact_knn import ExactKNNIndex
 from backend.core.openai_utils import get_openai_completion_params
 
 settings = get_settings()
@@ -428,6 +429,8 @@ class FAISSMemoryTool:
                 self.faiss = None
                 
         self.stored_content = []
+        # NumPy exact search when FAISS is missing; rows line up with stored_content
+        self.exact_index = None
     
     def embed_text(self, text: str) -> List[float]:
         """Create embedding for text"""
@@ -458,6 +461,10 @@ class FAISSMemoryTool:
                 'metadata': metadata,
                 'embedding': embedding
             }
+            if self.index is None:
+                if self.exact_index is None:
+                    self.exact_index = ExactKNNIndex(len(embedding))
+                self.exact_index.add(embedding)
             self.stored_content.append(item)
             
             # Add to FAISS index if available
@@ -508,32 +515,18 @@ class FAISSMemoryTool:
                 
                 return results
                 
-            else:
-                # Fallback: manual cosine similarity calculation
-                def cosine_similarity(a, b):
-                    if not a or not b:
-                        return 0.0
-                    dot_product = sum(x * y for x, y in zip(a, b))
-                    norm_a = sum(x * x for x in a) ** 0.5
-                    norm_b = sum(x * x for x in b) ** 0.5
-                    if norm_a == 0 or norm_b == 0:
-                        return 0.0
-                    return dot_product / (norm_a * norm_b)
-                
-                # Calculate similarities manually
-                results = []
-                for item in self.stored_content:
-                    if item['embedding']:
-                        similarity = cosine_similarity(query_embedding, item['embedding'])
-                        results.append({
-                            'content': item['content'],
-                            'metadata': item['metadata'],
-                            'similarity': similarity
-                        })
-                
-                # Sort by similarity and return top_k
-                results.sort(key=lambda x: x['similarity'], reverse=True)
-                return results[:top_k]
+            elif self.exact_index is not None:
+                # Fallback: one matrix-vector product over the pre-normalized embeddings
+                similarities, indices = self.exact_index.search(query_embedding, top_k)
+                return [
+                    {
+                        'content': self.stored_content[idx]['content'],
+                        'metadata': self.stored_content[idx]['metadata'],
+                        'similarity': float(similarity)
+                    }
+                    for similarity, idx in zip(similarities, indices)
+                ]
+            return []
                 
         except Exception as e:
             logger.error(f"Similarity search failed: {e}")
@@ -1,144 +1,185 @@
 """
 Centralized router registry for all API endpoints
+
+Routers are declared by module name and imported only when an app is built,
+one module at a time, so a process can serve a subset of groups (see the
+API_ROUTER_GROUPS setting) without importing the rest, a router whose
+dependencies are missing fails alone instead of taking the registry down,
+and each import is timed for the startup profile.
+
+A router may only be skipped for a missing package in
+OPTIONAL_ROUTER_PACKAGES; any other import failure is logged as an error
+and fails the startup profile check in CI.
 """
-from . import (
-    auth_open,  # New open SaaS authentication
-    auth_fastapi_users,
-    admin,
-    two_factor,
-    user_credentials,
-    user_settings,  # User preferences and configuration
-    ai_suggestions,  # AI contextual suggestions
-    content,
-    goals,
-    memory,
-    workflow_v2,
-    monitoring,
-    diagnostics,
-    content_history,
-    notifications,
-    vector_search,
-    vector_search_production,
-    similarity,
-    deep_research,
-    integration_services,
-    feature_flags,
-    autonomous,
-    performance_monitoring,
-    social_platforms,
-    social_inbox,  # Phase 3A social inbox for managing interactions
-    organizations,
-    system_logs,  # System logging and error tracking
-    database_health,  # Database schema health checks
-    partner_oauth,  # Partner OAuth for multi-tenant connections
-    assistant_chat,  # OpenAI Assistant chat for landing page
-    data_deletion,  # GA Checklist: Data deletion endpoints for compliance
-    webhooks,  # GA Checklist: Meta webhook endpoints for compliance
-    webhook_reliability,  # P0-11c: Webhook reliability monitoring and management
-    legal_documents,  # GA Checklist: Privacy Policy & Terms URLs for platform compliance
-    memory_vector,  # Vector memory endpoints used by frontend
-    linkedin_oauth,  # LinkedIn OAuth 2.0 integration for autonomous posting
-    dashboard_metrics,  # Dashboard metrics API for frontend consumption
-    websockets,  # WebSocket endpoints for real-time status updates
-    multi_tenant,  # Multi-tenant organization and RBAC management
-    billing,  # Stripe billing and subscription management
-    plans,  # Subscription plans and feature gating
-    plan_billing,  # Enhanced plan-based billing with Stripe integration
-    plan_aware_images,  # Plan-aware image generation with usage tracking
-    performance,  # Performance monitoring and optimization
-    monitoring_metrics,  # Prometheus and Sentry monitoring integration
-    sre_dashboard,  # SRE dashboard for enhanced observability and operations
-    observability,  # OpenTelemetry observability and metrics endpoints
-    plan_management,  # Plan management and quota enforcement API
-    data_export,  # GDPR/CCPA data export endpoints for privacy compliance
-    data_retention,  # Data retention policy management and automated cleanup
-    key_rotation,  # Encryption key rotation schedule and automation
-    template_validation,  # Template coverage validation system for AI models
-    error_taxonomy,  # Comprehensive error taxonomy mapping and classification
-    pw_settings,  # PW-SETTINGS-ADD-001: Pressure washing settings namespaces API
-    pw_pricing,  # PW-PRICING-ADD-001: Pressure washing pricing engine with org-scoping
-    pw_quotes,  # PW-PRICING-ADD-002: Pressure washing quote endpoints with status lifecycle
-    secure_media,  # PW-SEC-ADD-001: Secure media storage with signed URLs
-    leads,  # PW-DM-ADD-002: Lead management and media attachment API
-    jobs,  # PW-DM-ADD-001: Job management and scheduling API
-    weather,  # PW-WEATHER-ADD-001: Weather thresholds and job rescheduling API
-    business_analytics,  # PW-ANALYTICS-ADD-001: Business KPIs analytics with org-scoped data
-)
-
-# Import CSRF router
-try:
-    from backend.core.csrf_protection import csrf_router
-    CSRF_ROUTER_AVAILABLE = True
-except ImportError:
-    CSRF_ROUTER_AVAILABLE = False
-    csrf_router = None
-
-# All routers to be registered with the FastAPI app
-ROUTERS = [
-    auth_fastapi_users.router,  # FastAPI Users authentication (primary)
-    auth_open.router,  # Open SaaS authentication (no registration keys)
-    two_factor.router,  # Two-Factor Authentication endpoints
-    admin.router,  # Admin authentication and management system
-    user_credentials.router,  # User social media credentials management
-    user_settings.router,  # User preferences and configuration
-    ai_suggestions.router,  # AI contextual suggestions
-    content.router,
-    goals.router,
-    memory.router,
-    workflow_v2.router,
-    monitoring.router,
-    monitoring.analytics_router,  # /api/analytics endpoints
-    diagnostics.router,
-    content_history.router,
-    notifications.router,
-    vector_search_production.router,  # Production pgvector search (primary)
-    vector_search.router,  # Legacy vector search (will be phased out)
-    memory_vector.router,  # Vector memory endpoints used by frontend
-    similarity.router,
-    deep_research.router,
-    integration_services.router,
-    feature_flags.router,
-    autonomous.router,
-    # performance_monitoring.router,  # Middleware only - no router
-    social_platforms.router,  # Social media platform connections and posting
-    social_inbox.router,  # Phase 3A social inbox for managing interactions
-    organizations.router,  # Multi-tenant organization management
-    system_logs.router,  # System logging and error tracking endpoints
-    database_health.router,  # Database schema health monitoring
-    partner_oauth.router,  # Partner OAuth for multi-tenant connections
-    assistant_chat.router,  # OpenAI Assistant chat for landing page
-    data_deletion.router,  # GA Checklist: Data deletion endpoints for compliance
-    webhooks.router,  # GA Checklist: Meta webhook endpoints for compliance
-    webhook_reliability.router,  # P0-11c: Webhook reliability monitoring and management
-    legal_documents.router,  # GA Checklist: Privacy Policy & Terms URLs for platform compliance
-    linkedin_oauth.router,  # LinkedIn OAuth 2.0 integration for autonomous posting
-    dashboard_metrics.router,  # Dashboard metrics API for frontend consumption
-    websockets.router,  # WebSocket endpoints for real-time status updates
-    multi_tenant.router,  # Multi-tenant organization and RBAC management
-    billing.router,  # Stripe billing and subscription management
-    plans.router,  # Subscription plans and feature gating
-    plan_billing.router,  # Enhanced plan-based billing with Stripe integration
-    plan_aware_images.router,  # Plan-aware image generation with usage tracking
-    performance.router,  # Performance monitoring and optimization
-    monitoring_metrics.router,  # Prometheus and Sentry monitoring integration
-    sre_dashboard.router,  # SRE dashboard for enhanced observability and operations
-    observability.router,  # OpenTelemetry observability and metrics endpoints
-    plan_management.router,  # Plan management and quota enforcement API
-    data_export.router,  # GDPR/CCPA data export endpoints for privacy compliance
-    data_retention.router,  # Data retention policy management and automated cleanup
-    key_rotation.router,  # Encryption key rotation schedule and automation
-    template_validation.router,  # Template coverage validation system for AI models
-    error_taxonomy.router,  # Comprehensive error taxonomy mapping and classification
-    pw_settings.router,  # PW-SETTINGS-ADD-001: Pressure washing settings namespaces API
-    pw_pricing.router,  # PW-PRICING-ADD-001: Pressure washing pricing engine with org-scoping
-    pw_quotes.router,  # PW-PRICING-ADD-002: Pressure washing quote endpoints with status lifecycle
-    secure_media.router,  # PW-SEC-ADD-001: Secure media storage with signed URLs
-    leads.router,  # PW-DM-ADD-002: Lead management and media attachment API
-    jobs.router,  # PW-DM-ADD-001: Job management and scheduling API
-    weather.router,  # PW-WEATHER-ADD-001: Weather thresholds and job rescheduling API
-    business_analytics.router,  # PW-ANALYTICS-ADD-001: Business KPIs analytics with org-scoped data
+import importlib
+import logging
+from dataclasses import dataclass
+from typing import Any, Iterable, List, Optional, Tuple, Union
+
+from backend.core.startup_profile import StartupProfile
+
+logger = logging.getLogger(__name__)
+
+# Third-party packages a deployment may leave out, skipping the routers that need them
+OPTIONAL_ROUTER_PACKAGES = frozenset({
+    "boto3",  # secure_media
+    "psutil",  # monitoring
+    "stripe",  # billing, plan_billing
+})
+
+
+@dataclass(frozen=True)
+class RouterSpec:
+    """Where a router lives and which group serves it"""
+    module: str
+    attribute: str = "router"
+    group: str = "core"
+    package: str = "backend.api"
+
+    @property
+    def import_path(self) -> str:
+        return f"{self.package}.{self.module}" if self.package else self.module
+
+    @property
+    def name(self) -> str:
+        return self.module if self.attribute == "router" else f"{self.module}.{self.attribute}"
+
+
+# All routers to be registered with the FastAPI app, in registration order
+ROUTER_SPECS: List[RouterSpec] = [
+    RouterSpec("auth_fastapi_users", group="auth"),  # FastAPI Users authentication (primary)
+    RouterSpec("auth_open", group="auth"),  # Open SaaS authentication (no registration keys)
+    RouterSpec("two_factor", group="auth"),  # Two-Factor Authentication endpoints
+    RouterSpec("admin", group="admin"),  # Admin authentication and management system
+    RouterSpec("user_credentials", group="auth"),  # User social media credentials management
+    RouterSpec("user_settings", group="auth"),  # User preferences and configuration
+    RouterSpec("ai_suggestions", group="ai"),  # AI contextual suggestions
+    RouterSpec("content", group="content"),
+    RouterSpec("goals", group="content"),
+    RouterSpec("memory", group="content"),
+    RouterSpec("workflow_v2", group="ai"),
+    RouterSpec("monitoring", group="ops"),
+    RouterSpec("diagnostics", group="ops"),
+    RouterSpec("content_history", group="content"),
+    RouterSpec("notifications", group="content"),
+    RouterSpec("vector_search_production", group="ai"),  # Production pgvector search (primary)
+    RouterSpec("vector_search", group="ai"),  # Legacy vector search (will be phased out)
+    RouterSpec("memory_vector", group="content"),  # Vector memory endpoints used by frontend
+    RouterSpec("similarity", group="ai"),
+    RouterSpec("deep_research", group="ai"),
+    RouterSpec("integration_services", group="social"),
+    RouterSpec("feature_flags", group="admin"),
+    RouterSpec("autonomous", group="ai"),
+    RouterSpec("social_platforms", group="social"),  # Social media platform connections and posting
+    RouterSpec("social_inbox", group="social"),  # Phase 3A social inbox for managing interactions
+    RouterSpec("organizations", group="admin"),  # Multi-tenant organization management
+    RouterSpec("system_logs", group="admin"),  # System logging and error tracking endpoints
+    RouterSpec("database_health", group="admin"),  # Database schema health monitoring
+    RouterSpec("partner_oauth", group="social"),  # Partner OAuth for multi-tenant connections
+    RouterSpec("assistant_chat", group="ai"),  # OpenAI Assistant chat for landing page
+    RouterSpec("data_deletion", group="compliance"),  # GA Checklist: Data deletion endpoints for compliance
+    RouterSpec("webhooks", group="social"),  # GA Checklist: Meta webhook endpoints for compliance
+    RouterSpec("webhook_reliability", group="social"),  # P0-11c: Webhook reliability monitoring and management
+    RouterSpec("legal_documents", group="compliance"),  # GA Checklist: Privacy Policy & Terms URLs for platform compliance
+    RouterSpec("linkedin_oauth", group="social"),  # LinkedIn OAuth 2.0 integration for autonomous posting
+    RouterSpec("dashboard_metrics", group="content"),  # Dashboard metrics API for frontend consumption
+    RouterSpec("websockets", group="content"),  # WebSocket endpoints for real-time status updates
+    RouterSpec("multi_tenant", group="admin"),  # Multi-tenant organization and RBAC management
+    RouterSpec("billing", group="billing"),  # Stripe billing and subscription management
+    RouterSpec("plans", group="billing"),  # Subscription plans and feature gating
+    RouterSpec("plan_billing", group="billing"),  # Enhanced plan-based billing with Stripe integration
+    RouterSpec("plan_aware_images", group="ai"),  # Plan-aware image generation with usage tracking
+    RouterSpec("performance", group="ops"),  # Performance monitoring and optimization
+    RouterSpec("monitoring_metrics", group="ops"),  # Prometheus and Sentry monitoring integration
+    RouterSpec("sre_dashboard", group="ops"),  # SRE dashboard for enhanced observability and operations
+    RouterSpec("observability", group="ops"),  # OpenTelemetry observability and metrics endpoints
+    RouterSpec("plan_management", group="billing"),  # Plan management and quota enforcement API
+    RouterSpec("data_export", group="compliance"),  # GDPR/CCPA data export endpoints for privacy compliance
+    RouterSpec("data_retention", group="compliance"),  # Data retention policy management and automated cleanup
+    RouterSpec("key_rotation", group="admin"),  # Encryption key rotation schedule and automation
+    RouterSpec("template_validation", group="ai"),  # Template coverage validation system for AI models
+    RouterSpec("error_taxonomy", group="ops"),  # Comprehensive error taxonomy mapping and classification
+    RouterSpec("pw_settings", group="pressure_washing"),  # PW-SETTINGS-ADD-001: Pressure washing settings namespaces API
+    RouterSpec("pw_pricing", group="pressure_washing"),  # PW-PRICING-ADD-001: Pressure washing pricing engine with org-scoping
+    RouterSpec("pw_quotes", group="pressure_washing"),  # PW-PRICING-ADD-002: Pressure washing quote endpoints with status lifecycle
+    RouterSpec("secure_media", group="pressure_washing"),  # PW-SEC-ADD-001: Secure media storage with signed URLs
+    RouterSpec("leads", group="pressure_washing"),  # PW-DM-ADD-002: Lead management and media attachment API
+    RouterSpec("jobs", group="pressure_washing"),  # PW-DM-ADD-001: Job management and scheduling API
+    RouterSpec("weather", group="pressure_washing"),  # PW-WEATHER-ADD-001: Weather thresholds and job rescheduling API
+    RouterSpec("business_analytics", group="pressure_washing"),  # PW-ANALYTICS-ADD-001: Business KPIs analytics with org-scoped data
+    # performance_monitoring: middleware only - no router
+    RouterSpec("backend.core.csrf_protection", attribute="csrf_router", group="auth", package=""),  # CSRF token generation and validation endpoints
 ]
 
-# Add CSRF router if available
-if CSRF_ROUTER_AVAILABLE and csrf_router:
-    ROUTERS.append(csrf_router)  # CSRF token generation and validation endpoints
+ROUTER_GROUPS = tuple(dict.fromkeys(spec.group for spec in ROUTER_SPECS))
+
+
+def parse_groups(groups: Union[str, Iterable[str], None]) -> Optional[List[str]]:
+    """Normalize a group selection; None means every group"""
+    if groups is None:
+        return None
+    if isinstance(groups, str):
+        groups = groups.split(",")
+    selected = [group.strip() for group in groups if group and group.strip()]
+    if not selected or "all" in selected:
+        return None
+    unknown = sorted(set(selected) - set(ROUTER_GROUPS))
+    if unknown:
+        raise ValueError(f"Unknown router groups {unknown}; expected some of {list(ROUTER_GROUPS)}")
+    return selected
+
+
+def select_router_specs(groups: Union[str, Iterable[str], None] = None) -> List[RouterSpec]:
+    """Specs for the selected groups, in registration order"""
+    selected = parse_groups(groups)
+    return [spec for spec in ROUTER_SPECS if selected is None or spec.group in selected]
+
+
+def missing_optional_package(error: BaseException) -> Optional[str]:
+    """The optional package whose absence caused an import error, if that is the cause"""
+    if isinstance(error, ModuleNotFoundError) and error.name:
+        package = error.name.split(".")[0]
+        if package in OPTIONAL_ROUTER_PACKAGES:
+            return package
+    return None
+
+
+def load_routers(
+    groups: Union[str, Iterable[str], None] = None,
+    profile: Optional[StartupProfile] = None
+) -> Tuple[List[Tuple[RouterSpec, Any]], List[Tuple[str, str]]]:
+    """
+    Import the routers for the selected groups
+
+    Args:
+        groups: Group names, a comma-separated string, "all" or None for every group
+        profile: Startup profile to record each module's import cost in
+
+    Returns:
+        (spec, router) pairs that loaded and (name, error) pairs that did not
+    """
+    profile = profile or StartupProfile()
+    loaded = []
+    failed = []
+    for spec in select_router_specs(groups):
+        try:
+            with profile.measure(f"router:{spec.name}"):
+                router = getattr(importlib.import_module(spec.import_path), spec.attribute)
+        except Exception as e:
+            failed.append((spec.name, f"{type(e).__name__}: {e}"))
+            package = missing_optional_package(e)
+            if package:
+                profile.entries[-1].optional = True
+                logger.warning(f"Router module '{spec.name}' skipped, optional package '{package}' is not installed")
+            else:
+                logger.error(f"Router module '{spec.name}' failed to import: {e}")
+            continue
+        loaded.append((spec, router))
+    return loaded, failed
+
+
+def __getattr__(name: str):
+    # ROUTERS (every router, imported on first access) is kept for existing callers
+    if name == "ROUTERS":
+        return [router for _, router in load_routers()[0]]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
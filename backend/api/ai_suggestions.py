@@ -13,7 +13,6 @@ from backend.db.database import get_db
 from backend.db.models import User, UserSetting, Content, Goal, Memory
 from backend.auth.dependencies import get_current_active_user
 from backend.middleware.feature_flag_enforcement import require_flag
-from openai import AsyncOpenAI
 from backend.core.config import get_settings
 from backend.core.constants import (
     DEFAULT_SUGGESTION_LIMIT, MAX_CONTENT_COUNT_DISPLAY, 
@@ -146,6 +145,7 @@ async def generate_contextual_suggestions(user_context: Dict[str, Any], suggesti
     
     try:
         # Generate contextual suggestions using OpenAI directly with timeout
+        from openai import AsyncOpenAI
         client = AsyncOpenAI(api_key=settings.openai_api_key)
         
         # Use the utility function to get correct parameters for GPT-5
@@ -4,22 +4,29 @@ OpenAI Assistant Chat API endpoints for the landing page chat widget
 from fastapi import APIRouter, HTTPException
 from typing import Optional, List, Dict, Any
 from pydantic import BaseModel
-import openai
-from openai import OpenAI
 import logging
 import json
 import time
 from datetime import datetime
 
 from backend.core.config import get_settings
+from backend.core.lazy_imports import LazyObject, lazy_import
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api", tags=["assistant_chat"])
 settings = get_settings()
 
-# Initialize OpenAI client
-client = OpenAI(api_key=settings.openai_api_key)
+openai = lazy_import("openai")
+
+
+def _create_client():
+    from openai import OpenAI
+    return OpenAI(api_key=settings.openai_api_key)
+
+
+# OpenAI client, created on the first chat request
+client = LazyObject(_create_client, "assistant chat OpenAI client")
 
 # Assistant ID from OpenAI Dashboard
 ASSISTANT_ID = "asst_sfmtJkTcdBh6Y80zQ50fF92g"
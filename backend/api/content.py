@@ -14,15 +14,18 @@ from backend.db.database import get_db
 from backend.db.models import ContentLog, ContentItem, User, SocialConnection, ContentDraft
 from backend.auth.dependencies import get_current_active_user
 from backend.services.cache_decorators import cached, cache_invalidate
-from backend.agents.tools import openai_tool
-from backend.services.image_generation_service import image_generation_service
-from backend.services.file_upload_service import file_upload_service
 from backend.utils.db_checks import ensure_table_exists, safe_table_query
-from backend.services.content_scheduler_service import get_content_scheduler_service
 from backend.api.partner_oauth import is_partner_oauth_enabled
 from backend.core.api_version import create_versioned_router
+from backend.core.lazy_imports import lazy_import
 from backend.middleware.feature_flag_enforcement import require_flag
-from backend.services.content_safety_service import get_content_safety_service
+
+# Imported on first use so registering these routes does not load OpenAI, PIL or Celery
+openai_tool = lazy_import("backend.agents.tools", "openai_tool")
+image_generation_service = lazy_import("backend.services.image_generation_service", "image_generation_service")
+file_upload_service = lazy_import("backend.services.file_upload_service", "file_upload_service")
+get_content_scheduler_service = lazy_import("backend.services.content_scheduler_service", "get_content_scheduler_service")
+get_content_safety_service = lazy_import("backend.services.content_safety_service", "get_content_safety_service")
 
 logger = logging.getLogger(__name__)
 router = create_versioned_router(prefix="/content", tags=["content"])
@@ -14,7 +14,9 @@ from backend.db.database import get_db
 from backend.db.models import ContentItem, ContentPerformanceSnapshot, ContentCategory, User
 from backend.services.performance_tracking import performance_tracker
 from backend.services.content_categorization import content_categorizer
-from backend.services.embedding_service import embedding_service
+from backend.core.lazy_imports import lazy_import
+
+embedding_service = lazy_import("backend.services.embedding_service", "embedding_service")
 
 # Get logger (use application's logging configuration)
 logger = logging.getLogger(__name__)
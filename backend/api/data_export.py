@@ -9,20 +9,18 @@ import asyncio
 import json
 import logging
 import zipfile
-import io
 from datetime import datetime, timezone, timedelta
-from typing import Dict, Any, List, Optional, Union
+from typing import Dict, Any, Callable, Iterator, List, Optional, Tuple, Union
 from pathlib import Path
 import tempfile
-import csv
 
-from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks, Response
+from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks
 from fastapi.responses import StreamingResponse
-from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.orm import Query, Session, selectinload
 from sqlalchemy import and_, or_, text
 from pydantic import BaseModel, EmailStr
 
-from backend.db.database import get_db
+from backend.db.database import get_db, SessionLocal
 from backend.db.models import (
     User, UserSetting, Metric, ContentLog, Goal, WorkflowExecution,
     Notification, Memory, Content, Organization, Team, UserOrganizationRole,
@@ -33,6 +31,7 @@ from backend.db.user_credentials import UserCredentials
 from backend.auth.dependencies import get_current_user
 from backend.core.config import get_settings
 from backend.core.api_version import create_versioned_router
+from backend.services.streaming_export import EXPORT_PAGE_SIZE, encode_rows, stream_zip
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
@@ -62,9 +61,12 @@ class DataExportStatus(BaseModel):
 class DataExportService:
     """Service for handling comprehensive data exports"""
     
+    # Export requests by export_id, shared across requests (in production, use Redis).
+    # Only the request parameters are kept; the data is streamed at download time.
+    export_cache: Dict[str, Dict[str, Any]] = {}
+    
     def __init__(self, db: Session):
         self.db = db
-        self.export_cache = {}  # In production, use Redis
         
     def _anonymize_data(self, data: Dict[str, Any], sensitive_fields: List[str]) -> Dict[str, Any]:
         """Anonymize sensitive fields in data"""
@@ -133,55 +135,60 @@ class DataExportService:
             
         return settings_data
     
-    def _get_user_metrics_data(self, user: User, date_start: Optional[datetime] = None, 
-                              date_end: Optional[datetime] = None) -> List[Dict[str, Any]]:
-        """Extract user metrics data"""
-        query = self.db.query(Metric).filter(Metric.user_id == user.id)
-        
+    @staticmethod
+    def _filter_dates(query: Query, column, date_start: Optional[datetime] = None,
+                      date_end: Optional[datetime] = None) -> Query:
+        """Apply the export's date range to a query"""
         if date_start:
-            query = query.filter(Metric.date_recorded >= date_start)
+            query = query.filter(column >= date_start)
         if date_end:
-            query = query.filter(Metric.date_recorded <= date_end)
-            
-        metrics = query.all()
-        
-        return [{
+            query = query.filter(column <= date_end)
+        return query
+    
+    def _iter_rows(self, query: Query, serialize: Callable[[Any], Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """Serialize a query's rows, fetching EXPORT_PAGE_SIZE at a time (server-side cursor on PostgreSQL)"""
+        for record in query.yield_per(EXPORT_PAGE_SIZE):
+            yield serialize(record)
+    
+    def _metrics_query(self, user: User, date_start: Optional[datetime] = None,
+                       date_end: Optional[datetime] = None) -> Query:
+        query = self.db.query(Metric).filter(Metric.user_id == user.id)
+        return self._filter_dates(query, Metric.date_recorded, date_start, date_end).order_by(Metric.id)
+    
+    @staticmethod
+    def _serialize_metric(m: Metric) -> Dict[str, Any]:
+        return {
             "metric_type": m.metric_type,
             "platform": m.platform,
             "value": m.value,
             "date_recorded": m.date_recorded.isoformat() if m.date_recorded else None,
             "metric_metadata": m.metric_metadata,
-        } for m in metrics]
+        }
     
-    def _get_user_content_data(self, user: User, date_start: Optional[datetime] = None,
-                              date_end: Optional[datetime] = None, anonymize: bool = False) -> Dict[str, Any]:
-        """Extract user content data"""
-        # Content logs
-        content_query = self.db.query(ContentLog).filter(ContentLog.user_id == user.id)
-        if date_start:
-            content_query = content_query.filter(ContentLog.created_at >= date_start)
-        if date_end:
-            content_query = content_query.filter(ContentLog.created_at <= date_end)
-        content_logs = content_query.all()
-        
-        # Content (AI-generated content)
-        ai_content_query = self.db.query(Content).filter(Content.user_id == user.id)
-        if date_start:
-            ai_content_query = ai_content_query.filter(Content.created_at >= date_start)
-        if date_end:
-            ai_content_query = ai_content_query.filter(Content.created_at <= date_end)
-        ai_content = ai_content_query.all()
-        
-        # Memories (AI context)
-        memories_query = self.db.query(Memory).filter(Memory.user_id == user.id)
-        if date_start:
-            memories_query = memories_query.filter(Memory.created_at >= date_start)
-        if date_end:
-            memories_query = memories_query.filter(Memory.created_at <= date_end)
-        memories = memories_query.all()
-        
-        content_data = {
-            "content_logs": [{
+    def _get_user_metrics_data(self, user: User, date_start: Optional[datetime] = None, 
+                              date_end: Optional[datetime] = None) -> List[Dict[str, Any]]:
+        """Extract user metrics data"""
+        return list(self._iter_rows(self._metrics_query(user, date_start, date_end), self._serialize_metric))
+    
+    def _content_sections(self, user: User, date_start: Optional[datetime] = None,
+                          date_end: Optional[datetime] = None, anonymize: bool = False
+                          ) -> List[Tuple[str, Query, Callable[[Any], Dict[str, Any]]]]:
+        """Content logs, AI-generated content and memories as (name, query, serializer)"""
+        content_logs = self._filter_dates(
+            self.db.query(ContentLog).filter(ContentLog.user_id == user.id),
+            ContentLog.created_at, date_start, date_end
+        ).order_by(ContentLog.id)
+        ai_content = self._filter_dates(
+            self.db.query(Content).filter(Content.user_id == user.id),
+            Content.created_at, date_start, date_end
+        ).order_by(Content.id)
+        memories = self._filter_dates(
+            self.db.query(Memory).filter(Memory.user_id == user.id),
+            Memory.created_at, date_start, date_end
+        ).order_by(Memory.id)
+        
+        return [
+            ("content_logs", content_logs, lambda cl: {
                 "id": cl.id,
                 "content_type": cl.content_type,
                 "content": cl.content if not anonymize else "[CONTENT_ANONYMIZED]",
@@ -189,9 +196,8 @@ class DataExportService:
                 "status": cl.status,
                 "engagement_data": cl.engagement_data if not anonymize else {"anonymized": True},
                 "created_at": cl.created_at.isoformat() if cl.created_at else None,
-            } for cl in content_logs],
-            
-            "ai_generated_content": [{
+            }),
+            ("ai_generated_content", ai_content, lambda c: {
                 "id": c.id,
                 "content": c.content if not anonymize else "[AI_CONTENT_ANONYMIZED]",
                 "title": c.title,
@@ -200,45 +206,51 @@ class DataExportService:
                 "ai_model": c.ai_model,
                 "generation_params": c.generation_params if not anonymize else {"anonymized": True},
                 "created_at": c.created_at.isoformat() if c.created_at else None,
-            } for c in ai_content],
-            
-            "memories": [{
+            }),
+            ("memories", memories, lambda m: {
                 "id": m.id,
                 "content": m.content if not anonymize else "[MEMORY_ANONYMIZED]",
                 "memory_type": m.memory_type,
                 "relevance_score": m.relevance_score,
                 "memory_metadata": m.memory_metadata if not anonymize else {"anonymized": True},
                 "created_at": m.created_at.isoformat() if m.created_at else None,
-            } for m in memories]
+            }),
+        ]
+    
+    def _get_user_content_data(self, user: User, date_start: Optional[datetime] = None,
+                              date_end: Optional[datetime] = None, anonymize: bool = False) -> Dict[str, Any]:
+        """Extract user content data"""
+        return {
+            name: list(self._iter_rows(query, serialize))
+            for name, query, serialize in self._content_sections(user, date_start, date_end, anonymize)
         }
-        
-        return content_data
     
-    def _get_user_connections_data(self, user: User, anonymize: bool = False) -> List[Dict[str, Any]]:
-        """Extract user social connections data"""
+    def _connections_query(self, user: User) -> Query:
         # Get connections through organizations the user belongs to
         user_org_ids = [role.organization_id for role in user.organization_roles]
-        
-        connections = self.db.query(SocialConnection).filter(
+        return self.db.query(SocialConnection).filter(
             SocialConnection.organization_id.in_(user_org_ids)
-        ).all()
-        
-        connections_data = []
-        for conn in connections:
-            conn_data = {
-                "id": str(conn.id),
-                "platform": conn.platform,
-                "connection_name": conn.connection_name if not anonymize else "[ACCOUNT_ANONYMIZED]",
-                "platform_account_id": conn.platform_account_id if not anonymize else "[ID_ANONYMIZED]",
-                "connection_status": conn.connection_status,
-                "is_active": conn.is_active,
-                "scopes": conn.scopes,
-                "created_at": conn.created_at.isoformat() if conn.created_at else None,
-                "last_used_at": conn.last_used_at.isoformat() if conn.last_used_at else None,
-            }
-            connections_data.append(conn_data)
-            
-        return connections_data
+        ).order_by(SocialConnection.id)
+    
+    @staticmethod
+    def _serialize_connection(conn: SocialConnection, anonymize: bool = False) -> Dict[str, Any]:
+        return {
+            "id": str(conn.id),
+            "platform": conn.platform,
+            "connection_name": conn.connection_name if not anonymize else "[ACCOUNT_ANONYMIZED]",
+            "platform_account_id": conn.platform_account_id if not anonymize else "[ID_ANONYMIZED]",
+            "connection_status": conn.connection_status,
+            "is_active": conn.is_active,
+            "scopes": conn.scopes,
+            "created_at": conn.created_at.isoformat() if conn.created_at else None,
+            "last_used_at": conn.last_used_at.isoformat() if conn.last_used_at else None,
+        }
+    
+    def _get_user_connections_data(self, user: User, anonymize: bool = False) -> List[Dict[str, Any]]:
+        """Extract user social connections data"""
+        return list(self._iter_rows(
+            self._connections_query(user), lambda conn: self._serialize_connection(conn, anonymize)
+        ))
     
     def _get_user_organizations_data(self, user: User, anonymize: bool = False) -> Dict[str, Any]:
         """Extract user organization and team data"""
@@ -297,19 +309,15 @@ class DataExportService:
         
         return orgs_data
     
-    def _get_user_workflow_data(self, user: User, date_start: Optional[datetime] = None,
-                               date_end: Optional[datetime] = None) -> List[Dict[str, Any]]:
-        """Extract user workflow execution data"""
+    def _workflow_query(self, user: User, date_start: Optional[datetime] = None,
+                        date_end: Optional[datetime] = None) -> Query:
         query = self.db.query(WorkflowExecution).filter(WorkflowExecution.user_id == user.id)
-        
-        if date_start:
-            query = query.filter(WorkflowExecution.created_at >= date_start)
-        if date_end:
-            query = query.filter(WorkflowExecution.created_at <= date_end)
-            
-        executions = query.all()
-        
-        return [{
+        # Executions have no created_at; they are dated by when they started
+        return self._filter_dates(query, WorkflowExecution.started_at, date_start, date_end).order_by(WorkflowExecution.id)
+    
+    @staticmethod
+    def _serialize_workflow(we: WorkflowExecution) -> Dict[str, Any]:
+        return {
             "id": we.id,
             "workflow_type": we.workflow_type,
             "status": we.status,
@@ -318,13 +326,88 @@ class DataExportService:
             "error_message": we.error_message,
             "started_at": we.started_at.isoformat() if we.started_at else None,
             "completed_at": we.completed_at.isoformat() if we.completed_at else None,
-            "created_at": we.created_at.isoformat() if we.created_at else None,
-        } for we in executions]
+            "created_at": we.started_at.isoformat() if we.started_at else None,
+        }
     
-    def export_user_data(self, user: User, request: DataExportRequest) -> Dict[str, Any]:
-        """Generate comprehensive user data export"""
-        logger.info(f"Starting data export for user {user.id}")
+    def _get_user_workflow_data(self, user: User, date_start: Optional[datetime] = None,
+                               date_end: Optional[datetime] = None) -> List[Dict[str, Any]]:
+        """Extract user workflow execution data"""
+        return list(self._iter_rows(self._workflow_query(user, date_start, date_end), self._serialize_workflow))
+    
+    @staticmethod
+    def _serialize_goal(g: Goal, anonymize: bool = False) -> Dict[str, Any]:
+        return {
+            "id": g.id,
+            "title": g.title if not anonymize else "[GOAL_TITLE_ANONYMIZED]",
+            "description": g.description if not anonymize else "[GOAL_DESC_ANONYMIZED]",
+            "target_value": g.target_value,
+            "current_value": g.current_value,
+            "status": g.status,
+            "target_date": g.target_date.isoformat() if g.target_date else None,
+            "created_at": g.created_at.isoformat() if g.created_at else None,
+        }
+    
+    @staticmethod
+    def _serialize_notification(n: Notification, anonymize: bool = False) -> Dict[str, Any]:
+        return {
+            "id": n.id,
+            "notification_type": n.notification_type,
+            "title": n.title if not anonymize else "[NOTIFICATION_ANONYMIZED]",
+            "message": n.message if not anonymize else "[MESSAGE_ANONYMIZED]",
+            "is_read": n.is_read,
+            "priority": n.priority,
+            "created_at": n.created_at.isoformat() if n.created_at else None,
+        }
+    
+    def _row_sections(self, user: User, request: DataExportRequest
+                      ) -> List[Tuple[str, Query, Callable[[Any], Dict[str, Any]]]]:
+        """Every row-per-record section the request includes, as (name, query, serializer)"""
+        anonymize = request.anonymize_sensitive
+        start, end = request.date_range_start, request.date_range_end
+        sections = []
+        
+        if request.include_metrics:
+            sections.append(("metrics", self._metrics_query(user, start, end), self._serialize_metric))
+        if request.include_content:
+            sections.extend(self._content_sections(user, start, end, anonymize))
+        if request.include_connections:
+            sections.append(("social_connections", self._connections_query(user),
+                             lambda conn: self._serialize_connection(conn, anonymize)))
+        sections.append(("workflows", self._workflow_query(user, start, end), self._serialize_workflow))
+        sections.append(("goals", self.db.query(Goal).filter(Goal.user_id == user.id).order_by(Goal.id),
+                         lambda g: self._serialize_goal(g, anonymize)))
+        sections.append(("notifications",
+                         self.db.query(Notification).filter(Notification.user_id == user.id).order_by(Notification.id),
+                         lambda n: self._serialize_notification(n, anonymize)))
+        return sections
+    
+    def stream_user_data(self, user: User, request: DataExportRequest) -> Iterator[bytes]:
+        """
+        Stream the export as a ZIP archive in constant memory
         
+        export_metadata.json holds the metadata, profile, settings, plan and
+        organizations; every other section is its own NDJSON (json), CSV or
+        XML entry, paged from the database and compressed as it is read.
+        
+        Args:
+            user: User being exported (bound to this service's session)
+            request: Export options
+            
+        Returns:
+            Iterator over the archive's bytes
+        """
+        def entries():
+            logger.info(f"Starting streaming data export for user {user.id}")
+            summary = self._export_summary(user, request)
+            yield "export_metadata.json", [json.dumps(summary, indent=2, default=str).encode("utf-8")]
+            for name, query, serialize in self._row_sections(user, request):
+                yield encode_rows(self._iter_rows(query, serialize), request.format, name)
+            logger.info(f"Streaming data export completed for user {user.id}")
+        
+        return stream_zip(entries())
+    
+    def _export_summary(self, user: User, request: DataExportRequest) -> Dict[str, Any]:
+        """Metadata and the small per-user records"""
         export_data = {
             "export_metadata": {
                 "user_id": user.id,
@@ -364,6 +447,17 @@ class DataExportService:
                 }
             }
         
+        # Organization and team data
+        export_data["organizations"] = self._get_user_organizations_data(user, request.anonymize_sensitive)
+        
+        return export_data
+    
+    def export_user_data(self, user: User, request: DataExportRequest) -> Dict[str, Any]:
+        """Generate comprehensive user data export in memory (use stream_user_data for large accounts)"""
+        logger.info(f"Starting data export for user {user.id}")
+        
+        export_data = self._export_summary(user, request)
+        
         # Metrics data
         if request.include_metrics:
             export_data["metrics"] = self._get_user_metrics_data(
@@ -380,38 +474,20 @@ class DataExportService:
         if request.include_connections:
             export_data["social_connections"] = self._get_user_connections_data(user, request.anonymize_sensitive)
         
-        # Organization and team data
-        export_data["organizations"] = self._get_user_organizations_data(user, request.anonymize_sensitive)
-        
         # Workflow executions
         export_data["workflows"] = self._get_user_workflow_data(
             user, request.date_range_start, request.date_range_end
         )
         
         # Goals
-        goals = self.db.query(Goal).filter(Goal.user_id == user.id).all()
-        export_data["goals"] = [{
-            "id": g.id,
-            "title": g.title if not request.anonymize_sensitive else "[GOAL_TITLE_ANONYMIZED]",
-            "description": g.description if not request.anonymize_sensitive else "[GOAL_DESC_ANONYMIZED]",
-            "target_value": g.target_value,
-            "current_value": g.current_value,
-            "status": g.status,
-            "target_date": g.target_date.isoformat() if g.target_date else None,
-            "created_at": g.created_at.isoformat() if g.created_at else None,
-        } for g in goals]
+        goals = self.db.query(Goal).filter(Goal.user_id == user.id).order_by(Goal.id)
+        export_data["goals"] = [self._serialize_goal(g, request.anonymize_sensitive) for g in goals]
         
         # Notifications
-        notifications = self.db.query(Notification).filter(Notification.user_id == user.id).all()
-        export_data["notifications"] = [{
-            "id": n.id,
-            "notification_type": n.notification_type,
-            "title": n.title if not request.anonymize_sensitive else "[NOTIFICATION_ANONYMIZED]",
-            "message": n.message if not request.anonymize_sensitive else "[MESSAGE_ANONYMIZED]",
-            "is_read": n.is_read,
-            "priority": n.priority,
-            "created_at": n.created_at.isoformat() if n.created_at else None,
-        } for n in notifications]
+        notifications = self.db.query(Notification).filter(Notification.user_id == user.id).order_by(Notification.id)
+        export_data["notifications"] = [
+            self._serialize_notification(n, request.anonymize_sensitive) for n in notifications
+        ]
         
         logger.info(f"Data export completed for user {user.id}")
         return export_data
@@ -448,9 +524,12 @@ async def request_data_export(
     - User authentication required for download
     
     **Export Formats:**
-    - JSON: Structured data with full metadata
+    - JSON: Structured data with full metadata (row sections as NDJSON)
     - CSV: Tabular format for analysis
     - XML: Standards-compliant markup format
+    
+    The export is delivered as a ZIP archive streamed from the database at
+    download time, so accounts of any size export in constant memory.
     """
     try:
         # Generate export ID
@@ -474,19 +553,15 @@ async def request_data_export(
         )
         
         # Store status (in production, use Redis)
-        # For now, we'll process synchronously for small datasets
         export_service = DataExportService(db)
         
         try:
-            # Generate the export data
-            export_data = export_service.export_user_data(current_user, request)
-            
             # Create download URL (in production, store in S3/similar)
             download_url = f"/api/v1/data-export/download/{export_id}"
             
-            # Store the export data temporarily (in production, use persistent storage)
+            # Keep the request; the data itself is streamed when downloaded
             export_service.export_cache[export_id] = {
-                "data": export_data,
+                "request": request,
                 "format": request.format,
                 "created_at": datetime.now(timezone.utc),
                 "user_id": current_user.id
@@ -530,8 +605,16 @@ async def download_data_export(
     
     **Response Headers:**
     - Content-Disposition: attachment with timestamped filename
-    - Content-Type: application/json, text/csv, or application/xml
-    - Proper MIME type for browser download handling
+    - Content-Type: application/zip
+    
+    **Archive Layout:**
+    - export_metadata.json: metadata, profile, settings, plan and organizations
+    - One entry per section (metrics, content_logs, ai_generated_content,
+      memories, social_connections, workflows, goals, notifications) as
+      NDJSON, CSV or XML depending on the requested format
+    
+    Rows are paged from the database and compressed as the response is sent,
+    so memory use does not grow with the size of the account.
     
     **Error Handling:**
     - 404: Export not found or expired
@@ -555,110 +638,32 @@ async def download_data_export(
             del export_service.export_cache[export_id]
             raise HTTPException(status_code=410, detail="Export has expired")
         
-        export_format = export_info["format"]
-        export_data = export_info["data"]
+        export_request = export_info["request"]
+        user_id = current_user.id
         
         # Generate filename
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"user_data_export_{current_user.id}_{timestamp}"
-        
-        if export_format == "json":
-            # Return JSON format
-            json_content = json.dumps(export_data, indent=2, default=str)
-            return Response(
-                content=json_content,
-                media_type="application/json",
-                headers={
-                    "Content-Disposition": f"attachment; filename={filename}.json"
-                }
-            )
-        
-        elif export_format == "csv":
-            # Convert to CSV format
-            output = io.StringIO()
-            
-            # Write profile data
-            if "profile" in export_data:
-                output.write("=== USER PROFILE ===\\n")
-                profile_writer = csv.writer(output)
-                profile_writer.writerow(["Field", "Value"])
-                for key, value in export_data["profile"].items():
-                    profile_writer.writerow([key, str(value)])
-                output.write("\\n")
-            
-            # Write other sections
-            for section_name, section_data in export_data.items():
-                if section_name in ["profile", "export_metadata"]:
-                    continue
-                
-                output.write(f"=== {section_name.upper()} ===\\n")
-                
-                if isinstance(section_data, list) and section_data:
-                    # Table format for lists
-                    if isinstance(section_data[0], dict):
-                        writer = csv.DictWriter(output, fieldnames=section_data[0].keys())
-                        writer.writeheader()
-                        writer.writerows(section_data)
-                elif isinstance(section_data, dict):
-                    # Key-value format for dicts
-                    writer = csv.writer(output)
-                    writer.writerow(["Field", "Value"])
-                    for key, value in section_data.items():
-                        writer.writerow([key, str(value)])
-                
-                output.write("\\n")
-            
-            csv_content = output.getvalue()
-            output.close()
-            
-            return Response(
-                content=csv_content,
-                media_type="text/csv",
-                headers={
-                    "Content-Disposition": f"attachment; filename={filename}.csv"
-                }
-            )
-        
-        elif export_format == "xml":
-            # Convert to XML format (basic implementation)
-            def dict_to_xml(data, root_name="data"):
-                xml_lines = [f"<{root_name}>"]
-                
-                for key, value in data.items():
-                    if isinstance(value, dict):
-                        xml_lines.append(f"  <{key}>")
-                        for sub_key, sub_value in value.items():
-                            xml_lines.append(f"    <{sub_key}>{str(sub_value)}</{sub_key}>")
-                        xml_lines.append(f"  </{key}>")
-                    elif isinstance(value, list):
-                        xml_lines.append(f"  <{key}>")
-                        for i, item in enumerate(value):
-                            if isinstance(item, dict):
-                                xml_lines.append(f"    <item_{i}>")
-                                for sub_key, sub_value in item.items():
-                                    xml_lines.append(f"      <{sub_key}>{str(sub_value)}</{sub_key}>")
-                                xml_lines.append(f"    </item_{i}>")
-                            else:
-                                xml_lines.append(f"    <item_{i}>{str(item)}</item_{i}>")
-                        xml_lines.append(f"  </{key}>")
-                    else:
-                        xml_lines.append(f"  <{key}>{str(value)}</{key}>")
-                
-                xml_lines.append(f"</{root_name}>")
-                return "\\n".join(xml_lines)
-            
-            xml_content = f'<?xml version="1.0" encoding="UTF-8"?>\\n{dict_to_xml(export_data, "user_data_export")}'
-            
-            return Response(
-                content=xml_content,
-                media_type="application/xml",
-                headers={
-                    "Content-Disposition": f"attachment; filename={filename}.xml"
-                }
-            )
-        
-        else:
-            raise HTTPException(status_code=400, detail="Invalid export format")
+        filename = f"user_data_export_{user_id}_{timestamp}.zip"
+        
+        def archive_chunks():
+            # The request's session closes before the body is sent, so the stream owns its own
+            stream_db = SessionLocal()
+            try:
+                user = stream_db.get(User, user_id)
+                yield from DataExportService(stream_db).stream_user_data(user, export_request)
+            except Exception as e:
+                logger.error(f"Streaming export {export_id} failed: {str(e)}")
+                raise
+            finally:
+                stream_db.close()
+        
+        return StreamingResponse(
+            archive_chunks(),
+            media_type="application/zip",
+            headers={
+                "Content-Disposition": f"attachment; filename={filename}"
+            }
+        )
     
     except HTTPException:
         raise
@@ -14,7 +14,7 @@ import logging
 logger = logging.getLogger(__name__)
 
 from backend.services.research_scheduler import research_scheduler
-from backend.agents.deep_research_agent import deep_research_agent
+from backend.core.lazy_imports import lazy_import
 from backend.middleware.feature_flag_enforcement import require_flag
 from backend.middleware.research_access_control import (
     require_research_feature,
@@ -30,6 +30,10 @@ from backend.services.research_monitoring import (
     ResearchOperationTracker
 )
 from backend.auth.dependencies import get_current_user, AuthUser
+
+# The research agent (OpenAI, scraping, vector memory) loads on first use
+deep_research_agent = lazy_import("backend.agents.deep_research_agent", "deep_research_agent")
+
 try:
     from backend.tasks.research_tasks import (
         execute_weekly_deep_research_task,
@@ -3,39 +3,42 @@ AI Features Diagnostics API
 
 Provides comprehensive diagnostics for all AI features and their dependencies.
 """
+import importlib
 import os
 import logging
 from datetime import datetime
 from fastapi import APIRouter, HTTPException
 from typing import Dict, Any, List
 from backend.core.config import get_settings
+from backend.core.lazy_imports import lazy_import
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/diagnostics", tags=["diagnostics"])
 
-# Test imports for all AI services
-ai_service_status = {}
+# Import checks for all AI services, run on the first diagnostics request
+# so that registering this router does not load OpenAI or the image stack
+_ai_service_status: Dict[str, Dict[str, Any]] = {}
 
-# Test OpenAI import and API key
-try:
-    from openai import AsyncOpenAI
-    ai_service_status["openai_import"] = {"status": "available", "error": None}
-except ImportError as e:
-    ai_service_status["openai_import"] = {"status": "failed", "error": str(e)}
+AI_SERVICE_MODULES = [
+    ("openai_import", "openai"),  # Test OpenAI import and API key
+    ("ai_insights_service", "backend.services.ai_insights_service"),
+    ("image_generation_service", "backend.services.image_generation_service"),
+]
 
-# Test AI Insights Service
-try:
-    from backend.services.ai_insights_service import ai_insights_service
-    ai_service_status["ai_insights_service"] = {"status": "available", "error": None}
-except ImportError as e:
-    ai_service_status["ai_insights_service"] = {"status": "failed", "error": str(e)}
+ai_insights_service = lazy_import("backend.services.ai_insights_service", "ai_insights_service")
+
+
+def get_ai_service_status() -> Dict[str, Dict[str, Any]]:
+    """Import each AI service once and report which are available"""
+    if not _ai_service_status:
+        for name, module in AI_SERVICE_MODULES:
+            try:
+                importlib.import_module(module)
+                _ai_service_status[name] = {"status": "available", "error": None}
+            except ImportError as e:
+                _ai_service_status[name] = {"status": "failed", "error": str(e)}
+    return _ai_service_status
 
-# Test Image Generation Service
-try:
-    from backend.services.image_generation_service import ImageGenerationService
-    ai_service_status["image_generation_service"] = {"status": "available", "error": None}
-except ImportError as e:
-    ai_service_status["image_generation_service"] = {"status": "failed", "error": str(e)}
 
 @router.get("/ai-features")
 async def diagnose_ai_features():
@@ -43,6 +46,7 @@ async def diagnose_ai_features():
     Comprehensive diagnostics for all AI features and their dependencies
     """
     try:
+        ai_service_status = get_ai_service_status()
         settings = get_settings()
         
         # Check API Keys
@@ -63,6 +67,7 @@ async def diagnose_ai_features():
         openai_test = {"status": "not_tested", "error": None}
         if api_keys_status["openai_api_key"]["configured"]:
             try:
+                from openai import AsyncOpenAI
                 client = AsyncOpenAI(api_key=settings.openai_api_key)
                 response = await client.chat.completions.create(
                     model="gpt-4.1-mini",
@@ -130,6 +135,7 @@ async def diagnose_industry_research():
     Specific diagnostics for industry research functionality
     """
     try:
+        ai_service_status = get_ai_service_status()
         settings = get_settings()
         
         # Check if AI insights service is available
@@ -145,6 +151,7 @@ async def diagnose_industry_research():
         openai_test = {"status": "not_tested", "error": None}
         if settings.openai_api_key:
             try:
+                from openai import AsyncOpenAI
                 client = AsyncOpenAI(api_key=settings.openai_api_key)
                 response = await client.chat.completions.create(
                     model="gpt-4.1-mini",
@@ -11,7 +11,8 @@ from typing import Dict, Any, List, Optional
 import logging
 from datetime import datetime, timezone
 
-from backend.core.dependencies import get_db, get_current_admin_user
+from backend.db.database import get_db
+from backend.auth.dependencies import get_admin_user
 from backend.db.models import User
 from backend.services.error_taxonomy_service import (
     get_error_taxonomy_service,
@@ -38,7 +39,7 @@ class ErrorStatisticsRequest(BaseModel):
 @router.get("/status", response_model=Dict[str, Any])
 async def get_taxonomy_status(
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_admin_user)
+    current_user: User = Depends(get_admin_user)
 ) -> Dict[str, Any]:
     """Get error taxonomy system status"""
     try:
@@ -99,7 +100,7 @@ async def get_taxonomy_status(
 async def classify_error(
     request: ErrorClassificationRequest,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_admin_user)
+    current_user: User = Depends(get_admin_user)
 ) -> Dict[str, Any]:
     """Classify an error code and get comprehensive handling information"""
     try:
@@ -181,7 +182,7 @@ async def classify_error(
 async def get_error_statistics(
     request: ErrorStatisticsRequest,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_admin_user)
+    current_user: User = Depends(get_admin_user)
 ) -> Dict[str, Any]:
     """Get comprehensive error statistics for monitoring and reporting"""
     try:
@@ -252,7 +253,7 @@ async def get_error_statistics(
 @router.get("/categories", response_model=Dict[str, List[str]])
 async def get_taxonomy_categories(
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_admin_user)
+    current_user: User = Depends(get_admin_user)
 ) -> Dict[str, List[str]]:
     """Get available taxonomy categories and subcategories"""
     try:
@@ -284,7 +285,7 @@ async def get_taxonomy_categories(
 @router.get("/compliance/report", response_model=Dict[str, Any])
 async def get_compliance_report(
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_admin_user)
+    current_user: User = Depends(get_admin_user)
 ) -> Dict[str, Any]:
     """Generate comprehensive compliance-focused error report"""
     try:
@@ -342,7 +343,7 @@ async def get_compliance_report(
 @router.get("/export/taxonomy", response_model=Dict[str, Any])
 async def export_taxonomy_config(
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_admin_user)
+    current_user: User = Depends(get_admin_user)
 ) -> Dict[str, Any]:
     """Export complete error taxonomy configuration"""
     try:
@@ -373,7 +374,7 @@ async def export_taxonomy_config(
 @router.get("/validation/completeness", response_model=Dict[str, Any])
 async def validate_taxonomy_completeness(
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_admin_user)
+    current_user: User = Depends(get_admin_user)
 ) -> Dict[str, Any]:
     """Validate taxonomy completeness and coverage"""
     try:
@@ -424,7 +425,7 @@ async def validate_taxonomy_completeness(
 async def get_troubleshooting_guide(
     error_code: str,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_admin_user)
+    current_user: User = Depends(get_admin_user)
 ) -> Dict[str, Any]:
     """Get detailed troubleshooting guide for an error code"""
     try:
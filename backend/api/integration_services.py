@@ -63,20 +63,20 @@ class WorkflowTriggerRequest(BaseModel):
 # Instagram API Endpoints
 
 @router.post("/instagram/post")
-def create_instagram_post(
+async def create_instagram_post(
     request: InstagramPostRequest,
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
     """Create Instagram post with media"""
     try:
-        # Get user's Instagram access token (sync operation)
-        instagram_token = instagram_client.get_user_token(current_user.id)
+        # Get user's Instagram access token
+        instagram_token = await instagram_client.get_user_token(current_user.id)
         if not instagram_token:
             raise HTTPException(status_code=401, detail="Instagram account not connected")
         
-        # Create Instagram post using existing sync method
-        result = instagram_client.post_image(
+        # Create Instagram post over the pooled async transport
+        result = await instagram_client.post_image(
             access_token=instagram_token,
             image_url=request.media_urls[0],
             caption=request.caption,
@@ -180,7 +180,7 @@ async def linkedin_oauth_callback(
         
         # Get user profile to verify token
         try:
-            profile = linkedin_client.client.get_user_profile(
+            profile = await linkedin_client.client.get_user_profile(
                 access_token=token_data["access_token"]
             )
         except LinkedInAPIError as e:
@@ -254,7 +254,7 @@ async def get_linkedin_profile(
                 detail="LinkedIn client not available"
             )
         
-        profile = linkedin_client.client.get_user_profile(access_token)
+        profile = await linkedin_client.client.get_user_profile(access_token)
         
         return LinkedInProfileResponse(
             id=profile.get("id", ""),
@@ -316,7 +316,7 @@ async def create_linkedin_test_post(
             )
         
         # Attempt to create post (will fail without partnership)
-        result = linkedin_client.create_post(
+        result = await linkedin_client.create_post(
             access_token=access_token,
             person_urn=person_urn,
             content=post_data.content
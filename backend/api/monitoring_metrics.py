@@ -8,7 +8,8 @@ from fastapi import APIRouter, Depends, HTTPException, status, Response
 from pydantic import BaseModel, Field, ConfigDict
 from datetime import datetime
 
-from backend.auth.dependencies import get_current_admin_user, AuthUser
+from backend.auth.dependencies import get_admin_user
+from backend.db.models import User
 from backend.core.monitoring import monitoring_service
 from backend.core.api_version import create_versioned_router
 
@@ -82,7 +83,7 @@ async def get_prometheus_metrics():
 
 @router.get("/system", response_model=SystemMetricsResponse)
 async def get_system_metrics(
-    current_user: AuthUser = Depends(get_current_admin_user)
+    current_user: User = Depends(get_admin_user)
 ):
     """
     Get system metrics summary
@@ -115,7 +116,7 @@ async def get_system_metrics(
 
 @router.post("/test-error")
 async def test_error_tracking(
-    current_user: AuthUser = Depends(get_current_admin_user)
+    current_user: User = Depends(get_admin_user)
 ):
     """
     Test error tracking integration
@@ -130,7 +131,7 @@ async def test_error_tracking(
             test_exception,
             context={
                 "test": True,
-                "user_id": current_user.user_id,
+                "user_id": current_user.id,
                 "action": "test_error_tracking"
             }
         )
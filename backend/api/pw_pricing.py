@@ -12,11 +12,11 @@ from sqlalchemy.orm import Session
 from pydantic import BaseModel, Field, ConfigDict
 
 from backend.db.database import get_db
-from backend.core.security import get_current_active_user
+from backend.auth.dependencies import get_current_active_user
 from backend.db.models import User, PricingRule, Organization
 from backend.services.pricing_service import PricingService, PricingQuoteRequest
 from backend.services.settings_resolver import SettingsResolver
-from backend.core.rbac import require_permission, get_user_permissions
+from backend.auth.permissions import PermissionChecker
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/v1/pricing", tags=["Pricing Engine"])
@@ -76,6 +76,13 @@ class QuoteResponse(BaseModel):
     valid_until: Optional[str] = Field(None, description="Quote expiration datetime")
 
 
+class BatchQuoteRequest(BaseModel):
+    """Batch pricing quote request"""
+    model_config = ConfigDict(from_attributes=True)
+    
+    quotes: List[QuoteRequest] = Field(..., min_length=1, max_length=500, description="Quote requests to price")
+
+
 class PricingRuleCreate(BaseModel):
     """Create pricing rule request"""
     model_config = ConfigDict(from_attributes=True)
@@ -134,6 +141,11 @@ def get_organization_id(x_organization_id: Optional[str] = Header(None)) -> str:
     return x_organization_id
 
 
+def get_user_permissions(current_user: User, organization_id: str, db: Session) -> List[str]:
+    """Permission names the user holds in the organization"""
+    return PermissionChecker(db).get_user_permissions(current_user, organization_id)
+
+
 def verify_organization_access(
     organization_id: str,
     current_user: User,
@@ -146,8 +158,7 @@ def verify_organization_access(
         raise HTTPException(status_code=404, detail="Organization not found")
     
     # Check if user belongs to organization (owner or member)
-    # This should integrate with your actual RBAC system
-    user_permissions = get_user_permissions(current_user.id, organization_id, db)
+    user_permissions = get_user_permissions(current_user, organization_id, db)
     if not any(perm.startswith('pricing.') for perm in user_permissions):
         raise HTTPException(
             status_code=403, 
@@ -157,6 +168,30 @@ def verify_organization_access(
     return organization
 
 
+def require_permission(current_user: User, organization_id: str, permission_name: str, db: Session) -> None:
+    """Raise 403 unless the user holds the permission in the organization"""
+    if not PermissionChecker(db).user_has_permission(current_user, permission_name, organization_id):
+        raise HTTPException(
+            status_code=403,
+            detail=f"Permission '{permission_name}' required for this pricing operation"
+        )
+
+
+def _to_pricing_request(request: QuoteRequest, organization_id: str) -> PricingQuoteRequest:
+    """Convert Pydantic model to service model"""
+    return PricingQuoteRequest(
+        organization_id=organization_id,
+        service_types=request.service_types,
+        surfaces={k: v.model_dump() for k, v in request.surfaces.items()},
+        location=request.location.model_dump() if request.location else None,
+        preferred_date=request.preferred_date,
+        additional_services=request.additional_services,
+        customer_tier=request.customer_tier,
+        rush_job=request.rush_job,
+        metadata=request.metadata
+    )
+
+
 # API Endpoints
 @router.post("/quote", response_model=QuoteResponse)
 async def compute_quote(
@@ -172,27 +207,13 @@ async def compute_quote(
     """
     # Verify organization access and permissions
     verify_organization_access(organization_id, current_user, db)
-    require_permission(current_user.id, organization_id, "pricing.quote", db)
+    require_permission(current_user, organization_id, "pricing.quote", db)
     
     try:
-        # Convert Pydantic model to service model
-        surfaces_dict = {k: v.model_dump() for k, v in request.surfaces.items()}
-        location_dict = request.location.model_dump() if request.location else None
-        
-        quote_request = PricingQuoteRequest(
-            organization_id=organization_id,
-            service_types=request.service_types,
-            surfaces=surfaces_dict,
-            location=location_dict,
-            preferred_date=request.preferred_date,
-            additional_services=request.additional_services,
-            customer_tier=request.customer_tier,
-            rush_job=request.rush_job,
-            metadata=request.metadata
-        )
+        quote_request = _to_pricing_request(request, organization_id)
         
         # Initialize pricing service
-        settings_resolver = SettingsResolver()
+        settings_resolver = SettingsResolver(db)
         pricing_service = PricingService(settings_resolver)
         
         # Compute quote
@@ -209,6 +230,37 @@ async def compute_quote(
         raise HTTPException(status_code=500, detail="Internal server error computing quote")
 
 
+@router.post("/quotes/batch", response_model=List[QuoteResponse])
+async def compute_quotes_batch(
+    request: BatchQuoteRequest,
+    organization_id: str = Depends(get_organization_id),
+    current_user: User = Depends(get_current_active_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Compute pricing quotes for up to 500 leads in one call
+    
+    Requires: pricing.quote permission in the organization
+    """
+    verify_organization_access(organization_id, current_user, db)
+    require_permission(current_user, organization_id, "pricing.quote", db)
+    
+    try:
+        pricing_service = PricingService(SettingsResolver(db))
+        quotes = pricing_service.compute_quotes(
+            [_to_pricing_request(quote_request, organization_id) for quote_request in request.quotes],
+            db,
+            current_user.id
+        )
+        return [QuoteResponse(**quote.to_dict()) for quote in quotes]
+        
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error computing batch quotes for org {organization_id}: {str(e)}")
+        raise HTTPException(status_code=500, detail="Internal server error computing quotes")
+
+
 @router.post("/rules", response_model=PricingRuleResponse)
 async def create_pricing_rule(
     rule_data: PricingRuleCreate,
@@ -223,7 +275,7 @@ async def create_pricing_rule(
     """
     # Verify organization access and permissions
     verify_organization_access(organization_id, current_user, db)
-    require_permission(current_user.id, organization_id, "pricing.rules.create", db)
+    require_permission(current_user, organization_id, "pricing.rules.create", db)
     
     try:
         # Create new pricing rule
@@ -296,7 +348,7 @@ async def list_pricing_rules(
     """
     # Verify organization access and permissions
     verify_organization_access(organization_id, current_user, db)
-    require_permission(current_user.id, organization_id, "pricing.rules.read", db)
+    require_permission(current_user, organization_id, "pricing.rules.read", db)
     
     try:
         query = db.query(PricingRule).filter(PricingRule.organization_id == organization_id)
@@ -355,7 +407,7 @@ async def get_pricing_rule(
     """
     # Verify organization access and permissions
     verify_organization_access(organization_id, current_user, db)
-    require_permission(current_user.id, organization_id, "pricing.rules.read", db)
+    require_permission(current_user, organization_id, "pricing.rules.read", db)
     
     try:
         pricing_rule = db.query(PricingRule).filter(
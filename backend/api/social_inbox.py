@@ -10,6 +10,7 @@ from typing import Dict, Any, List, Optional
 from datetime import datetime, timezone
 from fastapi import APIRouter, Depends, HTTPException, Request, BackgroundTasks, Query, WebSocket, WebSocketDisconnect
 from fastapi.responses import JSONResponse
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 from pydantic import BaseModel, Field, ConfigDict
 
@@ -22,6 +23,7 @@ from backend.auth.dependencies import get_current_active_user
 from backend.middleware.tenant_context import get_tenant_context, TenantContext, require_role
 from backend.services.social_webhook_service import get_webhook_service
 from backend.services.personality_response_engine import get_personality_engine
+from backend.services.inbox_counters import get_inbox_counts, list_inbox_page
 from backend.services.websocket_manager import websocket_service
 
 logger = logging.getLogger(__name__)
@@ -51,6 +53,7 @@ class InteractionListResponse(BaseModel):
     total_count: int
     unread_count: int
     high_priority_count: int
+    next_cursor: Optional[str] = None
 
 class CreateResponseRequest(BaseModel):
     interaction_id: str
@@ -94,6 +97,7 @@ async def get_interactions(
     user_id: Optional[int] = Query(None, description="Filter by specific user (optional within org)"),
     limit: int = Query(50, ge=1, le=100),
     offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page; preferred over offset"),
     tenant_context: TenantContext = Depends(get_tenant_context),
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
@@ -104,60 +108,45 @@ async def get_interactions(
     Inbox is org-scoped; user filters are optional.
     """
     try:
-        # Build org-scoped query via SocialPlatformConnection
-        query = db.query(SocialInteraction).join(
-            SocialPlatformConnection,
-            SocialInteraction.connection_id == SocialPlatformConnection.id
-        ).filter(
-            SocialPlatformConnection.organization_id == tenant_context.organization_id
+        # Page of ids via keyset pagination on the covering inbox index
+        interactions, next_cursor = list_inbox_page(
+            db,
+            tenant_context.organization_id,
+            limit=limit,
+            cursor=cursor,
+            offset=offset,
+            user_id=user_id,
+            platform=platform,
+            status=status,
+            intent=intent
         )
         
-        # Optional user filtering within organization
-        if user_id is not None:
-            query = query.filter(SocialInteraction.user_id == user_id)
-        
-        if platform:
-            query = query.filter(SocialInteraction.platform == platform)
-        
-        if status:
-            query = query.filter(SocialInteraction.status == status)
-        
-        if intent:
-            query = query.filter(SocialInteraction.intent == intent)
-        
-        # Get total count before pagination
-        total_count = query.count()
-        
-        # Get paginated results
-        interactions = query.order_by(
-            SocialInteraction.priority_score.desc(),
-            SocialInteraction.received_at.desc()
-        ).offset(offset).limit(limit).all()
-        
-        # Get summary counts (org-scoped)
-        base_org_query = db.query(SocialInteraction).join(
-            SocialPlatformConnection,
-            SocialInteraction.connection_id == SocialPlatformConnection.id
-        ).filter(
-            SocialPlatformConnection.organization_id == tenant_context.organization_id
+        # Totals and badges from maintained counters; intent isn't counted,
+        # so an intent-filtered total still needs a COUNT
+        counts = get_inbox_counts(
+            db, tenant_context.organization_id, user_id=user_id, platform=platform, status=status
         )
-        
-        unread_count = base_org_query.filter(
-            SocialInteraction.status == 'unread'
-        ).count()
-        
-        high_priority_count = base_org_query.filter(
-            SocialInteraction.priority_score >= 70,
-            SocialInteraction.status.in_(['unread', 'read'])
-        ).count()
+        if intent:
+            query = db.query(func.count(SocialInteraction.id)).filter(
+                SocialInteraction.organization_id == str(tenant_context.organization_id),
+                SocialInteraction.intent == intent
+            )
+            if user_id is not None:
+                query = query.filter(SocialInteraction.user_id == user_id)
+            if platform:
+                query = query.filter(SocialInteraction.platform == platform)
+            if status:
+                query = query.filter(SocialInteraction.status == status)
+            counts["total_count"] = query.scalar()
         
         return InteractionListResponse(
             interactions=interactions,
-            total_count=total_count,
-            unread_count=unread_count,
-            high_priority_count=high_priority_count
+            next_cursor=next_cursor,
+            **counts
         )
         
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Failed to get interactions: {e}")
         raise HTTPException(status_code=500, detail="Failed to retrieve interactions")
@@ -238,14 +238,14 @@ async def oauth_callback(
             # Note: Twitter OAuth 2.0 with PKCE requires code_verifier
             # In production, this should be stored in session/cache
             code_verifier = "dummy_verifier"  # Should be retrieved from session
-            token_data = twitter_client.exchange_code_for_tokens(code, redirect_uri, code_verifier)
+            token_data = await twitter_client.exchange_code_for_tokens(code, redirect_uri, code_verifier)
             
             # Get user info to store connection details
-            user_info = twitter_client.get_user_info(token_data["access_token"])
+            user_info = await twitter_client.get_user_info(token_data["access_token"])
             
         elif platform == "instagram":
-            token_data = instagram_client.exchange_code_for_tokens(code, redirect_uri)
-            user_info = instagram_client.get_user_info(token_data["access_token"])
+            token_data = await instagram_client.exchange_code_for_tokens(code, redirect_uri)
+            user_info = await instagram_client.get_user_info(token_data["access_token"])
         
         # Encrypt and store tokens
         token_manager = get_token_manager()
@@ -515,9 +515,9 @@ async def validate_platform_connection(
         
         # Validate connection based on platform
         if platform == "twitter":
-            validation_result = twitter_client.validate_connection(access_token)
+            validation_result = await twitter_client.validate_connection(access_token)
         elif platform == "instagram":
-            validation_result = instagram_client.validate_connection(access_token)
+            validation_result = await instagram_client.validate_connection(access_token)
         else:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -608,7 +608,7 @@ async def post_to_platforms(
             
             # Post to platform
             if platform == "twitter":
-                post_result = twitter_client.post_tweet(
+                post_result = await twitter_client.post_tweet(
                     access_token, 
                     post_request.content, 
                     current_user.id,
@@ -622,7 +622,7 @@ async def post_to_platforms(
                     })
                     continue
                     
-                post_result = instagram_client.post_image(
+                post_result = await instagram_client.post_image(
                     access_token,
                     post_request.media_urls[0],
                     post_request.content,
@@ -7,7 +7,7 @@ Enables better testing, dependency injection, and configuration management.
 import os
 import sys
 import logging
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Union
 from pathlib import Path
 
 from fastapi import FastAPI, Request, HTTPException
@@ -17,6 +17,7 @@ from fastapi.staticfiles import StaticFiles
 # Import centralized modules
 from backend.core.logging import setup_logging, get_logger
 from backend.core.api_version import get_api_version
+from backend.core.startup_profile import get_startup_profile
 
 logger = logging.getLogger(__name__)
 
@@ -33,7 +34,8 @@ class AppConfig:
         debug: bool = None,
         enable_docs: bool = None,
         cors_origins: List[str] = None,
-        middleware: List[Dict[str, Any]] = None
+        middleware: List[Dict[str, Any]] = None,
+        router_groups: Union[str, List[str], None] = None
     ):
         # Environment detection
         self.environment = environment or os.getenv("ENVIRONMENT", "production").lower()
@@ -55,6 +57,9 @@ class AppConfig:
         # Middleware configuration
         self.middleware = middleware or []
         
+        # Router groups to serve (None: API_ROUTER_GROUPS setting, "all" by default)
+        self.router_groups = router_groups
+        
         # API versioning
         self.api_version = get_api_version()
     
@@ -205,16 +210,21 @@ def _setup_fallback_cors(app: FastAPI, config: AppConfig) -> None:
         )
 
 
-def setup_routers(app: FastAPI) -> tuple:
-    """Setup API routers."""
+def setup_routers(app: FastAPI, groups: Union[str, List[str], None] = None) -> tuple:
+    """Setup API routers for the selected groups, importing each router module on demand."""
     loaded_routers = []
     failed_routers = []
     
     try:
-        from backend.api._registry import ROUTERS
-        logger.info("Loading {} routers from registry".format(len(ROUTERS)))
+        from backend.api._registry import load_routers
+        from backend.core.config import get_settings
+        
+        if groups is None:
+            groups = get_settings().api_router_groups
+        routers, failed_routers = load_routers(groups, profile=get_startup_profile())
+        logger.info("Loading {} routers from registry (groups: {})".format(len(routers), groups))
         
-        for router in ROUTERS:
+        for _, router in routers:
             try:
                 router_name = getattr(router, 'prefix', 'unknown').replace('/api/', '') or 'root'
                 app.include_router(router)
@@ -346,7 +356,8 @@ def setup_health_endpoints(app: FastAPI, config: AppConfig, loaded_routers: List
             "python_version": sys.version,
             "available_routes": len(app.routes),
             "loaded_modules": loaded_routers,
-            "failed_modules": len(failed_routers)
+            "failed_modules": len(failed_routers),
+            "startup_profile": get_startup_profile().as_dict(limit=10)
         }
 
 
@@ -411,10 +422,11 @@ async def create_app_async(config: Optional[AppConfig] = None) -> FastAPI:
     )
     
     # Setup middleware
-    setup_middleware(app, config)
+    with get_startup_profile().measure("middleware"):
+        setup_middleware(app, config)
     
     # Setup routers
-    loaded_routers, failed_routers = setup_routers(app)
+    loaded_routers, failed_routers = setup_routers(app, config.router_groups)
     
     # Setup static files
     setup_static_files(app)
@@ -432,6 +444,9 @@ async def create_app_async(config: Optional[AppConfig] = None) -> FastAPI:
     logger.info("Loaded {} routers successfully".format(len(loaded_routers)))
     logger.info("Failed to load {} routers".format(len(failed_routers)))
     logger.info("Total routes: {}".format(len(app.routes)))
+    logger.info("Startup imports took {:.2f}s; slowest:\n{}".format(
+        get_startup_profile().total_seconds, get_startup_profile().format_report(limit=5)
+    ))
     logger.info("=" * 50)
     
     return app
@@ -486,10 +501,11 @@ def create_app(config: Optional[AppConfig] = None) -> FastAPI:
     )
     
     # Setup middleware
-    setup_middleware(app, config)
+    with get_startup_profile().measure("middleware"):
+        setup_middleware(app, config)
     
     # Setup routers
-    loaded_routers, failed_routers = setup_routers(app)
+    loaded_routers, failed_routers = setup_routers(app, config.router_groups)
     
     # Setup static files
     setup_static_files(app)
@@ -507,6 +523,9 @@ def create_app(config: Optional[AppConfig] = None) -> FastAPI:
     logger.info("Loaded {} routers successfully".format(len(loaded_routers)))
     logger.info("Failed to load {} routers".format(len(failed_routers)))
     logger.info("Total routes: {}".format(len(app.routes)))
+    logger.info("Startup imports took {:.2f}s; slowest:\n{}".format(
+        get_startup_profile().total_seconds, get_startup_profile().format_report(limit=5)
+    ))
     logger.info("=" * 50)
     
     return app
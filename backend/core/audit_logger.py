@@ -8,12 +8,12 @@ import logging
 import time
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 from contextlib import contextmanager
 from functools import wraps
 
 import structlog
-from sqlalchemy import create_engine, Column, Integer, String, Text, DateTime, JSON
+from sqlalchemy import create_engine, insert, Column, Integer, String, Text, DateTime, JSON
 from sqlalchemy.orm import sessionmaker, declarative_base
 
 # Configure structured logging
@@ -262,6 +262,74 @@ class AuditLogger:
                 self.logger.error("Failed to persist audit log", error=str(e))
                 self.db_session.rollback()
     
+    def log_events(self, events: List[Dict[str, Any]], db: Optional[Any] = None) -> int:
+        """
+        Log many audit events with a single batched insert.
+        
+        Each event takes the same keyword arguments as log_event. Rows are
+        added to the caller's session when one is given, so they commit
+        atomically with the changes they describe; otherwise they go to the
+        logger's own session.
+        
+        Args:
+            events: Event keyword-argument dicts
+            db: Session to insert into (caller commits)
+            
+        Returns:
+            Number of events logged
+        """
+        if not events:
+            return 0
+        
+        timestamp = datetime.now(timezone.utc)
+        rows = []
+        
+        for event in events:
+            event_type = event["event_type"]
+            if isinstance(event_type, AuditEventType):
+                event_type = event_type.value
+            details = event.get("details")
+            
+            compliance_flags = dict(event.get("compliance_flags") or {})
+            compliance_flags.update({
+                "retention_required": self._requires_retention(event_type),
+                "pii_involved": self._contains_pii(details),
+                "security_relevant": self._is_security_relevant(event_type),
+                "gdpr_relevant": self._is_gdpr_relevant(event_type, details)
+            })
+            
+            row = {
+                "timestamp": timestamp.replace(tzinfo=None),
+                "event_type": event_type,
+                "user_id": event.get("user_id"),
+                "session_id": event.get("session_id"),
+                "ip_address": event.get("ip_address"),
+                "user_agent": event.get("user_agent"),
+                "resource": event.get("resource"),
+                "action": event.get("action"),
+                "outcome": event.get("outcome", "success"),
+                "details": details,
+                "compliance_flags": compliance_flags
+            }
+            rows.append(row)
+            
+            self.logger.info("audit_event", **{**row, "timestamp": timestamp.isoformat(), "details": details or {}})
+        
+        session = db or self.db_session
+        if session is not None:
+            try:
+                session.execute(insert(AuditLog), rows)
+                if db is None:
+                    session.commit()
+            except Exception as e:
+                self.logger.error("Failed to persist audit log batch", error=str(e), count=len(rows))
+                if db is None:
+                    session.rollback()
+                else:
+                    raise
+        
+        return len(rows)
+    
     def _requires_retention(self, event_type: str) -> bool:
         """Determine if event requires long-term retention."""
         retention_events = {
@@ -270,6 +270,15 @@ class Settings(BaseSettings):
     cb_fail_threshold: int = Field(default=5, env="CB_FAIL_THRESHOLD")
     cb_cooldown_s: int = Field(default=120, env="CB_COOLDOWN_S")
     
+    # Data retention: chunked deletes, paced and bounded per run
+    retention_delete_chunk_size: int = Field(default=1000, env="RETENTION_DELETE_CHUNK_SIZE")
+    retention_delete_rows_per_second: int = Field(default=5000, env="RETENTION_DELETE_ROWS_PER_SECOND")
+    retention_run_max_seconds: int = Field(default=1800, env="RETENTION_RUN_MAX_SECONDS")
+
+    # API startup: router groups this process serves ("all" or e.g. "auth,content") and create_app budget
+    api_router_groups: str = Field(default="all", env="API_ROUTER_GROUPS")
+    api_import_budget_seconds: float = Field(default=9.0, env="API_IMPORT_BUDGET_SECONDS")
+
     # File Upload Configuration
     upload_dir: str = Field(default="uploads", env="UPLOAD_DIR")
     max_file_size: int = Field(default=10 * 1024 * 1024, env="MAX_FILE_SIZE")  # 10MB default
@@ -0,0 +1,189 @@
+"""
+Exact k-nearest-neighbour search over an in-memory NumPy matrix
+
+Shared fallback for when FAISS is unavailable. Vectors are L2-normalized
+on insert and kept in one contiguous, over-allocated matrix, so a query
+is a single matrix-vector product followed by an O(n) argpartition for
+the top k; cosine similarity is then just the dot product.
+"""
+from typing import Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+ArrayLike = Union[np.ndarray, Sequence[float], Sequence[Sequence[float]]]
+
+# Rows scored per block when storage is float16 (NumPy has no fast float16 GEMM)
+FLOAT16_BLOCK_ROWS = 16384
+
+
+def normalize_rows(vectors: np.ndarray) -> np.ndarray:
+    """
+    L2-normalize each row in place; all-zero rows stay zero
+
+    Args:
+        vectors: 2-D float array
+
+    Returns:
+        The same array
+    """
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    np.divide(vectors, norms, out=vectors, where=norms > 0)
+    return vectors
+
+
+class ExactKNNIndex:
+    """Brute-force cosine kNN over pre-normalized vectors"""
+
+    def __init__(self, dimension: int, dtype: np.dtype = np.float32, initial_capacity: int = 1024):
+        """
+        Initialize an empty index
+
+        Args:
+            dimension: Vector dimension
+            dtype: Storage type, float32 or float16 (half the memory, slower scoring)
+            initial_capacity: Rows to allocate up front
+        """
+        self.dimension = dimension
+        self.dtype = np.dtype(dtype)
+        if self.dtype not in (np.float32, np.float16):
+            raise ValueError(f"Unsupported storage dtype {self.dtype}; use float32 or float16")
+        self._matrix = np.zeros((max(1, initial_capacity), dimension), dtype=self.dtype)
+        self._size = 0
+
+    @classmethod
+    def from_vectors(cls, vectors: ArrayLike, dimension: Optional[int] = None, dtype: np.dtype = np.float32) -> "ExactKNNIndex":
+        """
+        Build an index from existing vectors
+
+        Args:
+            vectors: 2-D array of vectors (need not be normalized)
+            dimension: Vector dimension, used when `vectors` is empty
+            dtype: Storage type
+
+        Returns:
+            ExactKNNIndex holding the vectors
+        """
+        vectors = np.asarray(vectors, dtype=np.float32)
+        if vectors.size == 0:
+            return cls(dimension or (vectors.shape[1] if vectors.ndim == 2 else 0), dtype)
+        index = cls(vectors.shape[1], dtype, initial_capacity=len(vectors))
+        index.add_batch(vectors)
+        return index
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def vectors(self) -> np.ndarray:
+        """The stored (normalized) vectors, as a view"""
+        return self._matrix[:self._size]
+
+    def add(self, vector: ArrayLike) -> int:
+        """
+        Add one vector
+
+        Args:
+            vector: 1-D vector
+
+        Returns:
+            Row index of the vector
+        """
+        return self.add_batch(np.asarray(vector, dtype=np.float32).reshape(1, -1)).start
+
+    def add_batch(self, vectors: ArrayLike) -> range:
+        """
+        Add several vectors
+
+        Args:
+            vectors: 2-D array of vectors
+
+        Returns:
+            Row indexes of the added vectors
+        """
+        vectors = normalize_rows(np.array(vectors, dtype=np.float32, ndmin=2))
+        if vectors.shape[1] != self.dimension:
+            raise ValueError(f"Expected {self.dimension} dimensions, got {vectors.shape[1]}")
+
+        start = self._size
+        end = start + len(vectors)
+        if end > len(self._matrix):
+            # Amortized doubling instead of np.vstack per insert
+            grown = np.zeros((max(end, 2 * len(self._matrix)), self.dimension), dtype=self.dtype)
+            grown[:start] = self._matrix[:start]
+            self._matrix = grown
+        self._matrix[start:end] = vectors
+        self._size = end
+        return range(start, end)
+
+    def scores(self, queries: ArrayLike) -> np.ndarray:
+        """
+        Cosine similarity of each query to every stored vector
+
+        Args:
+            queries: 1-D query or 2-D batch of queries
+
+        Returns:
+            (n,) scores for a single query, (m, n) for a batch
+        """
+        queries = np.array(queries, dtype=np.float32, ndmin=2)
+        normalize_rows(queries)
+        if self.dtype == np.float16:
+            scores = np.empty((len(queries), self._size), dtype=np.float32)
+            for start in range(0, self._size, FLOAT16_BLOCK_ROWS):
+                block = self._matrix[start:start + FLOAT16_BLOCK_ROWS].astype(np.float32)
+                scores[:, start:start + len(block)] = queries @ block.T
+        else:
+            scores = queries @ self.vectors.T
+        return scores
+
+    def search(self, query: ArrayLike, top_k: int = 5, threshold: Optional[float] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Top-k most similar stored vectors for one query
+
+        Args:
+            query: 1-D query vector
+            top_k: Number of neighbours
+            threshold: Drop neighbours scoring below this
+
+        Returns:
+            (scores, indexes), best first
+        """
+        scores, indexes = self.search_batch(np.asarray(query, dtype=np.float32).reshape(1, -1), top_k, threshold)
+        return scores[0], indexes[0]
+
+    def search_batch(self, queries: ArrayLike, top_k: int = 5, threshold: Optional[float] = None) -> Tuple[list, list]:
+        """
+        Top-k most similar stored vectors for each of several queries
+
+        Args:
+            queries: 2-D batch of query vectors
+            top_k: Number of neighbours per query
+            threshold: Drop neighbours scoring below this
+
+        Returns:
+            (scores, indexes) lists with one array per query, best first
+        """
+        queries = np.array(queries, dtype=np.float32, ndmin=2)
+        k = min(top_k, self._size)
+        if k <= 0:
+            empty_scores = np.empty(0, dtype=np.float32)
+            empty_indexes = np.empty(0, dtype=np.int64)
+            return [empty_scores] * len(queries), [empty_indexes] * len(queries)
+
+        scores = self.scores(queries)
+        if k < self._size:
+            candidates = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        else:
+            candidates = np.broadcast_to(np.arange(self._size), (len(queries), self._size))
+        candidate_scores = np.take_along_axis(scores, candidates, axis=1)
+        order = np.argsort(-candidate_scores, axis=1, kind="stable")
+        top_indexes = np.take_along_axis(candidates, order, axis=1)
+        top_scores = np.take_along_axis(candidate_scores, order, axis=1)
+
+        if threshold is None:
+            return list(top_scores), list(top_indexes)
+        keep = top_scores >= threshold
+        return (
+            [row[mask] for row, mask in zip(top_scores, keep)],
+            [row[mask] for row, mask in zip(top_indexes, keep)],
+        )
@@ -4,10 +4,19 @@ Centralized HTTP Client Configuration
 Provides standardized async HTTP client with proper configuration, 
 timeouts, retry logic, and connection pooling.
 Replaces ad-hoc httpx.AsyncClient() and requests calls.
+
+Social platform clients share one pooled client per platform (see
+get_platform_http_client) with HTTP/2, keep-alive and per-platform
+connection limits, plus connection reuse and handshake metrics.
+Only idempotent methods are retried unless a call passes retry=True, and
+each event loop gets its own pool.
 """
 import os
 import asyncio
+import importlib.util
 import logging
+import time
+import weakref
 from contextlib import asynccontextmanager
 from typing import Optional, Dict, Any
 
@@ -16,6 +25,25 @@ import httpx
 logger = logging.getLogger(__name__)
 
 
+# HTTP/2 needs the optional h2 package; fall back to HTTP/1.1 keep-alive without it
+HTTP2_AVAILABLE = importlib.util.find_spec('h2') is not None
+
+# Methods safe to resend after a timeout or 5xx. A POST may already have been
+# applied (a published post, a consumed upload stream), so it is only retried
+# when the caller opts in with retry=True, e.g. behind an idempotency key.
+IDEMPOTENT_METHODS = frozenset({'GET', 'HEAD', 'PUT', 'DELETE', 'OPTIONS'})
+
+# Per-platform pool sizing. Each platform gets its own pool so a slow or
+# throttled API cannot hold connections another platform needs.
+# Override with HTTP_<PLATFORM>_MAX_CONNECTIONS / _MAX_KEEPALIVE / _TIMEOUT.
+PLATFORM_POOL_LIMITS: Dict[str, Dict[str, float]] = {
+    'facebook': {'max_connections': 50, 'max_keepalive_connections': 20, 'timeout': 120.0},
+    'instagram': {'max_connections': 50, 'max_keepalive_connections': 20, 'timeout': 30.0},
+    'twitter': {'max_connections': 30, 'max_keepalive_connections': 10, 'timeout': 15.0},
+    'linkedin': {'max_connections': 20, 'max_keepalive_connections': 10, 'timeout': 30.0},
+}
+
+
 class HTTPClientConfig:
     """Configuration for HTTP client."""
     
@@ -24,17 +52,37 @@ class HTTPClientConfig:
         self.max_retries = int(os.getenv('HTTP_MAX_RETRIES', '3'))
         self.max_connections = int(os.getenv('HTTP_MAX_CONNECTIONS', '100'))
         self.max_keepalive_connections = int(os.getenv('HTTP_MAX_KEEPALIVE', '20'))
+        self.keepalive_expiry = float(os.getenv('HTTP_KEEPALIVE_EXPIRY', '30.0'))
+        self.http2 = False
         self.user_agent = os.getenv('HTTP_USER_AGENT', 'AI-Social-Media-Agent/2.0')
         
         # Retry configuration
         self.retry_on_status = [408, 429, 500, 502, 503, 504]
         self.retry_backoff_factor = 0.3
+    
+    @classmethod
+    def for_platform(cls, platform: str) -> 'HTTPClientConfig':
+        """Build the pooled configuration for a social platform."""
+        config = cls()
+        limits = PLATFORM_POOL_LIMITS.get(platform, {})
+        prefix = f'HTTP_{platform.upper()}_'
+        
+        config.max_connections = int(os.getenv(
+            prefix + 'MAX_CONNECTIONS', limits.get('max_connections', config.max_connections)
+        ))
+        config.max_keepalive_connections = int(os.getenv(
+            prefix + 'MAX_KEEPALIVE', limits.get('max_keepalive_connections', config.max_keepalive_connections)
+        ))
+        config.timeout = float(os.getenv(prefix + 'TIMEOUT', limits.get('timeout', config.timeout)))
+        config.http2 = HTTP2_AVAILABLE and os.getenv('HTTP_ENABLE_HTTP2', 'true').lower() == 'true'
+        return config
         
     def to_limits(self):
         """Convert to httpx.Limits object."""
         return httpx.Limits(
             max_connections=self.max_connections,
-            max_keepalive_connections=self.max_keepalive_connections
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry
         )
     
     def to_timeout(self):
@@ -42,35 +90,159 @@ class HTTPClientConfig:
         return httpx.Timeout(self.timeout)
 
 
+class TransportMetrics:
+    """
+    Connection reuse and handshake timings collected from httpcore traces.
+    
+    httpcore resolves DNS inside connect_tcp, so "connect" timings cover
+    DNS resolution plus the TCP handshake; "tls" covers the TLS handshake.
+    """
+    
+    def __init__(self, name: str):
+        self.name = name
+        self.requests = 0
+        self.new_connections = 0
+        self.reused_connections = 0
+        self.failed_connections = 0
+        self.http2_requests = 0
+        self.connect_time_total = 0.0
+        self.tls_handshakes = 0
+        self.tls_time_total = 0.0
+        self.request_time_total = 0.0
+    
+    def record(self, trace: '_RequestTrace', http_version: Optional[str], elapsed: float):
+        """Record one completed request."""
+        self.requests += 1
+        self.request_time_total += elapsed
+        if trace.connect_time is not None:
+            self.new_connections += 1
+            self.connect_time_total += trace.connect_time
+        elif trace.connect_failed:
+            self.failed_connections += 1
+        else:
+            self.reused_connections += 1
+        if trace.tls_time is not None:
+            self.tls_handshakes += 1
+            self.tls_time_total += trace.tls_time
+        if http_version == 'HTTP/2':
+            self.http2_requests += 1
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Metrics snapshot."""
+        connected = self.new_connections + self.reused_connections
+        return {
+            'requests': self.requests,
+            'new_connections': self.new_connections,
+            'reused_connections': self.reused_connections,
+            'failed_connections': self.failed_connections,
+            'connection_reuse_rate': round(self.reused_connections / connected, 4) if connected else 0.0,
+            'http2_requests': self.http2_requests,
+            'avg_connect_ms': round(self.connect_time_total / self.new_connections * 1000, 2)
+            if self.new_connections else 0.0,
+            'tls_handshakes': self.tls_handshakes,
+            'avg_tls_handshake_ms': round(self.tls_time_total / self.tls_handshakes * 1000, 2)
+            if self.tls_handshakes else 0.0,
+            'avg_request_ms': round(self.request_time_total / self.requests * 1000, 2)
+            if self.requests else 0.0
+        }
+
+
+class _RequestTrace:
+    """httpcore "trace" extension callback for a single request."""
+    
+    def __init__(self):
+        self.connect_time: Optional[float] = None
+        self.connect_failed = False
+        self.tls_time: Optional[float] = None
+        self._started: Dict[str, float] = {}
+    
+    async def __call__(self, event_name: str, info: Dict[str, Any]):
+        step, _, phase = event_name.rpartition('.')
+        if phase == 'started':
+            self._started[step] = time.perf_counter()
+            return
+        
+        started = self._started.pop(step, None)
+        if started is None:
+            return
+        if step == 'connection.connect_tcp':
+            if phase == 'complete':
+                self.connect_time = time.perf_counter() - started
+            else:
+                self.connect_failed = True
+        elif step == 'connection.start_tls' and phase == 'complete':
+            self.tls_time = time.perf_counter() - started
+
+
 class HTTPClient:
     """Centralized async HTTP client with standard configuration."""
     
-    def __init__(self, config: Optional[HTTPClientConfig] = None):
+    def __init__(
+        self,
+        config: Optional[HTTPClientConfig] = None,
+        name: str = 'default',
+        transport: Optional[httpx.AsyncBaseTransport] = None
+    ):
         self.config = config or HTTPClientConfig()
-        self._client: Optional[httpx.AsyncClient] = None
+        self.name = name
+        self.metrics = TransportMetrics(name)
+        self._transport = transport
+        # One pool per event loop: pooled connections belong to the loop that
+        # opened them. Entries go away with their loop (weak keys) and are
+        # pruned as soon as their loop is closed.
+        self._clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+            weakref.WeakKeyDictionary()
+        )
         
-    async def _ensure_client(self):
-        """Ensure HTTP client is initialized."""
-        if self._client is None:
-            self._client = httpx.AsyncClient(
+    async def _ensure_client(self) -> httpx.AsyncClient:
+        """Get this event loop's HTTP client, creating it on first use."""
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None:
+            self._prune_closed_loops()
+            client = httpx.AsyncClient(
                 limits=self.config.to_limits(),
                 timeout=self.config.to_timeout(),
+                http2=self.config.http2,
+                transport=self._transport,
                 headers={
                     'User-Agent': self.config.user_agent
                 },
                 follow_redirects=True
             )
+            self._clients[loop] = client
+        return client
+    
+    def _prune_closed_loops(self):
+        """Drop pools whose event loop has closed (e.g. a finished asyncio.run())."""
+        for loop in [loop for loop in list(self._clients.keys()) if loop.is_closed()]:
+            # The loop cannot run aclose() any more; dropping the pool lets its sockets be collected
+            self._clients.pop(loop, None)
+            logger.debug(f"Released {self.name} HTTP pool of a closed event loop")
+    
+    @property
+    def client(self) -> Optional[httpx.AsyncClient]:
+        """Underlying httpx client of the running event loop (None until its first request)."""
+        try:
+            return self._clients.get(asyncio.get_running_loop())
+        except RuntimeError:
+            return None
             
     async def close(self):
-        """Close the HTTP client."""
-        if self._client:
-            await self._client.aclose()
-            self._client = None
+        """Close the HTTP clients: this loop's directly, other running loops' on their own loop."""
+        current = asyncio.get_running_loop()
+        for loop, client in list(self._clients.items()):
+            self._clients.pop(loop, None)
+            if loop is current:
+                await client.aclose()
+            elif not loop.is_closed():
+                asyncio.run_coroutine_threadsafe(client.aclose(), loop)
             
     async def request(
         self, 
         method: str, 
         url: str, 
+        retry: Optional[bool] = None,
         **kwargs
     ) -> httpx.Response:
         """
@@ -79,6 +251,8 @@ class HTTPClient:
         Args:
             method: HTTP method
             url: Request URL
+            retry: Retry on connection errors, timeouts and retryable status
+                codes; defaults to True only for idempotent methods
             **kwargs: Additional request parameters
             
         Returns:
@@ -87,22 +261,25 @@ class HTTPClient:
         Raises:
             httpx.HTTPError: For HTTP errors
         """
-        await self._ensure_client()
+        client = await self._ensure_client()
+        if retry is None:
+            retry = method.upper() in IDEMPOTENT_METHODS
+        max_retries = self.config.max_retries if retry else 0
         
         retry_count = 0
         last_exception = None
         
-        while retry_count <= self.config.max_retries:
+        while retry_count <= max_retries:
             try:
-                response = await self._client.request(method, url, **kwargs)
+                response = await self._traced_request(client, method, url, **kwargs)
                 
                 # Check if we should retry based on status code
-                if response.status_code in self.config.retry_on_status and retry_count < self.config.max_retries:
+                if response.status_code in self.config.retry_on_status and retry_count < max_retries:
                     retry_count += 1
                     backoff_time = self.config.retry_backoff_factor * (2 ** (retry_count - 1))
                     logger.warning(
                         "HTTP {} {} returned {}. Retrying in {:.1f}s (attempt {}/{})".format(
-                            method, url, response.status_code, backoff_time, retry_count, self.config.max_retries
+                            method, url, response.status_code, backoff_time, retry_count, max_retries
                         )
                     )
                     await asyncio.sleep(backoff_time)
@@ -112,12 +289,12 @@ class HTTPClient:
                 
             except (httpx.ConnectError, httpx.TimeoutException) as e:
                 last_exception = e
-                if retry_count < self.config.max_retries:
+                if retry_count < max_retries:
                     retry_count += 1
                     backoff_time = self.config.retry_backoff_factor * (2 ** (retry_count - 1))
                     logger.warning(
                         "HTTP {} {} failed: {}. Retrying in {:.1f}s (attempt {}/{})".format(
-                            method, url, str(e), backoff_time, retry_count, self.config.max_retries
+                            method, url, str(e), backoff_time, retry_count, max_retries
                         )
                     )
                     await asyncio.sleep(backoff_time)
@@ -131,6 +308,17 @@ class HTTPClient:
             response.raise_for_status()
             return response
     
+    async def _traced_request(self, client: httpx.AsyncClient, method: str, url: str, **kwargs) -> httpx.Response:
+        """Send one request, recording connection reuse and handshake timings."""
+        trace = _RequestTrace()
+        extensions = dict(kwargs.pop('extensions', None) or {})
+        extensions.setdefault('trace', trace)
+        
+        started = time.perf_counter()
+        response = await client.request(method, url, extensions=extensions, **kwargs)
+        self.metrics.record(trace, response.http_version, time.perf_counter() - started)
+        return response
+    
     # Convenience methods
     async def get(self, url: str, **kwargs) -> httpx.Response:
         """Make GET request."""
@@ -173,6 +361,43 @@ async def close_http_client():
         _global_client = None
 
 
+# Pooled clients shared by the social platform integrations
+_platform_clients: Dict[str, HTTPClient] = {}
+
+
+def get_platform_http_client(platform: str) -> HTTPClient:
+    """
+    Get the shared pooled HTTP client for a social platform.
+    
+    Args:
+        platform: Platform name (facebook, instagram, twitter, linkedin)
+        
+    Returns:
+        HTTPClient with the platform's connection limits
+    """
+    client = _platform_clients.get(platform)
+    if client is None:
+        client = HTTPClient(HTTPClientConfig.for_platform(platform), name=platform)
+        _platform_clients[platform] = client
+        logger.info(
+            f"Created pooled HTTP client for {platform} "
+            f"(max_connections={client.config.max_connections}, http2={client.config.http2})"
+        )
+    return client
+
+
+def get_platform_transport_stats() -> Dict[str, Dict[str, Any]]:
+    """Connection reuse and handshake metrics per platform."""
+    return {platform: client.metrics.get_stats() for platform, client in _platform_clients.items()}
+
+
+async def close_platform_http_clients():
+    """Close every pooled platform client."""
+    for client in list(_platform_clients.values()):
+        await client.close()
+    _platform_clients.clear()
+
+
 @asynccontextmanager
 async def http_client_context():
     """Context manager for HTTP client lifecycle."""
@@ -0,0 +1,82 @@
+"""
+Lazy Imports
+
+Router modules are imported at startup so their routes can be registered,
+but the services behind them (OpenAI clients, image generation, embeddings,
+research agents) are only needed once a request arrives. A LazyObject stands
+in for such a module-level name and performs the import the first time it is
+used, so registering a router stays cheap:
+
+    image_generation_service = lazy_import(
+        "backend.services.image_generation_service", "image_generation_service"
+    )
+
+Only use this for names that are touched inside request handlers; anything
+evaluated while the module loads (decorators, Depends, response models,
+annotations) resolves the import straight away.
+"""
+import importlib
+import threading
+from typing import Any, Callable, Optional
+
+_UNRESOLVED = object()
+
+
+class LazyObject:
+    """Proxy that builds its target on first attribute access or call"""
+
+    __slots__ = ("_loader", "_description", "_target", "_lock")
+
+    def __init__(self, loader: Callable[[], Any], description: str):
+        object.__setattr__(self, "_loader", loader)
+        object.__setattr__(self, "_description", description)
+        object.__setattr__(self, "_target", _UNRESOLVED)
+        object.__setattr__(self, "_lock", threading.Lock())
+
+    def _resolve(self) -> Any:
+        target = self._target
+        if target is _UNRESOLVED:
+            with self._lock:
+                target = self._target
+                if target is _UNRESOLVED:
+                    target = self._loader()
+                    object.__setattr__(self, "_target", target)
+        return target
+
+    @property
+    def is_resolved(self) -> bool:
+        return self._target is not _UNRESOLVED
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._resolve(), name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self._resolve(), name, value)
+
+    def __call__(self, *args, **kwargs) -> Any:
+        return self._resolve()(*args, **kwargs)
+
+    def __bool__(self) -> bool:
+        return bool(self._resolve())
+
+    def __repr__(self) -> str:
+        state = repr(self._target) if self.is_resolved else "not yet imported"
+        return f"<LazyObject {self._description}: {state}>"
+
+
+def lazy_import(module: str, attribute: Optional[str] = None) -> LazyObject:
+    """
+    Defer importing a module, or one of its attributes, until first use
+
+    Args:
+        module: Dotted module path
+        attribute: Name inside the module (the module itself when None)
+
+    Returns:
+        Proxy that imports on first attribute access or call
+    """
+    def load() -> Any:
+        loaded = importlib.import_module(module)
+        return getattr(loaded, attribute) if attribute else loaded
+
+    return LazyObject(load, f"{module}.{attribute}" if attribute else module)
@@ -10,6 +10,7 @@ from typing import List, Dict, Any, Optional
 from datetime import datetime
 from openai import OpenAI
 from backend.core.config import get_settings
+from backend.core.exact_knn import ExactKNNIndex
 
 settings = get_settings()
 logger = logging.getLogger(__name__)
@@ -30,9 +31,14 @@ class SimpleVectorSearch:
         os.makedirs(index_path, exist_ok=True)
         
         # Load or initialize data
-        self.vectors = self._load_vectors()
+        self.index = ExactKNNIndex.from_vectors(self._load_vectors(), dimension)
         self.metadata = self._load_metadata()
     
+    @property
+    def vectors(self) -> np.ndarray:
+        """Stored (normalized) vectors"""
+        return self.index.vectors
+    
     def _load_vectors(self) -> np.ndarray:
         """Load vectors from disk or create empty array"""
         if os.path.exists(self.vectors_file):
@@ -83,13 +89,9 @@ class SimpleVectorSearch:
         
         if embedding.any():
             # Add to vectors array
-            if self.vectors.shape[0] == 0:
-                self.vectors = embedding.reshape(1, -1)
-            else:
-                self.vectors = np.vstack([self.vectors, embedding])
+            index = self.index.add(embedding)
             
             # Store metadata with index
-            index = len(self.vectors) - 1
             self.metadata[str(index)] = {
                 'content_id': content_id,
                 'content': content,
@@ -116,25 +118,20 @@ class SimpleVectorSearch:
         if not query_embedding.any():
             return []
         
-        # Calculate similarities
-        similarities = np.dot(self.vectors, query_embedding)
-        
-        # Get top-k indices
-        top_indices = np.argsort(similarities)[::-1][:top_k]
+        # Top-k by cosine similarity without sorting every score
+        scores, top_indices = self.index.search(query_embedding, top_k, threshold)
         
         results = []
-        for idx in top_indices:
-            score = similarities[idx]
-            if score >= threshold:
-                metadata = self.metadata.get(str(idx), {})
-                if metadata:
-                    results.append({
-                        'content_id': metadata.get('content_id'),
-                        'content': metadata.get('content', ''),
-                        'similarity_score': float(score),
-                        'metadata': metadata.get('metadata', {}),
-                        'created_at': metadata.get('created_at')
-                    })
+        for score, idx in zip(scores, top_indices):
+            metadata = self.metadata.get(str(idx), {})
+            if metadata:
+                results.append({
+                    'content_id': metadata.get('content_id'),
+                    'content': metadata.get('content', ''),
+                    'similarity_score': float(score),
+                    'metadata': metadata.get('metadata', {}),
+                    'created_at': metadata.get('created_at')
+                })
         
         return results
     
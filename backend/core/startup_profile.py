@@ -0,0 +1,144 @@
+"""
+Startup Import Profile
+
+Records what create_app spends its time importing: each router module (and
+whatever services it pulls in on first import) and the middleware setup, with
+the number of modules each step added to sys.modules. The report is logged at
+startup, exposed on /render-health, and checked in CI against an import-time
+budget and for routers that failed to import (other than for a missing
+optional package):
+
+    python -m backend.core.startup_profile --groups auth,content --budget 4
+"""
+import argparse
+import logging
+import os
+import sys
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ImportCost:
+    """One startup step and what importing it cost"""
+    name: str
+    seconds: float
+    modules_loaded: int
+    error: Optional[str] = None
+    # The failure is an allowed missing optional package
+    optional: bool = False
+
+
+class StartupProfile:
+    """Per-step import costs collected while the app is built"""
+
+    def __init__(self):
+        self.entries: List[ImportCost] = []
+
+    @contextmanager
+    def measure(self, name: str) -> Iterator[None]:
+        """Time a step and count the modules it imported; failures are recorded and re-raised"""
+        modules_before = len(sys.modules)
+        started = time.perf_counter()
+        error = None
+        try:
+            yield
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            self.entries.append(ImportCost(
+                name=name,
+                seconds=time.perf_counter() - started,
+                modules_loaded=len(sys.modules) - modules_before,
+                error=error
+            ))
+
+    @property
+    def total_seconds(self) -> float:
+        return sum(entry.seconds for entry in self.entries)
+
+    def failures(self) -> List[ImportCost]:
+        """Steps that failed for a reason other than a missing optional package"""
+        return [entry for entry in self.entries if entry.error and not entry.optional]
+
+    def slowest(self, limit: int = 10) -> List[ImportCost]:
+        return sorted(self.entries, key=lambda entry: entry.seconds, reverse=True)[:limit]
+
+    def as_dict(self, limit: int = 10) -> Dict[str, Any]:
+        return {
+            "total_seconds": round(self.total_seconds, 3),
+            "steps": len(self.entries),
+            "slowest": [
+                dict(asdict(entry), seconds=round(entry.seconds, 3)) for entry in self.slowest(limit)
+            ]
+        }
+
+    def format_report(self, limit: int = 15) -> str:
+        lines = [f"{'seconds':>9}  {'modules':>7}  step"]
+        for entry in self.slowest(limit):
+            suffix = f"  ({'skipped' if entry.optional else 'failed'}: {entry.error})" if entry.error else ""
+            lines.append(f"{entry.seconds:>9.3f}  {entry.modules_loaded:>7}  {entry.name}{suffix}")
+        modules_loaded = sum(entry.modules_loaded for entry in self.entries)
+        lines.append(f"{self.total_seconds:>9.3f}  {modules_loaded:>7}  total over {len(self.entries)} steps")
+        return "\n".join(lines)
+
+
+# Global startup profile instance
+_startup_profile: Optional[StartupProfile] = None
+
+
+def get_startup_profile() -> StartupProfile:
+    """Get the profile of this process's app startup"""
+    global _startup_profile
+    if _startup_profile is None:
+        _startup_profile = StartupProfile()
+    return _startup_profile
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Build the app once, print the import profile and enforce the budget and clean imports"""
+    parser = argparse.ArgumentParser(description="Profile create_app imports against a time budget")
+    parser.add_argument("--groups", default=None, help="Router groups to load (default: API_ROUTER_GROUPS)")
+    parser.add_argument("--budget", type=float, default=None,
+                        help="Seconds create_app may take, imports included (default: API_IMPORT_BUDGET_SECONDS)")
+    parser.add_argument("--top", type=int, default=15, help="Slowest steps to list")
+    args = parser.parse_args(argv)
+
+    # The budget covers everything create_app imports, so nothing app-related may be loaded yet
+    started = time.perf_counter()
+    from backend.core.app_factory import AppConfig, create_app
+    from backend.core.config import get_settings
+    # Run as __main__, this module's globals are not the ones create_app records into
+    from backend.core.startup_profile import get_startup_profile as get_app_startup_profile
+
+    settings = get_settings()
+    groups = args.groups or settings.api_router_groups
+    budget = args.budget if args.budget is not None else settings.api_import_budget_seconds
+
+    app = create_app(AppConfig(environment=os.getenv("ENVIRONMENT", "testing"), router_groups=groups))
+    elapsed = time.perf_counter() - started
+
+    profile = get_app_startup_profile()
+    print(profile.format_report(args.top))
+    print(f"\ncreate_app ({len(app.routes)} routes, groups: {groups}): {elapsed:.2f}s of {budget:.2f}s budget")
+    status = 0
+    # A broken import also makes startup faster, so it must fail the check on its own
+    failures = profile.failures()
+    if failures:
+        print(f"{len(failures)} startup steps failed:")
+        for entry in failures:
+            print(f"  {entry.name}: {entry.error}")
+        status = 1
+    if elapsed > budget:
+        print(f"Import-time budget exceeded by {elapsed - budget:.2f}s")
+        status = 1
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -483,12 +483,16 @@ class VectorStore:
             return False
         
         # Remove from all data structures
-        self._metadata.pop(internal_id, None)
+        removed = self._metadata.pop(internal_id, None)
         self._id_mapping.pop(internal_id, None)
         self._vectors.pop(internal_id, None)
         
         logger.info(f"Removed vector data for content_id: {content_id}")
         
+        # Keep the near-duplicate pre-check from matching deleted content
+        from backend.services.near_duplicate_index import content_scope, get_near_duplicate_index
+        get_near_duplicate_index().remove(content_id, content_scope((removed or {}).get('metadata')))
+        
         if rebuild_index:
             # Immediately rebuild index to ensure true deletion
             self.rebuild_index()
@@ -529,6 +533,11 @@ class VectorStore:
         logger.info(f"Bulk removal complete: {removed_count}/{len(content_ids)} vectors removed")
         return removed_count
     
+    def iter_metadata(self):
+        """Yield (content_id, metadata) for every stored vector"""
+        for entry in list(self._metadata.values()):
+            yield entry.get('content_id'), entry.get('metadata') or {}
+    
     def get_statistics(self) -> Dict[str, Any]:
         """Get comprehensive index statistics."""
         stored_vectors = len(self._vectors)
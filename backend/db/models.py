@@ -1,5 +1,6 @@
 from sqlalchemy import Column, Integer, String, DateTime, Float, Boolean, Text, JSON, ForeignKey, Index, UniqueConstraint, Numeric
-from sqlalchemy.orm import relationship
+from sqlalchemy import event
+from sqlalchemy.orm import Session, relationship
 from sqlalchemy.sql import func
 from sqlalchemy.dialects.postgresql import UUID
 from backend.db.database import Base
@@ -599,7 +600,13 @@ class ContentItem(Base):
 
 
 class ContentPerformanceSnapshot(Base):
-    """Time-series performance data for content items"""
+    """
+    Time-series performance data for content items
+    
+    On PostgreSQL the table is range-partitioned by month on snapshot_time
+    (primary key id + snapshot_time); see services/performance_snapshot_store.
+    Rows are only written when a counter changed since the previous sweep.
+    """
     __tablename__ = "content_performance_snapshots"
     
     id = Column(Integer, primary_key=True, index=True)
@@ -635,6 +642,38 @@ class ContentPerformanceSnapshot(Base):
     )
 
 
+class ContentPerformanceRollup(Base):
+    """Hourly and daily downsampled performance history for trend queries"""
+    __tablename__ = "content_performance_rollups"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    content_item_id = Column(String, ForeignKey("content_items.id"), nullable=False)
+    granularity = Column(String(8), nullable=False)  # hour, day
+    bucket_start = Column(DateTime(timezone=True), nullable=False)
+    
+    # Latest values within the bucket
+    likes_count = Column(Integer, default=0)
+    shares_count = Column(Integer, default=0)
+    comments_count = Column(Integer, default=0)
+    reach_count = Column(Integer, default=0)
+    click_count = Column(Integer, default=0)
+    engagement_rate = Column(Float, default=0.0)
+    engagement_velocity = Column(Float, default=0.0)
+    viral_coefficient = Column(Float, default=0.0)
+    
+    # Peaks and sample count within the bucket
+    max_engagement_rate = Column(Float, default=0.0)
+    max_engagement_velocity = Column(Float, default=0.0)
+    sample_count = Column(Integer, default=0)
+    
+    updated_at = Column(DateTime(timezone=True))
+    
+    __table_args__ = (
+        UniqueConstraint('content_item_id', 'granularity', 'bucket_start', name='uq_rollup_content_bucket'),
+        Index('idx_rollup_granularity_bucket', granularity, bucket_start),
+    )
+
+
 class ContentCategory(Base):
     """Hierarchical content categorization system"""
     __tablename__ = "content_categories"
@@ -1071,6 +1110,8 @@ class SocialInteraction(Base):
     id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
     connection_id = Column(Integer, ForeignKey("social_platform_connections.id"), nullable=True)
+    # Copied from the connection so inbox queries don't need the join
+    organization_id = Column(String, ForeignKey("organizations.id", ondelete="CASCADE"), nullable=True)
     
     # Platform and interaction details
     platform = Column(String, nullable=False, index=True)  # facebook, instagram, twitter
@@ -1121,9 +1162,66 @@ class SocialInteraction(Base):
         Index('idx_social_interaction_status_priority', status, priority_score),
         Index('idx_social_interaction_user_received', user_id, received_at),
         Index('idx_social_interaction_external', platform, external_id),
+        # Inbox listing: keyset order plus filter columns, so the page of ids
+        # is read from the index alone
+        Index('idx_social_interaction_org_inbox', organization_id, priority_score, received_at, id,
+              postgresql_include=['status', 'platform', 'user_id', 'intent']),
+        Index('idx_social_interaction_org_status_inbox', organization_id, status, priority_score, received_at, id,
+              postgresql_include=['platform', 'user_id', 'intent']),
     )
 
 
+class SocialInboxCounter(Base):
+    """
+    Maintained social interaction counts for inbox badges and totals
+    
+    One row per (organization, user, platform, status, priority band);
+    user_id 0 holds the organization-wide count. Kept in step with
+    social_interactions in the same transaction by
+    backend.services.inbox_counters.
+    """
+    __tablename__ = "social_inbox_counters"
+    
+    organization_id = Column(String, ForeignKey("organizations.id", ondelete="CASCADE"), primary_key=True)
+    user_id = Column(Integer, primary_key=True, default=0)
+    platform = Column(String, primary_key=True)
+    status = Column(String, primary_key=True)
+    is_high_priority = Column(Boolean, primary_key=True)
+    count = Column(Integer, nullable=False, default=0)
+
+
+# SocialInteraction attributes that determine which counter row it belongs to
+SOCIAL_INBOX_COUNTER_FIELDS = ("organization_id", "user_id", "platform", "status", "priority_score")
+
+
+def _load_previous_counter_value(target, value, oldvalue, initiator):
+    return value
+
+
+# Load the old value when a counter field is set on an expired instance,
+# otherwise its history would not say which counter row to decrement
+for _field in SOCIAL_INBOX_COUNTER_FIELDS:
+    event.listen(
+        getattr(SocialInteraction, _field), "set", _load_previous_counter_value,
+        active_history=True, retval=True
+    )
+
+
+# The counter hooks are registered with the models so every process that
+# flushes interactions (API, workers, scripts) keeps the counters in step;
+# the work is done in backend.services.inbox_counters, imported on first flush
+@event.listens_for(Session, "before_flush")
+def _fill_interaction_organization(session, flush_context, instances) -> None:
+    from backend.services.inbox_counters import fill_interaction_organization
+    fill_interaction_organization(session)
+
+
+@event.listens_for(Session, "after_flush")
+def _maintain_inbox_counters(session, flush_context) -> None:
+    from backend.services.inbox_counters import maintain_inbox_counters
+    maintain_inbox_counters(session)
+
+
 class InteractionResponse(Base):
     """Stores responses sent to social media interactions"""
     __tablename__ = "interaction_responses"
@@ -1476,7 +1574,11 @@ class PricingRule(Base):
         "maximum_travel_distance": 50.0
     })
     
+    # Rush fees, customer tiers, tax rate and quote validity
+    business_rules = Column(JSON, nullable=False, default={})
+    
     # Pricing rule metadata
+    priority = Column(Integer, nullable=False, default=0)  # Highest priority active rule wins
     version = Column(Integer, nullable=False, default=1)  # For versioning pricing rules
     effective_date = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
     expiry_date = Column(DateTime(timezone=True))  # Optional expiration
@@ -1601,6 +1703,44 @@ class Quote(Base):
         return f"<Quote(id={self.id}, org={self.organization_id}, status={self.status}, total={self.total})>"
 
 
+class QuoteNumberSequence(Base):
+    """
+    Per-organization, per-month counter for human-readable quote numbers
+    
+    Incremented with a single upsert so concurrent quote creation never
+    hands out the same number twice.
+    """
+    __tablename__ = "quote_number_sequences"
+    
+    organization_id = Column(String, ForeignKey("organizations.id", ondelete="CASCADE"), primary_key=True)
+    period = Column(String(6), primary_key=True)  # YYYYMM
+    last_value = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    
+    def __repr__(self):
+        return f"<QuoteNumberSequence(org={self.organization_id}, period={self.period}, last={self.last_value})>"
+
+
+class RetentionCursor(Base):
+    """
+    Progress of an unfinished chunked retention pass over one table
+    
+    Saved with every deleted chunk so an interrupted cleanup resumes after
+    last_key; removed once the pass reaches the end of the table.
+    """
+    __tablename__ = "retention_cursors"
+    
+    category = Column(String(50), primary_key=True)
+    target = Column(String(100), primary_key=True)
+    last_key = Column(String, nullable=True)
+    rows_deleted = Column(Integer, nullable=False, default=0)
+    started_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    
+    def __repr__(self):
+        return f"<RetentionCursor(category={self.category}, target={self.target}, last_key={self.last_key})>"
+
+
 class MediaAsset(Base):
     """
     PW-SEC-ADD-001: Secure media storage for quote photos and PII assets
@@ -131,30 +131,14 @@ def optimize_database_settings():
 def create_partitioned_tables():
     """Create partitioned tables for time-series data"""
     
-    # Partition content performance snapshots by month for better query performance
+    # content_performance_snapshots is partitioned by month on snapshot_time
+    # (migration 7c4e1a9b2d5f); upcoming partitions are created by the daily
+    # partition maintenance task, these statements cover the next few months
+    from backend.services.performance_snapshot_store import get_performance_snapshot_store, partition_ddl
+    
     partition_queries = [
-        """
-        -- Create partitioned table for performance snapshots
-        CREATE TABLE IF NOT EXISTS content_performance_snapshots_partitioned (
-            LIKE content_performance_snapshots INCLUDING ALL
-        ) PARTITION BY RANGE (snapshot_time);
-        """,
-        
-        # Create monthly partitions for the current year
-        """
-        CREATE TABLE IF NOT EXISTS content_performance_snapshots_2025_01 
-        PARTITION OF content_performance_snapshots_partitioned 
-        FOR VALUES FROM ('2025-01-01') TO ('2025-02-01');
-        """,
-        
-        """
-        CREATE TABLE IF NOT EXISTS content_performance_snapshots_2025_02 
-        PARTITION OF content_performance_snapshots_partitioned 
-        FOR VALUES FROM ('2025-02-01') TO ('2025-03-01');
-        """,
-        
-        # Add more partitions as needed...
-        
+        partition_ddl(month) for month in get_performance_snapshot_store().upcoming_partition_months()
+    ] + [
         # Create materialized views for common analytics queries
         """
         CREATE MATERIALIZED VIEW IF NOT EXISTS content_daily_metrics AS
@@ -3,35 +3,71 @@ Social Media Integrations Package
 
 Provides unified access to social media platform APIs with backwards compatibility.
 Updated for Meta Graph API v22.0 unified approach.
+
+Clients are imported (and the legacy ones instantiated) on first access, so
+importing a submodule such as backend.integrations.performance_optimizer
+does not load every platform client. Prefer importing clients from their
+submodules: once e.g. backend.integrations.meta_client has been imported,
+the package attribute of that name is the submodule, not the client.
 """
-from backend.integrations.meta_client import meta_client
+import importlib
+
+__all__ = [
+    'meta_client',
+    'MetaGraphAPIClient',
+    'facebook_client',
+    'instagram_client',
+    'twitter_client'
+]
+
+
+def _meta_client():
+    return importlib.import_module("backend.integrations.meta_client").meta_client
+
+
+def _meta_graph_api_client():
+    # Unified Meta client (preferred for new code)
+    return importlib.import_module("backend.integrations.meta_client").MetaGraphAPIClient
 
-# Unified Meta client (preferred for new code)
-from backend.integrations.meta_client import MetaGraphAPIClient
 
 # Legacy clients (for backwards compatibility)
-try:
-    from backend.integrations.facebook_client import FacebookAPIClient
-    facebook_client = FacebookAPIClient()
-except ImportError:
-    facebook_client = None
+def _facebook_client():
+    try:
+        from backend.integrations.facebook_client import FacebookAPIClient
+        return FacebookAPIClient()
+    except ImportError:
+        return None
 
-try:
-    from backend.integrations.instagram_client import InstagramClient  
-    instagram_client = InstagramClient()
-except ImportError:
-    instagram_client = None
 
-try:
-    from backend.integrations.twitter_client import twitter_client
-except ImportError:
-    twitter_client = None
+def _instagram_client():
+    try:
+        from backend.integrations.instagram_client import InstagramClient
+        return InstagramClient()
+    except ImportError:
+        return None
 
 
-__all__ = [
-    'meta_client',
-    'MetaGraphAPIClient', 
-    'facebook_client',
-    'instagram_client', 
-    'twitter_client'
-]
\ No newline at end of file
+def _twitter_client():
+    try:
+        from backend.integrations.twitter_client import twitter_client
+        return twitter_client
+    except ImportError:
+        return None
+
+
+_LOADERS = {
+    'meta_client': _meta_client,
+    'MetaGraphAPIClient': _meta_graph_api_client,
+    'facebook_client': _facebook_client,
+    'instagram_client': _instagram_client,
+    'twitter_client': _twitter_client,
+}
+
+
+def __getattr__(name):
+    loader = _LOADERS.get(name)
+    if loader is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = loader()
+    globals()[name] = value
+    return value
@@ -15,6 +15,8 @@ from dataclasses import dataclass
 from enum import Enum
 
 from backend.core.config import get_settings
+from backend.core.http_client import get_platform_http_client
+from backend.integrations.meta_batch import MetaBatchExecutor, MetaBatchRequest
 from backend.auth.social_oauth import oauth_manager
 
 settings = get_settings()
@@ -118,6 +120,18 @@ class FacebookAPIClient:
     - Live video streaming
     """
     
+    POST_INFO_FIELDS = "id,message,story,created_time,updated_time,from,privacy,status_type,type,link,picture,full_picture,attachments,reactions.summary(total_count),comments.summary(total_count),shares"
+    
+    DEFAULT_POST_METRICS = [
+        "post_impressions",
+        "post_reach",
+        "post_engaged_users",
+        "post_reactions_by_type_total",
+        "post_clicks",
+        "post_consumptions",
+        "post_negative_feedback"
+    ]
+    
     def __init__(self):
         """Initialize Facebook API client with unified Meta Graph API v22.0"""
         # Use unified Meta configuration (2025 approach)
@@ -126,6 +140,7 @@ class FacebookAPIClient:
         self.access_token = settings.meta_access_token or settings.facebook_page_access_token
         self.api_version = settings.meta_api_version or "v22.0"
         self.api_base = f"https://graph.facebook.com/{self.api_version}"
+        self.batch_executor = MetaBatchExecutor(self.api_base, platform="facebook")
         
         # API endpoints
         self.endpoints = {
@@ -215,54 +230,56 @@ class FacebookAPIClient:
             "User-Agent": "AI-Social-Media-Agent/1.0"
         }
         
-        async with httpx.AsyncClient(timeout=120.0) as client:
-            try:
-                if method.upper() == "GET":
-                    response = await client.get(url, headers=headers, params=params)
-                elif method.upper() == "POST":
-                    if files:
-                        response = await client.post(url, headers=headers, data=data, files=files, params=params)
-                    elif data:
-                        response = await client.post(url, headers=headers, data=data, params=params)
-                    else:
-                        response = await client.post(url, headers=headers, params=params)
-                elif method.upper() == "DELETE":
-                    response = await client.delete(url, headers=headers, params=params)
+        client = get_platform_http_client("facebook")
+        try:
+            if method.upper() == "GET":
+                response = await client.get(url, headers=headers, params=params)
+            elif method.upper() == "POST":
+                # POSTs publish (posts, photos, events) and file streams are read once, so never resend them
+                if files:
+                    response = await client.post(url, headers=headers, data=data, files=files, params=params,
+                                                 retry=False)
+                elif data:
+                    response = await client.post(url, headers=headers, data=data, params=params, retry=False)
                 else:
-                    raise ValueError(f"Unsupported HTTP method: {method}")
-                
-                # Handle rate limiting
-                if response.status_code == 429:
-                    usage_header = response.headers.get("X-Business-Use-Case-Usage", "{}")
-                    try:
-                        usage_data = json.loads(usage_header)
-                        call_count = usage_data.get("call_count", 100)
-                        retry_after = min(3600, call_count * 10)  # Max 1 hour wait
-                    except:
-                        retry_after = 3600
-                    
-                    logger.warning(f"Facebook API rate limited. Waiting {retry_after}s")
-                    await asyncio.sleep(retry_after)
-                    return await self._make_request(method, endpoint, access_token, data, params, files)
-                
-                # Handle API errors
-                if response.status_code >= 400:
-                    error_data = response.json() if response.content else {}
-                    error = error_data.get("error", {})
-                    error_message = error.get("message", response.text)
-                    error_code = error.get("code", response.status_code)
-                    
-                    logger.error(f"Facebook API error {error_code}: {error_message}")
-                    raise Exception(f"Facebook API error ({error_code}): {error_message}")
+                    response = await client.post(url, headers=headers, params=params, retry=False)
+            elif method.upper() == "DELETE":
+                response = await client.delete(url, headers=headers, params=params)
+            else:
+                raise ValueError(f"Unsupported HTTP method: {method}")
+            
+            # Handle rate limiting
+            if response.status_code == 429:
+                usage_header = response.headers.get("X-Business-Use-Case-Usage", "{}")
+                try:
+                    usage_data = json.loads(usage_header)
+                    call_count = usage_data.get("call_count", 100)
+                    retry_after = min(3600, call_count * 10)  # Max 1 hour wait
+                except:
+                    retry_after = 3600
                 
-                return response.json() if response.content else {}
+                logger.warning(f"Facebook API rate limited. Waiting {retry_after}s")
+                await asyncio.sleep(retry_after)
+                return await self._make_request(method, endpoint, access_token, data, params, files)
+            
+            # Handle API errors
+            if response.status_code >= 400:
+                error_data = response.json() if response.content else {}
+                error = error_data.get("error", {})
+                error_message = error.get("message", response.text)
+                error_code = error.get("code", response.status_code)
                 
-            except httpx.RequestError as e:
-                logger.error(f"HTTP request error: {e}")
-                raise Exception(f"Network error: {str(e)}")
-            except Exception as e:
-                logger.error(f"Facebook API request failed: {e}")
-                raise
+                logger.error(f"Facebook API error {error_code}: {error_message}")
+                raise Exception(f"Facebook API error ({error_code}): {error_message}")
+            
+            return response.json() if response.content else {}
+            
+        except httpx.RequestError as e:
+            logger.error(f"HTTP request error: {e}")
+            raise Exception(f"Network error: {str(e)}")
+        except Exception as e:
+            logger.error(f"Facebook API request failed: {e}")
+            raise
     
     async def get_user_pages(self, access_token: str) -> List[FacebookPage]:
         """
@@ -613,12 +630,45 @@ class FacebookAPIClient:
             Post information
         """
         endpoint = self.endpoints["post_info"].format(post_id=post_id)
-        params = {
-            "fields": "id,message,story,created_time,updated_time,from,privacy,status_type,type,link,picture,full_picture,attachments,reactions.summary(total_count),comments.summary(total_count),shares"
-        }
+        params = {"fields": self.POST_INFO_FIELDS}
         
         response = await self._make_request("GET", endpoint, access_token, params=params)
+        return self._parse_post(response)
+    
+    async def get_posts_info(self, access_token: str, post_ids: List[str]) -> Dict[str, FacebookPost]:
+        """
+        Get information for many posts using Graph API batch requests
+        
+        Args:
+            access_token: Facebook access token
+            post_ids: Facebook post IDs
+            
+        Returns:
+            Posts keyed by ID; posts that failed are logged and omitted
+        """
+        requests = [
+            MetaBatchRequest.get(
+                self.endpoints["post_info"].format(post_id=post_id),
+                {"fields": self.POST_INFO_FIELDS}
+            )
+            for post_id in post_ids
+        ]
+        results = await self.batch_executor.execute(access_token, requests)
+        
+        posts = {}
+        for post_id, result in zip(post_ids, results):
+            if not result.ok:
+                logger.error(f"Failed to get post info for {post_id}: {result.error}")
+                continue
+            try:
+                posts[post_id] = self._parse_post(result.data)
+            except (TypeError, ValueError) as e:
+                logger.error(f"Failed to parse post info for {post_id}: {e}")
         
+        return posts
+    
+    def _parse_post(self, response: Dict[str, Any]) -> FacebookPost:
+        """Build a FacebookPost from a Graph API post object"""
         # Extract reaction counts
         reactions = {}
         reactions_data = response.get("reactions", {}).get("data", [])
@@ -696,82 +746,111 @@ class FacebookAPIClient:
             Post insights
         """
         endpoint = self.endpoints["post_insights"].format(post_id=post_id)
-        
-        # Default metrics
-        if not metrics:
-            metrics = [
-                "post_impressions",
-                "post_reach",
-                "post_engaged_users",
-                "post_reactions_by_type_total",
-                "post_clicks",
-                "post_consumptions",
-                "post_negative_feedback"
-            ]
-        
         params = {
-            "metric": ",".join(metrics),
+            "metric": ",".join(metrics or self.DEFAULT_POST_METRICS),
             "period": "lifetime"
         }
         
         try:
             response = await self._make_request("GET", endpoint, access_token, params=params)
-            
-            # Parse insights data
-            insights_data = {}
-            for insight in response.get("data", []):
-                metric_name = insight.get("name")
-                values = insight.get("values", [])
-                if values:
-                    value = values[0].get("value")
-                    if isinstance(value, dict):
-                        # For metrics like reactions_by_type
-                        insights_data[metric_name] = sum(value.values()) if value else 0
-                    else:
-                        insights_data[metric_name] = value or 0
-            
-            # Calculate total engagement
-            reactions = insights_data.get("post_reactions_by_type_total", 0)
-            comments = 0  # Will need separate API call for comments
-            shares = 0    # Will need separate API call for shares
-            engagement = reactions + comments + shares
-            
-            return FacebookInsights(
-                post_id=post_id,
-                impressions=insights_data.get("post_impressions", 0),
-                reach=insights_data.get("post_reach", 0),
-                engagement=engagement,
-                reactions=reactions,
-                comments=comments,
-                shares=shares,
-                clicks=insights_data.get("post_clicks", 0),
-                video_views=insights_data.get("post_video_views"),
-                story_completions=insights_data.get("post_story_completions"),
-                post_consumptions=insights_data.get("post_consumptions", 0),
-                post_engaged_users=insights_data.get("post_engaged_users", 0),
-                negative_feedback=insights_data.get("post_negative_feedback", 0),
-                fetched_at=datetime.utcnow()
-            )
+            return self._parse_post_insights(post_id, response)
             
         except Exception as e:
             logger.warning(f"Failed to get Facebook insights: {e}")
-            # Return empty insights
-            return FacebookInsights(
-                post_id=post_id,
-                impressions=0,
-                reach=0,
-                engagement=0,
-                reactions=0,
-                comments=0,
-                shares=0,
-                clicks=0,
-                video_views=None,
-                story_completions=None,
-                post_consumptions=0,
-                post_engaged_users=0,
-                negative_feedback=0,
-                fetched_at=datetime.utcnow()
-            )
+            return self._empty_insights(post_id)
+    
+    async def get_posts_insights(
+        self,
+        access_token: str,
+        post_ids: List[str],
+        metrics: Optional[List[str]] = None
+    ) -> Dict[str, FacebookInsights]:
+        """
+        Get insights for many posts using Graph API batch requests
+        
+        Args:
+            access_token: Facebook access token
+            post_ids: Facebook post IDs
+            metrics: Specific metrics to retrieve
+            
+        Returns:
+            Insights keyed by post ID; failed posts get empty insights
+        """
+        params = {
+            "metric": ",".join(metrics or self.DEFAULT_POST_METRICS),
+            "period": "lifetime"
+        }
+        requests = [
+            MetaBatchRequest.get(self.endpoints["post_insights"].format(post_id=post_id), params)
+            for post_id in post_ids
+        ]
+        results = await self.batch_executor.execute(access_token, requests)
+        
+        insights = {}
+        for post_id, result in zip(post_ids, results):
+            if result.ok:
+                insights[post_id] = self._parse_post_insights(post_id, result.data or {})
+            else:
+                logger.warning(f"Failed to get Facebook insights for {post_id}: {result.error}")
+                insights[post_id] = self._empty_insights(post_id)
+        
+        return insights
+    
+    def _parse_post_insights(self, post_id: str, response: Dict[str, Any]) -> FacebookInsights:
+        """Build FacebookInsights from a Graph API insights response"""
+        insights_data = {}
+        for insight in response.get("data", []):
+            metric_name = insight.get("name")
+            values = insight.get("values", [])
+            if values:
+                value = values[0].get("value")
+                if isinstance(value, dict):
+                    # For metrics like reactions_by_type
+                    insights_data[metric_name] = sum(value.values()) if value else 0
+                else:
+                    insights_data[metric_name] = value or 0
+        
+        # Calculate total engagement
+        reactions = insights_data.get("post_reactions_by_type_total", 0)
+        comments = 0  # Will need separate API call for comments
+        shares = 0    # Will need separate API call for shares
+        engagement = reactions + comments + shares
+        
+        return FacebookInsights(
+            post_id=post_id,
+            impressions=insights_data.get("post_impressions", 0),
+            reach=insights_data.get("post_reach", 0),
+            engagement=engagement,
+            reactions=reactions,
+            comments=comments,
+            shares=shares,
+            clicks=insights_data.get("post_clicks", 0),
+            video_views=insights_data.get("post_video_views"),
+            story_completions=insights_data.get("post_story_completions"),
+            post_consumptions=insights_data.get("post_consumptions", 0),
+            post_engaged_users=insights_data.get("post_engaged_users", 0),
+            negative_feedback=insights_data.get("post_negative_feedback", 0),
+            fetched_at=datetime.utcnow()
+        )
+    
+    def _empty_insights(self, post_id: str) -> FacebookInsights:
+        """Zeroed insights returned when the API call fails"""
+        return FacebookInsights(
+            post_id=post_id,
+            impressions=0,
+            reach=0,
+            engagement=0,
+            reactions=0,
+            comments=0,
+            shares=0,
+            clicks=0,
+            video_views=None,
+            story_completions=None,
+            post_consumptions=0,
+            post_engaged_users=0,
+            negative_feedback=0,
+            fetched_at=datetime.utcnow()
+        )
     
     async def get_page_posts(
         self,
@@ -807,16 +886,11 @@ class FacebookAPIClient:
         
         response = await self._make_request("GET", endpoint, page_access_token, params=params)
         
-        posts = []
-        for post_data in response.get("data", []):
-            try:
-                # Get full post details
-                post = await self.get_post_info(page_access_token, post_data["id"])
-                posts.append(post)
-            except Exception as e:
-                logger.error(f"Failed to get post info for {post_data['id']}: {e}")
+        # Get full post details in batches instead of one call per post
+        post_ids = [post_data["id"] for post_data in response.get("data", [])]
+        posts_by_id = await self.get_posts_info(page_access_token, post_ids)
         
-        return posts
+        return [posts_by_id[post_id] for post_id in post_ids if post_id in posts_by_id]
     
     async def delete_post(self, access_token: str, post_id: str) -> bool:
         """
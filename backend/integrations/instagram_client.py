@@ -2,6 +2,7 @@
 Instagram API Client with OAuth 2.0 Support
 Handles authentication, posting, and metrics collection for Instagram platform
 """
+import asyncio
 import os
 import logging
 from typing import Dict, Any, Optional, List, Tuple
@@ -11,13 +12,12 @@ import time
 from dataclasses import dataclass
 from enum import Enum
 
-import requests
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
-from requests.auth import HTTPBasicAuth
+import httpx
 from requests_oauthlib import OAuth2Session
 
+from backend.core.http_client import get_platform_http_client
 from backend.core.token_encryption import get_token_manager
+from backend.integrations.meta_batch import MetaBatchExecutor, MetaBatchRequest
 from backend.core.audit_logger import log_content_event, AuditEventType
 
 logger = logging.getLogger(__name__)
@@ -69,6 +69,8 @@ class InstagramClient:
     SUPPORTED_IMAGE_FORMATS = ["jpg", "jpeg", "png"]
     SUPPORTED_VIDEO_FORMATS = ["mp4", "mov"]
     
+    POST_INSIGHT_METRICS = "impressions,reach,likes,comments,saves,shares"
+    
     def __init__(self, client_id: Optional[str] = None, client_secret: Optional[str] = None):
         """
         Initialize Instagram client
@@ -85,18 +87,9 @@ class InstagramClient:
         
         self.token_manager = get_token_manager()
         
-        # Enhanced session with retries and timeouts
-        self.session = requests.Session()
-        retry_strategy = Retry(
-            total=5,
-            backoff_factor=0.5,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["GET", "POST", "PUT", "DELETE"]
-        )
-        adapter = HTTPAdapter(max_retries=retry_strategy, pool_connections=100, pool_maxsize=200)
-        self.session.mount("https://", adapter)
-        self.session.mount("http://", adapter)
+        # Requests go through the shared Instagram pool (retries and keep-alive)
         self.default_timeout = float(os.getenv("HTTP_TIMEOUT_SECONDS", "15"))
+        self.batch_executor = MetaBatchExecutor("https://graph.facebook.com/v18.0", platform="instagram")
         
         # Rate limiting tracking
         self.rate_limits = {}
@@ -135,7 +128,7 @@ class InstagramClient:
             logger.error(f"Failed to generate Instagram OAuth authorization URL: {e}")
             raise InstagramAPIError(f"OAuth authorization URL generation failed: {e}")
     
-    def exchange_code_for_tokens(self, authorization_code: str, redirect_uri: str) -> Dict[str, Any]:
+    async def exchange_code_for_tokens(self, authorization_code: str, redirect_uri: str) -> Dict[str, Any]:
         """
         Exchange authorization code for access and refresh tokens
         
@@ -155,7 +148,8 @@ class InstagramClient:
                 "client_secret": self.client_secret
             }
             
-            response = requests.post(
+            response = await self._request(
+                "POST",
                 self.FACEBOOK_TOKEN_URL,
                 data=token_data,
                 headers={"Content-Type": "application/x-www-form-urlencoded"},
@@ -170,7 +164,7 @@ class InstagramClient:
             
             # Exchange short-lived token for long-lived token
             if "access_token" in token_response:
-                long_lived_token = self._get_long_lived_token(token_response["access_token"])
+                long_lived_token = await self._get_long_lived_token(token_response["access_token"])
                 if long_lived_token:
                     token_response.update(long_lived_token)
             
@@ -181,7 +175,7 @@ class InstagramClient:
             logger.error(f"Instagram token exchange failed: {e}")
             raise InstagramAPIError(f"Token exchange failed: {e}")
     
-    def _get_long_lived_token(self, short_lived_token: str) -> Optional[Dict[str, Any]]:
+    async def _get_long_lived_token(self, short_lived_token: str) -> Optional[Dict[str, Any]]:
         """
         Exchange short-lived access token for long-lived token (60 days)
         
@@ -192,7 +186,8 @@ class InstagramClient:
             Long-lived token data or None if exchange fails
         """
         try:
-            response = requests.get(
+            response = await self._request(
+                "GET",
                 "https://graph.facebook.com/v18.0/oauth/access_token",
                 params={
                     "grant_type": "fb_exchange_token",
@@ -216,20 +211,11 @@ class InstagramClient:
             logger.error(f"Failed to get long-lived Instagram token: {e}")
             return None
     
-    def _request(self, method: str, url: str, **kwargs):
-        """Make HTTP request with timeout enforcement"""
+    async def _request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """Make HTTP request over the shared Instagram connection pool"""
         if "timeout" not in kwargs:
             kwargs["timeout"] = self.default_timeout
-        return self.session.request(method, url, **kwargs)
-    
-    def _get_authenticated_session(self, access_token: str) -> requests.Session:
-        """Get authenticated requests session"""
-        session = requests.Session()
-        session.headers.update({
-            "Authorization": f"Bearer {access_token}",
-            "Content-Type": "application/json"
-        })
-        return session
+        return await get_platform_http_client("instagram").request(method, url, **kwargs)
     
     def _check_rate_limit(self, endpoint: str) -> bool:
         """
@@ -253,7 +239,7 @@ class InstagramClient:
         remaining = rate_limit_info.get("remaining", 1)
         return remaining > 0
     
-    def _update_rate_limit(self, endpoint: str, response: requests.Response):
+    def _update_rate_limit(self, endpoint: str, response: httpx.Response):
         """Update rate limit tracking from API response headers"""
         headers = response.headers
         
@@ -264,7 +250,7 @@ class InstagramClient:
             "reset_time": int(time.time()) + 3600  # Assume 1 hour reset
         }
     
-    def get_user_info(self, access_token: str) -> Dict[str, Any]:
+    async def get_user_info(self, access_token: str) -> Dict[str, Any]:
         """
         Get authenticated user information
         
@@ -280,7 +266,7 @@ class InstagramClient:
                 raise InstagramAPIError("Rate limit exceeded for user info endpoint")
                 
             # First get user's pages to find Instagram account
-            pages_response = self._request("GET",
+            pages_response = await self._request("GET",
                 "https://graph.facebook.com/v18.0/me/accounts",
                 params={
                     "access_token": access_token,
@@ -300,7 +286,7 @@ class InstagramClient:
             
             for page in pages_data.get("data", []):
                 # Get Instagram account connected to this page
-                ig_response = self._request("GET",
+                ig_response = await self._request("GET",
                     f"https://graph.facebook.com/v18.0/{page['id']}",
                     params={
                         "access_token": page["access_token"],
@@ -319,7 +305,7 @@ class InstagramClient:
                 raise InstagramAPIError("No Instagram Business Account found")
             
             # Get Instagram account details
-            response = self._request("GET",
+            response = await self._request("GET",
                 f"https://graph.facebook.com/v18.0/{instagram_account_id}",
                 params={
                     "access_token": page_access_token,
@@ -353,7 +339,7 @@ class InstagramClient:
             logger.error(f"Failed to get Instagram user info: {e}")
             raise InstagramAPIError(f"Failed to get user info: {e}")
     
-    def create_media_container(self, access_token: str, image_url: str, caption: str, instagram_account_id: str) -> str:
+    async def create_media_container(self, access_token: str, image_url: str, caption: str, instagram_account_id: str) -> str:
         """
         Create a media container for posting
         
@@ -372,13 +358,15 @@ class InstagramClient:
                 raise InstagramAPIError(f"Caption too long: {len(caption)} > {self.MAX_CAPTION_LENGTH}")
             
             # Create media container
-            response = requests.post(
+            response = await self._request(
+                "POST",
                 f"https://graph.facebook.com/v18.0/{instagram_account_id}/media",
                 params={
                     "access_token": access_token,
                     "image_url": image_url,
                     "caption": caption
                 },
+                retry=False,  # Each resend creates another container
                 timeout=30
             )
             
@@ -396,7 +384,7 @@ class InstagramClient:
             logger.error(f"Failed to create Instagram media container: {e}")
             raise InstagramAPIError(f"Failed to create media container: {e}")
     
-    def publish_media(self, access_token: str, container_id: str, instagram_account_id: str, user_id: int) -> Dict[str, Any]:
+    async def publish_media(self, access_token: str, container_id: str, instagram_account_id: str, user_id: int) -> Dict[str, Any]:
         """
         Publish a media container to Instagram
         
@@ -415,12 +403,14 @@ class InstagramClient:
                 raise InstagramAPIError("Rate limit exceeded for media publish endpoint")
             
             # Publish media
-            response = requests.post(
+            response = await self._request(
+                "POST",
                 f"https://graph.facebook.com/v18.0/{instagram_account_id}/media_publish",
                 params={
                     "access_token": access_token,
                     "creation_id": container_id
                 },
+                retry=False,  # A resent publish after a timeout would post twice
                 timeout=30
             )
             
@@ -470,7 +460,7 @@ class InstagramClient:
             
             raise InstagramAPIError(f"Failed to publish media: {e}")
     
-    def post_image(self, access_token: str, image_url: str, caption: str, user_id: int) -> Dict[str, Any]:
+    async def post_image(self, access_token: str, image_url: str, caption: str, user_id: int) -> Dict[str, Any]:
         """
         Post an image to Instagram (combines container creation and publishing)
         
@@ -485,12 +475,12 @@ class InstagramClient:
         """
         try:
             # Get user info to get Instagram account ID and page token
-            user_info = self.get_user_info(access_token)
+            user_info = await self.get_user_info(access_token)
             instagram_account_id = user_info["id"]
             page_access_token = user_info["page_access_token"]
             
             # Create media container
-            container_id = self.create_media_container(
+            container_id = await self.create_media_container(
                 page_access_token, 
                 image_url, 
                 caption, 
@@ -498,11 +488,10 @@ class InstagramClient:
             )
             
             # Wait for media processing (Instagram requirement)
-            import time
-            time.sleep(2)  # Wait for Instagram processing
+            await asyncio.sleep(2)  # Wait for Instagram processing
             
             # Publish media
-            publish_result = self.publish_media(
+            publish_result = await self.publish_media(
                 page_access_token,
                 container_id,
                 instagram_account_id,
@@ -521,7 +510,7 @@ class InstagramClient:
             logger.error(f"Failed to post Instagram image: {e}")
             raise InstagramAPIError(f"Failed to post image: {e}")
     
-    def get_post_metrics(self, access_token: str, post_id: str) -> Dict[str, Any]:
+    async def get_post_metrics(self, access_token: str, post_id: str) -> Dict[str, Any]:
         """
         Get engagement metrics for a specific Instagram post
         
@@ -538,11 +527,12 @@ class InstagramClient:
                 raise InstagramAPIError("Rate limit exceeded for insights endpoint")
             
             # Get post insights
-            response = requests.get(
+            response = await self._request(
+                "GET",
                 f"https://graph.facebook.com/v18.0/{post_id}/insights",
                 params={
                     "access_token": access_token,
-                    "metric": "impressions,reach,likes,comments,saves,shares"
+                    "metric": self.POST_INSIGHT_METRICS
                 },
                 timeout=10
             )
@@ -552,71 +542,97 @@ class InstagramClient:
             if response.status_code != 200:
                 logger.error(f"Failed to get Instagram post metrics: {response.status_code} - {response.text}")
                 # Return empty metrics if API call fails
-                return {
-                    "post_id": post_id,
-                    "impressions_count": 0,
-                    "reach_count": 0,
-                    "likes_count": 0,
-                    "comments_count": 0,
-                    "saves_count": 0,
-                    "shares_count": 0,
-                    "engagement_rate": 0.0,
-                    "retrieved_at": datetime.utcnow().isoformat()
-                }
+                return self._empty_post_metrics(post_id)
             
-            insights_data = response.json()
-            
-            # Parse insights data
-            metrics = {}
-            for insight in insights_data.get("data", []):
-                metric_name = insight.get("name")
-                metric_values = insight.get("values", [])
-                if metric_values:
-                    metrics[metric_name] = metric_values[0].get("value", 0)
-            
-            # Calculate engagement rate
-            impressions = metrics.get("impressions", 0)
-            likes = metrics.get("likes", 0)
-            comments = metrics.get("comments", 0)
-            saves = metrics.get("saves", 0)
-            shares = metrics.get("shares", 0)
-            
-            engagement_count = likes + comments + saves + shares
-            engagement_rate = (engagement_count / impressions * 100) if impressions > 0 else 0
-            
-            processed_metrics = {
-                "post_id": post_id,
-                "impressions_count": impressions,
-                "reach_count": metrics.get("reach", 0),
-                "likes_count": likes,
-                "comments_count": comments,
-                "saves_count": saves,
-                "shares_count": shares,
-                "engagement_rate": round(engagement_rate, 2),
-                "total_engagement": engagement_count,
-                "retrieved_at": datetime.utcnow().isoformat()
-            }
-            
-            logger.info(f"Retrieved Instagram metrics for post {post_id}: {engagement_count} engagements, {engagement_rate:.2f}% rate")
+            processed_metrics = self._parse_post_metrics(post_id, response.json())
+            logger.info(
+                f"Retrieved Instagram metrics for post {post_id}: {processed_metrics['total_engagement']} engagements, "
+                f"{processed_metrics['engagement_rate']:.2f}% rate"
+            )
             return processed_metrics
             
         except Exception as e:
             logger.error(f"Failed to get Instagram post metrics: {e}")
             # Return empty metrics on error
-            return {
-                "post_id": post_id,
-                "impressions_count": 0,
-                "reach_count": 0,
-                "likes_count": 0,
-                "comments_count": 0,
-                "saves_count": 0,
-                "shares_count": 0,
-                "engagement_rate": 0.0,
-                "retrieved_at": datetime.utcnow().isoformat(),
-                "error": str(e)
-            }
+            return self._empty_post_metrics(post_id, error=str(e))
+    
+    async def get_posts_metrics(self, access_token: str, post_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get engagement metrics for many posts using Graph API batch requests
+        
+        Args:
+            access_token: OAuth access token
+            post_ids: Instagram post IDs
+            
+        Returns:
+            Metrics keyed by post ID; failed posts get empty metrics with an error
+        """
+        requests = [
+            MetaBatchRequest.get(f"{post_id}/insights", {"metric": self.POST_INSIGHT_METRICS})
+            for post_id in post_ids
+        ]
+        results = await self.batch_executor.execute(access_token, requests)
+        
+        metrics = {}
+        for post_id, result in zip(post_ids, results):
+            if result.ok:
+                metrics[post_id] = self._parse_post_metrics(post_id, result.data or {})
+            else:
+                logger.error(f"Failed to get Instagram post metrics for {post_id}: {result.error}")
+                metrics[post_id] = self._empty_post_metrics(post_id, error=result.error.get("message"))
+        
+        return metrics
+    
+    def _parse_post_metrics(self, post_id: str, insights_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert a Graph API insights response into post metrics"""
+        metrics = {}
+        for insight in insights_data.get("data", []):
+            metric_name = insight.get("name")
+            metric_values = insight.get("values", [])
+            if metric_values:
+                metrics[metric_name] = metric_values[0].get("value", 0)
+        
+        # Calculate engagement rate
+        impressions = metrics.get("impressions", 0)
+        likes = metrics.get("likes", 0)
+        comments = metrics.get("comments", 0)
+        saves = metrics.get("saves", 0)
+        shares = metrics.get("shares", 0)
+        
+        engagement_count = likes + comments + saves + shares
+        engagement_rate = (engagement_count / impressions * 100) if impressions > 0 else 0
+        
+        return {
+            "post_id": post_id,
+            "impressions_count": impressions,
+            "reach_count": metrics.get("reach", 0),
+            "likes_count": likes,
+            "comments_count": comments,
+            "saves_count": saves,
+            "shares_count": shares,
+            "engagement_rate": round(engagement_rate, 2),
+            "total_engagement": engagement_count,
+            "retrieved_at": datetime.utcnow().isoformat()
+        }
+    
+    def _empty_post_metrics(self, post_id: str, error: Optional[str] = None) -> Dict[str, Any]:
+        """Zeroed metrics returned when the API call fails"""
+        metrics = {
+            "post_id": post_id,
+            "impressions_count": 0,
+            "reach_count": 0,
+            "likes_count": 0,
+            "comments_count": 0,
+            "saves_count": 0,
+            "shares_count": 0,
+            "engagement_rate": 0.0,
+            "retrieved_at": datetime.utcnow().isoformat()
+        }
+        if error:
+            metrics["error"] = error
+        return metrics
     
-    def validate_connection(self, access_token: str) -> Dict[str, Any]:
+    async def validate_connection(self, access_token: str) -> Dict[str, Any]:
         """
         Validate Instagram connection by making a test API call
         
@@ -628,7 +644,7 @@ class InstagramClient:
         """
         try:
             # Test connection by getting user info
-            user_info = self.get_user_info(access_token)
+            user_info = await self.get_user_info(access_token)
             
             return {
                 "is_valid": True,
@@ -732,7 +748,7 @@ def create_instagram_client() -> InstagramClient:
     """Create and return an InstagramClient instance"""
     return InstagramClient()
 
-def validate_image_url(url: str) -> bool:
+async def validate_image_url(url: str) -> bool:
     """
     Validate that an image URL is accessible and valid for Instagram
     
@@ -743,7 +759,7 @@ def validate_image_url(url: str) -> bool:
         True if URL is valid and accessible
     """
     try:
-        response = requests.head(url, timeout=10)
+        response = await get_platform_http_client("instagram").request("HEAD", url, timeout=10)
         if response.status_code == 200:
             content_type = response.headers.get('content-type', '')
             return content_type.startswith('image/')
@@ -10,6 +10,7 @@ Following 2025 LinkedIn API guidelines:
 - Integration with observability and token management systems
 """
 
+import asyncio
 import logging
 import time
 import json
@@ -18,11 +19,11 @@ from datetime import datetime, timezone
 from dataclasses import dataclass
 from enum import Enum
 
-import requests
 from requests_oauthlib import OAuth2Session
 from urllib.parse import urlencode
 
 from backend.core.config import get_settings
+from backend.core.http_client import get_platform_http_client
 from backend.core.observability import get_observability_manager
 
 logger = logging.getLogger(__name__)
@@ -85,6 +86,9 @@ class LinkedInAPIClient:
     - Rate limiting is enforced per app and per user
     """
     
+    # Entities per Rest.li batch GET request
+    BATCH_GET_SIZE = 50
+    
     def __init__(self, config: Optional[LinkedInConfig] = None):
         """Initialize LinkedIn API client with 2025 best practices"""
         
@@ -97,7 +101,6 @@ class LinkedInAPIClient:
             )
         
         self.config = config
-        self.session = requests.Session()
         self._setup_session_defaults()
         
         # Track API usage for rate limiting
@@ -112,17 +115,23 @@ class LinkedInAPIClient:
             logger.warning("LinkedIn OAuth credentials not provided. Set LINKEDIN_CLIENT_ID and LINKEDIN_CLIENT_SECRET environment variables.")
     
     def _setup_session_defaults(self):
-        """Setup default session configuration"""
-        self.session.headers.update({
+        """Setup default headers sent with every request"""
+        self.default_headers = {
             'User-Agent': 'Autonomous-Social-Media-AI/2.0',
             'Accept': 'application/json',
             'Content-Type': 'application/json',
             'LinkedIn-Version': '202311'  # LinkedIn API version (2025)
-        })
-        
-        # Set timeout for all requests
-        self.session.request = lambda *args, **kwargs: requests.Session.request(
-            self.session, *args, timeout=30, **kwargs
+        }
+        self.request_timeout = 30
+    
+    async def _request(self, method: str, url: str, headers: Optional[Dict] = None, **kwargs):
+        """Make HTTP request over the shared LinkedIn connection pool"""
+        return await get_platform_http_client("linkedin").request(
+            method,
+            url,
+            headers={**self.default_headers, **(headers or {})},
+            timeout=self.request_timeout,
+            **kwargs
         )
     
     def get_authorization_url(self, scopes: Optional[List[str]] = None, state: Optional[str] = None) -> str:
@@ -196,7 +205,7 @@ class LinkedInAPIClient:
             observability.capture_exception(e, {"step": "linkedin_token_exchange"})
             raise LinkedInAPIError(f"Failed to exchange code for token: {e}")
     
-    def refresh_access_token(self, refresh_token: str) -> Dict[str, Any]:
+    async def refresh_access_token(self, refresh_token: str) -> Dict[str, Any]:
         """
         Refresh LinkedIn access token using refresh token
         
@@ -214,7 +223,8 @@ class LinkedInAPIClient:
                 'client_secret': self.config.client_secret
             }
             
-            response = self.session.post(
+            response = await self._request(
+                "POST",
                 self.config.token_url,
                 data=data,
                 headers={'Content-Type': 'application/x-www-form-urlencoded'}
@@ -241,7 +251,7 @@ class LinkedInAPIClient:
             observability.capture_exception(e, {"step": "linkedin_token_refresh"})
             raise LinkedInAPIError(f"Failed to refresh token: {e}")
     
-    def _make_authenticated_request(
+    async def _make_authenticated_request(
         self, 
         method: str, 
         endpoint: str, 
@@ -270,14 +280,14 @@ class LinkedInAPIClient:
         }
         
         # Rate limiting (basic implementation)
-        self._handle_rate_limiting()
+        await self._handle_rate_limiting()
         
         try:
             start_time = time.time()
             
-            response = self.session.request(
-                method=method,
-                url=url,
+            response = await self._request(
+                method,
+                url,
                 json=data if data else None,
                 params=params,
                 headers=headers
@@ -319,7 +329,7 @@ class LinkedInAPIClient:
             observability.capture_exception(e, {"endpoint": endpoint, "method": method})
             raise LinkedInAPIError(f"LinkedIn API request failed: {e}")
     
-    def _handle_rate_limiting(self):
+    async def _handle_rate_limiting(self):
         """Handle basic rate limiting to avoid API limits"""
         if self.last_request_time:
             # Basic rate limiting: max 1 request per second
@@ -327,9 +337,9 @@ class LinkedInAPIClient:
             if time_since_last < 1.0:
                 sleep_time = 1.0 - time_since_last
                 logger.debug(f"Rate limiting: sleeping for {sleep_time:.2f} seconds")
-                time.sleep(sleep_time)
+                await asyncio.sleep(sleep_time)
     
-    def get_user_profile(self, access_token: str) -> Dict[str, Any]:
+    async def get_user_profile(self, access_token: str) -> Dict[str, Any]:
         """
         Get LinkedIn user profile information
         
@@ -339,13 +349,13 @@ class LinkedInAPIClient:
         Returns:
             User profile data
         """
-        return self._make_authenticated_request(
+        return await self._make_authenticated_request(
             "GET",
             "/v2/people/~",
             access_token
         )
     
-    def create_ugc_post(
+    async def create_ugc_post(
         self, 
         access_token: str, 
         person_urn: str, 
@@ -396,7 +406,7 @@ class LinkedInAPIClient:
             ]
         
         try:
-            result = self._make_authenticated_request(
+            result = await self._make_authenticated_request(
                 "POST",
                 "/v2/ugcPosts",
                 access_token,
@@ -420,7 +430,7 @@ class LinkedInAPIClient:
                 )
             raise
     
-    def get_post_analytics(self, access_token: str, ugc_post_urn: str) -> Dict[str, Any]:
+    async def get_post_analytics(self, access_token: str, ugc_post_urn: str) -> Dict[str, Any]:
         """
         Get analytics for a LinkedIn UGC post (requires partnership)
         
@@ -431,13 +441,41 @@ class LinkedInAPIClient:
         Returns:
             Post analytics data
         """
-        return self._make_authenticated_request(
+        return await self._make_authenticated_request(
             "GET",
             f"/v2/socialActions/{ugc_post_urn}",
             access_token
         )
     
-    def upload_media(self, access_token: str, person_urn: str, media_data: bytes, media_type: str) -> str:
+    async def get_posts_analytics(self, access_token: str, ugc_post_urns: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get analytics for many UGC posts with batch GET requests (requires partnership)
+        
+        Args:
+            access_token: Valid LinkedIn access token
+            ugc_post_urns: LinkedIn UGC post URNs (BATCH_GET_SIZE per request)
+            
+        Returns:
+            Analytics keyed by post URN; posts LinkedIn reports as errors are omitted
+        """
+        analytics = {}
+        
+        for offset in range(0, len(ugc_post_urns), self.BATCH_GET_SIZE):
+            chunk = ugc_post_urns[offset:offset + self.BATCH_GET_SIZE]
+            response = await self._make_authenticated_request(
+                "GET",
+                "/v2/socialActions",
+                access_token,
+                params={"ids": chunk}
+            )
+            
+            analytics.update(response.get("results", {}))
+            for urn, error in response.get("errors", {}).items():
+                logger.warning(f"LinkedIn analytics error for {urn}: {error}")
+        
+        return analytics
+    
+    async def upload_media(self, access_token: str, person_urn: str, media_data: bytes, media_type: str) -> str:
         """
         Upload media to LinkedIn for use in posts (requires partnership)
         
@@ -458,7 +496,7 @@ class LinkedInAPIClient:
         logger.warning("LinkedIn media upload not fully implemented - requires partnership approval")
         raise LinkedInAPIError("Media upload requires LinkedIn Partnership Program approval")
     
-    def validate_token(self, access_token: str) -> bool:
+    async def validate_token(self, access_token: str) -> bool:
         """
         Validate LinkedIn access token
         
@@ -469,7 +507,7 @@ class LinkedInAPIClient:
             True if token is valid, False otherwise
         """
         try:
-            self.get_user_profile(access_token)
+            await self.get_user_profile(access_token)
             return True
         except LinkedInAPIError:
             return False
@@ -500,7 +538,7 @@ class LinkedInClientWrapper:
             bool(settings.linkedin_client_secret)
         )
     
-    def create_post(self, access_token: str, person_urn: str, content: str) -> Dict[str, Any]:
+    async def create_post(self, access_token: str, person_urn: str, content: str) -> Dict[str, Any]:
         """
         Create LinkedIn post with comprehensive error handling
         
@@ -520,7 +558,7 @@ class LinkedInClientWrapper:
             }
         
         try:
-            result = self.client.create_ugc_post(
+            result = await self.client.create_ugc_post(
                 access_token=access_token,
                 person_urn=person_urn,
                 text=content
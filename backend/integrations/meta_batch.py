@@ -0,0 +1,383 @@
+"""
+Meta Graph API Batch Executor
+
+Packs Graph API reads (post info, insights, media metrics) into batch
+requests of up to 50 sub-requests per HTTP call. Sub-requests that fail
+transiently or are not processed by Meta are retried individually, and
+the executor throttles itself from the X-App-Usage and
+X-Business-Use-Case-Usage headers before Meta starts rejecting calls.
+"""
+import asyncio
+import json
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from urllib.parse import urlencode
+
+from backend.core.http_client import IDEMPOTENT_METHODS, get_platform_http_client
+
+logger = logging.getLogger(__name__)
+
+# Graph API hard limit on sub-requests per batch call
+MAX_BATCH_SIZE = 50
+
+# Graph error codes that mean "try again later"
+TRANSIENT_ERROR_CODES = {1, 2}
+RATE_LIMIT_ERROR_CODES = {4, 17, 32, 613, 80001, 80002, 80004, 80005, 80006, 80008}
+
+
+@dataclass
+class MetaBatchRequest:
+    """A single Graph API call inside a batch"""
+    relative_url: str
+    method: str = "GET"
+    body: Optional[Dict[str, Any]] = None
+
+    @classmethod
+    def get(cls, path: str, params: Optional[Dict[str, Any]] = None) -> "MetaBatchRequest":
+        """Build a GET sub-request from a path and query parameters"""
+        relative_url = path.lstrip("/")
+        if params:
+            relative_url = f"{relative_url}?{urlencode(params)}"
+        return cls(relative_url=relative_url)
+
+    def to_payload(self) -> Dict[str, Any]:
+        payload = {"method": self.method.upper(), "relative_url": self.relative_url}
+        if self.body:
+            payload["body"] = urlencode(self.body)
+        return payload
+
+
+@dataclass
+class MetaBatchResult:
+    """Outcome of one sub-request"""
+    request: MetaBatchRequest
+    status_code: Optional[int] = None
+    data: Optional[Any] = None
+    error: Optional[Dict[str, Any]] = None
+    attempts: int = 0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and self.status_code is not None and self.status_code < 400
+
+
+class MetaUsageThrottle:
+    """
+    Self-throttling from Meta's usage headers.
+
+    X-App-Usage and X-Business-Use-Case-Usage report call count, CPU time
+    and total time as a percentage of the app's quota. Above the threshold
+    calls are delayed proportionally; when Meta reports an estimated time
+    to regain access the throttle waits that long. A rate-limit error
+    blocks calls for Retry-After, or for a backoff that doubles with each
+    consecutive error, without touching the reported usage.
+    """
+
+    def __init__(self, threshold: float = 75.0, max_delay: float = 300.0, penalty_delay: float = 30.0):
+        self.threshold = threshold
+        self.max_delay = max_delay
+        self.penalty_delay = penalty_delay
+        self.usage = 0.0
+        self.blocked_until = 0.0
+        self.penalties = 0
+        self.waits = 0
+
+    def update(self, headers: Any) -> None:
+        """Update usage from a Graph API response's headers"""
+        usage = 0.0
+        regain_minutes = 0.0
+
+        app_usage = _parse_usage_header(headers.get("x-app-usage"))
+        if isinstance(app_usage, dict):
+            usage = max(usage, _max_usage(app_usage))
+
+        business_usage = _parse_usage_header(headers.get("x-business-use-case-usage"))
+        if isinstance(business_usage, dict):
+            for entries in business_usage.values():
+                for entry in entries if isinstance(entries, list) else [entries]:
+                    usage = max(usage, _max_usage(entry))
+                    regain_minutes = max(regain_minutes, float(entry.get("estimated_time_to_regain_access", 0) or 0))
+
+        if app_usage is None and business_usage is None:
+            return
+
+        self.usage = usage
+        if regain_minutes > 0:
+            self.blocked_until = time.monotonic() + regain_minutes * 60
+
+    def penalize(self, retry_after: Optional[float] = None) -> None:
+        """Block calls after a rate-limit error, for retry_after seconds when Meta sent one"""
+        now = time.monotonic()
+        if retry_after is None:
+            if self.blocked_until > now:
+                # Already backing off; the other sub-requests of that batch hit the same limit
+                return
+            if now - self.blocked_until > self.max_delay:
+                self.penalties = 0
+            retry_after = self.penalty_delay * (2 ** self.penalties)
+            self.penalties += 1
+        self.blocked_until = max(self.blocked_until, now + min(retry_after, self.max_delay))
+
+    def delay(self) -> float:
+        """Seconds to wait before the next call"""
+        blocked = self.blocked_until - time.monotonic()
+        if blocked > 0:
+            return min(blocked, self.max_delay)
+        if self.usage < self.threshold:
+            return 0.0
+        ratio = min(1.0, (self.usage - self.threshold) / max(1.0, 100.0 - self.threshold))
+        return ratio * self.max_delay
+
+    async def wait(self) -> None:
+        delay = self.delay()
+        if delay > 0:
+            self.waits += 1
+            logger.warning(f"Meta API usage at {self.usage:.0f}%, throttling for {delay:.1f}s")
+            await asyncio.sleep(delay)
+
+
+def _parse_usage_header(value: Optional[str]) -> Optional[Any]:
+    if not value:
+        return None
+    try:
+        return json.loads(value)
+    except (TypeError, ValueError):
+        logger.debug(f"Ignoring malformed Meta usage header: {value!r}")
+        return None
+
+
+def _retry_after(headers: Any) -> Optional[float]:
+    try:
+        return max(0.0, float(headers.get("retry-after")))
+    except (TypeError, ValueError):
+        return None
+
+
+def _max_usage(usage: Dict[str, Any]) -> float:
+    return max(
+        float(usage.get(key, 0) or 0)
+        for key in ("call_count", "total_cputime", "total_time")
+    )
+
+
+class MetaBatchExecutor:
+    """
+    Executes Graph API sub-requests in batches of up to 50.
+
+    Results are returned in request order. Each result carries either the
+    parsed body or the Graph error, so one failing post never fails the
+    whole sweep.
+    """
+
+    def __init__(
+        self,
+        api_base: str,
+        platform: str = "facebook",
+        max_batch_size: int = MAX_BATCH_SIZE,
+        max_retries: int = 3,
+        retry_base_delay: float = 1.0,
+        max_concurrent_batches: int = 2,
+        throttle: Optional[MetaUsageThrottle] = None
+    ):
+        self.api_base = api_base.rstrip("/")
+        self.platform = platform
+        self.max_batch_size = min(max_batch_size, MAX_BATCH_SIZE)
+        self.max_retries = max_retries
+        self.retry_base_delay = retry_base_delay
+        self.max_concurrent_batches = max_concurrent_batches
+        self.throttle = throttle or get_meta_usage_throttle()
+
+        self.stats = {
+            "batches_sent": 0,
+            "sub_requests": 0,
+            "retried_sub_requests": 0,
+            "failed_sub_requests": 0
+        }
+
+    async def execute(self, access_token: str, requests: Sequence[MetaBatchRequest]) -> List[MetaBatchResult]:
+        """
+        Run sub-requests in batches, retrying transient per-item failures
+
+        Args:
+            access_token: Token applied to every sub-request
+            requests: Graph API calls to run
+
+        Returns:
+            One MetaBatchResult per request, in request order
+        """
+        results = [MetaBatchResult(request=request) for request in requests]
+        pending = list(range(len(results)))
+        semaphore = asyncio.Semaphore(self.max_concurrent_batches)
+
+        for attempt in range(self.max_retries + 1):
+            if not pending:
+                break
+            if attempt:
+                self.stats["retried_sub_requests"] += len(pending)
+                await asyncio.sleep(self.retry_base_delay * (2 ** (attempt - 1)))
+
+            chunks = [
+                pending[offset:offset + self.max_batch_size]
+                for offset in range(0, len(pending), self.max_batch_size)
+            ]
+            retry_lists = await asyncio.gather(*(
+                self._run_chunk(access_token, chunk, results, semaphore) for chunk in chunks
+            ))
+            pending = [index for retry in retry_lists for index in retry]
+
+        for index in pending:
+            # Out of retries; keep the last error
+            if results[index].error is None:
+                results[index].error = {"message": "Sub-request was not processed by Meta"}
+
+        self.stats["failed_sub_requests"] += sum(1 for result in results if not result.ok)
+        return results
+
+    async def _run_chunk(
+        self,
+        access_token: str,
+        chunk: List[int],
+        results: List[MetaBatchResult],
+        semaphore: asyncio.Semaphore
+    ) -> List[int]:
+        """Send one batch and return indexes that should be retried"""
+        async with semaphore:
+            await self.throttle.wait()
+            responses, error = await self._post_batch(access_token, [results[i].request for i in chunk])
+
+        if responses is None:
+            for index in chunk:
+                results[index].attempts += 1
+                results[index].error = error
+            return list(chunk) if _should_retry(error, error.get("status_code")) else []
+
+        retry = []
+        for index, response in zip(chunk, responses):
+            result = results[index]
+            result.attempts += 1
+            if self._apply_response(result, response):
+                retry.append(index)
+        return retry
+
+    async def _post_batch(
+        self,
+        access_token: str,
+        requests: List[MetaBatchRequest]
+    ) -> Tuple[Optional[List[Any]], Optional[Dict[str, Any]]]:
+        """POST one batch call, returning (responses, error)"""
+        self.stats["batches_sent"] += 1
+        self.stats["sub_requests"] += len(requests)
+
+        try:
+            response = await get_platform_http_client(self.platform).post(
+                f"{self.api_base}/",
+                data={
+                    "access_token": access_token,
+                    "batch": json.dumps([request.to_payload() for request in requests]),
+                    "include_headers": "false"
+                },
+                # The batch POST is safe to resend only if every call in it is
+                retry=all(request.method.upper() in IDEMPOTENT_METHODS for request in requests)
+            )
+        except Exception as e:
+            logger.error(f"Meta batch request failed: {e}")
+            return None, {"message": f"Network error: {e}", "is_transient": True}
+
+        self.throttle.update(response.headers)
+
+        if response.status_code >= 400:
+            error = _graph_error(response.text, response.status_code)
+            if error.get("code") in RATE_LIMIT_ERROR_CODES:
+                self.throttle.penalize(_retry_after(response.headers))
+            logger.error(f"Meta batch call rejected ({response.status_code}): {error.get('message')}")
+            return None, error
+
+        try:
+            responses = response.json()
+        except ValueError:
+            return None, {"message": "Invalid batch response from Meta", "is_transient": True}
+
+        if not isinstance(responses, list):
+            return None, _graph_error(response.text, response.status_code)
+
+        # Meta returns fewer entries when it stops early; treat the rest as unprocessed
+        responses = responses + [None] * (len(requests) - len(responses))
+        return responses, None
+
+    def _apply_response(self, result: MetaBatchResult, response: Optional[Dict[str, Any]]) -> bool:
+        """Store a sub-response on its result; returns True when it should be retried"""
+        if response is None:
+            result.error = {"message": "Sub-request was not processed by Meta"}
+            return True
+
+        result.status_code = response.get("code")
+        body = response.get("body")
+        try:
+            data = json.loads(body) if isinstance(body, str) and body else body
+        except ValueError:
+            data = body
+
+        if result.status_code is not None and result.status_code < 400:
+            result.data = data
+            result.error = None
+            return False
+
+        error = data.get("error", {}) if isinstance(data, dict) else {}
+        result.error = {
+            "message": error.get("message", f"HTTP {result.status_code}"),
+            "code": error.get("code", result.status_code),
+            "type": error.get("type"),
+            "is_transient": error.get("is_transient", False)
+        }
+
+        if result.error["code"] in RATE_LIMIT_ERROR_CODES:
+            self.throttle.penalize()
+        return _should_retry(result.error, result.status_code)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Batch execution statistics"""
+        return {
+            **self.stats,
+            "app_usage_percent": self.throttle.usage,
+            "throttle_waits": self.throttle.waits
+        }
+
+
+def _graph_error(text: str, status_code: int) -> Dict[str, Any]:
+    try:
+        error = json.loads(text).get("error", {})
+    except (TypeError, ValueError, AttributeError):
+        error = {}
+    return {
+        "message": error.get("message", text or f"HTTP {status_code}"),
+        "code": error.get("code", status_code),
+        "type": error.get("type"),
+        "is_transient": error.get("is_transient", False),
+        "status_code": status_code
+    }
+
+
+def _should_retry(error: Dict[str, Any], status_code: Optional[int]) -> bool:
+    """Transient, throttled and server-side failures are worth retrying"""
+    return bool(
+        error.get("is_transient")
+        or error.get("code") in TRANSIENT_ERROR_CODES
+        or error.get("code") in RATE_LIMIT_ERROR_CODES
+        or (status_code or 0) >= 500
+    )
+
+
+# One throttle per process: Facebook and Instagram share the Meta app quota
+_meta_usage_throttle: Optional[MetaUsageThrottle] = None
+
+
+def get_meta_usage_throttle() -> MetaUsageThrottle:
+    """Get or create the process-wide Meta usage throttle"""
+    global _meta_usage_throttle
+
+    if _meta_usage_throttle is None:
+        _meta_usage_throttle = MetaUsageThrottle()
+
+    return _meta_usage_throttle
@@ -199,7 +199,9 @@ class PerformanceCache:
 class ConnectionPool:
     """
     HTTP connection pool manager for social media APIs
-    Provides connection reuse and rate limiting coordination
+    
+    Thin view over the shared per-platform clients in backend.core.http_client,
+    so the optimizer and the platform clients reuse the same connections.
     """
     
     def __init__(self, max_connections: int = 100, max_keepalive: int = 20):
@@ -207,56 +209,42 @@ class ConnectionPool:
         Initialize connection pool
         
         Args:
-            max_connections: Maximum total connections
-            max_keepalive: Maximum keepalive connections per host
+            max_connections: Kept for compatibility; limits are per platform
+                (see PLATFORM_POOL_LIMITS)
+            max_keepalive: Kept for compatibility
         """
         self.max_connections = max_connections
         self.max_keepalive = max_keepalive
         self.pools: Dict[str, Any] = {}
-        self.connection_stats = {
-            "total_connections": 0,
-            "active_connections": 0,
-            "connection_reuse": 0,
-            "connection_timeouts": 0
-        }
         
         logger.info(f"Connection pool initialized: max_connections={max_connections}")
     
     async def get_client(self, platform: str, timeout: int = 30):
-        """Get optimized HTTP client for platform"""
-        import httpx
+        """Get the shared pooled HTTP client for platform"""
+        from backend.core.http_client import get_platform_http_client
         
         if platform not in self.pools:
-            limits = httpx.Limits(
-                max_connections=self.max_connections,
-                max_keepalive_connections=self.max_keepalive
-            )
-            
-            timeout_config = httpx.Timeout(timeout)
-            
-            self.pools[platform] = httpx.AsyncClient(
-                limits=limits,
-                timeout=timeout_config,
-                http2=True  # Enable HTTP/2 for better performance
-            )
-            
-            logger.info(f"Created new connection pool for {platform}")
+            self.pools[platform] = get_platform_http_client(platform)
         
         return self.pools[platform]
     
     async def close_all(self):
         """Close all connection pools"""
-        for platform, client in self.pools.items():
-            await client.aclose()
-            logger.info(f"Closed connection pool for {platform}")
+        from backend.core.http_client import close_platform_http_clients
         
+        await close_platform_http_clients()
         self.pools.clear()
     
     def get_stats(self) -> Dict[str, Any]:
-        """Get connection pool statistics"""
+        """Get connection reuse and handshake statistics per platform"""
+        from backend.core.http_client import get_platform_transport_stats
+        
+        platforms = get_platform_transport_stats()
         return {
-            **self.connection_stats,
-            "active_pools": len(self.pools)
+            "total_connections": sum(stats["new_connections"] for stats in platforms.values()),
+            "connection_reuse": sum(stats["reused_connections"] for stats in platforms.values()),
+            "active_pools": len(platforms),
+            "platforms": platforms
         }
 
 class RateLimiter:
@@ -10,10 +10,10 @@ import json
 import hashlib
 import time
 
-import requests
-from requests.auth import HTTPBasicAuth
+import httpx
 from requests_oauthlib import OAuth2Session
 
+from backend.core.http_client import get_platform_http_client
 from backend.core.token_encryption import get_token_manager
 from backend.core.audit_logger import log_content_event, AuditEventType
 
@@ -43,6 +43,7 @@ class TwitterClient:
     MAX_TWEET_LENGTH = 280
     MAX_THREAD_TWEETS = 25
     MAX_IMAGES_PER_TWEET = 4
+    MAX_LOOKUP_IDS = 100  # ids per GET /2/tweets lookup
     
     def __init__(self, client_id: Optional[str] = None, client_secret: Optional[str] = None):
         """
@@ -59,7 +60,6 @@ class TwitterClient:
             logger.warning("Twitter OAuth credentials not provided. Set TWITTER_CLIENT_ID and TWITTER_CLIENT_SECRET environment variables.")
         
         self.token_manager = get_token_manager()
-        self.session = requests.Session()
         
         # Rate limiting tracking
         self.rate_limits = {}
@@ -99,7 +99,7 @@ class TwitterClient:
             logger.error(f"Failed to generate OAuth authorization URL: {e}")
             raise TwitterAPIError(f"OAuth authorization URL generation failed: {e}")
     
-    def exchange_code_for_tokens(self, authorization_code: str, redirect_uri: str, code_verifier: str) -> Dict[str, Any]:
+    async def exchange_code_for_tokens(self, authorization_code: str, redirect_uri: str, code_verifier: str) -> Dict[str, Any]:
         """
         Exchange authorization code for access and refresh tokens
         
@@ -121,10 +121,11 @@ class TwitterClient:
                 "code_verifier": code_verifier
             }
             
-            response = requests.post(
+            response = await self._request(
+                "POST",
                 f"{self.OAUTH_URL}/token",
                 data=token_data,
-                auth=HTTPBasicAuth(self.client_id, self.client_secret),
+                auth=(self.client_id, self.client_secret),
                 headers={"Content-Type": "application/x-www-form-urlencoded"},
                 timeout=10
             )
@@ -146,7 +147,7 @@ class TwitterClient:
             logger.error(f"Token exchange failed: {e}")
             raise TwitterAPIError(f"Token exchange failed: {e}")
     
-    def refresh_access_token(self, refresh_token: str) -> Dict[str, Any]:
+    async def refresh_access_token(self, refresh_token: str) -> Dict[str, Any]:
         """
         Refresh access token using refresh token
         
@@ -163,10 +164,11 @@ class TwitterClient:
                 "client_id": self.client_id
             }
             
-            response = requests.post(
+            response = await self._request(
+                "POST",
                 f"{self.OAUTH_URL}/token",
                 data=token_data,
-                auth=HTTPBasicAuth(self.client_id, self.client_secret),
+                auth=(self.client_id, self.client_secret),
                 headers={"Content-Type": "application/x-www-form-urlencoded"},
                 timeout=10
             )
@@ -188,14 +190,16 @@ class TwitterClient:
             logger.error(f"Token refresh failed: {e}")
             raise TwitterAPIError(f"Token refresh failed: {e}")
     
-    def _get_authenticated_session(self, access_token: str) -> requests.Session:
-        """Get authenticated requests session"""
-        session = requests.Session()
-        session.headers.update({
-            "Authorization": f"Bearer {access_token}",
-            "Content-Type": "application/json"
-        })
-        return session
+    async def _request(self, method: str, url: str, access_token: Optional[str] = None, **kwargs) -> httpx.Response:
+        """Make HTTP request over the shared Twitter connection pool"""
+        if access_token:
+            headers = kwargs.pop("headers", None) or {}
+            kwargs["headers"] = {
+                "Authorization": f"Bearer {access_token}",
+                "Content-Type": "application/json",
+                **headers
+            }
+        return await get_platform_http_client("twitter").request(method, url, **kwargs)
     
     def _check_rate_limit(self, endpoint: str) -> bool:
         """
@@ -219,7 +223,7 @@ class TwitterClient:
         remaining = rate_limit_info.get("remaining", 1)
         return remaining > 0
     
-    def _update_rate_limit(self, endpoint: str, response: requests.Response):
+    def _update_rate_limit(self, endpoint: str, response: httpx.Response):
         """Update rate limit tracking from API response headers"""
         headers = response.headers
         
@@ -229,7 +233,7 @@ class TwitterClient:
             "reset_time": int(headers.get("x-rate-limit-reset", 0))
         }
     
-    def get_user_info(self, access_token: str) -> Dict[str, Any]:
+    async def get_user_info(self, access_token: str) -> Dict[str, Any]:
         """
         Get authenticated user information
         
@@ -256,14 +260,14 @@ class TwitterClient:
             }
             
         try:
-            session = self._get_authenticated_session(access_token)
-            
             # Check rate limits
             if not self._check_rate_limit("users/me"):
                 raise TwitterAPIError("Rate limit exceeded for user info endpoint")
             
-            response = session.get(
+            response = await self._request(
+                "GET",
                 f"{self.BASE_URL}/users/me",
+                access_token,
                 params={
                     "user.fields": "id,name,username,profile_image_url,public_metrics,verified,description,location"
                 },
@@ -284,7 +288,7 @@ class TwitterClient:
             logger.error(f"Failed to get user info: {e}")
             raise TwitterAPIError(f"Failed to get user info: {e}")
     
-    def post_tweet(self, access_token: str, content: str, user_id: int, media_ids: Optional[List[str]] = None) -> Dict[str, Any]:
+    async def post_tweet(self, access_token: str, content: str, user_id: int, media_ids: Optional[List[str]] = None) -> Dict[str, Any]:
         """
         Post a tweet to Twitter
         
@@ -302,8 +306,6 @@ class TwitterClient:
             if len(content) > self.MAX_TWEET_LENGTH:
                 raise TwitterAPIError(f"Tweet content too long: {len(content)} > {self.MAX_TWEET_LENGTH}")
             
-            session = self._get_authenticated_session(access_token)
-            
             # Check rate limits
             if not self._check_rate_limit("tweets"):
                 raise TwitterAPIError("Rate limit exceeded for tweets endpoint")
@@ -317,10 +319,13 @@ class TwitterClient:
                 tweet_payload["media"] = {"media_ids": media_ids}
             
             # Post tweet
-            response = session.post(
+            response = await self._request(
+                "POST",
                 f"{self.BASE_URL}/tweets",
+                access_token,
                 json=tweet_payload,
-                timeout=15
+                timeout=15,
+                retry=False  # A resent tweet after a timeout would publish twice
             )
             
             self._update_rate_limit("tweets", response)
@@ -366,7 +371,7 @@ class TwitterClient:
             
             raise TwitterAPIError(f"Failed to post tweet: {e}")
     
-    def get_tweet_metrics(self, access_token: str, tweet_id: str) -> Dict[str, Any]:
+    async def get_tweet_metrics(self, access_token: str, tweet_id: str) -> Dict[str, Any]:
         """
         Get engagement metrics for a specific tweet
         
@@ -378,14 +383,14 @@ class TwitterClient:
             Dictionary containing tweet metrics
         """
         try:
-            session = self._get_authenticated_session(access_token)
-            
             # Check rate limits
             if not self._check_rate_limit("tweets/metrics"):
                 raise TwitterAPIError("Rate limit exceeded for tweet metrics endpoint")
             
-            response = session.get(
+            response = await self._request(
+                "GET",
                 f"{self.BASE_URL}/tweets/{tweet_id}",
+                access_token,
                 params={
                     "tweet.fields": "public_metrics,created_at,author_id,context_annotations,entities",
                     "expansions": "author_id"
@@ -399,37 +404,87 @@ class TwitterClient:
                 logger.error(f"Failed to get tweet metrics: {response.status_code} - {response.text}")
                 raise TwitterAPIError(f"Failed to get tweet metrics: {response.text}")
             
-            tweet_data = response.json()["data"]
-            
-            # Extract metrics
-            metrics = tweet_data.get("public_metrics", {})
-            
-            # Calculate engagement rate (likes + retweets + replies / impressions)
-            engagement_count = metrics.get("like_count", 0) + metrics.get("retweet_count", 0) + metrics.get("reply_count", 0)
-            impression_count = metrics.get("impression_count", 1)  # Avoid division by zero
-            engagement_rate = (engagement_count / impression_count) * 100 if impression_count > 0 else 0
-            
-            processed_metrics = {
-                "tweet_id": tweet_id,
-                "likes_count": metrics.get("like_count", 0),
-                "retweets_count": metrics.get("retweet_count", 0),
-                "replies_count": metrics.get("reply_count", 0),
-                "quotes_count": metrics.get("quote_count", 0),
-                "bookmarks_count": metrics.get("bookmark_count", 0),
-                "impressions_count": impression_count,
-                "engagement_rate": round(engagement_rate, 2),
-                "created_at": tweet_data.get("created_at"),
-                "retrieved_at": datetime.utcnow().isoformat()
-            }
+            processed_metrics = self._process_tweet_metrics(response.json()["data"])
             
-            logger.info(f"Retrieved metrics for tweet {tweet_id}: {engagement_count} engagements, {engagement_rate:.2f}% rate")
+            logger.info(
+                f"Retrieved metrics for tweet {tweet_id}: {processed_metrics['total_engagement']} engagements, "
+                f"{processed_metrics['engagement_rate']:.2f}% rate"
+            )
             return processed_metrics
             
         except Exception as e:
             logger.error(f"Failed to get tweet metrics: {e}")
             raise TwitterAPIError(f"Failed to get tweet metrics: {e}")
     
-    def validate_connection(self, access_token: str) -> Dict[str, Any]:
+    async def get_tweets_metrics(self, access_token: str, tweet_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get engagement metrics for many tweets with the multi-id tweet lookup
+        
+        Args:
+            access_token: OAuth access token
+            tweet_ids: Twitter tweet IDs (looked up MAX_LOOKUP_IDS per request)
+            
+        Returns:
+            Metrics keyed by tweet ID; deleted or inaccessible tweets are omitted
+        """
+        metrics_by_id = {}
+        
+        for offset in range(0, len(tweet_ids), self.MAX_LOOKUP_IDS):
+            chunk = tweet_ids[offset:offset + self.MAX_LOOKUP_IDS]
+            
+            if not self._check_rate_limit("tweets/lookup"):
+                raise TwitterAPIError("Rate limit exceeded for tweet lookup endpoint")
+            
+            response = await self._request(
+                "GET",
+                f"{self.BASE_URL}/tweets",
+                access_token,
+                params={
+                    "ids": ",".join(chunk),
+                    "tweet.fields": "public_metrics,created_at"
+                },
+                timeout=15
+            )
+            
+            self._update_rate_limit("tweets/lookup", response)
+            
+            if response.status_code != 200:
+                logger.error(f"Failed to look up tweets: {response.status_code} - {response.text}")
+                raise TwitterAPIError(f"Failed to look up tweets: {response.text}")
+            
+            payload = response.json()
+            for tweet_data in payload.get("data", []):
+                metrics_by_id[tweet_data["id"]] = self._process_tweet_metrics(tweet_data)
+            
+            for error in payload.get("errors", []):
+                logger.warning(f"Tweet lookup error for {error.get('resource_id')}: {error.get('detail')}")
+        
+        return metrics_by_id
+    
+    def _process_tweet_metrics(self, tweet_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert a tweet object with public_metrics into engagement metrics"""
+        metrics = tweet_data.get("public_metrics", {})
+        
+        # Calculate engagement rate (likes + retweets + replies / impressions)
+        engagement_count = metrics.get("like_count", 0) + metrics.get("retweet_count", 0) + metrics.get("reply_count", 0)
+        impression_count = metrics.get("impression_count", 1)  # Avoid division by zero
+        engagement_rate = (engagement_count / impression_count) * 100 if impression_count > 0 else 0
+        
+        return {
+            "tweet_id": tweet_data.get("id"),
+            "likes_count": metrics.get("like_count", 0),
+            "retweets_count": metrics.get("retweet_count", 0),
+            "replies_count": metrics.get("reply_count", 0),
+            "quotes_count": metrics.get("quote_count", 0),
+            "bookmarks_count": metrics.get("bookmark_count", 0),
+            "impressions_count": impression_count,
+            "total_engagement": engagement_count,
+            "engagement_rate": round(engagement_rate, 2),
+            "created_at": tweet_data.get("created_at"),
+            "retrieved_at": datetime.utcnow().isoformat()
+        }
+    
+    async def validate_connection(self, access_token: str) -> Dict[str, Any]:
         """
         Validate Twitter connection by making a test API call
         
@@ -441,7 +496,7 @@ class TwitterClient:
         """
         try:
             # Test connection by getting user info
-            user_info = self.get_user_info(access_token)
+            user_info = await self.get_user_info(access_token)
             
             return {
                 "is_valid": True,
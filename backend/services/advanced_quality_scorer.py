@@ -6,9 +6,11 @@ beyond basic technical quality metrics. Provides comprehensive scoring
 for content relevance, aesthetic quality, and brand alignment.
 """
 
+import asyncio
 import logging
 import base64
 import io
+from dataclasses import dataclass
 from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 from PIL import Image
@@ -19,6 +21,106 @@ from backend.core.config import get_settings
 settings = get_settings()
 logger = logging.getLogger(__name__)
 
+# Longest edge of the thumbnail every pixel statistic is computed on
+ANALYSIS_SIZE = 256
+
+# Images decoded at once by score_batch
+BATCH_DECODE_CONCURRENCY = 4
+
+# Colour histogram resolution per channel (16 levels -> 4096 bins)
+HISTOGRAM_LEVELS = 16
+
+
+@dataclass
+class ImageAnalysis:
+    """Decoded analysis thumbnail and its pixel statistics"""
+    thumbnail: Image.Image
+    width: int
+    height: int
+    distinct_values: int
+    unique_colors: int
+    contrast: float
+    sharpness: float
+    dominant_colors: List[str]
+
+    @property
+    def size(self) -> Tuple[int, int]:
+        """Original image size"""
+        return self.width, self.height
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "width": self.width,
+            "height": self.height,
+            "unique_colors": self.unique_colors,
+            "contrast": round(self.contrast, 2),
+            "sharpness": round(self.sharpness, 2),
+            "dominant_colors": self.dominant_colors
+        }
+
+
+def analyze_image(image_base64: str) -> ImageAnalysis:
+    """
+    Decode an image once into a small thumbnail and compute its statistics
+    
+    Runs in a worker thread; JPEG decoding is downscaled in the decoder itself.
+    
+    Args:
+        image_base64: Base64 encoded image data
+        
+    Returns:
+        ImageAnalysis of the original size and thumbnail pixels
+    """
+    image = Image.open(io.BytesIO(base64.b64decode(image_base64)))
+    width, height = image.size
+    image.draft("RGB", (ANALYSIS_SIZE, ANALYSIS_SIZE))
+    image.thumbnail((ANALYSIS_SIZE, ANALYSIS_SIZE))
+    thumbnail = image.convert("RGB")
+
+    pixels = np.asarray(thumbnail, dtype=np.uint8)
+    flat = pixels.reshape(-1, 3)
+
+    # Distinct channel values (blank/uniform detection) and distinct RGB colours
+    distinct_values = int(np.count_nonzero(np.bincount(flat.ravel(), minlength=256)))
+    packed = (flat[:, 0].astype(np.uint32) << 16) | (flat[:, 1].astype(np.uint32) << 8) | flat[:, 2]
+    # Sorting beats np.unique's hash path on a thumbnail-sized array
+    packed.sort()
+    unique_colors = int(np.count_nonzero(np.diff(packed))) + 1
+
+    # Contrast is the luma standard deviation; sharpness the variance of its Laplacian
+    luma = flat @ np.array([0.299, 0.587, 0.114], dtype=np.float32)
+    luma = luma.reshape(pixels.shape[:2])
+    contrast = float(luma.std())
+    if min(luma.shape) >= 3:
+        laplacian = (4 * luma[1:-1, 1:-1] - luma[:-2, 1:-1] - luma[2:, 1:-1]
+                     - luma[1:-1, :-2] - luma[1:-1, 2:])
+        sharpness = float(laplacian.var())
+    else:
+        sharpness = 0.0
+
+    # Coarse colour histogram for the dominant palette
+    step = 256 // HISTOGRAM_LEVELS
+    quantized = flat // step
+    bins = (quantized[:, 0].astype(np.int32) * HISTOGRAM_LEVELS + quantized[:, 1]) * HISTOGRAM_LEVELS + quantized[:, 2]
+    histogram = np.bincount(bins, minlength=HISTOGRAM_LEVELS ** 3)
+    top = np.argsort(histogram)[::-1][:5]
+    dominant_colors = []
+    for index in top[histogram[top] > 0]:
+        levels = np.unravel_index(index, (HISTOGRAM_LEVELS,) * 3)
+        dominant_colors.append("#" + "".join(f"{int(level) * step + step // 2:02x}" for level in levels))
+
+    return ImageAnalysis(
+        thumbnail=thumbnail,
+        width=width,
+        height=height,
+        distinct_values=distinct_values,
+        unique_colors=unique_colors,
+        contrast=contrast,
+        sharpness=sharpness,
+        dominant_colors=dominant_colors
+    )
+
+
 class AdvancedQualityScorer:
     """
     Advanced image quality scoring using CLIP and LAION-based models.
@@ -147,71 +249,11 @@ class AdvancedQualityScorer:
             Comprehensive quality assessment with scores and recommendations
         """
         try:
-            # Load and validate image
-            image_pil = self._decode_image(image_base64)
-            if not image_pil:
+            # Decode once into an analysis thumbnail, off the event loop
+            analysis = await self._analyze(image_base64)
+            if not analysis:
                 return self._create_error_response("Failed to decode image")
-            
-            # Get platform-specific weights
-            weights = self.platform_weights.get(platform, self.platform_weights['default'])
-            
-            # Initialize scores
-            quality_scores = {}
-            total_score = 0
-            
-            # 1. Technical Quality Assessment
-            technical_score = await self._assess_technical_quality(image_pil)
-            quality_scores['technical'] = technical_score
-            total_score += technical_score * weights['technical']
-            
-            # 2. Semantic Alignment Assessment (CLIP-based)
-            semantic_score = await self._assess_semantic_alignment(image_pil, original_prompt)
-            quality_scores['semantic'] = semantic_score
-            total_score += semantic_score * weights['semantic']
-            
-            # 3. Aesthetic Quality Assessment (LAION-based)
-            aesthetic_score = await self._assess_aesthetic_quality(image_pil)
-            quality_scores['aesthetic'] = aesthetic_score
-            total_score += aesthetic_score * weights['aesthetic']
-            
-            # 4. Brand Consistency Assessment
-            brand_score = await self._assess_brand_consistency(image_pil, brand_context)
-            quality_scores['brand'] = brand_score
-            total_score += brand_score * weights['brand']
-            
-            # 5. Platform Suitability Assessment
-            platform_score = await self._assess_platform_suitability(image_pil, platform)
-            quality_scores['platform_fit'] = platform_score
-            total_score += platform_score * weights['platform_fit']
-            
-            # Calculate overall score
-            overall_score = min(100, max(0, total_score))
-            
-            # Generate quality assessment and recommendations
-            quality_level = self._determine_quality_level(overall_score)
-            recommendations = self._generate_recommendations(quality_scores, weights, platform)
-            
-            return {
-                "overall_score": round(overall_score, 1),
-                "quality_level": quality_level,
-                "dimension_scores": {
-                    "technical": round(quality_scores['technical'], 1),
-                    "semantic": round(quality_scores['semantic'], 1),
-                    "aesthetic": round(quality_scores['aesthetic'], 1),
-                    "brand": round(quality_scores['brand'], 1),
-                    "platform_fit": round(quality_scores['platform_fit'], 1)
-                },
-                "weights_used": weights,
-                "recommendations": recommendations,
-                "quality_acceptable": overall_score >= self.quality_thresholds['acceptable'],
-                "models_used": {
-                    "clip_available": self.clip_model is not None,
-                    "laion_available": self.laion_aesthetic_model is not None,
-                    "advanced_scoring": self.models_loaded
-                },
-                "platform": platform,
-                "assessed_at": datetime.utcnow().isoformat()
-            }
+            return await self._score_analysis(analysis, original_prompt, platform, brand_context)
             
         except Exception as e:
             logger.error(f"Advanced quality scoring failed: {e}")
@@ -222,20 +264,114 @@ class AdvancedQualityScorer:
             else:
                 return self._create_error_response(f"Quality assessment failed: {str(e)}")
     
-    def _decode_image(self, image_base64: str) -> Optional[Image.Image]:
-        """Decode base64 image to PIL Image."""
+    async def score_batch(self,
+                          images: List[Tuple[str, str]],
+                          platform: str = "instagram",
+                          brand_context: Optional[Dict[str, Any]] = None,
+                          fallback_to_basic: bool = True) -> List[Dict[str, Any]]:
+        """
+        Score several images, e.g. the variations generate_content_images
+        produces for one platform, decoding up to BATCH_DECODE_CONCURRENCY at once.
+        
+        Args:
+            images: List of (image_base64, original_prompt) tuples
+            platform: Target social media platform
+            brand_context: Brand guidelines and context
+            fallback_to_basic: Whether to fall back to basic scoring if models unavailable
+            
+        Returns:
+            Quality assessments in input order
+        """
+        limit = asyncio.Semaphore(BATCH_DECODE_CONCURRENCY)
+        
+        async def score_one(image_base64: str, original_prompt: str) -> Dict[str, Any]:
+            async with limit:
+                return await self.score_image_quality(
+                    image_base64, original_prompt, platform, brand_context, fallback_to_basic
+                )
+        
+        return await asyncio.gather(*(score_one(image, prompt) for image, prompt in images))
+    
+    async def _analyze(self, image_base64: str) -> Optional[ImageAnalysis]:
+        """Decode and analyze an image in a worker thread."""
         try:
-            image_data = base64.b64decode(image_base64)
-            image_pil = Image.open(io.BytesIO(image_data))
-            return image_pil
+            return await asyncio.to_thread(analyze_image, image_base64)
         except Exception as e:
             logger.error(f"Failed to decode image: {e}")
             return None
     
-    async def _assess_technical_quality(self, image: Image.Image) -> float:
+    async def _score_analysis(self,
+                              analysis: ImageAnalysis,
+                              original_prompt: str,
+                              platform: str,
+                              brand_context: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Score every dimension of an analyzed image."""
+        # Get platform-specific weights
+        weights = self.platform_weights.get(platform, self.platform_weights['default'])
+        
+        # Initialize scores
+        quality_scores = {}
+        total_score = 0
+        
+        # 1. Technical Quality Assessment
+        technical_score = await self._assess_technical_quality(analysis)
+        quality_scores['technical'] = technical_score
+        total_score += technical_score * weights['technical']
+        
+        # 2. Semantic Alignment Assessment (CLIP-based)
+        semantic_score = await self._assess_semantic_alignment(analysis.thumbnail, original_prompt)
+        quality_scores['semantic'] = semantic_score
+        total_score += semantic_score * weights['semantic']
+        
+        # 3. Aesthetic Quality Assessment (LAION-based)
+        aesthetic_score = await self._assess_aesthetic_quality(analysis)
+        quality_scores['aesthetic'] = aesthetic_score
+        total_score += aesthetic_score * weights['aesthetic']
+        
+        # 4. Brand Consistency Assessment
+        brand_score = await self._assess_brand_consistency(analysis, brand_context)
+        quality_scores['brand'] = brand_score
+        total_score += brand_score * weights['brand']
+        
+        # 5. Platform Suitability Assessment
+        platform_score = await self._assess_platform_suitability(analysis, platform)
+        quality_scores['platform_fit'] = platform_score
+        total_score += platform_score * weights['platform_fit']
+        
+        # Calculate overall score
+        overall_score = min(100, max(0, total_score))
+        
+        # Generate quality assessment and recommendations
+        quality_level = self._determine_quality_level(overall_score)
+        recommendations = self._generate_recommendations(quality_scores, weights, platform)
+        
+        return {
+            "overall_score": round(overall_score, 1),
+            "quality_level": quality_level,
+            "dimension_scores": {
+                "technical": round(quality_scores['technical'], 1),
+                "semantic": round(quality_scores['semantic'], 1),
+                "aesthetic": round(quality_scores['aesthetic'], 1),
+                "brand": round(quality_scores['brand'], 1),
+                "platform_fit": round(quality_scores['platform_fit'], 1)
+            },
+            "weights_used": weights,
+            "recommendations": recommendations,
+            "quality_acceptable": overall_score >= self.quality_thresholds['acceptable'],
+            "models_used": {
+                "clip_available": self.clip_model is not None,
+                "laion_available": self.laion_aesthetic_model is not None,
+                "advanced_scoring": self.models_loaded
+            },
+            "image_statistics": analysis.to_dict(),
+            "platform": platform,
+            "assessed_at": datetime.utcnow().isoformat()
+        }
+    
+    async def _assess_technical_quality(self, analysis: ImageAnalysis) -> float:
         """Assess technical image quality (resolution, composition, clarity)."""
         try:
-            width, height = image.size
+            width, height = analysis.size
             total_pixels = width * height
             
             # Resolution score (higher is better, up to a point)
@@ -259,12 +395,8 @@ class AdvancedQualityScorer:
             else:
                 aspect_score = 70
             
-            # Basic quality checks
-            # Convert to array for analysis
-            image_array = np.array(image)
-            
             # Check for completely blank or uniform images
-            if len(np.unique(image_array)) < 10:
+            if analysis.distinct_values < 10:
                 uniformity_penalty = 50
             else:
                 uniformity_penalty = 0
@@ -320,15 +452,15 @@ class AdvancedQualityScorer:
         # For now, just return a neutral score
         return 65.0
     
-    async def _assess_aesthetic_quality(self, image: Image.Image) -> float:
+    async def _assess_aesthetic_quality(self, analysis: ImageAnalysis) -> float:
         """Assess aesthetic quality using LAION-based models."""
         try:
             if not self.laion_aesthetic_model:
                 # Fallback to basic aesthetic assessment
-                return self._basic_aesthetic_assessment(image)
+                return self._basic_aesthetic_assessment(analysis)
             
             # Use the aesthetic model
-            result = self.laion_aesthetic_model(image)
+            result = self.laion_aesthetic_model(analysis.thumbnail)
             
             # Extract aesthetic score (depends on specific model)
             # This is a placeholder - adjust based on actual model output
@@ -348,20 +480,16 @@ class AdvancedQualityScorer:
             
         except Exception as e:
             logger.error(f"LAION aesthetic assessment failed: {e}")
-            return self._basic_aesthetic_assessment(image)
+            return self._basic_aesthetic_assessment(analysis)
     
-    def _basic_aesthetic_assessment(self, image: Image.Image) -> float:
+    def _basic_aesthetic_assessment(self, analysis: ImageAnalysis) -> float:
         """Basic aesthetic assessment fallback."""
         try:
             # Basic heuristics for aesthetic quality
-            width, height = image.size
-            
-            # Color variety
-            image_array = np.array(image)
-            unique_colors = len(np.unique(image_array.reshape(-1, image_array.shape[-1]), axis=0))
+            width, height = analysis.size
             
             # More color variety generally indicates more interesting images
-            color_score = min(100, (unique_colors / 1000) * 100)
+            color_score = min(100, (analysis.unique_colors / 1000) * 100)
             
             # Aspect ratio aesthetics
             aspect_ratio = width / height
@@ -377,7 +505,7 @@ class AdvancedQualityScorer:
             logger.error(f"Basic aesthetic assessment failed: {e}")
             return 60.0
     
-    async def _assess_brand_consistency(self, image: Image.Image, brand_context: Optional[Dict[str, Any]]) -> float:
+    async def _assess_brand_consistency(self, analysis: ImageAnalysis, brand_context: Optional[Dict[str, Any]]) -> float:
         """Assess brand consistency and alignment."""
         try:
             if not brand_context:
@@ -408,10 +536,10 @@ class AdvancedQualityScorer:
             logger.error(f"Brand consistency assessment failed: {e}")
             return 70.0
     
-    async def _assess_platform_suitability(self, image: Image.Image, platform: str) -> float:
+    async def _assess_platform_suitability(self, analysis: ImageAnalysis, platform: str) -> float:
         """Assess suitability for specific social media platform."""
         try:
-            width, height = image.size
+            width, height = analysis.size
             aspect_ratio = width / height
             
             platform_preferences = {
@@ -510,11 +638,11 @@ class AdvancedQualityScorer:
         """Fallback to basic quality scoring when advanced models unavailable."""
         try:
             # Basic quality assessment without ML models
-            image_pil = self._decode_image(image_base64)
-            if not image_pil:
+            analysis = await self._analyze(image_base64)
+            if not analysis:
                 return self._create_error_response("Failed to decode image for basic assessment")
             
-            technical_score = await self._assess_technical_quality(image_pil)
+            technical_score = await self._assess_technical_quality(analysis)
             
             # Simplified scoring
             fallback_score = technical_score * 0.6 + 40  # Add base score for other dimensions
@@ -0,0 +1,146 @@
+"""
+Async TTL Cache
+
+In-process LRU cache with per-entry TTL and single-flight computation,
+shared by the moderation verdict cache and the research search cache.
+
+Subclasses decide how a (namespace, key) pair maps to a cache key, how long
+entries in a namespace live and which computed values are worth keeping;
+storage, eviction, expiry and the single-flight bookkeeping live here.
+"""
+
+import asyncio
+import copy
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+
+def sha256_hex(text: str) -> str:
+    """SHA-256 hex digest of a string"""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class AsyncTTLCache:
+    """
+    In-process LRU cache with TTL and single-flight
+
+    Values are deep-copied on the way in and out so callers can mutate what
+    they get back without corrupting the cached entry. Concurrent misses for
+    the same key share one in-flight computation.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: int):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+        self.hits = 0
+        self.misses = 0
+
+    def make_key(self, namespace: str, key: str) -> str:
+        """Build the cache key for a namespace and key"""
+        return f"{namespace}:{sha256_hex(key)}"
+
+    def _ttl(self, namespace: str) -> int:
+        """Lifetime in seconds of entries stored under a namespace"""
+        return self.ttl_seconds
+
+    def _cacheable(self, value: Any) -> bool:
+        """Whether a computed value is stored when the caller passes no predicate"""
+        return True
+
+    def get(self, namespace: str, key: str) -> Optional[Any]:
+        """Return a cached value or None if missing/expired"""
+        cache_key = self.make_key(namespace, key)
+        entry = self._entries.get(cache_key)
+
+        if entry is None:
+            self.misses += 1
+            return None
+
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[cache_key]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(cache_key)
+        self.hits += 1
+        return copy.deepcopy(value)
+
+    def set(self, namespace: str, key: str, value: Any) -> None:
+        """Store a value, evicting the least recently used entries"""
+        cache_key = self.make_key(namespace, key)
+        self._entries[cache_key] = (time.monotonic() + self._ttl(namespace), copy.deepcopy(value))
+        self._entries.move_to_end(cache_key)
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def get_or_compute(
+        self,
+        namespace: str,
+        key: str,
+        compute: Callable[[], Awaitable[Any]],
+        cacheable: Optional[Callable[[Any], bool]] = None
+    ) -> Any:
+        """
+        Return the cached value or compute it once for all concurrent callers
+
+        Args:
+            namespace: Value namespace
+            key: Value key within the namespace
+            compute: Coroutine factory producing the value on a miss
+            cacheable: Predicate deciding whether a computed value is stored
+                (defaults to the cache's own rule)
+
+        Returns:
+            The value (a private copy for the caller)
+        """
+        cached = self.get(namespace, key)
+        if cached is not None:
+            return cached
+
+        cache_key = self.make_key(namespace, key)
+        inflight = self._inflight.get(cache_key)
+        if inflight is not None:
+            return copy.deepcopy(await asyncio.shield(inflight))
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[cache_key] = future
+        try:
+            value = await compute()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Mark retrieved so an unawaited failure does not log a warning
+            future.exception()
+            raise
+        else:
+            if (cacheable or self._cacheable)(value):
+                self.set(namespace, key, value)
+            future.set_result(value)
+            return copy.deepcopy(value)
+        finally:
+            self._inflight.pop(cache_key, None)
+
+    def clear(self) -> None:
+        """Drop every cached value"""
+        self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Cache statistics for monitoring"""
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 4) if total else 0.0
+        }
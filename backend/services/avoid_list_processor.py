@@ -6,6 +6,7 @@ across all AI model templates. Implements negative prompt support and
 content filtering for Agent 1 compliance requirements.
 """
 
+import hashlib
 import logging
 import re
 from typing import Dict, List, Set, Optional, Tuple, Any
@@ -14,6 +15,8 @@ from enum import Enum
 import json
 from pathlib import Path
 
+from backend.services.multi_pattern_matcher import MultiPatternMatcher, PatternRule, get_pattern_matcher
+
 logger = logging.getLogger(__name__)
 
 class ContentCategory(Enum):
@@ -57,6 +60,12 @@ class AvoidListProcessor:
         # Compile regex patterns for performance
         self.compiled_patterns = {}
         self._compile_patterns()
+        
+        # Single-scan matcher over every rule, rebuilt when rules change
+        self._matcher: Optional[MultiPatternMatcher] = None
+        self._rule_index: Dict[int, str] = {}
+        self._rules_version = 0
+        self._matcher_version: Optional[int] = None
     
     def _initialize_default_rules(self) -> List[AvoidListRule]:
         """Initialize default content safety rules"""
@@ -289,6 +298,39 @@ class AvoidListProcessor:
             except re.error as e:
                 logger.warning(f"Invalid regex pattern '{rule.pattern}': {e}")
     
+    def _all_rules(self) -> List[AvoidListRule]:
+        """All default, platform and quality rules in evaluation order"""
+        all_rules = self.rules.copy()
+        for platform_rules in self.platform_specific_rules.values():
+            all_rules.extend(platform_rules)
+        for quality_rules in self.quality_rules.values():
+            all_rules.extend(quality_rules)
+        return all_rules
+    
+    def _get_matcher(self) -> MultiPatternMatcher:
+        """Get the compiled matcher, recompiling after rule changes"""
+        if self._matcher is not None and self._matcher_version == self._rules_version:
+            return self._matcher
+        
+        all_rules = [rule for rule in self._all_rules() if rule.pattern in self.compiled_patterns]
+        fingerprint = hashlib.sha256(
+            "\n".join(f"{rule.category.value}:{rule.pattern}" for rule in all_rules).encode()
+        ).hexdigest()[:16]
+        
+        self._rule_index = {id(rule): str(index) for index, rule in enumerate(all_rules)}
+        self._matcher = get_pattern_matcher("avoid_list", fingerprint, [
+            PatternRule(
+                rule_id=str(index),
+                category=rule.category.value,
+                pattern=rule.pattern,
+                flags=re.IGNORECASE | re.MULTILINE
+            )
+            for index, rule in enumerate(all_rules)
+        ])
+        self._matcher_version = self._rules_version
+        
+        return self._matcher
+    
     def process_content(self, content: str, platform: Optional[str] = None, 
                        quality_level: Optional[str] = None, 
                        strict_mode: bool = True) -> Dict[str, Any]:
@@ -307,51 +349,56 @@ class AvoidListProcessor:
         # Get applicable rules
         applicable_rules = self._get_applicable_rules(platform, quality_level)
         
-        processed_content = content
+        # One scan finds the hits of every rule; rules are then applied in order
+        matcher = self._get_matcher()
+        hits_by_rule = matcher.group_by_rule(matcher.scan(content))
+        replacement_spans = []
         
         for rule in applicable_rules:
-            pattern = self.compiled_patterns.get(rule.pattern)
-            if not pattern:
+            rule_hits = hits_by_rule.get(self._rule_index.get(id(rule)))
+            if not rule_hits:
                 continue
             
-            matches = pattern.findall(processed_content)
-            if matches:
-                violation = {
-                    "category": rule.category.value,
-                    "severity": rule.severity,
-                    "description": rule.description,
-                    "matches": matches,
-                    "processing_mode": rule.processing_mode.value
-                }
-                result["violations"].append(violation)
-                
-                # Apply processing based on mode
-                if rule.processing_mode == ProcessingMode.BLOCK_REQUEST:
-                    if strict_mode or rule.severity == "critical":
-                        result["blocked"] = True
-                        result["warnings"].append(f"Content blocked due to {rule.category.value}: {rule.description}")
-                        break
-                
-                elif rule.processing_mode == ProcessingMode.FILTER_OUT:
-                    if rule.replacement_text:
-                        old_content = processed_content
-                        processed_content = pattern.sub(rule.replacement_text, processed_content)
-                        result["replacements"].append({
-                            "original": matches,
-                            "replacement": rule.replacement_text,
-                            "category": rule.category.value
-                        })
-                        logger.info(f"Content filtered: {rule.category.value} - {len(matches)} matches replaced")
-                
-                elif rule.processing_mode == ProcessingMode.NEGATIVE_PROMPT:
-                    negative_items = [match for match in matches if match not in result["negative_prompts"]]
-                    result["negative_prompts"].extend(negative_items)
-                
-                elif rule.processing_mode == ProcessingMode.POSITIVE_GUIDANCE:
-                    # Convert negative to positive guidance
-                    if rule.replacement_text:
-                        guidance = f"ensure {rule.replacement_text} instead of {', '.join(matches)}"
-                        result["negative_prompts"].append(guidance)
+            matches = [hit.text for hit in rule_hits]
+            violation = {
+                "category": rule.category.value,
+                "severity": rule.severity,
+                "description": rule.description,
+                "matches": matches,
+                "processing_mode": rule.processing_mode.value
+            }
+            result["violations"].append(violation)
+            
+            # Apply processing based on mode
+            if rule.processing_mode == ProcessingMode.BLOCK_REQUEST:
+                if strict_mode or rule.severity == "critical":
+                    result["blocked"] = True
+                    result["warnings"].append(f"Content blocked due to {rule.category.value}: {rule.description}")
+                    break
+            
+            elif rule.processing_mode == ProcessingMode.FILTER_OUT:
+                if rule.replacement_text:
+                    replacement_spans.extend(
+                        (hit.start, hit.end, rule.replacement_text) for hit in rule_hits
+                    )
+                    result["replacements"].append({
+                        "original": matches,
+                        "replacement": rule.replacement_text,
+                        "category": rule.category.value
+                    })
+                    logger.info(f"Content filtered: {rule.category.value} - {len(matches)} matches replaced")
+            
+            elif rule.processing_mode == ProcessingMode.NEGATIVE_PROMPT:
+                negative_items = [match for match in matches if match not in result["negative_prompts"]]
+                result["negative_prompts"].extend(negative_items)
+            
+            elif rule.processing_mode == ProcessingMode.POSITIVE_GUIDANCE:
+                # Convert negative to positive guidance
+                if rule.replacement_text:
+                    guidance = f"ensure {rule.replacement_text} instead of {', '.join(matches)}"
+                    result["negative_prompts"].append(guidance)
+        
+        processed_content = self._apply_replacements(content, replacement_spans)
         
         result["processed_content"] = processed_content
         
@@ -363,6 +410,28 @@ class AvoidListProcessor:
         
         return result
     
+    def _apply_replacements(self, content: str, spans: List[Tuple[int, int, str]]) -> str:
+        """
+        Apply replacement spans in one pass; spans are in rule priority order
+        and a span overlapping an earlier accepted one is dropped.
+        """
+        if not spans:
+            return content
+        
+        accepted: List[Tuple[int, int, str]] = []
+        for start, end, replacement in spans:
+            if all(end <= other_start or start >= other_end for other_start, other_end, _ in accepted):
+                accepted.append((start, end, replacement))
+        
+        parts = []
+        position = 0
+        for start, end, replacement in sorted(accepted):
+            parts.append(content[position:start])
+            parts.append(replacement)
+            position = end
+        parts.append(content[position:])
+        return "".join(parts)
+    
     def _get_applicable_rules(self, platform: Optional[str], quality_level: Optional[str]) -> List[AvoidListRule]:
         """Get rules applicable to the given platform and quality level"""
         applicable_rules = self.rules.copy()
@@ -470,6 +539,7 @@ class AvoidListProcessor:
             # Add rule
             self.rules.append(rule)
             self.compiled_patterns[rule.pattern] = re.compile(rule.pattern, re.IGNORECASE | re.MULTILINE)
+            self._rules_version += 1
             
             logger.info(f"Custom rule added: {rule.category.value} - {rule.description}")
             return True
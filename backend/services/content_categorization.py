@@ -3,12 +3,14 @@ AI-powered Content Categorization System
 Handles automatic categorization by topic, platform, engagement levels, and sentiment analysis
 """
 import asyncio
+import copy
+import hashlib
 import logging
 import re
+from collections import OrderedDict
 from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 from dataclasses import dataclass
-from openai import OpenAI, AsyncOpenAI
 import json
 
 from backend.core.config import get_settings
@@ -20,6 +22,22 @@ logger = logging.getLogger(__name__)
 
 settings = get_settings()
 
+CATEGORIZATION_MODEL = "gpt-4o-mini"
+
+# Packed batch requests: input budget per request (1 token ≈ 4 characters),
+# output tokens reserved per item, and packed requests in flight at once
+BATCH_INPUT_TOKEN_BUDGET = 6000
+BATCH_MAX_ITEMS = 40
+BATCH_OUTPUT_TOKENS_PER_ITEM = 150
+BATCH_CONCURRENCY = 4
+MAX_ITEM_CHARS = 2000
+
+# Keyword matches this confident, from at least this many distinct keywords, skip the LLM
+KEYWORD_CONFIDENCE_THRESHOLD = 0.8
+KEYWORD_MIN_DISTINCT_HITS = 3
+
+RESULT_CACHE_SIZE = 10000
+
 @dataclass
 class CategoryResult:
     """Result of content categorization"""
@@ -49,6 +67,8 @@ class ContentCategorizer:
     
     def __init__(self):
         """Initialize the content categorizer"""
+        # Imported here: the singleton is built on first use, so importing this module stays cheap
+        from openai import OpenAI, AsyncOpenAI
         self.openai_client = OpenAI(api_key=settings.openai_api_key)
         self.async_client = AsyncOpenAI(api_key=settings.openai_api_key)
         
@@ -88,6 +108,15 @@ class ContentCategorizer:
             }
         }
         
+        # Whole-word keyword patterns, so "ai" does not match inside "said"
+        self.keyword_patterns = {
+            category: [
+                re.compile(rf"(?<!\w){re.escape(keyword)}(?!\w)", re.IGNORECASE)
+                for keyword in info["keywords"]
+            ]
+            for category, info in self.base_categories.items()
+        }
+        
         # Platform-specific categorization rules
         self.platform_rules = {
             "twitter": {
@@ -117,8 +146,28 @@ class ContentCategorizer:
             }
         }
         
+        # AI results keyed by content hash; categorization does not drift for identical text
+        self._result_cache: "OrderedDict[str, CategoryResult]" = OrderedDict()
+        
         logger.info("ContentCategorizer initialized with base categories and platform rules")
     
+    def _cache_key(self, content: str, platform: str) -> str:
+        """Content hash used to cache AI categorizations"""
+        return hashlib.sha256(f"{platform}\n{content}".encode("utf-8")).hexdigest()
+    
+    def _get_cached(self, key: str) -> Optional[CategoryResult]:
+        result = self._result_cache.get(key)
+        if result is None:
+            return None
+        self._result_cache.move_to_end(key)
+        return copy.deepcopy(result)
+    
+    def _set_cached(self, key: str, result: CategoryResult) -> None:
+        self._result_cache[key] = copy.deepcopy(result)
+        self._result_cache.move_to_end(key)
+        while len(self._result_cache) > RESULT_CACHE_SIZE:
+            self._result_cache.popitem(last=False)
+    
     def _extract_text_elements(self, content: str) -> Dict[str, List[str]]:
         """Extract hashtags, mentions, and links from content"""
         # Extract hashtags
@@ -141,15 +190,10 @@ class ContentCategorizer:
     
     def _keyword_based_categorization(self, content: str) -> Tuple[str, float]:
         """Fallback categorization based on keyword matching"""
-        content_lower = content.lower()
-        
         category_scores = {}
-        for category, info in self.base_categories.items():
-            score = 0
-            for keyword in info["keywords"]:
-                # Count keyword occurrences (case-insensitive)
-                occurrences = content_lower.count(keyword.lower())
-                score += occurrences
+        for category, patterns in self.keyword_patterns.items():
+            # Count whole-word keyword occurrences (case-insensitive)
+            score = sum(len(pattern.findall(content)) for pattern in patterns)
             
             # Normalize by content length
             if len(content) > 0:
@@ -162,8 +206,17 @@ class ContentCategorizer:
         
         return "general", 0.5
     
-    async def _ai_categorization(self, content: str, platform: str) -> CategoryResult:
-        """Use OpenAI to categorize content with detailed analysis"""
+    def _keyword_confident(self, content: str) -> bool:
+        """True when keyword matching alone is reliable enough to skip the LLM"""
+        category, confidence = self._keyword_based_categorization(content)
+        if confidence < KEYWORD_CONFIDENCE_THRESHOLD:
+            return False
+        # One keyword repeated in a short post is not enough evidence
+        distinct_hits = sum(1 for pattern in self.keyword_patterns.get(category, []) if pattern.search(content))
+        return distinct_hits >= KEYWORD_MIN_DISTINCT_HITS
+    
+    async def _ai_categorization(self, content: str, platform: str) -> Optional[CategoryResult]:
+        """Use OpenAI to categorize content with detailed analysis; None when the request fails"""
         try:
             # Create comprehensive categorization prompt
             prompt = f"""
@@ -192,7 +245,7 @@ class ContentCategorizer:
             """
             
             response = await self.async_client.chat.completions.create(
-                model="gpt-4o-mini",
+                model=CATEGORIZATION_MODEL,
                 messages=[
                     {"role": "system", "content": "You are an expert content analyst specializing in social media categorization. Always respond with valid JSON."},
                     {"role": "user", "content": prompt}
@@ -203,27 +256,105 @@ class ContentCategorizer:
             
             # Parse AI response
             ai_result = json.loads(response.choices[0].message.content)
-            
-            # Extract text elements
-            text_elements = self._extract_text_elements(content)
-            
-            # Create result object
-            return CategoryResult(
-                topic_category=ai_result.get("topic_category", "general"),
-                confidence=float(ai_result.get("confidence", 0.5)),
-                sentiment=ai_result.get("sentiment", "neutral"),
-                tone=ai_result.get("tone", "conversational"),
-                reading_level=ai_result.get("reading_level", "intermediate"),
-                keywords=ai_result.get("keywords", []),
-                hashtags=text_elements["hashtags"],
-                mentions=text_elements["mentions"],
-                links=text_elements["links"]
-            )
+            return self._result_from_ai(content, ai_result)
             
         except Exception as e:
             logger.error(f"AI categorization failed: {e}")
-            # Fallback to keyword-based categorization
-            return await self._fallback_categorization(content, platform)
+            return None
+    
+    def _result_from_ai(self, content: str, ai_result: Dict[str, Any]) -> CategoryResult:
+        """Build a CategoryResult from one parsed AI categorization"""
+        text_elements = self._extract_text_elements(content)
+        return CategoryResult(
+            topic_category=ai_result.get("topic_category", "general"),
+            confidence=float(ai_result.get("confidence", 0.5)),
+            sentiment=ai_result.get("sentiment", "neutral"),
+            tone=ai_result.get("tone", "conversational"),
+            reading_level=ai_result.get("reading_level", "intermediate"),
+            keywords=ai_result.get("keywords", []),
+            hashtags=text_elements["hashtags"],
+            mentions=text_elements["mentions"],
+            links=text_elements["links"]
+        )
+    
+    def _pack_items(self, items: List[Tuple[str, str, str]]) -> List[List[Tuple[str, str, str]]]:
+        """
+        Group (key, content, platform) items into packed requests by token budget
+        
+        Args:
+            items: Items to categorize
+            
+        Returns:
+            Packs, each within BATCH_INPUT_TOKEN_BUDGET and BATCH_MAX_ITEMS
+        """
+        packs = []
+        current = []
+        current_tokens = 0
+        for item in items:
+            # Content is truncated to MAX_ITEM_CHARS in the request; ~20 tokens of JSON framing
+            item_tokens = min(len(item[1]), MAX_ITEM_CHARS) // 4 + 20
+            if current and (current_tokens + item_tokens > BATCH_INPUT_TOKEN_BUDGET or len(current) >= BATCH_MAX_ITEMS):
+                packs.append(current)
+                current = []
+                current_tokens = 0
+            current.append(item)
+            current_tokens += item_tokens
+        if current:
+            packs.append(current)
+        return packs
+    
+    async def _ai_categorization_packed(self, items: List[Tuple[str, str, str]]) -> Dict[str, CategoryResult]:
+        """
+        Categorize several items in one structured-output request
+        
+        Args:
+            items: (key, content, platform) tuples
+            
+        Returns:
+            Results by key; items the model left out or mangled are missing
+        """
+        payload = [
+            {"id": index, "platform": platform, "content": content[:MAX_ITEM_CHARS]}
+            for index, (_, content, platform) in enumerate(items)
+        ]
+        prompt = f"""
+        Analyze each social media post in the JSON array below and categorize it.
+
+        Posts:
+        {json.dumps(payload, ensure_ascii=False)}
+
+        Respond with a JSON object {{"results": [...]}} holding one entry per post, each:
+        {{
+            "id": the post's id,
+            "topic_category": "one of: technology, marketing, business, industry_news, educational, personal, finance, health, or general",
+            "confidence": 0.0-1.0,
+            "sentiment": "positive, negative, or neutral",
+            "tone": "professional, casual, humorous, inspiring, educational, promotional, or conversational",
+            "reading_level": "beginner, intermediate, or advanced",
+            "keywords": ["5-10 most important keywords"]
+        }}
+        """
+        
+        response = await self.async_client.chat.completions.create(
+            model=CATEGORIZATION_MODEL,
+            messages=[
+                {"role": "system", "content": "You are an expert content analyst specializing in social media categorization. Always respond with valid JSON."},
+                {"role": "user", "content": prompt}
+            ],
+            temperature=0.3,
+            max_tokens=BATCH_OUTPUT_TOKENS_PER_ITEM * len(items) + 100,
+            response_format={"type": "json_object"}
+        )
+        
+        entries = json.loads(response.choices[0].message.content).get("results", [])
+        results = {}
+        for entry in entries:
+            try:
+                key, content, _ = items[int(entry["id"])]
+                results[key] = self._result_from_ai(content, entry)
+            except (KeyError, IndexError, TypeError, ValueError) as e:
+                logger.warning(f"Skipping malformed packed categorization entry: {e}")
+        return results
     
     async def _fallback_categorization(self, content: str, platform: str) -> CategoryResult:
         """Fallback categorization when AI fails"""
@@ -311,22 +442,22 @@ class ContentCategorizer:
         """
         try:
             if use_ai and settings.openai_api_key:
-                result = await self._ai_categorization(content, platform)
+                key = self._cache_key(content, platform)
+                result = self._get_cached(key)
+                if result is None:
+                    if self._keyword_confident(content):
+                        result = await self._fallback_categorization(content, platform)
+                    else:
+                        result = await self._ai_categorization(content, platform)
+                        if result is None:
+                            # Keyword fallback; not cached so the next call retries the API
+                            result = await self._fallback_categorization(content, platform)
+                        else:
+                            self._set_cached(key, result)
             else:
                 result = await self._fallback_categorization(content, platform)
             
-            # Validate platform compatibility
-            platform_rules = self.platform_rules.get(platform, {})
-            if platform_rules:
-                # Check content length
-                max_length = platform_rules.get("max_length", 10000)
-                if len(content) > max_length:
-                    logger.warning(f"Content exceeds {platform} max length ({len(content)}/{max_length})")
-                
-                # Check hashtag limits
-                hashtag_limit = platform_rules.get("hashtag_limit", 10)
-                if len(result.hashtags) > hashtag_limit:
-                    logger.warning(f"Too many hashtags for {platform} ({len(result.hashtags)}/{hashtag_limit})")
+            self._check_platform_rules(content, platform, result)
             
             logger.info(f"Categorized content as '{result.topic_category}' with {result.confidence:.2f} confidence")
             return result
@@ -346,6 +477,20 @@ class ContentCategorizer:
                 links=[]
             )
     
+    def _check_platform_rules(self, content: str, platform: str, result: CategoryResult) -> None:
+        """Warn when content breaks the platform's length or hashtag limits"""
+        platform_rules = self.platform_rules.get(platform, {})
+        if platform_rules:
+            # Check content length
+            max_length = platform_rules.get("max_length", 10000)
+            if len(content) > max_length:
+                logger.warning(f"Content exceeds {platform} max length ({len(content)}/{max_length})")
+            
+            # Check hashtag limits
+            hashtag_limit = platform_rules.get("hashtag_limit", 10)
+            if len(result.hashtags) > hashtag_limit:
+                logger.warning(f"Too many hashtags for {platform} ({len(result.hashtags)}/{hashtag_limit})")
+    
     async def categorize_batch(
         self, 
         content_list: List[Tuple[str, str]], 
@@ -354,6 +499,11 @@ class ContentCategorizer:
         """
         Categorize multiple content items efficiently
         
+        Cached and keyword-confident items skip the LLM; the rest are packed
+        many to a request by token budget, with at most BATCH_CONCURRENCY
+        requests in flight. Items a packed request fails on fall back to
+        keyword categorization.
+        
         Args:
             content_list: List of (content, platform) tuples
             use_ai: Whether to use AI categorization
@@ -362,13 +512,13 @@ class ContentCategorizer:
             List of CategoryResult objects
         """
         try:
-            # Process in parallel for better performance
-            tasks = [
-                self.categorize_content(content, platform, use_ai)
-                for content, platform in content_list
-            ]
-            
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+            if use_ai and settings.openai_api_key:
+                results = await self._categorize_batch_packed(content_list)
+            else:
+                results = await asyncio.gather(*(
+                    self.categorize_content(content, platform, use_ai=False)
+                    for content, platform in content_list
+                ), return_exceptions=True)
             
             # Handle any exceptions in results
             processed_results = []
@@ -411,6 +561,54 @@ class ContentCategorizer:
                 for _ in content_list
             ]
     
+    async def _categorize_batch_packed(self, content_list: List[Tuple[str, str]]) -> List[Any]:
+        """AI batch categorization; returns a result or exception per item"""
+        results: List[Any] = [None] * len(content_list)
+        pending: Dict[str, List[int]] = {}
+        
+        for i, (content, platform) in enumerate(content_list):
+            key = self._cache_key(content, platform)
+            cached = self._get_cached(key)
+            if cached is not None:
+                results[i] = cached
+            elif key in pending:
+                pending[key].append(i)
+            elif self._keyword_confident(content):
+                results[i] = await self._fallback_categorization(content, platform)
+            else:
+                pending[key] = [i]
+        
+        items = [(key, *content_list[indexes[0]]) for key, indexes in pending.items()]
+        packs = self._pack_items(items)
+        limit = asyncio.Semaphore(BATCH_CONCURRENCY)
+        
+        async def run_pack(pack: List[Tuple[str, str, str]]) -> Dict[str, CategoryResult]:
+            async with limit:
+                try:
+                    return await self._ai_categorization_packed(pack)
+                except Exception as e:
+                    logger.error(f"Packed categorization of {len(pack)} items failed: {e}")
+                    return {}
+        
+        pack_results = await asyncio.gather(*(run_pack(pack) for pack in packs))
+        categorized = {key: result for results_by_key in pack_results for key, result in results_by_key.items()}
+        
+        for key, content, platform in items:
+            result = categorized.get(key)
+            if result is None:
+                result = await self._fallback_categorization(content, platform)
+            else:
+                self._set_cached(key, result)
+            for i in pending[key]:
+                results[i] = copy.deepcopy(result)
+        
+        for (content, platform), result in zip(content_list, results):
+            self._check_platform_rules(content, platform, result)
+        
+        if packs:
+            logger.info(f"Categorized {len(items)} unique items in {len(packs)} packed requests")
+        return results
+    
     def predict_engagement_level(
         self, 
         category_result: CategoryResult, 
@@ -23,6 +23,7 @@ linkedin_client = None
 from backend.integrations.instagram_client import instagram_client
 from backend.integrations.facebook_client import facebook_client
 from backend.core.vector_store import vector_store
+from backend.services.similarity_service import similarity_service
 from backend.db.database import get_db_session
 from backend.db.models import ContentItem, Goal
 from crewai import Crew, Process, Task
@@ -489,7 +490,9 @@ class ContentGenerationService:
                 platform_versions = await self._create_platform_versions(parsed_content, prompt)
                 
                 # Calculate quality scores
-                originality_score = await self._calculate_originality_score(parsed_content["body"])
+                originality_score = await self._calculate_originality_score(
+                    parsed_content["body"], prompt.constraints.get("organization_id")
+                )
                 brand_alignment_score = self._calculate_brand_alignment_score(parsed_content["body"], prompt.tone)
                 seo_score = self._calculate_seo_score(parsed_content["body"], prompt.keywords)
                 
@@ -728,9 +731,14 @@ class ContentGenerationService:
             logger.warning(f"Failed to extract trending keywords: {e}")
             return [topic.replace(" ", "").lower()]
     
-    async def _calculate_originality_score(self, content: str) -> float:
+    async def _calculate_originality_score(self, content: str, organization_id: Optional[str] = None) -> float:
         """Calculate content originality score"""
         try:
+            # Reworded copies of stored content are caught without a vector search
+            duplicate = similarity_service.check_near_duplicate(content, organization_id)
+            if duplicate:
+                return max(0.0, 100 - duplicate["similarity"] * 100)
+            
             # Search for similar content in vector store
             similar_content = await vector_store.similarity_search(content[:200], k=5)
             
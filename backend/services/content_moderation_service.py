@@ -9,11 +9,16 @@ import base64
 from typing import Dict, List, Any, Optional, Tuple, Union
 from datetime import datetime
 from enum import Enum
-import re
 
 from openai import AsyncOpenAI
 from backend.core.config import get_settings
 from backend.services.usage_tracking_service import UsageTrackingService
+from backend.services.moderation_cache import (
+    MODERATION_POLICY_VERSION,
+    get_moderation_cache,
+    get_openai_moderation,
+)
+from backend.services.multi_pattern_matcher import PatternRule, get_pattern_matcher
 
 logger = logging.getLogger(__name__)
 
@@ -56,6 +61,74 @@ class ModerationCategories:
         'copyright': {'threshold': 0.8, 'description': 'Potential copyright infringement'}
     }
 
+# Pattern matching rules per moderation category
+MODERATION_PATTERNS = {
+    # NSFW keywords (comprehensive list)
+    'nsfw': [
+        r'\b(porn|pornography|xxx|adult|nsfw)\b',
+        r'\b(nude|naked|nudity|topless|bottomless)\b',
+        r'\b(sex|sexual|sexy|erotic|intimate)\b',
+        r'\b(breast|nipple|genital|penis|vagina)\b',
+        r'\b(fetish|kink|bdsm|dominatrix)\b',
+        r'\b(masturbate|masturbation|orgasm|climax)\b',
+        r'\b(revealing|provocative|seductive|sensual)\b',
+        r'\b(undressed|unclothed|scantily)\b',
+        r'\b(explicit|graphic).*\b(content|material|imagery)\b',
+    ],
+    # Violence patterns
+    'violence': [
+        r'\b(kill|murder|death|blood|gore|violent)\b',
+        r'\b(gun|weapon|knife|bomb|explosive)\b',
+        r'\b(fight|attack|assault|violence)\b',
+        r'\b(shoot|shooting|stabbing|killing)\b',
+        r'\b(war|battlefield|combat|destruction)\b',
+        r'\b(torture|abuse|brutality|carnage)\b',
+    ],
+    # Hate speech patterns
+    'hate': [
+        r'\b(hate|racist|discrimination|prejudice)\b',
+        r'\b(nazi|hitler|holocaust)\b',
+        r'\b(terrorist|terrorism|extremist)\b',
+    ],
+    # Drug-related patterns
+    'drugs': [
+        r'\b(drug|cocaine|heroin|marijuana|cannabis)\b',
+        r'\b(alcohol|beer|wine|drunk|intoxicated)\b',
+        r'\b(smoke|smoking|cigarette|tobacco)\b',
+    ],
+}
+
+# Explicit sexual terms (plain substring checks)
+NSFW_EXPLICIT_TERMS = [
+    'explicit', 'graphic', 'sexual content', 'adult material',
+    'mature content', 'not safe for work', 'nsfw'
+]
+
+# Suggestive context combinations and their score contribution
+NSFW_SUGGESTIVE_COMBINATIONS = [
+    (r'\b(hot|sexy|attractive)\b.*\b(woman|man|person)\b', 0.3),
+    (r'\b(revealing|tight|skimpy)\b.*\b(clothing|outfit|dress)\b', 0.4),
+    (r'\b(bedroom|bed|intimate)\b.*\b(scene|moment|setting)\b', 0.5),
+]
+
+
+def _build_moderation_rules() -> List[PatternRule]:
+    """Flatten the moderation rule tables into matcher rules"""
+    rules = [
+        PatternRule(rule_id=f"{category}:{index}", category=category, pattern=pattern)
+        for category, patterns in MODERATION_PATTERNS.items()
+        for index, pattern in enumerate(patterns)
+    ]
+    rules.extend(
+        PatternRule(rule_id=f"nsfw_term:{index}", category='nsfw_content', pattern=term, is_regex=False)
+        for index, term in enumerate(NSFW_EXPLICIT_TERMS)
+    )
+    rules.extend(
+        PatternRule(rule_id=f"nsfw_context:{index}", category='nsfw_content', pattern=pattern)
+        for index, (pattern, _) in enumerate(NSFW_SUGGESTIVE_COMBINATIONS)
+    )
+    return rules
+
 class ContentModerationService:
     """
     Comprehensive content moderation service with multiple layers of protection
@@ -78,6 +151,14 @@ class ContentModerationService:
         # Initialize usage tracking (optional, requires database session)
         self.usage_tracker = None
         
+        # Verdict cache shared with ContentSafetyService
+        self.verdict_cache = get_moderation_cache()
+        
+        # Pattern and NSFW layers share one compiled single-scan matcher
+        self.pattern_matcher = get_pattern_matcher(
+            "moderation", MODERATION_POLICY_VERSION, _build_moderation_rules()
+        )
+        
         logger.info(f"Content moderation service initialized (enabled: {self.moderation_enabled})")
     
     async def moderate_content(
@@ -114,30 +195,43 @@ class ContentModerationService:
         start_time = datetime.utcnow()
         
         try:
-            # Layer 1: Basic content validation
-            basic_validation = await self._basic_validation(content, content_type)
-            if basic_validation['result'] != ModerationResult.APPROVED.value:
-                return basic_validation
-            
-            # Layer 2: OpenAI moderation (if available)
-            openai_result = None
-            if self.openai_client and content_type in [ContentType.TEXT, ContentType.COMBINED]:
-                openai_result = await self._openai_moderation(content)
-            
-            # Layer 3: Custom pattern matching
-            pattern_result = await self._pattern_matching(content, content_type)
-            
-            # Layer 4: NSFW text detection
-            nsfw_result = await self._nsfw_text_detection(content)
-            
-            # Combine results and make final decision
-            final_result = await self._combine_results(
-                basic_validation,
-                openai_result,
-                pattern_result,
-                nsfw_result,
-                context
-            )
+            # Identical drafts re-submitted while editing skip every layer
+            verdict_namespace = f"verdict:{content_type.value}"
+            final_result = self.verdict_cache.get(verdict_namespace, content)
+            if final_result is not None:
+                final_result['context'] = context or {}
+                final_result['cached'] = True
+            else:
+                # Layer 1: Basic content validation
+                basic_validation = await self._basic_validation(content, content_type)
+                if basic_validation['result'] != ModerationResult.APPROVED.value:
+                    return basic_validation
+                
+                # Layer 2 runs remotely; the local layers 3 and 4 are evaluated
+                # while the OpenAI request is in flight
+                if self.openai_client and content_type in [ContentType.TEXT, ContentType.COMBINED]:
+                    openai_check = self._openai_moderation(content)
+                else:
+                    openai_check = asyncio.sleep(0, result=None)
+                
+                openai_result, pattern_result, nsfw_result = await asyncio.gather(
+                    openai_check,
+                    self._pattern_matching(content, content_type),
+                    self._nsfw_text_detection(content)
+                )
+                
+                # Combine results and make final decision
+                final_result = await self._combine_results(
+                    basic_validation,
+                    openai_result,
+                    pattern_result,
+                    nsfw_result,
+                    context
+                )
+                
+                # Only complete verdicts are reusable
+                if not (openai_result and openai_result['result'] == ModerationResult.ERROR.value):
+                    self.verdict_cache.set(verdict_namespace, content, final_result)
             
             # Calculate processing time
             processing_time = (datetime.utcnow() - start_time).total_seconds() * 1000
@@ -227,21 +321,15 @@ class ContentModerationService:
             return None
         
         try:
-            response = await self.openai_client.moderations.create(
-                input=content,
-                model="text-moderation-latest"
-            )
-            
-            result = response.results[0]
-            categories = result.categories
-            category_scores = result.category_scores
+            moderation = await get_openai_moderation(self.openai_client, content)
+            category_scores = moderation['category_scores']
             
             # Check if any category exceeds threshold
             flagged_categories = {}
             max_score = 0
             
-            for category, flagged in categories:
-                score = getattr(category_scores, category, 0)
+            for category in moderation['categories']:
+                score = category_scores.get(category) or 0
                 max_score = max(max_score, score)
                 
                 # Check against our custom thresholds
@@ -278,57 +366,12 @@ class ContentModerationService:
         """Pattern-based content detection"""
         
         flagged_patterns = {}
-        content_lower = content.lower()
-        
-        # NSFW keywords (comprehensive list)
-        nsfw_patterns = [
-            r'\b(porn|pornography|xxx|adult|nsfw)\b',
-            r'\b(nude|naked|nudity|topless|bottomless)\b',
-            r'\b(sex|sexual|sexy|erotic|intimate)\b',
-            r'\b(breast|nipple|genital|penis|vagina)\b',
-            r'\b(fetish|kink|bdsm|dominatrix)\b',
-            r'\b(masturbate|masturbation|orgasm|climax)\b',
-            r'\b(revealing|provocative|seductive|sensual)\b',
-            r'\b(undressed|unclothed|scantily)\b',
-            r'\b(explicit|graphic).*\b(content|material|imagery)\b',
-        ]
-        
-        # Violence patterns
-        violence_patterns = [
-            r'\b(kill|murder|death|blood|gore|violent)\b',
-            r'\b(gun|weapon|knife|bomb|explosive)\b',
-            r'\b(fight|attack|assault|violence)\b',
-            r'\b(shoot|shooting|stabbing|killing)\b',
-            r'\b(war|battlefield|combat|destruction)\b',
-            r'\b(torture|abuse|brutality|carnage)\b',
-        ]
-        
-        # Hate speech patterns
-        hate_patterns = [
-            r'\b(hate|racist|discrimination|prejudice)\b',
-            r'\b(nazi|hitler|holocaust)\b',
-            r'\b(terrorist|terrorism|extremist)\b',
-        ]
-        
-        # Drug-related patterns
-        drug_patterns = [
-            r'\b(drug|cocaine|heroin|marijuana|cannabis)\b',
-            r'\b(alcohol|beer|wine|drunk|intoxicated)\b',
-            r'\b(smoke|smoking|cigarette|tobacco)\b',
-        ]
-        
-        # Check all patterns
-        all_patterns = {
-            'nsfw': nsfw_patterns,
-            'violence': violence_patterns,
-            'hate': hate_patterns,
-            'drugs': drug_patterns
-        }
+        hits_by_rule = self.pattern_matcher.group_by_rule(self.pattern_matcher.scan(content))
         
-        for category, patterns in all_patterns.items():
+        for category, patterns in MODERATION_PATTERNS.items():
             category_score = 0
-            for pattern in patterns:
-                matches = re.findall(pattern, content_lower)
+            for index in range(len(patterns)):
+                matches = hits_by_rule.get(f"{category}:{index}")
                 if matches:
                     # Higher score for NSFW and violence to be more sensitive
                     multiplier = 0.8 if category in ['nsfw', 'violence'] else 0.3
@@ -368,27 +411,16 @@ class ContentModerationService:
         
         # Enhanced NSFW detection using multiple approaches
         nsfw_score = 0
+        hit_rules = {hit.rule_id for hit in self.pattern_matcher.scan(content)}
         
         # Check for explicit sexual terms
-        explicit_terms = [
-            'explicit', 'graphic', 'sexual content', 'adult material',
-            'mature content', 'not safe for work', 'nsfw'
-        ]
-        
-        content_lower = content.lower()
-        for term in explicit_terms:
-            if term in content_lower:
+        for index in range(len(NSFW_EXPLICIT_TERMS)):
+            if f"nsfw_term:{index}" in hit_rules:
                 nsfw_score += 0.4
         
         # Check for suggestive context
-        suggestive_combinations = [
-            (r'\b(hot|sexy|attractive)\b.*\b(woman|man|person)\b', 0.3),
-            (r'\b(revealing|tight|skimpy)\b.*\b(clothing|outfit|dress)\b', 0.4),
-            (r'\b(bedroom|bed|intimate)\b.*\b(scene|moment|setting)\b', 0.5),
-        ]
-        
-        for pattern, score in suggestive_combinations:
-            if re.search(pattern, content_lower):
+        for index, (pattern, score) in enumerate(NSFW_SUGGESTIVE_COMBINATIONS):
+            if f"nsfw_context:{index}" in hit_rules:
                 nsfw_score += score
         
         # Cap the score at 1.0
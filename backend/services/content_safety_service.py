@@ -22,7 +22,6 @@ import json
 import re
 import hashlib
 
-from openai import AsyncOpenAI
 from prometheus_client import Counter, Histogram, Gauge
 from sqlalchemy.orm import Session
 from pydantic import BaseModel, Field
@@ -30,6 +29,8 @@ from pydantic import BaseModel, Field
 from backend.core.config import get_settings
 from backend.db.models import User
 from backend.core.observability import get_observability_manager
+from backend.services.moderation_cache import get_openai_moderation
+from backend.services.multi_pattern_matcher import PatternRule, get_pattern_matcher
 
 settings = get_settings()
 logger = logging.getLogger(__name__)
@@ -122,6 +123,8 @@ class ContentSafetyService:
         self.openai_client = None
         if settings.openai_api_key:
             try:
+                # Imported here so loading the safety middleware does not import OpenAI
+                from openai import AsyncOpenAI
                 self.openai_client = AsyncOpenAI(api_key=settings.openai_api_key)
                 logger.info("OpenAI moderation client initialized")
             except Exception as e:
@@ -137,6 +140,14 @@ class ContentSafetyService:
         
         # Brand protection keywords and patterns
         self.profanity_patterns = self._load_profanity_patterns()
+        self.profanity_matcher = get_pattern_matcher(
+            "content_safety_profanity",
+            hashlib.sha256("\n".join(self.profanity_patterns).encode()).hexdigest()[:16],
+            [
+                PatternRule(rule_id=pattern, category=ViolationType.PROFANITY.value, pattern=pattern)
+                for pattern in self.profanity_patterns
+            ]
+        )
         self.spam_indicators = self._load_spam_indicators()
         
         # Content quality thresholds
@@ -316,13 +327,11 @@ class ContentSafetyService:
             return {"status": "unavailable", "reason": "OpenAI client not configured"}
         
         try:
-            moderation = await self.openai_client.moderations.create(input=content_text)
-            result = moderation.results[0]
+            # Shares verdicts (and in-flight calls) with ContentModerationService
+            moderation = await get_openai_moderation(self.openai_client, content_text)
             
             return {
-                "flagged": result.flagged,
-                "categories": dict(result.categories),
-                "category_scores": dict(result.category_scores),
+                **moderation,
                 "status": "completed"
             }
             
@@ -333,13 +342,10 @@ class ContentSafetyService:
     async def _check_custom_filters(self, content_text: str, platform: str) -> Dict[str, Any]:
         """Apply custom profanity and spam filters"""
         violations = []
-        content_lower = content_text.lower()
         
-        # Profanity detection
-        profanity_matches = []
-        for pattern in self.profanity_patterns:
-            if re.search(pattern, content_lower, re.IGNORECASE):
-                profanity_matches.append(pattern)
+        # Profanity detection (single scan over all patterns)
+        hit_rules = {hit.rule_id for hit in self.profanity_matcher.scan(content_text)}
+        profanity_matches = [pattern for pattern in self.profanity_patterns if pattern in hit_rules]
         
         if profanity_matches:
             violations.append({
@@ -782,10 +788,13 @@ class ContentSafetyService:
         return vowels
 
 
-# Global service instance
-content_safety_service = ContentSafetyService()
+# Global service instance, created on first use
+content_safety_service: Optional[ContentSafetyService] = None
 
 
 def get_content_safety_service():
     """Get the global content safety service instance"""
+    global content_safety_service
+    if content_safety_service is None:
+        content_safety_service = ContentSafetyService()
     return content_safety_service
\ No newline at end of file
@@ -16,6 +16,7 @@ from backend.db.models import (
     SocialAudit, Organization
 )
 from backend.services.connection_publisher_service import get_connection_publisher_service
+from backend.services.publish_scheduler import get_publish_scheduler
 
 logger = logging.getLogger(__name__)
 
@@ -234,6 +235,7 @@ class ContentSchedulerService:
                         })
                     else:
                         # Scheduled for later
+                        self._queue_schedule(schedule)
                         results["scheduled_count"] += 1
                         results["results"].append({
                             "connection_id": str(connection.id),
@@ -277,6 +279,14 @@ class ContentSchedulerService:
             results["errors"].append(error_msg)
             return results
     
+    def _queue_schedule(self, schedule: ContentSchedule) -> None:
+        """Hand a scheduled post to the publish scheduler"""
+        try:
+            get_publish_scheduler().schedule(str(schedule.id), schedule.scheduled_for)
+        except Exception as e:
+            # The periodic reconcile picks up posts that missed the queue
+            logger.warning(f"Could not queue schedule {schedule.id} for publishing: {e}")
+    
     async def _create_audit_log(
         self, 
         db: Session, 
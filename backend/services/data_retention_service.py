@@ -11,18 +11,21 @@ from typing import Dict, Any, List, Optional, Tuple
 from dataclasses import dataclass
 from enum import Enum
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, text, func
+from sqlalchemy import or_, text, func
 
 from backend.db.models import (
     User, UserSetting, Metric, ContentLog, Goal, WorkflowExecution,
     Notification, Memory, Content, ContentDraft, ContentSchedule,
     SocialConnection, SocialAudit, UsageRecord, ResearchData,
-    ContentItem, ContentPerformanceSnapshot, SocialPost,
+    ContentItem, ContentPerformanceSnapshot, ContentPerformanceRollup, SocialPost,
     PlatformMetricsSnapshot, SocialInteraction, InteractionResponse,
     RefreshTokenBlacklist
 )
 from backend.db.database import get_db
 from backend.core.config import get_settings
+from backend.services.inbox_counters import subtract_deleted_interactions
+from backend.services.performance_snapshot_store import get_performance_snapshot_store
+from backend.services.retention_executor import RetentionExecutor, RetentionTarget
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
@@ -57,8 +60,10 @@ class RetentionPolicy:
 class DataRetentionService:
     """Service for managing data retention policies and automated cleanup"""
     
-    def __init__(self):
+    def __init__(self, executor: Optional[RetentionExecutor] = None):
         self.retention_policies = self._initialize_retention_policies()
+        self.cleanup_targets = self._initialize_cleanup_targets()
+        self.executor = executor or RetentionExecutor()
         
     def _initialize_retention_policies(self) -> Dict[DataCategory, RetentionPolicy]:
         """Initialize retention policies based on legal and business requirements"""
@@ -198,6 +203,59 @@ class DataRetentionService:
         
         return policies
     
+    def _initialize_cleanup_targets(self) -> Dict[DataCategory, List[RetentionTarget]]:
+        """Tables each category deletes from, in cleanup order"""
+        return {
+            DataCategory.USER_CONTENT: [
+                RetentionTarget("ContentLog", ContentLog, "created_at"),
+                RetentionTarget("ContentDraft", ContentDraft, "created_at"),
+                # Only completed/failed schedules
+                RetentionTarget("ContentSchedule", ContentSchedule, "created_at",
+                                conditions=(ContentSchedule.status.in_(["published", "failed"]),)),
+                RetentionTarget("ContentItem", ContentItem, "created_at"),
+            ],
+            DataCategory.METRICS_DATA: [
+                RetentionTarget("Metric", Metric, "date_recorded"),
+                # Expired monthly partitions are dropped whole, the row delete
+                # only touches what is left
+                RetentionTarget(
+                    "ContentPerformanceSnapshot", ContentPerformanceSnapshot, "snapshot_time",
+                    drop_partitions=lambda db, cutoff: get_performance_snapshot_store().drop_expired_partitions(
+                        db, cutoff, commit=False
+                    )
+                ),
+                RetentionTarget("ContentPerformanceRollup", ContentPerformanceRollup, "bucket_start"),
+                RetentionTarget("PlatformMetricsSnapshot", PlatformMetricsSnapshot, "snapshot_time"),
+            ],
+            DataCategory.AI_GENERATED: [
+                RetentionTarget("Memory", Memory, "created_at"),
+                # AI-generated content (where ai_model is not null)
+                RetentionTarget("AIContent", Content, "created_at", conditions=(Content.ai_model.isnot(None),)),
+            ],
+            DataCategory.SOCIAL_CONNECTIONS: [
+                RetentionTarget("SocialPost", SocialPost, "created_at"),
+                # Bulk deletes skip the ORM hooks that maintain inbox counters
+                RetentionTarget("SocialInteraction", SocialInteraction, "received_at",
+                                before_delete=subtract_deleted_interactions),
+                # Inactive connections only
+                RetentionTarget("SocialConnection", SocialConnection, "created_at",
+                                conditions=(SocialConnection.is_active == False,)),
+            ],
+            DataCategory.WORKFLOW_DATA: [
+                RetentionTarget("WorkflowExecution", WorkflowExecution, "created_at"),
+            ],
+            DataCategory.NOTIFICATIONS: [
+                RetentionTarget("Notification", Notification, "created_at"),
+            ],
+            DataCategory.RESEARCH_DATA: [
+                RetentionTarget("ResearchData", ResearchData, "created_at"),
+            ],
+            DataCategory.SECURITY_DATA: [
+                # Blacklisted refresh tokens
+                RetentionTarget("RefreshTokenBlacklist", RefreshTokenBlacklist, "revoked_at"),
+            ],
+        }
+    
     def get_retention_policy(self, category: DataCategory) -> RetentionPolicy:
         """Get retention policy for a specific data category"""
         return self.retention_policies.get(category)
@@ -244,6 +302,7 @@ class DataRetentionService:
             DataCategory.METRICS_DATA: [
                 (Metric, "date_recorded"),
                 (ContentPerformanceSnapshot, "snapshot_time"),
+                (ContentPerformanceRollup, "bucket_start"),
                 (PlatformMetricsSnapshot, "snapshot_time"),
             ],
             DataCategory.AI_GENERATED: [
@@ -253,7 +312,7 @@ class DataRetentionService:
             DataCategory.SOCIAL_CONNECTIONS: [
                 (SocialConnection, "created_at"),
                 (SocialPost, "created_at"),
-                (SocialInteraction, "created_at"),
+                (SocialInteraction, "received_at"),
             ],
             DataCategory.AUDIT_LOGS: [
                 (SocialAudit, "created_at"),
@@ -325,28 +384,18 @@ class DataRetentionService:
         if not dry_run:
             cutoff_date = datetime.now(timezone.utc) - timedelta(days=policy.retention_days)
             
-            # Map categories to cleanup functions
-            cleanup_functions = {
-                DataCategory.USER_CONTENT: self._cleanup_user_content,
-                DataCategory.METRICS_DATA: self._cleanup_metrics_data,
-                DataCategory.AI_GENERATED: self._cleanup_ai_generated,
-                DataCategory.SOCIAL_CONNECTIONS: self._cleanup_social_connections,
-                DataCategory.WORKFLOW_DATA: self._cleanup_workflow_data,
-                DataCategory.NOTIFICATIONS: self._cleanup_notifications,
-                DataCategory.RESEARCH_DATA: self._cleanup_research_data,
-                DataCategory.SECURITY_DATA: self._cleanup_security_data,
-            }
-            
-            cleanup_function = cleanup_functions.get(category)
-            if cleanup_function:
+            targets = self.cleanup_targets.get(category)
+            if targets:
                 try:
-                    deleted_counts = cleanup_function(db, cutoff_date)
-                    cleanup_results["deleted_counts"] = deleted_counts
-                    cleanup_results["total_deleted"] = sum(deleted_counts.values())
-                    
-                    # Commit changes
-                    db.commit()
-                    logger.info(f"Successfully cleaned up {category.value}: {deleted_counts}")
+                    # Chunks commit as they go; an error or the time budget
+                    # leaves a cursor the next run resumes from
+                    run = self.executor.run(db, category.value, targets, cutoff_date)
+                    cleanup_results["deleted_counts"] = run["deleted_counts"]
+                    cleanup_results["total_deleted"] = sum(run["deleted_counts"].values())
+                    cleanup_results["completed"] = run["completed"]
+                    cleanup_results["partitions_dropped"] = run["partitions_dropped"]
+                    cleanup_results["chunks"] = run["chunks"]
+                    logger.info(f"Successfully cleaned up {category.value}: {run['deleted_counts']}")
                     
                 except Exception as e:
                     db.rollback()
@@ -358,176 +407,6 @@ class DataRetentionService:
         
         return cleanup_results
     
-    def _cleanup_user_content(self, db: Session, cutoff_date: datetime) -> Dict[str, int]:
-        """Clean up expired user content"""
-        deleted_counts = {}
-        
-        # Content logs
-        content_logs = db.query(ContentLog).filter(ContentLog.created_at < cutoff_date)
-        deleted_counts["ContentLog"] = content_logs.count()
-        if deleted_counts["ContentLog"] > 0:
-            content_logs.delete(synchronize_session=False)
-        
-        # Content drafts
-        drafts = db.query(ContentDraft).filter(ContentDraft.created_at < cutoff_date)
-        deleted_counts["ContentDraft"] = drafts.count()
-        if deleted_counts["ContentDraft"] > 0:
-            drafts.delete(synchronize_session=False)
-        
-        # Content schedules (only completed/failed ones)
-        schedules = db.query(ContentSchedule).filter(
-            and_(
-                ContentSchedule.created_at < cutoff_date,
-                ContentSchedule.status.in_(["published", "failed"])
-            )
-        )
-        deleted_counts["ContentSchedule"] = schedules.count()
-        if deleted_counts["ContentSchedule"] > 0:
-            schedules.delete(synchronize_session=False)
-        
-        # Content items
-        content_items = db.query(ContentItem).filter(ContentItem.created_at < cutoff_date)
-        deleted_counts["ContentItem"] = content_items.count()
-        if deleted_counts["ContentItem"] > 0:
-            content_items.delete(synchronize_session=False)
-        
-        return deleted_counts
-    
-    def _cleanup_metrics_data(self, db: Session, cutoff_date: datetime) -> Dict[str, int]:
-        """Clean up expired metrics data"""
-        deleted_counts = {}
-        
-        # Metrics
-        metrics = db.query(Metric).filter(Metric.date_recorded < cutoff_date)
-        deleted_counts["Metric"] = metrics.count()
-        if deleted_counts["Metric"] > 0:
-            metrics.delete(synchronize_session=False)
-        
-        # Performance snapshots
-        perf_snapshots = db.query(ContentPerformanceSnapshot).filter(
-            ContentPerformanceSnapshot.snapshot_time < cutoff_date
-        )
-        deleted_counts["ContentPerformanceSnapshot"] = perf_snapshots.count()
-        if deleted_counts["ContentPerformanceSnapshot"] > 0:
-            perf_snapshots.delete(synchronize_session=False)
-        
-        # Platform metrics snapshots
-        platform_snapshots = db.query(PlatformMetricsSnapshot).filter(
-            PlatformMetricsSnapshot.snapshot_time < cutoff_date
-        )
-        deleted_counts["PlatformMetricsSnapshot"] = platform_snapshots.count()
-        if deleted_counts["PlatformMetricsSnapshot"] > 0:
-            platform_snapshots.delete(synchronize_session=False)
-        
-        return deleted_counts
-    
-    def _cleanup_ai_generated(self, db: Session, cutoff_date: datetime) -> Dict[str, int]:
-        """Clean up expired AI-generated content"""
-        deleted_counts = {}
-        
-        # AI memories
-        memories = db.query(Memory).filter(Memory.created_at < cutoff_date)
-        deleted_counts["Memory"] = memories.count()
-        if deleted_counts["Memory"] > 0:
-            memories.delete(synchronize_session=False)
-        
-        # AI-generated content (where ai_model is not null)
-        ai_content = db.query(Content).filter(
-            and_(
-                Content.created_at < cutoff_date,
-                Content.ai_model.isnot(None)
-            )
-        )
-        deleted_counts["AIContent"] = ai_content.count()
-        if deleted_counts["AIContent"] > 0:
-            ai_content.delete(synchronize_session=False)
-        
-        return deleted_counts
-    
-    def _cleanup_social_connections(self, db: Session, cutoff_date: datetime) -> Dict[str, int]:
-        """Clean up expired social connection data"""
-        deleted_counts = {}
-        
-        # Social posts (old ones)
-        old_posts = db.query(SocialPost).filter(SocialPost.created_at < cutoff_date)
-        deleted_counts["SocialPost"] = old_posts.count()
-        if deleted_counts["SocialPost"] > 0:
-            old_posts.delete(synchronize_session=False)
-        
-        # Social interactions
-        old_interactions = db.query(SocialInteraction).filter(
-            SocialInteraction.created_at < cutoff_date
-        )
-        deleted_counts["SocialInteraction"] = old_interactions.count()
-        if deleted_counts["SocialInteraction"] > 0:
-            old_interactions.delete(synchronize_session=False)
-        
-        # Inactive social connections (connections not used in retention period)
-        inactive_connections = db.query(SocialConnection).filter(
-            and_(
-                SocialConnection.created_at < cutoff_date,
-                SocialConnection.is_active == False
-            )
-        )
-        deleted_counts["SocialConnection"] = inactive_connections.count()
-        if deleted_counts["SocialConnection"] > 0:
-            inactive_connections.delete(synchronize_session=False)
-        
-        return deleted_counts
-    
-    def _cleanup_workflow_data(self, db: Session, cutoff_date: datetime) -> Dict[str, int]:
-        """Clean up expired workflow execution data"""
-        deleted_counts = {}
-        
-        workflow_executions = db.query(WorkflowExecution).filter(
-            WorkflowExecution.created_at < cutoff_date
-        )
-        deleted_counts["WorkflowExecution"] = workflow_executions.count()
-        if deleted_counts["WorkflowExecution"] > 0:
-            workflow_executions.delete(synchronize_session=False)
-        
-        return deleted_counts
-    
-    def _cleanup_notifications(self, db: Session, cutoff_date: datetime) -> Dict[str, int]:
-        """Clean up expired notifications"""
-        deleted_counts = {}
-        
-        notifications = db.query(Notification).filter(
-            Notification.created_at < cutoff_date
-        )
-        deleted_counts["Notification"] = notifications.count()
-        if deleted_counts["Notification"] > 0:
-            notifications.delete(synchronize_session=False)
-        
-        return deleted_counts
-    
-    def _cleanup_research_data(self, db: Session, cutoff_date: datetime) -> Dict[str, int]:
-        """Clean up expired research data"""
-        deleted_counts = {}
-        
-        research_data = db.query(ResearchData).filter(
-            ResearchData.created_at < cutoff_date
-        )
-        deleted_counts["ResearchData"] = research_data.count()
-        if deleted_counts["ResearchData"] > 0:
-            research_data.delete(synchronize_session=False)
-        
-        return deleted_counts
-    
-    def _cleanup_security_data(self, db: Session, cutoff_date: datetime) -> Dict[str, int]:
-        """Clean up expired security data"""
-        deleted_counts = {}
-        
-        # Blacklisted refresh tokens
-        blacklisted_tokens = db.query(RefreshTokenBlacklist).filter(
-            RefreshTokenBlacklist.revoked_at < cutoff_date
-        )
-        deleted_counts["RefreshTokenBlacklist"] = blacklisted_tokens.count()
-        if deleted_counts["RefreshTokenBlacklist"] > 0:
-            blacklisted_tokens.delete(synchronize_session=False)
-        
-        return deleted_counts
-    
     def generate_retention_report(self, db: Session) -> Dict[str, Any]:
         """Generate comprehensive data retention report"""
         report = {
@@ -557,6 +436,7 @@ class DataRetentionService:
                 total_expired += sum(expired_counts.values())
         
         report["total_expired_records"] = total_expired
+        report["cleanup_in_progress"] = self.executor.get_progress(db)
         
         # Generate recommendations
         if total_expired > 1000:
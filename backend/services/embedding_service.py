@@ -11,19 +11,21 @@ import hashlib
 from dataclasses import dataclass
 from concurrent.futures import ThreadPoolExecutor
 
-from openai import OpenAI, AsyncOpenAI
-# OpenAI v1.x has different error structure - using base exceptions
-try:
-    from openai import RateLimitError, APIError
-except ImportError:
-    # Fallback for compatibility
-    RateLimitError = Exception
-    APIError = Exception
-
 from backend.core.config import get_settings
+from backend.core.lazy_imports import lazy_import
 from backend.core.vector_store import vector_store
 from backend.core.embedding_validation import get_embedding_validator, EmbeddingValidationResult
 from backend.core.monitoring import monitoring_service
+from backend.services.near_duplicate_index import (
+    NearDuplicateMatch,
+    content_scope,
+    get_near_duplicate_index,
+    hamming_distance,
+    simhash,
+)
+
+# OpenAI v1.x error classes (openai.RateLimitError, openai.APIError), imported when first handled
+openai = lazy_import("openai")
 
 # Get logger (use application's logging configuration)
 logger = logging.getLogger(__name__)
@@ -56,6 +58,8 @@ class EmbeddingService:
     
     def __init__(self):
         """Initialize the embedding service"""
+        # Imported here: the singleton is built on first use, so importing this module stays cheap
+        from openai import OpenAI, AsyncOpenAI
         self.openai_client = OpenAI(api_key=settings.openai_api_key)
         self.async_client = AsyncOpenAI(api_key=settings.openai_api_key)
         self.model_name = "text-embedding-3-large"
@@ -72,6 +76,10 @@ class EmbeddingService:
         # Initialize embedding validator
         self.validator = get_embedding_validator()
         
+        # SimHash pre-check so reworded duplicates are not embedded again
+        self.near_duplicates = get_near_duplicate_index()
+        self._near_duplicates_loaded = False
+        
         logger.info(f"EmbeddingService initialized with model {self.model_name} and dimension validation")
     
     def _preprocess_text(self, text: str) -> str:
@@ -220,12 +228,12 @@ class EmbeddingService:
                         logger.error(f"Validation issues: {', '.join(validation_result.issues)}")
                     return None
                     
-            except RateLimitError as e:
+            except openai.RateLimitError as e:
                 wait_time = self.base_delay * (2 ** attempt)
                 logger.warning(f"Rate limit hit, waiting {wait_time}s (attempt {attempt + 1})")
                 await asyncio.sleep(wait_time)
                 
-            except APIError as e:
+            except openai.APIError as e:
                 logger.error(f"OpenAI API error: {e}")
                 if attempt == self.max_retries - 1:
                     return None
@@ -394,11 +402,73 @@ class EmbeddingService:
             logger.error(f"Error processing batch: {e}")
             return [None] * len(texts)
     
+    def _load_near_duplicates(self) -> None:
+        """Fingerprint content already in the vector store, once per process"""
+        if self._near_duplicates_loaded:
+            return
+        self._near_duplicates_loaded = True
+        
+        try:
+            loaded = 0
+            for content_id, metadata in vector_store.iter_metadata():
+                if content_id and metadata.get('content'):
+                    self.near_duplicates.add(content_id, metadata['content'], content_scope(metadata))
+                    loaded += 1
+            logger.info(f"Near-duplicate index loaded with {loaded} stored items")
+        except Exception as e:
+            logger.warning(f"Could not load near-duplicate index from vector store: {e}")
+    
+    def find_near_duplicate(
+        self,
+        content: str,
+        metadata: Optional[Dict[str, Any]] = None,
+        fingerprint: Optional[int] = None
+    ) -> Optional[NearDuplicateMatch]:
+        """
+        Closest stored near-duplicate of the content in the same organization
+        
+        Args:
+            content: Text content
+            metadata: Metadata carrying organization_id or user_id
+            fingerprint: Precomputed SimHash of the content
+            
+        Returns:
+            NearDuplicateMatch or None
+        """
+        self._load_near_duplicates()
+        matches = self.near_duplicates.find_near_duplicates(
+            content, content_scope(metadata), fingerprint=fingerprint
+        )
+        return matches[0] if matches else None
+    
+    def _near_duplicate_result(
+        self,
+        content: str,
+        metadata: Dict[str, Any],
+        match: NearDuplicateMatch,
+        start_time: float
+    ) -> EmbeddingResult:
+        """Result for content skipped because a near-duplicate is already stored"""
+        logger.info(f"Skipping embedding: near-duplicate of {match.item_id} ({match.distance} bits apart)")
+        return EmbeddingResult(
+            content_id=match.item_id,
+            content=content,
+            embedding=None,
+            metadata={
+                **metadata,
+                'near_duplicate_of': match.item_id,
+                'near_duplicate_similarity': match.similarity
+            },
+            success=True,
+            processing_time=time.time() - start_time
+        )
+    
     def store_content_with_embedding(
         self,
         content: str,
         metadata: Dict[str, Any],
-        content_id: Optional[str] = None
+        content_id: Optional[str] = None,
+        skip_near_duplicates: bool = True
     ) -> EmbeddingResult:
         """
         Create embedding and store content in vector store
@@ -407,9 +477,12 @@ class EmbeddingService:
             content: Text content
             metadata: Associated metadata
             content_id: Optional custom content ID
+            skip_near_duplicates: Return the stored near-duplicate instead of
+                embedding reworded copies of existing content
             
         Returns:
-            EmbeddingResult with operation details
+            EmbeddingResult with operation details; for a skipped near-duplicate,
+            success with the existing content_id and no embedding
         """
         start_time = time.time()
         
@@ -418,6 +491,12 @@ class EmbeddingService:
             if not content_id:
                 content_id = self._generate_content_id(content, metadata)
             
+            fingerprint = simhash(content)
+            if skip_near_duplicates:
+                match = self.find_near_duplicate(content, metadata, fingerprint)
+                if match and match.item_id != content_id:
+                    return self._near_duplicate_result(content, metadata, match, start_time)
+            
             # Create embedding
             embedding = self.create_embedding_sync(content)
             
@@ -447,6 +526,7 @@ class EmbeddingService:
                 processing_time = time.time() - start_time
                 
                 if success:
+                    self.near_duplicates.add(content_id, content, content_scope(metadata), fingerprint)
                     logger.info(f"Successfully stored content {content_id} with embedding")
                     return EmbeddingResult(
                         content_id=content_id,
@@ -493,7 +573,8 @@ class EmbeddingService:
         self,
         contents: List[str],
         metadata_list: List[Dict[str, Any]],
-        content_ids: Optional[List[str]] = None
+        content_ids: Optional[List[str]] = None,
+        skip_near_duplicates: bool = True
     ) -> List[EmbeddingResult]:
         """
         Store multiple content items with embeddings efficiently
@@ -502,9 +583,11 @@ class EmbeddingService:
             contents: List of text contents
             metadata_list: List of metadata dictionaries
             content_ids: Optional list of content IDs
+            skip_near_duplicates: Skip items that are near-duplicates of stored
+                content or of an earlier item in the batch
             
         Returns:
-            List of EmbeddingResults
+            List of EmbeddingResults, in input order
         """
         if len(contents) != len(metadata_list):
             raise ValueError("Contents and metadata lists must have same length")
@@ -518,13 +601,39 @@ class EmbeddingService:
                 for content, metadata in zip(contents, metadata_list)
             ]
         
-        # Create embeddings in batch
-        embeddings = await self.create_batch_embeddings(contents)
+        # Near-duplicates of stored content or of earlier batch items are not embedded
+        fingerprints = [simhash(content) for content in contents]
+        skipped: Dict[int, EmbeddingResult] = {}
+        if skip_near_duplicates:
+            pending = {}
+            for i, (content, metadata, content_id, fingerprint) in enumerate(
+                zip(contents, metadata_list, content_ids, fingerprints)
+            ):
+                match = self.find_near_duplicate(content, metadata, fingerprint)
+                # Word-less items have no fingerprint and match nothing
+                if match is None and fingerprint:
+                    scope = content_scope(metadata)
+                    for other_id, (other_scope, other_fingerprint) in pending.items():
+                        distance = hamming_distance(fingerprint, other_fingerprint)
+                        if other_scope == scope and distance <= self.near_duplicates.max_distance:
+                            match = NearDuplicateMatch(other_id, distance)
+                            break
+                if match and match.item_id != content_id:
+                    skipped[i] = self._near_duplicate_result(content, metadata, match, start_time)
+                else:
+                    pending[content_id] = (content_scope(metadata), fingerprint)
+        
+        to_embed = [i for i in range(len(contents)) if i not in skipped]
+        batch_embeddings = await self.create_batch_embeddings([contents[i] for i in to_embed]) if to_embed else []
+        embeddings = [None] * len(contents)
+        for i, embedding in zip(to_embed, batch_embeddings):
+            embeddings[i] = embedding
         
         results = []
         valid_vectors = []
         valid_ids = []
         valid_metadata = []
+        valid_indexes = []
         
         # Process results and prepare for batch storage
         for i, (content, metadata, embedding, content_id) in enumerate(
@@ -532,6 +641,10 @@ class EmbeddingService:
         ):
             processing_time = time.time() - start_time
             
+            if i in skipped:
+                results.append(skipped[i])
+                continue
+            
             if embedding is not None:
                 # Enhance metadata
                 enhanced_metadata = {
@@ -546,6 +659,7 @@ class EmbeddingService:
                 valid_vectors.append(embedding)
                 valid_ids.append(content_id)
                 valid_metadata.append(enhanced_metadata)
+                valid_indexes.append(i)
                 
                 results.append(EmbeddingResult(
                     content_id=content_id,
@@ -581,11 +695,16 @@ class EmbeddingService:
                 success = False
             
             if success:
+                for i in valid_indexes:
+                    self.near_duplicates.add(
+                        content_ids[i], contents[i], content_scope(metadata_list[i]), fingerprints[i]
+                    )
                 logger.info(f"Successfully stored {len(valid_vectors)} content items")
             else:
                 logger.error("Failed to store embeddings in vector store")
                 # Update results to reflect storage failure
-                for result in results:
+                for i in valid_indexes:
+                    result = results[i]
                     if result.success:
                         result.success = False
                         result.error = "Failed to store in vector store"
@@ -3,18 +3,23 @@ File Upload Service
 
 Production-ready file upload service with security validation,
 storage management, and image processing capabilities.
+
+Uploads are ingested in a single streaming pass: every chunk is hashed,
+size-checked and written to the storage backend as it arrives, while the
+leading bytes are used to sniff the real file type and to decode the image
+header. Memory per upload is bounded by the chunk size, not the file size.
 """
+import io
 import os
 import uuid
 import hashlib
 import logging
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, BinaryIO, Tuple
 from datetime import datetime, timezone
 
 from fastapi import HTTPException, UploadFile
 from PIL import Image
-import filetype
 
 # Try to import python-magic, but don't fail if not available
 try:
@@ -32,13 +37,144 @@ from sqlalchemy.orm import Session
 settings = get_settings()
 logger = logging.getLogger(__name__)
 
+# Size of each chunk read from the upload stream
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+# Upper bound on leading bytes buffered to decode the image header.
+# JPEG headers may sit behind large EXIF/ICC segments, so allow some room.
+MAX_HEADER_PROBE_BYTES = 256 * 1024
+
+# Magic byte signatures of the image formats we accept
+IMAGE_SIGNATURES = (
+    (b"\xff\xd8\xff", "image/jpeg"),
+    (b"\x89PNG\r\n\x1a\n", "image/png"),
+    (b"GIF87a", "image/gif"),
+    (b"GIF89a", "image/gif"),
+)
+
+ALLOWED_MIME_TYPES = {
+    'jpg': 'image/jpeg',
+    'jpeg': 'image/jpeg',
+    'png': 'image/png',
+    'gif': 'image/gif',
+    'webp': 'image/webp'
+}
+
+
+def sniff_image_mime(header: bytes) -> Optional[str]:
+    """
+    Detect the MIME type of an image from its leading bytes.
+
+    Args:
+        header: First bytes of the file (at least 12 for WebP detection)
+
+    Returns:
+        Detected MIME type, or None if the content is not recognised
+    """
+    for signature, mime_type in IMAGE_SIGNATURES:
+        if header.startswith(signature):
+            return mime_type
+
+    if len(header) >= 12 and header[:4] == b"RIFF" and header[8:12] == b"WEBP":
+        return "image/webp"
+
+    if HAS_MAGIC:
+        try:
+            return magic.from_buffer(header, mime=True)
+        except Exception:
+            return None
+
+    return None
+
+
+class ImageHeaderProbe:
+    """
+    Lazily decodes image dimensions from the leading bytes of a stream.
+
+    PIL's ``Image.open`` only parses the header and never allocates the
+    pixel buffer, so feeding it the first chunks is enough to read the size,
+    format and mode without decoding the image.
+    """
+
+    def __init__(self, max_bytes: int = MAX_HEADER_PROBE_BYTES):
+        self.max_bytes = max_bytes
+        self._buffer = bytearray()
+        self.metadata: Optional[Dict[str, Any]] = None
+        self.error: Optional[str] = None
+
+    @property
+    def done(self) -> bool:
+        return self.metadata is not None or self.error is not None
+
+    def feed(self, chunk: bytes) -> None:
+        """Feed the next chunk of the stream until the header is decoded"""
+        if self.done:
+            return
+
+        self._buffer.extend(chunk[:self.max_bytes - len(self._buffer)])
+        try:
+            with Image.open(io.BytesIO(self._buffer)) as img:
+                self.metadata = {
+                    'width': img.size[0],
+                    'height': img.size[1],
+                    'format': img.format,
+                    'mode': img.mode,
+                }
+        except Exception as e:
+            if len(self._buffer) >= self.max_bytes:
+                self.error = str(e) or "unable to decode image header"
+        else:
+            # Header decoded, release the buffered bytes
+            self._buffer = bytearray()
+
+    def finish(self) -> Dict[str, Any]:
+        """Return decoded header metadata once the stream has ended"""
+        if self.metadata is None:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Invalid image file: {self.error or 'unable to decode image header'}"
+            )
+        return self.metadata
+
+
+class LocalUploadStorage:
+    """
+    Local filesystem storage backend for uploaded images.
+
+    Writes go to a temporary file that is atomically renamed into place on
+    commit, so partially-streamed uploads never become visible.
+    """
+
+    def __init__(self, images_dir: Path, temp_dir: Path):
+        self.images_dir = images_dir
+        self.temp_dir = temp_dir
+
+    def open_temp(self) -> Tuple[Path, BinaryIO]:
+        """Open a new temporary file for streaming writes"""
+        temp_path = self.temp_dir / f"temp_{uuid.uuid4()}.tmp"
+        return temp_path, open(temp_path, "wb")
+
+    def commit(self, temp_path: Path, filename: str) -> None:
+        """Move a fully written temporary file to its final name"""
+        os.replace(temp_path, self.images_dir / filename)
+
+    def discard(self, temp_path: Path) -> None:
+        """Remove a temporary file if it still exists"""
+        if temp_path.exists():
+            temp_path.unlink()
+
+    def exists(self, filename: str) -> bool:
+        """Check whether a stored image exists"""
+        return (self.images_dir / filename).is_file()
+
+
 class FileUploadService:
     """
     Secure file upload service with validation, storage management,
     and image processing capabilities.
     """
     
-    def __init__(self):
+    def __init__(self, storage: Optional[LocalUploadStorage] = None):
         self.upload_dir = Path(settings.upload_dir)
         self.max_file_size = settings.max_file_size
         self.allowed_extensions = settings.allowed_image_types.split(',')
@@ -49,6 +185,8 @@ class FileUploadService:
         
         # Ensure directories exist
         self._ensure_directories()
+        
+        self.storage = storage or LocalUploadStorage(self.images_dir, self.temp_dir)
     
     def _ensure_directories(self) -> None:
         """Ensure upload directories exist with proper permissions"""
@@ -67,102 +205,68 @@ class FileUploadService:
                 detail=f"File too large. Maximum size allowed: {self.max_file_size / (1024*1024):.1f}MB"
             )
     
-    def _validate_file_type(self, file_path: Path, original_filename: str) -> str:
+    def _validate_extension(self, original_filename: str) -> str:
         """
-        Validate file type using multiple methods for security.
+        Validate the declared file extension before reading any content.
         Returns the validated file extension.
         """
-        # Method 1: Use python-magic to detect actual file type (if available)
-        file_type = None
-        if HAS_MAGIC:
-            try:
-                file_type = magic.from_file(str(file_path), mime=True)
-            except Exception:
-                file_type = None
-        
-        # Method 2: Use filetype library as backup
-        try:
-            kind = filetype.guess(str(file_path))
-            filetype_ext = kind.extension if kind else None
-        except Exception:
-            filetype_ext = None
-        
-        # Method 3: Check file extension
         file_ext = original_filename.lower().split('.')[-1] if '.' in original_filename else ''
         
-        # Validate against allowed image types
-        allowed_mime_types = {
-            'jpg': 'image/jpeg',
-            'jpeg': 'image/jpeg', 
-            'png': 'image/png',
-            'gif': 'image/gif',
-            'webp': 'image/webp'
-        }
-        
-        # Check if extension is allowed
         if file_ext not in self.allowed_extensions:
             raise HTTPException(
                 status_code=400,
                 detail=f"File type not allowed. Allowed types: {', '.join(self.allowed_extensions)}"
             )
         
-        # Verify MIME type matches extension (security check) - only if magic is available
-        expected_mime = allowed_mime_types.get(file_ext)
-        if HAS_MAGIC and expected_mime and file_type and not file_type.startswith(expected_mime.split('/')[0]):
+        return file_ext
+    
+    def _validate_file_type(self, header: bytes, file_ext: str) -> str:
+        """
+        Validate the sniffed content type against the declared extension.
+        Returns the detected MIME type.
+        """
+        detected_mime = sniff_image_mime(header)
+        
+        if not detected_mime or not detected_mime.startswith("image/"):
+            raise HTTPException(
+                status_code=400,
+                detail="Invalid image file: unrecognised file content"
+            )
+        
+        # Verify MIME type matches extension (security check)
+        expected_mime = ALLOWED_MIME_TYPES.get(file_ext)
+        if expected_mime and not detected_mime.startswith(expected_mime.split('/')[0]):
             raise HTTPException(
                 status_code=400,
                 detail="File content doesn't match extension"
             )
         
-        return file_ext
+        return detected_mime
     
-    def _validate_image(self, file_path: Path) -> Dict[str, Any]:
+    def _validate_image(self, metadata: Dict[str, Any]) -> Dict[str, Any]:
         """
-        Validate and get image information using PIL.
+        Validate image dimensions decoded from the header.
         Returns image metadata.
         """
-        try:
-            with Image.open(file_path) as img:
-                # Check if image can be opened (validates it's a real image)
-                img.verify()
-                
-                # Reopen for metadata (verify() closes the image)
-                with Image.open(file_path) as img:
-                    width, height = img.size
-                    format_name = img.format
-                    mode = img.mode
-                    
-                    # Basic size validation (prevent extremely large images)
-                    max_dimension = 8192  # 8K max
-                    if width > max_dimension or height > max_dimension:
-                        raise HTTPException(
-                            status_code=400,
-                            detail=f"Image dimensions too large. Max: {max_dimension}x{max_dimension}px"
-                        )
-                    
-                    # Minimum size validation
-                    min_dimension = 50
-                    if width < min_dimension or height < min_dimension:
-                        raise HTTPException(
-                            status_code=400,
-                            detail=f"Image too small. Min: {min_dimension}x{min_dimension}px"
-                        )
-                    
-                    return {
-                        'width': width,
-                        'height': height,
-                        'format': format_name,
-                        'mode': mode,
-                        'file_size': file_path.stat().st_size
-                    }
-                    
-        except HTTPException:
-            raise
-        except Exception as e:
+        width, height = metadata['width'], metadata['height']
+        
+        # Basic size validation (prevent extremely large images)
+        max_dimension = 8192  # 8K max
+        if width > max_dimension or height > max_dimension:
             raise HTTPException(
                 status_code=400,
-                detail=f"Invalid image file: {str(e)}"
+                detail=f"Image dimensions too large. Max: {max_dimension}x{max_dimension}px"
             )
+        
+        # Minimum size validation
+        min_dimension = 50
+        if width < min_dimension or height < min_dimension:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Image too small. Min: {min_dimension}x{min_dimension}px"
+            )
+        
+        return metadata
     
     def _generate_secure_filename(self, original_filename: str, file_ext: str) -> str:
         """Generate a secure, unique filename"""
@@ -176,13 +280,76 @@ class FileUploadService:
         
         return f"{timestamp}_{unique_id}_{base_name}.{file_ext}"
     
-    def _calculate_file_hash(self, file_path: Path) -> str:
-        """Calculate SHA-256 hash of file for duplicate detection"""
+    async def _stream_to_storage(self, file: UploadFile, file_ext: str) -> Dict[str, Any]:
+        """
+        Stream the upload into storage in a single pass.
+        
+        Each chunk is hashed, counted against the size limit and written to a
+        temporary file in the storage backend; the first chunks are also used
+        to sniff the file type and decode the image header.
+        
+        Returns:
+            Dictionary with temp_path, size, file_hash, mime_type and metadata
+        """
         hash_sha256 = hashlib.sha256()
-        with open(file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                hash_sha256.update(chunk)
-        return hash_sha256.hexdigest()
+        probe = ImageHeaderProbe()
+        total_size = 0
+        mime_type = None
+        header_checked = False
+        completed = False
+        
+        temp_path, temp_file = self.storage.open_temp()
+        try:
+            with temp_file:
+                while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                    total_size += len(chunk)
+                    if total_size > self.max_file_size:
+                        raise HTTPException(
+                            status_code=413,
+                            detail=f"File too large. Maximum size: {self.max_file_size / (1024*1024):.1f}MB"
+                        )
+                    
+                    if mime_type is None:
+                        mime_type = self._validate_file_type(chunk[:32], file_ext)
+                    
+                    probe.feed(chunk)
+                    if probe.metadata is not None and not header_checked:
+                        # Reject bad dimensions before streaming the rest
+                        self._validate_image(probe.metadata)
+                        header_checked = True
+                    
+                    hash_sha256.update(chunk)
+                    temp_file.write(chunk)
+            
+            if mime_type is None:
+                raise HTTPException(status_code=400, detail="Empty file uploaded")
+            
+            metadata = self._validate_image(probe.finish())
+            metadata['file_size'] = total_size
+            completed = True
+        finally:
+            if not completed:
+                self.storage.discard(temp_path)
+        
+        return {
+            "temp_path": temp_path,
+            "size": total_size,
+            "file_hash": hash_sha256.hexdigest(),
+            "mime_type": mime_type,
+            "metadata": metadata,
+        }
+    
+    def _find_duplicate(self, db: Session, user_id: str, file_hash: str) -> Optional[ContentItem]:
+        """Find a previously stored upload of the same content for this user"""
+        existing = db.query(ContentItem).filter(
+            ContentItem.user_id == user_id,
+            ContentItem.platform == "upload",
+            ContentItem.content_hash == file_hash
+        ).first()
+        
+        if existing and self.storage.exists(existing.content.rsplit('/', 1)[-1]):
+            return existing
+        return None
     
     async def upload_image(
         self, 
@@ -193,6 +360,9 @@ class FileUploadService:
         """
         Upload and process an image file with full validation.
         
+        The file is read exactly once. Content already uploaded by the same
+        user is detected by its SHA-256 and returned without being rewritten.
+        
         Args:
             file: The uploaded file
             user_id: ID of the user uploading the file
@@ -202,44 +372,59 @@ class FileUploadService:
             Dictionary with file information and metadata
         """
         
-        # Validate file size first
+        # Cheap checks that need no file content
         self._validate_file_size(file)
+        file_ext = self._validate_extension(file.filename or "unknown")
         
-        # Generate temporary filename
-        temp_filename = f"temp_{uuid.uuid4()}.tmp"
-        temp_path = self.temp_dir / temp_filename
+        try:
+            ingested = await self._stream_to_storage(file, file_ext)
+        except HTTPException:
+            raise
+        except Exception as e:
+            logger.error(f"File upload failed: {e}")
+            raise HTTPException(
+                status_code=500,
+                detail="File upload failed due to server error"
+            )
+        
+        temp_path = ingested["temp_path"]
+        total_size = ingested["size"]
+        file_hash = ingested["file_hash"]
+        image_metadata = ingested["metadata"]
         
+        db = None
         try:
-            # Stream file to temporary location with size check
-            total_size = 0
-            with open(temp_path, "wb") as temp_file:
-                while chunk := await file.read(8192):  # Read in 8KB chunks
-                    total_size += len(chunk)
-                    if total_size > self.max_file_size:
-                        raise HTTPException(
-                            status_code=413,
-                            detail=f"File too large. Maximum size: {self.max_file_size / (1024*1024):.1f}MB"
-                        )
-                    temp_file.write(chunk)
-            
-            # Reset file position for any further operations
-            await file.seek(0)
-            
-            # Validate file type and get extension
-            file_ext = self._validate_file_type(temp_path, file.filename or "unknown")
-            
-            # Validate image and get metadata
-            image_metadata = self._validate_image(temp_path)
+            try:
+                db = next(get_db())
+                duplicate = self._find_duplicate(db, user_id, file_hash)
+            except Exception as e:
+                logger.warning(f"Duplicate lookup failed for upload: {e}")
+                duplicate = None
             
-            # Calculate file hash
-            file_hash = self._calculate_file_hash(temp_path)
+            if duplicate:
+                self.storage.discard(temp_path)
+                relative_path = duplicate.content.replace("/api/files/", "", 1)
+                logger.info(f"Duplicate upload {file_hash[:12]} for user {user_id}, reusing ContentItem {duplicate.id}")
+                return {
+                    "id": str(uuid.uuid4()),
+                    "filename": relative_path.rsplit('/', 1)[-1],
+                    "original_filename": file.filename,
+                    "path": relative_path,
+                    "url": duplicate.content,
+                    "size": total_size,
+                    "content_type": file.content_type,
+                    "file_hash": file_hash,
+                    "user_id": user_id,
+                    "description": description,
+                    "metadata": image_metadata,
+                    "uploaded_at": datetime.now(timezone.utc).isoformat(),
+                    "status": "duplicate",
+                    "content_item_id": duplicate.id
+                }
             
-            # Generate secure final filename
+            # Generate secure final filename and publish the streamed file
             final_filename = self._generate_secure_filename(file.filename or "image", file_ext)
-            final_path = self.images_dir / final_filename
-            
-            # Move from temp to final location
-            temp_path.rename(final_path)
+            self.storage.commit(temp_path, final_filename)
             
             # Generate relative URL path for serving
             relative_path = f"uploads/images/{final_filename}"
@@ -263,7 +448,8 @@ class FileUploadService:
             
             # Create ContentItem for the uploaded image
             try:
-                db = next(get_db())
+                if db is None:
+                    db = next(get_db())
                 content_item = ContentItem(
                     user_id=user_id,
                     content=f"/api/files/{relative_path}",  # Store file URL as content
@@ -277,6 +463,7 @@ class FileUploadService:
                         "original_filename": file.filename,
                         "size_bytes": total_size,
                         "content_type": file.content_type,
+                        "detected_mime_type": ingested["mime_type"],
                         "image_metadata": image_metadata,
                         "source": "user_upload"
                     }
@@ -288,28 +475,21 @@ class FileUploadService:
             except Exception as e:
                 logger.warning(f"Failed to create ContentItem for upload: {e}")
                 # Don't fail the upload if ContentItem creation fails
-            finally:
-                if 'db' in locals():
-                    db.close()
             
             logger.info(f"Image uploaded successfully: {final_filename} ({total_size} bytes) for user {user_id}")
             
             return file_info
             
-        except HTTPException:
-            # Clean up temp file on HTTP exceptions
-            if temp_path.exists():
-                temp_path.unlink()
-            raise
         except Exception as e:
-            # Clean up temp file on any other exception
-            if temp_path.exists():
-                temp_path.unlink()
+            self.storage.discard(temp_path)
             logger.error(f"File upload failed: {e}")
             raise HTTPException(
                 status_code=500,
                 detail="File upload failed due to server error"
             )
+        finally:
+            if db is not None:
+                db.close()
     
     def delete_image(self, filename: str, user_id: str) -> bool:
         """
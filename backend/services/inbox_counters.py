@@ -0,0 +1,356 @@
+"""
+Social inbox counters and keyset listing
+
+Inbox badges and totals are read from social_inbox_counters instead of
+COUNT(*) over social_interactions. Counters are maintained from the ORM
+flush that inserts, updates or deletes an interaction (the Session hooks
+are registered in backend.db.models), in the same transaction, so they
+commit or roll back with it. Bulk Query.update()/
+delete() calls bypass the ORM: bulk deletes call
+subtract_deleted_interactions() for the rows first, anything else must be
+followed by rebuild_inbox_counters() for the affected organization.
+
+Listing uses keyset pagination over (priority_score, received_at, id),
+matching idx_social_interaction_org_inbox / _org_status_inbox.
+"""
+
+import base64
+import binascii
+import json
+import logging
+from collections import defaultdict
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import and_, case, delete, func, insert, inspect, literal, select, tuple_
+from sqlalchemy.orm import Session
+
+from backend.db.models import (
+    SOCIAL_INBOX_COUNTER_FIELDS,
+    SocialInboxCounter,
+    SocialInteraction,
+    SocialPlatformConnection,
+)
+
+logger = logging.getLogger(__name__)
+
+HIGH_PRIORITY_THRESHOLD = 70
+HIGH_PRIORITY_STATUSES = ("unread", "read")
+ORG_WIDE_USER_ID = 0
+
+# Interaction attributes that determine which counter row it belongs to
+COUNTER_FIELDS = SOCIAL_INBOX_COUNTER_FIELDS
+
+CounterKey = Tuple[str, int, str, str, bool]
+
+
+def _counter_key(values: Dict[str, Any]) -> Optional[CounterKey]:
+    """Counter row key for interaction values, None if not org-scoped"""
+    if not values["organization_id"]:
+        return None
+    return (
+        str(values["organization_id"]),
+        values["user_id"],
+        values["platform"],
+        values["status"] or "unread",
+        (values["priority_score"] or 0) >= HIGH_PRIORITY_THRESHOLD
+    )
+
+
+def _current_values(interaction: SocialInteraction) -> Dict[str, Any]:
+    return {field: getattr(interaction, field) for field in COUNTER_FIELDS}
+
+
+def _previous_values(interaction: SocialInteraction) -> Dict[str, Any]:
+    """Values as of the last flush, from attribute history"""
+    state = inspect(interaction)
+    values = {}
+    for field in COUNTER_FIELDS:
+        history = state.attrs[field].history
+        if history.deleted:
+            values[field] = history.deleted[0]
+        elif history.unchanged:
+            values[field] = history.unchanged[0]
+        else:
+            values[field] = getattr(interaction, field)
+    return values
+
+
+def _add_delta(deltas: Dict[CounterKey, int], key: Optional[CounterKey], amount: int) -> None:
+    if key is None:
+        return
+    organization_id, user_id, platform, status, high_priority = key
+    deltas[key] += amount
+    deltas[(organization_id, ORG_WIDE_USER_ID, platform, status, high_priority)] += amount
+
+
+def collect_counter_deltas(session: Session) -> Dict[CounterKey, int]:
+    """Counter changes implied by the session's pending interaction changes"""
+    deltas: Dict[CounterKey, int] = defaultdict(int)
+
+    for obj in session.new:
+        if isinstance(obj, SocialInteraction):
+            _add_delta(deltas, _counter_key(_current_values(obj)), 1)
+
+    for obj in session.deleted:
+        if isinstance(obj, SocialInteraction):
+            _add_delta(deltas, _counter_key(_previous_values(obj)), -1)
+
+    for obj in session.dirty:
+        if not isinstance(obj, SocialInteraction) or obj in session.deleted:
+            continue
+        previous = _counter_key(_previous_values(obj))
+        current = _counter_key(_current_values(obj))
+        if previous != current:
+            _add_delta(deltas, previous, -1)
+            _add_delta(deltas, current, 1)
+
+    return {key: amount for key, amount in deltas.items() if amount}
+
+
+def apply_counter_deltas(connection, deltas: Dict[CounterKey, int]) -> None:
+    """Add deltas to counter rows, creating missing rows"""
+    if not deltas:
+        return
+
+    rows = [
+        {
+            "organization_id": organization_id,
+            "user_id": user_id,
+            "platform": platform,
+            "status": status,
+            "is_high_priority": high_priority,
+            "count": amount
+        }
+        for (organization_id, user_id, platform, status, high_priority), amount in sorted(deltas.items())
+    ]
+    table = SocialInboxCounter.__table__
+
+    dialect = connection.dialect.name
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert as dialect_insert
+    elif dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert as dialect_insert
+    else:
+        for row in rows:
+            key_filter = and_(*(table.c[column] == row[column] for column in row if column != "count"))
+            updated = connection.execute(
+                table.update().where(key_filter).values(count=table.c.count + row["count"])
+            )
+            if not updated.rowcount:
+                connection.execute(table.insert().values(**row))
+        return
+
+    statement = dialect_insert(table).values(rows)
+    statement = statement.on_conflict_do_update(
+        index_elements=["organization_id", "user_id", "platform", "status", "is_high_priority"],
+        set_={"count": table.c.count + statement.excluded.count}
+    )
+    connection.execute(statement)
+
+
+def subtract_deleted_interactions(db: Session, interaction_ids: List[str]) -> None:
+    """
+    Decrement counters for interactions about to be bulk-deleted (no commit)
+
+    Args:
+        db: Database session; run in the same transaction as the delete
+        interaction_ids: Interactions the caller is deleting
+    """
+    if not interaction_ids:
+        return
+    columns = [getattr(SocialInteraction, field) for field in COUNTER_FIELDS]
+    rows = db.query(*columns, func.count()).filter(
+        SocialInteraction.id.in_(interaction_ids),
+        SocialInteraction.organization_id.isnot(None)
+    ).group_by(*columns).all()
+
+    deltas: Dict[CounterKey, int] = defaultdict(int)
+    for row in rows:
+        _add_delta(deltas, _counter_key(dict(zip(COUNTER_FIELDS, row))), -row[-1])
+    apply_counter_deltas(db.connection(), {key: amount for key, amount in deltas.items() if amount})
+
+
+def fill_interaction_organization(session: Session) -> None:
+    """Copy organization_id from the connection for interactions created without it"""
+    pending = [
+        obj for obj in session.new
+        if isinstance(obj, SocialInteraction) and obj.organization_id is None and obj.connection_id is not None
+    ]
+    if not pending:
+        return
+
+    connection_ids = {obj.connection_id for obj in pending}
+    with session.no_autoflush:
+        organizations = dict(session.query(
+            SocialPlatformConnection.id, SocialPlatformConnection.organization_id
+        ).filter(SocialPlatformConnection.id.in_(connection_ids)).all())
+    for obj in pending:
+        organization_id = organizations.get(obj.connection_id)
+        if organization_id is not None:
+            obj.organization_id = str(organization_id)
+
+
+def maintain_inbox_counters(session: Session) -> None:
+    """Apply the counter changes of a flush (called from the after_flush hook in backend.db.models)"""
+    # new/dirty/deleted and attribute history still reflect the flush here
+    deltas = collect_counter_deltas(session)
+    if deltas:
+        apply_counter_deltas(session.connection(), deltas)
+
+
+def get_inbox_counts(
+    db: Session,
+    organization_id: str,
+    user_id: Optional[int] = None,
+    platform: Optional[str] = None,
+    status: Optional[str] = None
+) -> Dict[str, int]:
+    """
+    Inbox totals and badges from maintained counters
+
+    Args:
+        db: Database session
+        organization_id: Organization whose inbox is shown
+        user_id: Restrict total_count to one user's interactions
+        platform: Restrict total_count to one platform
+        status: Restrict total_count to one status
+
+    Returns:
+        total_count for the filters, plus organization-wide unread_count and
+        high_priority_count
+    """
+    scopes = {ORG_WIDE_USER_ID} if user_id is None else {ORG_WIDE_USER_ID, user_id}
+    rows = db.query(
+        SocialInboxCounter.user_id,
+        SocialInboxCounter.platform,
+        SocialInboxCounter.status,
+        SocialInboxCounter.is_high_priority,
+        SocialInboxCounter.count
+    ).filter(
+        SocialInboxCounter.organization_id == str(organization_id),
+        SocialInboxCounter.user_id.in_(scopes)
+    ).all()
+
+    counts = {"total_count": 0, "unread_count": 0, "high_priority_count": 0}
+    total_scope = ORG_WIDE_USER_ID if user_id is None else user_id
+    for row in rows:
+        if row.user_id == ORG_WIDE_USER_ID:
+            if row.status == "unread":
+                counts["unread_count"] += row.count
+            if row.is_high_priority and row.status in HIGH_PRIORITY_STATUSES:
+                counts["high_priority_count"] += row.count
+        if (row.user_id == total_scope
+                and (platform is None or row.platform == platform)
+                and (status is None or row.status == status)):
+            counts["total_count"] += row.count
+    return counts
+
+
+def rebuild_inbox_counters(db: Session, organization_id: Optional[str] = None) -> None:
+    """
+    Recompute counters from social_interactions (no commit)
+
+    Used by the migration backfill and to repair drift after bulk updates.
+    """
+    counters = SocialInboxCounter.__table__
+    interactions = SocialInteraction.__table__
+    delete_statement = delete(counters)
+    source_filter = interactions.c.organization_id.isnot(None)
+    if organization_id is not None:
+        delete_statement = delete_statement.where(counters.c.organization_id == str(organization_id))
+        source_filter = and_(source_filter, interactions.c.organization_id == str(organization_id))
+    db.execute(delete_statement)
+
+    status = func.coalesce(interactions.c.status, "unread")
+    high_priority = case(
+        (func.coalesce(interactions.c.priority_score, 0) >= HIGH_PRIORITY_THRESHOLD, True),
+        else_=False
+    )
+    columns = ["organization_id", "user_id", "platform", "status", "is_high_priority", "count"]
+    for user_column in (interactions.c.user_id, literal(ORG_WIDE_USER_ID)):
+        group_by = [interactions.c.organization_id, interactions.c.platform, status, high_priority]
+        if user_column is interactions.c.user_id:
+            group_by.append(interactions.c.user_id)
+        db.execute(insert(counters).from_select(columns, select(
+            interactions.c.organization_id, user_column, interactions.c.platform,
+            status, high_priority, func.count()
+        ).where(source_filter).group_by(*group_by)))
+
+
+def encode_inbox_cursor(interaction: SocialInteraction) -> str:
+    """Opaque cursor positioned after an interaction"""
+    payload = [interaction.priority_score or 0, interaction.received_at.isoformat(), interaction.id]
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+
+
+def decode_inbox_cursor(cursor: str) -> Tuple[float, datetime, str]:
+    """
+    Decode a listing cursor
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        priority_score, received_at, interaction_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return float(priority_score), datetime.fromisoformat(received_at), str(interaction_id)
+    except (binascii.Error, TypeError, ValueError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+
+def list_inbox_page(
+    db: Session,
+    organization_id: str,
+    limit: int,
+    cursor: Optional[str] = None,
+    offset: int = 0,
+    user_id: Optional[int] = None,
+    platform: Optional[str] = None,
+    status: Optional[str] = None,
+    intent: Optional[str] = None
+) -> Tuple[List[SocialInteraction], Optional[str]]:
+    """
+    One page of the inbox, highest priority and newest first
+
+    Selects the page of ids from the covering index, then loads those rows
+    by primary key.
+
+    Args:
+        db: Database session
+        organization_id: Organization whose inbox is shown
+        limit: Page size
+        cursor: Cursor from the previous page (takes precedence over offset)
+        offset: Legacy offset paging
+        user_id, platform, status, intent: Optional filters
+
+    Returns:
+        (interactions, cursor for the next page or None on the last page)
+    """
+    sort_key = (SocialInteraction.priority_score, SocialInteraction.received_at, SocialInteraction.id)
+    id_query = db.query(SocialInteraction.id).filter(SocialInteraction.organization_id == str(organization_id))
+
+    if user_id is not None:
+        id_query = id_query.filter(SocialInteraction.user_id == user_id)
+    if platform:
+        id_query = id_query.filter(SocialInteraction.platform == platform)
+    if status:
+        id_query = id_query.filter(SocialInteraction.status == status)
+    if intent:
+        id_query = id_query.filter(SocialInteraction.intent == intent)
+    if cursor:
+        id_query = id_query.filter(tuple_(*sort_key) < tuple_(*decode_inbox_cursor(cursor)))
+
+    id_query = id_query.order_by(*(column.desc() for column in sort_key))
+    if offset and not cursor:
+        id_query = id_query.offset(offset)
+
+    page_ids = [row.id for row in id_query.limit(limit + 1)]
+    has_more = len(page_ids) > limit
+    page_ids = page_ids[:limit]
+    if not page_ids:
+        return [], None
+
+    rows = {row.id: row for row in db.query(SocialInteraction).filter(SocialInteraction.id.in_(page_ids)).all()}
+    interactions = [rows[interaction_id] for interaction_id in page_ids if interaction_id in rows]
+    next_cursor = encode_inbox_cursor(interactions[-1]) if has_more and interactions else None
+    return interactions, next_cursor
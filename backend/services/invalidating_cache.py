@@ -0,0 +1,125 @@
+"""
+Invalidating Cache
+
+Per-process LRU of values built from the database, shared by the pricing
+rule cache and the per-user knowledge/template indexes.
+
+Entries expire after a TTL and are dropped by invalidate(), which the
+owning module calls from a Session after_commit hook once a change is
+visible to other sessions. A build that was already running when its key
+was invalidated still answers its caller but is not stored, so a commit
+that lands mid-build is never hidden behind the stale result.
+"""
+
+import abc
+import threading
+import time
+from collections import Counter, OrderedDict
+from typing import Any, Dict, Generic, Hashable, Iterable, List, Optional, Tuple, TypeVar
+
+from sqlalchemy.orm import Session
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class InvalidatingCache(abc.ABC, Generic[K, V]):
+    """LRU of built values with TTL and invalidation that beats in-flight builds"""
+
+    def __init__(self, ttl_seconds: float, max_entries: int):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        # key -> (monotonic expiry, value)
+        self._entries: "OrderedDict[K, Tuple[float, V]]" = OrderedDict()
+        # key -> invalidations seen; kept only while a build for the key is running
+        self._generations: Dict[K, int] = {}
+        self._building: Counter = Counter()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.builds = 0
+
+    @abc.abstractmethod
+    def _build(self, db: Session, keys: List[K], **context: Any) -> Dict[K, Tuple[V, Optional[float]]]:
+        """
+        Build the values for keys that missed
+
+        Returns:
+            (value, ttl) per key; a ttl of None means ttl_seconds
+        """
+
+    def get(self, db: Session, key: K, **context: Any) -> V:
+        """Get one value, building it if missing or stale"""
+        return self.get_many(db, [key], **context)[key]
+
+    def get_many(self, db: Session, keys: Iterable[K], **context: Any) -> Dict[K, V]:
+        """
+        Get many values; the misses are built together in one _build call
+
+        Args:
+            db: Database session (used only to build missing values)
+            keys: Keys to resolve
+            **context: Passed through to _build
+
+        Returns:
+            Value keyed by key
+        """
+        resolved: Dict[K, V] = {}
+        missing: Dict[K, int] = {}
+
+        with self._lock:
+            monotonic_now = time.monotonic()
+            for key in dict.fromkeys(keys):
+                entry = self._entries.get(key)
+                if entry and entry[0] > monotonic_now:
+                    self._entries.move_to_end(key)
+                    resolved[key] = entry[1]
+                    self.hits += 1
+                else:
+                    self._entries.pop(key, None)
+                    missing[key] = self._generations.get(key, 0)
+                    self._building[key] += 1
+                    self.misses += 1
+
+        if not missing:
+            return resolved
+
+        built: Dict[K, Tuple[V, Optional[float]]] = {}
+        try:
+            built = self._build(db, list(missing), **context)
+        finally:
+            with self._lock:
+                monotonic_now = time.monotonic()
+                for key, generation in missing.items():
+                    if key in built:
+                        value, ttl = built[key]
+                        resolved[key] = value
+                        if self._generations.get(key, 0) == generation:
+                            ttl = self.ttl_seconds if ttl is None else min(ttl, self.ttl_seconds)
+                            self._entries[key] = (monotonic_now + ttl, value)
+                            self._entries.move_to_end(key)
+                    self._building[key] -= 1
+                    if not self._building[key]:
+                        del self._building[key]
+                        self._generations.pop(key, None)
+
+                if built:
+                    self.builds += 1
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+
+        return resolved
+
+    def invalidate(self, key: K) -> None:
+        """Drop a key's entry and any build for it already in flight"""
+        with self._lock:
+            self._entries.pop(key, None)
+            if key in self._building:
+                self._generations[key] = self._generations.get(key, 0) + 1
+
+    def clear(self) -> None:
+        """Drop all entries and any builds already in flight"""
+        with self._lock:
+            self._entries.clear()
+            for key in self._building:
+                self._generations[key] = self._generations.get(key, 0) + 1
@@ -7,18 +7,43 @@ that exceed weather thresholds to next safe time slots.
 """
 
 import asyncio
+import logging
 from datetime import datetime, timedelta, timezone, time
-from typing import List, Optional, Dict, Any, Tuple
+from typing import Iterable, List, Optional, Dict, Any, Tuple
 from dataclasses import dataclass
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_
+from sqlalchemy import and_, or_, update
 
 from backend.db.models import Job
-from backend.services.weather_service import WeatherService, get_weather_service
-from backend.services.settings_resolver import WeatherSettings, get_weather_settings
+from backend.services.weather_service import (
+    WeatherForecast,
+    WeatherService,
+    forecast_cell,
+    get_weather_service
+)
+from backend.services.settings_resolver import (
+    WeatherSettings,
+    get_weather_settings,
+    get_weather_settings_bulk
+)
 from backend.services.job_service import JobService, JobUpdateRequest
+from backend.services.redis_cache import redis_cache
 from backend.core.audit_logger import get_audit_logger, AuditEventType
 
+logger = logging.getLogger(__name__)
+
+# Geocodes only change when the address does, so keep them for a month
+GEOCODE_CACHE_TTL_SECONDS = 30 * 24 * 3600
+
+# Upper bound of WeatherSettings.lookahead_days; the global sweep loads
+# jobs this far ahead and trims per organization
+MAX_LOOKAHEAD_DAYS = 14
+
+
+def _as_utc(value: datetime) -> datetime:
+    """Treat naive datetimes from the database as UTC"""
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
 
 @dataclass
 class RescheduleResult:
@@ -56,6 +81,50 @@ class BusinessHours:
             )
 
 
+class GeocodeCache:
+    """
+    Address to coordinates cache that persists across sweeps
+    
+    Served from process memory and written through to the shared Redis
+    cache, so restarted workers don't geocode every job address again.
+    """
+    
+    def __init__(self, store: Optional[Any] = redis_cache, ttl_seconds: int = GEOCODE_CACHE_TTL_SECONDS):
+        self.store = store
+        self.ttl_seconds = ttl_seconds
+        self._memory: Dict[str, Tuple[float, float]] = {}
+    
+    @staticmethod
+    def normalize(address: str) -> str:
+        """Case and whitespace insensitive cache key for an address"""
+        return " ".join((address or "").lower().split())
+    
+    def get(self, address: str) -> Optional[Tuple[float, float]]:
+        """Return cached coordinates from memory"""
+        return self._memory.get(self.normalize(address))
+    
+    async def load(self, addresses: Iterable[str]) -> None:
+        """Pull persisted coordinates for addresses not yet in memory"""
+        if self.store is None:
+            return
+        
+        for key in {self.normalize(address) for address in addresses} - self._memory.keys():
+            cached = await self.store.get("weather", "geocode", resource_id=key)
+            if cached:
+                self._memory[key] = tuple(cached)
+    
+    async def set(self, address: str, coordinates: Tuple[float, float]) -> None:
+        """Cache coordinates in memory and the persistent store"""
+        key = self.normalize(address)
+        self._memory[key] = coordinates
+        
+        if self.store is not None:
+            await self.store.set(
+                "weather", "geocode", list(coordinates),
+                resource_id=key, ttl=self.ttl_seconds
+            )
+
+
 class JobRescheduler:
     """
     PW-WEATHER-ADD-001: Automatic job rescheduling based on weather
@@ -67,10 +136,12 @@ class JobRescheduler:
     def __init__(
         self,
         weather_service: Optional[WeatherService] = None,
-        job_service: Optional[JobService] = None
+        job_service: Optional[JobService] = None,
+        geocode_cache: Optional[GeocodeCache] = None
     ):
         self.weather_service = weather_service or get_weather_service()
         self.job_service = job_service or JobService()
+        self.geocode_cache = geocode_cache or GeocodeCache()
         self.audit_logger = get_audit_logger()
     
     async def run_rescheduling_check(
@@ -114,6 +185,14 @@ class JobRescheduler:
         if not upcoming_jobs:
             return []
         
+        # One geocode per unique address and one forecast per unique cell,
+        # fetched concurrently before any job is evaluated
+        locations = await self._geocode_addresses(job.address for job in upcoming_jobs)
+        forecasts_by_cell = await self.weather_service.get_forecasts_for_locations(
+            locations.values(),
+            date_range=weather_settings.lookahead_days
+        )
+        
         results = []
         
         for job in upcoming_jobs:
@@ -122,7 +201,8 @@ class JobRescheduler:
                     job=job,
                     weather_settings=weather_settings,
                     db=db,
-                    user_id=user_id
+                    user_id=user_id,
+                    forecasts=forecasts_by_cell.get(forecast_cell(*locations[job.address]), [])
                 )
                 
                 if result:
@@ -142,6 +222,157 @@ class JobRescheduler:
         
         return results
     
+    async def run_global_rescheduling_sweep(
+        self,
+        db: Session,
+        user_id: Optional[int] = None
+    ) -> Dict[str, List[RescheduleResult]]:
+        """
+        Run the weather rescheduling pass for every organization at once
+        
+        Loads all scheduled jobs within the maximum lookahead in one query,
+        resolves weather settings for the affected organizations in one
+        query, evaluates one forecast per location cell and applies all
+        reschedules with a single bulk update and a single audit insert.
+        
+        Args:
+            db: Database session
+            user_id: User ID recorded on the changes (None for the system)
+            
+        Returns:
+            Rescheduling results keyed by organization ID
+        """
+        now = datetime.now(timezone.utc)
+        
+        jobs = db.query(Job).filter(
+            and_(
+                Job.status == "scheduled",
+                Job.scheduled_for >= now,
+                Job.scheduled_for <= now + timedelta(days=MAX_LOOKAHEAD_DAYS)
+            )
+        ).order_by(Job.scheduled_for).all()
+        
+        if not jobs:
+            return {}
+        
+        settings_by_org = get_weather_settings_bulk(db, [job.organization_id for job in jobs])
+        
+        # Keep jobs of orgs with auto-rescheduling on, inside each org's own lookahead
+        due_jobs = []
+        for job in jobs:
+            weather_settings = settings_by_org[job.organization_id]
+            horizon = now + timedelta(days=weather_settings.lookahead_days)
+            if weather_settings.auto_reschedule and _as_utc(job.scheduled_for) <= horizon:
+                due_jobs.append(job)
+        
+        if not due_jobs:
+            return {}
+        
+        locations = await self._geocode_addresses(job.address for job in due_jobs)
+        forecasts_by_cell = await self.weather_service.get_forecasts_for_locations(
+            locations.values(),
+            date_range=max(settings_by_org[job.organization_id].lookahead_days for job in due_jobs)
+        )
+        
+        results: Dict[str, List[RescheduleResult]] = {}
+        job_updates = []
+        audit_events = []
+        
+        for job in due_jobs:
+            weather_settings = settings_by_org[job.organization_id]
+            forecasts = forecasts_by_cell.get(forecast_cell(*locations[job.address]), [])
+            
+            plan = self._plan_reschedule(job, weather_settings, forecasts[:weather_settings.lookahead_days])
+            if plan is None:
+                continue
+            
+            job_forecast, next_safe_date = plan
+            
+            if not next_safe_date:
+                results.setdefault(job.organization_id, []).append(RescheduleResult(
+                    job_id=job.id,
+                    original_date=job.scheduled_for,
+                    new_date=None,
+                    reschedule_reason="No safe weather window found within forecast period",
+                    success=False
+                ))
+                continue
+            
+            reschedule_reason = self._generate_reschedule_reason(
+                job_forecast, weather_settings.bad_weather_threshold
+            )
+            job_updates.append(self._reschedule_values(job, next_safe_date, reschedule_reason, user_id))
+            audit_events.append({
+                "event_type": AuditEventType.JOB_RESCHEDULED,
+                "user_id": str(user_id) if user_id else None,
+                "resource": f"job/{job.id}",
+                "action": "weather_reschedule",
+                "details": {
+                    "organization_id": job.organization_id,
+                    "job_id": job.id,
+                    "original_date": job.scheduled_for.isoformat(),
+                    "new_date": next_safe_date.isoformat(),
+                    "reason": reschedule_reason,
+                    "automated": True,
+                    "weather_data": {
+                        "rain_probability": job_forecast.rain_probability,
+                        "wind_speed": job_forecast.wind_speed_mph,
+                        "temperature": job_forecast.temperature_low_f,
+                        "condition": job_forecast.condition.value
+                    }
+                }
+            })
+            results.setdefault(job.organization_id, []).append(RescheduleResult(
+                job_id=job.id,
+                original_date=job.scheduled_for,
+                new_date=next_safe_date,
+                reschedule_reason=reschedule_reason,
+                success=True
+            ))
+        
+        if job_updates:
+            try:
+                db.execute(update(Job), job_updates)
+                self.audit_logger.log_events(audit_events, db=db)
+                db.commit()
+            except Exception as e:
+                db.rollback()
+                logger.error(f"Failed to apply {len(job_updates)} weather reschedules: {e}")
+                for org_results in results.values():
+                    for result in org_results:
+                        if result.success:
+                            result.success = False
+                            result.new_date = None
+                            result.error_message = str(e)
+        
+        logger.info(
+            f"Weather sweep checked {len(due_jobs)} jobs across {len(settings_by_org)} organizations, "
+            f"rescheduled {len(job_updates)}"
+        )
+        return results
+    
+    def _reschedule_values(
+        self,
+        job: Job,
+        new_scheduled_time: datetime,
+        reason: str,
+        user_id: Optional[int]
+    ) -> Dict[str, Any]:
+        """Column values for a bulk reschedule, matching JobService.reschedule_job"""
+        old_time = job.scheduled_for
+        reschedule_note = (
+            f"Rescheduled from {old_time.isoformat() if old_time else 'unscheduled'} "
+            f"to {new_scheduled_time.isoformat()}. Reason: {reason}"
+        )
+        
+        return {
+            "id": job.id,
+            "scheduled_for": new_scheduled_time,
+            "status": "rescheduled",
+            "updated_by_id": user_id,
+            "internal_notes": f"{job.internal_notes}\n{reschedule_note}" if job.internal_notes else reschedule_note
+        }
+    
     def _get_upcoming_jobs(
         self,
         organization_id: str,
@@ -167,48 +398,31 @@ class JobRescheduler:
         job: Job,
         weather_settings: WeatherSettings,
         db: Session,
-        user_id: Optional[int]
+        user_id: Optional[int],
+        forecasts: Optional[List[WeatherForecast]] = None
     ) -> Optional[RescheduleResult]:
-        """Evaluate weather for a job and reschedule if necessary"""
+        """
+        Evaluate weather for a job and reschedule if necessary
+        
+        Sweeps pass the prefetched forecast for the job's cell; single-job
+        checks fetch it here.
+        """
         if not job.scheduled_for:
             return None
             
-        # Get weather forecast for job date
-        # For now, using fixed coordinates - in production, would geocode address
-        latitude, longitude = self._geocode_address(job.address)
-        
-        forecasts = await self.weather_service.get_forecast(
-            latitude=latitude,
-            longitude=longitude,
-            date_range=weather_settings.lookahead_days
-        )
+        if forecasts is None:
+            latitude, longitude = self._geocode_address(job.address)
+            forecasts = await self.weather_service.get_forecast(
+                latitude=latitude,
+                longitude=longitude,
+                date_range=weather_settings.lookahead_days
+            )
         
-        if not forecasts:
+        plan = self._plan_reschedule(job, weather_settings, forecasts)
+        if plan is None:
             return None
-            
-        # Find forecast for job date
-        job_date = job.scheduled_for.date()
-        job_forecast = None
         
-        for forecast in forecasts:
-            if forecast.date.date() == job_date:
-                job_forecast = forecast
-                break
-        
-        if not job_forecast:
-            return None
-            
-        # Check if weather exceeds thresholds
-        if not job_forecast.is_bad_weather(weather_settings.bad_weather_threshold):
-            # Weather is fine, no rescheduling needed
-            return None
-            
-        # Weather is bad, find next safe slot
-        next_safe_date = self._find_next_safe_slot(
-            forecasts=forecasts,
-            weather_settings=weather_settings,
-            current_job_duration=job.duration_minutes or 120
-        )
+        job_forecast, next_safe_date = plan
         
         if not next_safe_date:
             # No safe slot found within forecast window
@@ -273,10 +487,76 @@ class JobRescheduler:
                 error_message=str(e)
             )
     
+    def _plan_reschedule(
+        self,
+        job: Job,
+        weather_settings: WeatherSettings,
+        forecasts: List[WeatherForecast]
+    ) -> Optional[Tuple[WeatherForecast, Optional[datetime]]]:
+        """
+        Decide whether a job has to move because of the weather
+        
+        Returns:
+            None if no forecast covers the job date or the weather is fine,
+            otherwise the job-day forecast and the next safe slot (None when
+            the forecast window has no safe slot)
+        """
+        if not forecasts:
+            return None
+            
+        # Find forecast for job date
+        job_date = job.scheduled_for.date()
+        job_forecast = None
+        
+        for forecast in forecasts:
+            if forecast.date.date() == job_date:
+                job_forecast = forecast
+                break
+        
+        if not job_forecast:
+            return None
+            
+        # Check if weather exceeds thresholds
+        if not job_forecast.is_bad_weather(weather_settings.bad_weather_threshold):
+            # Weather is fine, no rescheduling needed
+            return None
+            
+        # Weather is bad, find next safe slot
+        next_safe_date = self._find_next_safe_slot(
+            forecasts=forecasts,
+            weather_settings=weather_settings,
+            current_job_duration=job.duration_minutes or 120
+        )
+        
+        return job_forecast, next_safe_date
+    
+    async def _geocode_addresses(self, addresses: Iterable[str]) -> Dict[str, Tuple[float, float]]:
+        """Geocode each unique address once, going through the geocode cache"""
+        unique_addresses = set(addresses)
+        await self.geocode_cache.load(unique_addresses)
+        
+        locations = {}
+        for address in unique_addresses:
+            coordinates = self.geocode_cache.get(address)
+            if coordinates is None:
+                coordinates = self._lookup_coordinates(address)
+                await self.geocode_cache.set(address, coordinates)
+            locations[address] = coordinates
+        
+        return locations
+    
     def _geocode_address(self, address: str) -> Tuple[float, float]:
         """
         Geocode address to latitude/longitude
         
+        Uses the in-memory geocode cache, falling back to a lookup.
+        """
+        return self.geocode_cache.get(address) or self._lookup_coordinates(address)
+    
+    def _lookup_coordinates(self, address: str) -> Tuple[float, float]:
+        """
+        Resolve an address with the geocoding service
+        
         For now, returns fixed coordinates for Atlanta, GA.
         In production, would use actual geocoding service.
         """
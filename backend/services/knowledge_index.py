@@ -0,0 +1,335 @@
+"""
+In-process retrieval indexes for the personality response engine
+
+- CompanyKnowledgeIndex keeps one BM25 index per user over their active
+  CompanyKnowledge entries (title, summary, content, keywords and tags),
+  so a multi-keyword query is a single ranked lookup instead of an ILIKE
+  scan per keyword.
+- ResponseTemplateIndex keeps a precomputed (intent, platform, keyword)
+  -> template map per user for template selection.
+
+Both are built lazily with one query per user and refreshed when an
+indexed field of a CompanyKnowledge / ResponseTemplate row is committed
+in this process. Writes made by other processes are picked up after
+ttl_seconds. Usage counters are not indexed, so bumping them does not
+trigger a rebuild.
+"""
+
+import abc
+import logging
+import math
+import re
+from collections import Counter, defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Tuple, TypeVar
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session, object_session
+
+from backend.db.models import CompanyKnowledge, ResponseTemplate
+from backend.services.invalidating_cache import InvalidatingCache
+
+logger = logging.getLogger(__name__)
+
+INDEX_TTL_SECONDS = 300
+MAX_INDEXED_USERS = 1000
+
+_TOKEN_RE = re.compile(r"\w+")
+
+# Dropped from queries and documents; inbound messages are full of them
+STOPWORDS = frozenset(
+    "a an and are as at be but by can do does for from have how i if in is it "
+    "me my of on or our so that the their them there this to us was we what "
+    "when where which who why will with you your".split()
+)
+
+# Term frequency multipliers per field (a simple BM25F)
+FIELD_WEIGHTS = {
+    "title": 3,
+    "keywords": 3,
+    "tags": 2,
+    "summary": 1,
+    "content": 1,
+}
+
+# Fields whose change requires rebuilding the owning user's index
+KNOWLEDGE_INDEXED_FIELDS = ("user_id", "title", "summary", "content", "keywords", "tags", "is_active")
+TEMPLATE_INDEXED_FIELDS = ("user_id", "trigger_type", "platforms", "keywords", "priority", "is_active")
+
+
+def _stem(token: str) -> str:
+    """Strip common English suffixes so 'washing' matches 'wash'"""
+    for suffix in ("ing", "ed", "es", "s"):
+        if token.endswith(suffix) and len(token) - len(suffix) >= 3 and not token.endswith("ss"):
+            return token[:-len(suffix)]
+    return token
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """Lowercase word tokens without stopwords, lightly stemmed"""
+    if not text:
+        return []
+    return [_stem(token) for token in _TOKEN_RE.findall(text.lower()) if token not in STOPWORDS]
+
+
+class BM25Index:
+    """
+    Okapi BM25 over pre-tokenized documents
+
+    Documents are term-frequency counters keyed by document id.
+    """
+
+    def __init__(self, documents: Dict[str, Counter], k1: float = 1.2, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self.document_count = len(documents)
+        self.doc_lengths = {doc_id: sum(tf.values()) for doc_id, tf in documents.items()}
+        self.avg_doc_length = (
+            sum(self.doc_lengths.values()) / self.document_count if self.document_count else 0.0
+        )
+
+        self.postings: Dict[str, List[Tuple[str, int]]] = defaultdict(list)
+        for doc_id, term_frequencies in documents.items():
+            for term, frequency in term_frequencies.items():
+                self.postings[term].append((doc_id, frequency))
+
+        self.idf = {
+            term: math.log(1 + (self.document_count - len(postings) + 0.5) / (len(postings) + 0.5))
+            for term, postings in self.postings.items()
+        }
+
+    def search(self, terms: Iterable[str], limit: int = 5) -> List[Tuple[str, float]]:
+        """
+        Rank documents for a query
+
+        Args:
+            terms: Query terms (already tokenized); repeats are ignored
+            limit: Maximum number of results
+
+        Returns:
+            (document id, score) pairs, best first
+        """
+        scores: Dict[str, float] = defaultdict(float)
+        for term in set(terms):
+            postings = self.postings.get(term)
+            if not postings:
+                continue
+            idf = self.idf[term]
+            for doc_id, frequency in postings:
+                norm = self.k1 * (1 - self.b + self.b * self.doc_lengths[doc_id] / self.avg_doc_length)
+                scores[doc_id] += idf * frequency * (self.k1 + 1) / (frequency + norm)
+
+        return sorted(scores.items(), key=lambda item: (-item[1], item[0]))[:limit]
+
+
+T = TypeVar("T")
+
+
+class _PerUserIndexCache(InvalidatingCache[int, T]):
+    """LRU of per-user indexes with TTL and commit-driven invalidation"""
+
+    def __init__(self, ttl_seconds: float = INDEX_TTL_SECONDS, max_users: int = MAX_INDEXED_USERS):
+        super().__init__(ttl_seconds=ttl_seconds, max_entries=max_users)
+
+    @abc.abstractmethod
+    def _build_index(self, db: Session, user_id: int) -> T:
+        """Build one user's index with a single query"""
+
+    def _build(self, db: Session, keys: List[int], **context: Any) -> Dict[int, Tuple[T, Optional[float]]]:
+        return {user_id: (self._build_index(db, user_id), None) for user_id in keys}
+
+    def get_index(self, db: Session, user_id: int) -> T:
+        """Get the user's index, building it if missing or stale"""
+        return self.get(db, user_id)
+
+
+class CompanyKnowledgeIndex(_PerUserIndexCache[BM25Index]):
+    """Per-user BM25 indexes over active company knowledge"""
+
+    def _build_index(self, db: Session, user_id: int) -> BM25Index:
+        rows = db.query(
+            CompanyKnowledge.id,
+            CompanyKnowledge.title,
+            CompanyKnowledge.summary,
+            CompanyKnowledge.content,
+            CompanyKnowledge.keywords,
+            CompanyKnowledge.tags
+        ).filter(
+            CompanyKnowledge.user_id == user_id,
+            CompanyKnowledge.is_active == True
+        ).all()
+
+        documents = {}
+        for row in rows:
+            term_frequencies = Counter()
+            for field_name, weight in FIELD_WEIGHTS.items():
+                value = getattr(row, field_name)
+                if isinstance(value, list):
+                    value = " ".join(str(item) for item in value)
+                for token in tokenize(value):
+                    term_frequencies[token] += weight
+            documents[row.id] = term_frequencies
+
+        logger.debug(f"Built knowledge index for user {user_id} with {len(documents)} entries")
+        return BM25Index(documents)
+
+    def search(self, db: Session, user_id: int, keywords: Iterable[str], limit: int = 5) -> List[Tuple[str, float]]:
+        """
+        Rank a user's knowledge entries for a set of keywords
+
+        Args:
+            db: Database session (used only to build a missing index)
+            user_id: Knowledge owner
+            keywords: Query keywords or phrases
+            limit: Maximum number of results
+
+        Returns:
+            (CompanyKnowledge id, score) pairs, best first
+        """
+        terms = [token for keyword in keywords for token in tokenize(keyword)]
+        if not terms:
+            return []
+        return self.get_index(db, user_id).search(terms, limit)
+
+
+class TemplateMap:
+    """Template ids per (intent, platform) in priority order, plus keyword positions"""
+
+    def __init__(self):
+        self.ordered: Dict[Tuple[str, str], List[str]] = defaultdict(list)
+        # (intent, platform, keyword) -> position of the first template with that keyword
+        self.keyword_positions: Dict[Tuple[str, str, str], int] = {}
+
+    def add(self, intent: str, platform: str, template_id: str, keywords: Iterable[str]) -> None:
+        position = len(self.ordered[(intent, platform)])
+        self.ordered[(intent, platform)].append(template_id)
+        for keyword in keywords:
+            self.keyword_positions.setdefault((intent, platform, keyword.lower()), position)
+
+    def match(self, intent: str, platform: str, keywords: Iterable[str]) -> Optional[str]:
+        """Highest-priority template sharing a keyword, else the highest-priority one"""
+        candidates = self.ordered.get((intent, platform))
+        if not candidates:
+            return None
+
+        positions = [
+            self.keyword_positions[key]
+            for key in ((intent, platform, keyword.lower()) for keyword in keywords)
+            if key in self.keyword_positions
+        ]
+        return candidates[min(positions)] if positions else candidates[0]
+
+
+class ResponseTemplateIndex(_PerUserIndexCache[TemplateMap]):
+    """Per-user keyword -> template maps"""
+
+    def _build_index(self, db: Session, user_id: int) -> TemplateMap:
+        rows = db.query(
+            ResponseTemplate.id,
+            ResponseTemplate.trigger_type,
+            ResponseTemplate.platforms,
+            ResponseTemplate.keywords
+        ).filter(
+            ResponseTemplate.user_id == user_id,
+            ResponseTemplate.is_active == True
+        ).order_by(ResponseTemplate.priority.desc(), ResponseTemplate.id).all()
+
+        template_map = TemplateMap()
+        for row in rows:
+            for platform in row.platforms or []:
+                template_map.add(row.trigger_type, platform, row.id, row.keywords or [])
+        return template_map
+
+    def match(
+        self,
+        db: Session,
+        user_id: int,
+        intent: str,
+        platform: str,
+        keywords: Iterable[str]
+    ) -> Optional[str]:
+        """Get the id of the template to use for an interaction, if any"""
+        return self.get_index(db, user_id).match(intent, platform, keywords)
+
+
+# Global index instances
+_company_knowledge_index: Optional[CompanyKnowledgeIndex] = None
+_response_template_index: Optional[ResponseTemplateIndex] = None
+
+
+def get_company_knowledge_index() -> CompanyKnowledgeIndex:
+    """Get global company knowledge index"""
+    global _company_knowledge_index
+    if _company_knowledge_index is None:
+        _company_knowledge_index = CompanyKnowledgeIndex()
+    return _company_knowledge_index
+
+
+def set_company_knowledge_index(index: CompanyKnowledgeIndex) -> None:
+    """Set global company knowledge index (mainly for testing)"""
+    global _company_knowledge_index
+    _company_knowledge_index = index
+
+
+def get_response_template_index() -> ResponseTemplateIndex:
+    """Get global response template index"""
+    global _response_template_index
+    if _response_template_index is None:
+        _response_template_index = ResponseTemplateIndex()
+    return _response_template_index
+
+
+def set_response_template_index(index: ResponseTemplateIndex) -> None:
+    """Set global response template index (mainly for testing)"""
+    global _response_template_index
+    _response_template_index = index
+
+
+# Refresh on write: remember changed owners per session, invalidate on commit
+_CHANGED_USERS_KEY = "knowledge_index_changed_users"
+
+
+def _indexed_fields_changed(target: Any, fields: Tuple[str, ...]) -> bool:
+    state = inspect(target)
+    return any(state.attrs[name].history.has_changes() for name in fields)
+
+
+def _record_change(kind: str, fields: Optional[Tuple[str, ...]]):
+    def listener(mapper, connection, target):
+        if fields is not None and not _indexed_fields_changed(target, fields):
+            return
+        session = object_session(target)
+        if session is None:
+            return
+        changed = session.info.setdefault(_CHANGED_USERS_KEY, set())
+        changed.add((kind, target.user_id))
+        # A row moved between users leaves a stale entry in the old owner's index
+        history = inspect(target).attrs.user_id.history
+        for previous_user_id in history.deleted or ():
+            changed.add((kind, previous_user_id))
+    return listener
+
+
+for _model, _kind, _fields in (
+    (CompanyKnowledge, "knowledge", KNOWLEDGE_INDEXED_FIELDS),
+    (ResponseTemplate, "template", TEMPLATE_INDEXED_FIELDS),
+):
+    event.listen(_model, "after_insert", _record_change(_kind, None))
+    event.listen(_model, "after_delete", _record_change(_kind, None))
+    event.listen(_model, "after_update", _record_change(_kind, _fields))
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed_indexes(session: Session) -> None:
+    changed = session.info.pop(_CHANGED_USERS_KEY, None)
+    if not changed:
+        return
+    for kind, user_id in changed:
+        if kind == "knowledge":
+            get_company_knowledge_index().invalidate(user_id)
+        else:
+            get_response_template_index().invalidate(user_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_rolled_back_changes(session: Session) -> None:
+    session.info.pop(_CHANGED_USERS_KEY, None)
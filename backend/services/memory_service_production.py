@@ -12,6 +12,9 @@ from backend.db.models import User
 
 logger = logging.getLogger(__name__)
 
+# Engagement rate (%) content needs to count as high-performing inspiration
+MIN_ENGAGEMENT_RATE = 2.0
+
 class ProductionMemoryService:
     """Production memory service using pgvector for semantic storage"""
     
@@ -132,25 +135,16 @@ class ProductionMemoryService:
     ) -> List[Dict[str, Any]]:
         """Find similar high-performing content for inspiration"""
         try:
+            # Filter for high-performing content in SQL so `limit` rows still come back;
+            # content with no metrics is assumed good
             results = self.vector_service.similarity_search_content(
                 user_id=user_id,
                 query_text=query_text,
                 limit=limit,
-                similarity_threshold=similarity_threshold
+                similarity_threshold=similarity_threshold,
+                min_engagement_rate=MIN_ENGAGEMENT_RATE if include_performance else None
             )
             
-            # Filter for high-performing content if requested
-            if include_performance:
-                filtered_results = []
-                for result in results:
-                    metrics = result['metadata'].get('performance_metrics', {})
-                    # Include content with engagement rate > 2% or no metrics (assume good)
-                    engagement_rate = metrics.get('engagement_rate', 3.0)  # Default to 3% if no data
-                    if engagement_rate >= 2.0:
-                        filtered_results.append(result)
-                
-                results = filtered_results[:limit]
-            
             logger.info(f"Found {len(results)} similar high-performing content items")
             return results
             
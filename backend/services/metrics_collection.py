@@ -4,21 +4,25 @@ Integration Specialist Component - Comprehensive metrics aggregation from all pl
 """
 import asyncio
 import logging
-from typing import Dict, List, Optional, Any, Tuple
+import time
+from typing import Dict, List, Optional, Any, Tuple, Callable, Awaitable
 from datetime import datetime, timedelta, timezone
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from enum import Enum
 import json
+from sqlalchemy import or_
 from sqlalchemy.orm import Session
 
 from backend.core.config import get_settings
 from backend.db.database import get_db
-from backend.db.models import ContentItem, ContentPerformanceSnapshot
+from backend.db.models import ContentItem, ContentPerformanceRollup
+from backend.services.performance_snapshot_store import get_performance_snapshot_store
 
 # Mock classes for compatibility (since models don't exist)
 class SocialMediaAccount:
-    def __init__(self, platform="mock", account_id="mock123", access_token="mock_token", is_active=True):
+    def __init__(self, platform="mock", account_id="mock123", access_token="mock_token", is_active=True, user_id=None):
         self.platform = platform
+        self.user_id = user_id
         self.account_id = account_id
         self.access_token = access_token
         self.is_active = is_active
@@ -37,6 +41,7 @@ class FacebookInsights:
 from backend.integrations.twitter_client import twitter_client
 from backend.integrations.instagram_client import instagram_client
 from backend.integrations.facebook_client import facebook_client
+from backend.integrations.linkedin_client import linkedin_client
 
 settings = get_settings()
 logger = logging.getLogger(__name__)
@@ -77,6 +82,51 @@ class UnifiedMetrics:
                 total_engagement += self.saves
             self.engagement_rate = (total_engagement / self.impressions) * 100
 
+# ContentItem columns loaded for collection: post lookup plus previous rollups for growth
+CONTENT_ITEM_METRIC_COLUMNS = (
+    ContentItem.id,
+    ContentItem.platform_post_id,
+    ContentItem.likes_count,
+    ContentItem.shares_count,
+    ContentItem.comments_count,
+    ContentItem.reach_count,
+    ContentItem.click_count,
+    ContentItem.last_performance_update
+)
+
+class PlatformRateBudget:
+    """
+    Per-platform API budget for a collection run
+    
+    Caps how many accounts are collected at once and spaces API requests
+    with a token bucket sized to the platform's rate-limit window.
+    """
+    
+    def __init__(self, max_concurrent_accounts: int, requests_per_window: int, window_seconds: float):
+        self.accounts = asyncio.Semaphore(max_concurrent_accounts)
+        self.capacity = float(requests_per_window)
+        self.refill_rate = requests_per_window / window_seconds
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self.requests = 0
+        self.wait_time = 0.0
+    
+    def _reserve(self, cost: float) -> float:
+        """Take tokens, returning how long to wait until they are available"""
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.refill_rate)
+        self._updated = now
+        self._tokens -= cost
+        return 0.0 if self._tokens >= 0 else -self._tokens / self.refill_rate
+    
+    async def acquire(self, requests: int = 1):
+        """Wait until the budget allows another API request"""
+        self.requests += requests
+        delay = self._reserve(requests)
+        if delay > 0:
+            self.wait_time += delay
+            await asyncio.sleep(delay)
+
 @dataclass
 class MetricsCollectionResult:
     """Result of metrics collection operation"""
@@ -116,12 +166,22 @@ class SocialMediaMetricsCollector:
             "base_delay": 60  # seconds
         }
         
+        # Posts per API call and per database commit
         self.batch_sizes = {
-            Platform.TWITTER: 50,      # Twitter API allows good batch sizes
-            Platform.INSTAGRAM: 25,    # Instagram is more restrictive
-            Platform.FACEBOOK: 25,     # Facebook similar to Instagram
-            Platform.LINKEDIN: 20      # LinkedIn most restrictive
+            Platform.TWITTER: 100,     # GET /2/tweets accepts 100 ids
+            Platform.INSTAGRAM: 50,    # Graph API batch limit
+            Platform.FACEBOOK: 50,     # Graph API batch limit
+            Platform.LINKEDIN: 50      # Rest.li batch GET
+        }
+        
+        # Concurrent accounts and request rate per platform
+        self.rate_budgets = {
+            Platform.TWITTER: {"max_concurrent_accounts": 8, "requests_per_window": 450, "window_seconds": 900},
+            Platform.INSTAGRAM: {"max_concurrent_accounts": 8, "requests_per_window": 600, "window_seconds": 600},
+            Platform.FACEBOOK: {"max_concurrent_accounts": 8, "requests_per_window": 600, "window_seconds": 600},
+            Platform.LINKEDIN: {"max_concurrent_accounts": 4, "requests_per_window": 60, "window_seconds": 60}
         }
+        self._rate_budgets: Dict[Platform, PlatformRateBudget] = {}
         
         logger.info("SocialMediaMetricsCollector initialized")
     
@@ -138,13 +198,19 @@ class SocialMediaMetricsCollector:
             db: Database session
             force_collection: Force collection regardless of intervals
             platforms: Specific platforms to collect from (if None, collect all)
-            
+        
         Returns:
             List of collection results
         """
         if platforms is None:
             platforms = list(Platform)
         
+        # Budgets hold asyncio primitives, so build them inside the running loop
+        self._rate_budgets = {
+            platform: PlatformRateBudget(**self.rate_budgets[platform])
+            for platform in Platform
+        }
+        
         results = []
         
         # Collect metrics from each platform in parallel
@@ -193,345 +259,237 @@ class SocialMediaMetricsCollector:
         db: Session,
         force_collection: bool = False
     ) -> MetricsCollectionResult:
-        """Collect metrics from Twitter"""
-        try:
-            # Get Twitter accounts
-            twitter_accounts = db.query(SocialMediaAccount).filter(
-                SocialMediaAccount.platform == "twitter",
-                SocialMediaAccount.is_active == True
-            ).all()
-            
-            if not twitter_accounts:
-                return MetricsCollectionResult(
-                    success=True,
-                    platform="twitter",
-                    metrics_collected=0,
-                    errors=[],
-                    collection_time=datetime.now(timezone.utc)
-                )
-            
-            total_metrics = 0
-            errors = []
-            
-            for account in twitter_accounts:
-                try:
-                    # Get recent content items for this account
-                    content_items = db.query(ContentItem).filter(
-                        ContentItem.platform == "twitter",
-                        ContentItem.account_id == account.account_id,
-                        ContentItem.status == "published"
-                    ).order_by(ContentItem.published_at.desc()).limit(self.batch_sizes[Platform.TWITTER]).all()
-                    
-                    # Collect metrics for each content item
-                    for content_item in content_items:
-                        if not self._should_collect_metrics(content_item, Platform.TWITTER, force_collection):
-                            continue
-                        
-                        try:
-                            # Get Twitter analytics
-                            analytics = await twitter_client.get_tweet_analytics(
-                                access_token=account.access_token,
-                                tweet_id=content_item.platform_post_id
-                            )
-                            
-                            # Convert to unified metrics
-                            unified_metrics = self._twitter_to_unified_metrics(analytics, content_item)
-                            
-                            # Save to database
-                            await self._save_metrics_to_db(db, unified_metrics, content_item)
-                            
-                            total_metrics += 1
-                            
-                            # Brief delay to respect rate limits
-                            await asyncio.sleep(0.1)
-                            
-                        except Exception as e:
-                            error_msg = f"Failed to collect Twitter metrics for content {content_item.id}: {e}"
-                            errors.append(error_msg)
-                            logger.error(error_msg)
-                
-                except Exception as e:
-                    error_msg = f"Failed to process Twitter account {account.account_id}: {e}"
-                    errors.append(error_msg)
-                    logger.error(error_msg)
-            
-            return MetricsCollectionResult(
-                success=len(errors) == 0,
-                platform="twitter",
-                metrics_collected=total_metrics,
-                errors=errors,
-                collection_time=datetime.now(timezone.utc),
-                next_collection=datetime.now(timezone.utc) + self.collection_intervals[Platform.TWITTER]
-            )
-            
-        except Exception as e:
-            logger.error(f"Twitter metrics collection failed: {e}")
-            return MetricsCollectionResult(
-                success=False,
-                platform="twitter",
-                metrics_collected=0,
-                errors=[str(e)],
-                collection_time=datetime.now(timezone.utc)
-            )
+        """Collect metrics from Twitter (100 tweets per multi-id lookup)"""
+        return await self._collect_platform_metrics(
+            db,
+            Platform.TWITTER,
+            force_collection,
+            fetch=lambda account, post_ids: twitter_client.get_tweets_metrics(
+                access_token=account.access_token,
+                tweet_ids=post_ids
+            ),
+            convert=self._twitter_to_unified_metrics
+        )
     
     async def _collect_instagram_metrics(
         self,
         db: Session,
         force_collection: bool = False
     ) -> MetricsCollectionResult:
-        """Collect metrics from Instagram"""
-        try:
-            # Get Instagram accounts
-            instagram_accounts = db.query(SocialMediaAccount).filter(
-                SocialMediaAccount.platform == "instagram",
-                SocialMediaAccount.is_active == True
-            ).all()
-            
-            if not instagram_accounts:
-                return MetricsCollectionResult(
-                    success=True,
-                    platform="instagram",
-                    metrics_collected=0,
-                    errors=[],
-                    collection_time=datetime.now(timezone.utc)
-                )
-            
-            total_metrics = 0
-            errors = []
-            
-            for account in instagram_accounts:
-                try:
-                    # Get recent content items for this account
-                    content_items = db.query(ContentItem).filter(
-                        ContentItem.platform == "instagram",
-                        ContentItem.account_id == account.account_id,
-                        ContentItem.status == "published"
-                    ).order_by(ContentItem.published_at.desc()).limit(self.batch_sizes[Platform.INSTAGRAM]).all()
-                    
-                    # Collect metrics for each content item
-                    for content_item in content_items:
-                        if not self._should_collect_metrics(content_item, Platform.INSTAGRAM, force_collection):
-                            continue
-                        
-                        try:
-                            # Get Instagram insights
-                            insights = await instagram_client.get_media_insights(
-                                access_token=account.access_token,
-                                media_id=content_item.platform_post_id
-                            )
-                            
-                            # Convert to unified metrics
-                            unified_metrics = self._instagram_to_unified_metrics(insights, content_item)
-                            
-                            # Save to database
-                            await self._save_metrics_to_db(db, unified_metrics, content_item)
-                            
-                            total_metrics += 1
-                            
-                            # Brief delay to respect rate limits
-                            await asyncio.sleep(0.2)
-                            
-                        except Exception as e:
-                            error_msg = f"Failed to collect Instagram metrics for content {content_item.id}: {e}"
-                            errors.append(error_msg)
-                            logger.error(error_msg)
-                
-                except Exception as e:
-                    error_msg = f"Failed to process Instagram account {account.account_id}: {e}"
-                    errors.append(error_msg)
-                    logger.error(error_msg)
-            
-            return MetricsCollectionResult(
-                success=len(errors) == 0,
-                platform="instagram",
-                metrics_collected=total_metrics,
-                errors=errors,
-                collection_time=datetime.now(timezone.utc),
-                next_collection=datetime.now(timezone.utc) + self.collection_intervals[Platform.INSTAGRAM]
-            )
-            
-        except Exception as e:
-            logger.error(f"Instagram metrics collection failed: {e}")
-            return MetricsCollectionResult(
-                success=False,
-                platform="instagram",
-                metrics_collected=0,
-                errors=[str(e)],
-                collection_time=datetime.now(timezone.utc)
-            )
+        """Collect metrics from Instagram (50 posts per Graph API batch call)"""
+        return await self._collect_platform_metrics(
+            db,
+            Platform.INSTAGRAM,
+            force_collection,
+            fetch=lambda account, post_ids: instagram_client.get_posts_metrics(
+                access_token=account.access_token,
+                post_ids=post_ids
+            ),
+            convert=self._instagram_to_unified_metrics
+        )
     
     async def _collect_facebook_metrics(
         self,
         db: Session,
         force_collection: bool = False
     ) -> MetricsCollectionResult:
-        """Collect metrics from Facebook"""
+        """Collect metrics from Facebook (50 posts per Graph API batch call)"""
+        return await self._collect_platform_metrics(
+            db,
+            Platform.FACEBOOK,
+            force_collection,
+            fetch=lambda account, post_ids: facebook_client.get_posts_insights(
+                access_token=account.access_token,
+                post_ids=post_ids
+            ),
+            convert=self._facebook_to_unified_metrics
+        )
+    
+    async def _collect_linkedin_metrics(
+        self,
+        db: Session,
+        force_collection: bool = False
+    ) -> MetricsCollectionResult:
+        """Collect metrics from LinkedIn (50 posts per batch GET)"""
+        async def fetch(account, post_ids):
+            if linkedin_client.client is None:
+                raise Exception("LinkedIn client not available")
+            return await linkedin_client.client.get_posts_analytics(
+                access_token=account.access_token,
+                ugc_post_urns=post_ids
+            )
+        
+        return await self._collect_platform_metrics(
+            db,
+            Platform.LINKEDIN,
+            force_collection,
+            fetch=fetch,
+            convert=self._linkedin_to_unified_metrics
+        )
+    
+    async def _collect_platform_metrics(
+        self,
+        db: Session,
+        platform: Platform,
+        force_collection: bool,
+        fetch: Callable[[Any, List[str]], Awaitable[Dict[str, Any]]],
+        convert: Callable[[Any, Any], UnifiedMetrics]
+    ) -> MetricsCollectionResult:
+        """
+        Collect metrics for every active account of a platform
+        
+        Accounts run concurrently under the platform's rate budget. Each
+        account's due posts are fetched with platform batch lookups and
+        every batch is saved with a single commit.
+        
+        Args:
+            db: Database session
+            platform: Platform to collect
+            force_collection: Collect regardless of intervals
+            fetch: Batch lookup returning analytics keyed by platform post ID
+            convert: Converts one post's analytics to UnifiedMetrics
+        
+        Returns:
+            Collection result for the platform
+        """
         try:
-            # Get Facebook accounts
-            facebook_accounts = db.query(SocialMediaAccount).filter(
-                SocialMediaAccount.platform == "facebook",
-                SocialMediaAccount.is_active == True
-            ).all()
+            accounts = self._get_active_accounts(db, platform)
             
-            if not facebook_accounts:
+            if not accounts:
                 return MetricsCollectionResult(
                     success=True,
-                    platform="facebook",
+                    platform=platform.value,
                     metrics_collected=0,
                     errors=[],
                     collection_time=datetime.now(timezone.utc)
                 )
             
-            total_metrics = 0
-            errors = []
+            budget = self._get_rate_budget(platform)
+            errors: List[str] = []
             
-            for account in facebook_accounts:
-                try:
-                    # Get recent content items for this account
-                    content_items = db.query(ContentItem).filter(
-                        ContentItem.platform == "facebook",
-                        ContentItem.account_id == account.account_id,
-                        ContentItem.status == "published"
-                    ).order_by(ContentItem.published_at.desc()).limit(self.batch_sizes[Platform.FACEBOOK]).all()
-                    
-                    # Collect metrics for each content item
-                    for content_item in content_items:
-                        if not self._should_collect_metrics(content_item, Platform.FACEBOOK, force_collection):
-                            continue
-                        
-                        try:
-                            # Get Facebook insights
-                            insights = await facebook_client.get_post_insights(
-                                access_token=account.access_token,
-                                post_id=content_item.platform_post_id
-                            )
-                            
-                            # Convert to unified metrics
-                            unified_metrics = self._facebook_to_unified_metrics(insights, content_item)
-                            
-                            # Save to database
-                            await self._save_metrics_to_db(db, unified_metrics, content_item)
-                            
-                            total_metrics += 1
-                            
-                            # Brief delay to respect rate limits
-                            await asyncio.sleep(0.2)
-                            
-                        except Exception as e:
-                            error_msg = f"Failed to collect Facebook metrics for content {content_item.id}: {e}"
-                            errors.append(error_msg)
-                            logger.error(error_msg)
-                
-                except Exception as e:
-                    error_msg = f"Failed to process Facebook account {account.account_id}: {e}"
-                    errors.append(error_msg)
-                    logger.error(error_msg)
+            collected = await asyncio.gather(*(
+                self._collect_account_metrics(db, platform, account, force_collection, budget, fetch, convert, errors)
+                for account in accounts
+            ))
             
             return MetricsCollectionResult(
                 success=len(errors) == 0,
-                platform="facebook",
-                metrics_collected=total_metrics,
+                platform=platform.value,
+                metrics_collected=sum(collected),
                 errors=errors,
                 collection_time=datetime.now(timezone.utc),
-                next_collection=datetime.now(timezone.utc) + self.collection_intervals[Platform.FACEBOOK]
+                next_collection=datetime.now(timezone.utc) + self.collection_intervals[platform]
             )
-            
+        
         except Exception as e:
-            logger.error(f"Facebook metrics collection failed: {e}")
+            logger.error(f"{platform.value.capitalize()} metrics collection failed: {e}")
             return MetricsCollectionResult(
                 success=False,
-                platform="facebook",
+                platform=platform.value,
                 metrics_collected=0,
                 errors=[str(e)],
                 collection_time=datetime.now(timezone.utc)
             )
     
-    async def _collect_linkedin_metrics(
+    async def _collect_account_metrics(
         self,
         db: Session,
-        force_collection: bool = False
-    ) -> MetricsCollectionResult:
-        """Collect metrics from LinkedIn"""
-        try:
-            # Get LinkedIn accounts
-            linkedin_accounts = db.query(SocialMediaAccount).filter(
-                SocialMediaAccount.platform == "linkedin",
-                SocialMediaAccount.is_active == True
-            ).all()
-            
-            if not linkedin_accounts:
-                return MetricsCollectionResult(
-                    success=True,
-                    platform="linkedin",
-                    metrics_collected=0,
-                    errors=[],
-                    collection_time=datetime.now(timezone.utc)
-                )
-            
-            total_metrics = 0
-            errors = []
-            
-            for account in linkedin_accounts:
-                try:
-                    # Get recent content items for this account
-                    content_items = db.query(ContentItem).filter(
-                        ContentItem.platform == "linkedin",
-                        ContentItem.account_id == account.account_id,
-                        ContentItem.status == "published"
-                    ).order_by(ContentItem.published_at.desc()).limit(self.batch_sizes[Platform.LINKEDIN]).all()
+        platform: Platform,
+        account: SocialMediaAccount,
+        force_collection: bool,
+        budget: "PlatformRateBudget",
+        fetch: Callable[[Any, List[str]], Awaitable[Dict[str, Any]]],
+        convert: Callable[[Any, Any], UnifiedMetrics],
+        errors: List[str]
+    ) -> int:
+        """Collect and save metrics for one account, returning the number saved"""
+        platform_name = platform.value.capitalize()
+        total_metrics = 0
+        
+        async with budget.accounts:
+            try:
+                content_items = self._get_due_content_items(db, platform, account, force_collection)
+                batch_size = self.batch_sizes[platform]
+                
+                for offset in range(0, len(content_items), batch_size):
+                    batch = content_items[offset:offset + batch_size]
+                    
+                    await budget.acquire()
+                    try:
+                        analytics_by_post = await fetch(account, [item.platform_post_id for item in batch])
+                    except Exception as e:
+                        error_msg = f"Failed to fetch {platform_name} metrics for account {account.account_id}: {e}"
+                        errors.append(error_msg)
+                        logger.error(error_msg)
+                        continue
                     
-                    # Collect metrics for each content item
-                    for content_item in content_items:
-                        if not self._should_collect_metrics(content_item, Platform.LINKEDIN, force_collection):
+                    metrics_batch = []
+                    for content_item in batch:
+                        analytics = analytics_by_post.get(content_item.platform_post_id)
+                        if analytics is None or (isinstance(analytics, dict) and analytics.get("error")):
+                            reason = analytics.get("error") if analytics else "not returned by the platform"
+                            errors.append(f"Failed to collect {platform_name} metrics for content {content_item.id}: {reason}")
                             continue
                         
                         try:
-                            # Get LinkedIn analytics (using existing client method)
-                            analytics = await linkedin_client.get_post_analytics(
-                                access_token=account.access_token,
-                                post_id=content_item.platform_post_id
-                            )
-                            
-                            # Convert to unified metrics
-                            unified_metrics = self._linkedin_to_unified_metrics(analytics, content_item)
-                            
-                            # Save to database
-                            await self._save_metrics_to_db(db, unified_metrics, content_item)
-                            
-                            total_metrics += 1
-                            
-                            # Brief delay to respect rate limits
-                            await asyncio.sleep(0.3)
-                            
+                            metrics_batch.append((convert(analytics, content_item), content_item))
                         except Exception as e:
-                            error_msg = f"Failed to collect LinkedIn metrics for content {content_item.id}: {e}"
+                            error_msg = f"Failed to collect {platform_name} metrics for content {content_item.id}: {e}"
                             errors.append(error_msg)
                             logger.error(error_msg)
-                
-                except Exception as e:
-                    error_msg = f"Failed to process LinkedIn account {account.account_id}: {e}"
-                    errors.append(error_msg)
-                    logger.error(error_msg)
-            
-            return MetricsCollectionResult(
-                success=len(errors) == 0,
-                platform="linkedin",
-                metrics_collected=total_metrics,
-                errors=errors,
-                collection_time=datetime.now(timezone.utc),
-                next_collection=datetime.now(timezone.utc) + self.collection_intervals[Platform.LINKEDIN]
-            )
+                    
+                    # No await between the bulk writes and the commit, so concurrent
+                    # accounts never interleave on the shared session
+                    total_metrics += self._save_metrics_batch(db, metrics_batch)
             
-        except Exception as e:
-            logger.error(f"LinkedIn metrics collection failed: {e}")
-            return MetricsCollectionResult(
-                success=False,
-                platform="linkedin",
-                metrics_collected=0,
-                errors=[str(e)],
-                collection_time=datetime.now(timezone.utc)
-            )
+            except Exception as e:
+                error_msg = f"Failed to process {platform_name} account {account.account_id}: {e}"
+                errors.append(error_msg)
+                logger.error(error_msg)
+        
+        return total_metrics
     
+    def _get_active_accounts(self, db: Session, platform: Platform) -> List[SocialMediaAccount]:
+        """Get active connected accounts for a platform"""
+        return db.query(SocialMediaAccount).filter(
+            SocialMediaAccount.platform == platform.value,
+            SocialMediaAccount.is_active == True
+        ).all()
+    
+    def _get_due_content_items(
+        self,
+        db: Session,
+        platform: Platform,
+        account: SocialMediaAccount,
+        force_collection: bool
+    ) -> List[Any]:
+        """
+        Get published posts of an account whose metrics are due
+        
+        Only the columns needed for collection and growth calculation are
+        loaded, so rows stay valid across the per-batch commits.
+        """
+        query = db.query(*CONTENT_ITEM_METRIC_COLUMNS).filter(
+            ContentItem.platform == platform.value,
+            ContentItem.user_id == account.user_id,
+            ContentItem.status == "published",
+            ContentItem.platform_post_id.isnot(None)
+        )
+        
+        if not force_collection:
+            cutoff = datetime.now(timezone.utc) - self.collection_intervals[platform]
+            query = query.filter(or_(
+                ContentItem.last_performance_update.is_(None),
+                ContentItem.last_performance_update < cutoff
+            ))
+        
+        return query.order_by(ContentItem.published_at.desc()).all()
+    
+    def _get_rate_budget(self, platform: Platform) -> "PlatformRateBudget":
+        """Get the rate budget for the current collection run"""
+        if platform not in self._rate_budgets:
+            self._rate_budgets[platform] = PlatformRateBudget(**self.rate_budgets[platform])
+        return self._rate_budgets[platform]
     
     def _should_collect_metrics(
         self,
@@ -544,64 +502,57 @@ class SocialMediaMetricsCollector:
             return True
         
         # Check if enough time has passed since last collection
-        if content_item.last_metrics_update:
-            time_since_last = datetime.now(timezone.utc) - content_item.last_metrics_update
+        if content_item.last_performance_update:
+            time_since_last = datetime.now(timezone.utc) - content_item.last_performance_update
             if time_since_last < self.collection_intervals[platform]:
                 return False
         
-        # Always collect for recently published content (within 24 hours)
-        if content_item.published_at:
-            time_since_publish = datetime.now(timezone.utc) - content_item.published_at
-            if time_since_publish < timedelta(hours=24):
-                return True
-        
-        # Collect for content that hasn't been updated recently
         return True
     
     def _twitter_to_unified_metrics(
         self,
-        analytics: TwitterAnalytics,
+        metrics: Dict[str, Any],
         content_item: ContentItem
     ) -> UnifiedMetrics:
-        """Convert Twitter analytics to unified metrics"""
+        """Convert Twitter tweet metrics to unified metrics"""
         return UnifiedMetrics(
             platform="twitter",
             content_id=str(content_item.id),
-            post_id=analytics.tweet_id,
-            impressions=analytics.impressions,
-            reach=analytics.impressions,  # Twitter doesn't separate reach from impressions
-            engagement=analytics.retweets + analytics.likes + analytics.replies + analytics.quotes,
-            likes=analytics.likes,
-            comments=analytics.replies,
-            shares=analytics.retweets + analytics.quotes,
-            clicks=analytics.url_clicks + analytics.profile_clicks,
+            post_id=metrics["tweet_id"],
+            impressions=metrics.get("impressions_count", 0),
+            reach=metrics.get("impressions_count", 0),  # Twitter doesn't separate reach from impressions
+            engagement=metrics.get("total_engagement", 0) + metrics.get("quotes_count", 0),
+            likes=metrics.get("likes_count", 0),
+            comments=metrics.get("replies_count", 0),
+            shares=metrics.get("retweets_count", 0) + metrics.get("quotes_count", 0),
+            clicks=0,  # Not part of public metrics
             video_views=None,  # Not available in basic analytics
-            saves=analytics.bookmarks,
-            engagement_rate=analytics.engagement_rate,
-            collected_at=analytics.fetched_at
+            saves=metrics.get("bookmarks_count", 0),
+            engagement_rate=metrics.get("engagement_rate", 0.0),
+            collected_at=datetime.now(timezone.utc)
         )
     
     def _instagram_to_unified_metrics(
         self,
-        insights: InstagramInsight,
+        insights: Dict[str, Any],
         content_item: ContentItem
     ) -> UnifiedMetrics:
-        """Convert Instagram insights to unified metrics"""
+        """Convert Instagram post metrics to unified metrics"""
         return UnifiedMetrics(
             platform="instagram",
             content_id=str(content_item.id),
-            post_id=insights.media_id,
-            impressions=insights.impressions,
-            reach=insights.reach,
-            engagement=insights.engagement,
-            likes=insights.likes,
-            comments=insights.comments,
-            shares=insights.shares,
-            clicks=insights.website_clicks,
-            video_views=insights.video_views,
-            saves=insights.saved,
+            post_id=insights["post_id"],
+            impressions=insights.get("impressions_count", 0),
+            reach=insights.get("reach_count", 0),
+            engagement=insights.get("total_engagement", 0),
+            likes=insights.get("likes_count", 0),
+            comments=insights.get("comments_count", 0),
+            shares=insights.get("shares_count", 0),
+            clicks=0,  # Not part of the post insights metrics
+            video_views=None,
+            saves=insights.get("saves_count", 0),
             engagement_rate=0.0,  # Will be calculated in __post_init__
-            collected_at=insights.fetched_at
+            collected_at=datetime.now(timezone.utc)
         )
     
     def _facebook_to_unified_metrics(
@@ -624,7 +575,7 @@ class SocialMediaMetricsCollector:
             video_views=insights.video_views,
             saves=None,  # Facebook doesn't have saves
             engagement_rate=0.0,  # Will be calculated in __post_init__
-            collected_at=insights.fetched_at
+            collected_at=datetime.now(timezone.utc)
         )
     
     def _linkedin_to_unified_metrics(
@@ -632,17 +583,20 @@ class SocialMediaMetricsCollector:
         analytics: Dict[str, Any],
         content_item: ContentItem
     ) -> UnifiedMetrics:
-        """Convert LinkedIn analytics to unified metrics"""
-        # LinkedIn analytics structure varies, adapt as needed
+        """Convert LinkedIn social actions to unified metrics"""
+        # socialActions reports like/comment summaries; flat keys are kept for other analytics shapes
+        likes = analytics.get("likesSummary", {}).get("totalLikes", analytics.get("likes", 0))
+        comments = analytics.get("commentsSummary", {}).get("aggregatedTotalComments", analytics.get("comments", 0))
+        
         return UnifiedMetrics(
             platform="linkedin",
             content_id=str(content_item.id),
             post_id=str(content_item.platform_post_id),
             impressions=analytics.get("impressions", 0),
             reach=analytics.get("reach", 0),
-            engagement=analytics.get("engagement", 0),
-            likes=analytics.get("likes", 0),
-            comments=analytics.get("comments", 0),
+            engagement=analytics.get("engagement", likes + comments),
+            likes=likes,
+            comments=comments,
             shares=analytics.get("shares", 0),
             clicks=analytics.get("clicks", 0),
             video_views=analytics.get("video_views"),
@@ -651,47 +605,100 @@ class SocialMediaMetricsCollector:
             collected_at=datetime.now(timezone.utc)
         )
     
-    async def _save_metrics_to_db(
+    def _save_metrics_batch(
         self,
         db: Session,
-        metrics: UnifiedMetrics,
-        content_item: ContentItem
-    ):
-        """Save unified metrics to database"""
-        try:
-            # Create performance snapshot
-            snapshot = ContentPerformanceSnapshot(
-                content_item_id=content_item.id,
-                timestamp=metrics.collected_at,
-                impressions=metrics.impressions,
-                reach=metrics.reach,
-                engagement=metrics.engagement,
-                likes=metrics.likes,
-                comments=metrics.comments,
-                shares=metrics.shares,
-                clicks=metrics.clicks,
-                video_views=metrics.video_views,
-                saves=metrics.saves,
-                engagement_rate=metrics.engagement_rate,
-                platform_specific_data=asdict(metrics)
-            )
-            
-            db.add(snapshot)
-            
-            # Update content item with latest metrics
-            content_item.total_impressions = metrics.impressions
-            content_item.total_engagement = metrics.engagement
-            content_item.engagement_rate = metrics.engagement_rate
-            content_item.last_metrics_update = metrics.collected_at
+        metrics_batch: List[Tuple[UnifiedMetrics, Any]]
+    ) -> int:
+        """
+        Store snapshots for changed posts and bulk-update content rollups with one commit
+        
+        Snapshots are skipped for posts whose counters did not change since the
+        last sweep; last_performance_update is still advanced for every post.
+        
+        Args:
+            db: Database session
+            metrics_batch: (metrics, content item row) pairs; rows need the
+                CONTENT_ITEM_METRIC_COLUMNS attributes
+                
+        Returns:
+            Number of content items saved
+        """
+        if not metrics_batch:
+            return 0
+        
+        snapshots = []
+        rollups = []
+        previous = {}
+        for metrics, content_item in metrics_batch:
+            # Only counters without a snapshot column are kept as platform metrics
+            platform_metrics = {
+                key: value for key, value in (
+                    ("impressions", metrics.impressions),
+                    ("engagement", metrics.engagement),
+                    ("saves", metrics.saves),
+                    ("video_views", metrics.video_views)
+                ) if value is not None
+            }
             
+            snapshots.append({
+                "content_item_id": content_item.id,
+                "snapshot_time": metrics.collected_at,
+                "likes_count": metrics.likes,
+                "shares_count": metrics.shares,
+                "comments_count": metrics.comments,
+                "reach_count": metrics.reach,
+                "click_count": metrics.clicks,
+                "engagement_rate": metrics.engagement_rate,
+                "likes_growth": metrics.likes - (content_item.likes_count or 0),
+                "shares_growth": metrics.shares - (content_item.shares_count or 0),
+                "comments_growth": metrics.comments - (content_item.comments_count or 0),
+                "reach_growth": metrics.reach - (content_item.reach_count or 0),
+                "platform_metrics": platform_metrics
+            })
+            rollups.append({
+                "id": content_item.id,
+                "likes_count": metrics.likes,
+                "shares_count": metrics.shares,
+                "comments_count": metrics.comments,
+                "reach_count": metrics.reach,
+                "click_count": metrics.clicks,
+                "engagement_rate": metrics.engagement_rate,
+                "last_performance_update": metrics.collected_at
+            })
+            # Never-collected posts always get a first snapshot
+            if content_item.last_performance_update is not None:
+                previous[content_item.id] = {
+                    "likes_count": content_item.likes_count,
+                    "shares_count": content_item.shares_count,
+                    "comments_count": content_item.comments_count,
+                    "reach_count": content_item.reach_count,
+                    "click_count": content_item.click_count
+                }
+        
+        try:
+            written = get_performance_snapshot_store().write_snapshots(db, snapshots, previous)
+            db.bulk_update_mappings(ContentItem, rollups)
             db.commit()
-            
-            logger.info(f"Saved metrics for content {content_item.id} on {metrics.platform}")
-            
         except Exception as e:
             db.rollback()
-            logger.error(f"Failed to save metrics to database: {e}")
+            logger.error(f"Failed to save metrics batch to database: {e}")
             raise
+        
+        logger.info(
+            f"Saved metrics for {len(metrics_batch)} content items on {metrics_batch[0][0].platform} "
+            f"({written} changed)"
+        )
+        return len(metrics_batch)
+    
+    async def _save_metrics_to_db(
+        self,
+        db: Session,
+        metrics: UnifiedMetrics,
+        content_item: ContentItem
+    ):
+        """Save unified metrics for a single content item"""
+        self._save_metrics_batch(db, [(metrics, content_item)])
     
     async def get_metrics_summary(
         self,
@@ -708,50 +715,55 @@ class SocialMediaMetricsCollector:
             days: Number of days to include in summary
             
         Returns:
-            Metrics summary
+            Metrics summary. Audience size is reported as reach, from the
+            reach_count rollups; impressions are not rolled up (Twitter, which
+            has no reach metric, records its impressions as reach)
         """
         since_date = datetime.now(timezone.utc) - timedelta(days=days)
         
-        query = db.query(ContentPerformanceSnapshot).filter(
-            ContentPerformanceSnapshot.timestamp >= since_date
+        # Daily rollups hold one row per content item and day
+        query = db.query(ContentPerformanceRollup, ContentItem.platform).join(
+            ContentItem, ContentItem.id == ContentPerformanceRollup.content_item_id
+        ).filter(
+            ContentPerformanceRollup.granularity == "day",
+            ContentPerformanceRollup.bucket_start >= since_date
         )
         
         if platform:
-            # Join with ContentItem to filter by platform
-            query = query.join(ContentItem).filter(ContentItem.platform == platform)
+            query = query.filter(ContentItem.platform == platform)
         
-        snapshots = query.all()
+        # Latest day per content item
+        latest: Dict[str, Tuple[ContentPerformanceRollup, str]] = {}
+        for rollup, platform_name in query.order_by(ContentPerformanceRollup.bucket_start):
+            latest[rollup.content_item_id] = (rollup, platform_name)
         
-        if not snapshots:
+        if not latest:
             return {
                 "total_content": 0,
-                "total_impressions": 0,
+                "total_reach": 0,
                 "total_engagement": 0,
                 "average_engagement_rate": 0.0,
                 "platforms": {}
             }
         
-        # Calculate aggregated metrics
-        total_impressions = sum(s.impressions for s in snapshots)
-        total_engagement = sum(s.engagement for s in snapshots)
-        avg_engagement_rate = sum(s.engagement_rate for s in snapshots) / len(snapshots)
-        
-        # Group by platform
         platforms = {}
-        for snapshot in snapshots:
-            platform_name = snapshot.content_item.platform
+        for rollup, platform_name in latest.values():
             if platform_name not in platforms:
                 platforms[platform_name] = {
                     "content_count": 0,
-                    "impressions": 0,
+                    "reach": 0,
                     "engagement": 0,
                     "engagement_rate": 0.0
                 }
             
+            engagement = (rollup.likes_count or 0) + (rollup.shares_count or 0) + \
+                (rollup.comments_count or 0) + (rollup.click_count or 0)
             platforms[platform_name]["content_count"] += 1
-            platforms[platform_name]["impressions"] += snapshot.impressions
-            platforms[platform_name]["engagement"] += snapshot.engagement
-            platforms[platform_name]["engagement_rate"] += snapshot.engagement_rate
+            platforms[platform_name]["reach"] += rollup.reach_count or 0
+            platforms[platform_name]["engagement"] += engagement
+            platforms[platform_name]["engagement_rate"] += rollup.engagement_rate or 0.0
+        
+        total_engagement_rate = sum(data["engagement_rate"] for data in platforms.values())
         
         # Calculate averages for each platform
         for platform_name, data in platforms.items():
@@ -759,10 +771,10 @@ class SocialMediaMetricsCollector:
                 data["engagement_rate"] /= data["content_count"]
         
         return {
-            "total_content": len(snapshots),
-            "total_impressions": total_impressions,
-            "total_engagement": total_engagement,
-            "average_engagement_rate": avg_engagement_rate,
+            "total_content": len(latest),
+            "total_reach": sum(data["reach"] for data in platforms.values()),
+            "total_engagement": sum(data["engagement"] for data in platforms.values()),
+            "average_engagement_rate": total_engagement_rate / len(latest),
             "platforms": platforms,
             "collection_period_days": days,
             "last_updated": datetime.now(timezone.utc)
@@ -0,0 +1,103 @@
+"""
+Moderation Verdict Cache
+
+Content-hash keyed cache of moderation verdicts shared by
+ContentModerationService and ContentSafetyService.
+
+Keys combine the moderation policy version with a SHA-256 of the normalized
+content, so bumping MODERATION_POLICY_VERSION (or changing thresholds and
+patterns together with it) invalidates every cached verdict at once.
+Concurrent lookups for the same content share one in-flight computation,
+which means the OpenAI moderation endpoint is called at most once per
+unique text even when the middleware and image generation screen it at the
+same time.
+"""
+
+import logging
+import unicodedata
+from typing import Any, Dict, Optional
+
+from backend.services.async_ttl_cache import AsyncTTLCache, sha256_hex
+
+logger = logging.getLogger(__name__)
+
+# Bump whenever moderation thresholds, patterns or models change
+MODERATION_POLICY_VERSION = "2025.2"
+
+# Model used for every OpenAI moderation call so both services share verdicts;
+# pinned to the omni family (text-moderation-* is deprecated)
+OPENAI_MODERATION_MODEL = "omni-moderation-latest"
+
+
+def content_fingerprint(content: str) -> str:
+    """SHA-256 of the normalized content used as the cache key"""
+    return sha256_hex(unicodedata.normalize("NFC", content or "").strip())
+
+
+class ModerationVerdictCache(AsyncTTLCache):
+    """
+    LRU cache of moderation verdicts with TTL and single-flight
+
+    Keys carry the policy version, so a cache built for a new version never
+    serves verdicts from an old one.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 10000,
+        ttl_seconds: int = 3600,
+        policy_version: str = MODERATION_POLICY_VERSION
+    ):
+        super().__init__(max_entries=max_entries, ttl_seconds=ttl_seconds)
+        self.policy_version = policy_version
+
+    def make_key(self, namespace: str, content: str) -> str:
+        """Build the cache key for a namespace and content"""
+        return f"{self.policy_version}:{namespace}:{content_fingerprint(content)}"
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Cache statistics for monitoring"""
+        return {**super().get_stats(), "policy_version": self.policy_version}
+
+
+async def get_openai_moderation(client: Any, content: str) -> Dict[str, Any]:
+    """
+    Call the OpenAI moderation endpoint through the shared verdict cache
+
+    Args:
+        client: AsyncOpenAI client
+        content: Text to moderate
+
+    Returns:
+        Dictionary with flagged, categories and category_scores
+
+    Raises:
+        Exception: Any API error (errors are never cached)
+    """
+    async def _fetch() -> Dict[str, Any]:
+        response = await client.moderations.create(
+            input=content,
+            model=OPENAI_MODERATION_MODEL
+        )
+        result = response.results[0]
+        return {
+            "flagged": result.flagged,
+            "categories": dict(result.categories),
+            "category_scores": dict(result.category_scores)
+        }
+
+    return await get_moderation_cache().get_or_compute("openai", content, _fetch)
+
+
+# Global cache instance
+_moderation_cache: Optional[ModerationVerdictCache] = None
+
+
+def get_moderation_cache() -> ModerationVerdictCache:
+    """Get or create the process-wide moderation verdict cache"""
+    global _moderation_cache
+
+    if _moderation_cache is None:
+        _moderation_cache = ModerationVerdictCache()
+
+    return _moderation_cache
@@ -0,0 +1,379 @@
+"""
+Multi-Pattern Matching Engine
+
+Shared single-scan matcher for content safety, moderation and avoid-list
+rules. A rule set is compiled once per version into:
+
+- a token-level Aho-Corasick automaton for literal word terms, including
+  multi-word phrases (``\\b(?:fake\\s+news|hoax)\\b`` style rules are
+  decomposed into literal terms automatically), and
+- one combined regex for the remaining patterns, where every rule is an
+  optional lookahead so all rules are evaluated at every position in a
+  single pass over the text.
+
+Patterns that cannot share a combined regex (backreferences, named groups,
+inline flags) are compiled on their own and scanned separately.
+
+A scan returns every hit with its rule, category and character offsets.
+Hits of the same rule never overlap and follow regex alternation order,
+so per-rule results are identical to ``re.findall`` on that rule alone.
+Each rule keeps its own regex flags (case-insensitive by default).
+"""
+
+import itertools
+import logging
+import re
+import threading
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Word tokenizer; token boundaries coincide with regex \b boundaries
+_TOKEN_RE = re.compile(r"\w+")
+
+# Rule patterns of the form \b(a|b\s+c|d\s*e)\b that can be matched literally
+_WORD_ALTERNATION_RE = re.compile(r"^\\b\((?:\?:)?(?P<body>[^()\[\]{}]*)\)\\b$")
+_LITERAL_ALTERNATIVE_RE = re.compile(r"^\w+(?:\\s[+*]\w+)*$")
+
+# Regex rules per combined pattern, keeps conditional nesting shallow
+_REGEX_CHUNK_SIZE = 50
+
+# Constructs that change meaning or fail inside a combined pattern: numbered
+# and named backreferences, named groups, conditionals and inline flags
+# (an unescaped backslash or parenthesis is preceded by an even run of \\)
+_STANDALONE_CONSTRUCT_RE = re.compile(
+    r"(?<!\\)(?:\\\\)*(?:\\[1-9]|\\g<|\(\?P[<=]|\(\?<[^=!]|\(\?\(|\(\?[aiLmsux-]+[:)])"
+)
+
+# Flags under which a word alternation can go to the token automaton
+_LITERAL_SAFE_FLAGS = re.IGNORECASE | re.MULTILINE | re.DOTALL
+
+
+@dataclass(frozen=True)
+class PatternRule:
+    """A single matching rule"""
+    rule_id: str
+    category: str
+    pattern: str
+    # True: pattern is a regex. False: pattern is a literal substring.
+    is_regex: bool = True
+    flags: int = re.IGNORECASE
+    metadata: Dict[str, Any] = field(default_factory=dict, compare=False, hash=False)
+
+
+@dataclass(frozen=True)
+class PatternHit:
+    """A rule match inside the scanned text"""
+    rule_id: str
+    category: str
+    start: int
+    end: int
+    text: str
+
+
+def _needs_own_regex(pattern: str) -> bool:
+    """True for a regex that must not be merged into a combined pattern"""
+    return _STANDALONE_CONSTRUCT_RE.search(pattern) is not None
+
+
+def _literal_terms(pattern: str) -> Optional[List[Tuple[str, ...]]]:
+    """
+    Decompose a word-alternation regex into literal token sequences.
+
+    Returns None when the pattern needs the regex engine. Alternatives are
+    returned in pattern order; ``\\s*`` joins expand into both the spaced
+    and the concatenated spelling.
+    """
+    match = _WORD_ALTERNATION_RE.match(pattern)
+    if not match:
+        return None
+
+    terms: List[Tuple[str, ...]] = []
+    for alternative in match.group("body").split("|"):
+        if not _LITERAL_ALTERNATIVE_RE.match(alternative):
+            return None
+
+        words = re.split(r"\\s([+*])", alternative)
+        # words alternates token, joiner, token, joiner, ...
+        tokens = words[0::2]
+        joiners = words[1::2]
+        optional = [i for i, joiner in enumerate(joiners) if joiner == "*"]
+
+        for merged in itertools.product((False, True), repeat=len(optional)):
+            merge_at = {optional[i] for i, flag in enumerate(merged) if flag}
+            sequence = [tokens[0].lower()]
+            for i, token in enumerate(tokens[1:]):
+                if i in merge_at:
+                    sequence[-1] += token.lower()
+                else:
+                    sequence.append(token.lower())
+            terms.append(tuple(sequence))
+
+    return terms
+
+
+class TokenAutomaton:
+    """Aho-Corasick automaton whose alphabet is word tokens"""
+
+    def __init__(self):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[Tuple[int, int, int]]] = [[]]
+
+    def add(self, tokens: Sequence[str], rule_index: int, alternative: int) -> None:
+        """Add a token sequence reported as (rule_index, alternative, length)"""
+        state = 0
+        for token in tokens:
+            next_state = self._goto[state].get(token)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][token] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            state = next_state
+        self._output[state].append((rule_index, alternative, len(tokens)))
+
+    def build(self) -> None:
+        """Compute failure links breadth-first"""
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for token, child in self._goto[state].items():
+                queue.append(child)
+                fallback = self._fail[state]
+                while fallback and token not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(token, 0)
+                self._fail[child] = target if target != child else 0
+                self._output[child] = self._output[child] + self._output[self._fail[child]]
+
+    def search(self, tokens: Sequence[str]) -> Iterable[Tuple[int, int, int, int]]:
+        """Yield (end_token_index, rule_index, alternative, length) for all matches"""
+        goto, fail, output = self._goto, self._fail, self._output
+        state = 0
+        for index, token in enumerate(tokens):
+            while state and token not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(token, 0)
+            for rule_index, alternative, length in output[state]:
+                yield index, rule_index, alternative, length
+
+    @property
+    def size(self) -> int:
+        return len(self._goto)
+
+
+class MultiPatternMatcher:
+    """
+    Compiled rule set answering "which rules hit where" in one scan.
+
+    Instances are immutable after construction; use get_pattern_matcher()
+    to share compiled matchers by rule-set name and version.
+    """
+
+    def __init__(self, rules: Sequence[PatternRule], version: str = "1"):
+        self.rules = list(rules)
+        self.version = version
+
+        self._automaton = TokenAutomaton()
+        self._regex_rules: List[int] = []
+        self._regexes: List[Tuple[re.Pattern, List[Tuple[str, int]]]] = []
+        self._standalone: List[Tuple[re.Pattern, int]] = []
+        self.literal_rule_count = 0
+
+        for rule_index, rule in enumerate(self.rules):
+            case_insensitive_words = rule.flags & re.IGNORECASE and not rule.flags & ~_LITERAL_SAFE_FLAGS
+            terms = _literal_terms(rule.pattern) if rule.is_regex and case_insensitive_words else None
+            if terms is None:
+                self._regex_rules.append(rule_index)
+                continue
+
+            self.literal_rule_count += 1
+            for alternative, tokens in enumerate(terms):
+                self._automaton.add(tokens, rule_index, alternative)
+
+        self._automaton.build()
+        self._compile_regexes()
+
+        # Layers of one request usually scan the same text back to back
+        self._last_scan: Tuple[Optional[str], List[PatternHit]] = (None, [])
+
+    def _compile_regexes(self) -> None:
+        """
+        Combine regex rules into chunked lookahead alternations.
+
+        Rules are grouped by their flags and a cheap positional gate so the
+        engine only tries the lookaheads where some rule can start: word
+        boundaries for ``\\b``-anchored patterns, the first characters for
+        literal substrings, and every position for anything else. Rules
+        that cannot be combined get a regex of their own.
+        """
+        # (gate, flags) -> rule indexes; a gate of None means "first characters"
+        buckets: Dict[Tuple[Optional[str], int], List[int]] = {}
+        for rule_index in self._regex_rules:
+            rule = self.rules[rule_index]
+            if rule.is_regex and _needs_own_regex(rule.pattern):
+                self._standalone.append((re.compile(rule.pattern, rule.flags), rule_index))
+                continue
+            if not rule.is_regex and rule.pattern:
+                gate = None
+            elif rule.pattern.startswith(r"\b"):
+                gate = r"\b"
+            else:
+                gate = ""
+            buckets.setdefault((gate, rule.flags), []).append(rule_index)
+
+        for (gate, flags), rule_indexes in buckets.items():
+            for offset in range(0, len(rule_indexes), _REGEX_CHUNK_SIZE):
+                chunk = rule_indexes[offset:offset + _REGEX_CHUNK_SIZE]
+                if gate is None:
+                    # Compiled with the chunk's flags, so the class follows the rules' case handling
+                    first_chars = {self.rules[rule_index].pattern[:1] for rule_index in chunk}
+                    chunk_gate = "(?=[" + "".join(re.escape(c) for c in sorted(first_chars)) + "])"
+                else:
+                    chunk_gate = gate
+                self._regexes.append(self._compile_chunk(chunk, chunk_gate, flags))
+
+    def _compile_chunk(
+        self,
+        chunk: List[int],
+        gate: str,
+        flags: int
+    ) -> Tuple[re.Pattern, List[Tuple[str, int]]]:
+        """Compile one gated lookahead alternation over a chunk of rules sharing flags"""
+        groups: List[Tuple[str, int]] = []
+        lookaheads = []
+
+        for position, rule_index in enumerate(chunk):
+            rule = self.rules[rule_index]
+            source = rule.pattern if rule.is_regex else re.escape(rule.pattern)
+            re.compile(source, flags)  # Surface invalid patterns with their own error
+            name = f"r{position}"
+            groups.append((name, rule_index))
+            lookaheads.append(f"(?:(?=(?P<{name}>{source}))|)")
+
+        # Only stop where at least one rule matched
+        guard = "(?!)"
+        for name, _ in reversed(groups):
+            guard = f"(?({name})|{guard})"
+
+        combined = re.compile(gate + "".join(lookaheads) + guard, flags)
+        return combined, groups
+
+    def scan(self, text: str) -> List[PatternHit]:
+        """
+        Scan text once and return all hits ordered by offset.
+
+        Args:
+            text: Text to scan (offsets refer to this string)
+
+        Returns:
+            List of PatternHit sorted by (start, rule order)
+        """
+        if not text:
+            return []
+
+        last_text, last_hits = self._last_scan
+        if text == last_text:
+            return list(last_hits)
+
+        # (start, alternative, end, rule_index) candidates per rule
+        candidates: List[Tuple[int, int, int, int]] = []
+
+        if self._automaton.size > 1:
+            spans = []
+            tokens = []
+            for match in _TOKEN_RE.finditer(text):
+                spans.append(match.span())
+                tokens.append(match.group().lower())
+
+            for end_index, rule_index, alternative, length in self._automaton.search(tokens):
+                start_index = end_index - length + 1
+                if length > 1 and not all(
+                    text[spans[i][1]:spans[i + 1][0]].isspace()
+                    for i in range(start_index, end_index)
+                ):
+                    continue
+                candidates.append((spans[start_index][0], alternative, spans[end_index][1], rule_index))
+
+        for combined, groups in self._regexes:
+            for match in combined.finditer(text):
+                for name, rule_index in groups:
+                    start, end = match.span(name)
+                    if start >= 0:
+                        candidates.append((start, 0, end, rule_index))
+
+        for compiled, rule_index in self._standalone:
+            for match in compiled.finditer(text):
+                candidates.append((match.start(), 0, match.end(), rule_index))
+
+        # Per rule, keep leftmost non-overlapping matches like re.findall
+        candidates.sort()
+        last_end: Dict[int, int] = {}
+        hits = []
+        for start, _, end, rule_index in candidates:
+            if start < last_end.get(rule_index, 0):
+                continue
+            last_end[rule_index] = max(end, start + 1)
+            rule = self.rules[rule_index]
+            hits.append(PatternHit(rule.rule_id, rule.category, start, end, text[start:end]))
+
+        self._last_scan = (text, hits)
+        return list(hits)
+
+    def group_by_rule(self, hits: Iterable[PatternHit]) -> Dict[str, List[PatternHit]]:
+        """Group hits by rule id preserving order"""
+        grouped: Dict[str, List[PatternHit]] = {}
+        for hit in hits:
+            grouped.setdefault(hit.rule_id, []).append(hit)
+        return grouped
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Compilation statistics"""
+        return {
+            "version": self.version,
+            "rules": len(self.rules),
+            "literal_rules": self.literal_rule_count,
+            "regex_rules": len(self._regex_rules),
+            "standalone_rules": len(self._standalone),
+            "automaton_states": self._automaton.size
+        }
+
+
+# Compiled matchers shared across service instances
+_matcher_cache: "OrderedDict[Tuple[str, str], MultiPatternMatcher]" = OrderedDict()
+_matcher_lock = threading.Lock()
+_MAX_CACHED_MATCHERS = 64
+
+
+def get_pattern_matcher(name: str, version: str, rules: Sequence[PatternRule]) -> MultiPatternMatcher:
+    """
+    Get the compiled matcher for a rule set, compiling it on first use.
+
+    Args:
+        name: Rule-set name (e.g. "moderation", "avoid_list")
+        version: Rule-set version; a new version triggers recompilation
+        rules: Rules to compile when the (name, version) is not cached
+
+    Returns:
+        Compiled MultiPatternMatcher
+    """
+    key = (name, version)
+    with _matcher_lock:
+        matcher = _matcher_cache.get(key)
+        if matcher is not None:
+            _matcher_cache.move_to_end(key)
+            return matcher
+
+    matcher = MultiPatternMatcher(rules, version=version)
+    logger.debug(f"Compiled pattern matcher {name}@{version}: {matcher.get_stats()}")
+
+    with _matcher_lock:
+        _matcher_cache[key] = matcher
+        while len(_matcher_cache) > _MAX_CACHED_MATCHERS:
+            _matcher_cache.popitem(last=False)
+
+    return matcher
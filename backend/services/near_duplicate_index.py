@@ -0,0 +1,283 @@
+"""
+Near-Duplicate Content Index
+
+Per-organization SimHash fingerprints of normalized post text, stored in
+banded lookup tables so trivially reworded copies of existing content are
+found in microseconds, before paying for an embedding or a vector search.
+
+A 64-bit fingerprint is split into BAND_COUNT bands of equal width. By the
+pigeonhole principle, two fingerprints that differ in at most
+BAND_COUNT * (r + 1) - 1 bits differ in at most r bits within at least one
+band, so probing each band's table with every value within r bits of the
+probe's band finds all of them while only comparing against the few
+fingerprints sharing those band values.
+
+Text with no words (emoji, punctuation or a bare link) has no fingerprint
+(0) and is never indexed or matched; otherwise all such posts would be
+duplicates of each other.
+"""
+
+import hashlib
+import itertools
+import logging
+import re
+import threading
+import unicodedata
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Dict, Hashable, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+FINGERPRINT_BITS = 64
+BAND_COUNT = 4
+BAND_BITS = FINGERPRINT_BITS // BAND_COUNT
+BAND_MASK = (1 << BAND_BITS) - 1
+
+# Bits that may differ for two posts to count as near-duplicates. Short posts
+# have few features, so one reworded word moves a fingerprint by ~3-6 bits
+# while unrelated posts stay 11+ bits apart
+MAX_HAMMING_DISTANCE = 6
+
+DEFAULT_SCOPE = "global"
+
+_URL_RE = re.compile(r"https?://\S+|www\.\S+")
+_NON_WORD_RE = re.compile(r"[^\w#@]+")
+
+
+@dataclass
+class NearDuplicateMatch:
+    """Indexed item that is a near-duplicate of the probe text"""
+    item_id: str
+    distance: int
+
+    @property
+    def similarity(self) -> float:
+        """1.0 for identical fingerprints, falling linearly with Hamming distance"""
+        return 1.0 - self.distance / FINGERPRINT_BITS
+
+
+def normalize_post_text(text: str) -> str:
+    """Case-fold, strip links and punctuation, and collapse whitespace"""
+    text = unicodedata.normalize("NFKC", text or "").casefold()
+    text = _URL_RE.sub(" ", text)
+    return " ".join(_NON_WORD_RE.sub(" ", text).split())
+
+
+def content_scope(metadata: Optional[Dict]) -> Optional[str]:
+    """Organization (or, for single-user content, user) a post is indexed under"""
+    metadata = metadata or {}
+    scope = metadata.get("organization_id") or metadata.get("user_id")
+    return str(scope) if scope is not None else None
+
+
+def _feature_hash(feature: str) -> int:
+    return int.from_bytes(hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+def simhash(text: str) -> int:
+    """
+    64-bit SimHash of a post over its normalized words
+
+    Args:
+        text: Raw post text (normalized here)
+
+    Returns:
+        Fingerprint; 0 (no fingerprint) for text with no words
+    """
+    words = normalize_post_text(text).split()
+    if not words:
+        return 0
+
+    hashes = np.fromiter((_feature_hash(word) for word in words), dtype=np.uint64, count=len(words))
+    bits = np.unpackbits(hashes.view(np.uint8), bitorder="little").reshape(len(words), FINGERPRINT_BITS)
+    majority = bits.sum(axis=0, dtype=np.int64) * 2 > len(words)
+    return int(np.packbits(majority, bitorder="little").view("<u8")[0])
+
+
+def hamming_distance(a: int, b: int) -> int:
+    """Number of differing bits between two fingerprints"""
+    return (a ^ b).bit_count()
+
+
+def _scope_key(organization_id: Optional[Hashable]) -> Hashable:
+    return DEFAULT_SCOPE if organization_id is None else organization_id
+
+
+class _ScopeTables:
+    """Fingerprints and band tables for one organization"""
+
+    __slots__ = ("fingerprints", "bands")
+
+    def __init__(self):
+        self.fingerprints: Dict[str, int] = {}
+        # Buckets hold (item_id, fingerprint) so candidates are checked without another lookup
+        self.bands: List[Dict[int, List[Tuple[str, int]]]] = [defaultdict(list) for _ in range(BAND_COUNT)]
+
+
+class NearDuplicateIndex:
+    """
+    In-process SimHash index with banded lookup, partitioned by organization
+
+    Thread-safe; lookups never compare fingerprints across organizations.
+    """
+
+    def __init__(self, max_distance: int = MAX_HAMMING_DISTANCE):
+        if max_distance < 0:
+            raise ValueError("max_distance must not be negative")
+        self.max_distance = max_distance
+        # Differing bits to probe per band so every match within max_distance is found
+        probe_radius = max_distance // BAND_COUNT
+        self._probe_masks = [
+            sum(1 << bit for bit in bits)
+            for radius in range(probe_radius + 1)
+            for bits in itertools.combinations(range(BAND_BITS), radius)
+        ]
+        self._scopes: Dict[Hashable, _ScopeTables] = {}
+        self._lock = threading.Lock()
+
+        self.lookups = 0
+        self.duplicates_found = 0
+
+    @staticmethod
+    def _band_values(fingerprint: int) -> List[int]:
+        return [fingerprint >> (band * BAND_BITS) & BAND_MASK for band in range(BAND_COUNT)]
+
+    def add(self, item_id: str, text: str, organization_id: Optional[Hashable] = None, fingerprint: Optional[int] = None) -> int:
+        """
+        Index a post, replacing any earlier fingerprint for the same item
+
+        Args:
+            item_id: Content identifier returned by lookups
+            text: Post text (ignored when `fingerprint` is given)
+            organization_id: Scope to index under
+            fingerprint: Precomputed SimHash
+
+        Returns:
+            The item's fingerprint; 0 when the text has no words and was not indexed
+        """
+        if fingerprint is None:
+            fingerprint = simhash(text)
+        scope_key = _scope_key(organization_id)
+
+        with self._lock:
+            scope = self._scopes.get(scope_key)
+            if not fingerprint:
+                if scope is not None and item_id in scope.fingerprints:
+                    self._remove_locked(scope, item_id)
+                return fingerprint
+            if scope is None:
+                scope = self._scopes[scope_key] = _ScopeTables()
+            if item_id in scope.fingerprints:
+                self._remove_locked(scope, item_id)
+            scope.fingerprints[item_id] = fingerprint
+            entry = (item_id, fingerprint)
+            for table, value in zip(scope.bands, self._band_values(fingerprint)):
+                table[value].append(entry)
+        return fingerprint
+
+    def remove(self, item_id: str, organization_id: Optional[Hashable] = None) -> bool:
+        """
+        Drop an item from the index
+
+        Returns:
+            True if the item was indexed
+        """
+        with self._lock:
+            scope = self._scopes.get(_scope_key(organization_id))
+            if scope is None or item_id not in scope.fingerprints:
+                return False
+            self._remove_locked(scope, item_id)
+            return True
+
+    def _remove_locked(self, scope: _ScopeTables, item_id: str) -> None:
+        fingerprint = scope.fingerprints.pop(item_id)
+        for table, value in zip(scope.bands, self._band_values(fingerprint)):
+            bucket = table[value]
+            bucket.remove((item_id, fingerprint))
+            if not bucket:
+                del table[value]
+
+    def find_near_duplicates(
+        self,
+        text: str,
+        organization_id: Optional[Hashable] = None,
+        max_distance: Optional[int] = None,
+        fingerprint: Optional[int] = None
+    ) -> List[NearDuplicateMatch]:
+        """
+        Indexed posts within `max_distance` bits of the text's fingerprint
+
+        Args:
+            text: Post text (ignored when `fingerprint` is given)
+            organization_id: Scope to search
+            max_distance: Hamming threshold, at most the index's own
+            fingerprint: Precomputed SimHash
+
+        Returns:
+            Matches, closest first; none for text with no words
+        """
+        if fingerprint is None:
+            fingerprint = simhash(text)
+        max_distance = self.max_distance if max_distance is None else min(max_distance, self.max_distance)
+
+        with self._lock:
+            self.lookups += 1
+            scope = self._scopes.get(_scope_key(organization_id))
+            if scope is None or not fingerprint:
+                return []
+
+            # An item can sit in several probed buckets; the dict keeps it once
+            matches = {}
+            for table, value in zip(scope.bands, self._band_values(fingerprint)):
+                for mask in self._probe_masks:
+                    for item_id, candidate in table.get(value ^ mask, ()):
+                        distance = (fingerprint ^ candidate).bit_count()
+                        if distance <= max_distance:
+                            matches[item_id] = distance
+            if matches:
+                self.duplicates_found += 1
+
+        return sorted(
+            (NearDuplicateMatch(item_id, distance) for item_id, distance in matches.items()),
+            key=lambda match: match.distance
+        )
+
+    def find_first(self, text: str, organization_id: Optional[Hashable] = None) -> Optional[NearDuplicateMatch]:
+        """Closest near-duplicate of the text, or None"""
+        matches = self.find_near_duplicates(text, organization_id)
+        return matches[0] if matches else None
+
+    def __len__(self) -> int:
+        return sum(len(scope.fingerprints) for scope in self._scopes.values())
+
+    def clear(self) -> None:
+        """Drop every fingerprint"""
+        with self._lock:
+            self._scopes.clear()
+
+    def get_stats(self) -> Dict[str, int]:
+        """Index statistics for monitoring"""
+        return {
+            "fingerprints": len(self),
+            "organizations": len(self._scopes),
+            "lookups": self.lookups,
+            "duplicates_found": self.duplicates_found,
+            "max_distance": self.max_distance
+        }
+
+
+# Global index instance
+_near_duplicate_index: Optional[NearDuplicateIndex] = None
+
+
+def get_near_duplicate_index() -> NearDuplicateIndex:
+    """Get or create the process-wide near-duplicate index"""
+    global _near_duplicate_index
+
+    if _near_duplicate_index is None:
+        _near_duplicate_index = NearDuplicateIndex()
+
+    return _near_duplicate_index
@@ -0,0 +1,354 @@
+"""
+Performance Snapshot Storage
+
+Compact, time-partitioned history for content performance:
+
+- content_performance_snapshots is range-partitioned by month on
+  snapshot_time (PostgreSQL). Partitions are created ahead of time and
+  dropped whole once they fall out of retention.
+- Snapshots are delta-only: a row is written only when one of the
+  counters changed since the previous sweep.
+- Every stored snapshot is folded into hourly and daily rollups
+  (content_performance_rollups), which trend queries read instead of
+  scanning raw history.
+"""
+import logging
+import re
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from sqlalchemy import case, text
+from sqlalchemy.orm import Session
+
+from backend.db.models import ContentPerformanceRollup, ContentPerformanceSnapshot
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_TABLE = ContentPerformanceSnapshot.__tablename__
+DEFAULT_PARTITION = f"{SNAPSHOT_TABLE}_default"
+_PARTITION_NAME_RE = re.compile(rf"^{SNAPSHOT_TABLE}_y(\d{{4}})m(\d{{2}})$")
+
+# Counters that make a snapshot worth storing when any of them changes
+SNAPSHOT_COUNTERS = ("likes_count", "shares_count", "comments_count", "reach_count", "click_count")
+
+# Rollups keep the latest value of these columns per bucket
+ROLLUP_LATEST_COLUMNS = SNAPSHOT_COUNTERS + ("engagement_rate", "engagement_velocity", "viral_coefficient")
+
+ROLLUP_GRANULARITIES = ("hour", "day")
+
+# Rows per upsert statement
+_UPSERT_CHUNK_SIZE = 500
+
+
+def counters_changed(previous: Optional[Mapping[str, Any]], current: Mapping[str, Any]) -> bool:
+    """True when there is no previous value or any counter differs"""
+    if previous is None:
+        return True
+    return any(
+        int(previous.get(counter) or 0) != int(current.get(counter) or 0)
+        for counter in SNAPSHOT_COUNTERS
+    )
+
+
+def bucket_start(timestamp: datetime, granularity: str) -> datetime:
+    """Start of the hour or day bucket containing timestamp"""
+    start = timestamp.replace(minute=0, second=0, microsecond=0)
+    if granularity == "day":
+        start = start.replace(hour=0)
+    return start
+
+
+def _month_start(value: datetime) -> datetime:
+    return value.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def _add_months(value: datetime, months: int) -> datetime:
+    month_index = value.year * 12 + value.month - 1 + months
+    return value.replace(year=month_index // 12, month=month_index % 12 + 1)
+
+
+def partition_name(month: datetime) -> str:
+    """Name of the monthly partition holding month"""
+    return f"{SNAPSHOT_TABLE}_y{month.year:04d}m{month.month:02d}"
+
+
+def partition_ddl(month: datetime) -> str:
+    """CREATE statement for the monthly partition holding month"""
+    start = _month_start(month)
+    end = _add_months(start, 1)
+    return (
+        f"CREATE TABLE IF NOT EXISTS {partition_name(start)} "
+        f"PARTITION OF {SNAPSHOT_TABLE} "
+        f"FOR VALUES FROM ('{start:%Y-%m-%d}') TO ('{end:%Y-%m-%d}')"
+    )
+
+
+class PerformanceSnapshotStore:
+    """Writes delta-only snapshots with rollups and manages partitions"""
+
+    def __init__(self, partition_months_ahead: int = 3, hourly_retention_days: int = 30):
+        self.partition_months_ahead = partition_months_ahead
+        self.hourly_retention_days = hourly_retention_days
+
+    def write_snapshots(
+        self,
+        db: Session,
+        snapshots: List[Dict[str, Any]],
+        previous: Optional[Mapping[str, Mapping[str, Any]]] = None
+    ) -> int:
+        """
+        Bulk-insert changed snapshots and fold them into rollups (no commit)
+
+        Args:
+            db: Database session
+            snapshots: ContentPerformanceSnapshot column mappings
+            previous: Last known counters keyed by content item ID; snapshots
+                whose counters match are skipped
+
+        Returns:
+            Number of snapshots written
+        """
+        if previous is not None:
+            snapshots = [
+                snapshot for snapshot in snapshots
+                if counters_changed(previous.get(snapshot["content_item_id"]), snapshot)
+            ]
+        if not snapshots:
+            return 0
+
+        now = datetime.now(timezone.utc)
+        for snapshot in snapshots:
+            snapshot.setdefault("snapshot_time", now)
+
+        db.bulk_insert_mappings(ContentPerformanceSnapshot, snapshots)
+        self.upsert_rollups(db, snapshots)
+        return len(snapshots)
+
+    def upsert_rollups(self, db: Session, snapshots: Iterable[Mapping[str, Any]]) -> int:
+        """
+        Fold snapshots into their hourly and daily rollup buckets
+
+        Returns:
+            Number of rollup rows inserted or updated
+        """
+        buckets: Dict[Tuple[str, str, datetime], Dict[str, Any]] = {}
+        for snapshot in sorted(snapshots, key=lambda s: s["snapshot_time"]):
+            for granularity in ROLLUP_GRANULARITIES:
+                start = bucket_start(snapshot["snapshot_time"], granularity)
+                key = (snapshot["content_item_id"], granularity, start)
+                row = buckets.get(key)
+                if row is None:
+                    row = buckets[key] = {
+                        "content_item_id": snapshot["content_item_id"],
+                        "granularity": granularity,
+                        "bucket_start": start,
+                        "max_engagement_rate": 0.0,
+                        "max_engagement_velocity": 0.0,
+                        "sample_count": 0
+                    }
+                for column in ROLLUP_LATEST_COLUMNS:
+                    row[column] = snapshot.get(column) or 0
+                row["max_engagement_rate"] = max(row["max_engagement_rate"], snapshot.get("engagement_rate") or 0.0)
+                row["max_engagement_velocity"] = max(
+                    row["max_engagement_velocity"], snapshot.get("engagement_velocity") or 0.0
+                )
+                row["sample_count"] += 1
+                row["updated_at"] = snapshot["snapshot_time"]
+
+        rows = list(buckets.values())
+        if not rows:
+            return 0
+
+        dialect = db.get_bind().dialect.name
+        if dialect == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert
+        elif dialect == "sqlite":
+            from sqlalchemy.dialects.sqlite import insert
+        else:
+            self._merge_rollups(db, rows)
+            return len(rows)
+
+        table = ContentPerformanceRollup.__table__
+        for offset in range(0, len(rows), _UPSERT_CHUNK_SIZE):
+            statement = insert(table).values(rows[offset:offset + _UPSERT_CHUNK_SIZE])
+            excluded = statement.excluded
+            statement = statement.on_conflict_do_update(
+                index_elements=["content_item_id", "granularity", "bucket_start"],
+                set_={
+                    **{column: excluded[column] for column in ROLLUP_LATEST_COLUMNS},
+                    "max_engagement_rate": case(
+                        (excluded.max_engagement_rate > table.c.max_engagement_rate, excluded.max_engagement_rate),
+                        else_=table.c.max_engagement_rate
+                    ),
+                    "max_engagement_velocity": case(
+                        (excluded.max_engagement_velocity > table.c.max_engagement_velocity,
+                         excluded.max_engagement_velocity),
+                        else_=table.c.max_engagement_velocity
+                    ),
+                    "sample_count": table.c.sample_count + excluded.sample_count,
+                    "updated_at": excluded.updated_at
+                }
+            )
+            db.execute(statement)
+
+        return len(rows)
+
+    def _merge_rollups(self, db: Session, rows: List[Dict[str, Any]]) -> None:
+        """Read-modify-write fallback for databases without ON CONFLICT"""
+        for row in rows:
+            existing = db.query(ContentPerformanceRollup).filter_by(
+                content_item_id=row["content_item_id"],
+                granularity=row["granularity"],
+                bucket_start=row["bucket_start"]
+            ).first()
+            if existing is None:
+                db.add(ContentPerformanceRollup(**row))
+                continue
+
+            for column in ROLLUP_LATEST_COLUMNS + ("updated_at",):
+                setattr(existing, column, row[column])
+            existing.max_engagement_rate = max(existing.max_engagement_rate or 0.0, row["max_engagement_rate"])
+            existing.max_engagement_velocity = max(
+                existing.max_engagement_velocity or 0.0, row["max_engagement_velocity"]
+            )
+            existing.sample_count = (existing.sample_count or 0) + row["sample_count"]
+
+    def get_rollups(
+        self,
+        db: Session,
+        content_id: str,
+        since: datetime,
+        granularity: str = "day"
+    ) -> List[ContentPerformanceRollup]:
+        """Rollup buckets for a content item since a point in time, oldest first"""
+        return db.query(ContentPerformanceRollup).filter(
+            ContentPerformanceRollup.content_item_id == content_id,
+            ContentPerformanceRollup.granularity == granularity,
+            ContentPerformanceRollup.bucket_start >= bucket_start(since, granularity)
+        ).order_by(ContentPerformanceRollup.bucket_start).all()
+
+    def is_partitioned(self, db: Session) -> bool:
+        """True when the snapshot table is a PostgreSQL partitioned table"""
+        if db.get_bind().dialect.name != "postgresql":
+            return False
+        return db.execute(text(
+            "SELECT 1 FROM pg_partitioned_table pt "
+            "JOIN pg_class c ON c.oid = pt.partrelid "
+            "WHERE c.relname = :table"
+        ), {"table": SNAPSHOT_TABLE}).first() is not None
+
+    def list_partitions(self, db: Session) -> List[str]:
+        """Names of the snapshot table's partitions"""
+        rows = db.execute(text(
+            "SELECT c.relname FROM pg_inherits i "
+            "JOIN pg_class c ON c.oid = i.inhrelid "
+            "JOIN pg_class p ON p.oid = i.inhparent "
+            "WHERE p.relname = :table"
+        ), {"table": SNAPSHOT_TABLE})
+        return [row[0] for row in rows]
+
+    def upcoming_partition_months(self, now: Optional[datetime] = None) -> List[datetime]:
+        """First day of the current month and each month kept ready ahead"""
+        current = _month_start(now or datetime.now(timezone.utc))
+        return [_add_months(current, offset) for offset in range(self.partition_months_ahead + 1)]
+
+    def ensure_partitions(self, db: Session, now: Optional[datetime] = None) -> List[str]:
+        """
+        Create monthly partitions for the current month and the months ahead
+
+        Returns:
+            Partition names that were ensured
+        """
+        if not self.is_partitioned(db):
+            return []
+
+        ensured = []
+        for month in self.upcoming_partition_months(now):
+            db.execute(text(partition_ddl(month)))
+            ensured.append(partition_name(month))
+
+        db.commit()
+        return ensured
+
+    def drop_expired_partitions(self, db: Session, cutoff: datetime, commit: bool = True) -> List[str]:
+        """
+        Drop monthly partitions that end on or before cutoff
+
+        Args:
+            db: Database session
+            cutoff: Retention cutoff
+            commit: Commit the drops (False when part of a larger cleanup)
+
+        Returns:
+            Names of dropped partitions
+        """
+        if not self.is_partitioned(db):
+            return []
+
+        dropped = []
+        for name in sorted(self.list_partitions(db)):
+            match = _PARTITION_NAME_RE.match(name)
+            if not match:
+                continue
+            month = datetime(int(match.group(1)), int(match.group(2)), 1, tzinfo=timezone.utc)
+            if _add_months(month, 1) <= cutoff:
+                db.execute(text(f"DROP TABLE IF EXISTS {name}"))
+                dropped.append(name)
+
+        if dropped:
+            if commit:
+                db.commit()
+            logger.info(f"Dropped expired performance snapshot partitions: {', '.join(dropped)}")
+        return dropped
+
+    def prune_rollups(self, db: Session, daily_cutoff: datetime, now: Optional[datetime] = None) -> Dict[str, int]:
+        """
+        Delete hourly rollups past their retention and daily rollups before daily_cutoff
+
+        Returns:
+            Deleted row counts per granularity
+        """
+        hourly_cutoff = (now or datetime.now(timezone.utc)) - timedelta(days=self.hourly_retention_days)
+        deleted = {}
+        for granularity, cutoff in (("hour", hourly_cutoff), ("day", daily_cutoff)):
+            deleted[granularity] = db.query(ContentPerformanceRollup).filter(
+                ContentPerformanceRollup.granularity == granularity,
+                ContentPerformanceRollup.bucket_start < cutoff
+            ).delete(synchronize_session=False)
+
+        db.commit()
+        return deleted
+
+    def run_maintenance(self, db: Session, retention_days: int, now: Optional[datetime] = None) -> Dict[str, Any]:
+        """
+        Create upcoming partitions and apply retention to snapshots and rollups
+
+        Args:
+            db: Database session
+            retention_days: Raw snapshot and daily rollup retention
+            now: Reference time (defaults to now)
+
+        Returns:
+            Summary of the maintenance run
+        """
+        now = now or datetime.now(timezone.utc)
+        cutoff = now - timedelta(days=retention_days)
+        return {
+            "partitions_ensured": self.ensure_partitions(db, now),
+            "partitions_dropped": self.drop_expired_partitions(db, cutoff),
+            "rollups_deleted": self.prune_rollups(db, cutoff, now)
+        }
+
+
+# Global store instance
+_snapshot_store: Optional[PerformanceSnapshotStore] = None
+
+
+def get_performance_snapshot_store() -> PerformanceSnapshotStore:
+    """Get or create the global performance snapshot store"""
+    global _snapshot_store
+
+    if _snapshot_store is None:
+        _snapshot_store = PerformanceSnapshotStore()
+
+    return _snapshot_store
@@ -5,8 +5,8 @@ Handles engagement metrics collection, analysis, and performance categorization
 import asyncio
 import logging
 from typing import List, Dict, Any, Optional, Tuple
-from datetime import datetime, timedelta
-from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from dataclasses import dataclass, asdict
 from sqlalchemy.orm import Session
 from sqlalchemy import and_, desc, func
 import numpy as np
@@ -14,6 +14,7 @@ from statistics import mean, median
 
 from backend.db.database import get_db
 from backend.db.models import ContentItem, ContentPerformanceSnapshot, User
+from backend.services.performance_snapshot_store import get_performance_snapshot_store
 from backend.core.config import get_settings
 
 # Get logger (use application's logging configuration)
@@ -231,6 +232,7 @@ class PerformanceTracker:
                 raise ValueError(f"Content item {content_id} not found")
             
             # Store previous metrics for comparison
+            had_history = content_item.last_performance_update is not None
             old_metrics = PerformanceMetrics(
                 likes_count=content_item.likes_count or 0,
                 shares_count=content_item.shares_count or 0,
@@ -286,20 +288,21 @@ class PerformanceTracker:
             content_item.last_performance_update = datetime.utcnow()
             
             # Create performance snapshot
-            snapshot = ContentPerformanceSnapshot(
-                content_item_id=content_id,
-                likes_count=current_metrics.likes_count,
-                shares_count=current_metrics.shares_count,
-                comments_count=current_metrics.comments_count,
-                reach_count=current_metrics.reach_count,
-                click_count=current_metrics.click_count,
-                engagement_rate=current_metrics.engagement_rate,
-                likes_growth=current_metrics.likes_count - old_metrics.likes_count,
-                shares_growth=current_metrics.shares_count - old_metrics.shares_count,
-                comments_growth=current_metrics.comments_count - old_metrics.comments_count,
-                reach_growth=current_metrics.reach_count - old_metrics.reach_count,
-                platform_metrics=platform_specific_data or {}
-            )
+            snapshot = {
+                "content_item_id": content_id,
+                "snapshot_time": datetime.now(timezone.utc),
+                "likes_count": current_metrics.likes_count,
+                "shares_count": current_metrics.shares_count,
+                "comments_count": current_metrics.comments_count,
+                "reach_count": current_metrics.reach_count,
+                "click_count": current_metrics.click_count,
+                "engagement_rate": current_metrics.engagement_rate,
+                "likes_growth": current_metrics.likes_count - old_metrics.likes_count,
+                "shares_growth": current_metrics.shares_count - old_metrics.shares_count,
+                "comments_growth": current_metrics.comments_count - old_metrics.comments_count,
+                "reach_growth": current_metrics.reach_count - old_metrics.reach_count,
+                "platform_metrics": platform_specific_data or {}
+            }
             
             # Calculate engagement velocity (engagements per hour)
             if content_item.published_at:
@@ -308,13 +311,15 @@ class PerformanceTracker:
                 total_engagements = (current_metrics.likes_count + 
                                    current_metrics.shares_count + 
                                    current_metrics.comments_count)
-                snapshot.engagement_velocity = total_engagements / hours
+                snapshot["engagement_velocity"] = total_engagements / hours
                 
                 # Calculate viral coefficient (shares per like)
                 if current_metrics.likes_count > 0:
-                    snapshot.viral_coefficient = current_metrics.shares_count / current_metrics.likes_count
+                    snapshot["viral_coefficient"] = current_metrics.shares_count / current_metrics.likes_count
             
-            db.add(snapshot)
+            # Delta-only history: unchanged counters don't add a snapshot
+            previous = {content_id: asdict(old_metrics)} if had_history else None
+            get_performance_snapshot_store().write_snapshots(db, [snapshot], previous)
             db.commit()
             
             # Calculate growth metrics
@@ -478,20 +483,35 @@ class PerformanceTracker:
             Performance trends data
         """
         try:
-            cutoff_date = datetime.utcnow() - timedelta(days=days)
+            cutoff_date = datetime.now(timezone.utc) - timedelta(days=days)
             
-            snapshots = db.query(ContentPerformanceSnapshot).filter(
-                and_(
-                    ContentPerformanceSnapshot.content_item_id == content_id,
-                    ContentPerformanceSnapshot.snapshot_time >= cutoff_date
-                )
-            ).order_by(ContentPerformanceSnapshot.snapshot_time).all()
+            # Trends read downsampled rollups: hourly up to a week, daily beyond
+            granularity = "hour" if days <= 7 else "day"
+            snapshots = get_performance_snapshot_store().get_rollups(db, content_id, cutoff_date, granularity)
+            
+            if snapshots:
+                timestamps = [s.bucket_start for s in snapshots]
+                total_snapshots = sum(s.sample_count or 0 for s in snapshots)
+                engagement_peaks = [s.max_engagement_rate or 0.0 for s in snapshots]
+                velocity_peaks = [s.max_engagement_velocity or 0.0 for s in snapshots]
+            else:
+                # History recorded before rollups existed
+                granularity = "snapshot"
+                snapshots = db.query(ContentPerformanceSnapshot).filter(
+                    and_(
+                        ContentPerformanceSnapshot.content_item_id == content_id,
+                        ContentPerformanceSnapshot.snapshot_time >= cutoff_date
+                    )
+                ).order_by(ContentPerformanceSnapshot.snapshot_time).all()
+                timestamps = [s.snapshot_time for s in snapshots]
+                total_snapshots = len(snapshots)
+                engagement_peaks = [s.engagement_rate or 0.0 for s in snapshots]
+                velocity_peaks = [s.engagement_velocity or 0.0 for s in snapshots]
             
             if not snapshots:
                 return {"error": "No performance data available"}
             
             # Extract time series data
-            timestamps = [s.snapshot_time for s in snapshots]
             likes_data = [s.likes_count for s in snapshots]
             shares_data = [s.shares_count for s in snapshots]
             comments_data = [s.comments_count for s in snapshots]
@@ -499,7 +519,8 @@ class PerformanceTracker:
             
             # Calculate trends
             return {
-                "total_snapshots": len(snapshots),
+                "total_snapshots": total_snapshots,
+                "granularity": granularity,
                 "date_range": {
                     "start": timestamps[0].isoformat(),
                     "end": timestamps[-1].isoformat()
@@ -525,12 +546,12 @@ class PerformanceTracker:
                     "engagement_rate": {
                         "data": engagement_data,
                         "current": engagement_data[-1],
-                        "peak": max(engagement_data),
+                        "peak": max(engagement_peaks),
                         "average": mean(engagement_data)
                     }
                 },
                 "velocity_analysis": {
-                    "peak_velocity": max([s.engagement_velocity or 0 for s in snapshots]),
+                    "peak_velocity": max(velocity_peaks),
                     "current_velocity": snapshots[-1].engagement_velocity or 0,
                     "viral_coefficient": snapshots[-1].viral_coefficient or 0
                 }
@@ -18,6 +18,7 @@ from backend.db.models import (
 )
 from backend.db.database import get_db
 from backend.agents.tools import openai_tool
+from backend.services.knowledge_index import get_company_knowledge_index, get_response_template_index
 
 logger = logging.getLogger(__name__)
 
@@ -167,32 +168,20 @@ class PersonalityResponseEngine:
             List of relevant knowledge entries
         """
         try:
-            # Start with exact keyword matches
-            knowledge_entries = []
-            
-            for keyword in query_keywords:
-                if not keyword.strip():
-                    continue
-                    
-                # Search in title, content, keywords, and tags
-                entries = self.db.query(CompanyKnowledge).filter(
-                    CompanyKnowledge.user_id == user_id,
-                    CompanyKnowledge.is_active == True,
-                    (
-                        CompanyKnowledge.title.ilike(f"%{keyword}%") |
-                        CompanyKnowledge.content.ilike(f"%{keyword}%") |
-                        CompanyKnowledge.keywords.op('@>')([keyword]) |
-                        CompanyKnowledge.tags.op('@>')([keyword])
-                    )
-                ).limit(3).all()
-                
-                knowledge_entries.extend(entries)
-            
-            # Remove duplicates and sort by usage count
-            unique_entries = list({entry.id: entry for entry in knowledge_entries}.values())
-            unique_entries.sort(key=lambda x: x.usage_count or 0, reverse=True)
-            
-            return unique_entries[:5]  # Return top 5 most relevant
+            # One ranked lookup over the user's BM25 index (title, summary,
+            # content, keywords and tags)
+            ranked = get_company_knowledge_index().search(self.db, user_id, query_keywords, limit=5)
+            if not ranked:
+                return []
+            
+            entries = {
+                entry.id: entry for entry in self.db.query(CompanyKnowledge).filter(
+                    CompanyKnowledge.id.in_([entry_id for entry_id, _ in ranked]),
+                    CompanyKnowledge.is_active == True
+                ).all()
+            }
+            
+            return [entries[entry_id] for entry_id, _ in ranked if entry_id in entries]
             
         except Exception as e:
             logger.error(f"Knowledge search failed: {e}")
@@ -218,22 +207,13 @@ class PersonalityResponseEngine:
             Matching response template or None
         """
         try:
-            # Look for templates that match the intent and platform
-            templates = self.db.query(ResponseTemplate).filter(
-                ResponseTemplate.user_id == user_id,
-                ResponseTemplate.is_active == True,
-                ResponseTemplate.trigger_type == intent,
-                ResponseTemplate.platforms.op('@>')([platform])
-            ).order_by(ResponseTemplate.priority.desc()).all()
-            
-            # Find template with matching keywords
-            for template in templates:
-                template_keywords = template.keywords or []
-                if any(keyword.lower() in [tk.lower() for tk in template_keywords] for keyword in keywords):
-                    return template
-            
-            # If no keyword match, return first template for the intent
-            return templates[0] if templates else None
+            # Precomputed (intent, platform, keyword) -> template map; prefers
+            # the highest-priority template sharing a keyword, else the
+            # highest-priority template for the intent
+            template_id = get_response_template_index().match(
+                self.db, user_id, intent, platform, keywords
+            )
+            return self.db.get(ResponseTemplate, template_id) if template_id else None
             
         except Exception as e:
             logger.error(f"Template search failed: {e}")
@@ -27,6 +27,25 @@ if not settings.openai_api_key:
 
 openai.api_key = settings.openai_api_key
 
+# HNSW build parameters for the embedding indexes
+HNSW_M = 16
+HNSW_EF_CONSTRUCTION = 64
+# Candidate list size per search; raised to the result limit when larger
+HNSW_EF_SEARCH = 100
+
+# Whether the installed pgvector supports hnsw.iterative_scan (0.8+), per process
+_iterative_scan_supported: Optional[bool] = None
+
+
+def _load_metadata(value: Any) -> Dict[str, Any]:
+    """Metadata comes back as a dict from json columns and a string from text ones"""
+    if not value:
+        return {}
+    if isinstance(value, str):
+        return json.loads(value)
+    return value
+
+
 class PgVectorService:
     """Production vector search service using pgvector"""
     
@@ -46,6 +65,60 @@ class PgVectorService:
             logger.error(f"Failed to enable pgvector extension: {e}")
             raise
     
+    def ensure_vector_indexes(self):
+        """
+        Create the HNSW indexes searches rely on, if missing
+
+        Embeddings are indexed as halfvec because HNSW caps vector columns
+        at 2000 dimensions; queries order by the same cast expression.
+        """
+        try:
+            for table in ("content_embeddings", "memory_embeddings"):
+                self.db.execute(text(f"""
+                    CREATE INDEX IF NOT EXISTS ix_{table}_embedding_hnsw ON {table}
+                    USING hnsw ((embedding::halfvec({self.embedding_dimensions})) halfvec_cosine_ops)
+                    WITH (m = {HNSW_M}, ef_construction = {HNSW_EF_CONSTRUCTION})
+                """))
+            self.db.execute(text(
+                "CREATE INDEX IF NOT EXISTS ix_memory_embeddings_user_type "
+                "ON memory_embeddings (user_id, memory_type)"
+            ))
+            self.db.commit()
+            logger.info("pgvector HNSW indexes ready")
+        except Exception as e:
+            logger.error(f"Failed to create pgvector indexes: {e}")
+            self.db.rollback()
+            raise
+    
+    def _distance_expression(self) -> str:
+        """Cosine distance to :query_embedding, matching the HNSW index expression"""
+        dimensions = int(self.embedding_dimensions)
+        return f"(embedding::halfvec({dimensions})) <=> CAST(:query_embedding AS halfvec({dimensions}))"
+    
+    def _configure_ann_scan(self, limit: int) -> None:
+        """
+        Size the HNSW candidate list for this transaction's searches
+
+        With pgvector 0.8+ the scan keeps walking the graph until enough rows
+        pass the WHERE filters, so per-user searches still return `limit` rows.
+        """
+        global _iterative_scan_supported
+        
+        self.db.execute(
+            text("SELECT set_config('hnsw.ef_search', :ef_search, true)"),
+            {'ef_search': str(max(HNSW_EF_SEARCH, limit))}
+        )
+        
+        if _iterative_scan_supported is None:
+            version = self.db.execute(
+                text("SELECT extversion FROM pg_extension WHERE extname = 'vector'")
+            ).scalar() or "0"
+            major_minor = tuple(int(part) for part in version.split(".")[:2] if part.isdigit())
+            _iterative_scan_supported = major_minor >= (0, 8)
+        
+        if _iterative_scan_supported:
+            self.db.execute(text("SELECT set_config('hnsw.iterative_scan', 'relaxed_order', true)"))
+    
     def get_embedding(self, text: str) -> List[float]:
         """Generate embedding using OpenAI"""
         try:
@@ -159,32 +232,73 @@ class PgVectorService:
         user_id: int,
         query_text: str,
         limit: int = 10,
-        similarity_threshold: float = 0.7
+        similarity_threshold: float = 0.7,
+        min_engagement_rate: Optional[float] = None,
+        metadata_filters: Optional[Dict[str, Any]] = None
     ) -> List[Dict[str, Any]]:
-        """Search for similar content using cosine similarity"""
+        """
+        Search for similar content using cosine similarity
+        
+        The nearest `limit` rows come from the HNSW index; the similarity
+        threshold is applied to those rows afterwards so it doesn't force an
+        exact scan.
+        
+        Args:
+            user_id: Owner of the content
+            query_text: Text to match
+            limit: Maximum results
+            similarity_threshold: Minimum cosine similarity
+            min_engagement_rate: Skip content whose performance_metrics.engagement_rate
+                is below this (content without metrics is kept)
+            metadata_filters: Top-level metadata keys that must equal the given values
+            
+        Returns:
+            Matching content, most similar first
+        """
         try:
             # Generate query embedding
             query_embedding = self.get_embedding(query_text)
             
-            # Search for similar content
-            query = text("""
+            filters = ["user_id = :user_id"]
+            params = {
+                'user_id': user_id,
+                'query_embedding': query_embedding,
+                'max_distance': 1 - similarity_threshold,
+                'limit': limit
+            }
+            
+            if min_engagement_rate is not None:
+                filters.append(
+                    "(metadata -> 'performance_metrics' ->> 'engagement_rate' IS NULL "
+                    "OR (metadata -> 'performance_metrics' ->> 'engagement_rate')::float >= :min_engagement_rate)"
+                )
+                params['min_engagement_rate'] = min_engagement_rate
+            
+            for index, (key, value) in enumerate((metadata_filters or {}).items()):
+                filters.append(f"metadata ->> :metadata_key_{index} = :metadata_value_{index}")
+                params[f'metadata_key_{index}'] = key
+                params[f'metadata_value_{index}'] = str(value)
+            
+            distance = self._distance_expression()
+            query = text(f"""
                 SELECT 
                     id, content_id, content_text, metadata,
-                    1 - (embedding <=> :query_embedding) as similarity,
+                    1 - distance as similarity,
                     created_at
-                FROM content_embeddings 
-                WHERE user_id = :user_id 
-                    AND 1 - (embedding <=> :query_embedding) > :threshold
-                ORDER BY embedding <=> :query_embedding
-                LIMIT :limit
+                FROM (
+                    SELECT id, content_id, content_text, metadata, created_at,
+                        {distance} as distance
+                    FROM content_embeddings 
+                    WHERE {' AND '.join(filters)}
+                    ORDER BY {distance}
+                    LIMIT :limit
+                ) AS nearest
+                WHERE distance < :max_distance
+                ORDER BY distance
             """)
             
-            result = self.db.execute(query, {
-                'user_id': user_id,
-                'query_embedding': query_embedding,
-                'threshold': similarity_threshold,
-                'limit': limit
-            })
+            self._configure_ann_scan(limit)
+            result = self.db.execute(query, params)
             
             results = []
             for row in result:
@@ -192,7 +306,7 @@ class PgVectorService:
                     'id': row.id,
                     'content_id': row.content_id,
                     'content_text': row.content_text,
-                    'metadata': json.loads(row.metadata) if row.metadata else {},
+                    'metadata': _load_metadata(row.metadata),
                     'similarity': float(row.similarity),
                     'created_at': row.created_at.isoformat()
                 })
@@ -217,12 +331,12 @@ class PgVectorService:
             # Generate query embedding
             query_embedding = self.get_embedding(query_text)
             
-            # Build query with optional memory_type filter
-            where_clause = "WHERE user_id = :user_id AND 1 - (embedding <=> :query_embedding) > :threshold"
+            # Build query with optional memory_type filter; the threshold applies to the nearest rows
+            where_clause = "WHERE user_id = :user_id"
             params = {
                 'user_id': user_id,
                 'query_embedding': query_embedding,
-                'threshold': similarity_threshold,
+                'max_distance': 1 - similarity_threshold,
                 'limit': limit
             }
             
@@ -230,17 +344,25 @@ class PgVectorService:
                 where_clause += " AND memory_type = :memory_type"
                 params['memory_type'] = memory_type
             
+            distance = self._distance_expression()
             query = text(f"""
                 SELECT 
                     id, title, content, memory_type, metadata,
-                    1 - (embedding <=> :query_embedding) as similarity,
+                    1 - distance as similarity,
                     created_at
-                FROM memory_embeddings 
-                {where_clause}
-                ORDER BY embedding <=> :query_embedding
-                LIMIT :limit
+                FROM (
+                    SELECT id, title, content, memory_type, metadata, created_at,
+                        {distance} as distance
+                    FROM memory_embeddings 
+                    {where_clause}
+                    ORDER BY {distance}
+                    LIMIT :limit
+                ) AS nearest
+                WHERE distance < :max_distance
+                ORDER BY distance
             """)
             
+            self._configure_ann_scan(limit)
             result = self.db.execute(query, params)
             
             results = []
@@ -250,7 +372,7 @@ class PgVectorService:
                     'title': row.title,
                     'content': row.content,
                     'memory_type': row.memory_type,
-                    'metadata': json.loads(row.metadata) if row.metadata else {},
+                    'metadata': _load_metadata(row.metadata),
                     'similarity': float(row.similarity),
                     'created_at': row.created_at.isoformat()
                 })
@@ -2,16 +2,17 @@
 Pressure washing pricing engine with org-scoped rules and quote computation
 """
 
-from datetime import datetime, timezone, date
+from datetime import datetime, timezone, date, timedelta
 from decimal import Decimal, ROUND_HALF_UP
-from typing import Dict, List, Optional, Any, Union
+from typing import Dict, List, Optional, Any, Union, Iterable, Tuple
 import math
 import logging
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_
+from sqlalchemy.orm import Session, object_session
+from sqlalchemy import and_, or_, event
 
 from backend.db.models import PricingRule, Organization, User
-from backend.services.settings_resolver import SettingsResolver, PricingSettings
+from backend.services.invalidating_cache import InvalidatingCache
+from backend.services.settings_resolver import SettingsResolver, PricingSettings, SettingsNamespace
 
 logger = logging.getLogger(__name__)
 
@@ -61,6 +62,7 @@ class PricingQuote:
         self.applied_rules: List[str] = []
         self.warning_messages: List[str] = []
         self.valid_until: Optional[datetime] = None
+        self.pricing_rule_id: Optional[int] = None
         
     def to_dict(self) -> Dict[str, Any]:
         """Convert quote to dictionary for JSON serialization"""
@@ -83,152 +85,199 @@ class PricingQuote:
         }
 
 
-class PricingService:
+PRICING_RULE_CACHE_TTL_SECONDS = 60
+
+
+def _to_decimal(value: Any) -> Decimal:
+    """Convert a JSON number to Decimal without float artifacts"""
+    return Decimal(str(value))
+
+
+def _as_utc(value: Optional[datetime]) -> Optional[datetime]:
+    """Treat naive datetimes (e.g. from SQLite) as UTC"""
+    if value is not None and value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
+def _get_season(month: int) -> str:
+    """Get season name from month number"""
+    if month in [12, 1, 2]:
+        return "winter"
+    elif month in [3, 4, 5]:
+        return "spring"
+    elif month in [6, 7, 8]:
+        return "summer"
+    elif month in [9, 10, 11]:
+        return "fall"
+    return "unknown"
+
+
+class CompiledPricingRule:
     """
-    Pressure washing pricing engine with organization-scoped rules
+    Pricing rule with its JSON configuration parsed once
+    
+    Rates are converted to Decimal, bundles to sets and seasonal modifiers
+    to a per-month lookup, so pricing a quote is just arithmetic. Produces
+    the same breakdown entries as reading the rule JSON step by step.
     """
     
-    def __init__(self, settings_resolver: SettingsResolver):
-        self.settings_resolver = settings_resolver
+    def __init__(self, pricing_rule: PricingRule):
+        self.rule_id = pricing_rule.id
+        self.organization_id = pricing_rule.organization_id
+        self.name = pricing_rule.name
+        self.version = pricing_rule.version
+        self.currency = pricing_rule.currency
+        self.min_job_total = _to_decimal(pricing_rule.min_job_total or 0)
+        
+        # service -> (surface rates, flat rate)
+        self.service_rates: Dict[str, Tuple[Dict[str, Decimal], Optional[Decimal]]] = {}
+        for service_type, service_rates in (pricing_rule.base_rates or {}).items():
+            if not isinstance(service_rates, dict):
+                service_rates = {}
+            surfaces = {
+                surface_type: _to_decimal(rate)
+                for surface_type, rate in service_rates.get("surfaces", {}).items()
+            }
+            flat_rate = service_rates.get("flat_rate")
+            self.service_rates[service_type] = (
+                surfaces, _to_decimal(flat_rate) if flat_rate is not None else None
+            )
+        
+        self.bundles = [
+            (
+                bundle.get("name", "Bundle Discount"),
+                frozenset(bundle.get("services", [])),
+                bundle.get("discount_type", "percentage"),
+                _to_decimal(bundle.get("discount_value", 0))
+            )
+            for bundle in (pricing_rule.bundles or [])
+        ]
+        
+        # month -> [(breakdown key, key value, modifier percent)]
+        seasonal_modifiers = pricing_rule.seasonal_modifiers or {}
+        self.month_modifiers: Dict[int, List[Tuple[str, Any, Decimal]]] = {}
+        for month in range(1, 13):
+            modifiers = []
+            if str(month) in seasonal_modifiers:
+                modifiers.append(("month", month, _to_decimal(seasonal_modifiers[str(month)])))
+            season = _get_season(month)
+            if season in seasonal_modifiers:
+                modifiers.append(("season", season, _to_decimal(seasonal_modifiers[season])))
+            self.month_modifiers[month] = modifiers
+        
+        travel_settings = pricing_rule.travel_settings or {}
+        self.free_radius_miles = _to_decimal(travel_settings.get("free_radius_miles", 0))
+        self.rate_per_mile = _to_decimal(travel_settings.get("rate_per_mile", 0))
+        self.minimum_travel_fee = _to_decimal(travel_settings.get("minimum_fee", 0))
+        
+        self.additional_services = {
+            service_name: (
+                _to_decimal(service_config.get("price", 0)),
+                service_config.get("description", "")
+            )
+            for service_name, service_config in (pricing_rule.additional_services or {}).items()
+        }
+        
+        business_rules = pricing_rule.business_rules or {}
+        rush_fee_config = business_rules.get("rush_fee", {})
+        self.rush_fee_enabled = bool(rush_fee_config.get("enabled", False))
+        self.rush_fee_type = rush_fee_config.get("type", "percentage")
+        self.rush_fee_value = _to_decimal(rush_fee_config.get("value", 0))
+        self.tier_discounts = {
+            tier: _to_decimal(tier_config.get("discount_percent", 0))
+            for tier, tier_config in business_rules.get("customer_tiers", {}).items()
+        }
+        self.tax_rate = _to_decimal(business_rules.get("tax_rate", 0))
+        self.quote_validity_days = int(business_rules.get("quote_validity_days", 30))
     
-    def compute_quote(
-        self, 
-        request: PricingQuoteRequest, 
-        db: Session,
-        user_id: int
+    def price(
+        self,
+        request: PricingQuoteRequest,
+        settings_tax_rate: Decimal = Decimal('0'),
+        now: Optional[datetime] = None
     ) -> PricingQuote:
         """
-        Compute a comprehensive pricing quote based on organization rules
+        Price a single request against this rule
+        
+        Args:
+            request: Quote request for this rule's organization
+            settings_tax_rate: Tax rate from pricing settings; the rule's own
+                rate is used when this is zero
+            now: Reference time for quote validity
+        
+        Returns:
+            Computed pricing quote
         """
-        try:
-            # Get active pricing rule for organization
-            pricing_rule = self._get_active_pricing_rule(request.organization_id, db)
-            if not pricing_rule:
-                raise ValueError(f"No active pricing rules found for organization {request.organization_id}")
-            
-            # Get pricing settings from settings resolver
-            pricing_settings = self.settings_resolver.get_pricing_settings(
-                request.organization_id, db, user_id
-            )
-            
-            quote = PricingQuote()
-            quote.currency = pricing_rule.currency
-            quote.applied_rules.append(pricing_rule.name)
-            
-            # 1. Calculate base pricing for services and surfaces
-            self._calculate_base_pricing(request, pricing_rule, quote)
-            
-            # 2. Apply bundle discounts if applicable
-            self._apply_bundle_discounts(request, pricing_rule, quote)
-            
-            # 3. Apply seasonal modifiers
-            self._apply_seasonal_modifiers(request, pricing_rule, quote)
-            
-            # 4. Calculate travel fees
-            self._calculate_travel_fees(request, pricing_rule, quote)
-            
-            # 5. Add rush job fees if applicable
-            self._apply_rush_fees(request, pricing_rule, quote)
-            
-            # 6. Calculate additional services
-            self._calculate_additional_services(request, pricing_rule, quote)
-            
-            # 7. Apply business rules and constraints
-            self._apply_business_rules(request, pricing_rule, quote)
-            
-            # 8. Calculate subtotal
-            quote.subtotal = (
-                quote.base_total + 
-                quote.bundle_discount +  # Note: bundle_discount is negative
-                quote.seasonal_modifier + 
-                quote.travel_fee + 
-                quote.rush_fee + 
-                quote.additional_services_total
-            )
-            
-            # 9. Apply tax calculations
-            self._calculate_taxes(request, pricing_rule, pricing_settings, quote)
-            
-            # 10. Set quote validity period
-            self._set_quote_validity(pricing_rule, quote)
-            
-            # Ensure minimum job total
-            if quote.total < pricing_rule.min_job_total:
-                original_total = quote.total
-                quote.total = pricing_rule.min_job_total
-                quote.warning_messages.append(
-                    f"Quote adjusted to minimum job total: {quote.currency} {pricing_rule.min_job_total}"
-                )
-                quote.breakdown.append({
-                    "type": "minimum_adjustment",
-                    "description": "Minimum job total adjustment",
-                    "original_amount": float(original_total),
-                    "adjusted_amount": float(quote.total)
-                })
-            
-            return quote
-            
-        except Exception as e:
-            logger.error(f"Error computing pricing quote: {str(e)}")
-            raise
-    
-    def _get_active_pricing_rule(self, organization_id: str, db: Session) -> Optional[PricingRule]:
-        """Get the active pricing rule for an organization with highest priority"""
-        now = datetime.now(timezone.utc)
+        quote = PricingQuote()
+        quote.currency = self.currency
+        quote.pricing_rule_id = self.rule_id
+        quote.applied_rules.append(self.name)
         
-        pricing_rule = db.query(PricingRule).filter(
-            and_(
-                PricingRule.organization_id == organization_id,
-                PricingRule.is_active == True,
-                or_(
-                    PricingRule.effective_from == None,
-                    PricingRule.effective_from <= now
-                ),
-                or_(
-                    PricingRule.effective_until == None,
-                    PricingRule.effective_until >= now
-                )
+        self.apply_base_pricing(request, quote)
+        self.apply_bundle_discounts(request, quote)
+        self.apply_seasonal_modifiers(request, quote)
+        self.apply_travel_fees(request, quote)
+        self.apply_rush_fees(request, quote)
+        self.apply_additional_services(request, quote)
+        self.apply_business_rules(request, quote)
+        
+        quote.subtotal = (
+            quote.base_total +
+            quote.bundle_discount +  # Note: bundle_discount is negative
+            quote.seasonal_modifier +
+            quote.travel_fee +
+            quote.rush_fee +
+            quote.additional_services_total
+        )
+        
+        self.apply_taxes(settings_tax_rate, quote)
+        self.apply_quote_validity(quote, now)
+        
+        # Ensure minimum job total
+        if quote.total < self.min_job_total:
+            original_total = quote.total
+            quote.total = self.min_job_total
+            quote.warning_messages.append(
+                f"Quote adjusted to minimum job total: {quote.currency} {self.min_job_total}"
             )
-        ).order_by(
-            PricingRule.priority.desc(),
-            PricingRule.created_at.desc()
-        ).first()
+            quote.breakdown.append({
+                "type": "minimum_adjustment",
+                "description": "Minimum job total adjustment",
+                "original_amount": float(original_total),
+                "adjusted_amount": float(quote.total)
+            })
         
-        return pricing_rule
+        return quote
     
-    def _calculate_base_pricing(self, request: PricingQuoteRequest, pricing_rule: PricingRule, quote: PricingQuote):
+    def apply_base_pricing(self, request: PricingQuoteRequest, quote: PricingQuote):
         """Calculate base pricing for services and surfaces"""
-        base_rates = pricing_rule.base_rates
-        
         for service_type in request.service_types:
-            if service_type not in base_rates:
+            if service_type not in self.service_rates:
                 quote.warning_messages.append(f"No base rate found for service type: {service_type}")
                 continue
-                
-            service_rates = base_rates[service_type]
+            
+            surface_rates, flat_rate = self.service_rates[service_type]
             service_total = Decimal('0.00')
             
-            # Calculate pricing based on surface measurements
-            if "surfaces" in service_rates:
-                for surface_type, surface_data in request.surfaces.items():
-                    if surface_type in service_rates["surfaces"]:
-                        surface_rate = Decimal(str(service_rates["surfaces"][surface_type]))
-                        area = Decimal(str(surface_data.get("area", 0)))
-                        surface_cost = surface_rate * area
-                        service_total += surface_cost
-                        
-                        quote.breakdown.append({
-                            "type": "base_service",
-                            "service": service_type,
-                            "surface": surface_type,
-                            "area": float(area),
-                            "rate": float(surface_rate),
-                            "amount": float(surface_cost)
-                        })
+            for surface_type, surface_data in request.surfaces.items():
+                surface_rate = surface_rates.get(surface_type)
+                if surface_rate is None:
+                    continue
+                area = _to_decimal(surface_data.get("area", 0))
+                surface_cost = surface_rate * area
+                service_total += surface_cost
+                
+                quote.breakdown.append({
+                    "type": "base_service",
+                    "service": service_type,
+                    "surface": surface_type,
+                    "area": float(area),
+                    "rate": float(surface_rate),
+                    "amount": float(surface_cost)
+                })
             
-            # Apply flat rate if specified
-            if "flat_rate" in service_rates and service_total == 0:
-                flat_rate = Decimal(str(service_rates["flat_rate"]))
+            if flat_rate is not None and service_total == 0:
                 service_total = flat_rate
                 
                 quote.breakdown.append({
@@ -240,184 +289,125 @@ class PricingService:
             
             quote.base_total += service_total
     
-    def _apply_bundle_discounts(self, request: PricingQuoteRequest, pricing_rule: PricingRule, quote: PricingQuote):
-        """Apply bundle discounts for multiple services"""
-        bundles = pricing_rule.bundles
+    def apply_bundle_discounts(self, request: PricingQuoteRequest, quote: PricingQuote):
+        """Apply the first bundle whose services are all requested"""
+        request_services = set(request.service_types)
         
-        for bundle in bundles:
-            bundle_services = set(bundle.get("services", []))
-            request_services = set(request.service_types)
+        for bundle_name, bundle_services, discount_type, discount_value in self.bundles:
+            if not bundle_services.issubset(request_services):
+                continue
             
-            # Check if all bundle services are included in request
-            if bundle_services.issubset(request_services):
-                discount_type = bundle.get("discount_type", "percentage")
-                discount_value = Decimal(str(bundle.get("discount_value", 0)))
-                
-                if discount_type == "percentage":
-                    discount_amount = quote.base_total * (discount_value / Decimal('100'))
-                else:  # flat discount
-                    discount_amount = discount_value
-                
-                # Bundle discounts are negative (reduce total)
-                quote.bundle_discount -= discount_amount
-                
-                quote.breakdown.append({
-                    "type": "bundle_discount",
-                    "bundle_name": bundle.get("name", "Bundle Discount"),
-                    "services": list(bundle_services),
-                    "discount_type": discount_type,
-                    "discount_value": float(discount_value),
-                    "amount": float(-discount_amount)
-                })
-                
-                break  # Apply only the first matching bundle
-    
-    def _apply_seasonal_modifiers(self, request: PricingQuoteRequest, pricing_rule: PricingRule, quote: PricingQuote):
-        """Apply seasonal pricing modifiers"""
-        if not request.preferred_date:
-            return
+            if discount_type == "percentage":
+                discount_amount = quote.base_total * (discount_value / Decimal('100'))
+            else:  # flat discount
+                discount_amount = discount_value
             
-        seasonal_modifiers = pricing_rule.seasonal_modifiers
-        current_month = request.preferred_date.month
-        
-        # Check for specific month modifiers
-        month_key = str(current_month)
-        if month_key in seasonal_modifiers:
-            modifier = Decimal(str(seasonal_modifiers[month_key]))
-            modifier_amount = quote.base_total * (modifier / Decimal('100'))
-            quote.seasonal_modifier += modifier_amount
+            # Bundle discounts are negative (reduce total)
+            quote.bundle_discount -= discount_amount
             
             quote.breakdown.append({
-                "type": "seasonal_modifier",
-                "month": current_month,
-                "modifier_percent": float(modifier),
-                "amount": float(modifier_amount)
+                "type": "bundle_discount",
+                "bundle_name": bundle_name,
+                "services": list(bundle_services),
+                "discount_type": discount_type,
+                "discount_value": float(discount_value),
+                "amount": float(-discount_amount)
             })
+            break
+    
+    def apply_seasonal_modifiers(self, request: PricingQuoteRequest, quote: PricingQuote):
+        """Apply month and season modifiers for the preferred date"""
+        if not request.preferred_date:
+            return
         
-        # Check for season-based modifiers
-        season = self._get_season(current_month)
-        if season in seasonal_modifiers:
-            modifier = Decimal(str(seasonal_modifiers[season]))
+        for key, value, modifier in self.month_modifiers[request.preferred_date.month]:
             modifier_amount = quote.base_total * (modifier / Decimal('100'))
             quote.seasonal_modifier += modifier_amount
             
             quote.breakdown.append({
                 "type": "seasonal_modifier",
-                "season": season,
+                key: value,
                 "modifier_percent": float(modifier),
                 "amount": float(modifier_amount)
             })
     
-    def _calculate_travel_fees(self, request: PricingQuoteRequest, pricing_rule: PricingRule, quote: PricingQuote):
+    def apply_travel_fees(self, request: PricingQuoteRequest, quote: PricingQuote):
         """Calculate travel fees based on distance"""
-        travel_settings = pricing_rule.travel_settings
-        
         if not request.location or "distance_miles" not in request.location:
             return
-            
-        distance = Decimal(str(request.location["distance_miles"]))
         
-        # Check if within free travel radius
-        free_radius = Decimal(str(travel_settings.get("free_radius_miles", 0)))
-        if distance <= free_radius:
+        distance = _to_decimal(request.location["distance_miles"])
+        if distance <= self.free_radius_miles:
             return
-            
-        # Calculate travel fee
-        rate_per_mile = Decimal(str(travel_settings.get("rate_per_mile", 0)))
-        min_travel_fee = Decimal(str(travel_settings.get("minimum_fee", 0)))
-        
-        billable_distance = distance - free_radius
-        calculated_fee = billable_distance * rate_per_mile
-        travel_fee = max(calculated_fee, min_travel_fee)
         
+        billable_distance = distance - self.free_radius_miles
+        travel_fee = max(billable_distance * self.rate_per_mile, self.minimum_travel_fee)
         quote.travel_fee = travel_fee
         
         quote.breakdown.append({
             "type": "travel_fee",
             "total_distance": float(distance),
-            "free_radius": float(free_radius),
+            "free_radius": float(self.free_radius_miles),
             "billable_distance": float(billable_distance),
-            "rate_per_mile": float(rate_per_mile),
+            "rate_per_mile": float(self.rate_per_mile),
             "amount": float(travel_fee)
         })
     
-    def _apply_rush_fees(self, request: PricingQuoteRequest, pricing_rule: PricingRule, quote: PricingQuote):
+    def apply_rush_fees(self, request: PricingQuoteRequest, quote: PricingQuote):
         """Apply rush job fees if applicable"""
-        if not request.rush_job:
+        if not request.rush_job or not self.rush_fee_enabled:
             return
-            
-        business_rules = pricing_rule.business_rules
-        rush_fee_config = business_rules.get("rush_fee", {})
         
-        if not rush_fee_config.get("enabled", False):
-            return
-            
-        fee_type = rush_fee_config.get("type", "percentage")
-        fee_value = Decimal(str(rush_fee_config.get("value", 0)))
-        
-        if fee_type == "percentage":
-            rush_fee = quote.base_total * (fee_value / Decimal('100'))
+        if self.rush_fee_type == "percentage":
+            rush_fee = quote.base_total * (self.rush_fee_value / Decimal('100'))
         else:  # flat fee
-            rush_fee = fee_value
+            rush_fee = self.rush_fee_value
         
         quote.rush_fee = rush_fee
         
         quote.breakdown.append({
             "type": "rush_fee",
-            "fee_type": fee_type,
-            "fee_value": float(fee_value),
+            "fee_type": self.rush_fee_type,
+            "fee_value": float(self.rush_fee_value),
             "amount": float(rush_fee)
         })
     
-    def _calculate_additional_services(self, request: PricingQuoteRequest, pricing_rule: PricingRule, quote: PricingQuote):
+    def apply_additional_services(self, request: PricingQuoteRequest, quote: PricingQuote):
         """Calculate pricing for additional services"""
-        additional_services = pricing_rule.additional_services
-        
         for service_name in request.additional_services:
-            if service_name not in additional_services:
+            if service_name not in self.additional_services:
                 quote.warning_messages.append(f"Additional service not found: {service_name}")
                 continue
-                
-            service_config = additional_services[service_name]
-            service_cost = Decimal(str(service_config.get("price", 0)))
             
+            service_cost, description = self.additional_services[service_name]
             quote.additional_services_total += service_cost
             
             quote.breakdown.append({
                 "type": "additional_service",
                 "service": service_name,
-                "description": service_config.get("description", ""),
+                "description": description,
                 "amount": float(service_cost)
             })
     
-    def _apply_business_rules(self, request: PricingQuoteRequest, pricing_rule: PricingRule, quote: PricingQuote):
-        """Apply business rules and constraints"""
-        business_rules = pricing_rule.business_rules
+    def apply_business_rules(self, request: PricingQuoteRequest, quote: PricingQuote):
+        """Apply customer tier discounts"""
+        discount_percent = self.tier_discounts.get(request.customer_tier)
+        if not discount_percent or discount_percent <= 0:
+            return
         
-        # Apply customer tier discounts
-        tier_discounts = business_rules.get("customer_tiers", {})
-        if request.customer_tier in tier_discounts:
-            tier_config = tier_discounts[request.customer_tier]
-            discount_percent = Decimal(str(tier_config.get("discount_percent", 0)))
-            
-            if discount_percent > 0:
-                tier_discount = quote.base_total * (discount_percent / Decimal('100'))
-                quote.base_total -= tier_discount
-                
-                quote.breakdown.append({
-                    "type": "customer_tier_discount",
-                    "tier": request.customer_tier,
-                    "discount_percent": float(discount_percent),
-                    "amount": float(-tier_discount)
-                })
+        tier_discount = quote.base_total * (discount_percent / Decimal('100'))
+        quote.base_total -= tier_discount
+        
+        quote.breakdown.append({
+            "type": "customer_tier_discount",
+            "tier": request.customer_tier,
+            "discount_percent": float(discount_percent),
+            "amount": float(-tier_discount)
+        })
     
-    def _calculate_taxes(self, request: PricingQuoteRequest, pricing_rule: PricingRule, pricing_settings: PricingSettings, quote: PricingQuote):
-        """Calculate tax amounts"""
-        # Use tax rate from pricing settings or fallback to business rules
-        tax_rate = Decimal(str(pricing_settings.tax_rate))
-        if tax_rate == 0:
-            business_rules = pricing_rule.business_rules
-            tax_rate = Decimal(str(business_rules.get("tax_rate", 0)))
+    def apply_taxes(self, settings_tax_rate: Decimal, quote: PricingQuote):
+        """Calculate tax, preferring the settings rate over the rule's"""
+        tax_rate = settings_tax_rate if settings_tax_rate else self.tax_rate
         
         quote.tax_rate = tax_rate
         quote.tax_amount = quote.subtotal * (tax_rate / Decimal('100'))
@@ -431,30 +421,301 @@ class PricingService:
                 "amount": float(quote.tax_amount)
             })
     
+    def apply_quote_validity(self, quote: PricingQuote, now: Optional[datetime] = None):
+        """Quotes stay valid until the end of the day, quote_validity_days from now"""
+        now = now or datetime.now(timezone.utc)
+        quote.valid_until = now.replace(
+            hour=23, minute=59, second=59, microsecond=0
+        ) + timedelta(days=self.quote_validity_days)
+
+
+class PricingRuleCache(InvalidatingCache[str, Optional[CompiledPricingRule]]):
+    """
+    Per-process cache of each organization's compiled active pricing rule
+    
+    Entries are dropped when a PricingRule for the organization is
+    committed in this process (see the session hooks below) and otherwise
+    expire after ttl_seconds, which bounds staleness for changes made by
+    other workers. An entry never outlives the next effective/expiry date
+    among the organization's rules, so scheduled rule changes apply on time.
+    Organizations without an active rule are cached as misses too.
+    """
+    
+    def __init__(self, ttl_seconds: float = PRICING_RULE_CACHE_TTL_SECONDS, max_organizations: int = 10000):
+        super().__init__(ttl_seconds=ttl_seconds, max_entries=max_organizations)
+    
+    def get(self, db: Session, organization_id: str, now: Optional[datetime] = None) -> Optional[CompiledPricingRule]:
+        """Get the compiled active rule for one organization"""
+        return self.get_many(db, [organization_id], now)[organization_id]
+    
+    def get_many(
+        self,
+        db: Session,
+        organization_ids: Iterable[str],
+        now: Optional[datetime] = None
+    ) -> Dict[str, Optional[CompiledPricingRule]]:
+        """
+        Get compiled active rules for many organizations
+        
+        Cache misses are loaded together in one query.
+        
+        Args:
+            db: Database session
+            organization_ids: Organizations to resolve
+            now: Reference time for effective/expiry dates
+        
+        Returns:
+            Compiled rule (or None when the org has no active rule) keyed by org ID
+        """
+        return super().get_many(db, organization_ids, now=now or datetime.now(timezone.utc))
+    
+    def _build(
+        self,
+        db: Session,
+        keys: List[str],
+        now: Optional[datetime] = None
+    ) -> Dict[str, Tuple[Optional[CompiledPricingRule], Optional[float]]]:
+        """Load the active rules of every missing organization in one query"""
+        now = now or datetime.now(timezone.utc)
+        rules_by_org: Dict[str, List[PricingRule]] = {organization_id: [] for organization_id in keys}
+        for rule in db.query(PricingRule).filter(
+            and_(
+                PricingRule.organization_id.in_(keys),
+                PricingRule.is_active == True,
+                or_(
+                    PricingRule.expiry_date == None,
+                    PricingRule.expiry_date > now
+                )
+            )
+        ).all():
+            rules_by_org[rule.organization_id].append(rule)
+        
+        return {
+            organization_id: self._compile_active_rule(rules, now)
+            for organization_id, rules in rules_by_org.items()
+        }
+    
+    def _compile_active_rule(
+        self,
+        rules: List[PricingRule],
+        now: datetime
+    ) -> Tuple[Optional[CompiledPricingRule], float]:
+        """Pick the highest-priority effective rule and how long it stays valid"""
+        ttl = float(self.ttl_seconds)
+        active = []
+        for rule in rules:
+            effective_date = _as_utc(rule.effective_date)
+            expiry_date = _as_utc(rule.expiry_date)
+            for boundary in (effective_date, expiry_date):
+                if boundary and boundary > now:
+                    ttl = min(ttl, (boundary - now).total_seconds())
+            if effective_date is None or effective_date <= now:
+                active.append(rule)
+        
+        if not active:
+            return None, ttl
+        
+        epoch = datetime.min.replace(tzinfo=timezone.utc)
+        rule = max(active, key=lambda r: (r.priority or 0, _as_utc(r.created_at) or epoch, r.id or 0))
+        return CompiledPricingRule(rule), ttl
+    
+    def stats(self) -> Dict[str, Any]:
+        """Get cache statistics"""
+        total = self.hits + self.misses
+        return {
+            "organizations": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0
+        }
+
+
+# Global cache instance
+_pricing_rule_cache: Optional[PricingRuleCache] = None
+
+
+def get_pricing_rule_cache() -> PricingRuleCache:
+    """Get global pricing rule cache instance"""
+    global _pricing_rule_cache
+    if _pricing_rule_cache is None:
+        _pricing_rule_cache = PricingRuleCache()
+    return _pricing_rule_cache
+
+
+def set_pricing_rule_cache(cache: PricingRuleCache) -> None:
+    """Set global pricing rule cache instance (mainly for testing)"""
+    global _pricing_rule_cache
+    _pricing_rule_cache = cache
+
+
+_CHANGED_PRICING_ORGS_KEY = "pricing_rule_changed_orgs"
+
+
+def _record_pricing_rule_change(mapper, connection, target: PricingRule) -> None:
+    """Remember which organization's rules changed in this session"""
+    session = object_session(target)
+    if session is not None and target.organization_id:
+        session.info.setdefault(_CHANGED_PRICING_ORGS_KEY, set()).add(target.organization_id)
+
+
+for _event_name in ("after_insert", "after_update", "after_delete"):
+    event.listen(PricingRule, _event_name, _record_pricing_rule_change)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed_pricing_rules(session: Session) -> None:
+    """Invalidate cached rules only once the change is visible to other sessions"""
+    changed = session.info.pop(_CHANGED_PRICING_ORGS_KEY, None)
+    if changed:
+        cache = get_pricing_rule_cache()
+        for organization_id in changed:
+            cache.invalidate(organization_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_rolled_back_pricing_rules(session: Session) -> None:
+    session.info.pop(_CHANGED_PRICING_ORGS_KEY, None)
+
+
+class PricingService:
+    """
+    Pressure washing pricing engine with organization-scoped rules
+    """
+    
+    def __init__(self, settings_resolver: SettingsResolver, rule_cache: Optional[PricingRuleCache] = None):
+        self.settings_resolver = settings_resolver
+        self.rule_cache = rule_cache or get_pricing_rule_cache()
+    
+    def compute_quote(
+        self,
+        request: PricingQuoteRequest,
+        db: Session,
+        user_id: int
+    ) -> PricingQuote:
+        """
+        Compute a comprehensive pricing quote based on organization rules
+        """
+        try:
+            return self.compute_quotes([request], db, user_id)[0]
+        except Exception as e:
+            logger.error(f"Error computing pricing quote: {str(e)}")
+            raise
+    
+    def compute_quotes(
+        self,
+        requests: List[PricingQuoteRequest],
+        db: Session,
+        user_id: int
+    ) -> List[PricingQuote]:
+        """
+        Price many requests in one call
+        
+        Pricing rules and settings are resolved once per organization, so a
+        batch of leads costs at most one rule query regardless of its size.
+        
+        Args:
+            requests: Quote requests, possibly spanning organizations
+            db: Database session
+            user_id: User the quotes are computed for
+        
+        Returns:
+            Quotes in the same order as requests
+        
+        Raises:
+            ValueError: If an organization has no active pricing rule
+        """
+        if not requests:
+            return []
+        
+        now = datetime.now(timezone.utc)
+        organization_ids = list(dict.fromkeys(request.organization_id for request in requests))
+        
+        compiled_rules = self.rule_cache.get_many(db, organization_ids, now)
+        for organization_id in organization_ids:
+            if compiled_rules.get(organization_id) is None:
+                raise ValueError(f"No active pricing rules found for organization {organization_id}")
+        
+        tax_rates = {
+            organization_id: self._get_settings_tax_rate(organization_id, user_id)
+            for organization_id in organization_ids
+        }
+        
+        return [
+            compiled_rules[request.organization_id].price(request, tax_rates[request.organization_id], now)
+            for request in requests
+        ]
+    
+    def _get_settings_tax_rate(self, organization_id: str, user_id: Optional[int]) -> Decimal:
+        """Tax rate from the organization's pricing settings, zero when unset"""
+        pricing_settings = self.settings_resolver.get_namespace_settings(
+            organization_id, SettingsNamespace.PRICING, user_id
+        )
+        return _to_decimal(getattr(pricing_settings, "tax_rate", 0) or 0)
+    
+    def _get_active_pricing_rule(self, organization_id: str, db: Session) -> Optional[PricingRule]:
+        """Get the active pricing rule for an organization with highest priority (uncached)"""
+        now = datetime.now(timezone.utc)
+        
+        pricing_rule = db.query(PricingRule).filter(
+            and_(
+                PricingRule.organization_id == organization_id,
+                PricingRule.is_active == True,
+                or_(
+                    PricingRule.effective_date == None,
+                    PricingRule.effective_date <= now
+                ),
+                or_(
+                    PricingRule.expiry_date == None,
+                    PricingRule.expiry_date > now
+                )
+            )
+        ).order_by(
+            PricingRule.priority.desc(),
+            PricingRule.created_at.desc()
+        ).first()
+        
+        return pricing_rule
+    
+    def _calculate_base_pricing(self, request: PricingQuoteRequest, pricing_rule: PricingRule, quote: PricingQuote):
+        """Calculate base pricing for services and surfaces"""
+        CompiledPricingRule(pricing_rule).apply_base_pricing(request, quote)
+    
+    def _apply_bundle_discounts(self, request: PricingQuoteRequest, pricing_rule: PricingRule, quote: PricingQuote):
+        """Apply bundle discounts for multiple services"""
+        CompiledPricingRule(pricing_rule).apply_bundle_discounts(request, quote)
+    
+    def _apply_seasonal_modifiers(self, request: PricingQuoteRequest, pricing_rule: PricingRule, quote: PricingQuote):
+        """Apply seasonal pricing modifiers"""
+        CompiledPricingRule(pricing_rule).apply_seasonal_modifiers(request, quote)
+    
+    def _calculate_travel_fees(self, request: PricingQuoteRequest, pricing_rule: PricingRule, quote: PricingQuote):
+        """Calculate travel fees based on distance"""
+        CompiledPricingRule(pricing_rule).apply_travel_fees(request, quote)
+    
+    def _apply_rush_fees(self, request: PricingQuoteRequest, pricing_rule: PricingRule, quote: PricingQuote):
+        """Apply rush job fees if applicable"""
+        CompiledPricingRule(pricing_rule).apply_rush_fees(request, quote)
+    
+    def _calculate_additional_services(self, request: PricingQuoteRequest, pricing_rule: PricingRule, quote: PricingQuote):
+        """Calculate pricing for additional services"""
+        CompiledPricingRule(pricing_rule).apply_additional_services(request, quote)
+    
+    def _apply_business_rules(self, request: PricingQuoteRequest, pricing_rule: PricingRule, quote: PricingQuote):
+        """Apply business rules and constraints"""
+        CompiledPricingRule(pricing_rule).apply_business_rules(request, quote)
+    
+    def _calculate_taxes(self, request: PricingQuoteRequest, pricing_rule: PricingRule, pricing_settings: PricingSettings, quote: PricingQuote):
+        """Calculate tax amounts"""
+        settings_tax_rate = _to_decimal(getattr(pricing_settings, "tax_rate", 0) or 0)
+        CompiledPricingRule(pricing_rule).apply_taxes(settings_tax_rate, quote)
+    
     def _set_quote_validity(self, pricing_rule: PricingRule, quote: PricingQuote):
         """Set quote validity period"""
-        business_rules = pricing_rule.business_rules
-        validity_days = business_rules.get("quote_validity_days", 30)
-        
-        quote.valid_until = datetime.now(timezone.utc).replace(
-            hour=23, minute=59, second=59, microsecond=0
-        ) + timezone.utc.localize(datetime.now()).replace(
-            tzinfo=None
-        ).replace(
-            day=datetime.now().day + validity_days
-        ).replace(tzinfo=timezone.utc) - datetime.now(timezone.utc)
+        CompiledPricingRule(pricing_rule).apply_quote_validity(quote, datetime.now(timezone.utc))
     
     def _get_season(self, month: int) -> str:
         """Get season name from month number"""
-        if month in [12, 1, 2]:
-            return "winter"
-        elif month in [3, 4, 5]:
-            return "spring"
-        elif month in [6, 7, 8]:
-            return "summer"
-        elif month in [9, 10, 11]:
-            return "fall"
-        return "unknown"
+        return _get_season(month)
 
 
 # Convenience function for standalone usage
@@ -0,0 +1,353 @@
+"""
+Delayed-queue scheduler for ContentSchedule publishes
+Keeps scheduled posts in a Redis sorted set scored by due time, so the
+dispatcher process (backend.tasks.publish_dispatcher) only touches posts
+that are actually due instead of scanning the content_schedules table, and
+sleeps until the earliest one is due
+"""
+import logging
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from redis import Redis
+from sqlalchemy.orm import Session
+
+from backend.core.config import get_settings
+from backend.db.models import ContentSchedule, SocialConnection
+from backend.services.rate_limit import TokenBucket, get_token_bucket
+
+logger = logging.getLogger(__name__)
+
+# Posts claimed per dispatcher tick
+DISPATCH_BATCH_SIZE = 500
+# Claim posts due this far ahead and hand them to Celery with a countdown
+DISPATCH_LOOKAHEAD_SECONDS = 1.0
+# Retry delay for posts whose enqueue failed
+ENQUEUE_RETRY_SECONDS = 30
+# Longest the dispatcher sleeps without checking the queue, even when it is empty
+DISPATCHER_MAX_IDLE_SECONDS = 30.0
+# Rows per pipeline round trip when scheduling or reconciling in bulk
+PIPELINE_CHUNK_SIZE = 1000
+
+
+def _timestamp(value: datetime) -> float:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+class PublishScheduler:
+    """Sorted-set delayed queue that dispatches scheduled posts when they fall due"""
+
+    def __init__(
+        self,
+        redis_client: Redis,
+        token_bucket: Optional[TokenBucket] = None,
+        key_prefix: str = "publish_schedule"
+    ):
+        """
+        Initialize publish scheduler
+
+        Args:
+            redis_client: Redis client holding the queue
+            token_bucket: Publish rate limiter used to pace bursts
+            key_prefix: Prefix for Redis keys
+        """
+        self.redis = redis_client
+        self.token_bucket = token_bucket or get_token_bucket()
+        self.queue_key = f"{key_prefix}:due"
+        self.reconciled_key = f"{key_prefix}:reconciled"
+        # Pushed to whenever posts are added, so a sleeping dispatcher re-reads the head
+        self.wakeup_key = f"{key_prefix}:wakeup"
+
+    def schedule(self, schedule_id: str, due_at: datetime) -> None:
+        """
+        Add or move a scheduled post
+
+        Args:
+            schedule_id: ContentSchedule ID
+            due_at: When the post should go out
+        """
+        self.redis.zadd(self.queue_key, {str(schedule_id): _timestamp(due_at)})
+        self.wake()
+
+    def schedule_many(self, entries: Iterable[Tuple[str, datetime]], only_new: bool = False) -> int:
+        """
+        Add scheduled posts in pipelined batches
+
+        Args:
+            entries: (schedule_id, due_at) pairs
+            only_new: Leave posts already in the queue where they are
+
+        Returns:
+            Number of posts added
+        """
+        added = 0
+        batch: Dict[str, float] = {}
+        for schedule_id, due_at in entries:
+            batch[str(schedule_id)] = _timestamp(due_at)
+            if len(batch) >= PIPELINE_CHUNK_SIZE:
+                added += self.redis.zadd(self.queue_key, batch, nx=only_new)
+                batch = {}
+        if batch:
+            added += self.redis.zadd(self.queue_key, batch, nx=only_new)
+        if added:
+            self.wake()
+        return added
+
+    def cancel(self, schedule_id: str) -> bool:
+        """
+        Remove a scheduled post from the queue
+
+        Args:
+            schedule_id: ContentSchedule ID
+
+        Returns:
+            True if the post was queued
+        """
+        return bool(self.redis.zrem(self.queue_key, str(schedule_id)))
+
+    def pending_count(self) -> int:
+        """Number of posts waiting in the queue"""
+        return self.redis.zcard(self.queue_key)
+
+    def next_due_at(self) -> Optional[float]:
+        """Due timestamp of the earliest queued post, or None when the queue is empty"""
+        head = self.redis.zrange(self.queue_key, 0, 0, withscores=True)
+        return head[0][1] if head else None
+
+    def seconds_until_next(self, now: Optional[float] = None) -> float:
+        """
+        How long the dispatcher can sleep before the earliest post needs claiming
+
+        Args:
+            now: Current Unix timestamp (defaults to the clock)
+
+        Returns:
+            Seconds, capped at DISPATCHER_MAX_IDLE_SECONDS
+        """
+        now = time.time() if now is None else now
+        due_at = self.next_due_at()
+        if due_at is None:
+            return DISPATCHER_MAX_IDLE_SECONDS
+        return min(max(0.0, due_at - DISPATCH_LOOKAHEAD_SECONDS - now), DISPATCHER_MAX_IDLE_SECONDS)
+
+    def wake(self) -> None:
+        """Wake a sleeping dispatcher so it sees posts added ahead of the head it is waiting for"""
+        pipe = self.redis.pipeline(transaction=False)
+        pipe.lpush(self.wakeup_key, 1)
+        pipe.ltrim(self.wakeup_key, 0, 0)
+        pipe.execute()
+
+    def wait_for_work(self, timeout: float) -> bool:
+        """
+        Block until the timeout passes or a post is added
+
+        Args:
+            timeout: Seconds to wait at most
+
+        Returns:
+            True if woken by a newly added post
+        """
+        if timeout <= 0:
+            return False
+        # BLPOP treats 0 as "forever", so sub-millisecond waits are skipped above
+        return self.redis.blpop([self.wakeup_key], timeout=max(timeout, 0.001)) is not None
+
+    def claim_due(self, until: float, limit: int = DISPATCH_BATCH_SIZE) -> Dict[str, float]:
+        """
+        Take posts due by `until` off the queue
+
+        A post belongs to whichever dispatcher's ZREM removes it, so
+        overlapping ticks never dispatch the same post twice.
+
+        Args:
+            until: Unix timestamp
+            limit: Maximum posts to claim
+
+        Returns:
+            Claimed schedule IDs mapped to their due timestamps
+        """
+        due = self.redis.zrangebyscore(self.queue_key, "-inf", until, start=0, num=limit, withscores=True)
+        if not due:
+            return {}
+
+        pipe = self.redis.pipeline(transaction=False)
+        for member, _ in due:
+            pipe.zrem(self.queue_key, member)
+        removed = pipe.execute()
+
+        return {
+            (member.decode() if isinstance(member, bytes) else member): score
+            for (member, score), was_removed in zip(due, removed)
+            if was_removed
+        }
+
+    def dispatch_due(self, db: Session, now: Optional[float] = None, limit: int = DISPATCH_BATCH_SIZE) -> Dict[str, Any]:
+        """
+        Enqueue publish tasks for posts that are due
+
+        Args:
+            db: Database session
+            now: Current Unix timestamp (defaults to the clock)
+            limit: Maximum posts to claim this tick
+
+        Returns:
+            Dictionary with dispatch counts
+        """
+        now = time.time() if now is None else now
+        claimed = self.claim_due(now + DISPATCH_LOOKAHEAD_SECONDS, limit)
+        results = {"claimed": len(claimed), "dispatched": 0, "deferred": 0, "skipped": 0, "failed": 0}
+        if not claimed:
+            return results
+
+        rows = self._load_schedules(db, claimed.keys())
+        results["skipped"] = len(claimed) - len(rows)
+
+        requeue: Dict[str, float] = {}
+        ready = []
+        for schedule, platform in rows:
+            schedule_id = str(schedule.id)
+            due_at = _timestamp(schedule.scheduled_for)
+            if due_at > now + DISPATCH_LOOKAHEAD_SECONDS:
+                # Rescheduled later since it was queued
+                requeue[schedule_id] = due_at
+            else:
+                ready.append((schedule, platform, claimed[schedule_id]))
+
+        dispatch, deferred = self._pace(ready, now)
+        requeue.update(deferred)
+        results["deferred"] = len(deferred)
+
+        dispatched_ids = []
+        for schedule, due_at in dispatch:
+            try:
+                self._enqueue(schedule, max(0.0, due_at - now))
+                dispatched_ids.append(schedule.id)
+            except Exception as e:
+                logger.error(f"Error enqueueing scheduled post {schedule.id}: {e}")
+                requeue[str(schedule.id)] = now + ENQUEUE_RETRY_SECONDS
+                results["failed"] += 1
+
+        if requeue:
+            self.redis.zadd(self.queue_key, requeue)
+
+        if dispatched_ids:
+            db.query(ContentSchedule).filter(
+                ContentSchedule.id.in_(dispatched_ids)
+            ).update({"status": "publishing"}, synchronize_session=False)
+            db.commit()
+
+        results["dispatched"] = len(dispatched_ids)
+        return results
+
+    def reconcile(self, db: Session) -> Dict[str, int]:
+        """
+        Re-queue scheduled posts missing from Redis
+
+        Covers posts created while Redis was unreachable and a Redis
+        restart that lost the queue. Posts already queued keep their score.
+
+        Args:
+            db: Database session
+
+        Returns:
+            Dictionary with scheduled and re-queued counts
+        """
+        rows = db.query(ContentSchedule.id, ContentSchedule.scheduled_for).filter(
+            ContentSchedule.status == "scheduled",
+            ContentSchedule.scheduled_for.isnot(None)
+        ).yield_per(PIPELINE_CHUNK_SIZE)
+
+        scheduled = 0
+
+        def entries():
+            nonlocal scheduled
+            for schedule_id, scheduled_for in rows:
+                scheduled += 1
+                yield schedule_id, scheduled_for
+
+        added = self.schedule_many(entries(), only_new=True)
+        self.redis.set(self.reconciled_key, int(time.time()))
+
+        if added:
+            logger.warning(f"Publish scheduler re-queued {added} of {scheduled} scheduled posts")
+        return {"scheduled": scheduled, "requeued": added}
+
+    def needs_reconcile(self) -> bool:
+        """True if the queue has not been rebuilt since Redis last lost its data"""
+        return not self.redis.exists(self.reconciled_key)
+
+    def _load_schedules(self, db: Session, schedule_ids: Iterable[str]) -> List[Tuple[ContentSchedule, str]]:
+        """Load claimed posts that are still waiting to publish, with their platform"""
+        ids = [uuid.UUID(schedule_id) for schedule_id in schedule_ids]
+        return db.query(ContentSchedule, SocialConnection.platform).join(
+            SocialConnection, SocialConnection.id == ContentSchedule.connection_id
+        ).filter(
+            ContentSchedule.id.in_(ids),
+            ContentSchedule.status == "scheduled"
+        ).all()
+
+    def _pace(self, ready: List[Tuple[ContentSchedule, str, float]], now: float) -> Tuple[List[Tuple[ContentSchedule, float]], Dict[str, float]]:
+        """
+        Split due posts into ones to send now and ones to push back
+
+        Posts sharing a token bucket (organization + platform) are sent up to
+        the tokens left in it; the rest are spaced at the bucket's refill
+        interval rather than enqueued to fail the rate limit and retry.
+        """
+        buckets: Dict[Tuple[str, str], List[Tuple[ContentSchedule, float]]] = {}
+        for schedule, platform, due_at in ready:
+            buckets.setdefault((str(schedule.organization_id), platform), []).append((schedule, due_at))
+
+        interval = self.token_bucket.window_s / self.token_bucket.refill_rate
+        dispatch = []
+        deferred = {}
+        for (org_id, platform), posts in buckets.items():
+            posts.sort(key=lambda post: post[1])
+            allowance = len(posts) if len(posts) == 1 else self.token_bucket.get_remaining(org_id, platform)
+            dispatch.extend(posts[:allowance])
+            for position, (schedule, _) in enumerate(posts[allowance:], start=1):
+                deferred[str(schedule.id)] = now + position * interval
+        return dispatch, deferred
+
+    def _enqueue(self, schedule: ContentSchedule, delay_s: float) -> str:
+        from backend.services.connection_publisher_service import get_connection_publisher_service
+
+        return get_connection_publisher_service().enqueue_publish_task(
+            connection_id=str(schedule.connection_id),
+            content=schedule.content,
+            media_urls=schedule.media_urls or [],
+            content_hash=schedule.content_hash,
+            scheduled_time=schedule.scheduled_for,
+            idempotency_key=schedule.idempotency_key,
+            delay_s=delay_s
+        )
+
+
+# Singleton instance
+_publish_scheduler = None
+
+
+def get_publish_scheduler(redis_client: Optional[Redis] = None) -> PublishScheduler:
+    """
+    Get publish scheduler instance
+
+    Args:
+        redis_client: Redis client (will create default if not provided)
+
+    Returns:
+        PublishScheduler instance
+    """
+    global _publish_scheduler
+
+    if _publish_scheduler is None:
+        if redis_client is None:
+            import redis
+            settings = get_settings()
+            redis_client = redis.from_url(getattr(settings, 'redis_url', 'redis://localhost:6379/0'))
+        _publish_scheduler = PublishScheduler(redis_client)
+
+    return _publish_scheduler
@@ -8,9 +8,9 @@ from decimal import Decimal
 from typing import Dict, List, Optional, Any
 import logging
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from sqlalchemy import and_, func
 
-from backend.db.models import Quote, PricingRule, Organization, User
+from backend.db.models import Quote, QuoteNumberSequence, Organization, User
 from backend.services.pricing_service import PricingService, PricingQuoteRequest
 from backend.services.settings_resolver import SettingsResolver
 from backend.core.audit_logger import get_audit_logger, AuditEventType
@@ -149,17 +149,8 @@ class QuoteService:
                 created_by_id=user_id
             )
             
-            # Try to link to pricing rule used
-            if pricing_quote.applied_rules:
-                pricing_rule = db.query(PricingRule).filter(
-                    and_(
-                        PricingRule.organization_id == request.organization_id,
-                        PricingRule.name.in_(pricing_quote.applied_rules),
-                        PricingRule.is_active == True
-                    )
-                ).first()
-                if pricing_rule:
-                    quote.pricing_rule_id = pricing_rule.id
+            # Link to the pricing rule used
+            quote.pricing_rule_id = pricing_quote.pricing_rule_id
             
             db.add(quote)
             db.commit()
@@ -341,31 +332,49 @@ class QuoteService:
     
     def _generate_quote_number(self, organization_id: str, db: Session) -> str:
         """
-        Generate a unique quote number for the organization
-        """
-        # Get current year and month
-        now = datetime.now()
-        year_month = now.strftime("%Y%m")
+        Take the next quote number from the organization's monthly sequence
         
-        # Find the highest quote number for this org and month
-        existing_quote = db.query(Quote).filter(
-            and_(
-                Quote.organization_id == organization_id,
-                Quote.quote_number.like(f"Q-{year_month}-%")
-            )
-        ).order_by(Quote.quote_number.desc()).first()
+        The counter row is incremented atomically and stays locked until the
+        caller's transaction ends, so concurrent requests never get the same
+        number and a rolled-back quote gives its number back.
         
-        if existing_quote:
-            # Extract sequence number and increment
-            try:
-                last_seq = int(existing_quote.quote_number.split("-")[-1])
-                next_seq = last_seq + 1
-            except (ValueError, IndexError):
-                next_seq = 1
+        Args:
+            organization_id: Organization to number quotes for
+            db: Database session (not committed here)
+            
+        Returns:
+            Quote number such as Q-202506-0001
+        """
+        year_month = datetime.now().strftime("%Y%m")
+        return f"Q-{year_month}-{self._increment_quote_sequence(organization_id, year_month, db):04d}"
+    
+    def _increment_quote_sequence(self, organization_id: str, period: str, db: Session) -> int:
+        """Increment the (organization, period) counter and return its new value"""
+        dialect = db.get_bind().dialect.name
+        if dialect == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert
+        elif dialect == "sqlite":
+            from sqlalchemy.dialects.sqlite import insert
         else:
-            next_seq = 1
+            sequence = db.query(QuoteNumberSequence).filter_by(
+                organization_id=organization_id, period=period
+            ).with_for_update().first()
+            if sequence is None:
+                sequence = QuoteNumberSequence(organization_id=organization_id, period=period, last_value=0)
+                db.add(sequence)
+            sequence.last_value += 1
+            db.flush()
+            return sequence.last_value
+        
+        table = QuoteNumberSequence.__table__
+        statement = insert(table).values(
+            organization_id=organization_id, period=period, last_value=1
+        ).on_conflict_do_update(
+            index_elements=["organization_id", "period"],
+            set_={"last_value": table.c.last_value + 1, "updated_at": func.now()}
+        ).returning(table.c.last_value)
         
-        return f"Q-{year_month}-{next_seq:04d}"
+        return db.execute(statement).scalar_one()
     
     def _recompute_quote_pricing(self, quote: Quote, db: Session, user_id: int):
         """
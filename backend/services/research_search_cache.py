@@ -0,0 +1,96 @@
+"""
+Research Search Cache
+
+Process-wide cache of web search results, scraped pages and research model
+responses used by DeepResearchAgent.
+
+Industries and tenants research overlapping topics, so the same queries and
+URLs come up again and again within a weekly run. Search queries are keyed
+by their normalized text and pages by their canonical URL (tracking
+parameters and fragments dropped), entries expire after a TTL, and
+concurrent lookups for the same key share one in-flight request.
+"""
+
+import logging
+from typing import Any, Dict, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from backend.services.async_ttl_cache import AsyncTTLCache
+
+logger = logging.getLogger(__name__)
+
+# Search results change slowly; a weekly run finishes well inside this
+SEARCH_TTL_SECONDS = 12 * 3600
+PAGE_TTL_SECONDS = 24 * 3600
+
+TRACKING_PARAM_PREFIXES = ("utm_", "fbclid", "gclid", "mc_cid", "mc_eid", "ref_src")
+
+
+def normalize_query(query: str) -> str:
+    """Case-fold and collapse whitespace so equivalent queries share a key"""
+    return " ".join((query or "").casefold().split())
+
+
+def normalize_url(url: str) -> str:
+    """
+    Canonical form of a URL for caching and dedup
+
+    Lower-cases the scheme and host, drops the fragment, default ports,
+    trailing slashes and tracking parameters, and sorts the query string.
+    """
+    try:
+        parts = urlsplit((url or "").strip())
+    except ValueError:
+        return (url or "").strip()
+
+    scheme = parts.scheme.lower()
+    netloc = parts.netloc.lower()
+    if (scheme, netloc.rsplit(":", 1)[-1]) in (("http", "80"), ("https", "443")):
+        netloc = netloc.rsplit(":", 1)[0]
+    if netloc.startswith("www."):
+        netloc = netloc[4:]
+
+    params = sorted(
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith(TRACKING_PARAM_PREFIXES)
+    )
+    path = parts.path.rstrip("/") or "/"
+    return urlunsplit((scheme, netloc, path, urlencode(params), ""))
+
+
+class ResearchSearchCache(AsyncTTLCache):
+    """
+    LRU cache of research lookups with per-namespace TTLs and single-flight
+
+    Empty results are not stored, so a failed search or scrape is retried
+    on the next lookup.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 20000,
+        ttl_seconds: Optional[Dict[str, int]] = None,
+        default_ttl_seconds: int = SEARCH_TTL_SECONDS
+    ):
+        super().__init__(max_entries=max_entries, ttl_seconds=default_ttl_seconds)
+        self.namespace_ttl_seconds = ttl_seconds or {"page": PAGE_TTL_SECONDS}
+
+    def _ttl(self, namespace: str) -> int:
+        return self.namespace_ttl_seconds.get(namespace.split(":", 1)[0], self.ttl_seconds)
+
+    def _cacheable(self, value: Any) -> bool:
+        return bool(value)
+
+
+# Global cache instance
+_research_search_cache: Optional[ResearchSearchCache] = None
+
+
+def get_research_search_cache() -> ResearchSearchCache:
+    """Get or create the process-wide research search cache"""
+    global _research_search_cache
+
+    if _research_search_cache is None:
+        _research_search_cache = ResearchSearchCache()
+
+    return _research_search_cache
@@ -0,0 +1,223 @@
+"""
+Retention Executor
+
+Deletes expired rows in short, primary-key-ordered chunks instead of one
+unbounded DELETE per table:
+
+- Each chunk selects the next `chunk_size` expired primary keys after the
+  cursor, deletes them and saves the cursor in the same short transaction,
+  so locks are held briefly and WAL is written in small pieces.
+- A rows-per-second budget paces the run so webhook and publishing writers
+  are not starved.
+- Cursors are persisted per (category, target) in retention_cursors. A run
+  that is interrupted or hits its time budget resumes after the last
+  deleted key; a finished pass clears its cursor.
+- Time-partitioned tables drop whole expired partitions before deleting
+  what is left row by row.
+- Bulk deletes skip ORM events, so a target whose rows feed maintained
+  state (e.g. inbox counters) adjusts it in before_delete, in the same
+  transaction as each chunk.
+"""
+import logging
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from prometheus_client import Counter, Histogram
+from sqlalchemy.orm import Session
+
+from backend.core.config import get_settings
+from backend.db.models import RetentionCursor
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+RETENTION_ROWS_DELETED = Counter(
+    'data_retention_rows_deleted_total',
+    'Rows deleted by chunked retention cleanup',
+    ['category', 'target']
+)
+
+RETENTION_PARTITIONS_DROPPED = Counter(
+    'data_retention_partitions_dropped_total',
+    'Expired partitions dropped by retention cleanup',
+    ['category', 'target']
+)
+
+RETENTION_CHUNK_DURATION = Histogram(
+    'data_retention_chunk_duration_seconds',
+    'Time spent deleting one retention chunk',
+    ['category']
+)
+
+
+@dataclass(frozen=True)
+class RetentionTarget:
+    """One table (optionally narrowed by extra conditions) a category cleans up"""
+    name: str
+    model: Any
+    date_column: str
+    conditions: Tuple[Any, ...] = ()
+    drop_partitions: Optional[Callable[[Session, datetime], List[str]]] = None
+    # Called with each chunk's primary keys just before they are deleted
+    before_delete: Optional[Callable[[Session, List[Any]], None]] = None
+
+    @property
+    def primary_key(self):
+        columns = list(self.model.__table__.primary_key.columns)
+        if len(columns) != 1:
+            raise ValueError(f"{self.name} needs a single-column primary key for chunked deletes")
+        return getattr(self.model, columns[0].key)
+
+    def parse_key(self, value: str) -> Any:
+        """Turn a persisted cursor back into a primary key value"""
+        return self.primary_key.type.python_type(value)
+
+
+class RetentionExecutor:
+    """Chunked, throttled, resumable deletes for data retention"""
+
+    def __init__(
+        self,
+        chunk_size: Optional[int] = None,
+        rows_per_second: Optional[int] = None,
+        max_seconds: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep
+    ):
+        self.chunk_size = chunk_size or settings.retention_delete_chunk_size
+        self.rows_per_second = rows_per_second if rows_per_second is not None else settings.retention_delete_rows_per_second
+        self.max_seconds = max_seconds if max_seconds is not None else settings.retention_run_max_seconds
+        self._clock = clock
+        self._sleep = sleep
+
+    def run(self, db: Session, category: str, targets: Sequence[RetentionTarget], cutoff: datetime) -> Dict[str, Any]:
+        """
+        Delete rows older than cutoff from each target, resuming saved cursors
+
+        Args:
+            db: Database session (committed after every chunk)
+            category: Retention category the cursors are stored under
+            targets: Tables to clean, in order
+            cutoff: Rows whose date column is before this are deleted
+
+        Returns:
+            Deleted counts per target, dropped partitions, chunk count and
+            whether every target finished within the time budget
+        """
+        started = self._clock()
+        result = {
+            "deleted_counts": {},
+            "partitions_dropped": {},
+            "chunks": 0,
+            "completed": True,
+            "resumed": []
+        }
+
+        for target in targets:
+            if self.max_seconds and self._clock() - started >= self.max_seconds:
+                result["completed"] = False
+                break
+            if not self._run_target(db, category, target, cutoff, started, result):
+                result["completed"] = False
+                break
+
+        result["elapsed_seconds"] = round(self._clock() - started, 3)
+        logger.info(
+            f"Retention {category}: deleted {sum(result['deleted_counts'].values())} rows in "
+            f"{result['chunks']} chunks ({'complete' if result['completed'] else 'will resume'})"
+        )
+        return result
+
+    def _run_target(
+        self,
+        db: Session,
+        category: str,
+        target: RetentionTarget,
+        cutoff: datetime,
+        started: float,
+        result: Dict[str, Any]
+    ) -> bool:
+        """Clean one target; returns False when the time budget ran out first"""
+        if target.drop_partitions:
+            dropped = target.drop_partitions(db, cutoff)
+            db.commit()
+            if dropped:
+                result["partitions_dropped"][target.name] = dropped
+                RETENTION_PARTITIONS_DROPPED.labels(category=category, target=target.name).inc(len(dropped))
+
+        pk = target.primary_key
+        cursor = db.get(RetentionCursor, (category, target.name))
+        last_key = target.parse_key(cursor.last_key) if cursor and cursor.last_key is not None else None
+        if last_key is not None:
+            result["resumed"].append(target.name)
+        result["deleted_counts"].setdefault(target.name, 0)
+
+        while True:
+            if self.max_seconds and self._clock() - started >= self.max_seconds:
+                return False
+
+            chunk_started = time.perf_counter()
+            query = db.query(pk).filter(getattr(target.model, target.date_column) < cutoff, *target.conditions)
+            if last_key is not None:
+                query = query.filter(pk > last_key)
+            keys = [row[0] for row in query.order_by(pk).limit(self.chunk_size)]
+
+            if not keys:
+                if cursor is not None:
+                    db.delete(cursor)
+                    db.commit()
+                return True
+
+            if target.before_delete:
+                target.before_delete(db, keys)
+            deleted = db.query(target.model).filter(pk.in_(keys)).delete(synchronize_session=False)
+            last_key = keys[-1]
+            if cursor is None:
+                cursor = RetentionCursor(category=category, target=target.name, rows_deleted=0)
+                db.add(cursor)
+            cursor.last_key = str(last_key)
+            cursor.rows_deleted = (cursor.rows_deleted or 0) + deleted
+            cursor.updated_at = datetime.now(timezone.utc)
+            db.commit()
+
+            RETENTION_CHUNK_DURATION.labels(category=category).observe(time.perf_counter() - chunk_started)
+            RETENTION_ROWS_DELETED.labels(category=category, target=target.name).inc(deleted)
+            result["deleted_counts"][target.name] += deleted
+            result["chunks"] += 1
+            self._throttle(sum(result["deleted_counts"].values()), started)
+
+    def _throttle(self, deleted: int, started: float) -> None:
+        """Sleep until the run is back within its rows-per-second budget"""
+        if not self.rows_per_second:
+            return
+        ahead = deleted / self.rows_per_second - (self._clock() - started)
+        if ahead > 0:
+            self._sleep(ahead)
+
+    def get_progress(self, db: Session, category: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Unfinished passes and how far they got
+
+        Args:
+            db: Database session
+            category: Only this category (all when None)
+
+        Returns:
+            One entry per saved cursor
+        """
+        query = db.query(RetentionCursor)
+        if category:
+            query = query.filter(RetentionCursor.category == category)
+        return [
+            {
+                "category": cursor.category,
+                "target": cursor.target,
+                "last_key": cursor.last_key,
+                "rows_deleted": cursor.rows_deleted,
+                "started_at": cursor.started_at.isoformat() if cursor.started_at else None,
+                "updated_at": cursor.updated_at.isoformat() if cursor.updated_at else None
+            }
+            for cursor in query.order_by(RetentionCursor.category, RetentionCursor.target)
+        ]
@@ -726,6 +726,48 @@ class SettingsResolver:
             return full_settings.scheduling
         else:
             raise ValueError(f"Unknown namespace: {namespace}")
+    
+    def get_namespace_settings_bulk(self,
+                                    org_ids: List[str],
+                                    namespace: SettingsNamespace) -> Dict[str, Union[PricingSettings, WeatherSettings, DMSettings, SchedulingSettings]]:
+        """
+        Resolve organization-level settings for many organizations in one query
+        
+        Used by system sweeps that have no user or team context, so only the
+        organization layer is merged over the defaults. Organizations that
+        don't exist resolve to defaults.
+        
+        Args:
+            org_ids: Organization IDs to resolve
+            namespace: Settings namespace to return
+            
+        Returns:
+            Namespace settings keyed by organization ID
+        """
+        unique_ids = list(dict.fromkeys(org_ids))
+        if not unique_ids:
+            return {}
+        
+        orgs = {
+            org.id: org for org in
+            self.db.query(Organization).filter(Organization.id.in_(unique_ids)).all()
+        }
+        
+        resolved = {}
+        for org_id in unique_ids:
+            merged_settings = {ns.value: {} for ns in SettingsNamespace}
+            org = orgs.get(org_id)
+            if org:
+                for ns in SettingsNamespace:
+                    org_settings = self._get_settings_from_entity(org, ns)
+                    if org_settings:
+                        merged_settings[ns.value] = self._merge_settings_dicts(
+                            merged_settings[ns.value], org_settings
+                        )
+            
+            resolved[org_id] = getattr(self._validate_settings(merged_settings), namespace.value)
+        
+        return resolved
 
 
 def create_settings_resolver(db: Session) -> SettingsResolver:
@@ -746,6 +788,12 @@ def get_weather_settings(db: Session, org_id: str, user_id: Optional[int] = None
     return resolver.get_namespace_settings(org_id, SettingsNamespace.WEATHER, user_id)
 
 
+def get_weather_settings_bulk(db: Session, org_ids: List[str]) -> Dict[str, WeatherSettings]:
+    """Get organization-level weather settings for many organizations at once"""
+    resolver = SettingsResolver(db)
+    return resolver.get_namespace_settings_bulk(org_ids, SettingsNamespace.WEATHER)
+
+
 def get_dm_settings(db: Session, org_id: str, user_id: Optional[int] = None) -> DMSettings:
     """Get DM settings for an organization/user"""
     resolver = SettingsResolver(db)
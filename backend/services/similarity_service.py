@@ -130,6 +130,34 @@ class SimilarityService:
         
         logger.info("SimilarityService initialized with advanced content analysis capabilities")
     
+    def check_near_duplicate(
+        self,
+        content: str,
+        organization_id: Optional[Union[str, int]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Fast SimHash pre-check for reworded copies of stored content
+        
+        Runs in microseconds without an embedding call, so callers can use it
+        before paying for a vector similarity search.
+        
+        Args:
+            content: Text to check
+            organization_id: Only compare against this organization's content
+            
+        Returns:
+            Dict with content_id, similarity and hamming_distance of the closest
+            near-duplicate, or None
+        """
+        match = embedding_service.find_near_duplicate(content, {"organization_id": organization_id})
+        if match is None:
+            return None
+        return {
+            "content_id": match.item_id,
+            "similarity": match.similarity,
+            "hamming_distance": match.distance
+        }
+    
     async def find_similar_content(
         self,
         query: str,
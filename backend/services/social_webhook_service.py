@@ -243,6 +243,7 @@ class SocialWebhookService:
             interaction = SocialInteraction(
                 user_id=connection.user_id,
                 connection_id=connection.id,
+                organization_id=str(connection.organization_id),
                 platform='facebook',
                 interaction_type='comment',
                 external_id=comment_id,
@@ -284,6 +285,7 @@ class SocialWebhookService:
             interaction = SocialInteraction(
                 user_id=connection.user_id,
                 connection_id=connection.id,
+                organization_id=str(connection.organization_id),
                 platform='facebook',
                 interaction_type='mention',
                 external_id=mention_id,
@@ -324,6 +326,7 @@ class SocialWebhookService:
             interaction = SocialInteraction(
                 user_id=connection.user_id,
                 connection_id=connection.id,
+                organization_id=str(connection.organization_id),
                 platform='facebook',
                 interaction_type='dm',
                 external_id=message_id,
@@ -384,6 +387,7 @@ class SocialWebhookService:
             interaction = SocialInteraction(
                 user_id=connection.user_id,
                 connection_id=connection.id,
+                organization_id=str(connection.organization_id),
                 platform='instagram',
                 interaction_type='comment',
                 external_id=comment_id,
@@ -425,6 +429,7 @@ class SocialWebhookService:
             interaction = SocialInteraction(
                 user_id=connection.user_id,
                 connection_id=connection.id,
+                organization_id=str(connection.organization_id),
                 platform='instagram',
                 interaction_type='mention',
                 external_id=comment_id,
@@ -475,6 +480,7 @@ class SocialWebhookService:
             interaction = SocialInteraction(
                 user_id=our_connection.user_id,
                 connection_id=our_connection.id,
+                organization_id=str(our_connection.organization_id),
                 platform='twitter',
                 interaction_type='mention',
                 external_id=tweet_id,
@@ -521,6 +527,7 @@ class SocialWebhookService:
             interaction = SocialInteraction(
                 user_id=connection.user_id,
                 connection_id=connection.id,
+                organization_id=str(connection.organization_id),
                 platform='twitter',
                 interaction_type='dm',
                 external_id=message_id,
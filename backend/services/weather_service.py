@@ -7,10 +7,14 @@ Supports multiple weather providers through injectable provider pattern.
 
 import os
 import json
+import math
+import time
 import asyncio
+import logging
 from abc import ABC, abstractmethod
-from datetime import datetime, timedelta, timezone
-from typing import Dict, List, Optional, Any, Protocol
+from collections import OrderedDict
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, Iterable, List, Optional, Any, Protocol, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
@@ -20,6 +24,11 @@ from pydantic import BaseModel, Field
 
 from backend.services.settings_resolver import BadWeatherThreshold
 
+logger = logging.getLogger(__name__)
+
+# Forecast cells are 0.1° squares (~11 km), well inside forecast model resolution
+FORECAST_CELL_DEGREES = 0.1
+
 
 class WeatherCondition(str, Enum):
     """Weather condition classifications"""
@@ -90,6 +99,10 @@ class WeatherForecast:
 class WeatherProvider(ABC):
     """Abstract base class for weather providers"""
     
+    # How often the provider publishes a new forecast run; cached forecasts
+    # older than this are stale
+    update_interval_seconds: int = 3600
+    
     @abstractmethod
     async def get_forecast(
         self, 
@@ -119,6 +132,9 @@ class WeatherProvider(ABC):
 class OpenWeatherMapProvider(WeatherProvider):
     """OpenWeatherMap API provider implementation"""
     
+    # The 5 day / 3 hour forecast is refreshed every 3 hours
+    update_interval_seconds = 3 * 3600
+    
     def __init__(self, api_key: Optional[str] = None):
         self.api_key = api_key or os.getenv("OPENWEATHER_API_KEY")
         self.base_url = "https://api.openweathermap.org/data/2.5"
@@ -233,6 +249,8 @@ class MockWeatherProvider(WeatherProvider):
     
     def __init__(self, mock_conditions: Optional[List[WeatherForecast]] = None):
         self.mock_conditions = mock_conditions or []
+        self.call_count = 0
+        self.calls: List[Tuple[float, float, int]] = []
     
     def validate_config(self) -> bool:
         """Mock provider is always valid"""
@@ -245,6 +263,9 @@ class MockWeatherProvider(WeatherProvider):
         days: int = 3
     ) -> List[WeatherForecast]:
         """Return mock forecast data"""
+        self.call_count += 1
+        self.calls.append((latitude, longitude, days))
+        
         if self.mock_conditions:
             return self.mock_conditions[:days]
             
@@ -267,6 +288,82 @@ class MockWeatherProvider(WeatherProvider):
         return forecasts
 
 
+def forecast_cell(
+    latitude: float,
+    longitude: float,
+    cell_degrees: float = FORECAST_CELL_DEGREES
+) -> Tuple[float, float]:
+    """
+    Snap coordinates to the center of their forecast grid cell
+    
+    Locations in the same cell share one provider forecast.
+    """
+    return (
+        round((math.floor(latitude / cell_degrees) + 0.5) * cell_degrees, 4),
+        round((math.floor(longitude / cell_degrees) + 0.5) * cell_degrees, 4)
+    )
+
+
+class ForecastCache:
+    """
+    In-process forecast cache keyed by location cell and forecast day
+    
+    Entries expire after the provider's update interval, so a sweep never
+    refetches a forecast the provider has not republished yet. Each cell
+    remembers how many days were requested, which keeps providers that
+    return fewer days than asked (OpenWeatherMap caps at 5) cacheable.
+    """
+    
+    def __init__(self, ttl_seconds: int = 3600, max_cells: int = 10000):
+        self.ttl_seconds = ttl_seconds
+        self.max_cells = max_cells
+        
+        # cell -> (expires_at, days_requested, {forecast day: forecast})
+        self._entries: "OrderedDict[Tuple[float, float], Tuple[float, int, Dict[date, WeatherForecast]]]" = OrderedDict()
+        
+        self.hits = 0
+        self.misses = 0
+    
+    def get(self, cell: Tuple[float, float], days: int) -> Optional[List[WeatherForecast]]:
+        """Return cached forecasts from today onwards, or None on a miss"""
+        entry = self._entries.get(cell)
+        
+        if entry is None or entry[0] < time.monotonic() or entry[1] < days:
+            self.misses += 1
+            return None
+        
+        self._entries.move_to_end(cell)
+        self.hits += 1
+        
+        today = datetime.now(timezone.utc).date()
+        by_day = entry[2]
+        return [by_day[day] for day in sorted(by_day) if day >= today][:days]
+    
+    def set(self, cell: Tuple[float, float], days: int, forecasts: List[WeatherForecast]) -> None:
+        """Cache a provider response for a cell"""
+        by_day = {forecast.date.date(): forecast for forecast in forecasts}
+        self._entries[cell] = (time.monotonic() + self.ttl_seconds, days, by_day)
+        self._entries.move_to_end(cell)
+        
+        while len(self._entries) > self.max_cells:
+            self._entries.popitem(last=False)
+    
+    def clear(self) -> None:
+        """Drop all cached forecasts"""
+        self._entries.clear()
+    
+    def stats(self) -> Dict[str, Any]:
+        """Cache statistics for monitoring"""
+        total = self.hits + self.misses
+        return {
+            "cells": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total * 100, 2) if total else 0.0,
+            "ttl_seconds": self.ttl_seconds
+        }
+
+
 class WeatherService:
     """
     PW-WEATHER-ADD-001: Weather service with provider abstraction
@@ -274,17 +371,30 @@ class WeatherService:
     Provides weather forecasting capabilities with pluggable providers
     """
     
-    def __init__(self, provider: Optional[WeatherProvider] = None):
+    def __init__(
+        self,
+        provider: Optional[WeatherProvider] = None,
+        forecast_cache: Optional[ForecastCache] = None,
+        max_concurrent_fetches: int = 10
+    ):
         """
         Initialize weather service with optional provider
         
         Args:
             provider: Weather provider instance. If None, will auto-select based on config
+            forecast_cache: Cell/day forecast cache. Defaults to one with the provider's update interval as TTL
+            max_concurrent_fetches: Upper bound on parallel provider calls during a sweep
         """
         if provider:
             self.provider = provider
         else:
             self.provider = self._create_default_provider()
+        
+        self.forecast_cache = forecast_cache or ForecastCache(
+            ttl_seconds=self.provider.update_interval_seconds
+        )
+        self.max_concurrent_fetches = max_concurrent_fetches
+        self._inflight: Dict[Tuple[Tuple[float, float], int], asyncio.Task] = {}
     
     def _create_default_provider(self) -> WeatherProvider:
         """Create default weather provider based on environment configuration"""
@@ -323,6 +433,77 @@ class WeatherService:
             print(f"Weather service error: {e}")
             return []
     
+    async def get_cell_forecast(
+        self,
+        latitude: float,
+        longitude: float,
+        date_range: int = 3
+    ) -> List[WeatherForecast]:
+        """
+        Get the cached forecast for the grid cell containing a location
+        
+        The provider is queried at the cell center, and concurrent callers
+        for the same cell share a single in-flight request.
+        
+        Args:
+            latitude: Location latitude
+            longitude: Location longitude
+            date_range: Number of days to forecast
+            
+        Returns:
+            List of weather forecasts in normalized format
+        """
+        cell = forecast_cell(latitude, longitude)
+        cached = self.forecast_cache.get(cell, date_range)
+        if cached is not None:
+            return cached
+        
+        key = (cell, date_range)
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_cell(cell, date_range))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        
+        return await asyncio.shield(task)
+    
+    async def _fetch_cell(self, cell: Tuple[float, float], date_range: int) -> List[WeatherForecast]:
+        """Fetch a cell forecast from the provider and cache non-empty results"""
+        forecasts = await self.get_forecast(cell[0], cell[1], date_range)
+        if forecasts:
+            self.forecast_cache.set(cell, date_range, forecasts)
+        return forecasts
+    
+    async def get_forecasts_for_locations(
+        self,
+        locations: Iterable[Tuple[float, float]],
+        date_range: int = 3
+    ) -> Dict[Tuple[float, float], List[WeatherForecast]]:
+        """
+        Fetch forecasts for many locations with one request per unique cell
+        
+        Args:
+            locations: (latitude, longitude) pairs
+            date_range: Number of days to forecast
+            
+        Returns:
+            Forecasts keyed by forecast cell (see forecast_cell)
+        """
+        cells = {forecast_cell(latitude, longitude) for latitude, longitude in locations}
+        semaphore = asyncio.Semaphore(self.max_concurrent_fetches)
+        
+        async def fetch(cell: Tuple[float, float]):
+            async with semaphore:
+                return cell, await self.get_cell_forecast(cell[0], cell[1], date_range)
+        
+        results = await asyncio.gather(*(fetch(cell) for cell in cells))
+        
+        logger.info(
+            f"Fetched forecasts for {len(cells)} cells "
+            f"(cache hits={self.forecast_cache.hits}, misses={self.forecast_cache.misses})"
+        )
+        return dict(results)
+    
     def evaluate_weather_risk(
         self, 
         forecasts: List[WeatherForecast],
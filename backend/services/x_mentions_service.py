@@ -6,7 +6,7 @@ import logging
 import random
 import time
 from datetime import datetime, timezone, timedelta
-from typing import Dict, Any, Optional, List, Set
+from typing import Dict, Any, Optional, List, Set, Tuple
 import httpx
 
 from backend.core.config import get_settings
@@ -40,13 +40,74 @@ class XMentionsService:
         # Track processed tweet IDs to avoid duplicates within session
         self._processed_tweet_ids: Set[str] = set()
     
-    async def poll_mentions(self, connection: SocialConnection, db: Session) -> Dict[str, Any]:
+    def create_client(self, max_connections: int = 10) -> httpx.AsyncClient:
+        """
+        Pooled HTTP client shared by the polls of one sweep
+        
+        Args:
+            max_connections: Maximum concurrent connections to the X API
+            
+        Returns:
+            httpx.AsyncClient (use as an async context manager)
+        """
+        return httpx.AsyncClient(
+            timeout=30.0,
+            limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections)
+        )
+    
+    async def poll_mentions(
+        self,
+        connection: SocialConnection,
+        db: Session,
+        client: Optional[httpx.AsyncClient] = None
+    ) -> Dict[str, Any]:
         """
         Poll X mentions for a connection with since_id tracking and deduplication
         
         Args:
             connection: SocialConnection instance for X platform
             db: Database session
+            client: Optional shared HTTP client
+            
+        Returns:
+            Dictionary with polling results and statistics
+        """
+        previous_since_id = self._get_since_id(connection)
+        result = await self.fetch_new_mentions(connection, client)
+        if not result.get("success"):
+            return result
+        
+        try:
+            new_since_id = result["since_id"]
+            if new_since_id != previous_since_id:
+                await self._update_since_id(connection, db, new_since_id)
+                logger.info(f"Updated since_id for connection {connection.id}: {previous_since_id} -> {new_since_id}")
+            
+            # Update last checked timestamp
+            connection.last_checked_at = datetime.now(timezone.utc)
+            db.commit()
+            
+        except Exception as e:
+            error_msg = f"X mentions polling failed: {str(e)}"
+            logger.error(f"X mentions poll error for connection {connection.id}: {error_msg}")
+            return {"success": False, "error": error_msg}
+        
+        return result
+    
+    async def fetch_new_mentions(
+        self,
+        connection: SocialConnection,
+        client: Optional[httpx.AsyncClient] = None
+    ) -> Dict[str, Any]:
+        """
+        Fetch and process new mentions for a connection without touching the database
+        
+        Safe to run concurrently for many connections; store the returned
+        since_id with record_poll_results() or poll_mentions().
+        
+        Args:
+            connection: SocialConnection instance for X platform
+            client: Optional shared HTTP client
             
         Returns:
             Dictionary with polling results and statistics
@@ -61,13 +122,11 @@ class XMentionsService:
             
             access_token = decrypt_token(encrypted_token)
             user_id = connection.platform_account_id
-            
-            # Get since_id from connection metadata
-            since_id = connection.platform_metadata.get("mentions_since_id") if connection.platform_metadata else None
+            since_id = self._get_since_id(connection)
             
             # Poll mentions from X API
             try:
-                mentions_data = await self._fetch_mentions(user_id, access_token, since_id)
+                mentions_data = await self._fetch_mentions(user_id, access_token, since_id, client=client)
             except httpx.HTTPStatusError as e:
                 if e.response.status_code == 429:
                     # Rate limited - calculate backoff
@@ -121,16 +180,6 @@ class XMentionsService:
                         # Don't update since_id if processing fails
                         continue
             
-            # Only update since_id if we successfully processed at least one mention
-            # or if we got a successful API response (even if no new mentions)
-            if new_since_id != since_id:
-                await self._update_since_id(connection, db, new_since_id)
-                logger.info(f"Updated since_id for connection {connection.id}: {since_id} -> {new_since_id}")
-            
-            # Update last checked timestamp
-            connection.last_checked_at = datetime.now(timezone.utc)
-            db.commit()
-            
             result = {
                 "success": True,
                 "new_mentions": new_mentions_count,
@@ -147,7 +196,38 @@ class XMentionsService:
             logger.error(f"X mentions poll error for connection {connection.id}: {error_msg}")
             return {"success": False, "error": error_msg}
     
-    async def _fetch_mentions(self, user_id: str, access_token: str, since_id: Optional[str] = None) -> Dict[str, Any]:
+    def record_poll_results(self, db: Session, polled: List[Tuple[SocialConnection, Dict[str, Any]]]) -> int:
+        """
+        Store since_ids and last-checked times for a sweep in one commit
+        
+        Args:
+            db: Database session
+            polled: (connection, fetch_new_mentions result) pairs
+            
+        Returns:
+            Number of connections updated
+        """
+        checked_at = datetime.now(timezone.utc)
+        updated = 0
+        for connection, result in polled:
+            if not result.get("success"):
+                continue
+            if result["since_id"] != self._get_since_id(connection):
+                self._set_since_id(connection, result["since_id"])
+            connection.last_checked_at = checked_at
+            updated += 1
+        
+        if updated:
+            db.commit()
+        return updated
+    
+    async def _fetch_mentions(
+        self,
+        user_id: str,
+        access_token: str,
+        since_id: Optional[str] = None,
+        client: Optional[httpx.AsyncClient] = None
+    ) -> Dict[str, Any]:
         """
         Fetch mentions from X API
         
@@ -155,6 +235,7 @@ class XMentionsService:
             user_id: X user ID to fetch mentions for
             access_token: Bearer token for authentication
             since_id: Optional since_id parameter for pagination
+            client: Optional shared HTTP client (a short-lived one is used otherwise)
             
         Returns:
             API response data
@@ -174,6 +255,11 @@ class XMentionsService:
         if since_id:
             params["since_id"] = since_id
         
+        if client is not None:
+            response = await client.get(url, headers=headers, params=params)
+            response.raise_for_status()
+            return response.json()
+        
         async with httpx.AsyncClient(timeout=30.0) as client:
             response = await client.get(url, headers=headers, params=params)
             response.raise_for_status()
@@ -255,6 +341,14 @@ class XMentionsService:
         
         return total_backoff
     
+    def _get_since_id(self, connection: SocialConnection) -> Optional[str]:
+        """since_id stored in connection metadata"""
+        return connection.platform_metadata.get("mentions_since_id") if connection.platform_metadata else None
+    
+    def _set_since_id(self, connection: SocialConnection, new_since_id: str) -> None:
+        """Set since_id in connection metadata (assigning a new dict so the change is tracked)"""
+        connection.platform_metadata = {**(connection.platform_metadata or {}), "mentions_since_id": new_since_id}
+    
     async def _update_since_id(self, connection: SocialConnection, db: Session, new_since_id: str) -> None:
         """
         Update the since_id in connection metadata
@@ -265,17 +359,7 @@ class XMentionsService:
             new_since_id: New since_id value to store
         """
         try:
-            # Initialize platform_metadata if it doesn't exist
-            if not connection.platform_metadata:
-                connection.platform_metadata = {}
-            
-            # Update the mentions since_id
-            connection.platform_metadata["mentions_since_id"] = new_since_id
-            
-            # Mark the field as modified for SQLAlchemy to detect changes
-            from sqlalchemy.orm.attributes import flag_modified
-            flag_modified(connection, "platform_metadata")
-            
+            self._set_since_id(connection, new_since_id)
             db.commit()
             db.refresh(connection)
             
@@ -0,0 +1,223 @@
+"""
+Long-lived event loop for Celery worker processes
+
+Tasks used to wrap each coroutine in asyncio.run() or a fresh
+new_event_loop(), which throws away every loop-bound resource on each
+invocation: httpx connection pools, redis.asyncio pools, SDK clients.
+Instead each worker process runs one event loop in a daemon thread,
+started on worker_process_init, and sync task code submits coroutines to
+it with run_async() or the @async_task decorator. Clients registered with
+shared_resource() live as long as the loop and are closed on
+worker_process_shutdown.
+
+Outside a worker (API process, scripts, tests) the runtime starts lazily
+on first use, and a forked child gets its own runtime.
+"""
+import asyncio
+import functools
+import inspect
+import logging
+import os
+import threading
+from concurrent.futures import CancelledError as FutureCancelledError
+from typing import Any, Awaitable, Callable, Dict, Optional, TypeVar
+
+from celery.signals import worker_process_init, worker_process_shutdown
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+SHUTDOWN_TIMEOUT_SECONDS = 10
+
+
+class AsyncRuntime:
+    """An event loop running in a daemon thread, plus the clients bound to it"""
+
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        self.pid = os.getpid()
+        self.tasks_run = 0
+        self._resources: Dict[str, Any] = {}
+        self._thread = threading.Thread(target=self._run_loop, name="async-runtime", daemon=True)
+        self._thread.start()
+
+    def _run_loop(self) -> None:
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread.is_alive() and not self.loop.is_closed()
+
+    def run(self, coro: Awaitable[T], timeout: Optional[float] = None) -> T:
+        """
+        Run a coroutine on the runtime loop and wait for its result
+
+        Args:
+            coro: Coroutine to run
+            timeout: Seconds to wait before cancelling it
+
+        Returns:
+            The coroutine's result (its exception is re-raised)
+        """
+        if self._in_loop_thread():
+            raise RuntimeError("run_async() called from the async runtime's own loop; await the coroutine instead")
+
+        future = asyncio.run_coroutine_threadsafe(coro, self.loop)
+        try:
+            result = future.result(timeout)
+        except BaseException:
+            # Timeouts and Celery's soft time limit land here; stop the coroutine too
+            future.cancel()
+            raise
+        self.tasks_run += 1
+        return result
+
+    def resource(self, name: str, factory: Callable[[], T]) -> T:
+        """
+        Shared client kept alive across tasks, created on first use
+
+        Only use the returned object from coroutines running on this
+        runtime; pools inside it bind to this loop.
+
+        Args:
+            name: Registry key
+            factory: Creates the client
+
+        Returns:
+            The shared client
+        """
+        if name not in self._resources:
+            self._resources[name] = factory()
+        return self._resources[name]
+
+    def _in_loop_thread(self) -> bool:
+        return threading.current_thread() is self._thread
+
+    async def _close_resources(self) -> None:
+        resources, self._resources = self._resources, {}
+        for name, resource in resources.items():
+            close = getattr(resource, "aclose", None) or getattr(resource, "close", None)
+            if close is None:
+                continue
+            try:
+                result = close()
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as e:
+                logger.warning(f"Error closing shared resource {name}: {e}")
+
+    def shutdown(self) -> None:
+        """Close shared resources and stop the loop"""
+        if not self.is_running:
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(self._close_resources(), self.loop).result(SHUTDOWN_TIMEOUT_SECONDS)
+        except (Exception, FutureCancelledError) as e:
+            logger.warning(f"Error closing async runtime resources: {e}")
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join(SHUTDOWN_TIMEOUT_SECONDS)
+        if not self._thread.is_alive():
+            self.loop.close()
+
+
+# Per-process runtime
+_async_runtime: Optional[AsyncRuntime] = None
+_runtime_lock = threading.Lock()
+
+
+def get_async_runtime() -> AsyncRuntime:
+    """
+    Get this process's async runtime, starting it if needed
+
+    Returns:
+        AsyncRuntime instance
+    """
+    global _async_runtime
+
+    runtime = _async_runtime
+    if runtime is not None and runtime.pid == os.getpid() and runtime.is_running:
+        return runtime
+
+    with _runtime_lock:
+        # A runtime inherited through fork has no loop thread in this process
+        if _async_runtime is None or _async_runtime.pid != os.getpid() or not _async_runtime.is_running:
+            _async_runtime = AsyncRuntime()
+            logger.info(f"Started async runtime in process {_async_runtime.pid}")
+        return _async_runtime
+
+
+def shutdown_async_runtime() -> None:
+    """Stop this process's runtime, if it has one"""
+    global _async_runtime
+
+    with _runtime_lock:
+        runtime, _async_runtime = _async_runtime, None
+    if runtime is not None and runtime.pid == os.getpid():
+        runtime.shutdown()
+
+
+def run_async(coro: Awaitable[T], timeout: Optional[float] = None) -> T:
+    """
+    Run a coroutine on the process's persistent event loop from sync code
+
+    Drop-in replacement for asyncio.run() in task code.
+
+    Args:
+        coro: Coroutine to run
+        timeout: Seconds to wait before cancelling it
+
+    Returns:
+        The coroutine's result
+    """
+    return get_async_runtime().run(coro, timeout)
+
+
+def shared_resource(name: str, factory: Callable[[], T]) -> T:
+    """
+    Process-wide client that outlives individual tasks
+
+    Args:
+        name: Registry key
+        factory: Creates the client on first use
+
+    Returns:
+        The shared client
+    """
+    return get_async_runtime().resource(name, factory)
+
+
+def async_task(func: Callable[..., Awaitable[T]]) -> Callable[..., T]:
+    """
+    Turn a coroutine function into a sync callable for Celery
+
+    Apply beneath the Celery decorator:
+
+        @celery_app.task(name="...")
+        @async_task
+        async def my_task(...):
+            ...
+
+    The body runs on the runtime's thread, where Celery's thread-local
+    request (self.request, current_task) is not set; tasks that need it
+    should call run_async() from a sync body instead.
+    """
+    if not inspect.iscoroutinefunction(func):
+        raise TypeError(f"@async_task expects a coroutine function, got {func!r}")
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs) -> T:
+        return run_async(func(*args, **kwargs))
+
+    return wrapper
+
+
+@worker_process_init.connect
+def _start_worker_runtime(**kwargs) -> None:
+    get_async_runtime()
+
+
+@worker_process_shutdown.connect
+def _stop_worker_runtime(**kwargs) -> None:
+    shutdown_async_runtime()
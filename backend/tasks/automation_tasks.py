@@ -24,6 +24,7 @@ from backend.integrations.instagram_client import instagram_client
 from backend.integrations.facebook_client import facebook_client
 from backend.integrations.twitter_client import twitter_client
 from backend.integrations.client import client
+from backend.tasks.async_runtime import run_async
 
 logger = get_task_logger(__name__)
 
@@ -64,11 +65,8 @@ def execute_research_pipeline(user_id: int, research_config: Dict[str, Any]) ->
             include_engagement=research_config.get("include_engagement", True)
         )
         
-        # Execute research in async context
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        
-        results = loop.run_until_complete(
+        # Execute research on the worker's event loop
+        results = run_async(
             research_service.execute_research_pipeline(
                 query=research_query,
                 user_id=user_id,
@@ -96,8 +94,6 @@ def execute_research_pipeline(user_id: int, research_config: Dict[str, Any]) ->
             "timestamp": datetime.utcnow().isoformat()
         }
     finally:
-        if 'loop' in locals():
-            loop.close()
         db.close()
 
 @shared_task(name="daily_trend_analysis")
@@ -124,10 +120,7 @@ def daily_trend_analysis(user_id: int) -> Dict[str, Any]:
                 "timestamp": datetime.utcnow().isoformat()
             }
         # Get trending topics from each platform
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        
-        trends = loop.run_until_complete(
+        trends = run_async(
             research_service.analyze_daily_trends(user_id, db)
         )
         
@@ -154,8 +147,6 @@ def daily_trend_analysis(user_id: int) -> Dict[str, Any]:
         logger.error(f"Daily trend analysis failed for user {user_id}: {str(e)}")
         return {"success": False, "user_id": user_id, "error": str(e)}
     finally:
-        if 'loop' in locals():
-            loop.close()
         db.close()
 
 # Content Generation and Publishing Tasks
@@ -195,8 +186,6 @@ def generate_and_schedule_content(user_id: int, content_config: Dict[str, Any])
             # Reduce platforms to fit within limit
             platforms = platforms[:daily_limit]
             content_config["platforms"] = platforms
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
         
         # Generate content for platforms with bounded concurrency
         platforms = content_config.get("platforms", ["twitter"])
@@ -221,10 +210,11 @@ def generate_and_schedule_content(user_id: int, content_config: Dict[str, Any])
             async with semaphore:
                 return platform, await generate_platform_content(platform)
         
+        async def generate_all():
+            return await asyncio.gather(*[bounded_generate(p) for p in platforms], return_exceptions=True)
+        
         # Execute all platforms concurrently with bounds
-        platform_results = loop.run_until_complete(
-            asyncio.gather(*[bounded_generate(p) for p in platforms], return_exceptions=True)
-        )
+        platform_results = run_async(generate_all())
         
         generated_content = {}
         scheduled_posts = []
@@ -254,7 +244,7 @@ def generate_and_schedule_content(user_id: int, content_config: Dict[str, Any])
             
             # Schedule post if enabled
             if content_config.get("auto_schedule"):
-                schedule_result = loop.run_until_complete(
+                schedule_result = run_async(
                     _schedule_platform_post(platform, content_result, user_id, content_config)
                 )
                 scheduled_posts.append({
@@ -282,8 +272,6 @@ def generate_and_schedule_content(user_id: int, content_config: Dict[str, Any])
         db.rollback()
         return {"success": False, "user_id": user_id, "error": str(e)}
     finally:
-        if 'loop' in locals():
-            loop.close()
         db.close()
 
 async def _schedule_platform_post(platform: str, content_result: Dict[str, Any], user_id: int, config: Dict[str, Any]) -> Dict[str, Any]:
@@ -350,8 +338,6 @@ def execute_daily_workflow(user_id: int, workflow_config: Dict[str, Any] = None)
                 "required_feature": "enhanced_autopilot",
                 "timestamp": datetime.utcnow().isoformat()
             }
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
         
         # Default daily workflow configuration
         if not workflow_config:
@@ -363,7 +349,7 @@ def execute_daily_workflow(user_id: int, workflow_config: Dict[str, Any] = None)
                 "auto_schedule": True
             }
         
-        workflow_results = loop.run_until_complete(
+        workflow_results = run_async(
             workflow_orchestrator.execute_workflow(
                 workflow_type="daily_content",
                 user_id=user_id,
@@ -387,8 +373,6 @@ def execute_daily_workflow(user_id: int, workflow_config: Dict[str, Any] = None)
         logger.error(f"Daily workflow failed for user {user_id}: {str(e)}")
         return {"success": False, "user_id": user_id, "error": str(e)}
     finally:
-        if 'loop' in locals():
-            loop.close()
         db.close()
 
 @shared_task(name="execute_engagement_optimization")
@@ -414,16 +398,14 @@ def execute_engagement_optimization(user_id: int) -> Dict[str, Any]:
                 "required_feature": "advanced_analytics",
                 "timestamp": datetime.utcnow().isoformat()
             }
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
         
         # Collect recent metrics
-        metrics_result = loop.run_until_complete(
+        metrics_result = run_async(
             metrics_collector.collect_all_metrics(user_id, days=7)
         )
         
         # Execute optimization workflow
-        optimization_result = loop.run_until_complete(
+        optimization_result = run_async(
             workflow_orchestrator.execute_workflow(
                 workflow_type="engagement_optimization",
                 user_id=user_id,
@@ -446,8 +428,6 @@ def execute_engagement_optimization(user_id: int) -> Dict[str, Any]:
         logger.error(f"Engagement optimization failed for user {user_id}: {str(e)}")
         return {"success": False, "user_id": user_id, "error": str(e)}
     finally:
-        if 'loop' in locals():
-            loop.close()
         db.close()
 
 # Metrics Collection Tasks
@@ -460,11 +440,8 @@ def collect_all_platform_metrics(user_id: int) -> Dict[str, Any]:
     db = SessionLocal()
     
     try:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        
         # Collect metrics from all platforms
-        metrics_result = loop.run_until_complete(
+        metrics_result = run_async(
             metrics_collector.collect_all_metrics(user_id)
         )
         
@@ -491,8 +468,6 @@ def collect_all_platform_metrics(user_id: int) -> Dict[str, Any]:
         logger.error(f"Metrics collection failed for user {user_id}: {str(e)}")
         return {"success": False, "user_id": user_id, "error": str(e)}
     finally:
-        if 'loop' in locals():
-            loop.close()
         db.close()
 
 # Scheduled Tasks for Automation
@@ -6,7 +6,6 @@ Handles daily/weekly autonomous content generation and posting loops
 from backend.core.suppress_warnings import suppress_third_party_warnings
 suppress_third_party_warnings()
 
-import asyncio
 import logging
 from datetime import datetime, timedelta, timezone
 from typing import Dict, Any, List, Optional
@@ -27,17 +26,25 @@ except ImportError:
 
 from backend.db.database import get_db
 from backend.db.models import User, UserSetting, WorkflowExecution
-from backend.services.research_automation_production import ProductionResearchAutomationService, ResearchQuery
 from backend.services.content_persistence_service import ContentPersistenceService
-from backend.services.memory_service_production import ProductionMemoryService
 from backend.services.usage_tracking_service import UsageTrackingService
 from backend.services.plan_aware_social_service import get_plan_aware_social_service
+from backend.tasks.async_runtime import run_async
 from backend.tasks.celery_app import celery_app
 from backend.tasks.db_session_manager import get_celery_db_session
 from backend.core.feature_flags import ff
+from backend.core.lazy_imports import lazy_import
 
 logger = logging.getLogger(__name__)
 
+# Research automation (OpenAI, aiohttp) and production memory (numpy, pgvector)
+# are imported on first task use, or preloaded by autonomous workers
+ProductionResearchAutomationService = lazy_import(
+    "backend.services.research_automation_production", "ProductionResearchAutomationService"
+)
+ResearchQuery = lazy_import("backend.services.research_automation_production", "ResearchQuery")
+ProductionMemoryService = lazy_import("backend.services.memory_service_production", "ProductionMemoryService")
+
 class AutonomousScheduler:
     """Manages autonomous content generation and posting schedules"""
     
@@ -410,8 +417,8 @@ def daily_content_generation(self):
                     user_settings = db.query(UserSetting).filter(UserSetting.user_id == user_id).first()
                     industry = user_settings.industry_type if user_settings and user_settings.industry_type else "general"
                     
-                    # Use asyncio.run() for async research service call (2025 best practice)
-                    research_results = asyncio.run(
+                    # Run on the worker's persistent loop so research clients are reused
+                    research_results = run_async(
                         scheduler.research_service.execute_comprehensive_research(
                             query=research_query,
                             user_plan=user_plan,
@@ -707,13 +714,12 @@ def process_scheduled_content(self):
         with get_celery_db_session() as db:
             content_service = ContentPersistenceService(db)
         
-        # Get content scheduled for posting now (within the next hour)
+        # Only load content that is already due; later items are picked up by later runs
         now = datetime.now(timezone.utc)
-        posting_window = now + timedelta(hours=1)
         
         scheduled_content = content_service.get_scheduled_content(
             user_id=None,  # Get for all users
-            before=posting_window
+            before=now
         )
         
         if not scheduled_content:
@@ -5,6 +5,10 @@ suppress_third_party_warnings()
 import os
 from celery import Celery
 from backend.core.config import get_settings
+# Registers the per-worker event loop on worker_process_init
+import backend.tasks.async_runtime  # noqa: F401
+# Preloads shared state before the pool forks and logs per-queue boot time and RSS
+import backend.tasks.worker_boot  # noqa: F401
 
 settings = get_settings()
 
@@ -24,6 +28,8 @@ celery_app = Celery(
         "backend.tasks.ftc_compliance_tasks",  # P1-10b: FTC compliance disclosures
         "backend.tasks.data_retention_tasks",  # P0-4b: Data retention policy enforcement
         "backend.tasks.key_rotation_tasks",  # P0-4c: Encryption key rotation and automation
+        "backend.tasks.weather_tasks",  # Nightly cross-org weather rescheduling
+        "backend.tasks.publish_tasks",  # Connection publishing and the scheduled-post dispatcher
         # Disabled heavy tasks to prevent memory issues
         # "backend.tasks.content_tasks",  # CrewAI - uses 500MB+
         # "backend.tasks.research_tasks",  # CrewAI - uses 500MB+ 
@@ -69,6 +75,7 @@ celery_app.conf.update(
     task_routes={
         # Default queue for general tasks
         'backend.tasks.posting_tasks.*': {'queue': 'posting', 'priority': 8},
+        'publish_tasks.*': {'queue': 'posting', 'priority': 8},
         'backend.tasks.webhook_tasks.*': {'queue': 'webhooks', 'priority': 9},
         'backend.tasks.token_health_tasks.*': {'queue': 'token_health', 'priority': 7},
         'backend.tasks.x_polling_tasks.*': {'queue': 'x_polling', 'priority': 6},
@@ -79,6 +86,7 @@ celery_app.conf.update(
         'backend.tasks.ftc_compliance_tasks.*': {'queue': 'ftc_compliance', 'priority': 8},
         'backend.tasks.data_retention_tasks.*': {'queue': 'data_retention', 'priority': 5},
         'backend.tasks.key_rotation_tasks.*': {'queue': 'key_rotation', 'priority': 9},
+        'backend.tasks.weather_tasks.*': {'queue': 'weather', 'priority': 6},
     },
     
     # Dead Letter Queue configuration
@@ -166,6 +174,12 @@ celery_app.conf.task_queues = {
         'durable': True,
         'auto_delete': False,
     },
+    'weather': {
+        'exchange': 'weather',
+        'routing_key': 'weather',
+        'durable': True,
+        'auto_delete': False,
+    },
 }
 
 # Production autonomous schedule for fully automated operation
@@ -198,6 +212,16 @@ celery_app.conf.beat_schedule = {
         'options': {'queue': 'posting'},
     },
     
+    # Scheduled posts are dispatched by the publish dispatcher process
+    # (python -m backend.tasks.publish_dispatcher), not from beat
+    
+    # Re-queue scheduled posts missing from Redis - every 5 minutes
+    'publish-scheduler-reconcile': {
+        'task': 'publish_tasks.reconcile_publish_schedule',
+        'schedule': 60.0 * 5,  # Every 5 minutes
+        'options': {'queue': 'posting', 'expires': 240},  # 4 min expiry
+    },
+    
     # Lightweight research tasks (memory optimized)
     'lightweight-research': {
         'task': 'backend.tasks.lightweight_research_tasks.lightweight_daily_research',
@@ -313,6 +337,20 @@ celery_app.conf.beat_schedule = {
         'options': {'queue': 'data_retention', 'expires': 3600},  # 1 hour expiry
     },
     
+    # Performance snapshot partitions - create upcoming months, drop expired ones daily
+    'performance-snapshot-partition-maintenance': {
+        'task': 'data_retention_snapshot_partition_maintenance',
+        'schedule': 60.0 * 60.0 * 24,  # Daily
+        'options': {'queue': 'data_retention', 'expires': 3600},  # 1 hour expiry
+    },
+    
+    # Weather rescheduling - one sweep across all organizations nightly
+    'weather-rescheduling-sweep': {
+        'task': 'backend.tasks.weather_tasks.weather_rescheduling_sweep',
+        'schedule': 60.0 * 60.0 * 24,  # Daily
+        'options': {'queue': 'weather', 'expires': 3600},  # 1 hour expiry
+    },
+    
     # P0-4c: Encryption key rotation schedule and automation
     # Key rotation health check - every 6 hours for continuous security monitoring
     'key-rotation-health-check': {
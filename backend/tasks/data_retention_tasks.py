@@ -17,6 +17,7 @@ from backend.db.database import get_db
 from backend.services.data_retention_service import (
     DataRetentionService, DataCategory, get_data_retention_service
 )
+from backend.services.performance_snapshot_store import get_performance_snapshot_store
 from backend.core.audit_logger import audit_logger, AuditEventType
 
 logger = logging.getLogger(__name__)
@@ -410,4 +411,54 @@ def emergency_data_retention_cleanup(self, category: str, force: bool = False):
         logger.error(f"Emergency data retention cleanup failed for {category}: {e}")
         raise
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+@celery_app.task(bind=True, base=DataRetentionTask, name="data_retention_snapshot_partition_maintenance")
+def performance_snapshot_partition_maintenance(self):
+    """
+    Performance snapshot partition maintenance
+    
+    Creates upcoming monthly partitions for content performance snapshots,
+    drops partitions past the metrics retention period and prunes hourly
+    and daily rollups. Runs daily so partitions always exist ahead of time.
+    """
+    logger.info("Starting performance snapshot partition maintenance")
+    
+    # Get database session
+    db_gen = get_db()
+    db = next(db_gen)
+    
+    try:
+        retention_service = get_data_retention_service()
+        policy = retention_service.get_retention_policy(DataCategory.METRICS_DATA)
+        
+        result = get_performance_snapshot_store().run_maintenance(db, retention_days=policy.retention_days)
+        
+        if result["partitions_dropped"]:
+            audit_logger.log_event(
+                AuditEventType.DATA_RETENTION_ACTION,
+                user_id=None,
+                details={
+                    "action": "snapshot_partitions_dropped",
+                    "partitions": result["partitions_dropped"],
+                    "retention_days": policy.retention_days,
+                    "timestamp": datetime.now(timezone.utc).isoformat()
+                },
+                ip_address="system",
+                user_agent="celery-worker"
+            )
+        
+        logger.info(f"Performance snapshot partition maintenance completed: {result}")
+        
+        return {
+            "status": "completed",
+            **result,
+            "timestamp": datetime.now(timezone.utc).isoformat()
+        }
+        
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Performance snapshot partition maintenance failed: {e}")
+        raise
+    finally:
+        db.close()
@@ -16,12 +16,12 @@ from celery import shared_task
 from celery.utils.log import get_task_logger
 from datetime import datetime, timedelta
 from typing import Dict, Any
-import asyncio
 
 from backend.db.database import SessionLocal
 from backend.db.models import User, Goal
 from backend.services.goals_progress_service import GoalsProgressService
 from backend.services.notification_service import NotificationService
+from backend.tasks.async_runtime import run_async
 
 logger = get_task_logger(__name__)
 
@@ -51,13 +51,7 @@ def update_all_goals_progress() -> Dict[str, Any]:
         # Update goals for each user
         for user in users_with_goals:
             try:
-                # Run async function in sync context
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                
-                update_result = loop.run_until_complete(
-                    service.update_all_user_goals(db, user.id)
-                )
+                update_result = run_async(service.update_all_user_goals(db, user.id))
                 
                 results["total_goals_updated"] += update_result["updated_count"]
                 results["total_notifications"] += update_result["notifications_created"]
@@ -70,9 +64,6 @@ def update_all_goals_progress() -> Dict[str, Any]:
                     "user_id": user.id,
                     "error": str(e)
                 })
-            finally:
-                if loop:
-                    loop.close()
         
         logger.info(f"Goals progress update completed: {results}")
         return results
@@ -94,13 +85,7 @@ def sync_platform_metrics(user_id: int, platform: str) -> Dict[str, Any]:
     service = GoalsProgressService()
     
     try:
-        # Run async function in sync context
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        
-        result = loop.run_until_complete(
-            service.sync_platform_metrics(db, user_id, platform)
-        )
+        result = run_async(service.sync_platform_metrics(db, user_id, platform))
         
         logger.info(f"Synced {platform} metrics for user {user_id}: {result}")
         return result
@@ -109,8 +94,6 @@ def sync_platform_metrics(user_id: int, platform: str) -> Dict[str, Any]:
         logger.error(f"Error syncing platform metrics: {str(e)}")
         raise
     finally:
-        if loop:
-            loop.close()
         db.close()
 
 
@@ -3,15 +3,17 @@ Memory-optimized research tasks using GPT-5-mini with web search
 Replaces heavy CrewAI agents with lightweight GPT-5 Responses API calls with real-time web search
 """
 import logging
-import asyncio
 import gc
 from typing import List, Dict, Any
 from celery import current_task
+from backend.tasks.async_runtime import run_async
 from backend.tasks.celery_app import celery_app
-from backend.services.ai_insights_service import ai_insights_service
 from backend.core.openai_utils import get_openai_completion_params
-from openai import AsyncOpenAI
 from backend.core.config import get_settings
+from backend.core.lazy_imports import lazy_import
+
+# Imported on first task use (or preloaded by research workers, see worker_boot)
+AsyncOpenAI = lazy_import("openai", "AsyncOpenAI")
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
@@ -36,31 +38,23 @@ def lightweight_daily_research(self, topics=None):
         )
         
         # Use existing AI insights service instead of CrewAI
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        
-        try:
-            for i, topic in enumerate(topics):
-                current_task.update_state(
-                    state='PROGRESS',
-                    meta={'current': i+1, 'total': total_topics, 'status': f'Researching: {topic}'}
-                )
-                
-                # Simple research using existing service
-                research_result = loop.run_until_complete(
-                    _lightweight_topic_research(topic)
-                )
-                
-                results.append({
-                    'topic': topic,
-                    'insights': research_result.get('insights', []),
-                    'status': 'completed'
-                })
-                
-                # Force garbage collection between topics
-                gc.collect()
-        finally:
-            loop.close()
+        for i, topic in enumerate(topics):
+            current_task.update_state(
+                state='PROGRESS',
+                meta={'current': i+1, 'total': total_topics, 'status': f'Researching: {topic}'}
+            )
+            
+            # Simple research using existing service
+            research_result = run_async(_lightweight_topic_research(topic))
+            
+            results.append({
+                'topic': topic,
+                'insights': research_result.get('insights', []),
+                'status': 'completed'
+            })
+            
+            # Force garbage collection between topics
+            gc.collect()
         
         return {
             'status': 'success',
@@ -130,13 +124,8 @@ def lightweight_content_generation(self, research_insights: List[str], platform:
         )
         
         # Simple OpenAI call instead of CrewAI content agent
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        
         try:
-            content = loop.run_until_complete(
-                _generate_simple_content(research_insights, platform)
-            )
+            content = run_async(_generate_simple_content(research_insights, platform))
             
             return {
                 'status': 'success',
@@ -144,7 +133,6 @@ def lightweight_content_generation(self, research_insights: List[str], platform:
                 'platform': platform
             }
         finally:
-            loop.close()
             gc.collect()
         
     except Exception as exc:
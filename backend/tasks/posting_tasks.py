@@ -3,11 +3,11 @@ from backend.core.suppress_warnings import suppress_third_party_warnings
 suppress_third_party_warnings()
 
 from backend.tasks.celery_app import celery_app
-from backend.agents.tools import twitter_tool
 from backend.db.database import get_db
 from backend.db.models import ContentLog
 from backend.core.feature_flags import ff
 from backend.core.dlq import handle_task_failure, TaskFailureReason
+from backend.core.lazy_imports import lazy_import
 import logging
 import hashlib
 import traceback
@@ -16,6 +16,9 @@ from sqlalchemy.orm import Session
 
 logger = logging.getLogger(__name__)
 
+# Agent tools load tweepy, numpy and the vector index; imported on first post
+twitter_tool = lazy_import("backend.agents.tools", "twitter_tool")
+
 @celery_app.task(
     bind=True,
     autoretry_for=(Exception,),
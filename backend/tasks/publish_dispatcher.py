@@ -0,0 +1,135 @@
+"""
+Scheduled-post dispatcher process
+
+Runs next to the Celery workers as its own long-lived process:
+
+    python -m backend.tasks.publish_dispatcher
+
+Each pass claims the posts that are due from the Redis delayed queue and
+hands them to the posting queue, then sleeps until the earliest remaining
+post is due. Scheduling a post wakes it early, so a post added ahead of the
+current head is not held back. Dispatch therefore never waits behind long
+research or metrics tasks on a shared worker, and no beat message is sent
+while nothing is due.
+"""
+import argparse
+import logging
+import signal
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlalchemy.orm import Session
+
+from backend.db.database import SessionLocal
+from backend.services.publish_scheduler import DISPATCH_BATCH_SIZE, PublishScheduler, get_publish_scheduler
+
+logger = logging.getLogger(__name__)
+
+# Pause after a failed pass (Redis or database unreachable) before trying again
+ERROR_BACKOFF_SECONDS = 5.0
+
+
+class _Stopped(Exception):
+    """Raised out of a blocking wait when the process is asked to stop"""
+
+
+class PublishDispatcher:
+    """Loop that dispatches due posts and sleeps until the next one is due"""
+
+    def __init__(
+        self,
+        scheduler: Optional[PublishScheduler] = None,
+        session_factory: Callable[[], Session] = SessionLocal
+    ):
+        self.scheduler = scheduler or get_publish_scheduler()
+        self.session_factory = session_factory
+        self.stopping = False
+        self._waiting = False
+
+    def run_once(self, now: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Claim and enqueue the posts that are due
+
+        Rebuilds the queue from the database first if Redis has lost it.
+
+        Args:
+            now: Current Unix timestamp (defaults to the clock)
+
+        Returns:
+            Dictionary with dispatch counts
+        """
+        db = self.session_factory()
+        try:
+            if self.scheduler.needs_reconcile():
+                self.scheduler.reconcile(db)
+
+            results = self.scheduler.dispatch_due(db, now=now)
+            if results['claimed']:
+                logger.info(
+                    f"Dispatched {results['dispatched']} scheduled posts, "
+                    f"deferred {results['deferred']}, skipped {results['skipped']}"
+                )
+            return results
+
+        except Exception:
+            db.rollback()
+            raise
+
+        finally:
+            db.close()
+
+    def next_wait(self, results: Dict[str, Any], now: Optional[float] = None) -> float:
+        """Seconds to sleep after a pass; none when the pass hit the batch limit"""
+        if results.get('claimed', 0) >= DISPATCH_BATCH_SIZE:
+            return 0.0
+        return self.scheduler.seconds_until_next(now)
+
+    def run(self) -> None:
+        """Dispatch until stop() is called"""
+        logger.info("Publish dispatcher started")
+        while not self.stopping:
+            try:
+                wait = self.next_wait(self.run_once())
+            except Exception as e:
+                logger.error(f"Error dispatching scheduled posts: {e}")
+                wait = ERROR_BACKOFF_SECONDS
+
+            if self.stopping:
+                break
+            self._waiting = True
+            try:
+                self.scheduler.wait_for_work(wait)
+            except _Stopped:
+                break
+            except Exception as e:
+                logger.error(f"Error waiting for scheduled posts: {e}")
+                time.sleep(ERROR_BACKOFF_SECONDS)
+            finally:
+                self._waiting = False
+        logger.info("Publish dispatcher stopped")
+
+    def stop(self, *_: Any) -> None:
+        """Finish the current pass and exit; interrupts a wait right away"""
+        self.stopping = True
+        if self._waiting:
+            raise _Stopped()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the dispatcher until SIGTERM or SIGINT"""
+    parser = argparse.ArgumentParser(description="Dispatch scheduled posts from the Redis delayed queue")
+    parser.parse_args(argv)
+
+    from backend.core.logging import setup_logging
+    setup_logging(service_name='publish-dispatcher')
+
+    dispatcher = PublishDispatcher()
+    signal.signal(signal.SIGTERM, dispatcher.stop)
+    signal.signal(signal.SIGINT, dispatcher.stop)
+    dispatcher.run()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
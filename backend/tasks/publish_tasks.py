@@ -3,16 +3,18 @@ Celery tasks for Phase 8 resilient publishing
 Handles connection-based publishing with rate limiting and retries
 """
 import logging
-import asyncio
 from datetime import datetime, timezone
 from typing import Dict, Any, Optional
 from celery import Task
+from celery.exceptions import Retry
 from sqlalchemy.orm import Session
 
-from backend.tasks.celery_app import celery
+from backend.tasks.async_runtime import run_async
+from backend.tasks.celery_app import celery_app
 from backend.db.database import get_db, SessionLocal
 from backend.db.models import SocialConnection, ContentSchedule
 from backend.services.publish_runner import get_publish_runner, PublishPayload
+from backend.services.publish_scheduler import get_publish_scheduler
 from backend.services.rate_limit import RetryableError, FatalError
 
 logger = logging.getLogger(__name__)
@@ -34,7 +36,7 @@ class CallbackTask(Task):
         logger.warning(f"Task {task_id} retrying: {exc}")
 
 
-@celery.task(
+@celery_app.task(
     bind=True,
     base=CallbackTask,
     max_retries=6,
@@ -111,18 +113,13 @@ def publish_via_connection(
         
         # Run resilient publish
         runner = get_publish_runner()
-        # Run async publish pipeline from synchronous Celery task
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            result = loop.run_until_complete(runner.run_publish(
-                connection=connection,
-                payload=payload,
-                db=db,
-                attempt=self.request.retries
-            ))
-        finally:
-            loop.close()
+        # Run async publish pipeline on the worker's event loop
+        result = run_async(runner.run_publish(
+            connection=connection,
+            payload=payload,
+            db=db,
+            attempt=self.request.retries
+        ))
         
         # Handle result
         if result.success:
@@ -193,8 +190,8 @@ def publish_via_connection(
                 'metrics': result.metrics
             }
             
-    except RetryableError:
-        # This will be caught by Celery's autoretry_for
+    except (RetryableError, Retry):
+        # Caught by Celery's autoretry_for, or a retry already scheduled above
         raise
         
     except FatalError as e:
@@ -255,7 +252,7 @@ def publish_via_connection(
         db.close()
 
 
-@celery.task(
+@celery_app.task(
     bind=True,
     name='publish_tasks.get_publish_status'
 )
@@ -288,7 +285,7 @@ def get_publish_status(self, org_id: str, platform: str) -> Dict[str, Any]:
         }
 
 
-@celery.task(
+@celery_app.task(
     bind=True,
     name='publish_tasks.reset_circuit_breaker'
 )
@@ -327,6 +324,48 @@ def reset_circuit_breaker(self, org_id: str, platform: str) -> Dict[str, Any]:
         }
 
 
+@celery_app.task(name='publish_tasks.dispatch_due_publishes')
+def dispatch_due_publishes() -> Dict[str, Any]:
+    """
+    Enqueue publish tasks for scheduled posts that are due now
+
+    One dispatcher pass, for running by hand; the publish dispatcher
+    process (backend.tasks.publish_dispatcher) runs them continuously.
+
+    Returns:
+        Dictionary with dispatch counts
+    """
+    from backend.tasks.publish_dispatcher import PublishDispatcher
+
+    try:
+        return PublishDispatcher().run_once()
+
+    except Exception as e:
+        logger.error(f"Error dispatching scheduled posts: {e}")
+        return {'error': str(e)}
+
+
+@celery_app.task(name='publish_tasks.reconcile_publish_schedule')
+def reconcile_publish_schedule() -> Dict[str, Any]:
+    """
+    Re-queue scheduled posts missing from the Redis queue
+
+    Returns:
+        Dictionary with scheduled and re-queued counts
+    """
+    db = SessionLocal()
+
+    try:
+        return get_publish_scheduler().reconcile(db)
+
+    except Exception as e:
+        logger.error(f"Error reconciling publish schedule: {e}")
+        return {'error': str(e)}
+
+    finally:
+        db.close()
+
+
 # Helper function to enqueue publish tasks
 def enqueue_publish_task(
     connection_id: str,
@@ -2,7 +2,6 @@
 Celery tasks for token health management
 Handles automated token refresh and health auditing
 """
-import asyncio
 import logging
 from datetime import datetime, timezone, timedelta
 from typing import Dict, Any, List
@@ -13,6 +12,7 @@ from backend.core.config import get_settings
 from backend.db.database import get_db
 from backend.db.models import SocialConnection, SocialAudit
 from backend.services.token_refresh_service import get_token_refresh_service
+from backend.tasks.async_runtime import run_async
 
 logger = logging.getLogger(__name__)
 
@@ -93,9 +93,9 @@ def audit_all_tokens() -> Dict[str, Any]:
                     
                     # Refresh based on platform
                     if connection.platform == "meta":
-                        success, new_expiry, message = asyncio.run(refresh_service.refresh_meta_connection(connection, db))
+                        success, new_expiry, message = run_async(refresh_service.refresh_meta_connection(connection, db))
                     elif connection.platform == "x":
-                        success, new_expiry, message = asyncio.run(refresh_service.refresh_x_connection(connection, db))
+                        success, new_expiry, message = run_async(refresh_service.refresh_x_connection(connection, db))
                     else:
                         logger.warning(f"Unknown platform for refresh: {connection.platform}")
                         continue
@@ -182,9 +182,9 @@ def refresh_connection(connection_id: str) -> Dict[str, Any]:
             refresh_service = get_token_refresh_service()
             
             if connection.platform == "meta":
-                success, new_expiry, message = asyncio.run(refresh_service.refresh_meta_connection(connection, db))
+                success, new_expiry, message = run_async(refresh_service.refresh_meta_connection(connection, db))
             elif connection.platform == "x":
-                success, new_expiry, message = asyncio.run(refresh_service.refresh_x_connection(connection, db))
+                success, new_expiry, message = run_async(refresh_service.refresh_x_connection(connection, db))
             else:
                 return {
                     "status": "failed",
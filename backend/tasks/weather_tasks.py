@@ -0,0 +1,57 @@
+"""
+Weather Rescheduling Tasks
+
+Nightly cross-organization sweep that moves scheduled jobs out of bad
+weather. One pass covers every organization with a fixed number of
+queries; forecasts are shared per location cell through the weather
+service's forecast cache.
+"""
+import logging
+from datetime import datetime, timezone
+
+from backend.tasks.async_runtime import async_task
+from backend.tasks.celery_app import celery_app
+from backend.db.database import get_db
+from backend.services.job_rescheduler import get_job_rescheduler
+
+logger = logging.getLogger(__name__)
+
+
+@celery_app.task(name="backend.tasks.weather_tasks.weather_rescheduling_sweep")
+@async_task
+async def weather_rescheduling_sweep():
+    """
+    Run weather-based rescheduling for all organizations
+
+    Returns:
+        Summary of organizations touched and jobs rescheduled
+    """
+    start_time = datetime.now(timezone.utc)
+    logger.info("Starting weather rescheduling sweep")
+
+    db_gen = get_db()
+    db = next(db_gen)
+
+    try:
+        results = await get_job_rescheduler().run_global_rescheduling_sweep(db=db)
+
+        all_results = [result for org_results in results.values() for result in org_results]
+        summary = {
+            "status": "completed",
+            "organizations_affected": len(results),
+            "jobs_rescheduled": sum(1 for r in all_results if r.success),
+            "jobs_without_safe_slot": sum(1 for r in all_results if not r.success and not r.error_message),
+            "errors": sum(1 for r in all_results if r.error_message),
+            "duration_seconds": (datetime.now(timezone.utc) - start_time).total_seconds(),
+            "timestamp": start_time.isoformat()
+        }
+
+        logger.info(f"Weather rescheduling sweep completed: {summary}")
+        return summary
+
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Weather rescheduling sweep failed: {e}")
+        raise
+    finally:
+        db.close()
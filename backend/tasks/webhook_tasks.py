@@ -5,13 +5,13 @@ Enhanced with P0-11c reliability improvements
 """
 import json
 import logging
-import asyncio
 from datetime import datetime, timezone, timedelta
 from typing import Dict, Any, Optional
 from celery import Celery
 from celery.exceptions import Retry
 
 from backend.core.config import get_settings
+from backend.tasks.async_runtime import run_async
 from backend.services.meta_webhook_service import get_meta_webhook_service
 from backend.core.dlq import handle_task_failure, get_dlq_manager, TaskFailureReason
 from backend.services.webhook_reliability_service import (
@@ -93,7 +93,7 @@ def process_meta_event(self, entry: Dict[str, Any], event_info: Dict[str, Any])
         )
         
         # Check for duplicate processing
-        is_duplicate, previous_result = asyncio.run(
+        is_duplicate, previous_result = run_async(
             reliability_service.check_idempotency(
                 idempotency_key=idempotency_key,
                 platform="meta",
@@ -121,7 +121,7 @@ def process_meta_event(self, entry: Dict[str, Any], event_info: Dict[str, Any])
         # Track delivery attempt start
         webhook_id = f"meta_{entry.get('id', task_id)}_{int(start_time.timestamp())}"
         
-        asyncio.run(
+        run_async(
             reliability_service.track_delivery_attempt(
                 webhook_id=webhook_id,
                 platform="meta",
@@ -137,7 +137,7 @@ def process_meta_event(self, entry: Dict[str, Any], event_info: Dict[str, Any])
         normalized_entry = webhook_service.normalize_webhook_entry(entry)
         
         # Process different types of events
-        result = asyncio.run(_process_normalized_entry(normalized_entry, event_info))
+        result = run_async(_process_normalized_entry(normalized_entry, event_info))
         
         # Calculate processing time
         processing_time = (datetime.now(timezone.utc) - start_time).total_seconds()
@@ -149,7 +149,7 @@ def process_meta_event(self, entry: Dict[str, Any], event_info: Dict[str, Any])
             processing_result = WebhookProcessingResult.TEMPORARY_FAILURE
         
         # Record successful processing
-        asyncio.run(
+        run_async(
             reliability_service.record_processing_result(
                 idempotency_key=idempotency_key,
                 platform="meta",
@@ -168,7 +168,7 @@ def process_meta_event(self, entry: Dict[str, Any], event_info: Dict[str, Any])
         )
         
         # Track successful delivery
-        asyncio.run(
+        run_async(
             reliability_service.track_delivery_attempt(
                 webhook_id=webhook_id,
                 platform="meta",
@@ -209,7 +209,7 @@ def process_meta_event(self, entry: Dict[str, Any], event_info: Dict[str, Any])
             webhook_id = f"meta_{entry.get('id', task_id)}_{int(start_time.timestamp())}"
             
             # Track failed delivery attempt
-            asyncio.run(
+            run_async(
                 reliability_service.track_delivery_attempt(
                     webhook_id=webhook_id,
                     platform="meta",
@@ -241,7 +241,7 @@ def process_meta_event(self, entry: Dict[str, Any], event_info: Dict[str, Any])
             elif 'rate' in str(e).lower():
                 processing_result = WebhookProcessingResult.RATE_LIMITED
             
-            asyncio.run(
+            run_async(
                 reliability_service.record_processing_result(
                     idempotency_key=idempotency_key,
                     platform="meta",
@@ -730,7 +730,7 @@ def webhook_recovery_scan(self, limit: int = 50) -> Dict[str, Any]:
         reliability_service = get_webhook_reliability_service()
         
         # Process failed webhooks for recovery
-        recovery_results = asyncio.run(
+        recovery_results = run_async(
             reliability_service.process_failed_webhooks_recovery(limit=limit)
         )
         
@@ -790,7 +790,7 @@ def webhook_cleanup_task(self, batch_size: int = 1000) -> Dict[str, Any]:
         reliability_service = get_webhook_reliability_service()
         
         # Clean up expired records
-        cleanup_results = asyncio.run(
+        cleanup_results = run_async(
             reliability_service.cleanup_expired_records(batch_size=batch_size)
         )
         
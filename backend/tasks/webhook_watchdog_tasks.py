@@ -4,6 +4,7 @@ GA Checklist requirement: Retry/DLQ watchdog logging
 """
 import logging
 from celery import current_task
+from backend.tasks.async_runtime import run_async
 from backend.tasks.celery_app import celery_app
 from backend.tasks.webhook_watchdog import get_webhook_watchdog
 
@@ -34,8 +35,7 @@ def scan_dlq_watchdog(self):
         watchdog = get_webhook_watchdog()
         
         # Perform DLQ scan
-        import asyncio
-        scan_results = asyncio.run(watchdog.scan_dlq())
+        scan_results = run_async(watchdog.scan_dlq())
         
         # Log summary
         logger.info(f"DLQ watchdog scan completed: {scan_results.get('actions_taken', {})}")
@@ -82,11 +82,8 @@ def process_dlq_entry_retry(self, entry_id: str):
         # Get watchdog instance
         watchdog = get_webhook_watchdog()
         
-        # Process the specific entry
-        import asyncio
-        
         # Get the entry first
-        entries = asyncio.run(watchdog._get_dlq_entries())
+        entries = run_async(watchdog._get_dlq_entries())
         target_entry = None
         
         for entry in entries:
@@ -103,7 +100,7 @@ def process_dlq_entry_retry(self, entry_id: str):
             }
         
         # Process the entry
-        result = asyncio.run(watchdog._process_dlq_entry(target_entry))
+        result = run_async(watchdog._process_dlq_entry(target_entry))
         
         logger.info(f"DLQ entry {entry_id} retry result: {result}")
         
@@ -140,8 +137,7 @@ def cleanup_old_dlq_entries(self):
         watchdog = get_webhook_watchdog()
         
         # Cleanup expired entries
-        import asyncio
-        cleanup_count = asyncio.run(watchdog._cleanup_expired_entries())
+        cleanup_count = run_async(watchdog._cleanup_expired_entries())
         
         logger.info(f"DLQ cleanup completed: removed {cleanup_count} expired entries")
         
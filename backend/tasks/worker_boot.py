@@ -0,0 +1,289 @@
+"""
+Celery worker boot: shared preloading and per-queue memory report
+
+Prefork children are forked from the worker's main process and, with
+worker_max_tasks_per_child, replaced every hundred tasks. Whatever a child
+builds for itself (SQLAlchemy mapper configuration, the heavy services task
+modules import on first use) is paid again by every replacement child, and
+objects inherited from the parent are gradually copied into each child as
+the garbage collector writes to them.
+
+On worker_init, in the main process after the task modules are imported and
+before the pool forks, this module:
+
+- preloads shared read-only state once: settings, the ORM models with their
+  mappers configured, and the heavy modules of the queues this worker
+  consumes (QUEUE_PRELOADS); a worker for other queues never imports them
+- moves everything loaded so far into the collector's permanent generation
+  (gc.freeze) so children keep sharing those pages copy-on-write
+
+Each child logs its boot time and memory when it starts and stops. To
+compare queues without a broker:
+
+    python -m backend.tasks.worker_boot --queues research webhooks posting,autonomous
+"""
+import argparse
+import gc
+import importlib
+import json
+import logging
+import os
+import subprocess
+import sys
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Dict, Iterable, List, Optional, Sequence
+
+from celery.signals import task_postrun, worker_init, worker_process_init, worker_process_shutdown
+
+logger = logging.getLogger(__name__)
+
+# Imported by celery_app, so boot time counts from the app's first import
+_BOOT_STARTED = time.perf_counter()
+
+# Heavy modules whose task modules import them lazily, preloaded in the main
+# process only when the worker consumes one of these queues
+QUEUE_PRELOADS: Dict[str, Sequence[str]] = {
+    "research": ("openai",),
+    "autonomous": (
+        "backend.services.research_automation_production",
+        "backend.services.memory_service_production",
+    ),
+    # Beat sends autonomous_scheduler's autonomous_content_posting to posting too
+    "posting": (
+        "backend.agents.tools",
+        "backend.services.research_automation_production",
+        "backend.services.memory_service_production",
+    ),
+}
+
+
+@dataclass
+class WorkerBootReport:
+    """Boot time and memory of one worker process"""
+    queues: List[str]
+    role: str
+    pid: int
+    boot_seconds: float
+    rss_bytes: int
+    private_bytes: int
+    preloaded: List[str] = field(default_factory=list)
+    tasks_run: Optional[int] = None
+
+    @property
+    def shared_bytes(self) -> int:
+        return max(self.rss_bytes - self.private_bytes, 0)
+
+
+# State of this worker, set in the main process and inherited by its children
+_worker_queues: List[str] = []
+_preloaded: List[str] = []
+_parent_boot_seconds = 0.0
+_tasks_run = 0
+
+
+def memory_usage() -> Dict[str, int]:
+    """
+    Resident memory of this process and the part of it not shared with others
+
+    Returns:
+        rss_bytes and private_bytes (zeros where /proc is unavailable)
+    """
+    usage = {"rss_bytes": 0, "private_bytes": 0}
+    try:
+        with open("/proc/self/smaps_rollup") as smaps:
+            for line in smaps:
+                key, _, value = line.partition(":")
+                if key == "Rss":
+                    usage["rss_bytes"] = int(value.split()[0]) * 1024
+                elif key in ("Private_Clean", "Private_Dirty"):
+                    usage["private_bytes"] += int(value.split()[0]) * 1024
+    except OSError:
+        pass
+    return usage
+
+
+def preload_modules_for(queues: Iterable[str]) -> List[str]:
+    """Heavy modules to preload for the given queues, in order, without duplicates"""
+    return list(dict.fromkeys(module for queue in queues for module in QUEUE_PRELOADS.get(queue, ())))
+
+
+def preload_shared_state(queues: Iterable[str]) -> List[str]:
+    """
+    Load read-only state every child would otherwise build for itself
+
+    Args:
+        queues: Queues this worker consumes
+
+    Returns:
+        Names of the steps that succeeded; a failed step is logged and left
+        to the first task that needs it
+    """
+    steps = [("settings", _load_settings), ("models", _configure_models)]
+    steps += [(module, lambda module=module: importlib.import_module(module)) for module in preload_modules_for(queues)]
+
+    loaded = []
+    for name, step in steps:
+        try:
+            step()
+        except Exception as e:
+            logger.warning(f"Worker preload of {name} failed, children will load it on first use: {e}")
+            continue
+        loaded.append(name)
+    return loaded
+
+
+def _load_settings() -> None:
+    from backend.core.config import get_settings
+    get_settings()
+
+
+def _configure_models() -> None:
+    from sqlalchemy.orm import configure_mappers
+    import backend.db.models  # noqa: F401
+    configure_mappers()
+
+
+def freeze_shared_heap() -> None:
+    """Keep the collector from touching (and so copying) objects inherited by children"""
+    gc.collect()
+    gc.freeze()
+
+
+def boot_report(role: str, tasks_run: Optional[int] = None) -> WorkerBootReport:
+    """Report for this process; children report the main process's boot time"""
+    return WorkerBootReport(
+        queues=list(_worker_queues),
+        role=role,
+        pid=os.getpid(),
+        boot_seconds=round(_parent_boot_seconds, 3),
+        preloaded=list(_preloaded),
+        tasks_run=tasks_run,
+        **memory_usage()
+    )
+
+
+def _log_report(report: WorkerBootReport) -> None:
+    logger.info(
+        f"Celery {report.role} for queues {','.join(report.queues) or 'all'}: "
+        f"boot {report.boot_seconds:.2f}s, RSS {report.rss_bytes / 1048576:.1f} MB "
+        f"({report.private_bytes / 1048576:.1f} MB private, {report.shared_bytes / 1048576:.1f} MB shared)"
+        + (f" after {report.tasks_run} tasks" if report.tasks_run is not None else ""),
+        extra={"worker_boot": asdict(report)}
+    )
+
+
+@worker_init.connect
+def _preload_worker(sender=None, **kwargs) -> None:
+    global _worker_queues, _preloaded, _parent_boot_seconds
+    try:
+        _worker_queues = sorted(sender.app.amqp.queues.consume_from or sender.app.amqp.queues)
+    except AttributeError:
+        _worker_queues = []
+
+    _preloaded = preload_shared_state(_worker_queues)
+    freeze_shared_heap()
+    _parent_boot_seconds = time.perf_counter() - _BOOT_STARTED
+    _log_report(boot_report("main process"))
+
+
+@worker_process_init.connect
+def _report_child_start(**kwargs) -> None:
+    global _tasks_run
+    _tasks_run = 0
+    _log_report(boot_report("child"))
+
+
+@task_postrun.connect
+def _count_task(**kwargs) -> None:
+    global _tasks_run
+    _tasks_run += 1
+
+
+@worker_process_shutdown.connect
+def _report_child_stop(**kwargs) -> None:
+    # RSS at the end of a child's life shows what its tasks added on top of the shared heap
+    _log_report(boot_report("child", tasks_run=_tasks_run))
+
+
+def measure_boot(queues: List[str], preload: bool = True) -> Dict[str, object]:
+    """
+    Boot like a worker for the queues, fork one child and measure both
+
+    Args:
+        queues: Queues the simulated worker consumes
+        preload: Preload and freeze in the main process, as worker_init does
+
+    Returns:
+        The main process's and the child's reports; the child's includes
+        first_use_seconds, what it spent loading the shared state itself
+    """
+    global _worker_queues, _preloaded, _parent_boot_seconds
+    from backend.tasks.celery_app import celery_app
+
+    for module in celery_app.conf.include:
+        try:
+            importlib.import_module(module)
+        except Exception as e:
+            logger.warning(f"Task module {module} failed to import: {e}")
+    _worker_queues = list(queues)
+    if preload:
+        _preloaded = preload_shared_state(queues)
+        freeze_shared_heap()
+    _parent_boot_seconds = time.perf_counter() - _BOOT_STARTED
+    parent = boot_report("main process")
+
+    read_end, write_end = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        os.close(read_end)
+        # What the child's first tasks load unless the main process already did, then a full collection
+        started = time.perf_counter()
+        preload_shared_state(queues)
+        gc.collect()
+        child = dict(asdict(boot_report("child")), first_use_seconds=round(time.perf_counter() - started, 3))
+        with os.fdopen(write_end, "w") as pipe:
+            json.dump(child, pipe)
+        os._exit(0)
+    os.close(write_end)
+    with os.fdopen(read_end) as pipe:
+        child = json.load(pipe)
+    os.waitpid(pid, 0)
+    return {"main": asdict(parent), "child": child}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Boot a fresh interpreter per queue set and print boot time and memory"""
+    parser = argparse.ArgumentParser(description="Report Celery worker boot time and memory per queue")
+    parser.add_argument("--queues", nargs="+", default=sorted(QUEUE_PRELOADS) + ["webhooks"],
+                        help="Queue sets to measure, each comma-separated (e.g. research posting,autonomous)")
+    parser.add_argument("--no-preload", action="store_true",
+                        help="Skip the main-process preload, to compare against")
+    parser.add_argument("--measure", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.measure is not None:
+        queues = [queue for queue in args.measure.split(",") if queue]
+        print(json.dumps(measure_boot(queues, preload=not args.no_preload)))
+        return 0
+
+    width = max(len(queues) for queues in args.queues) + 2
+    print(f"{'queues':<{width}} {'boot s':>7} {'main RSS':>9} {'child RSS':>10} {'child private':>14} "
+          f"{'child first use s':>18}")
+    for queues in args.queues:
+        command = [sys.executable, "-m", "backend.tasks.worker_boot", "--measure", queues]
+        result = subprocess.run(command + (["--no-preload"] if args.no_preload else []),
+                                capture_output=True, text=True)
+        if result.returncode != 0:
+            print(f"{queues:<{width}} failed: {result.stderr.strip().splitlines()[-1:]}")
+            continue
+        report = json.loads(result.stdout.strip().splitlines()[-1])
+        main_report, child = report["main"], report["child"]
+        print(f"{queues:<{width}} {main_report['boot_seconds']:>7.2f} {main_report['rss_bytes'] / 1048576:>7.1f}MB "
+              f"{child['rss_bytes'] / 1048576:>8.1f}MB {child['private_bytes'] / 1048576:>12.1f}MB "
+              f"{child['first_use_seconds']:>18.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
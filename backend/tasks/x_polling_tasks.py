@@ -7,7 +7,8 @@ import logging
 import json
 import redis
 from datetime import datetime, timezone, timedelta
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Tuple
+import httpx
 from celery import Celery
 from sqlalchemy.orm import Session
 
@@ -15,6 +16,7 @@ from backend.core.config import get_settings
 from backend.db.database import get_db
 from backend.db.models import SocialConnection, SocialAudit
 from backend.services.x_mentions_service import get_x_mentions_service
+from backend.tasks.async_runtime import run_async, shared_resource
 
 logger = logging.getLogger(__name__)
 
@@ -44,6 +46,10 @@ DEFAULT_RATE_LIMIT = {
     "burst_allowance": 5        # Allow small burst above limit
 }
 
+# Concurrent X API requests per sweep, overall and per organization
+POLL_CONCURRENCY = 10
+ORG_POLL_CONCURRENCY = 2
+
 
 def is_partner_oauth_enabled() -> bool:
     """Check if partner OAuth feature is enabled"""
@@ -117,100 +123,76 @@ def poll_all_x_mentions() -> Dict[str, Any]:
                     org_connections[org_id] = []
                 org_connections[org_id].append(conn)
             
-            # Poll each organization's connections with rate limiting
+            # Skip organizations that are over quota or still backing off
+            for org_id in list(org_connections):
+                if redis_client and not _check_org_rate_limit(redis_client, org_id):
+                    logger.warning(f"Organization {org_id} rate limited for X mentions polling")
+                    poll_results["rate_limited_orgs"].append(org_id)
+                    poll_results["connections_skipped"] += len(org_connections.pop(org_id))
+            
+            # Poll every remaining connection in one event loop
             mentions_service = get_x_mentions_service()
+            polled, org_backoffs = run_async(
+                _poll_connections(mentions_service, org_connections, _get_http_client(mentions_service))
+            )
             
-            for org_id, connections in org_connections.items():
-                try:
-                    # Check organization rate limit
-                    if redis_client and not _check_org_rate_limit(redis_client, org_id):
-                        logger.warning(f"Organization {org_id} rate limited for X mentions polling")
-                        poll_results["rate_limited_orgs"].append(org_id)
-                        poll_results["connections_skipped"] += len(connections)
-                        continue
-                    
-                    # Poll mentions for each connection in this org
-                    for connection in connections:
-                        try:
-                            logger.info(f"Polling mentions for X connection {connection.id}")
-                            
-                            result = asyncio.run(mentions_service.poll_mentions(connection, db))
-                            
-                            if result.get("success"):
-                                poll_results["connections_polled"] += 1
-                                poll_results["total_new_mentions"] += result.get("new_mentions", 0)
-                                
-                                # Create audit log for successful poll
-                                asyncio.run(_create_poll_audit(
-                                    db, connection, "poll_mentions", "success",
-                                    {
-                                        "new_mentions": result.get("new_mentions", 0),
-                                        "since_id": result.get("since_id"),
-                                        "total_fetched": result.get("total_fetched", 0)
-                                    }
-                                ))
-                                
-                            elif result.get("error") == "rate_limited":
-                                # Handle rate limiting
-                                poll_results["connections_skipped"] += 1
-                                logger.warning(f"Connection {connection.id} rate limited: {result}")
-                                
-                                # Create audit log for rate limit
-                                asyncio.run(_create_poll_audit(
-                                    db, connection, "poll_mentions", "rate_limited",
-                                    {
-                                        "backoff_seconds": result.get("backoff_seconds"),
-                                        "retry_after": result.get("retry_after", {}).isoformat() if result.get("retry_after") else None
-                                    }
-                                ))
-                                
-                            else:
-                                # Handle other errors
-                                poll_results["connections_skipped"] += 1
-                                error_msg = result.get("error", "unknown error")
-                                poll_results["errors"].append({
-                                    "connection_id": str(connection.id),
-                                    "error": error_msg
-                                })
-                                
-                                # Create audit log for error
-                                asyncio.run(_create_poll_audit(
-                                    db, connection, "poll_mentions", "failure",
-                                    {"error": error_msg}
-                                ))
-                        
-                        except Exception as e:
-                            poll_results["connections_skipped"] += 1
-                            error_msg = f"Exception polling connection {connection.id}: {str(e)}"
-                            logger.error(error_msg)
-                            poll_results["errors"].append({
-                                "connection_id": str(connection.id),
-                                "error": str(e)
-                            })
-                            
-                            # Create audit log for exception
-                            try:
-                                asyncio.run(_create_poll_audit(
-                                    db, connection, "poll_mentions", "failure",
-                                    {"error": str(e), "exception": True}
-                                ))
-                            except Exception as audit_err:
-                                import logging
-                                audit_logger = logging.getLogger(__name__)
-                                audit_logger.warning("Audit write failed in X mentions polling",
-                                             extra={"err": str(audit_err)}, exc_info=audit_err)
-                    
-                    # Update rate limit counter for this organization
-                    if redis_client:
-                        _update_org_rate_limit(redis_client, org_id, len(connections))
+            audits = []
+            for connection, result in polled:
+                if result.get("success"):
+                    poll_results["connections_polled"] += 1
+                    poll_results["total_new_mentions"] += result.get("new_mentions", 0)
+                    audits.append(_build_poll_audit(
+                        connection, "poll_mentions", "success",
+                        {
+                            "new_mentions": result.get("new_mentions", 0),
+                            "since_id": result.get("since_id"),
+                            "total_fetched": result.get("total_fetched", 0)
+                        }
+                    ))
                 
-                except Exception as e:
-                    error_msg = f"Error polling organization {org_id}: {str(e)}"
-                    logger.error(error_msg)
+                elif result.get("error") == "rate_limited":
+                    poll_results["connections_skipped"] += 1
+                    logger.warning(f"Connection {connection.id} rate limited: {result}")
+                    audits.append(_build_poll_audit(
+                        connection, "poll_mentions", "rate_limited",
+                        {
+                            "backoff_seconds": result.get("backoff_seconds"),
+                            "retry_after": result["retry_after"].isoformat() if result.get("retry_after") else None
+                        }
+                    ))
+                
+                else:
+                    poll_results["connections_skipped"] += 1
+                    error_msg = result.get("error", "unknown error")
                     poll_results["errors"].append({
-                        "organization_id": org_id,
-                        "error": str(e)
+                        "connection_id": str(connection.id),
+                        "error": error_msg
                     })
+                    metadata = {"error": error_msg}
+                    if result.get("exception"):
+                        metadata["exception"] = True
+                    audits.append(_build_poll_audit(connection, "poll_mentions", "failure", metadata))
+            
+            # since_ids for the whole sweep in one commit, then the audit rows in one insert
+            try:
+                mentions_service.record_poll_results(db, polled)
+            except Exception as e:
+                db.rollback()
+                logger.error(f"Failed to store X mentions since_ids: {e}")
+                poll_results["errors"].append({"error": f"since_id update failed: {str(e)}"})
+            _write_poll_audits(db, audits)
+            
+            # Update rate limit counters for the requests actually made
+            if redis_client:
+                requests_by_org = {}
+                for connection, result in polled:
+                    if not result.get("skipped"):
+                        org_id = str(connection.organization_id)
+                        requests_by_org[org_id] = requests_by_org.get(org_id, 0) + 1
+                for org_id, request_count in requests_by_org.items():
+                    _update_org_rate_limit(redis_client, org_id, request_count)
+                for org_id, backoff_seconds in org_backoffs.items():
+                    _set_org_backoff(redis_client, org_id, backoff_seconds)
             
             # Calculate polling duration
             end_time = datetime.now(timezone.utc)
@@ -274,27 +256,30 @@ def poll_connection_mentions(connection_id: str) -> Dict[str, Any]:
             
             # Poll mentions
             mentions_service = get_x_mentions_service()
-            result = asyncio.run(mentions_service.poll_mentions(connection, db))
+            result = run_async(
+                mentions_service.poll_mentions(connection, db, client=_get_http_client(mentions_service))
+            )
             
             # Create audit log
             if result.get("success"):
-                asyncio.run(_create_poll_audit(
-                    db, connection, "poll_mentions", "success",
+                audit = _build_poll_audit(
+                    connection, "poll_mentions", "success",
                     {
                         "new_mentions": result.get("new_mentions", 0),
                         "since_id": result.get("since_id"),
                         "total_fetched": result.get("total_fetched", 0),
                         "manual_poll": True
                     }
-                ))
+                )
             else:
-                asyncio.run(_create_poll_audit(
-                    db, connection, "poll_mentions", "failure",
+                audit = _build_poll_audit(
+                    connection, "poll_mentions", "failure",
                     {
                         "error": result.get("error"),
                         "manual_poll": True
                     }
-                ))
+                )
+            _write_poll_audits(db, [audit])
             
             poll_result = {
                 **result,
@@ -331,6 +316,11 @@ def _check_org_rate_limit(redis_client: redis.Redis, org_id: str) -> bool:
         True if within rate limit, False if rate limited
     """
     try:
+        # Honor a backoff recorded after the org's last 429
+        if redis_client.exists(f"{REDIS_RATE_LIMIT_PREFIX}:{org_id}:backoff"):
+            logger.warning(f"Organization {org_id} backing off after an X rate limit")
+            return False
+        
         key = f"{REDIS_RATE_LIMIT_PREFIX}:{org_id}"
         current_time = int(datetime.now(timezone.utc).timestamp())
         window_start = current_time - DEFAULT_RATE_LIMIT["window_seconds"]
@@ -367,11 +357,10 @@ def _update_org_rate_limit(redis_client: redis.Redis, org_id: str, request_count
         key = f"{REDIS_RATE_LIMIT_PREFIX}:{org_id}"
         current_time = int(datetime.now(timezone.utc).timestamp())
         
-        # Add current requests to the sorted set
-        for i in range(request_count):
-            # Use slight time offsets to avoid duplicate scores
-            score = current_time + (i * 0.001)
-            redis_client.zadd(key, {f"req_{score}": score})
+        # Add current requests to the sorted set in one call
+        # Use slight time offsets to avoid duplicate scores
+        scores = [current_time + (i * 0.001) for i in range(request_count)]
+        redis_client.zadd(key, {f"req_{score}": score for score in scores})
         
         # Set expiry to clean up automatically
         redis_client.expire(key, DEFAULT_RATE_LIMIT["window_seconds"] + 3600)
@@ -380,40 +369,133 @@ def _update_org_rate_limit(redis_client: redis.Redis, org_id: str, request_count
         logger.warning(f"Error updating rate limit: {e}")
 
 
-async def _create_poll_audit(
-    db: Session,
+def _get_http_client(mentions_service) -> httpx.AsyncClient:
+    """X API client kept alive across polls on the worker's event loop"""
+    return shared_resource("x_mentions_http_client", lambda: mentions_service.create_client(POLL_CONCURRENCY))
+
+
+def _set_org_backoff(redis_client: redis.Redis, org_id: str, backoff_seconds: int) -> None:
+    """
+    Record that an organization hit the X rate limit
+    
+    _check_org_rate_limit skips the organization until the backoff expires.
+    
+    Args:
+        redis_client: Redis client
+        org_id: Organization ID
+        backoff_seconds: Backoff from XMentionsService._calculate_rate_limit_backoff
+    """
+    try:
+        redis_client.set(f"{REDIS_RATE_LIMIT_PREFIX}:{org_id}:backoff", 1, ex=max(1, int(backoff_seconds)))
+    except Exception as e:
+        logger.warning(f"Error recording rate limit backoff: {e}")
+
+
+async def _poll_connections(
+    mentions_service,
+    org_connections: Dict[str, List[SocialConnection]],
+    client: Optional[httpx.AsyncClient] = None
+) -> Tuple[List[Tuple[SocialConnection, Dict[str, Any]]], Dict[str, int]]:
+    """
+    Poll connections concurrently over one pooled HTTP client
+    
+    At most POLL_CONCURRENCY requests are in flight overall and
+    ORG_POLL_CONCURRENCY per organization. Once one of an organization's
+    connections is rate limited, its remaining connections are skipped
+    without a request. Only the HTTP work runs here; database writes
+    happen after the sweep.
+    
+    Args:
+        mentions_service: XMentionsService instance
+        org_connections: Connections grouped by organization ID
+        client: HTTP client to use (a pooled one is opened for the sweep otherwise)
+        
+    Returns:
+        (connection, result) pairs and backoff seconds per rate-limited organization
+    """
+    if client is None:
+        async with mentions_service.create_client(POLL_CONCURRENCY) as client:
+            return await _poll_connections(mentions_service, org_connections, client)
+    
+    semaphore = asyncio.Semaphore(POLL_CONCURRENCY)
+    org_backoffs: Dict[str, int] = {}
+    
+    async def poll_org(org_id: str, connections: List[SocialConnection]):
+        org_semaphore = asyncio.Semaphore(ORG_POLL_CONCURRENCY)
+        
+        async def poll(connection: SocialConnection):
+            async with org_semaphore, semaphore:
+                if org_id in org_backoffs:
+                    return connection, {
+                        "success": False,
+                        "error": "rate_limited",
+                        "backoff_seconds": org_backoffs[org_id],
+                        "skipped": True
+                    }
+                try:
+                    logger.info(f"Polling mentions for X connection {connection.id}")
+                    result = await mentions_service.fetch_new_mentions(connection, client)
+                except Exception as e:
+                    logger.error(f"Exception polling connection {connection.id}: {str(e)}")
+                    result = {"success": False, "error": str(e), "exception": True}
+                if result.get("error") == "rate_limited":
+                    org_backoffs[org_id] = max(org_backoffs.get(org_id, 0), result.get("backoff_seconds") or 0)
+                return connection, result
+        
+        return await asyncio.gather(*(poll(connection) for connection in connections))
+    
+    per_org = await asyncio.gather(*(
+        poll_org(org_id, connections) for org_id, connections in org_connections.items()
+    ))
+    
+    return [pair for pairs in per_org for pair in pairs], org_backoffs
+
+
+def _build_poll_audit(
     connection: SocialConnection,
     action: str,
     status: str,
     metadata: Dict[str, Any]
-) -> None:
+) -> SocialAudit:
     """
-    Create audit log for mentions polling operation
+    Build an audit log entry for a mentions polling operation
     
     Args:
-        db: Database session
         connection: SocialConnection instance
         action: Action type (e.g., 'poll_mentions')
         status: Status ('success', 'failure', 'rate_limited')
         metadata: Additional metadata
     """
+    return SocialAudit(
+        organization_id=connection.organization_id,
+        connection_id=connection.id,
+        action=action,
+        platform=connection.platform,
+        user_id=None,  # System operation
+        status=status,
+        audit_metadata={
+            **metadata,
+            "platform_account_id": connection.platform_account_id,
+            "platform_username": connection.platform_username
+        }
+    )
+
+
+def _write_poll_audits(db: Session, audits: List[SocialAudit]) -> None:
+    """
+    Insert polling audit logs in one commit
+    
+    Args:
+        db: Database session
+        audits: Entries from _build_poll_audit
+    """
+    if not audits:
+        return
     try:
-        audit = SocialAudit(
-            organization_id=connection.organization_id,
-            connection_id=connection.id,
-            action=action,
-            platform=connection.platform,
-            user_id=None,  # System operation
-            status=status,
-            audit_metadata={
-                **metadata,
-                "platform_account_id": connection.platform_account_id,
-                "platform_username": connection.platform_username
-            }
-        )
-        db.add(audit)
+        db.add_all(audits)
         db.commit()
         
     except Exception as e:
-        logger.error(f"Failed to create poll audit log: {e}")
-        # Don't raise - audit logging shouldn't break the main operation
\ No newline at end of file
+        db.rollback()
+        logger.warning("Audit write failed in X mentions polling", extra={"err": str(e)}, exc_info=e)
+        # Don't raise - audit logging shouldn't break the main operation
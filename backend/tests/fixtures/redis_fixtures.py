@@ -2,6 +2,7 @@
 Redis test fixtures using fakeredis
 Provides isolated Redis test environment without external dependencies
 """
+import bisect
 import pytest
 from unittest.mock import Mock, patch
 import logging
@@ -355,6 +356,134 @@ def redis_helper(fake_redis):
     return RedisTestHelper(fake_redis)
 
 
+class SortedSetRedis:
+    """
+    In-memory stand-in for the Redis sorted-set, string and list commands
+    used by delayed queues, for when fakeredis is not installed
+    """
+    
+    def __init__(self):
+        self.sets = {}
+        self.strings = {}
+        self.lists = {}
+        # Timeouts passed to blpop, which returns at once instead of blocking
+        self.blpop_timeouts = []
+    
+    def _entries(self, key):
+        return self.sets.setdefault(key, ([], {}))
+    
+    def zadd(self, key, mapping, nx=False):
+        ordered, scores = self._entries(key)
+        added = 0
+        for member, score in mapping.items():
+            score = float(score)
+            if member in scores:
+                if nx:
+                    continue
+                del ordered[bisect.bisect_left(ordered, (scores[member], member))]
+            else:
+                added += 1
+            scores[member] = score
+            bisect.insort(ordered, (score, member))
+        return added
+    
+    def zrem(self, key, *members):
+        ordered, scores = self._entries(key)
+        removed = 0
+        for member in members:
+            if member in scores:
+                del ordered[bisect.bisect_left(ordered, (scores.pop(member), member))]
+                removed += 1
+        return removed
+    
+    def zrangebyscore(self, key, min, max, start=None, num=None, withscores=False):
+        ordered, _ = self._entries(key)
+        low = float(min)
+        high = float(max)
+        matches = ordered[bisect.bisect_left(ordered, (low, "")):bisect.bisect_right(ordered, (high, "￿"))]
+        if start is not None and num is not None:
+            matches = matches[start:start + num]
+        if withscores:
+            return [(member, score) for score, member in matches]
+        return [member for _, member in matches]
+    
+    def zrange(self, key, start, end, withscores=False):
+        ordered, _ = self._entries(key)
+        matches = ordered[start:None if end == -1 else end + 1]
+        if withscores:
+            return [(member, score) for score, member in matches]
+        return [member for _, member in matches]
+    
+    def zscore(self, key, member):
+        return self._entries(key)[1].get(member)
+    
+    def zcard(self, key):
+        return len(self._entries(key)[1])
+    
+    def set(self, key, value, ex=None):
+        self.strings[key] = value
+        return True
+    
+    def lpush(self, key, *values):
+        items = self.lists.setdefault(key, [])
+        items[:0] = reversed(values)
+        return len(items)
+    
+    def ltrim(self, key, start, end):
+        self.lists[key] = self.lists.get(key, [])[start:None if end == -1 else end + 1]
+        return True
+    
+    def blpop(self, keys, timeout=0):
+        self.blpop_timeouts.append(timeout)
+        for key in keys:
+            if self.lists.get(key):
+                return key, self.lists[key].pop(0)
+        return None
+    
+    def exists(self, key):
+        return int(key in self.strings or bool(self.sets.get(key, ([], {}))[1]))
+    
+    def flushall(self):
+        self.sets.clear()
+        self.strings.clear()
+        self.lists.clear()
+        return True
+    
+    def pipeline(self, transaction=True):
+        return _SortedSetPipeline(self)
+
+
+class _SortedSetPipeline:
+    """Queues SortedSetRedis calls and runs them on execute()"""
+    
+    def __init__(self, client):
+        self.client = client
+        self.calls = []
+    
+    def __getattr__(self, name):
+        command = getattr(self.client, name)
+        
+        def queue(*args, **kwargs):
+            self.calls.append((command, args, kwargs))
+            return self
+        return queue
+    
+    def execute(self):
+        calls, self.calls = self.calls, []
+        return [command(*args, **kwargs) for command, args, kwargs in calls]
+
+
+@pytest.fixture
+def sorted_set_redis():
+    """
+    Provide a Redis client with working sorted sets
+    Uses fakeredis if available, otherwise the in-memory SortedSetRedis
+    """
+    if FAKEREDIS_AVAILABLE:
+        return fakeredis.FakeRedis(decode_responses=False)
+    return SortedSetRedis()
+
+
 # Test validation fixtures
 @pytest.fixture
 def validate_redis_test_setup():
@@ -5,13 +5,18 @@ Tests that duplicate schedules with same content_hash don't double-post
 import pytest
 from unittest.mock import Mock, AsyncMock, patch
 from datetime import datetime, timezone
-from celery.result import AsyncResult
+from celery.exceptions import Retry
 
 from backend.tasks.publish_tasks import publish_via_connection
 from backend.db.models import SocialConnection, ContentSchedule
 from backend.services.publish_runner import PublishPayload
 
 
+def run_publish_task(task, *args):
+    """Run the task body with a mock standing in for the bound Celery task"""
+    return publish_via_connection.__wrapped__.__func__(task, *args)
+
+
 @pytest.fixture
 def mock_connection():
     """Create mock social connection"""
@@ -55,13 +60,12 @@ def mock_db_session():
 class TestIdempotency:
     """Test idempotency in publish tasks and content scheduling"""
     
-    @pytest.mark.asyncio
-    @patch('backend.tasks.publish_tasks.get_db')
+    @patch('backend.tasks.publish_tasks.SessionLocal')
     @patch('backend.tasks.publish_tasks.get_publish_runner')
-    async def test_duplicate_content_hash_prevents_double_post(self, mock_runner, mock_get_db, mock_connection, payload_dict, mock_db_session):
+    def test_duplicate_content_hash_prevents_double_post(self, mock_runner, mock_session_local, mock_connection, payload_dict, mock_db_session):
         """Test that duplicate content hash prevents double posting"""
         # Setup mocks
-        mock_get_db.return_value.__next__.return_value = mock_db_session
+        mock_session_local.return_value = mock_db_session
         
         # Mock existing successful schedule
         existing_schedule = Mock(spec=ContentSchedule)
@@ -82,7 +86,7 @@ class TestIdempotency:
         mock_task.request.retries = 0
         
         # Call the task function directly
-        result = await publish_via_connection.__wrapped__(
+        result = run_publish_task(
             mock_task,
             str(mock_connection.id),
             payload_dict,
@@ -98,18 +102,18 @@ class TestIdempotency:
         # Verify publish runner was never called
         mock_runner.assert_not_called()
     
-    @pytest.mark.asyncio
-    @patch('backend.tasks.publish_tasks.get_db')
+    @patch('backend.tasks.publish_tasks.SessionLocal')
     @patch('backend.tasks.publish_tasks.get_publish_runner')
-    async def test_new_content_hash_allows_publish(self, mock_runner, mock_get_db, mock_connection, payload_dict, mock_db_session):
+    def test_new_content_hash_allows_publish(self, mock_runner, mock_session_local, mock_connection, payload_dict, mock_db_session):
         """Test that new content hash allows publish to proceed"""
         # Setup mocks
-        mock_get_db.return_value.__next__.return_value = mock_db_session
+        mock_session_local.return_value = mock_db_session
         
         # Mock no existing schedule
         mock_db_session.query.return_value.filter.side_effect = [
             Mock(first=Mock(return_value=mock_connection)),  # Connection query
-            Mock(first=Mock(return_value=None))  # No existing ContentSchedule
+            Mock(first=Mock(return_value=None)),  # No existing ContentSchedule
+            Mock(first=Mock(return_value=None))  # No schedule for the idempotency key
         ]
         
         # Mock successful publish
@@ -129,7 +133,7 @@ class TestIdempotency:
         mock_task.request.retries = 0
         
         # Call the task function
-        result = await publish_via_connection.__wrapped__(
+        result = run_publish_task(
             mock_task,
             str(mock_connection.id),
             payload_dict,
@@ -145,12 +149,11 @@ class TestIdempotency:
         # Verify publish runner was called
         mock_publish_runner.run_publish.assert_called_once()
     
-    @pytest.mark.asyncio
-    @patch('backend.tasks.publish_tasks.get_db')
-    async def test_missing_connection_prevents_duplicate_check(self, mock_get_db, payload_dict, mock_db_session):
+    @patch('backend.tasks.publish_tasks.SessionLocal')
+    def test_missing_connection_prevents_duplicate_check(self, mock_session_local, payload_dict, mock_db_session):
         """Test that missing connection prevents duplicate check"""
         # Setup mocks
-        mock_get_db.return_value.__next__.return_value = mock_db_session
+        mock_session_local.return_value = mock_db_session
         
         # Mock connection not found
         mock_db_session.query.return_value.filter.return_value.first.return_value = None
@@ -162,7 +165,7 @@ class TestIdempotency:
         mock_task.request.retries = 0
         
         # Call the task function
-        result = await publish_via_connection.__wrapped__(
+        result = run_publish_task(
             mock_task,
             "nonexistent_connection_id",
             payload_dict,
@@ -175,13 +178,12 @@ class TestIdempotency:
         assert "not found" in result['error_message']
         assert result.get('is_fatal') is True
     
-    @pytest.mark.asyncio
-    @patch('backend.tasks.publish_tasks.get_db')
+    @patch('backend.tasks.publish_tasks.SessionLocal')
     @patch('backend.tasks.publish_tasks.get_publish_runner')
-    async def test_idempotency_key_updates_schedule_status(self, mock_runner, mock_get_db, mock_connection, payload_dict, mock_db_session):
+    def test_idempotency_key_updates_schedule_status(self, mock_runner, mock_session_local, mock_connection, payload_dict, mock_db_session):
         """Test that successful publish updates ContentSchedule status via idempotency key"""
         # Setup mocks
-        mock_get_db.return_value.__next__.return_value = mock_db_session
+        mock_session_local.return_value = mock_db_session
         
         # Mock existing schedule in pending state
         mock_schedule = Mock(spec=ContentSchedule)
@@ -212,7 +214,7 @@ class TestIdempotency:
         mock_task.request.retries = 0
         
         # Call the task function
-        result = await publish_via_connection.__wrapped__(
+        result = run_publish_task(
             mock_task,
             str(mock_connection.id),
             payload_dict,
@@ -230,13 +232,12 @@ class TestIdempotency:
         assert mock_schedule.published_at is not None
         mock_db_session.commit.assert_called()
     
-    @pytest.mark.asyncio
-    @patch('backend.tasks.publish_tasks.get_db')
+    @patch('backend.tasks.publish_tasks.SessionLocal')
     @patch('backend.tasks.publish_tasks.get_publish_runner')
-    async def test_retry_updates_schedule_status(self, mock_runner, mock_get_db, mock_connection, payload_dict, mock_db_session):
+    def test_retry_updates_schedule_status(self, mock_runner, mock_session_local, mock_connection, payload_dict, mock_db_session):
         """Test that retryable failure updates ContentSchedule status"""
         # Setup mocks
-        mock_get_db.return_value.__next__.return_value = mock_db_session
+        mock_session_local.return_value = mock_db_session
         
         # Mock existing schedule
         mock_schedule = Mock(spec=ContentSchedule)
@@ -265,11 +266,11 @@ class TestIdempotency:
         mock_task = Mock()
         mock_task.request.retries = 0
         mock_task.max_retries = 6
-        mock_task.retry = Mock(side_effect=Exception("Retry called"))  # To catch retry
+        mock_task.retry = Mock(side_effect=Retry("Retry called"))  # To catch retry
         
         # Expect retry exception
-        with pytest.raises(Exception, match="Retry called"):
-            await publish_via_connection.__wrapped__(
+        with pytest.raises(Retry, match="Retry called"):
+            run_publish_task(
                 mock_task,
                 str(mock_connection.id),
                 payload_dict,
@@ -284,13 +285,12 @@ class TestIdempotency:
         # Verify retry was called
         mock_task.retry.assert_called_once()
     
-    @pytest.mark.asyncio
-    @patch('backend.tasks.publish_tasks.get_db')
+    @patch('backend.tasks.publish_tasks.SessionLocal')
     @patch('backend.tasks.publish_tasks.get_publish_runner')
-    async def test_fatal_error_updates_schedule_status(self, mock_runner, mock_get_db, mock_connection, payload_dict, mock_db_session):
+    def test_fatal_error_updates_schedule_status(self, mock_runner, mock_session_local, mock_connection, payload_dict, mock_db_session):
         """Test that fatal error updates ContentSchedule status"""
         # Setup mocks
-        mock_get_db.return_value.__next__.return_value = mock_db_session
+        mock_session_local.return_value = mock_db_session
         
         # Mock existing schedule
         mock_schedule = Mock(spec=ContentSchedule)
@@ -319,7 +319,7 @@ class TestIdempotency:
         mock_task.request.retries = 0
         
         # Call the task function
-        result = await publish_via_connection.__wrapped__(
+        result = run_publish_task(
             mock_task,
             str(mock_connection.id),
             payload_dict,
@@ -336,12 +336,11 @@ class TestIdempotency:
         assert mock_schedule.error_message == "Authentication failed"
         mock_db_session.commit.assert_called()
     
-    @pytest.mark.asyncio
-    @patch('backend.tasks.publish_tasks.get_db')
-    async def test_empty_content_hash_skips_duplicate_check(self, mock_get_db, mock_connection, payload_dict, mock_db_session):
+    @patch('backend.tasks.publish_tasks.SessionLocal')
+    def test_empty_content_hash_skips_duplicate_check(self, mock_session_local, mock_connection, payload_dict, mock_db_session):
         """Test that empty/None content hash skips duplicate check"""
         # Setup mocks
-        mock_get_db.return_value.__next__.return_value = mock_db_session
+        mock_session_local.return_value = mock_db_session
         
         # Mock connection found, but no duplicate check should be made
         mock_db_session.query.return_value.filter.return_value.first.return_value = mock_connection
@@ -362,7 +361,7 @@ class TestIdempotency:
             mock_runner.return_value = mock_publish_runner
             
             # Call with None content hash
-            result = await publish_via_connection.__wrapped__(
+            result = run_publish_task(
                 mock_task,
                 str(mock_connection.id),
                 payload_dict,
@@ -374,5 +373,5 @@ class TestIdempotency:
             assert result['success'] is True
             assert result['platform_post_id'] == "no_hash_post_123"
             
-            # Verify only connection query was made (no duplicate check)
-            assert mock_db_session.query.call_count == 1
\ No newline at end of file
+            # Verify only the connection and the idempotency key schedule were queried (no duplicate check)
+            assert mock_db_session.query.call_count == 2
\ No newline at end of file
@@ -0,0 +1,116 @@
+"""
+Benchmark: per-task event loops vs the worker's persistent async runtime
+
+Runs 300 small "tasks" that each make one HTTP request to a local
+keep-alive server, once the old way (new event loop and new httpx client
+per task) and once through run_async() with a shared_resource() client,
+and reports per-task overhead and how many TCP connections each opened.
+
+Run with: pytest backend/tests/performance/test_async_runtime_benchmark.py -s
+"""
+import asyncio
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+
+from backend.tasks.async_runtime import run_async, shared_resource, shutdown_async_runtime
+
+TASK_COUNT = 300
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out as separate writes; avoid delayed-ACK stalls on reused connections
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        super().setup()
+        self.server.connections += 1
+
+    def do_GET(self):
+        body = b'{"ok": true}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), KeepAliveHandler)
+    httpd.daemon_threads = True
+    httpd.connections = 0
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+async def fetch(client: httpx.AsyncClient, url: str) -> int:
+    response = await client.get(url)
+    return response.status_code
+
+
+def legacy_task(url: str) -> int:
+    """What tasks did before: fresh loop and fresh client every invocation"""
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    try:
+        async def run():
+            async with httpx.AsyncClient(timeout=10.0) as client:
+                return await fetch(client, url)
+        return loop.run_until_complete(run())
+    finally:
+        loop.close()
+
+
+def runtime_task(url: str) -> int:
+    """Same work on the persistent loop with a shared pooled client"""
+    async def run():
+        client = shared_resource("benchmark_client", lambda: httpx.AsyncClient(timeout=10.0))
+        return await fetch(client, url)
+    return run_async(run())
+
+
+def measure(task, url: str, server) -> tuple:
+    server.connections = 0
+    start = time.perf_counter()
+    statuses = [task(url) for _ in range(TASK_COUNT)]
+    elapsed = time.perf_counter() - start
+    assert statuses == [200] * TASK_COUNT
+    return elapsed, server.connections
+
+
+@pytest.mark.performance
+@pytest.mark.slow
+class TestAsyncRuntimeBenchmark:
+    """Compare per-task event loops with the persistent worker runtime"""
+
+    def test_runtime_reuses_loop_and_connections(self, server):
+        url = f"http://127.0.0.1:{server.server_address[1]}/"
+        shutdown_async_runtime()
+
+        legacy_seconds, legacy_connections = measure(legacy_task, url, server)
+        runtime_seconds, runtime_connections = measure(runtime_task, url, server)
+        shutdown_async_runtime()
+
+        print(
+            f"\n{TASK_COUNT} tasks, one HTTP request each"
+            f"\n  loop + client per task:  {legacy_seconds / TASK_COUNT * 1000:6.2f}ms/task, "
+            f"{legacy_connections} TCP connections"
+            f"\n  persistent runtime:      {runtime_seconds / TASK_COUNT * 1000:6.2f}ms/task, "
+            f"{runtime_connections} TCP connections"
+            f"\n  speedup: {legacy_seconds / runtime_seconds:.1f}x"
+        )
+
+        assert legacy_connections == TASK_COUNT
+        assert runtime_connections <= 2
+        assert runtime_seconds < legacy_seconds
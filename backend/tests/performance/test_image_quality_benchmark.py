@@ -0,0 +1,97 @@
+"""
+Benchmark: full-resolution pixel passes vs thumbnail analysis in AdvancedQualityScorer
+
+Scores generated-looking 1024x1024 and 1792x1024 images (smooth gradients
+with noise, as PNG and JPEG) through the legacy pixel statistics (full
+decode, np.unique over every channel value and over every RGB row) and
+through analyze_image, then times score_image_quality and score_batch end
+to end. CLIP/LAION are not installed here, so the model-backed dimensions
+use their fallbacks in both paths.
+
+Run with: pytest backend/tests/performance/test_image_quality_benchmark.py -s
+"""
+import asyncio
+import base64
+import io
+import statistics
+import time
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from backend.services.advanced_quality_scorer import AdvancedQualityScorer, analyze_image
+
+ROUNDS = 5
+
+
+def generated_image(width, height, seed):
+    rng = np.random.default_rng(seed)
+    x = np.linspace(0, 1, width, dtype=np.float32)
+    y = np.linspace(0, 1, height, dtype=np.float32)[:, None]
+    base = np.stack([x + 0 * y, y + 0 * x, (x * y) ** 0.5], axis=-1) * 220
+    pixels = np.clip(base + rng.normal(0, 12, base.shape), 0, 255).astype(np.uint8)
+    return Image.fromarray(pixels)
+
+
+def encode(image, image_format):
+    buffer = io.BytesIO()
+    image.save(buffer, format=image_format, **({"quality": 90} if image_format == "JPEG" else {}))
+    return base64.b64encode(buffer.getvalue()).decode("utf-8")
+
+
+def legacy_pixel_passes(image_base64):
+    """Technical and aesthetic statistics as previously computed on the full image"""
+    image = Image.open(io.BytesIO(base64.b64decode(image_base64)))
+    image_array = np.array(image)
+    distinct_values = len(np.unique(image_array))
+    image_array = np.array(image)
+    unique_colors = len(np.unique(image_array.reshape(-1, image_array.shape[-1]), axis=0))
+    return distinct_values, unique_colors
+
+
+def time_ms(function, *args):
+    timings = []
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        function(*args)
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+@pytest.mark.performance
+@pytest.mark.slow
+class TestImageQualityBenchmark:
+    """Compare full-resolution statistics with the analysis thumbnail"""
+
+    def test_thumbnail_analysis_vs_full_resolution(self):
+        scorer = AdvancedQualityScorer()
+        print()
+        for width, height in ((1024, 1024), (1792, 1024)):
+            image = generated_image(width, height, seed=width)
+            for image_format in ("PNG", "JPEG"):
+                encoded = encode(image, image_format)
+                legacy_ms = time_ms(legacy_pixel_passes, encoded)
+                analysis_ms = time_ms(analyze_image, encoded)
+                score_ms = time_ms(lambda: asyncio.run(scorer.score_image_quality(encoded, "prompt")))
+                print(
+                    f"  {width}x{height} {image_format}: legacy pixel passes {legacy_ms:7.1f}ms"
+                    f"  analyze_image {analysis_ms:5.1f}ms  score_image_quality {score_ms:5.1f}ms"
+                )
+
+                assert analysis_ms * 10 < legacy_ms
+
+    def test_score_batch(self):
+        scorer = AdvancedQualityScorer()
+        images = [(encode(generated_image(1024, 1024, seed), "JPEG"), "prompt") for seed in range(8)]
+
+        start = time.perf_counter()
+        sequential = [asyncio.run(scorer.score_image_quality(image, prompt)) for image, prompt in images]
+        sequential_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        batched = asyncio.run(scorer.score_batch(images))
+        batch_ms = (time.perf_counter() - start) * 1000
+
+        print(f"\n  {len(images)} images: sequential {sequential_ms:.1f}ms, score_batch {batch_ms:.1f}ms")
+        assert [r["overall_score"] for r in batched] == [r["overall_score"] for r in sequential]
@@ -0,0 +1,112 @@
+"""
+Benchmark: banded SimHash lookups vs a brute-force Hamming scan over 1M fingerprints
+
+Indexes 1M fingerprints twice: spread over 100 organizations (10k each, a
+large tenant) and all in one organization (worst case). Near-duplicates of
+the probe posts are planted at every distance up to the threshold, and
+lookups through the band tables are timed against a vectorized NumPy scan
+of the organization's fingerprints, checking that both agree. The
+embedding call and vector search the pre-check avoids cost tens to hundreds
+of milliseconds per draft and are not reproduced here.
+
+Run with: pytest backend/tests/performance/test_near_duplicate_benchmark.py -s
+"""
+import random
+import statistics
+import time
+
+import numpy as np
+import pytest
+
+from backend.services.near_duplicate_index import MAX_HAMMING_DISTANCE, NearDuplicateIndex, simhash
+
+FINGERPRINT_COUNT = 1_000_000
+ORGANIZATION_COUNT = 100
+QUERY_COUNT = 200
+
+VOCABULARY = (
+    "pressure washing driveway patio roof soft wash deck fence siding gutter "
+    "clean fresh spring summer special discount book today call now free quote "
+    "family owned local business customer happy results before after amazing"
+).split()
+
+
+def popcount(values: np.ndarray) -> np.ndarray:
+    """Bits set per uint64"""
+    return np.unpackbits(values.view(np.uint8)).reshape(-1, 64).sum(axis=1)
+
+
+def brute_force(fingerprints: np.ndarray, probe: int) -> set:
+    distances = popcount(fingerprints ^ np.uint64(probe))
+    return set(np.nonzero(distances <= MAX_HAMMING_DISTANCE)[0].tolist())
+
+
+def run_lookups(fingerprints: np.ndarray, organizations: np.ndarray, probes, probe_org: int):
+    """Build an index and time every probe against probe_org; returns timings and agreement"""
+    index = NearDuplicateIndex()
+    start = time.perf_counter()
+    for item_id, (fingerprint, organization) in enumerate(zip(fingerprints.tolist(), organizations.tolist())):
+        index.add(item_id, "", organization, fingerprint=fingerprint)
+    build_seconds = time.perf_counter() - start
+
+    lookup_us, results = [], []
+    for probe in probes:
+        start = time.perf_counter()
+        matches = index.find_near_duplicates("", probe_org, fingerprint=probe)
+        lookup_us.append((time.perf_counter() - start) * 1e6)
+        results.append({match.item_id for match in matches})
+
+    in_org = np.nonzero(organizations == probe_org)[0]
+    scan_us, agree = [], True
+    for probe, result in zip(probes[:20], results):
+        start = time.perf_counter()
+        expected = set(in_org[list(brute_force(fingerprints[in_org], probe))].tolist())
+        scan_us.append((time.perf_counter() - start) * 1e6)
+        agree = agree and expected == result
+    found = sum(1 for matches in results if matches)
+    return build_seconds, lookup_us, scan_us, agree, found
+
+
+@pytest.mark.performance
+@pytest.mark.slow
+class TestNearDuplicateBenchmark:
+    """Compare banded lookups with a full scan"""
+
+    def test_banded_lookup_vs_full_scan(self):
+        rng = random.Random(11)
+        posts = [" ".join(rng.choice(VOCABULARY) for _ in range(rng.randint(20, 40))) for _ in range(QUERY_COUNT)]
+
+        start = time.perf_counter()
+        probes = [simhash(post) for post in posts]
+        simhash_us = (time.perf_counter() - start) * 1e6 / QUERY_COUNT
+
+        np_rng = np.random.default_rng(11)
+        fingerprints = np_rng.integers(0, 2**64, size=FINGERPRINT_COUNT, dtype=np.uint64, endpoint=False)
+        spread = np.arange(FINGERPRINT_COUNT) % ORGANIZATION_COUNT
+        # Plant near-duplicates of half the probes, at distances 0..MAX_HAMMING_DISTANCE, in organization 0
+        slots = iter(np_rng.choice(
+            np.nonzero(spread == 0)[0], size=QUERY_COUNT * (MAX_HAMMING_DISTANCE + 1) // 2, replace=False
+        ))
+        for probe in probes[::2]:
+            for distance in range(MAX_HAMMING_DISTANCE + 1):
+                planted = probe
+                for bit in rng.sample(range(64), distance):
+                    planted ^= 1 << bit
+                fingerprints[next(slots)] = planted
+
+        print(f"\n{FINGERPRINT_COUNT} fingerprints, threshold {MAX_HAMMING_DISTANCE} bits, simhash {simhash_us:.1f}us/post")
+        for label, organizations in (
+            (f"{ORGANIZATION_COUNT} organizations", spread),
+            ("one organization", np.zeros(FINGERPRINT_COUNT, dtype=np.int64)),
+        ):
+            build_seconds, lookup_us, scan_us, agree, found = run_lookups(fingerprints, organizations, probes, 0)
+            print(
+                f"  {label}: build {build_seconds:.1f}s"
+                f"\n    banded lookup:   p50 {statistics.median(lookup_us):8.1f}us  max {max(lookup_us):8.1f}us"
+                f"\n    NumPy full scan: p50 {statistics.median(scan_us):8.1f}us"
+                f"\n    probes with near-duplicates: {found}/{QUERY_COUNT}"
+            )
+
+            assert agree
+            assert found >= QUERY_COUNT // 2
+            assert statistics.median(lookup_us) < statistics.median(scan_us)
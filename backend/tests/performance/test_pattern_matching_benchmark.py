@@ -0,0 +1,151 @@
+"""
+Benchmark: single-scan pattern matching vs per-pattern regex loops
+
+Runs 10k synthetic posts through the moderation, content safety and avoid
+list rule sets, once with the previous per-pattern loops (re.findall /
+re.search over every rule for every post) and once with the shared
+MultiPatternMatcher, and checks that both agree.
+
+Run with: pytest backend/tests/performance/test_pattern_matching_benchmark.py -s
+"""
+import random
+import re
+import time
+
+import pytest
+
+from backend.services.avoid_list_processor import AvoidListProcessor
+from backend.services.content_moderation_service import (
+    MODERATION_PATTERNS,
+    NSFW_EXPLICIT_TERMS,
+    NSFW_SUGGESTIVE_COMBINATIONS,
+    _build_moderation_rules,
+)
+from backend.services.multi_pattern_matcher import MultiPatternMatcher, PatternRule
+
+POST_COUNT = 10_000
+
+PROFANITY_PATTERNS = [
+    r'\b(damn|hell|crap)\b',
+    r'\b(stupid|dumb|idiot)\b',
+]
+
+VOCABULARY = (
+    "pressure washing driveway patio roof soft wash deck fence siding gutter "
+    "clean fresh spring summer special discount book today call now free quote "
+    "family owned local business customer happy results before after amazing "
+    "the a and with for your our this that is are we you to of in on at"
+).split()
+
+RISKY_WORDS = [
+    "gun", "knife", "sexy", "hot", "woman", "dress", "tight", "bedroom", "scene",
+    "drunk", "beer", "fake", "news", "hoax", "nike", "star", "wars", "damn",
+    "stupid", "blurry", "watermark", "explicit", "content", "violence", "hate",
+]
+
+
+def make_posts(count: int, seed: int = 42):
+    """Generate social posts with a sprinkling of risky terms"""
+    rng = random.Random(seed)
+    posts = []
+    for _ in range(count):
+        words = [rng.choice(VOCABULARY) for _ in range(rng.randint(20, 50))]
+        for _ in range(rng.randint(0, 3)):
+            words.insert(rng.randrange(len(words)), rng.choice(RISKY_WORDS))
+        text = " ".join(words)
+        if rng.random() < 0.3:
+            text = text.capitalize() + "!"
+        posts.append(text)
+    return posts
+
+
+def legacy_scan(text, avoid_rules, avoid_patterns):
+    """The per-pattern loops the services used before the shared engine"""
+    hits = {}
+    content_lower = text.lower()
+
+    # ContentModerationService._pattern_matching
+    for category, patterns in MODERATION_PATTERNS.items():
+        for index, pattern in enumerate(patterns):
+            matches = re.findall(pattern, content_lower)
+            if matches:
+                hits[f"{category}:{index}"] = len(matches)
+
+    # ContentModerationService._nsfw_text_detection
+    for index, term in enumerate(NSFW_EXPLICIT_TERMS):
+        if term in content_lower:
+            hits[f"nsfw_term:{index}"] = 1
+    for index, (pattern, _) in enumerate(NSFW_SUGGESTIVE_COMBINATIONS):
+        if re.search(pattern, content_lower):
+            hits[f"nsfw_context:{index}"] = 1
+
+    # ContentSafetyService._check_custom_filters
+    for pattern in PROFANITY_PATTERNS:
+        if re.search(pattern, content_lower, re.IGNORECASE):
+            hits[f"profanity:{pattern}"] = 1
+
+    # AvoidListProcessor.process_content (default rules)
+    for index, rule in enumerate(avoid_rules):
+        matches = avoid_patterns[rule.pattern].findall(text)
+        if matches:
+            hits[f"avoid:{index}"] = len(matches)
+
+    return hits
+
+
+def engine_scan(text, matcher):
+    """Same information from one scan of the shared engine"""
+    hits = {}
+    for hit in matcher.scan(text):
+        if hit.rule_id.startswith(("nsfw_term:", "nsfw_context:", "profanity:")):
+            hits[hit.rule_id] = 1
+        else:
+            hits[hit.rule_id] = hits.get(hit.rule_id, 0) + 1
+    return hits
+
+
+@pytest.mark.performance
+@pytest.mark.slow
+class TestPatternMatchingBenchmark:
+    """Compare legacy loops with the single-scan engine over 10k posts"""
+
+    def test_single_scan_engine_vs_legacy_loops(self):
+        posts = make_posts(POST_COUNT)
+
+        processor = AvoidListProcessor()
+        avoid_rules = processor.rules
+        avoid_patterns = processor.compiled_patterns
+
+        rules = _build_moderation_rules()
+        rules += [
+            PatternRule(rule_id=f"profanity:{pattern}", category="profanity", pattern=pattern)
+            for pattern in PROFANITY_PATTERNS
+        ]
+        rules += [
+            PatternRule(rule_id=f"avoid:{index}", category=rule.category.value, pattern=rule.pattern)
+            for index, rule in enumerate(avoid_rules)
+        ]
+
+        compile_start = time.perf_counter()
+        matcher = MultiPatternMatcher(rules)
+        compile_ms = (time.perf_counter() - compile_start) * 1000
+
+        start = time.perf_counter()
+        legacy_results = [legacy_scan(post, avoid_rules, avoid_patterns) for post in posts]
+        legacy_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        engine_results = [engine_scan(post, matcher) for post in posts]
+        engine_seconds = time.perf_counter() - start
+
+        print(
+            f"\n{POST_COUNT} posts, {len(rules)} rules ({matcher.get_stats()}), compile {compile_ms:.1f}ms"
+            f"\n  legacy per-pattern loops: {legacy_seconds * 1000:8.1f}ms "
+            f"({legacy_seconds / POST_COUNT * 1e6:6.1f}us/post)"
+            f"\n  single-scan engine:       {engine_seconds * 1000:8.1f}ms "
+            f"({engine_seconds / POST_COUNT * 1e6:6.1f}us/post)"
+            f"\n  speedup: {legacy_seconds / engine_seconds:.1f}x"
+        )
+
+        assert engine_results == legacy_results
+        assert engine_seconds < legacy_seconds
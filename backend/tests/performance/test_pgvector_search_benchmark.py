@@ -0,0 +1,147 @@
+"""
+Benchmark: threshold-in-WHERE exact scans vs HNSW top-k pgvector search
+
+Seeds a local Postgres with 1M random vectors spread over 20 users, then
+runs the same per-user top-10 searches with the old query (similarity
+threshold in the WHERE clause, which rules out the ANN index) and through
+PgVectorService (ORDER BY distance LIMIT k on the halfvec HNSW index,
+threshold applied afterwards). Reports p50/p95 latency for both and the
+HNSW results' recall@10 against the exact answer.
+
+Needs Postgres with pgvector 0.7+; seeding and the index build take a few
+minutes the first time and are reused afterwards (drop the
+pgvector_benchmark schema to reseed).
+
+Run with: PGVECTOR_BENCHMARK_URL=postgresql://localhost/bench pytest backend/tests/performance/test_pgvector_search_benchmark.py -s
+"""
+import os
+import random
+import statistics
+import time
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+BENCHMARK_URL = os.getenv("PGVECTOR_BENCHMARK_URL")
+ROW_COUNT = int(os.getenv("PGVECTOR_BENCHMARK_ROWS", "1000000"))
+DIMENSIONS = int(os.getenv("PGVECTOR_BENCHMARK_DIMENSIONS", "256"))
+USER_COUNT = 20
+QUERY_COUNT = 50
+TOP_K = 10
+SEED_BATCH = 50_000
+SCHEMA = "pgvector_benchmark"
+
+pytestmark = pytest.mark.skipif(not BENCHMARK_URL, reason="PGVECTOR_BENCHMARK_URL not set")
+
+LEGACY_QUERY = text("""
+    SELECT id, 1 - (embedding <=> CAST(:query_embedding AS vector)) as similarity
+    FROM content_embeddings
+    WHERE user_id = :user_id
+        AND 1 - (embedding <=> CAST(:query_embedding AS vector)) > :threshold
+    ORDER BY embedding <=> CAST(:query_embedding AS vector)
+    LIMIT :limit
+""")
+
+
+def seed(session) -> None:
+    session.execute(text("CREATE EXTENSION IF NOT EXISTS vector"))
+    session.execute(text(f"CREATE SCHEMA IF NOT EXISTS {SCHEMA}"))
+    session.execute(text(f"SET search_path TO {SCHEMA}, public"))
+    for table, columns in (
+        ("content_embeddings", "content_id INTEGER, content_text TEXT"),
+        ("memory_embeddings", "title TEXT, content TEXT, memory_type TEXT"),
+    ):
+        session.execute(text(f"""
+            CREATE TABLE IF NOT EXISTS {table} (
+                id SERIAL PRIMARY KEY, user_id INTEGER NOT NULL, {columns},
+                embedding vector({DIMENSIONS}) NOT NULL, metadata JSON,
+                embedding_model TEXT, created_at TIMESTAMPTZ DEFAULT NOW()
+            )
+        """))
+    session.execute(text("CREATE INDEX IF NOT EXISTS ix_content_embeddings_user_id ON content_embeddings (user_id)"))
+    session.commit()
+
+    existing = session.execute(text("SELECT COUNT(*) FROM content_embeddings")).scalar()
+    for start in range(existing, ROW_COUNT, SEED_BATCH):
+        session.execute(text(f"""
+            INSERT INTO content_embeddings (user_id, content_id, content_text, embedding, metadata, embedding_model)
+            SELECT i % {USER_COUNT}, i, 'post ' || i,
+                (SELECT array_agg(random() - 0.5) FROM generate_series(1, {DIMENSIONS}) WHERE i > 0)::vector,
+                json_build_object('performance_metrics', json_build_object('engagement_rate', random() * 5)),
+                'benchmark'
+            FROM generate_series(:start, :end) AS i
+        """), {"start": start, "end": min(start + SEED_BATCH, ROW_COUNT) - 1})
+        session.commit()
+    session.execute(text("ANALYZE content_embeddings"))
+    session.commit()
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+@pytest.fixture(scope="module")
+def session():
+    engine = create_engine(BENCHMARK_URL)
+    db = sessionmaker(bind=engine)()
+    seed(db)
+    yield db
+    db.close()
+    engine.dispose()
+
+
+@pytest.mark.performance
+@pytest.mark.slow
+class TestPgVectorSearchBenchmark:
+    """Compare exact threshold scans with HNSW top-k searches"""
+
+    def test_hnsw_search_latency_and_recall(self, session):
+        from backend.services.pgvector_service import PgVectorService
+
+        service = PgVectorService(session)
+        service.embedding_dimensions = DIMENSIONS
+        session.execute(text(f"SET search_path TO {SCHEMA}, public"))
+        start = time.perf_counter()
+        service.ensure_vector_indexes()
+        index_seconds = time.perf_counter() - start
+        session.execute(text(f"SET search_path TO {SCHEMA}, public"))
+
+        rng = random.Random(7)
+        queries = [
+            (rng.randrange(USER_COUNT), [rng.random() - 0.5 for _ in range(DIMENSIONS)])
+            for _ in range(QUERY_COUNT)
+        ]
+
+        legacy_ms, hnsw_ms, recalls = [], [], []
+        for user_id, vector in queries:
+            start = time.perf_counter()
+            exact = session.execute(LEGACY_QUERY, {
+                "user_id": user_id, "query_embedding": vector, "threshold": -1.0, "limit": TOP_K
+            }).fetchall()
+            legacy_ms.append((time.perf_counter() - start) * 1000)
+            session.commit()
+
+            service.get_embedding = lambda query_text, vector=vector: vector
+            start = time.perf_counter()
+            approximate = service.similarity_search_content(
+                user_id, "benchmark", limit=TOP_K, similarity_threshold=-1.0
+            )
+            hnsw_ms.append((time.perf_counter() - start) * 1000)
+            session.commit()
+            session.execute(text(f"SET search_path TO {SCHEMA}, public"))
+
+            exact_ids = {row.id for row in exact}
+            recalls.append(len(exact_ids & {row["id"] for row in approximate}) / len(exact_ids))
+
+        print(
+            f"\n{ROW_COUNT} vectors x {DIMENSIONS} dims, {USER_COUNT} users, top-{TOP_K}, {QUERY_COUNT} queries"
+            f"\n  HNSW index ready in {index_seconds:.1f}s"
+            f"\n  threshold in WHERE (exact): p50 {statistics.median(legacy_ms):8.1f}ms  p95 {percentile(legacy_ms, 0.95):8.1f}ms"
+            f"\n  ORDER BY distance LIMIT k:  p50 {statistics.median(hnsw_ms):8.1f}ms  p95 {percentile(hnsw_ms, 0.95):8.1f}ms"
+            f"\n  recall@{TOP_K}: mean {statistics.mean(recalls):.3f}, min {min(recalls):.2f}"
+        )
+
+        assert statistics.median(hnsw_ms) < statistics.median(legacy_ms)
+        assert statistics.mean(recalls) >= 0.9
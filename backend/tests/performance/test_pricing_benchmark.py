@@ -0,0 +1,140 @@
+"""
+Benchmark: batch pricing with cached compiled rules vs per-quote rule lookups
+
+Prices 2k leads across 20 organizations, once the old way (query the active
+pricing rule and re-read its JSON for every quote) and once through
+PricingService.compute_quotes with the per-org compiled rule cache, and
+checks that both produce the same quotes.
+
+Run with: pytest backend/tests/performance/test_pricing_benchmark.py -s
+"""
+import random
+import time
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+from unittest.mock import Mock
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from backend.db.models import PricingRule
+from backend.db.multi_tenant_models import Organization
+from backend.services.pricing_service import (
+    CompiledPricingRule,
+    PricingQuoteRequest,
+    PricingRuleCache,
+    PricingService,
+)
+from backend.services.settings_resolver import PricingSettings
+
+QUOTE_COUNT = 2_000
+ORG_COUNT = 20
+RULES_PER_ORG = 3
+NOW = datetime.now(timezone.utc)
+
+SURFACES = ["driveway", "deck", "siding", "roof", "patio", "fence"]
+SERVICES = ["pressure_wash", "soft_wash", "gutter_cleaning"]
+
+
+def make_rule(org_id: str, index: int) -> PricingRule:
+    return PricingRule(
+        organization_id=org_id,
+        name=f"Rule {index}",
+        currency="USD",
+        min_job_total=Decimal("150.00"),
+        base_rates={
+            "pressure_wash": {"surfaces": {"driveway": 0.15, "deck": 0.12, "patio": 0.14, "fence": 0.2}},
+            "soft_wash": {"surfaces": {"roof": 0.25, "siding": 0.18}},
+            "gutter_cleaning": {"flat_rate": 120}
+        },
+        bundles=[{"name": "Exterior", "services": ["pressure_wash", "soft_wash"],
+                  "discount_type": "percentage", "discount_value": 15}],
+        seasonal_modifiers={"6": 10, "12": -20, "summer": 15, "winter": -25},
+        travel_settings={"free_radius_miles": 10, "rate_per_mile": 2.5, "minimum_fee": 25},
+        additional_services={"window_cleaning": {"price": 75, "description": "Windows"}},
+        business_rules={
+            "tax_rate": 8.25,
+            "rush_fee": {"enabled": True, "type": "percentage", "value": 25},
+            "customer_tiers": {"premium": {"discount_percent": 10}}
+        },
+        is_active=True,
+        priority=index,
+        version=1,
+        created_by_id=1,
+        effective_date=datetime.now(timezone.utc) - timedelta(days=1)
+    )
+
+
+def make_requests(count: int, seed: int = 42):
+    """Generate lead quote requests spread across organizations"""
+    rng = random.Random(seed)
+    return [
+        PricingQuoteRequest(
+            organization_id=f"org-{rng.randrange(ORG_COUNT)}",
+            service_types=rng.sample(SERVICES, rng.randint(1, 3)),
+            surfaces={s: {"area": rng.randint(100, 3000)} for s in rng.sample(SURFACES, rng.randint(1, 4))},
+            location={"distance_miles": rng.uniform(0, 40)},
+            preferred_date=date(2026, rng.randint(1, 12), 15),
+            additional_services=["window_cleaning"] if rng.random() < 0.3 else [],
+            customer_tier=rng.choice(["standard", "premium"]),
+            rush_job=rng.random() < 0.1
+        )
+        for _ in range(count)
+    ]
+
+
+def legacy_quote(service, request, db):
+    """Per-quote rule query and settings lookup, rule JSON parsed every time"""
+    rule = service._get_active_pricing_rule(request.organization_id, db)
+    tax_rate = service._get_settings_tax_rate(request.organization_id, 1)
+    return CompiledPricingRule(rule).price(request, tax_rate, now=NOW)
+
+
+@pytest.mark.performance
+@pytest.mark.slow
+class TestPricingBenchmark:
+    """Compare per-quote lookups with cached batch pricing"""
+
+    def test_batch_compiled_pricing_vs_per_quote_lookups(self):
+        engine = create_engine("sqlite://")
+        Organization.__table__.create(engine)
+        PricingRule.__table__.create(engine)
+        db = sessionmaker(bind=engine)()
+        for org_index in range(ORG_COUNT):
+            org_id = f"org-{org_index}"
+            db.add(Organization(id=org_id, name=org_id, slug=org_id, owner_id=1))
+            db.add_all([make_rule(org_id, index) for index in range(RULES_PER_ORG)])
+        db.commit()
+
+        resolver = Mock()
+        resolver.get_namespace_settings.return_value = PricingSettings()
+        service = PricingService(resolver, rule_cache=PricingRuleCache())
+        requests = make_requests(QUOTE_COUNT)
+
+        start = time.perf_counter()
+        legacy_quotes = [legacy_quote(service, request, db) for request in requests]
+        legacy_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        cold_quotes = service.compute_quotes(requests, db, user_id=1)
+        cold_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        service.compute_quotes(requests, db, user_id=1)
+        warm_seconds = time.perf_counter() - start
+
+        print(
+            f"\n{QUOTE_COUNT} quotes across {ORG_COUNT} orgs ({RULES_PER_ORG} rules each)"
+            f"\n  per-quote lookups:     {legacy_seconds * 1000:8.1f}ms ({QUOTE_COUNT / legacy_seconds:8.0f} quotes/s)"
+            f"\n  batch, cold cache:     {cold_seconds * 1000:8.1f}ms ({QUOTE_COUNT / cold_seconds:8.0f} quotes/s)"
+            f"\n  batch, warm cache:     {warm_seconds * 1000:8.1f}ms ({QUOTE_COUNT / warm_seconds:8.0f} quotes/s)"
+            f"\n  speedup (warm): {legacy_seconds / warm_seconds:.1f}x"
+        )
+
+        for legacy, batched in zip(legacy_quotes, cold_quotes):
+            assert batched.applied_rules == legacy.applied_rules == [f"Rule {RULES_PER_ORG - 1}"]
+            assert batched.total == legacy.total
+            assert batched.breakdown == legacy.breakdown
+        assert warm_seconds < legacy_seconds
+        db.close()
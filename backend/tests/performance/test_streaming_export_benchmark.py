@@ -0,0 +1,151 @@
+"""
+Benchmark: in-memory export vs streamed ZIP export in DataExportService
+
+Exports a synthetic user with 1,000,000 metric rows from a file-backed
+SQLite database through stream_user_data while a sampler thread tracks the
+process's resident set size, then runs the legacy path (export_user_data
+plus json.dumps of the whole document, as the download endpoint used to do)
+on a 100,000-row user for comparison. Streaming memory should stay flat as
+the row count grows; the legacy path grows with it.
+
+Run with: pytest backend/tests/performance/test_streaming_export_benchmark.py -s
+"""
+import gc
+import json
+import os
+import threading
+import time
+import uuid
+import zipfile
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.schema import CreateTable
+
+from backend.api.data_export import DataExportRequest, DataExportService
+from backend.db.models import (
+    Content, ContentLog, Goal, Memory, Metric, Notification, SocialConnection, User, WorkflowExecution
+)
+
+STREAMED_ROWS = 1_000_000
+LEGACY_ROWS = 100_000
+INSERT_BATCH = 50_000
+PAGE_SIZE = os.sysconf("SC_PAGE_SIZE")
+
+pytestmark = pytest.mark.skipif(not os.path.exists("/proc/self/statm"), reason="needs /proc to sample RSS")
+
+
+class PeakRss:
+    """Samples this process's RSS in the background and keeps the peak"""
+
+    def __init__(self, interval=0.005):
+        self.interval = interval
+        self.peak = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._sample, daemon=True)
+
+    @staticmethod
+    def current():
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * PAGE_SIZE
+
+    def _sample(self):
+        while not self._stop.is_set():
+            self.peak = max(self.peak, self.current())
+            time.sleep(self.interval)
+
+    def __enter__(self):
+        gc.collect()
+        self.baseline = self.peak = self.current()
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+        self.peak = max(self.peak, self.current())
+
+    @property
+    def growth_mb(self):
+        return (self.peak - self.baseline) / 1024 / 1024
+
+
+def synthetic_user(db, rows):
+    user_id = db.execute(insert(User.__table__).values(
+        public_id=uuid.uuid4(), email=f"{uuid.uuid4().hex}@example.com", username=uuid.uuid4().hex
+    )).inserted_primary_key[0]
+    for start in range(0, rows, INSERT_BATCH):
+        db.execute(insert(Metric.__table__), [
+            {"user_id": user_id, "metric_type": "engagement", "platform": "instagram", "value": index * 0.5,
+             "metric_metadata": {"post_id": f"post_{index}", "likes": index % 977, "comments": index % 53}}
+            for index in range(start, min(start + INSERT_BATCH, rows))
+        ])
+        db.commit()
+    # Lazy-loaded relationships are provided directly (see test_streaming_data_export)
+    return SimpleNamespace(
+        id=user_id, public_id=uuid.uuid4(), email="synthetic@example.com", username="synthetic",
+        full_name=None, is_active=True, is_verified=True, tier="pro", auth_provider="local",
+        two_factor_enabled=False, email_verified=True, subscription_status="active",
+        subscription_end_date=None, created_at=None, updated_at=None, user_settings=None, plan=None,
+        organization_roles=[], owned_organizations=[], teams=[], sent_invitations=[], received_invitations=[]
+    )
+
+
+@pytest.fixture(scope="module")
+def db(tmp_path_factory):
+    engine = create_engine(f"sqlite:///{tmp_path_factory.mktemp('export') / 'export.db'}")
+    with engine.begin() as connection:
+        for model in (User, Metric, ContentLog, Content, Memory, SocialConnection, WorkflowExecution, Goal,
+                      Notification):
+            connection.execute(CreateTable(model.__table__))
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+    engine.dispose()
+
+
+@pytest.mark.performance
+@pytest.mark.slow
+def test_streamed_export_memory_is_flat(db, tmp_path):
+    large_user = synthetic_user(db, STREAMED_ROWS)
+    small_user = synthetic_user(db, LEGACY_ROWS)
+    request = DataExportRequest(format="json")
+    archive_path = tmp_path / "export.zip"
+
+    # Streamed first, so the legacy run's freed heap cannot flatter it
+    with PeakRss() as streamed_rss:
+        start = time.perf_counter()
+        with open(archive_path, "wb") as archive_file:
+            for chunk in DataExportService(db).stream_user_data(large_user, request):
+                archive_file.write(chunk)
+        streamed_seconds = time.perf_counter() - start
+
+    db.expunge_all()
+    gc.collect()
+
+    with PeakRss() as legacy_rss:
+        start = time.perf_counter()
+        legacy_body = json.dumps(
+            DataExportService(db).export_user_data(small_user, request), indent=2, default=str
+        ).encode("utf-8")
+        legacy_seconds = time.perf_counter() - start
+    legacy_bytes = len(legacy_body)
+    del legacy_body
+
+    with zipfile.ZipFile(archive_path) as archive:
+        metrics = archive.getinfo("metrics.ndjson")
+        with archive.open(metrics) as entry:
+            streamed_lines = sum(1 for _ in entry)
+
+    print(f"\nLegacy in-memory export, {LEGACY_ROWS:,} rows: {legacy_seconds:.1f}s, "
+          f"{legacy_bytes / 1024 / 1024:.0f} MB body, peak RSS +{legacy_rss.growth_mb:.0f} MB")
+    print(f"Streamed ZIP export, {STREAMED_ROWS:,} rows: {streamed_seconds:.1f}s, "
+          f"{archive_path.stat().st_size / 1024 / 1024:.0f} MB archive "
+          f"({metrics.file_size / 1024 / 1024:.0f} MB uncompressed), peak RSS +{streamed_rss.growth_mb:.0f} MB")
+
+    assert streamed_lines == STREAMED_ROWS
+    # Ten times the rows in a fraction of the memory, and bounded in absolute terms
+    assert streamed_rss.growth_mb < legacy_rss.growth_mb / 2
+    assert streamed_rss.growth_mb < 64
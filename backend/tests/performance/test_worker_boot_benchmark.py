@@ -0,0 +1,52 @@
+"""
+Benchmark: per-child boot cost with and without main-process preloading
+
+Boots a simulated Celery worker in a fresh interpreter for each queue set
+(task modules imported, as the worker's main process does), forks one
+child, and has the child load what its first tasks need and run a full
+garbage collection. Without preloading every prefork child (and every
+replacement after worker_max_tasks_per_child) configures the mappers and
+imports the queue's heavy services itself, and the collector dirties the
+inherited heap; with worker_boot's preload and gc.freeze the child starts
+with that state shared copy-on-write.
+
+Run with: pytest backend/tests/performance/test_worker_boot_benchmark.py -s
+"""
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+QUEUE_SETS = ["webhooks", "research", "posting,autonomous"]
+
+pytestmark = pytest.mark.skipif(
+    not os.path.exists("/proc/self/smaps_rollup") or not hasattr(os, "fork"),
+    reason="needs fork and /proc smaps_rollup"
+)
+
+
+def boot(queues, preload):
+    command = [sys.executable, "-m", "backend.tasks.worker_boot", "--measure", queues]
+    result = subprocess.run(command + ([] if preload else ["--no-preload"]),
+                            capture_output=True, text=True, check=True)
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+@pytest.mark.performance
+@pytest.mark.slow
+def test_preloaded_children_share_boot_state():
+    print(f"\n{'queues':<20} {'mode':<11} {'main boot':>10} {'child first use':>16} {'child private':>14}")
+    for queues in QUEUE_SETS:
+        legacy = boot(queues, preload=False)
+        preloaded = boot(queues, preload=True)
+        for mode, report in (("no preload", legacy), ("preloaded", preloaded)):
+            print(f"{queues:<20} {mode:<11} {report['main']['boot_seconds']:>9.2f}s "
+                  f"{report['child']['first_use_seconds']:>15.2f}s "
+                  f"{report['child']['private_bytes'] / 1048576:>11.1f} MB")
+
+        # The work moves to the main process, paid once instead of per child
+        assert preloaded["child"]["first_use_seconds"] < legacy["child"]["first_use_seconds"] / 5
+        assert preloaded["child"]["private_bytes"] < legacy["child"]["private_bytes"] / 5
+        assert "models" in preloaded["main"]["preloaded"]
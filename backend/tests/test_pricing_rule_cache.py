@@ -0,0 +1,244 @@
+"""
+Unit tests for compiled pricing rules, the per-org rule cache, batch quoting
+and per-org quote number sequences
+"""
+
+import time
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+from unittest.mock import Mock
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from backend.db.models import PricingRule, Quote, QuoteNumberSequence
+from backend.db.multi_tenant_models import Organization
+from backend.services.pricing_service import (
+    CompiledPricingRule,
+    PricingQuote,
+    PricingQuoteRequest,
+    PricingRuleCache,
+    PricingService,
+    get_pricing_rule_cache,
+    set_pricing_rule_cache,
+)
+from backend.services.quote_service import QuoteService
+from backend.services.settings_resolver import PricingSettings
+
+
+def rule_config(**overrides):
+    config = dict(
+        currency="USD",
+        min_job_total=Decimal("150.00"),
+        base_rates={
+            "pressure_wash": {"surfaces": {"driveway": 0.15, "deck": 0.12}},
+            "soft_wash": {"surfaces": {"roof": 0.25}},
+            "gutter_cleaning": {"flat_rate": 120}
+        },
+        bundles=[{
+            "name": "Complete Exterior",
+            "services": ["pressure_wash", "soft_wash"],
+            "discount_type": "percentage",
+            "discount_value": 15
+        }],
+        seasonal_modifiers={"6": 10, "summer": 15, "winter": -25},
+        travel_settings={"free_radius_miles": 10, "rate_per_mile": 2.50, "minimum_fee": 25.00},
+        additional_services={"window_cleaning": {"price": 75.00, "description": "Exterior windows"}},
+        business_rules={
+            "tax_rate": 8.25,
+            "quote_validity_days": 30,
+            "rush_fee": {"enabled": True, "type": "percentage", "value": 25},
+            "customer_tiers": {"premium": {"discount_percent": 10}}
+        },
+        is_active=True,
+        priority=0,
+        version=1,
+        created_by_id=1,
+        effective_date=datetime.now(timezone.utc) - timedelta(days=1)
+    )
+    config.update(overrides)
+    return config
+
+
+def full_request(org_id="org-1"):
+    return PricingQuoteRequest(
+        organization_id=org_id,
+        service_types=["pressure_wash", "soft_wash"],
+        surfaces={"driveway": {"area": 1000}, "roof": {"area": 1000}},
+        location={"distance_miles": 20.0},
+        preferred_date=date(2026, 6, 15),
+        additional_services=["window_cleaning", "unknown_service"],
+        customer_tier="premium",
+        rush_job=True
+    )
+
+
+@pytest.fixture
+def cache():
+    previous = get_pricing_rule_cache()
+    cache = PricingRuleCache()
+    set_pricing_rule_cache(cache)
+    yield cache
+    set_pricing_rule_cache(previous)
+
+
+@pytest.fixture
+def db(cache):
+    engine = create_engine("sqlite://")
+    for model in (Organization, PricingRule, Quote, QuoteNumberSequence):
+        model.__table__.create(engine)
+    session = sessionmaker(bind=engine)()
+    for org_id in ("org-1", "org-2"):
+        session.add(Organization(id=org_id, name=org_id, slug=org_id, owner_id=1))
+    session.commit()
+    session.statements = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def record(conn, cursor, statement, parameters, context, executemany):
+        session.statements.append(statement)
+
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def service(cache):
+    resolver = Mock()
+    resolver.get_namespace_settings.return_value = PricingSettings()
+    return PricingService(resolver)
+
+
+def pricing_rule_selects(db):
+    return [s for s in db.statements if s.startswith("SELECT") and "FROM pricing_rules" in s]
+
+
+class TestCompiledPricingRule:
+    def test_full_quote(self):
+        now = datetime(2026, 6, 1, 12, 0, tzinfo=timezone.utc)
+        quote = CompiledPricingRule(PricingRule(id=7, name="Standard", **rule_config())).price(full_request(), now=now)
+
+        # 150 + 250 base, minus 10% premium tier
+        assert quote.base_total == Decimal("360.00")
+        # Bundle/seasonal/rush were computed on the pre-tier base of 400
+        assert quote.bundle_discount == Decimal("-60.00")
+        assert quote.seasonal_modifier == Decimal("100.00")
+        assert quote.rush_fee == Decimal("100.00")
+        assert quote.travel_fee == Decimal("25.00")
+        assert quote.additional_services_total == Decimal("75.00")
+        assert quote.subtotal == Decimal("600.00")
+        assert quote.tax_amount == Decimal("49.50")
+        assert quote.total == Decimal("649.50")
+        assert quote.pricing_rule_id == 7
+        assert quote.valid_until == datetime(2026, 7, 1, 23, 59, 59, tzinfo=timezone.utc)
+        assert quote.warning_messages == ["Additional service not found: unknown_service"]
+        assert [item.get("month") or item.get("season") for item in quote.breakdown
+                if item["type"] == "seasonal_modifier"] == [6, "summer"]
+
+    def test_flat_rate_and_minimum_total(self):
+        request = PricingQuoteRequest(organization_id="org-1", service_types=["gutter_cleaning"], surfaces={})
+        quote = CompiledPricingRule(PricingRule(name="Standard", **rule_config())).price(
+            request, settings_tax_rate=Decimal("0")
+        )
+
+        assert quote.base_total == Decimal("120")
+        assert quote.total == Decimal("150.00")
+        assert quote.breakdown[-1]["type"] == "minimum_adjustment"
+
+    def test_step_methods_match_compiled_rule(self, service):
+        rule = PricingRule(name="Standard", **rule_config())
+        request = full_request()
+        stepwise = PricingQuote()
+        service._calculate_base_pricing(request, rule, stepwise)
+        service._apply_bundle_discounts(request, rule, stepwise)
+        service._apply_seasonal_modifiers(request, rule, stepwise)
+
+        compiled = CompiledPricingRule(rule)
+        quote = PricingQuote()
+        compiled.apply_base_pricing(request, quote)
+        compiled.apply_bundle_discounts(request, quote)
+        compiled.apply_seasonal_modifiers(request, quote)
+
+        assert stepwise.breakdown == quote.breakdown
+        assert stepwise.seasonal_modifier == quote.seasonal_modifier
+
+
+class TestBatchQuotes:
+    def test_one_rule_query_per_batch_then_cached(self, db, service):
+        db.add_all([PricingRule(organization_id=org_id, name="Standard", **rule_config())
+                    for org_id in ("org-1", "org-2")])
+        db.commit()
+        db.statements.clear()
+
+        requests = [full_request("org-1" if i % 2 else "org-2") for i in range(200)]
+        quotes = service.compute_quotes(requests, db, user_id=1)
+
+        assert len(quotes) == 200
+        assert all(quote.total == Decimal("649.50") for quote in quotes)
+        assert len(pricing_rule_selects(db)) == 1
+        assert service.settings_resolver.get_namespace_settings.call_count == 2
+
+        db.statements.clear()
+        service.compute_quotes(requests, db, user_id=1)
+        assert db.statements == []
+
+    def test_missing_rule_raises(self, db, service):
+        with pytest.raises(ValueError, match="No active pricing rules found for organization org-2"):
+            service.compute_quote(full_request("org-2"), db, user_id=1)
+
+    def test_highest_priority_effective_rule_wins(self, db, service, cache):
+        # Taken here, not at import: the scheduled rule must still be 30s away when the quote runs
+        now = datetime.now(timezone.utc)
+        db.add_all([
+            PricingRule(organization_id="org-1", name="Base", **rule_config()),
+            PricingRule(organization_id="org-1", name="Promo", **rule_config(priority=5)),
+            PricingRule(organization_id="org-1", name="Expired", **rule_config(
+                priority=9, expiry_date=now - timedelta(hours=1))),
+            PricingRule(organization_id="org-1", name="Scheduled", **rule_config(
+                priority=9, effective_date=now + timedelta(seconds=30))),
+        ])
+        db.commit()
+
+        quote = service.compute_quote(full_request(), db, user_id=1)
+
+        assert quote.applied_rules == ["Promo"]
+        # The cached entry must not outlive the scheduled rule's start
+        expires_at = cache._entries["org-1"][0]
+        assert expires_at - time.monotonic() <= 30
+
+    def test_committed_rule_change_invalidates_cache(self, db, service, cache):
+        rule = PricingRule(organization_id="org-1", name="Standard", **rule_config())
+        db.add(rule)
+        db.commit()
+        assert service.compute_quote(full_request(), db, user_id=1).applied_rules == ["Standard"]
+
+        rule.name = "Renamed"
+        db.flush()
+        db.rollback()
+        assert "org-1" in cache._entries
+
+        rule.name = "Renamed"
+        db.commit()
+        assert "org-1" not in cache._entries
+        assert service.compute_quote(full_request(), db, user_id=1).applied_rules == ["Renamed"]
+
+
+class TestQuoteNumberSequence:
+    def test_numbers_are_sequential_per_org(self, db):
+        quote_service = QuoteService(Mock())
+        period = datetime.now().strftime("%Y%m")
+
+        assert quote_service._generate_quote_number("org-1", db) == f"Q-{period}-0001"
+        assert quote_service._generate_quote_number("org-1", db) == f"Q-{period}-0002"
+        assert quote_service._generate_quote_number("org-2", db) == f"Q-{period}-0001"
+        assert quote_service._generate_quote_number("org-1", db) == f"Q-{period}-0003"
+
+    def test_rolled_back_number_is_reused(self, db):
+        quote_service = QuoteService(Mock())
+        first = quote_service._generate_quote_number("org-1", db)
+        db.commit()
+
+        quote_service._generate_quote_number("org-1", db)
+        db.rollback()
+
+        assert quote_service._generate_quote_number("org-1", db) == first[:-4] + "0002"
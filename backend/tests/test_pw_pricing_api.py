@@ -8,10 +8,13 @@ from decimal import Decimal
 from unittest.mock import Mock, patch
 import json
 
+from fastapi import HTTPException
 from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session
 
 from backend.api.pw_pricing import router
+from backend.auth.dependencies import get_current_active_user
+from backend.db.database import get_db
 from backend.db.models import User, Organization, PricingRule
 from backend.services.pricing_service import PricingQuote
 
@@ -158,6 +161,7 @@ class TestPricingAPIEndpoints:
         rule.id = 1
         rule.organization_id = "org-123"
         rule.name = "Test Pricing Rule"
+        rule.description = None
         rule.currency = "USD"
         rule.min_job_total = Decimal('150.00')
         rule.base_rates = {"pressure_wash": {"surfaces": {"driveway": 0.15}}}
@@ -178,17 +182,18 @@ class TestPricingAPIEndpoints:
         return rule
     
     @pytest.fixture
-    def mock_dependencies(self, mock_user, mock_organization):
+    def mock_dependencies(self, mock_app, mock_user, mock_organization):
         """Mock FastAPI dependencies"""
-        with patch('backend.api.pw_pricing.get_current_active_user') as mock_get_user, \
-             patch('backend.api.pw_pricing.get_db') as mock_get_db, \
-             patch('backend.api.pw_pricing.verify_organization_access') as mock_verify_org, \
+        mock_get_user = Mock(return_value=mock_user)
+        mock_get_db = Mock(return_value=Mock(spec=Session))
+        mock_app.dependency_overrides[get_current_active_user] = lambda: mock_get_user()
+        mock_app.dependency_overrides[get_db] = lambda: mock_get_db()
+        
+        with patch('backend.api.pw_pricing.verify_organization_access') as mock_verify_org, \
              patch('backend.api.pw_pricing.require_permission') as mock_require_perm:
             
-            mock_get_user.return_value = mock_user
-            mock_get_db.return_value = Mock(spec=Session)
             mock_verify_org.return_value = mock_organization
-            mock_require_perm.return_value = True
+            mock_require_perm.return_value = None
             
             yield {
                 'get_user': mock_get_user,
@@ -196,6 +201,8 @@ class TestPricingAPIEndpoints:
                 'verify_org': mock_verify_org,
                 'require_perm': mock_require_perm
             }
+        
+        mock_app.dependency_overrides.clear()
     
     def test_compute_quote_success(self, client, mock_dependencies):
         """Test successful quote computation"""
@@ -241,6 +248,61 @@ class TestPricingAPIEndpoints:
             assert len(data["breakdown"]) == 1
             assert len(data["applied_rules"]) == 1
     
+    def test_compute_quotes_batch_success(self, client, mock_dependencies):
+        """Test batch quote computation prices every lead in one service call"""
+        with patch('backend.api.pw_pricing.PricingService') as mock_service_class, \
+             patch('backend.api.pw_pricing.SettingsResolver'):
+            
+            mock_service = Mock()
+            mock_service_class.return_value = mock_service
+            
+            quotes = []
+            for total in (Decimal('460.00'), Decimal('920.00')):
+                quote = PricingQuote()
+                quote.base_total = total
+                quote.total = total
+                quote.currency = "USD"
+                quote.valid_until = datetime(2025, 7, 1, tzinfo=timezone.utc)
+                quotes.append(quote)
+            mock_service.compute_quotes.return_value = quotes
+            
+            request_data = {
+                "quotes": [
+                    {"service_types": ["pressure_wash"], "surfaces": {"driveway": {"area": 1000.0}}},
+                    {"service_types": ["pressure_wash"], "surfaces": {"driveway": {"area": 2000.0}},
+                     "rush_job": True}
+                ]
+            }
+            
+            response = client.post(
+                "/api/v1/pricing/quotes/batch",
+                json=request_data,
+                headers={"X-Organization-ID": "org-123"}
+            )
+            
+            assert response.status_code == 200
+            assert [quote["total"] for quote in response.json()] == [460.00, 920.00]
+            
+            mock_service.compute_quotes.assert_called_once()
+            pricing_requests = mock_service.compute_quotes.call_args.args[0]
+            assert [request.organization_id for request in pricing_requests] == ["org-123", "org-123"]
+            assert pricing_requests[1].surfaces["driveway"]["area"] == 2000.0
+            assert pricing_requests[1].rush_job is True
+            mock_dependencies['require_perm'].assert_called_once_with(
+                mock_dependencies['get_user'].return_value, "org-123", "pricing.quote",
+                mock_dependencies['get_db'].return_value
+            )
+    
+    def test_compute_quotes_batch_rejects_empty_batch(self, client, mock_dependencies):
+        """Test batch quote computation with no quotes"""
+        response = client.post(
+            "/api/v1/pricing/quotes/batch",
+            json={"quotes": []},
+            headers={"X-Organization-ID": "org-123"}
+        )
+        
+        assert response.status_code == 422
+    
     def test_compute_quote_missing_org_header(self, client, mock_dependencies):
         """Test quote computation without organization header"""
         request_data = {
@@ -424,34 +486,29 @@ class TestPricingAPIEndpoints:
         assert response.status_code == 404
         assert "Pricing rule not found" in response.json()["detail"]
     
-    def test_organization_access_verification(self, client, mock_user):
+    def test_organization_access_verification(self, client, mock_dependencies):
         """Test organization access verification"""
-        with patch('backend.api.pw_pricing.get_current_active_user') as mock_get_user, \
-             patch('backend.api.pw_pricing.get_db') as mock_get_db, \
-             patch('backend.api.pw_pricing.verify_organization_access') as mock_verify_org:
-            
-            mock_get_user.return_value = mock_user
-            mock_get_db.return_value = Mock(spec=Session)
-            mock_verify_org.side_effect = Exception("Organization not found")
-            
-            request_data = {
-                "service_types": ["pressure_wash"],
-                "surfaces": {"driveway": {"area": 1000.0}}
-            }
-            
-            response = client.post(
-                "/api/v1/pricing/quote",
-                json=request_data,
-                headers={"X-Organization-ID": "org-invalid"}
-            )
-            
-            # Should propagate the exception from verify_organization_access
-            assert response.status_code == 500
+        mock_dependencies['verify_org'].side_effect = HTTPException(status_code=404, detail="Organization not found")
+        
+        request_data = {
+            "service_types": ["pressure_wash"],
+            "surfaces": {"driveway": {"area": 1000.0}}
+        }
+        
+        response = client.post(
+            "/api/v1/pricing/quote",
+            json=request_data,
+            headers={"X-Organization-ID": "org-invalid"}
+        )
+        
+        # Should propagate the error from verify_organization_access
+        assert response.status_code == 404
+        assert response.json()["detail"] == "Organization not found"
     
     def test_permission_requirements(self, client, mock_dependencies):
         """Test RBAC permission requirements"""
         # Mock permission check to fail
-        mock_dependencies['require_perm'].side_effect = Exception("Insufficient permissions")
+        mock_dependencies['require_perm'].side_effect = HTTPException(status_code=403, detail="Insufficient permissions")
         
         request_data = {
             "service_types": ["pressure_wash"],
@@ -464,13 +521,26 @@ class TestPricingAPIEndpoints:
             headers={"X-Organization-ID": "org-123"}
         )
         
-        # Should propagate the permission exception
-        assert response.status_code == 500
+        # Should propagate the permission error
+        assert response.status_code == 403
+        mock_dependencies['require_perm'].assert_called_once_with(
+            mock_dependencies['get_user'].return_value, "org-123", "pricing.quote",
+            mock_dependencies['get_db'].return_value
+        )
 
 
 class TestPricingAPIHelpers:
     """Test pricing API helper functions"""
     
+    @pytest.fixture
+    def mock_user(self):
+        """Mock current user"""
+        user = Mock(spec=User)
+        user.id = 1
+        user.email = "test@example.com"
+        user.is_active = True
+        return user
+    
     def test_get_organization_id_header(self):
         """Test organization ID header extraction"""
         from backend.api.pw_pricing import get_organization_id
@@ -525,6 +595,21 @@ class TestPricingAPIHelpers:
             with pytest.raises(Exception):  # Should raise HTTPException
                 verify_organization_access("org-123", mock_user, mock_db)
 
+    
+    def test_require_permission_denied(self, mock_user):
+        """Test permission check when the user's role lacks the permission"""
+        from backend.api.pw_pricing import require_permission
+        
+        with patch('backend.api.pw_pricing.PermissionChecker') as mock_checker_class:
+            mock_checker_class.return_value.user_has_permission.return_value = False
+            
+            with pytest.raises(HTTPException) as exc_info:
+                require_permission(mock_user, "org-123", "pricing.quote", Mock(spec=Session))
+            
+            assert exc_info.value.status_code == 403
+            mock_checker_class.return_value.user_has_permission.assert_called_once_with(
+                mock_user, "pricing.quote", "org-123"
+            )
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
\ No newline at end of file
@@ -380,7 +380,8 @@ class TestQuoteService:
     def test_generate_quote_number_first(self, quote_service):
         """Test quote number generation for first quote"""
         db = Mock(spec=Session)
-        db.query.return_value.filter.return_value.order_by.return_value.first.return_value = None
+        db.get_bind.return_value.dialect.name = "postgresql"
+        db.execute.return_value.scalar_one.return_value = 1
         
         with patch('backend.services.quote_service.datetime') as mock_datetime:
             mock_datetime.now.return_value.strftime.return_value = "202506"
@@ -388,15 +389,14 @@ class TestQuoteService:
             quote_number = quote_service._generate_quote_number("org-123", db)
             
             assert quote_number == "Q-202506-0001"
+            db.query.assert_not_called()
     
     def test_generate_quote_number_increment(self, quote_service):
         """Test quote number generation with existing quotes"""
-        # Mock existing quote
-        mock_existing_quote = Mock(spec=Quote)
-        mock_existing_quote.quote_number = "Q-202506-0005"
-        
+        # Sequence already handed out 5 numbers this month
         db = Mock(spec=Session)
-        db.query.return_value.filter.return_value.order_by.return_value.first.return_value = mock_existing_quote
+        db.get_bind.return_value.dialect.name = "postgresql"
+        db.execute.return_value.scalar_one.return_value = 6
         
         with patch('backend.services.quote_service.datetime') as mock_datetime:
             mock_datetime.now.return_value.strftime.return_value = "202506"
@@ -0,0 +1,169 @@
+"""
+Unit tests for cell/day forecast caching and the deduplicated rescheduling sweep
+"""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock, patch
+
+import pytest
+
+from backend.services.job_rescheduler import GeocodeCache, JobRescheduler
+from backend.services.settings_resolver import WeatherSettings
+from backend.services.weather_service import (
+    ForecastCache,
+    MockWeatherProvider,
+    OpenWeatherMapProvider,
+    WeatherService,
+    forecast_cell,
+)
+
+
+ADDRESSES = {
+    "100 Peachtree St, Atlanta, GA": (33.7490, -84.3880),
+    "120 Peachtree St, Atlanta, GA": (33.7512, -84.3861),  # same cell
+    "1 Main St, Marietta, GA": (33.9526, -84.5499),
+}
+
+
+class SlowMockWeatherProvider(MockWeatherProvider):
+    """Mock provider that yields so concurrent callers overlap"""
+
+    async def get_forecast(self, latitude, longitude, days=3):
+        await asyncio.sleep(0.01)
+        return await super().get_forecast(latitude, longitude, days)
+
+
+class DictGeocodeStore:
+    """Stand-in for the Redis cache interface used by GeocodeCache"""
+
+    def __init__(self):
+        self.data = {}
+
+    async def get(self, platform, operation, resource_id=None, **kwargs):
+        return self.data.get((platform, operation, resource_id))
+
+    async def set(self, platform, operation, data, resource_id=None, ttl=None, **kwargs):
+        self.data[(platform, operation, resource_id)] = data
+        return True
+
+
+def make_rescheduler(provider, store=None):
+    rescheduler = JobRescheduler(
+        weather_service=WeatherService(provider=provider),
+        job_service=Mock(),
+        geocode_cache=GeocodeCache(store=store or DictGeocodeStore())
+    )
+    rescheduler.geocode_lookups = []
+
+    def lookup(address):
+        rescheduler.geocode_lookups.append(address)
+        return ADDRESSES[address]
+
+    rescheduler._lookup_coordinates = lookup
+    return rescheduler
+
+
+def make_jobs(org_id, addresses):
+    tomorrow = datetime.now(timezone.utc) + timedelta(days=1)
+    return [
+        Mock(id=f"{org_id}-job-{i}", organization_id=org_id, address=address,
+             scheduled_for=tomorrow, duration_minutes=120)
+        for i, address in enumerate(addresses)
+    ]
+
+
+class TestForecastCell:
+    def test_nearby_locations_share_a_cell(self):
+        atlanta = forecast_cell(*ADDRESSES["100 Peachtree St, Atlanta, GA"])
+
+        assert atlanta == forecast_cell(*ADDRESSES["120 Peachtree St, Atlanta, GA"])
+        assert atlanta == (33.75, -84.35)
+        assert atlanta != forecast_cell(*ADDRESSES["1 Main St, Marietta, GA"])
+
+
+class TestForecastCache:
+    @pytest.mark.asyncio
+    async def test_entries_expire_after_ttl(self):
+        cache = ForecastCache(ttl_seconds=60)
+        forecasts = await MockWeatherProvider().get_forecast(33.7, -84.4, 3)
+        cache.set((33.7, -84.4), 3, forecasts)
+
+        assert cache.get((33.7, -84.4), 3) == forecasts
+        assert cache.get((33.7, -84.4), 2) == forecasts[:2]
+        # Asking for more days than were fetched is a miss
+        assert cache.get((33.7, -84.4), 5) is None
+
+        with patch("backend.services.weather_service.time.monotonic", return_value=10 ** 9):
+            assert cache.get((33.7, -84.4), 3) is None
+
+    def test_ttl_follows_provider_update_interval(self):
+        service = WeatherService(provider=OpenWeatherMapProvider(api_key="key"))
+
+        assert service.forecast_cache.ttl_seconds == 3 * 3600
+
+
+class TestCellForecasts:
+    @pytest.mark.asyncio
+    async def test_one_provider_call_per_unique_cell(self):
+        provider = SlowMockWeatherProvider()
+        service = WeatherService(provider=provider)
+
+        forecasts = await service.get_forecasts_for_locations(ADDRESSES.values(), date_range=3)
+        await service.get_forecasts_for_locations(ADDRESSES.values(), date_range=3)
+
+        assert provider.call_count == 2
+        assert set(forecasts) == {(33.75, -84.35), (33.95, -84.55)}
+        assert all(len(days) == 3 for days in forecasts.values())
+
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_share_in_flight_fetch(self):
+        provider = SlowMockWeatherProvider()
+        service = WeatherService(provider=provider)
+
+        results = await asyncio.gather(*(service.get_cell_forecast(33.749, -84.388, 3) for _ in range(5)))
+
+        assert provider.call_count == 1
+        assert all(result == results[0] for result in results)
+
+    @pytest.mark.asyncio
+    async def test_empty_responses_are_not_cached(self):
+        service = WeatherService(provider=MockWeatherProvider())
+        service.provider.get_forecast = Mock(side_effect=RuntimeError("provider down"))
+
+        assert await service.get_cell_forecast(33.749, -84.388, 3) == []
+        assert service.forecast_cache.get((33.75, -84.35), 3) is None
+
+
+class TestReschedulingSweep:
+    @pytest.mark.asyncio
+    @patch("backend.services.job_rescheduler.get_weather_settings")
+    async def test_sweep_across_orgs_calls_provider_per_unique_location(self, mock_get_settings):
+        mock_get_settings.return_value = WeatherSettings(auto_reschedule=True, lookahead_days=3)
+        provider = MockWeatherProvider()
+        rescheduler = make_rescheduler(provider)
+        jobs_by_org = {
+            "org-1": make_jobs("org-1", list(ADDRESSES) * 3),
+            "org-2": make_jobs("org-2", ["100 Peachtree St, Atlanta, GA"] * 4),
+        }
+        rescheduler._get_upcoming_jobs = lambda organization_id, lookahead_days, db: jobs_by_org[organization_id]
+
+        for org_id in jobs_by_org:
+            results = await rescheduler.run_rescheduling_check(org_id, db=Mock())
+            assert results == []
+
+        assert provider.call_count == 2
+        assert sorted(rescheduler.geocode_lookups) == sorted(ADDRESSES)
+        rescheduler.job_service.reschedule_job.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_geocodes_persist_across_rescheduler_instances(self):
+        store = DictGeocodeStore()
+        first = make_rescheduler(MockWeatherProvider(), store=store)
+        await first._geocode_addresses(ADDRESSES)
+
+        second = make_rescheduler(MockWeatherProvider(), store=store)
+        locations = await second._geocode_addresses(ADDRESSES)
+
+        assert second.geocode_lookups == []
+        assert locations == ADDRESSES
@@ -0,0 +1,147 @@
+"""
+Unit tests for the cross-organization weather rescheduling sweep
+"""
+
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from backend.core.audit_logger import AuditLog
+from backend.db.models import Job
+from backend.db.multi_tenant_models import Organization
+from backend.services.job_rescheduler import GeocodeCache, JobRescheduler
+from backend.services.settings_resolver import get_weather_settings_bulk
+from backend.services.weather_service import (
+    MockWeatherProvider,
+    WeatherCondition,
+    WeatherForecast,
+    WeatherService,
+)
+
+
+OPEN_EVERY_DAY = {
+    day: {"start": "08:00", "end": "17:00"}
+    for day in ("monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday")
+}
+
+ADDRESSES = {
+    "100 Peachtree St, Atlanta, GA": (33.7490, -84.3880),
+    "120 Peachtree St, Atlanta, GA": (33.7512, -84.3861),
+    "1 Main St, Marietta, GA": (33.9526, -84.5499),
+}
+
+TODAY = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+def forecast(days_ahead, rain_probability):
+    return WeatherForecast(
+        date=TODAY + timedelta(days=days_ahead),
+        temperature_high_f=75.0,
+        temperature_low_f=50.0,
+        rain_probability=rain_probability,
+        condition=WeatherCondition.CLOUDY
+    )
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://")
+    for model in (Organization, Job, AuditLog):
+        model.__table__.create(engine)
+    session = sessionmaker(bind=engine)()
+    session.statements = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def record(conn, cursor, statement, parameters, context, executemany):
+        session.statements.append(statement.split()[0])
+
+    yield session
+    session.close()
+
+
+def add_org(db, org_id, **weather):
+    db.add(Organization(
+        id=org_id, name=org_id, slug=org_id, owner_id=1,
+        settings={"weather": {"business_hours": OPEN_EVERY_DAY, **weather}}
+    ))
+
+
+def add_job(db, org_id, job_id, address, days_ahead=1):
+    db.add(Job(
+        id=job_id, organization_id=org_id, service_type="house_wash", address=address,
+        scheduled_for=TODAY + timedelta(days=days_ahead, hours=10), duration_minutes=120,
+        status="scheduled", estimated_cost=Decimal("250.00"), created_by_id=1,
+        internal_notes="Gate code 1234" if job_id == "job-1" else None
+    ))
+
+
+def make_rescheduler(provider):
+    rescheduler = JobRescheduler(
+        weather_service=WeatherService(provider=provider),
+        job_service=None,
+        geocode_cache=GeocodeCache(store=None)
+    )
+    rescheduler._lookup_coordinates = ADDRESSES.__getitem__
+    return rescheduler
+
+
+class TestGlobalReschedulingSweep:
+    @pytest.mark.asyncio
+    async def test_sweep_uses_fixed_queries_across_orgs(self, db):
+        add_org(db, "org-1", lookahead_days=3)
+        add_org(db, "org-2", lookahead_days=2)
+        add_org(db, "org-3", auto_reschedule=False)
+        add_job(db, "org-1", "job-1", "100 Peachtree St, Atlanta, GA")
+        add_job(db, "org-1", "job-2", "1 Main St, Marietta, GA")
+        add_job(db, "org-2", "job-3", "120 Peachtree St, Atlanta, GA")
+        add_job(db, "org-2", "job-4", "120 Peachtree St, Atlanta, GA", days_ahead=5)
+        add_job(db, "org-3", "job-5", "100 Peachtree St, Atlanta, GA")
+        db.commit()
+        db.statements.clear()
+
+        provider = MockWeatherProvider([forecast(0, 90), forecast(1, 90), forecast(2, 10)])
+        results = await make_rescheduler(provider).run_global_rescheduling_sweep(db)
+
+        # jobs, organizations, bulk job update, bulk audit insert
+        assert db.statements == ["SELECT", "SELECT", "UPDATE", "INSERT"]
+        assert provider.call_count == 2
+
+        assert {r.job_id for r in results["org-1"] if r.success} == {"job-1", "job-2"}
+        # org-2 only looks two days ahead, so there is no safe day in its window
+        [org2_result] = results["org-2"]
+        assert org2_result.job_id == "job-3" and not org2_result.success
+        assert "org-3" not in results
+
+        db.expire_all()
+        job = db.get(Job, "job-1")
+        assert job.status == "rescheduled"
+        assert job.scheduled_for.replace(tzinfo=timezone.utc) == TODAY + timedelta(days=2, hours=9)
+        assert job.internal_notes.startswith("Gate code 1234\nRescheduled from ")
+        assert db.get(Job, "job-3").status == "scheduled"
+        assert db.get(Job, "job-5").status == "scheduled"
+
+        audit_rows = db.query(AuditLog).all()
+        assert sorted(row.details["job_id"] for row in audit_rows) == ["job-1", "job-2"]
+        assert all(row.event_type == "job_rescheduled" for row in audit_rows)
+
+    @pytest.mark.asyncio
+    async def test_sweep_without_jobs_runs_one_query(self, db):
+        results = await make_rescheduler(MockWeatherProvider()).run_global_rescheduling_sweep(db)
+
+        assert results == {}
+        assert db.statements == ["SELECT"]
+
+
+class TestBulkWeatherSettings:
+    def test_org_overrides_and_missing_orgs_get_defaults(self, db):
+        add_org(db, "org-1", lookahead_days=7)
+        db.commit()
+
+        settings = get_weather_settings_bulk(db, ["org-1", "org-missing", "org-1"])
+
+        assert settings["org-1"].lookahead_days == 7
+        assert settings["org-1"].business_hours["sunday"]["start"] == "08:00"
+        assert settings["org-missing"].lookahead_days == 3
@@ -0,0 +1,96 @@
+"""
+Unit tests for thumbnail-based image analysis and batch quality scoring
+"""
+import base64
+import io
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from backend.services import advanced_quality_scorer as scorer_module
+from backend.services.advanced_quality_scorer import ANALYSIS_SIZE, AdvancedQualityScorer, analyze_image
+
+
+def encode(image, image_format="PNG"):
+    buffer = io.BytesIO()
+    image.save(buffer, format=image_format)
+    return base64.b64encode(buffer.getvalue()).decode("utf-8")
+
+
+def gradient(width, height):
+    x = np.linspace(0, 255, width, dtype=np.float32)
+    y = np.linspace(0, 255, height, dtype=np.float32)[:, None]
+    pixels = np.stack(np.broadcast_arrays(x + 0 * y, y + 0 * x, (x + y) / 2), axis=-1)
+    return Image.fromarray(pixels.astype(np.uint8))
+
+
+@pytest.fixture
+def scorer():
+    return AdvancedQualityScorer()
+
+
+class TestAnalyzeImage:
+    @pytest.mark.parametrize("image_format", ["PNG", "JPEG"])
+    def test_keeps_original_size_but_analyzes_a_thumbnail(self, image_format):
+        analysis = analyze_image(encode(gradient(1792, 1024), image_format))
+
+        assert analysis.size == (1792, 1024)
+        assert max(analysis.thumbnail.size) <= ANALYSIS_SIZE
+        assert analysis.unique_colors > 1000
+        assert analysis.contrast > 30
+
+    def test_uniform_image_statistics(self):
+        analysis = analyze_image(encode(Image.new("RGBA", (800, 800), (200, 30, 30, 255))))
+
+        assert analysis.distinct_values < 10
+        assert analysis.unique_colors == 1
+        assert analysis.contrast == pytest.approx(0.0, abs=1e-3)
+        assert analysis.sharpness == pytest.approx(0.0, abs=1e-3)
+        assert analysis.dominant_colors == ["#c81818"]
+
+    def test_blurring_lowers_sharpness(self):
+        noisy = Image.fromarray(np.random.default_rng(1).integers(0, 256, (512, 512, 3), dtype=np.uint8))
+        blurred = noisy.resize((64, 64)).resize((512, 512), Image.Resampling.BICUBIC)
+
+        assert analyze_image(encode(blurred)).sharpness < analyze_image(encode(noisy)).sharpness / 4
+
+
+class TestScoring:
+    @pytest.mark.asyncio
+    async def test_uniform_images_score_lower_than_detailed_ones(self, scorer):
+        detailed = await scorer.score_image_quality(encode(gradient(1024, 1024)), "gradient")
+        blank = await scorer.score_image_quality(encode(Image.new("RGB", (1024, 1024), "white")), "blank")
+
+        assert detailed["dimension_scores"]["technical"] == 100
+        assert blank["dimension_scores"]["technical"] == 85
+        assert detailed["overall_score"] > blank["overall_score"]
+        assert detailed["image_statistics"]["width"] == 1024
+
+    @pytest.mark.asyncio
+    async def test_undecodable_image_returns_error(self, scorer):
+        result = await scorer.score_image_quality("bm90IGFuIGltYWdl", "prompt", fallback_to_basic=False)
+
+        assert result["quality_level"] == "error"
+
+    @pytest.mark.asyncio
+    async def test_score_batch_keeps_order_and_bounds_decoding(self, scorer, monkeypatch):
+        running, peak = [0], [0]
+        analyze = scorer_module.analyze_image
+
+        def tracked_analyze(image_base64):
+            running[0] += 1
+            peak[0] = max(peak[0], running[0])
+            try:
+                return analyze(image_base64)
+            finally:
+                running[0] -= 1
+
+        monkeypatch.setattr(scorer_module, "analyze_image", tracked_analyze)
+        images = [(encode(gradient(256 * (i % 3 + 1), 256)), f"prompt {i}") for i in range(10)]
+
+        results = await scorer.score_batch(images, platform="twitter")
+
+        assert [result["image_statistics"]["width"] for result in results] == [256 * (i % 3 + 1) for i in range(10)]
+        assert all(result["platform"] == "twitter" for result in results)
+        assert peak[0] <= scorer_module.BATCH_DECODE_CONCURRENCY
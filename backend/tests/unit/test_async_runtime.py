@@ -0,0 +1,145 @@
+"""
+Unit tests for the per-process async runtime used by Celery tasks
+"""
+import asyncio
+import os
+
+import pytest
+
+from backend.tasks import async_runtime
+from backend.tasks.async_runtime import (
+    async_task,
+    get_async_runtime,
+    run_async,
+    shared_resource,
+    shutdown_async_runtime,
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_runtime():
+    shutdown_async_runtime()
+    yield
+    shutdown_async_runtime()
+
+
+class Client:
+    def __init__(self):
+        self.closed = False
+
+    async def aclose(self):
+        self.closed = True
+
+
+class TestRunAsync:
+    def test_coroutines_share_one_loop(self):
+        async def current_loop():
+            return asyncio.get_running_loop()
+
+        first = run_async(current_loop())
+        second = run_async(current_loop())
+
+        assert first is second is get_async_runtime().loop
+        assert get_async_runtime().tasks_run == 2
+
+    def test_exceptions_propagate(self):
+        async def fail():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError, match="boom"):
+            run_async(fail())
+        assert run_async(asyncio.sleep(0, result="still running")) == "still running"
+
+    def test_timeout_cancels_coroutine(self):
+        cancelled = []
+
+        async def slow():
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+
+        with pytest.raises(TimeoutError):
+            run_async(slow(), timeout=0.05)
+        run_async(asyncio.sleep(0.01))
+        assert cancelled == [True]
+
+    def test_nested_call_from_loop_is_rejected(self):
+        async def nested():
+            coro = asyncio.sleep(0)
+            try:
+                run_async(coro)
+            finally:
+                coro.close()
+
+        with pytest.raises(RuntimeError, match="own loop"):
+            run_async(nested())
+
+    def test_forked_child_gets_its_own_runtime(self, monkeypatch):
+        parent = get_async_runtime()
+        child_pid = os.getpid() + 1
+        monkeypatch.setattr(async_runtime.os, "getpid", lambda: child_pid)
+
+        child = get_async_runtime()
+
+        assert child is not parent
+        assert child.loop is not parent.loop
+        parent.shutdown()
+        child.shutdown()
+
+
+class TestAsyncTask:
+    def test_wraps_coroutine_function(self):
+        @async_task
+        async def add(a, b=1):
+            await asyncio.sleep(0)
+            return a + b
+
+        assert add(2, b=3) == 5
+        assert add.__name__ == "add"
+
+    def test_rejects_sync_function(self):
+        with pytest.raises(TypeError):
+            async_task(lambda: None)
+
+    def test_celery_task_body_runs_on_the_runtime_loop(self, monkeypatch):
+        from backend.tasks import weather_tasks
+
+        loops = []
+
+        class FakeRescheduler:
+            async def run_global_rescheduling_sweep(self, db):
+                loops.append(asyncio.get_running_loop())
+                return {}
+
+        class FakeSession:
+            def close(self):
+                pass
+
+        monkeypatch.setattr(weather_tasks, "get_job_rescheduler", FakeRescheduler)
+        monkeypatch.setattr(weather_tasks, "get_db", lambda: iter([FakeSession()]))
+
+        summary = weather_tasks.weather_rescheduling_sweep.run()
+
+        assert summary["status"] == "completed"
+        assert loops == [get_async_runtime().loop]
+
+
+class TestSharedResource:
+    def test_reused_across_tasks_and_closed_on_shutdown(self):
+        created = []
+
+        def factory():
+            created.append(Client())
+            return created[-1]
+
+        async def use():
+            return shared_resource("client", factory)
+
+        assert run_async(use()) is run_async(use())
+        assert len(created) == 1
+
+        shutdown_async_runtime()
+
+        assert created[0].closed
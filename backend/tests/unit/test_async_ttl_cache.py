@@ -0,0 +1,51 @@
+"""
+Unit tests for the shared async TTL cache
+"""
+import asyncio
+
+import pytest
+
+from backend.services.async_ttl_cache import AsyncTTLCache
+
+
+class TestAsyncTTLCache:
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = AsyncTTLCache(max_entries=2, ttl_seconds=60)
+        cache.set("ns", "a", 1)
+        cache.set("ns", "b", 2)
+        cache.get("ns", "a")
+        cache.set("ns", "c", 3)
+
+        assert cache.get("ns", "b") is None
+        assert cache.get("ns", "a") == 1
+        assert cache.get("ns", "c") == 3
+
+    @pytest.mark.asyncio
+    async def test_failures_are_shared_but_not_cached(self):
+        cache = AsyncTTLCache(max_entries=10, ttl_seconds=60)
+        calls = []
+
+        async def compute():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            raise RuntimeError("provider down")
+
+        results = await asyncio.gather(
+            *(cache.get_or_compute("ns", "k", compute) for _ in range(3)),
+            return_exceptions=True
+        )
+
+        assert len(calls) == 1
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert cache.get("ns", "k") is None
+
+    @pytest.mark.asyncio
+    async def test_predicate_overrides_the_default_rule(self):
+        cache = AsyncTTLCache(max_entries=10, ttl_seconds=60)
+
+        async def compute():
+            return {"partial": True}
+
+        await cache.get_or_compute("ns", "k", compute, cacheable=lambda value: not value.get("partial"))
+
+        assert cache.get("ns", "k") is None
@@ -0,0 +1,151 @@
+"""
+Unit tests for packed, bounded-concurrency batch categorization
+"""
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from backend.services import content_categorization as categorization_module
+from backend.services.content_categorization import ContentCategorizer
+
+TECH_POST = "AI software tech automation digital"
+
+
+def plain_post(number):
+    return f"Spent the afternoon at the river with everyone, walk number {number} of the summer."
+
+
+class FakeCompletions:
+    """Answers packed requests, recording each call and the peak in flight"""
+
+    def __init__(self, drop_ids=(), fail=False):
+        self.calls = []
+        self.running = 0
+        self.peak = 0
+        self.drop_ids = set(drop_ids)
+        self.fail = fail
+
+    async def create(self, **kwargs):
+        self.calls.append(kwargs)
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        try:
+            await asyncio.sleep(0.01)
+            if self.fail:
+                raise RuntimeError("rate limited")
+            prompt = kwargs["messages"][1]["content"]
+            posts = json.loads(prompt.split("Posts:", 1)[1].split("Respond with", 1)[0])
+            results = [
+                {"id": post["id"], "topic_category": "personal", "confidence": 0.9, "sentiment": "positive",
+                 "tone": "casual", "reading_level": "beginner", "keywords": ["river"]}
+                for post in posts if post["id"] not in self.drop_ids
+            ]
+            message = SimpleNamespace(content=json.dumps({"results": results}))
+            return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+        finally:
+            self.running -= 1
+
+
+@pytest.fixture
+def categorizer(monkeypatch):
+    monkeypatch.setattr(categorization_module.settings, "openai_api_key", "test-key", raising=False)
+    return ContentCategorizer()
+
+
+def use_completions(categorizer, completions):
+    categorizer.async_client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+
+
+class TestCategorizeBatch:
+    @pytest.mark.asyncio
+    async def test_items_are_packed_under_a_concurrency_cap(self, categorizer, monkeypatch):
+        monkeypatch.setattr(categorization_module, "BATCH_MAX_ITEMS", 10)
+        completions = FakeCompletions()
+        use_completions(categorizer, completions)
+
+        results = await categorizer.categorize_batch([(plain_post(i), "twitter") for i in range(100)])
+
+        assert len(completions.calls) == 10
+        assert completions.peak == categorization_module.BATCH_CONCURRENCY
+        assert all(call["response_format"] == {"type": "json_object"} for call in completions.calls)
+        assert [result.topic_category for result in results] == ["personal"] * 100
+
+    def test_packs_respect_the_token_budget(self, categorizer):
+        items = [(str(i), "x" * 4000, "linkedin") for i in range(10)]
+
+        packs = categorizer._pack_items(items)
+
+        # 2000 truncated characters is ~520 tokens, so 11 fit the budget but only 10 items exist
+        assert [len(pack) for pack in packs] == [10]
+        long_packs = categorizer._pack_items([(str(i), "x", "x") for i in range(95)])
+        assert [len(pack) for pack in long_packs] == [40, 40, 15]
+
+    @pytest.mark.asyncio
+    async def test_cached_duplicate_and_keyword_confident_items_skip_the_model(self, categorizer):
+        completions = FakeCompletions()
+        use_completions(categorizer, completions)
+        batch = [(plain_post(1), "twitter"), (plain_post(1), "twitter"), (TECH_POST, "twitter")]
+
+        first = await categorizer.categorize_batch(batch)
+        second = await categorizer.categorize_batch(batch)
+        single = await categorizer.categorize_content(plain_post(1), "twitter")
+
+        assert len(completions.calls) == 1
+        assert "AI software" not in completions.calls[0]["messages"][1]["content"]
+        assert [result.topic_category for result in first] == ["personal", "personal", "technology"]
+        assert second == first
+        assert single == first[0]
+
+    def test_keywords_match_whole_words_only(self, categorizer):
+        # "ai" sits inside "said" and "main"
+        post = "She said hi to her team at the main office today."
+
+        assert categorizer._keyword_based_categorization(post)[0] != "technology"
+        assert not categorizer._keyword_confident(post)
+        # One keyword repeated is confident by score but not by evidence
+        assert categorizer._keyword_based_categorization("AI AI AI")[1] >= 0.8
+        assert not categorizer._keyword_confident("AI AI AI")
+        assert categorizer._keyword_confident(TECH_POST)
+
+    @pytest.mark.asyncio
+    async def test_substring_keyword_matches_still_reach_the_model(self, categorizer):
+        completions = FakeCompletions()
+        use_completions(categorizer, completions)
+
+        result = await categorizer.categorize_content("She said hi to her team at the main office today.", "twitter")
+
+        assert len(completions.calls) == 1
+        assert result.topic_category == "personal"
+
+    @pytest.mark.asyncio
+    async def test_missing_items_and_failed_packs_fall_back(self, categorizer):
+        use_completions(categorizer, FakeCompletions(drop_ids={1}))
+
+        results = await categorizer.categorize_batch([(plain_post(i), "twitter") for i in range(3)])
+
+        assert [result.tone for result in results] == ["casual", "conversational", "casual"]
+
+        failing = FakeCompletions(fail=True)
+        use_completions(categorizer, failing)
+        results = await categorizer.categorize_batch([(plain_post(0), "twitter"), (plain_post(9), "twitter")])
+
+        # The cached item is still served; the failed one is not cached
+        assert [result.tone for result in results] == ["casual", "conversational"]
+        assert categorizer._get_cached(categorizer._cache_key(plain_post(9), "twitter")) is None
+
+
+class TestCategorizeContent:
+    @pytest.mark.asyncio
+    async def test_failed_request_falls_back_without_caching(self, categorizer):
+        failing = FakeCompletions(fail=True)
+        use_completions(categorizer, failing)
+
+        first = await categorizer.categorize_content(plain_post(1), "twitter")
+        second = await categorizer.categorize_content(plain_post(1), "twitter")
+
+        # Each call retries the API instead of serving the cached fallback
+        assert len(failing.calls) == 2
+        assert first.tone == second.tone == "conversational"
+        assert categorizer._get_cached(categorizer._cache_key(plain_post(1), "twitter")) is None
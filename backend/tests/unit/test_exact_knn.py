@@ -0,0 +1,109 @@
+"""
+Unit tests for the NumPy exact kNN engine
+"""
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from backend.core.exact_knn import ExactKNNIndex
+
+DIMENSION = 64
+
+
+@pytest.fixture
+def vectors():
+    return np.random.default_rng(7).standard_normal((500, DIMENSION)).astype(np.float32)
+
+
+def brute_force(vectors, query, top_k):
+    """Reference answer: full cosine scores, fully sorted"""
+    normalized = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+    scores = normalized @ (query / np.linalg.norm(query))
+    order = np.argsort(-scores, kind="stable")[:top_k]
+    return scores[order], order
+
+
+class TestSearch:
+    def test_matches_brute_force(self, vectors):
+        index = ExactKNNIndex.from_vectors(vectors)
+        query = np.random.default_rng(1).standard_normal(DIMENSION)
+
+        scores, indexes = index.search(query, top_k=10)
+
+        expected_scores, expected_indexes = brute_force(vectors, query, 10)
+        assert list(indexes) == list(expected_indexes)
+        np.testing.assert_allclose(scores, expected_scores, rtol=1e-5)
+
+    def test_batch_matches_single_queries(self, vectors):
+        index = ExactKNNIndex.from_vectors(vectors)
+        queries = np.random.default_rng(2).standard_normal((4, DIMENSION))
+
+        batch_scores, batch_indexes = index.search_batch(queries, top_k=5)
+
+        for query, scores, indexes in zip(queries, batch_scores, batch_indexes):
+            single_scores, single_indexes = index.search(query, top_k=5)
+            assert list(indexes) == list(single_indexes)
+            np.testing.assert_allclose(scores, single_scores, rtol=1e-5)
+
+    def test_threshold_and_small_index(self):
+        index = ExactKNNIndex(3)
+        index.add_batch([[1, 0, 0], [1, 1, 0], [0, 0, 1]])
+
+        scores, indexes = index.search([1, 0, 0], top_k=10, threshold=0.5)
+
+        assert list(indexes) == [0, 1]
+        np.testing.assert_allclose(scores, [1.0, np.sqrt(0.5)], rtol=1e-5)
+
+    def test_empty_index(self):
+        scores, indexes = ExactKNNIndex(3).search([1, 0, 0])
+
+        assert len(scores) == 0 and len(indexes) == 0
+
+    def test_float16_storage_keeps_ranking(self, vectors):
+        index = ExactKNNIndex.from_vectors(vectors, dtype=np.float16)
+        query = np.random.default_rng(3).standard_normal(DIMENSION)
+
+        scores, indexes = index.search(query, top_k=5)
+
+        expected_scores, expected_indexes = brute_force(vectors, query, 5)
+        assert index.vectors.dtype == np.float16
+        assert set(indexes) == set(expected_indexes)
+        np.testing.assert_allclose(scores, expected_scores, atol=1e-2)
+
+
+class TestStorage:
+    def test_add_grows_without_losing_rows(self, vectors):
+        index = ExactKNNIndex(DIMENSION, initial_capacity=2)
+
+        positions = [index.add(vector) for vector in vectors[:50]]
+
+        assert positions == list(range(50))
+        assert len(index) == 50
+        np.testing.assert_allclose(np.linalg.norm(index.vectors, axis=1), 1.0, rtol=1e-5)
+
+    def test_zero_vector_stays_zero(self):
+        index = ExactKNNIndex(3)
+        index.add([0, 0, 0])
+
+        assert not index.vectors.any()
+
+    def test_rejects_wrong_dimension(self):
+        with pytest.raises(ValueError):
+            ExactKNNIndex(3).add([1, 0])
+
+
+def test_memory_tool_fallback_ranks_with_exact_index():
+    from backend.agents.tools import FAISSMemoryTool
+
+    tool = FAISSMemoryTool()
+    tool.index = None
+    embeddings = {"cats": [1.0, 0.0, 0.0], "dogs": [0.8, 0.6, 0.0], "cars": [0.0, 0.0, 1.0]}
+    tool.embed_text = MagicMock(side_effect=lambda text: embeddings.get(text, [1.0, 0.1, 0.0]))
+    for text in embeddings:
+        tool.store_content(text, {"topic": text})
+
+    results = tool.search_similar("pets", top_k=2)
+
+    assert [result["content"] for result in results] == ["cats", "dogs"]
+    assert results[0]["similarity"] > results[1]["similarity"]
@@ -0,0 +1,157 @@
+"""
+Unit tests for streaming file upload ingestion
+"""
+import io
+import hashlib
+import pytest
+from unittest.mock import MagicMock, patch
+
+from fastapi import HTTPException, UploadFile
+from PIL import Image
+
+from backend.services.file_upload_service import (
+    FileUploadService,
+    ImageHeaderProbe,
+    LocalUploadStorage,
+    sniff_image_mime,
+)
+
+
+def make_image_bytes(fmt: str = "PNG", size=(120, 80)) -> bytes:
+    """Render a small noisy image so the payload spans several chunks"""
+    img = Image.effect_noise(size, 64).convert("RGB")
+    buffer = io.BytesIO()
+    img.save(buffer, format=fmt)
+    return buffer.getvalue()
+
+
+class CountingUploadFile(UploadFile):
+    """UploadFile that records how many bytes were read"""
+
+    def __init__(self, data: bytes, filename: str):
+        super().__init__(file=io.BytesIO(data), filename=filename)
+        self.bytes_read = 0
+
+    async def read(self, size: int = -1) -> bytes:
+        chunk = await super().read(size)
+        self.bytes_read += len(chunk)
+        return chunk
+
+
+class TestFileUploadService:
+    """Test single-pass upload ingestion"""
+
+    @pytest.fixture
+    def storage(self, tmp_path):
+        images_dir = tmp_path / "images"
+        temp_dir = tmp_path / "temp"
+        images_dir.mkdir()
+        temp_dir.mkdir()
+        return LocalUploadStorage(images_dir, temp_dir)
+
+    @pytest.fixture
+    def mock_db(self):
+        db = MagicMock()
+        db.query.return_value.filter.return_value.first.return_value = None
+        with patch(
+            'backend.services.file_upload_service.get_db',
+            side_effect=lambda: iter([db])
+        ):
+            yield db
+
+    @pytest.fixture
+    def service(self, storage):
+        service = FileUploadService(storage=storage)
+        service.max_file_size = 5 * 1024 * 1024
+        return service
+
+    def test_sniff_image_mime(self):
+        """Magic bytes are recognised without decoding"""
+        assert sniff_image_mime(make_image_bytes("PNG")[:32]) == "image/png"
+        assert sniff_image_mime(make_image_bytes("JPEG")[:32]) == "image/jpeg"
+        assert sniff_image_mime(make_image_bytes("GIF")[:32]) == "image/gif"
+        assert sniff_image_mime(b"RIFF\x00\x00\x00\x00WEBPVP8 ") == "image/webp"
+
+    def test_header_probe_decodes_from_leading_bytes(self):
+        """Dimensions come from the header without the full payload"""
+        data = make_image_bytes("PNG", size=(640, 480))
+        probe = ImageHeaderProbe()
+        probe.feed(data[:64])
+
+        assert probe.metadata == {
+            'width': 640, 'height': 480, 'format': 'PNG', 'mode': 'RGB'
+        }
+
+    @pytest.mark.asyncio
+    async def test_upload_reads_stream_once(self, service, storage, mock_db):
+        """Hash, type and dimensions are produced from one pass"""
+        data = make_image_bytes("PNG", size=(400, 300))
+        upload = CountingUploadFile(data, "photo.png")
+
+        result = await service.upload_image(upload, user_id=1)
+
+        assert upload.bytes_read == len(data)
+        assert result["status"] == "uploaded"
+        assert result["size"] == len(data)
+        assert result["file_hash"] == hashlib.sha256(data).hexdigest()
+        assert result["metadata"]["width"] == 400
+        assert result["metadata"]["height"] == 300
+        assert (storage.images_dir / result["filename"]).read_bytes() == data
+        assert list(storage.temp_dir.iterdir()) == []
+
+    @pytest.mark.asyncio
+    async def test_upload_too_large_is_rejected(self, service, storage, mock_db):
+        """Size limit is enforced while streaming"""
+        data = make_image_bytes("PNG", size=(400, 300))
+        service.max_file_size = len(data) // 2
+
+        with pytest.raises(HTTPException) as exc_info:
+            await service.upload_image(CountingUploadFile(data, "photo.png"), user_id=1)
+
+        assert exc_info.value.status_code == 413
+        assert list(storage.temp_dir.iterdir()) == []
+        assert list(storage.images_dir.iterdir()) == []
+
+    @pytest.mark.asyncio
+    async def test_upload_content_mismatch_is_rejected(self, service, storage, mock_db):
+        """Non-image content with an image extension is rejected"""
+        upload = CountingUploadFile(b"#!/bin/sh\necho not an image\n" * 10, "photo.png")
+
+        with pytest.raises(HTTPException) as exc_info:
+            await service.upload_image(upload, user_id=1)
+
+        assert exc_info.value.status_code == 400
+        assert list(storage.temp_dir.iterdir()) == []
+
+    @pytest.mark.asyncio
+    async def test_upload_small_dimensions_stop_early(self, service, storage, mock_db):
+        """Header validation fails before the rest of the stream is read"""
+        data = make_image_bytes("PNG", size=(20, 20000))
+        upload = CountingUploadFile(data, "photo.png")
+
+        with pytest.raises(HTTPException) as exc_info:
+            await service.upload_image(upload, user_id=1)
+
+        assert exc_info.value.status_code == 400
+        assert upload.bytes_read < len(data)
+        assert list(storage.temp_dir.iterdir()) == []
+
+    @pytest.mark.asyncio
+    async def test_duplicate_upload_is_not_rewritten(self, service, storage, mock_db):
+        """Content already stored for the user is reused by hash"""
+        data = make_image_bytes("PNG", size=(400, 300))
+        (storage.images_dir / "existing.png").write_bytes(data)
+
+        existing = MagicMock()
+        existing.id = 42
+        existing.content = "/api/files/uploads/images/existing.png"
+        mock_db.query.return_value.filter.return_value.first.return_value = existing
+
+        result = await service.upload_image(CountingUploadFile(data, "again.png"), user_id=1)
+
+        assert result["status"] == "duplicate"
+        assert result["content_item_id"] == 42
+        assert result["filename"] == "existing.png"
+        assert [p.name for p in storage.images_dir.iterdir()] == ["existing.png"]
+        assert list(storage.temp_dir.iterdir()) == []
+        mock_db.add.assert_not_called()
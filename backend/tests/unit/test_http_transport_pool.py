@@ -0,0 +1,276 @@
+"""
+Unit tests for the pooled per-platform HTTP transport
+"""
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+
+from backend.core import http_client
+from backend.core.http_client import (
+    HTTPClient,
+    HTTPClientConfig,
+    PLATFORM_POOL_LIMITS,
+    get_platform_http_client,
+    get_platform_transport_stats,
+)
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    """Minimal HTTP/1.1 handler that keeps connections open"""
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = json.dumps({"path": self.path}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def local_server():
+    """Local keep-alive server on an ephemeral port"""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def platform_clients(monkeypatch):
+    """Isolated registry of pooled platform clients"""
+    clients = {}
+    monkeypatch.setattr(http_client, "_platform_clients", clients)
+    return clients
+
+
+def mock_platform_client(platform, handler):
+    """Pooled client for a platform backed by a mock transport"""
+    config = HTTPClientConfig.for_platform(platform)
+    config.max_retries = 0
+    return HTTPClient(config, name=platform, transport=httpx.MockTransport(handler))
+
+
+class TestPlatformConfig:
+    def test_platform_limits_applied(self):
+        config = HTTPClientConfig.for_platform("linkedin")
+        limits = PLATFORM_POOL_LIMITS["linkedin"]
+
+        assert config.max_connections == limits["max_connections"]
+        assert config.max_keepalive_connections == limits["max_keepalive_connections"]
+        assert config.timeout == limits["timeout"]
+
+    def test_env_override(self, monkeypatch):
+        monkeypatch.setenv("HTTP_TWITTER_MAX_CONNECTIONS", "7")
+        config = HTTPClientConfig.for_platform("twitter")
+        assert config.max_connections == 7
+        assert config.to_limits().max_connections == 7
+
+    def test_http2_follows_h2_availability(self, monkeypatch):
+        monkeypatch.setattr(http_client, "HTTP2_AVAILABLE", False)
+        assert HTTPClientConfig.for_platform("facebook").http2 is False
+
+        monkeypatch.setattr(http_client, "HTTP2_AVAILABLE", True)
+        monkeypatch.setenv("HTTP_ENABLE_HTTP2", "false")
+        assert HTTPClientConfig.for_platform("facebook").http2 is False
+
+
+class TestPlatformClients:
+    def test_one_shared_client_per_platform(self, platform_clients):
+        facebook = get_platform_http_client("facebook")
+
+        assert get_platform_http_client("facebook") is facebook
+        assert get_platform_http_client("twitter") is not facebook
+        assert set(platform_clients) == {"facebook", "twitter"}
+
+    @pytest.mark.asyncio
+    async def test_keepalive_connection_reused(self, platform_clients, local_server):
+        client = get_platform_http_client("instagram")
+        client.config.http2 = False
+
+        for i in range(3):
+            response = await client.get(f"{local_server}/item/{i}")
+            assert response.json() == {"path": f"/item/{i}"}
+
+        stats = get_platform_transport_stats()["instagram"]
+        assert stats["requests"] == 3
+        assert stats["new_connections"] == 1
+        assert stats["reused_connections"] == 2
+        assert stats["connection_reuse_rate"] == pytest.approx(2 / 3, abs=1e-3)
+        assert stats["avg_connect_ms"] > 0
+        assert stats["tls_handshakes"] == 0
+
+        await client.close()
+
+    def test_pool_rebuilt_for_new_event_loop(self, local_server):
+        client = HTTPClient(HTTPClientConfig.for_platform("twitter"), name="twitter")
+
+        async def fetch():
+            await client.get(f"{local_server}/ping")
+            return client.client
+
+        first = asyncio.run(fetch())
+        second = asyncio.run(fetch())
+
+        assert first is not second
+        assert client.metrics.new_connections == 2
+        # The first loop's pool was released instead of being kept alongside the new one
+        assert list(client._clients.values()) == [second]
+
+    def test_one_pool_per_live_event_loop(self):
+        client = mock_platform_client("twitter", lambda request: httpx.Response(200))
+        other_loop = asyncio.new_event_loop()
+        runner = threading.Thread(target=other_loop.run_forever, daemon=True)
+        runner.start()
+
+        async def fetch():
+            await client.get("https://api.example.com/ping")
+            return client.client
+
+        try:
+            on_other_loop = asyncio.run_coroutine_threadsafe(fetch(), other_loop).result(5)
+
+            async def fetch_and_close():
+                here = await fetch()
+                await client.close()
+                return here
+
+            here = asyncio.run(fetch_and_close())
+
+            assert here is not on_other_loop
+            assert not client._clients
+            # The other loop's pool is closed on its own loop
+            for _ in range(50):
+                if on_other_loop.is_closed:
+                    break
+                threading.Event().wait(0.01)
+            assert on_other_loop.is_closed
+        finally:
+            other_loop.call_soon_threadsafe(other_loop.stop)
+            runner.join(5)
+            other_loop.close()
+
+
+class TestRetryPolicy:
+    @staticmethod
+    def flaky_client(statuses):
+        calls = []
+
+        def handler(request):
+            calls.append(request.method)
+            return httpx.Response(statuses[min(len(calls), len(statuses)) - 1])
+
+        config = HTTPClientConfig.for_platform("instagram")
+        config.max_retries = 2
+        config.retry_backoff_factor = 0
+        return HTTPClient(config, name="instagram", transport=httpx.MockTransport(handler)), calls
+
+    @pytest.mark.asyncio
+    async def test_idempotent_methods_are_retried(self):
+        client, calls = self.flaky_client([503, 200])
+
+        response = await client.get("https://graph.example.com/me")
+
+        assert response.status_code == 200
+        assert calls == ["GET", "GET"]
+
+    @pytest.mark.asyncio
+    async def test_post_is_sent_once(self):
+        client, calls = self.flaky_client([503, 200])
+
+        response = await client.post("https://graph.example.com/media_publish")
+
+        assert response.status_code == 503
+        assert calls == ["POST"]
+
+    @pytest.mark.asyncio
+    async def test_post_timeout_is_not_resent(self):
+        calls = []
+
+        def handler(request):
+            calls.append(request.method)
+            raise httpx.ReadTimeout("timed out", request=request)
+
+        client = HTTPClient(HTTPClientConfig.for_platform("twitter"), name="twitter",
+                            transport=httpx.MockTransport(handler))
+
+        with pytest.raises(httpx.ReadTimeout):
+            await client.post("https://api.example.com/2/tweets", json={"text": "hi"})
+        assert calls == ["POST"]
+
+    @pytest.mark.asyncio
+    async def test_explicit_retry_overrides_the_method_default(self):
+        client, calls = self.flaky_client([503, 503, 200])
+        assert (await client.post("https://graph.example.com/", retry=True)).status_code == 200
+        assert calls == ["POST"] * 3
+
+        client, calls = self.flaky_client([503, 200])
+        assert (await client.get("https://graph.example.com/", retry=False)).status_code == 503
+        assert calls == ["GET"]
+
+
+class TestPlatformClientsUsePool:
+    @pytest.mark.asyncio
+    async def test_publish_calls_are_not_retried(self, platform_clients):
+        from backend.integrations.instagram_client import InstagramClient
+
+        calls = []
+
+        def handler(request):
+            calls.append(request.url.path)
+            return httpx.Response(502, json={"error": {"message": "bad gateway"}})
+
+        config = HTTPClientConfig.for_platform("instagram")
+        config.retry_backoff_factor = 0
+        platform_clients["instagram"] = HTTPClient(config, name="instagram", transport=httpx.MockTransport(handler))
+
+        with pytest.raises(Exception):
+            await InstagramClient().publish_media("token", "container_1", "ig_1", user_id=1)
+
+        assert calls == ["/v18.0/ig_1/media_publish"]
+
+    @pytest.mark.asyncio
+    async def test_twitter_requests_go_through_pool(self, platform_clients):
+        from backend.integrations.twitter_client import TwitterClient
+
+        seen = []
+
+        def handler(request):
+            seen.append(request)
+            return httpx.Response(200, json={"data": {"id": "1", "public_metrics": {"like_count": 3}}})
+
+        platform_clients["twitter"] = mock_platform_client("twitter", handler)
+
+        metrics = await TwitterClient().get_tweet_metrics("token-123", "1")
+
+        assert metrics["likes_count"] == 3
+        assert seen[0].headers["Authorization"] == "Bearer token-123"
+        assert seen[0].url.path == "/2/tweets/1"
+        assert platform_clients["twitter"].metrics.requests == 1
+
+    @pytest.mark.asyncio
+    async def test_facebook_requests_go_through_pool(self, platform_clients):
+        from backend.integrations.facebook_client import FacebookAPIClient
+
+        def handler(request):
+            assert request.url.params["access_token"] == "page-token"
+            return httpx.Response(200, json={"id": "post_1"})
+
+        platform_clients["facebook"] = mock_platform_client("facebook", handler)
+
+        client = FacebookAPIClient()
+        first = await client._make_request("GET", "/post_1", "page-token")
+        second = await client._make_request("GET", "/post_1", "page-token")
+
+        assert first == second == {"id": "post_1"}
+        assert platform_clients["facebook"].metrics.requests == 2
@@ -0,0 +1,252 @@
+"""
+Unit tests for maintained social inbox counters and keyset inbox listing
+"""
+import subprocess
+import sys
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import create_engine, func
+from sqlalchemy.schema import CreateTable
+from sqlalchemy.orm import sessionmaker
+
+from backend.db.models import (
+    InteractionResponse,
+    RetentionCursor,
+    SocialInboxCounter,
+    SocialInteraction,
+    SocialPlatformConnection,
+    User,
+)
+from backend.db.multi_tenant_models import Organization
+from backend.services.data_retention_service import DataCategory, DataRetentionService
+from backend.services.inbox_counters import (
+    decode_inbox_cursor,
+    get_inbox_counts,
+    list_inbox_page,
+    rebuild_inbox_counters,
+)
+from backend.services.retention_executor import RetentionExecutor
+
+ORG_ID = "aaaaaaaa-0000-4000-8000-000000000001"
+OTHER_ORG_ID = "bbbbbbbb-0000-4000-8000-000000000002"
+START = datetime(2026, 10, 1, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://")
+    for model in (Organization, SocialPlatformConnection, SocialInteraction, InteractionResponse, SocialInboxCounter):
+        model.__table__.create(engine)
+    # Deleting an interaction loads its user; users' indexes don't build on SQLite
+    with engine.begin() as connection:
+        connection.execute(CreateTable(User.__table__))
+    session = sessionmaker(bind=engine)()
+    for index, org_id in enumerate((ORG_ID, OTHER_ORG_ID), start=1):
+        session.add(Organization(id=org_id, name=org_id, slug=org_id, owner_id=1))
+        session.add(SocialPlatformConnection(
+            id=index, user_id=index, organization_id=uuid.UUID(org_id), platform="facebook",
+            platform_user_id=f"page-{index}", platform_username=f"page{index}", access_token="token"
+        ))
+    session.commit()
+    yield session
+    session.close()
+
+
+def add_interaction(db, number, connection_id=1, user_id=1, platform="facebook", status="unread",
+                    priority_score=0.0, intent=None):
+    interaction = SocialInteraction(
+        id=f"i-{number:04d}", user_id=user_id, connection_id=connection_id, platform=platform,
+        interaction_type="comment", external_id=str(number), author_platform_id="a",
+        author_username="a", content="hello", status=status, priority_score=priority_score,
+        intent=intent, platform_created_at=START, received_at=START + timedelta(minutes=number % 7)
+    )
+    db.add(interaction)
+    return interaction
+
+
+def counter_rows(db):
+    return {
+        (row.organization_id, row.user_id, row.platform, row.status, row.is_high_priority): row.count
+        for row in db.query(SocialInboxCounter).filter(SocialInboxCounter.count != 0)
+    }
+
+
+def counted(db, organization_id=ORG_ID, **filters):
+    query = db.query(func.count(SocialInteraction.id)).filter(SocialInteraction.organization_id == organization_id)
+    for column, value in filters.items():
+        query = query.filter(getattr(SocialInteraction, column) == value)
+    return query.scalar()
+
+
+class TestCounterMaintenance:
+    def test_insert_fills_organization_and_counts(self, db):
+        add_interaction(db, 1, priority_score=80)
+        add_interaction(db, 2, platform="instagram")
+        add_interaction(db, 3, connection_id=2, user_id=2)
+        db.commit()
+
+        assert db.get(SocialInteraction, "i-0001").organization_id == ORG_ID
+        assert counter_rows(db) == {
+            (ORG_ID, 1, "facebook", "unread", True): 1,
+            (ORG_ID, 0, "facebook", "unread", True): 1,
+            (ORG_ID, 1, "instagram", "unread", False): 1,
+            (ORG_ID, 0, "instagram", "unread", False): 1,
+            (OTHER_ORG_ID, 2, "facebook", "unread", False): 1,
+            (OTHER_ORG_ID, 0, "facebook", "unread", False): 1,
+        }
+
+    def test_updates_move_counts_between_rows(self, db):
+        interaction = add_interaction(db, 1)
+        db.commit()
+
+        interaction.status = "read"
+        interaction.priority_score = 90
+        db.commit()
+
+        assert get_inbox_counts(db, ORG_ID) == {"total_count": 1, "unread_count": 0, "high_priority_count": 1}
+
+        # Update through an expired instance: the old values must still be known
+        db.expire_all()
+        interaction.status = "responded"
+        db.commit()
+
+        assert get_inbox_counts(db, ORG_ID) == {"total_count": 1, "unread_count": 0, "high_priority_count": 0}
+        assert counter_rows(db) == {
+            (ORG_ID, 1, "facebook", "responded", True): 1,
+            (ORG_ID, 0, "facebook", "responded", True): 1,
+        }
+
+    def test_delete_and_rollback(self, db):
+        keep = add_interaction(db, 1)
+        drop = add_interaction(db, 2)
+        db.commit()
+
+        keep.status = "archived"
+        db.flush()
+        db.rollback()
+        assert get_inbox_counts(db, ORG_ID)["unread_count"] == 2
+
+        db.delete(drop)
+        db.commit()
+        assert get_inbox_counts(db, ORG_ID) == {"total_count": 1, "unread_count": 1, "high_priority_count": 0}
+
+
+class TestInboxCounts:
+    def test_counts_match_count_queries(self, db):
+        for number in range(60):
+            add_interaction(
+                db, number, user_id=1 + number % 2,
+                platform=("facebook", "instagram", "twitter")[number % 3],
+                status=("unread", "read", "responded", "archived")[number % 4],
+                priority_score=float(number * 7 % 100)
+            )
+        db.commit()
+
+        counts = get_inbox_counts(db, ORG_ID, user_id=2, platform="twitter")
+        assert counts["total_count"] == counted(db, user_id=2, platform="twitter")
+        assert counts["unread_count"] == counted(db, status="unread")
+        assert counts["high_priority_count"] == (
+            db.query(func.count(SocialInteraction.id)).filter(
+                SocialInteraction.priority_score >= 70, SocialInteraction.status.in_(["unread", "read"])
+            ).scalar()
+        )
+        assert get_inbox_counts(db, ORG_ID, status="read")["total_count"] == counted(db, status="read")
+        assert get_inbox_counts(db, OTHER_ORG_ID)["total_count"] == 0
+
+    def test_rebuild_repairs_bulk_update_drift(self, db):
+        for number in range(10):
+            add_interaction(db, number)
+        db.commit()
+
+        db.query(SocialInteraction).filter(SocialInteraction.id < "i-0004").update(
+            {"status": "archived"}, synchronize_session=False
+        )
+        rebuild_inbox_counters(db, ORG_ID)
+        db.commit()
+
+        assert counter_rows(db) == {
+            (ORG_ID, 1, "facebook", "archived", False): 4,
+            (ORG_ID, 0, "facebook", "archived", False): 4,
+            (ORG_ID, 1, "facebook", "unread", False): 6,
+            (ORG_ID, 0, "facebook", "unread", False): 6,
+        }
+
+    def test_retention_bulk_delete_decrements_counters(self, db):
+        RetentionCursor.__table__.create(db.get_bind())
+        for number in range(7):
+            expired = add_interaction(db, number, status=("unread", "read")[number % 2], priority_score=number * 20.0)
+            expired.received_at = START - timedelta(days=400)
+        add_interaction(db, 7)
+        add_interaction(db, 8, connection_id=2, user_id=2)
+        add_interaction(db, 9, connection_id=2, user_id=2).received_at = START - timedelta(days=400)
+        db.commit()
+
+        targets = DataRetentionService().cleanup_targets[DataCategory.SOCIAL_CONNECTIONS]
+        interactions = [target for target in targets if target.name == "SocialInteraction"]
+        executor = RetentionExecutor(chunk_size=3, rows_per_second=0, max_seconds=0)
+        result = executor.run(db, "social_connections", interactions, START - timedelta(days=30))
+
+        assert result["deleted_counts"] == {"SocialInteraction": 8}
+        expected = dict(counter_rows(db))
+        rebuild_inbox_counters(db)
+        assert counter_rows(db) == expected == {
+            (ORG_ID, 1, "facebook", "unread", False): 1,
+            (ORG_ID, 0, "facebook", "unread", False): 1,
+            (OTHER_ORG_ID, 2, "facebook", "unread", False): 1,
+            (OTHER_ORG_ID, 0, "facebook", "unread", False): 1,
+        }
+
+
+class TestKeysetListing:
+    def test_pages_cover_inbox_in_priority_order(self, db):
+        for number in range(53):
+            add_interaction(db, number, priority_score=float(number % 5 * 20), intent="question")
+        add_interaction(db, 99, connection_id=2, user_id=2)
+        db.commit()
+
+        seen, cursor = [], None
+        while True:
+            page, cursor = list_inbox_page(db, ORG_ID, limit=10, cursor=cursor)
+            seen.extend(page)
+            if cursor is None:
+                break
+
+        expected = db.query(SocialInteraction).filter(SocialInteraction.organization_id == ORG_ID).order_by(
+            SocialInteraction.priority_score.desc(), SocialInteraction.received_at.desc(), SocialInteraction.id.desc()
+        ).all()
+        assert [interaction.id for interaction in seen] == [interaction.id for interaction in expected]
+        assert len(seen) == 53
+
+    def test_filters_offset_and_bad_cursor(self, db):
+        for number in range(12):
+            add_interaction(db, number, status="read" if number % 3 else "unread")
+        db.commit()
+
+        page, cursor = list_inbox_page(db, ORG_ID, limit=3, status="unread")
+        assert [interaction.status for interaction in page] == ["unread"] * 3
+        assert cursor is not None
+        assert len(list_inbox_page(db, ORG_ID, limit=3, cursor=cursor, status="unread")[0]) == 1
+
+        offset_page, _ = list_inbox_page(db, ORG_ID, limit=3, offset=3, status="unread")
+        assert [i.id for i in offset_page] == [i.id for i in list_inbox_page(db, ORG_ID, limit=3, cursor=cursor, status="unread")[0]]
+
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            decode_inbox_cursor("not-a-cursor")
+
+
+def test_counter_hooks_are_registered_by_the_models_alone():
+    code = (
+        "import sys\n"
+        "from sqlalchemy import event\n"
+        "from sqlalchemy.orm import Session\n"
+        "from backend.db import models\n"
+        "assert event.contains(Session, 'before_flush', models._fill_interaction_organization)\n"
+        "assert event.contains(Session, 'after_flush', models._maintain_inbox_counters)\n"
+        "assert 'backend.services.personality_response_engine' not in sys.modules\n"
+        "assert 'backend.services.inbox_counters' not in sys.modules\n"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+
+    assert result.returncode == 0, result.stderr
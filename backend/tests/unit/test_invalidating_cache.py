@@ -0,0 +1,49 @@
+"""
+Unit tests for the shared invalidating cache base
+"""
+import pytest
+
+from backend.services.invalidating_cache import InvalidatingCache
+
+
+class SquareCache(InvalidatingCache[int, int]):
+    def __init__(self, max_entries=10):
+        super().__init__(ttl_seconds=60, max_entries=max_entries)
+        self.on_build = None
+
+    def _build(self, db, keys, **context):
+        if self.on_build:
+            self.on_build()
+        return {key: (key * key, None) for key in keys}
+
+
+class TestInvalidatingCache:
+    def test_build_is_abstract(self):
+        with pytest.raises(TypeError):
+            InvalidatingCache(ttl_seconds=60, max_entries=10)
+
+    def test_misses_are_built_once_then_cached(self):
+        cache = SquareCache()
+
+        assert cache.get_many(None, [2, 3, 2]) == {2: 4, 3: 9}
+        assert cache.get(None, 3) == 9
+        assert (cache.builds, cache.hits, cache.misses) == (1, 1, 2)
+
+    def test_invalidation_during_build_is_not_overwritten(self):
+        cache = SquareCache()
+        cache.on_build = lambda: cache.invalidate(4)
+
+        assert cache.get(None, 4) == 16
+        assert 4 not in cache._entries
+
+    def test_generations_are_dropped_once_builds_finish(self):
+        cache = SquareCache(max_entries=1)
+        cache.on_build = lambda: cache.clear()
+        cache.get_many(None, [1, 2])
+        cache.on_build = None
+        for key in range(5):
+            cache.get(None, key)
+            cache.invalidate(key)
+
+        assert cache._generations == {}
+        assert len(cache._entries) <= 1
@@ -0,0 +1,143 @@
+"""
+Unit tests for the BM25 company knowledge index and keyword -> template map
+"""
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from backend.db.models import CompanyKnowledge, ResponseTemplate
+from backend.services.knowledge_index import (
+    BM25Index,
+    CompanyKnowledgeIndex,
+    ResponseTemplateIndex,
+    get_company_knowledge_index,
+    get_response_template_index,
+    set_company_knowledge_index,
+    set_response_template_index,
+    tokenize,
+)
+from backend.services.personality_response_engine import PersonalityResponseEngine
+
+
+@pytest.fixture
+def db():
+    previous = (get_company_knowledge_index(), get_response_template_index())
+    set_company_knowledge_index(CompanyKnowledgeIndex())
+    set_response_template_index(ResponseTemplateIndex())
+
+    engine = create_engine("sqlite://")
+    CompanyKnowledge.__table__.create(engine)
+    ResponseTemplate.__table__.create(engine)
+    session = sessionmaker(bind=engine)()
+    session.statements = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def record(conn, cursor, statement, parameters, context, executemany):
+        session.statements.append(statement.split()[0])
+
+    yield session
+    session.close()
+    set_company_knowledge_index(previous[0])
+    set_response_template_index(previous[1])
+
+
+def add_knowledge(db, entry_id, title, content, user_id=1, **kwargs):
+    db.add(CompanyKnowledge(id=entry_id, user_id=user_id, title=title, topic="faq", content=content, **kwargs))
+
+
+def add_template(db, template_id, priority, keywords, trigger_type="question", platforms=("facebook",), user_id=1):
+    db.add(ResponseTemplate(
+        id=template_id, user_id=user_id, name=template_id, trigger_type=trigger_type,
+        keywords=list(keywords), platforms=list(platforms), response_text="Hi!", priority=priority
+    ))
+
+
+class TestTokenize:
+    def test_drops_stopwords_and_stems(self):
+        assert tokenize("How much is washing the Driveways?") == ["much", "wash", "driveway"]
+
+
+class TestBM25Index:
+    def test_rarer_and_repeated_terms_rank_higher(self):
+        index = BM25Index({
+            "a": {"roof": 1, "clean": 1},
+            "b": {"roof": 3},
+            "c": {"clean": 1, "deck": 1},
+        })
+
+        assert [doc_id for doc_id, _ in index.search(["roof"])] == ["b", "a"]
+        assert index.search(["deck", "clean"])[0][0] == "c"
+        assert index.search(["gutter"]) == []
+
+
+class TestKnowledgeSearch:
+    def test_multi_keyword_query_is_one_ranked_lookup(self, db):
+        add_knowledge(db, "pricing", "Driveway pricing", "Driveway washing starts at $99.", keywords=["price"])
+        add_knowledge(db, "hours", "Business hours", "We are open Monday to Friday.")
+        add_knowledge(db, "roof", "Roof soft wash", "Soft washing removes algae from roofs.", tags=["roof"])
+        add_knowledge(db, "inactive", "Old driveway price", "Driveway price list", is_active=False)
+        add_knowledge(db, "other-user", "Driveway price", "Driveway price", user_id=2)
+        db.commit()
+        engine = PersonalityResponseEngine(db)
+        db.statements.clear()
+
+        results = engine.search_company_knowledge(1, ["what", "price", "driveway washing"])
+
+        assert [entry.id for entry in results] == ["pricing", "roof"]
+        # Index build + entry fetch, then only the entry fetch once built
+        assert db.statements == ["SELECT", "SELECT"]
+        db.statements.clear()
+        assert [entry.id for entry in engine.search_company_knowledge(1, ["roof", "algae"])] == ["roof"]
+        assert db.statements == ["SELECT"]
+
+    def test_committed_content_change_refreshes_index(self, db):
+        add_knowledge(db, "hours", "Business hours", "We are open Monday to Friday.")
+        db.commit()
+        engine = PersonalityResponseEngine(db)
+        assert engine.search_company_knowledge(1, ["saturday"]) == []
+
+        entry = db.get(CompanyKnowledge, "hours")
+        entry.content = "We are open Monday to Saturday."
+        db.commit()
+
+        assert [e.id for e in engine.search_company_knowledge(1, ["saturday"])] == ["hours"]
+
+    def test_usage_count_updates_keep_index(self, db):
+        add_knowledge(db, "hours", "Business hours", "We are open Monday to Friday.")
+        db.commit()
+        index = get_company_knowledge_index()
+        engine = PersonalityResponseEngine(db)
+        [entry] = engine.search_company_knowledge(1, ["hours"])
+
+        entry.usage_count = 5
+        db.commit()
+        engine.search_company_knowledge(1, ["hours"])
+
+        assert index.builds == 1
+
+
+class TestTemplateMatching:
+    def test_keyword_match_prefers_priority_then_falls_back(self, db):
+        add_template(db, "generic", 90, [])
+        add_template(db, "pricing-low", 10, ["price", "cost"])
+        add_template(db, "pricing-high", 60, ["Price"])
+        add_template(db, "twitter-only", 100, ["price"], platforms=["twitter"])
+        add_template(db, "complaint", 100, ["price"], trigger_type="complaint")
+        db.commit()
+        engine = PersonalityResponseEngine(db)
+
+        assert engine.find_matching_template(1, "question", "facebook", ["what", "price"]).id == "pricing-high"
+        assert engine.find_matching_template(1, "question", "facebook", ["COST"]).id == "pricing-low"
+        assert engine.find_matching_template(1, "question", "facebook", ["hello"]).id == "generic"
+        assert engine.find_matching_template(1, "praise", "facebook", ["price"]) is None
+
+    def test_template_changes_refresh_map(self, db):
+        add_template(db, "generic", 50, [])
+        db.commit()
+        engine = PersonalityResponseEngine(db)
+        assert engine.find_matching_template(1, "question", "facebook", ["price"]).id == "generic"
+
+        add_template(db, "pricing", 10, ["price"])
+        db.commit()
+
+        assert engine.find_matching_template(1, "question", "facebook", ["price"]).id == "pricing"
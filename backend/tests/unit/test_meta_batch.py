@@ -0,0 +1,241 @@
+"""
+Unit tests for the Meta Graph API batch executor, run against a local mock Graph server
+"""
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from backend.core import http_client
+from backend.integrations.meta_batch import (
+    MetaBatchExecutor,
+    MetaBatchRequest,
+    MetaUsageThrottle,
+)
+
+
+class MockGraphServer:
+    """
+    Minimal Graph API batch endpoint.
+
+    Sub-request paths drive the behaviour:
+    - ``<id>/insights``: insights body for the post
+    - ``flaky_<n>/...``: transient error on the first attempt
+    - ``dropped_<n>/...``: null (unprocessed) entry on the first attempt
+    - ``bad_<n>/...``: permanent OAuth error
+    """
+
+    def __init__(self):
+        self.batches = []
+        self.seen = {}
+        self.app_usage = {"call_count": 10, "total_cputime": 5, "total_time": 5}
+        self.business_usage = None
+        self._lock = threading.Lock()
+
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length", 0))
+                form = parse_qs(self.rfile.read(length).decode())
+                batch = json.loads(form["batch"][0])
+                with server._lock:
+                    server.batches.append({"token": form["access_token"][0], "size": len(batch)})
+                    body = json.dumps([server.respond(item) for item in batch]).encode()
+
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.send_header("X-App-Usage", json.dumps(server.app_usage))
+                if server.business_usage:
+                    self.send_header("X-Business-Use-Case-Usage", json.dumps(server.business_usage))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self._httpd.server_address[1]}/v22.0"
+
+    def respond(self, item):
+        path = urlsplit(item["relative_url"]).path
+        object_id = path.split("/")[0]
+        attempt = self.seen.get(object_id, 0) + 1
+        self.seen[object_id] = attempt
+
+        if object_id.startswith("dropped_") and attempt == 1:
+            return None
+        if object_id.startswith("flaky_") and attempt == 1:
+            error = {"message": "An unexpected error has occurred", "code": 2, "is_transient": True}
+            return {"code": 500, "body": json.dumps({"error": error})}
+        if object_id.startswith("bad_"):
+            error = {"message": "Invalid OAuth access token", "code": 190, "type": "OAuthException"}
+            return {"code": 400, "body": json.dumps({"error": error})}
+
+        body = {
+            "data": [
+                {"name": "post_impressions", "values": [{"value": 100}]},
+                {"name": "post_reach", "values": [{"value": 80}]},
+                {"name": "post_reactions_by_type_total", "values": [{"value": {"like": 4, "love": 1}}]}
+            ],
+            "id": object_id
+        }
+        return {"code": 200, "body": json.dumps(body)}
+
+    def start(self):
+        threading.Thread(target=self._httpd.serve_forever, daemon=True).start()
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+
+@pytest.fixture
+def graph_server(monkeypatch):
+    monkeypatch.setattr(http_client, "_platform_clients", {})
+    server = MockGraphServer()
+    server.start()
+    yield server
+    server.stop()
+
+
+def make_executor(graph_server, **kwargs):
+    kwargs.setdefault("retry_base_delay", 0)
+    kwargs.setdefault("throttle", MetaUsageThrottle(max_delay=0.05))
+    return MetaBatchExecutor(graph_server.url, **kwargs)
+
+
+def insights_request(object_id):
+    return MetaBatchRequest.get(f"/{object_id}/insights", {"metric": "post_impressions", "period": "lifetime"})
+
+
+class TestMetaBatchExecutor:
+    @pytest.mark.asyncio
+    async def test_packs_fifty_sub_requests_per_call(self, graph_server):
+        executor = make_executor(graph_server)
+        ids = [f"post_{i}" for i in range(120)]
+
+        results = await executor.execute("token-1", [insights_request(i) for i in ids])
+
+        assert [batch["size"] for batch in graph_server.batches] == [50, 50, 20]
+        assert all(batch["token"] == "token-1" for batch in graph_server.batches)
+        assert all(result.ok for result in results)
+        assert [result.data["id"] for result in results] == ids
+
+    @pytest.mark.asyncio
+    async def test_retries_only_transient_and_dropped_items(self, graph_server):
+        executor = make_executor(graph_server)
+        ids = ["post_1", "flaky_1", "dropped_1", "bad_1", "post_2"]
+
+        results = await executor.execute("token", [insights_request(i) for i in ids])
+        by_id = dict(zip(ids, results))
+
+        assert by_id["post_1"].ok and by_id["post_1"].attempts == 1
+        assert by_id["flaky_1"].ok and by_id["flaky_1"].attempts == 2
+        assert by_id["dropped_1"].ok and by_id["dropped_1"].attempts == 2
+        assert not by_id["bad_1"].ok
+        assert by_id["bad_1"].error["code"] == 190
+        assert by_id["bad_1"].attempts == 1
+
+        # The retry batch only carried the two transient items
+        assert [batch["size"] for batch in graph_server.batches] == [5, 2]
+        assert executor.get_stats()["failed_sub_requests"] == 1
+
+    @pytest.mark.asyncio
+    async def test_throttles_on_high_app_usage(self, graph_server):
+        graph_server.app_usage = {"call_count": 95, "total_cputime": 20, "total_time": 30}
+        throttle = MetaUsageThrottle(threshold=75.0, max_delay=0.05)
+        executor = make_executor(graph_server, throttle=throttle, max_concurrent_batches=1)
+
+        await executor.execute("token", [insights_request(f"post_{i}") for i in range(60)])
+
+        assert throttle.usage == 95
+        # Second batch waited after the first reported 95% usage
+        assert throttle.waits == 1
+
+    @pytest.mark.asyncio
+    async def test_facebook_client_batches_post_insights(self, graph_server):
+        from backend.integrations.facebook_client import FacebookAPIClient
+
+        client = FacebookAPIClient()
+        client.batch_executor = make_executor(graph_server)
+        post_ids = [f"post_{i}" for i in range(75)] + ["bad_1"]
+
+        insights = await client.get_posts_insights("page-token", post_ids)
+
+        assert len(graph_server.batches) == 2
+        assert insights["post_3"].impressions == 100
+        assert insights["post_3"].reactions == 5
+        assert insights["bad_1"].impressions == 0
+
+
+class TestMetaUsageThrottle:
+    def test_below_threshold_does_not_wait(self):
+        throttle = MetaUsageThrottle(threshold=75.0, max_delay=100.0)
+        throttle.update({"x-app-usage": json.dumps({"call_count": 40, "total_cputime": 10, "total_time": 12})})
+
+        assert throttle.usage == 40
+        assert throttle.delay() == 0
+
+    def test_delay_scales_with_usage(self):
+        throttle = MetaUsageThrottle(threshold=75.0, max_delay=100.0)
+        throttle.update({"x-app-usage": json.dumps({"call_count": 10, "total_cputime": 90, "total_time": 20})})
+
+        assert throttle.delay() == pytest.approx(60.0)
+
+    def test_business_use_case_regain_time(self):
+        throttle = MetaUsageThrottle(threshold=75.0, max_delay=600.0)
+        throttle.update({"x-business-use-case-usage": json.dumps({
+            "1234": [{"type": "pages", "call_count": 100, "total_cputime": 30,
+                      "total_time": 40, "estimated_time_to_regain_access": 5}]
+        })})
+
+        assert throttle.usage == 100
+        assert 290 < throttle.delay() <= 300
+
+    def test_headers_missing_keep_previous_usage(self):
+        throttle = MetaUsageThrottle()
+        throttle.update({"x-app-usage": json.dumps({"call_count": 80})})
+        throttle.update({})
+
+        assert throttle.usage == 80
+
+    def test_rate_limit_backs_off_without_pinning_usage(self, monkeypatch):
+        clock = [1000.0]
+        monkeypatch.setattr("backend.integrations.meta_batch.time.monotonic", lambda: clock[0])
+        throttle = MetaUsageThrottle(threshold=75.0, max_delay=300.0, penalty_delay=30.0)
+        throttle.update({"x-app-usage": json.dumps({"call_count": 40})})
+
+        throttle.penalize()
+        # Other sub-requests of the same batch do not extend the backoff
+        throttle.penalize()
+
+        assert throttle.usage == 40
+        assert throttle.delay() == pytest.approx(30.0)
+
+        clock[0] += 31
+        assert throttle.delay() == 0
+
+        throttle.penalize()
+        assert throttle.delay() == pytest.approx(60.0)
+
+        # Once the window has long reset the backoff starts over
+        clock[0] += 1000
+        throttle.penalize()
+        assert throttle.delay() == pytest.approx(30.0)
+
+    def test_rate_limit_honors_retry_after(self, monkeypatch):
+        clock = [1000.0]
+        monkeypatch.setattr("backend.integrations.meta_batch.time.monotonic", lambda: clock[0])
+        throttle = MetaUsageThrottle(max_delay=300.0)
+
+        throttle.penalize(retry_after=12)
+        assert throttle.delay() == pytest.approx(12.0)
+
+        throttle.penalize(retry_after=3600)
+        assert throttle.delay() == pytest.approx(300.0)
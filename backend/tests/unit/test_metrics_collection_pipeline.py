@@ -0,0 +1,228 @@
+"""
+Unit tests for the batched, concurrent metrics collection pipeline
+"""
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from backend.db.models import ContentItem, ContentPerformanceRollup, ContentPerformanceSnapshot
+from backend.services import metrics_collection
+from backend.services.metrics_collection import (
+    Platform,
+    PlatformRateBudget,
+    SocialMediaAccount,
+    SocialMediaMetricsCollector,
+)
+
+
+class FakeTwitterClient:
+    """Multi-id tweet lookup that records every call"""
+
+    def __init__(self, delay: float = 0.0, missing=()):
+        self.calls = []
+        self.delay = delay
+        self.missing = set(missing)
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def get_tweets_metrics(self, access_token, tweet_ids):
+        self.calls.append((access_token, list(tweet_ids)))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(self.delay)
+        self.in_flight -= 1
+
+        return {
+            tweet_id: {
+                "tweet_id": tweet_id,
+                "likes_count": 10,
+                "retweets_count": 2,
+                "replies_count": 3,
+                "quotes_count": 1,
+                "bookmarks_count": 0,
+                "impressions_count": 400,
+                "total_engagement": 15,
+                "engagement_rate": 3.75
+            }
+            for tweet_id in tweet_ids if tweet_id not in self.missing
+        }
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://")
+    ContentItem.__table__.create(engine)
+    ContentPerformanceSnapshot.__table__.create(engine)
+    ContentPerformanceRollup.__table__.create(engine)
+    session = sessionmaker(bind=engine)()
+    session.commits = 0
+
+    @event.listens_for(session, "after_commit")
+    def count_commit(_session):
+        session.commits += 1
+
+    yield session
+    session.close()
+
+
+def add_posts(db, user_id, count, last_update=None, likes=0):
+    db.add_all([
+        ContentItem(
+            id=f"content-{user_id}-{i}",
+            user_id=user_id,
+            content="post",
+            platform="twitter",
+            content_type="text",
+            status="published",
+            published_at=datetime.now(timezone.utc) - timedelta(minutes=i),
+            platform_post_id=f"tweet-{user_id}-{i}",
+            likes_count=likes,
+            last_performance_update=last_update
+        )
+        for i in range(count)
+    ])
+    db.commit()
+    db.commits = 0
+
+
+def make_collector(accounts, twitter, monkeypatch):
+    monkeypatch.setattr(metrics_collection, "twitter_client", twitter)
+    collector = SocialMediaMetricsCollector()
+    collector._get_active_accounts = lambda db, platform: accounts
+    return collector
+
+
+def twitter_account(user_id):
+    return SocialMediaAccount(platform="twitter", account_id=f"acct-{user_id}", access_token=f"token-{user_id}", user_id=user_id)
+
+
+class TestBatchedCollection:
+    @pytest.mark.asyncio
+    async def test_lookups_batched_and_committed_per_batch(self, db, monkeypatch):
+        add_posts(db, user_id=1, count=230)
+        add_posts(db, user_id=2, count=20)
+        twitter = FakeTwitterClient()
+        collector = make_collector([twitter_account(1), twitter_account(2)], twitter, monkeypatch)
+
+        [result] = await collector.collect_all_metrics(db, platforms=[Platform.TWITTER])
+
+        assert result.success
+        assert result.metrics_collected == 250
+        assert sorted(len(ids) for _, ids in twitter.calls) == [20, 30, 100, 100]
+        assert db.commits == 4
+        assert db.query(ContentPerformanceSnapshot).count() == 250
+
+        item = db.get(ContentItem, "content-1-0")
+        assert item.likes_count == 10
+        assert item.shares_count == 3
+        assert item.reach_count == 400
+        assert item.last_performance_update is not None
+
+    @pytest.mark.asyncio
+    async def test_only_due_posts_collected_and_growth_recorded(self, db, monkeypatch):
+        add_posts(db, user_id=1, count=5, likes=4)
+        recent = datetime.now(timezone.utc) - timedelta(minutes=1)
+        db.query(ContentItem).filter(ContentItem.id.in_(["content-1-0", "content-1-1"])).update(
+            {"last_performance_update": recent}, synchronize_session=False
+        )
+        db.commit()
+        twitter = FakeTwitterClient()
+        collector = make_collector([twitter_account(1)], twitter, monkeypatch)
+
+        [result] = await collector.collect_all_metrics(db, platforms=[Platform.TWITTER])
+
+        assert result.metrics_collected == 3
+        assert sorted(twitter.calls[0][1]) == ["tweet-1-2", "tweet-1-3", "tweet-1-4"]
+        snapshot = db.query(ContentPerformanceSnapshot).filter_by(content_item_id="content-1-2").one()
+        assert snapshot.likes_growth == 6
+        assert snapshot.platform_metrics["impressions"] == 400
+
+    @pytest.mark.asyncio
+    async def test_summary_reports_reach_from_rollups(self, db, monkeypatch):
+        add_posts(db, user_id=1, count=3)
+        collector = make_collector([twitter_account(1)], FakeTwitterClient(), monkeypatch)
+        await collector.collect_all_metrics(db, platforms=[Platform.TWITTER])
+
+        summary = await collector.get_metrics_summary(db)
+
+        assert summary["total_content"] == 3
+        assert summary["total_reach"] == 1200
+        assert summary["platforms"]["twitter"]["reach"] == 1200
+        assert "total_impressions" not in summary
+
+    @pytest.mark.asyncio
+    async def test_missing_posts_reported_without_failing_batch(self, db, monkeypatch):
+        add_posts(db, user_id=1, count=3)
+        twitter = FakeTwitterClient(missing={"tweet-1-1"})
+        collector = make_collector([twitter_account(1)], twitter, monkeypatch)
+
+        [result] = await collector.collect_all_metrics(db, force_collection=True, platforms=[Platform.TWITTER])
+
+        assert result.metrics_collected == 2
+        assert len(result.errors) == 1
+        assert "content-1-1" in result.errors[0]
+        assert db.commits == 1
+
+    @pytest.mark.asyncio
+    async def test_accounts_run_concurrently_within_budget(self, db, monkeypatch):
+        accounts = []
+        for user_id in range(1, 7):
+            add_posts(db, user_id=user_id, count=2)
+            accounts.append(twitter_account(user_id))
+        twitter = FakeTwitterClient(delay=0.05)
+        collector = make_collector(accounts, twitter, monkeypatch)
+        collector.rate_budgets[Platform.TWITTER]["max_concurrent_accounts"] = 3
+
+        [result] = await collector.collect_all_metrics(db, platforms=[Platform.TWITTER])
+
+        assert result.metrics_collected == 12
+        assert twitter.max_in_flight == 3
+
+
+class TestPlatformRateBudget:
+    @pytest.mark.asyncio
+    async def test_burst_then_spaced_by_refill_rate(self):
+        budget = PlatformRateBudget(max_concurrent_accounts=1, requests_per_window=2, window_seconds=0.2)
+
+        await budget.acquire()
+        await budget.acquire()
+        assert budget.wait_time == 0
+
+        await budget.acquire()
+        assert budget.wait_time == pytest.approx(0.1, abs=0.02)
+        assert budget.requests == 3
+
+
+class TestTwitterMultiIdLookup:
+    @pytest.mark.asyncio
+    async def test_lookup_chunks_ids_and_skips_errors(self, monkeypatch):
+        import httpx
+        from backend.core import http_client
+        from backend.core.http_client import HTTPClient, HTTPClientConfig
+        from backend.integrations.twitter_client import TwitterClient
+
+        requested = []
+
+        def handler(request):
+            ids = request.url.params["ids"].split(",")
+            requested.append(ids)
+            return httpx.Response(200, json={
+                "data": [{"id": i, "public_metrics": {"like_count": 1, "impression_count": 10}} for i in ids if i != "7"],
+                "errors": [{"resource_id": "7", "detail": "Not Found"}] if "7" in ids else []
+            })
+
+        config = HTTPClientConfig.for_platform("twitter")
+        config.max_retries = 0
+        monkeypatch.setattr(http_client, "_platform_clients", {
+            "twitter": HTTPClient(config, name="twitter", transport=httpx.MockTransport(handler))
+        })
+
+        metrics = await TwitterClient().get_tweets_metrics("token", [str(i) for i in range(150)])
+
+        assert [len(ids) for ids in requested] == [100, 50]
+        assert len(metrics) == 149
+        assert metrics["8"]["likes_count"] == 1
+        assert metrics["8"]["engagement_rate"] == 10.0
@@ -0,0 +1,188 @@
+"""
+Unit tests for the shared moderation verdict cache
+"""
+import asyncio
+import time
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from backend.services import moderation_cache
+from backend.services.moderation_cache import ModerationVerdictCache, content_fingerprint
+from backend.services.content_moderation_service import ContentModerationService, ModerationResult
+from backend.services.content_safety_service import ContentSafetyService
+
+
+def make_openai_client(delay: float = 0.0):
+    """Fake AsyncOpenAI client returning a clean moderation result"""
+    async def create(**kwargs):
+        await asyncio.sleep(delay)
+        result = SimpleNamespace(
+            flagged=False,
+            categories={'sexual': False, 'violence': False},
+            category_scores={'sexual': 0.01, 'violence': 0.02}
+        )
+        return SimpleNamespace(results=[result])
+
+    client = MagicMock()
+    client.moderations.create = AsyncMock(side_effect=create)
+    return client
+
+
+@pytest.fixture
+def verdict_cache():
+    """Fresh process-wide cache for every test"""
+    cache = ModerationVerdictCache()
+    with patch.object(moderation_cache, '_moderation_cache', cache):
+        yield cache
+
+
+@pytest.fixture
+def openai_client():
+    return make_openai_client(delay=0.01)
+
+
+@pytest.fixture
+def moderation_service(verdict_cache, openai_client):
+    service = ContentModerationService()
+    service.moderation_enabled = True
+    service.openai_client = openai_client
+    return service
+
+
+class TestModerationVerdictCache:
+    """Test verdict cache behaviour"""
+
+    def test_fingerprint_normalizes_whitespace_edges(self):
+        assert content_fingerprint("  hello world \n") == content_fingerprint("hello world")
+        assert content_fingerprint("hello world") != content_fingerprint("hello  world")
+
+    def test_policy_version_partitions_keys(self):
+        cache = ModerationVerdictCache(policy_version="v1")
+        cache.set("openai", "text", {"flagged": False})
+        assert cache.get("openai", "text") == {"flagged": False}
+
+        cache.policy_version = "v2"
+        assert cache.get("openai", "text") is None
+
+    def test_lru_eviction_and_ttl(self):
+        cache = ModerationVerdictCache(max_entries=2, ttl_seconds=60)
+        cache.set("ns", "a", {"v": 1})
+        cache.set("ns", "b", {"v": 2})
+        cache.get("ns", "a")
+        cache.set("ns", "c", {"v": 3})
+
+        assert cache.get("ns", "b") is None
+        assert cache.get("ns", "a") == {"v": 1}
+
+        cache.ttl_seconds = -1
+        cache.set("ns", "d", {"v": 4})
+        assert cache.get("ns", "d") is None
+
+    def test_returned_values_are_copies(self):
+        cache = ModerationVerdictCache()
+        cache.set("ns", "a", {"categories": {}})
+        cache.get("ns", "a")["categories"]["x"] = 1
+        assert cache.get("ns", "a") == {"categories": {}}
+
+    @pytest.mark.asyncio
+    async def test_concurrent_lookups_share_one_computation(self):
+        cache = ModerationVerdictCache()
+        calls = 0
+
+        async def compute():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return {"flagged": False}
+
+        results = await asyncio.gather(*[
+            cache.get_or_compute("openai", "same text", compute) for _ in range(5)
+        ])
+
+        assert calls == 1
+        assert all(r == {"flagged": False} for r in results)
+
+    @pytest.mark.asyncio
+    async def test_errors_are_not_cached(self):
+        cache = ModerationVerdictCache()
+        compute = AsyncMock(side_effect=[RuntimeError("rate limited"), {"flagged": False}])
+
+        with pytest.raises(RuntimeError):
+            await cache.get_or_compute("openai", "text", compute)
+
+        assert await cache.get_or_compute("openai", "text", compute) == {"flagged": False}
+        assert compute.await_count == 2
+
+
+class TestModerationServiceCaching:
+    """Test ContentModerationService with the verdict cache"""
+
+    @pytest.mark.asyncio
+    async def test_resubmitted_draft_is_served_from_cache(self, moderation_service, openai_client):
+        draft = "Spring cleaning special: driveway and patio washing this week"
+
+        first = await moderation_service.moderate_content(draft, context={'attempt': 1})
+
+        start = time.perf_counter()
+        second = await moderation_service.moderate_content(draft, context={'attempt': 2})
+        elapsed_ms = (time.perf_counter() - start) * 1000
+
+        assert first['result'] == ModerationResult.APPROVED.value
+        assert second['result'] == first['result']
+        assert second['cached'] is True
+        assert second['context'] == {'attempt': 2}
+        assert elapsed_ms < 1.0
+        assert openai_client.moderations.create.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_openai_errors_are_retried(self, moderation_service, openai_client):
+        openai_client.moderations.create.side_effect = RuntimeError("timeout")
+
+        first = await moderation_service.moderate_content("Fresh draft text")
+        second = await moderation_service.moderate_content("Fresh draft text")
+
+        assert 'api_error' in first['categories']
+        assert 'cached' not in second
+        assert openai_client.moderations.create.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_local_layers_overlap_remote_call(self, moderation_service):
+        moderation_service.openai_client = make_openai_client(delay=0.05)
+        order = []
+
+        original = moderation_service._pattern_matching
+
+        async def tracking_pattern_matching(content, content_type):
+            order.append('pattern')
+            return await original(content, content_type)
+
+        moderation_service._pattern_matching = tracking_pattern_matching
+        original_openai = moderation_service._openai_moderation
+
+        async def tracking_openai(content):
+            result = await original_openai(content)
+            order.append('openai_done')
+            return result
+
+        moderation_service._openai_moderation = tracking_openai
+
+        await moderation_service.moderate_content("Concurrent layer check")
+
+        assert order == ['pattern', 'openai_done']
+
+    @pytest.mark.asyncio
+    async def test_safety_service_shares_remote_verdict(self, moderation_service, openai_client):
+        safety_service = ContentSafetyService()
+        safety_service.openai_client = openai_client
+        text = "Book your roof soft wash before the holidays"
+
+        await asyncio.gather(
+            moderation_service.moderate_image_prompt(text),
+            safety_service._check_openai_moderation(text)
+        )
+        flags = await safety_service._check_openai_moderation(text)
+
+        assert flags['status'] == 'completed'
+        assert flags['flagged'] is False
+        assert openai_client.moderations.create.await_count == 1
@@ -0,0 +1,147 @@
+"""
+Unit tests for the shared multi-pattern matching engine
+"""
+import re
+import pytest
+
+from backend.services.multi_pattern_matcher import (
+    MultiPatternMatcher,
+    PatternRule,
+    get_pattern_matcher,
+)
+from backend.services.avoid_list_processor import AvoidListProcessor, AvoidListRule, ContentCategory, ProcessingMode
+from backend.services.content_moderation_service import _build_moderation_rules
+
+
+SAMPLE_TEXTS = [
+    "Fake news! This conspiracy about Star  Wars and Coca Cola is a hoax.",
+    "A hot woman in a tight dress at the bedroom scene, explicitly graphic imagery",
+    "Kill the weeds, not the lawn. Violence-free pressure washing since 1999.",
+    "dc-comics fans: cocacola and coca\tcola giveaway, no gun or knife allowed",
+    "Nothing to see here, just a clean driveway and a happy customer.",
+    "hate HATE Hate; nazi propaganda is misleading and fake",
+    "",
+]
+
+
+class TestMultiPatternMatcher:
+    """Test single-scan matching semantics"""
+
+    @pytest.fixture
+    def rules(self):
+        return _build_moderation_rules() + [
+            PatternRule(rule_id=f"avoid:{i}", category=rule.category.value, pattern=rule.pattern)
+            for i, rule in enumerate(AvoidListProcessor()._all_rules())
+        ]
+
+    def test_literal_and_regex_rules_are_split(self, rules):
+        matcher = MultiPatternMatcher(rules)
+        stats = matcher.get_stats()
+
+        assert stats["literal_rules"] > 0
+        assert stats["regex_rules"] > 0
+        assert stats["literal_rules"] + stats["regex_rules"] == len(rules)
+
+    @pytest.mark.parametrize("text", SAMPLE_TEXTS)
+    def test_hits_match_findall_per_rule(self, rules, text):
+        """Every rule reports exactly what re.findall would on its own"""
+        matcher = MultiPatternMatcher(rules)
+        grouped = matcher.group_by_rule(matcher.scan(text))
+
+        for rule in rules:
+            source = rule.pattern if rule.is_regex else re.escape(rule.pattern)
+            expected = [m.group(0) for m in re.finditer(source, text, re.IGNORECASE)]
+            actual = [hit.text for hit in grouped.get(rule.rule_id, [])]
+            assert actual == expected, rule.pattern
+
+    def test_hits_carry_category_and_offsets(self):
+        matcher = MultiPatternMatcher([
+            PatternRule(rule_id="brands", category="copyrighted", pattern=r'\b(?:star\s+wars|coca\s*cola)\b'),
+            PatternRule(rule_id="combo", category="nsfw", pattern=r'\b(hot)\b.*\b(woman)\b'),
+        ])
+        text = "Hot deals: Star Wars mugs, CocaCola and a hot woman"
+
+        hits = matcher.scan(text)
+
+        assert [(h.rule_id, h.category, h.text) for h in hits] == [
+            ("combo", "nsfw", "Hot deals: Star Wars mugs, CocaCola and a hot woman"),
+            ("brands", "copyrighted", "Star Wars"),
+            ("brands", "copyrighted", "CocaCola"),
+        ]
+        assert all(text[h.start:h.end] == h.text for h in hits)
+
+    def test_backreferences_and_inline_flags_get_their_own_regex(self):
+        rules = [
+            PatternRule(rule_id="repeat", category="spam", pattern=r'(\w)\1{2,}'),
+            PatternRule(rule_id="named", category="spam", pattern=r'(?P<word>\w+) (?P=word)'),
+            PatternRule(rule_id="verbose", category="spam", pattern=r'(?x) buy \s+ now'),
+            PatternRule(rule_id="plain", category="spam", pattern=r'(\w)(\w)!'),
+        ]
+        matcher = MultiPatternMatcher(rules)
+        text = "Sooo good good, buy   now ok!"
+
+        grouped = matcher.group_by_rule(matcher.scan(text))
+
+        assert matcher.get_stats()["standalone_rules"] == 3
+        for rule in rules:
+            expected = [m.group(0) for m in re.finditer(rule.pattern, text, re.IGNORECASE)]
+            assert [hit.text for hit in grouped.get(rule.rule_id, [])] == expected, rule.pattern
+
+    def test_rules_keep_their_own_flags(self):
+        matcher = MultiPatternMatcher([
+            PatternRule(rule_id="exact", category="brand", pattern=r'\b(ACME)\b', flags=0),
+            PatternRule(rule_id="exact_literal", category="brand", pattern="Widget", is_regex=False, flags=0),
+            PatternRule(rule_id="any_case", category="brand", pattern=r'\b(acme)\b'),
+        ])
+
+        hits = matcher.scan("ACME acme Acme widget Widget")
+
+        assert [(h.rule_id, h.start) for h in hits if h.rule_id != "any_case"] == [("exact", 0), ("exact_literal", 22)]
+        assert [h.text for h in hits if h.rule_id == "any_case"] == ["ACME", "acme", "Acme"]
+
+    def test_matchers_are_shared_per_version(self):
+        rules = [PatternRule(rule_id="a", category="x", pattern=r'\b(alpha)\b')]
+
+        first = get_pattern_matcher("unit_test_rules", "v1", rules)
+        assert get_pattern_matcher("unit_test_rules", "v1", []) is first
+        assert get_pattern_matcher("unit_test_rules", "v2", rules) is not first
+
+
+class TestAvoidListProcessorMatching:
+    """Test avoid list processing on top of the shared engine"""
+
+    def test_filter_out_replaces_all_matches(self):
+        processor = AvoidListProcessor()
+
+        result = processor.process_content("A sexy pose with a knife and a Pepsi", strict_mode=False)
+
+        assert result["processed_content"] == (
+            "A elegant and artistic pose with a peaceful scene and a generic brand"
+        )
+        assert not result["blocked"]
+        categories = [v["category"] for v in result["violations"]]
+        assert categories == ["nsfw", "violence", "copyrighted"]
+
+    def test_block_request_stops_processing(self):
+        processor = AvoidListProcessor()
+
+        result = processor.process_content("nsfw poster with a gun")
+
+        assert result["blocked"] is True
+        assert len(result["violations"]) == 1
+        assert result["processed_content"] == "nsfw poster with a gun"
+
+    def test_custom_rule_triggers_recompile(self):
+        processor = AvoidListProcessor()
+        assert processor.process_content("grumpy cat")["violations"] == []
+
+        processor.add_custom_rule(AvoidListRule(
+            pattern=r'\b(?:grumpy)\b',
+            category=ContentCategory.QUALITY_ISSUES,
+            severity="low",
+            processing_mode=ProcessingMode.NEGATIVE_PROMPT,
+            description="Mood"
+        ))
+
+        result = processor.process_content("grumpy cat")
+        assert result["negative_prompts"] == ["grumpy"]
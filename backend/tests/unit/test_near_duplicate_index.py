@@ -0,0 +1,153 @@
+"""
+Unit tests for the SimHash near-duplicate index and its embedding pre-check
+"""
+import random
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from backend.services import embedding_service as embedding_module
+from backend.services.embedding_service import EmbeddingService
+from backend.services.near_duplicate_index import (
+    MAX_HAMMING_DISTANCE,
+    NearDuplicateIndex,
+    hamming_distance,
+    simhash,
+)
+
+POST = (
+    "Spring special! Book your driveway pressure washing today and get 20% off. "
+    "Call now for a free quote from our family owned team."
+)
+REWORDED = (
+    "Spring special!! Book your driveway pressure washing today & get 20% off - "
+    "call now for a free quote from our family-owned team https://t.co/abc"
+)
+UNRELATED = "We cleaned a roof in Austin yesterday, check out the before and after photos of this transformation."
+
+
+def flip_bits(fingerprint, bits):
+    for bit in bits:
+        fingerprint ^= 1 << bit
+    return fingerprint
+
+
+class TestSimhash:
+    def test_ignores_case_punctuation_and_links(self):
+        assert simhash(POST) == simhash(POST.upper() + " https://example.com/offer")
+
+    def test_reworded_posts_stay_close_and_unrelated_ones_do_not(self):
+        assert hamming_distance(simhash(POST), simhash(REWORDED)) <= MAX_HAMMING_DISTANCE
+        assert hamming_distance(simhash(POST), simhash(UNRELATED)) > MAX_HAMMING_DISTANCE
+
+    def test_empty_text(self):
+        assert simhash("") == 0
+
+
+class TestNearDuplicateIndex:
+    def test_finds_reworded_copy_within_organization_only(self):
+        index = NearDuplicateIndex()
+        index.add("post-1", POST, organization_id="org-a")
+        index.add("post-2", UNRELATED, organization_id="org-a")
+
+        assert [match.item_id for match in index.find_near_duplicates(REWORDED, "org-a")] == ["post-1"]
+        assert index.find_near_duplicates(REWORDED, "org-b") == []
+
+    def test_banded_lookup_finds_every_fingerprint_within_threshold(self):
+        rng = random.Random(3)
+        index = NearDuplicateIndex()
+        probe = rng.getrandbits(64)
+        expected = {}
+        for distance in range(MAX_HAMMING_DISTANCE + 3):
+            for copy in range(5):
+                item_id = f"d{distance}-{copy}"
+                index.add(item_id, "", fingerprint=flip_bits(probe, rng.sample(range(64), distance)))
+                if distance <= MAX_HAMMING_DISTANCE:
+                    expected[item_id] = distance
+        for number in range(2000):
+            index.add(f"random-{number}", "", fingerprint=rng.getrandbits(64))
+
+        matches = index.find_near_duplicates("", fingerprint=probe)
+
+        assert {match.item_id: match.distance for match in matches} == expected
+        assert [match.distance for match in matches] == sorted(match.distance for match in matches)
+
+    def test_readding_replaces_and_remove_forgets(self):
+        index = NearDuplicateIndex()
+        index.add("post-1", POST)
+        index.add("post-1", UNRELATED)
+
+        assert index.find_first(POST) is None
+        assert index.find_first(UNRELATED).item_id == "post-1"
+        assert index.remove("post-1")
+        assert index.find_first(UNRELATED) is None
+        assert len(index) == 0
+
+    def test_posts_without_words_never_match(self):
+        index = NearDuplicateIndex()
+        index.add("party", "🎉🎉🎉", organization_id="org-a")
+        index.add("sale", "https://shop.example.com/spring-sale", organization_id="org-a")
+
+        assert index.find_near_duplicates("👍 !!!", "org-a") == []
+        assert index.find_near_duplicates("https://other.example.org/careers", "org-a") == []
+        assert len(index) == 0
+
+
+@pytest.fixture
+def service(monkeypatch):
+    fake_store = MagicMock()
+    fake_store.add_vector.side_effect = lambda vector, content_id, metadata: content_id
+    fake_store.add_vectors_batch.side_effect = lambda vectors, content_ids, metadata_list: content_ids
+    monkeypatch.setattr(embedding_module, "vector_store", fake_store)
+
+    embedding_service = EmbeddingService()
+    embedding_service.near_duplicates = NearDuplicateIndex()
+    embedding_service._near_duplicates_loaded = True
+    embedding_service.create_embedding_sync = MagicMock(return_value=np.ones(3) / np.sqrt(3))
+    embedding_service.create_batch_embeddings = MagicMock(
+        side_effect=lambda texts: _resolved([np.ones(3) / np.sqrt(3) for _ in texts])
+    )
+    return embedding_service
+
+
+async def _resolved(value):
+    return value
+
+
+class TestEmbeddingPreCheck:
+    def test_reworded_copy_is_not_embedded_again(self, service):
+        first = service.store_content_with_embedding(POST, {"organization_id": "org-a"})
+        duplicate = service.store_content_with_embedding(REWORDED, {"organization_id": "org-a"})
+        other_org = service.store_content_with_embedding(REWORDED, {"organization_id": "org-b"})
+
+        assert service.create_embedding_sync.call_count == 2
+        assert duplicate.success and duplicate.embedding is None
+        assert duplicate.content_id == first.content_id
+        assert duplicate.metadata["near_duplicate_of"] == first.content_id
+        assert other_org.embedding is not None
+
+    @pytest.mark.asyncio
+    async def test_batch_skips_duplicates_within_the_batch(self, service):
+        results = await service.store_batch_content(
+            [POST, UNRELATED, REWORDED],
+            [{"organization_id": "org-a"}] * 3,
+            content_ids=["post", "roof", "reworded"]
+        )
+
+        embedded_texts = service.create_batch_embeddings.call_args.args[0]
+        assert embedded_texts == [POST, UNRELATED]
+        assert [result.content_id for result in results] == ["post", "roof", "post"]
+        assert all(result.success for result in results)
+        assert service.find_near_duplicate(REWORDED, {"organization_id": "org-a"}).item_id == "post"
+
+    @pytest.mark.asyncio
+    async def test_posts_without_words_are_embedded(self, service):
+        results = await service.store_batch_content(
+            ["🎉🎉🎉", "👍 !!!"], [{"organization_id": "org-a"}] * 2, content_ids=["party", "thumbs"]
+        )
+        single = service.store_content_with_embedding("https://other.example.org/careers", {"organization_id": "org-a"})
+
+        assert service.create_batch_embeddings.call_args.args[0] == ["🎉🎉🎉", "👍 !!!"]
+        assert [result.content_id for result in results] == ["party", "thumbs"]
+        assert single.embedding is not None
@@ -0,0 +1,146 @@
+"""
+Unit tests for delta-only performance snapshots, rollups and partition helpers
+"""
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from backend.db.models import ContentItem, ContentPerformanceRollup, ContentPerformanceSnapshot
+from backend.services.performance_snapshot_store import (
+    PerformanceSnapshotStore,
+    bucket_start,
+    counters_changed,
+    partition_ddl,
+)
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://")
+    for model in (ContentItem, ContentPerformanceSnapshot, ContentPerformanceRollup):
+        model.__table__.create(engine)
+    session = sessionmaker(bind=engine)()
+    session.add(ContentItem(
+        id="content-1", user_id=1, content="post", platform="twitter",
+        content_type="text", status="published"
+    ))
+    session.commit()
+    yield session
+    session.close()
+
+
+def snapshot(at, likes=10, engagement_rate=1.0, velocity=0.0):
+    return {
+        "content_item_id": "content-1",
+        "snapshot_time": at,
+        "likes_count": likes,
+        "shares_count": 1,
+        "comments_count": 2,
+        "reach_count": 100,
+        "click_count": 0,
+        "engagement_rate": engagement_rate,
+        "engagement_velocity": velocity
+    }
+
+
+class TestDeltaOnlySnapshots:
+    def test_unchanged_counters_are_skipped(self, db):
+        store = PerformanceSnapshotStore()
+        t0 = datetime(2026, 10, 18, 9, 5, tzinfo=timezone.utc)
+
+        assert store.write_snapshots(db, [snapshot(t0)]) == 1
+        previous = {"content-1": snapshot(t0)}
+        assert store.write_snapshots(db, [snapshot(t0 + timedelta(hours=1))], previous) == 0
+        assert store.write_snapshots(db, [snapshot(t0 + timedelta(hours=2), likes=11)], previous) == 1
+        db.commit()
+
+        assert db.query(ContentPerformanceSnapshot).count() == 2
+
+    def test_counters_changed(self):
+        current = snapshot(None)
+        assert counters_changed(None, current)
+        assert not counters_changed({**current, "engagement_rate": 9.0}, current)
+        assert counters_changed({**current, "reach_count": 99}, current)
+
+
+class TestRollups:
+    def test_hourly_and_daily_buckets_keep_latest_and_peaks(self, db):
+        store = PerformanceSnapshotStore()
+        t0 = datetime(2026, 10, 18, 9, 5, tzinfo=timezone.utc)
+
+        store.write_snapshots(db, [
+            snapshot(t0, likes=10, engagement_rate=2.0, velocity=5.0),
+            snapshot(t0 + timedelta(minutes=20), likes=12, engagement_rate=1.5)
+        ])
+        # A later sweep lands in the same hour through the upsert path
+        store.write_snapshots(db, [snapshot(t0 + timedelta(minutes=40), likes=15, engagement_rate=1.0)])
+        store.write_snapshots(db, [snapshot(t0 + timedelta(hours=3), likes=20)])
+        db.commit()
+
+        hourly = store.get_rollups(db, "content-1", t0 - timedelta(days=1), "hour")
+        assert [r.likes_count for r in hourly] == [15, 20]
+        assert hourly[0].sample_count == 3
+        assert hourly[0].max_engagement_rate == 2.0
+        assert hourly[0].max_engagement_velocity == 5.0
+        assert hourly[0].engagement_rate == 1.0
+
+        [daily] = store.get_rollups(db, "content-1", t0 - timedelta(days=1), "day")
+        assert daily.likes_count == 20
+        assert daily.sample_count == 4
+
+    def test_trends_read_rollups(self, db):
+        from backend.services.performance_tracking import PerformanceTracker
+
+        store = PerformanceSnapshotStore()
+        # Midday yesterday, so the one-hour offset below never crosses into the next day
+        now = datetime.now(timezone.utc).replace(hour=12, minute=0, second=0, microsecond=0) - timedelta(days=1)
+        store.write_snapshots(db, [
+            snapshot(now - timedelta(days=3), likes=5),
+            snapshot(now - timedelta(days=2), likes=9),
+            snapshot(now - timedelta(days=2, hours=-1), likes=12)
+        ])
+        db.commit()
+
+        trends = PerformanceTracker().get_performance_trends(db, "content-1", days=30)
+
+        assert trends["granularity"] == "day"
+        assert trends["trends"]["likes"]["data"] == [5, 12]
+        assert trends["total_snapshots"] == 3
+
+    def test_prune_rollups_by_granularity(self, db):
+        store = PerformanceSnapshotStore(hourly_retention_days=30)
+        now = datetime(2026, 10, 18, tzinfo=timezone.utc)
+        store.write_snapshots(db, [snapshot(now - timedelta(days=45)), snapshot(now - timedelta(days=1), likes=11)])
+        db.commit()
+
+        deleted = store.prune_rollups(db, daily_cutoff=now - timedelta(days=365), now=now)
+
+        assert deleted == {"hour": 1, "day": 0}
+        assert db.query(ContentPerformanceRollup).count() == 3
+
+
+class TestPartitionHelpers:
+    def test_partition_ddl_month_bounds(self):
+        ddl = partition_ddl(datetime(2026, 12, 18, tzinfo=timezone.utc))
+
+        assert "content_performance_snapshots_y2026m12 PARTITION OF content_performance_snapshots" in ddl
+        assert "FROM ('2026-12-01') TO ('2027-01-01')" in ddl
+
+    def test_upcoming_months_cross_year(self):
+        store = PerformanceSnapshotStore(partition_months_ahead=3)
+        months = store.upcoming_partition_months(datetime(2026, 11, 30, 23, tzinfo=timezone.utc))
+
+        assert [(m.year, m.month) for m in months] == [(2026, 11), (2026, 12), (2027, 1), (2027, 2)]
+
+    def test_maintenance_is_noop_without_partitioning(self, db):
+        result = PerformanceSnapshotStore().run_maintenance(db, retention_days=365)
+
+        assert result["partitions_ensured"] == []
+        assert result["partitions_dropped"] == []
+
+    def test_bucket_start(self):
+        at = datetime(2026, 10, 18, 9, 45, 12, tzinfo=timezone.utc)
+        assert bucket_start(at, "hour") == datetime(2026, 10, 18, 9, tzinfo=timezone.utc)
+        assert bucket_start(at, "day") == datetime(2026, 10, 18, tzinfo=timezone.utc)
@@ -0,0 +1,138 @@
+"""
+Unit tests for index-friendly pgvector similarity queries
+"""
+import re
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from backend.services import pgvector_service
+from backend.services.memory_service_production import MIN_ENGAGEMENT_RATE, ProductionMemoryService
+from backend.services.pgvector_service import PgVectorService, _load_metadata
+
+CREATED = datetime(2026, 10, 18, tzinfo=timezone.utc)
+
+
+class RecordingSession:
+    """Session that records statements and returns canned search rows"""
+
+    def __init__(self, rows=(), pgvector_version="0.8.0"):
+        self.rows = list(rows)
+        self.pgvector_version = pgvector_version
+        self.statements = []
+
+    def execute(self, statement, params=None):
+        sql = " ".join(str(statement).split())
+        self.statements.append((sql, params or {}))
+        result = MagicMock()
+        if "pg_extension" in sql:
+            result.scalar.return_value = self.pgvector_version
+        result.__iter__.return_value = iter(self.rows if "FROM (" in sql else [])
+        return result
+
+    def search(self):
+        return next((sql, params) for sql, params in self.statements if "FROM (" in sql)
+
+    def config(self):
+        return [(sql, params) for sql, params in self.statements if "set_config" in sql]
+
+
+@pytest.fixture(autouse=True)
+def reset_version_cache(monkeypatch):
+    monkeypatch.setattr(pgvector_service, "_iterative_scan_supported", None)
+
+
+def make_service(session):
+    service = PgVectorService(session)
+    service.get_embedding = lambda text: [0.1, 0.2, 0.3]
+    return service
+
+
+def content_row(similarity=0.9, metadata='{"platform": "x"}'):
+    return SimpleNamespace(
+        id=1, content_id=7, content_text="post", metadata=metadata,
+        similarity=similarity, created_at=CREATED
+    )
+
+
+class TestContentSearch:
+    def test_threshold_is_applied_after_the_nearest_neighbours(self):
+        session = RecordingSession([content_row()])
+
+        results = make_service(session).similarity_search_content(1, "query", limit=5, similarity_threshold=0.7)
+
+        sql, params = session.search()
+        inner, outer = sql.split(") AS nearest")
+        inner_where = inner.split("WHERE", 1)[1].split("ORDER BY")[0]
+        assert "<=>" not in inner_where
+        assert re.search(r"ORDER BY \(embedding::halfvec\(\d+\)\) <=> CAST\(:query_embedding AS halfvec\(\d+\)\) LIMIT :limit", inner)
+        assert "WHERE distance < :max_distance ORDER BY distance" in outer
+        assert params["max_distance"] == pytest.approx(0.3)
+        assert results[0]["metadata"] == {"platform": "x"}
+
+    def test_filters_are_pushed_into_sql(self):
+        session = RecordingSession()
+
+        make_service(session).similarity_search_content(
+            1, "query", min_engagement_rate=2.0, metadata_filters={"platform": "x"}
+        )
+
+        sql, params = session.search()
+        inner_where = sql.split("WHERE", 1)[1].split("ORDER BY")[0]
+        assert "engagement_rate')::float >= :min_engagement_rate" in inner_where
+        assert "metadata ->> :metadata_key_0 = :metadata_value_0" in inner_where
+        assert params["metadata_key_0"] == "platform" and params["metadata_value_0"] == "x"
+
+    def test_candidate_list_covers_limit_and_enables_iterative_scan(self):
+        session = RecordingSession()
+        service = make_service(session)
+
+        service.similarity_search_content(1, "query", limit=500)
+        service.similarity_search_content(1, "query", limit=5)
+
+        ef_values = [params["ef_search"] for sql, params in session.config() if "ef_search" in sql]
+        assert ef_values == ["500", str(pgvector_service.HNSW_EF_SEARCH)]
+        assert sum("iterative_scan" in sql for sql, _ in session.config()) == 2
+        # Extension version is looked up once per process
+        assert sum("pg_extension" in sql for sql, _ in session.statements) == 1
+
+    def test_iterative_scan_skipped_on_older_pgvector(self):
+        session = RecordingSession(pgvector_version="0.7.4")
+
+        make_service(session).similarity_search_content(1, "query")
+
+        assert not any("iterative_scan" in sql for sql, _ in session.config())
+
+
+class TestMemorySearch:
+    def test_memory_type_filter_and_threshold(self):
+        session = RecordingSession()
+
+        make_service(session).similarity_search_memories(1, "query", memory_type="insight", similarity_threshold=0.8)
+
+        sql, params = session.search()
+        inner_where = sql.split("WHERE", 1)[1].split("ORDER BY")[0]
+        assert "memory_type = :memory_type" in inner_where and "<=>" not in inner_where
+        assert params["max_distance"] == pytest.approx(0.2)
+
+
+class TestFindSimilarContent:
+    def test_engagement_filter_is_delegated_to_sql(self):
+        service = ProductionMemoryService(MagicMock())
+        rows = [{"metadata": {"performance_metrics": {"engagement_rate": 0.5}}}] * 3
+        service.vector_service = MagicMock()
+        service.vector_service.similarity_search_content.return_value = rows
+
+        assert service.find_similar_content(1, "query", limit=3) == rows
+        assert service.vector_service.similarity_search_content.call_args.kwargs["min_engagement_rate"] == MIN_ENGAGEMENT_RATE
+
+        service.find_similar_content(1, "query", include_performance=False)
+        assert service.vector_service.similarity_search_content.call_args.kwargs["min_engagement_rate"] is None
+
+
+def test_load_metadata_accepts_json_and_text_columns():
+    assert _load_metadata({"a": 1}) == {"a": 1}
+    assert _load_metadata('{"a": 1}') == {"a": 1}
+    assert _load_metadata(None) == {}
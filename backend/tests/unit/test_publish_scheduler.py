@@ -0,0 +1,261 @@
+"""
+Unit tests for the Redis delayed-queue publish scheduler
+"""
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from backend.db.models import ContentSchedule, SocialConnection
+from backend.db.multi_tenant_models import Organization
+from backend.services.publish_scheduler import DISPATCHER_MAX_IDLE_SECONDS, ENQUEUE_RETRY_SECONDS, PublishScheduler
+from backend.tasks.publish_dispatcher import PublishDispatcher
+from backend.tests.fixtures.redis_fixtures import SortedSetRedis
+
+ORG_ID = uuid.UUID("aaaaaaaa-0000-4000-8000-000000000001")
+META_ID = uuid.UUID("cccccccc-0000-4000-8000-000000000001")
+X_ID = uuid.UUID("cccccccc-0000-4000-8000-000000000002")
+NOW = datetime(2026, 10, 18, 12, 0, tzinfo=timezone.utc)
+
+
+class FakeBucket:
+    """Token bucket with a fixed number of tokens left"""
+
+    def __init__(self, remaining=60, refill_rate=60, window_s=60):
+        self.remaining = remaining
+        self.refill_rate = refill_rate
+        self.window_s = window_s
+        self.checked = []
+
+    def get_remaining(self, org_id, platform):
+        self.checked.append((org_id, platform))
+        return self.remaining
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://")
+    for model in (Organization, SocialConnection, ContentSchedule):
+        model.__table__.create(engine)
+    session = sessionmaker(bind=engine)()
+    session.add(Organization(id=str(ORG_ID), name="org", slug="org", owner_id=1))
+    for connection_id, platform in ((META_ID, "meta"), (X_ID, "x")):
+        session.add(SocialConnection(id=connection_id, organization_id=ORG_ID, platform=platform))
+    session.commit()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def enqueued(monkeypatch):
+    calls = []
+
+    def fake_enqueue(self, schedule, delay_s):
+        calls.append((str(schedule.id), delay_s))
+        return f"task-{len(calls)}"
+    monkeypatch.setattr(PublishScheduler, "_enqueue", fake_enqueue)
+    return calls
+
+
+def add_schedule(db, number, due_at, connection_id=META_ID, status="scheduled"):
+    schedule = ContentSchedule(
+        id=uuid.UUID(f"dddddddd-0000-4000-8000-{number:012d}"), organization_id=ORG_ID,
+        connection_id=connection_id, content=f"post {number}", content_hash=f"hash-{number}",
+        scheduled_for=due_at, status=status, idempotency_key=f"key-{number}"
+    )
+    db.add(schedule)
+    db.commit()
+    return schedule
+
+
+def make_scheduler(bucket=None):
+    return PublishScheduler(SortedSetRedis(), token_bucket=bucket or FakeBucket())
+
+
+class TestQueue:
+    def test_claim_takes_only_due_posts_once(self):
+        scheduler = make_scheduler()
+        scheduler.schedule_many((f"post-{i}", NOW + timedelta(seconds=i)) for i in range(10))
+
+        claimed = scheduler.claim_due(NOW.timestamp() + 3)
+
+        assert sorted(claimed) == ["post-0", "post-1", "post-2", "post-3"]
+        assert scheduler.claim_due(NOW.timestamp() + 3) == {}
+        assert scheduler.pending_count() == 6
+
+    def test_schedule_moves_and_cancel_removes(self):
+        scheduler = make_scheduler()
+        scheduler.schedule("post", NOW + timedelta(hours=1))
+        scheduler.schedule("post", NOW)
+
+        assert scheduler.claim_due(NOW.timestamp()) == {"post": NOW.timestamp()}
+        scheduler.schedule("other", NOW)
+        assert scheduler.cancel("other")
+        assert not scheduler.cancel("other")
+
+
+class TestDispatch:
+    def test_dispatches_due_posts_and_marks_them_publishing(self, db, enqueued):
+        scheduler = make_scheduler()
+        due = add_schedule(db, 1, NOW)
+        later = add_schedule(db, 2, NOW + timedelta(minutes=5))
+        scheduler.schedule_many([(due.id, due.scheduled_for), (later.id, later.scheduled_for)])
+
+        results = scheduler.dispatch_due(db, now=NOW.timestamp())
+
+        assert results["dispatched"] == 1
+        assert enqueued == [(str(due.id), 0.0)]
+        db.expire_all()
+        assert due.status == "publishing"
+        assert later.status == "scheduled"
+        assert scheduler.pending_count() == 1
+
+    def test_posts_due_within_lookahead_get_countdown(self, db, enqueued):
+        scheduler = make_scheduler()
+        schedule = add_schedule(db, 1, NOW + timedelta(milliseconds=400))
+        scheduler.schedule(str(schedule.id), schedule.scheduled_for)
+
+        scheduler.dispatch_due(db, now=NOW.timestamp())
+
+        assert enqueued[0][1] == pytest.approx(0.4)
+
+    def test_burst_is_paced_against_token_bucket(self, db, enqueued):
+        bucket = FakeBucket(remaining=2, refill_rate=12, window_s=60)
+        scheduler = make_scheduler(bucket)
+        schedules = [add_schedule(db, i, NOW - timedelta(seconds=10 - i)) for i in range(5)]
+        single_x = add_schedule(db, 9, NOW, connection_id=X_ID)
+        scheduler.schedule_many((s.id, s.scheduled_for) for s in schedules + [single_x])
+
+        results = scheduler.dispatch_due(db, now=NOW.timestamp())
+
+        assert results["dispatched"] == 3
+        assert results["deferred"] == 3
+        assert sorted(schedule_id for schedule_id, _ in enqueued) == sorted(
+            str(s.id) for s in schedules[:2] + [single_x]
+        )
+        # A lone post for a bucket goes straight out; the runner enforces the limit
+        assert bucket.checked == [(str(ORG_ID), "meta")]
+        # Deferred posts keep their order, one refill interval (5s) apart
+        assert [scheduler.redis.zscore(scheduler.queue_key, str(s.id)) for s in schedules[2:]] == [
+            NOW.timestamp() + 5, NOW.timestamp() + 10, NOW.timestamp() + 15
+        ]
+
+    def test_cancelled_and_rescheduled_posts(self, db, enqueued):
+        scheduler = make_scheduler()
+        cancelled = add_schedule(db, 1, NOW, status="failed")
+        moved = add_schedule(db, 2, NOW + timedelta(hours=2))
+        scheduler.schedule(str(cancelled.id), NOW)
+        scheduler.schedule(str(moved.id), NOW)
+
+        results = scheduler.dispatch_due(db, now=NOW.timestamp())
+
+        assert results == {"claimed": 2, "dispatched": 0, "deferred": 0, "skipped": 1, "failed": 0}
+        assert enqueued == []
+        assert scheduler.redis.zscore(scheduler.queue_key, str(moved.id)) == moved.scheduled_for.timestamp()
+
+    def test_failed_enqueue_is_retried_later(self, db, monkeypatch):
+        scheduler = make_scheduler()
+        schedule = add_schedule(db, 1, NOW)
+        scheduler.schedule(str(schedule.id), NOW)
+
+        def broken_enqueue(self, schedule, delay_s):
+            raise ConnectionError("broker down")
+        monkeypatch.setattr(PublishScheduler, "_enqueue", broken_enqueue)
+
+        results = scheduler.dispatch_due(db, now=NOW.timestamp())
+
+        assert results["failed"] == 1
+        assert scheduler.redis.zscore(scheduler.queue_key, str(schedule.id)) == NOW.timestamp() + ENQUEUE_RETRY_SECONDS
+        db.expire_all()
+        assert schedule.status == "scheduled"
+
+
+class TestReconcile:
+    def test_requeues_missing_posts_without_moving_queued_ones(self, db):
+        scheduler = make_scheduler()
+        queued = add_schedule(db, 1, NOW)
+        missing = add_schedule(db, 2, NOW + timedelta(minutes=1))
+        add_schedule(db, 3, NOW, status="published")
+        deferred_to = NOW.timestamp() + 30
+        scheduler.redis.zadd(scheduler.queue_key, {str(queued.id): deferred_to})
+        assert scheduler.needs_reconcile()
+
+        results = scheduler.reconcile(db)
+
+        assert results == {"scheduled": 2, "requeued": 1}
+        assert scheduler.redis.zscore(scheduler.queue_key, str(queued.id)) == deferred_to
+        assert scheduler.redis.zscore(scheduler.queue_key, str(missing.id)) == missing.scheduled_for.timestamp()
+        assert not scheduler.needs_reconcile()
+
+    def test_dispatcher_recovers_after_redis_loses_queue(self, db, enqueued):
+        scheduler = make_scheduler()
+        schedule = add_schedule(db, 1, NOW)
+        scheduler.schedule(str(schedule.id), NOW)
+        scheduler.reconcile(db)
+        scheduler.redis.flushall()
+
+        assert scheduler.needs_reconcile()
+        scheduler.reconcile(db)
+        scheduler.dispatch_due(db, now=NOW.timestamp())
+
+        assert enqueued == [(str(schedule.id), 0.0)]
+
+
+class TestDispatcher:
+    def test_sleeps_until_the_earliest_post_is_due(self):
+        scheduler = make_scheduler()
+        now = NOW.timestamp()
+        assert scheduler.seconds_until_next(now) == DISPATCHER_MAX_IDLE_SECONDS
+
+        scheduler.schedule("later", NOW + timedelta(seconds=20))
+        assert scheduler.seconds_until_next(now) == pytest.approx(19.0)
+        scheduler.schedule("overdue", NOW - timedelta(seconds=5))
+        assert scheduler.seconds_until_next(now) == 0.0
+        scheduler.cancel("overdue")
+        scheduler.schedule("far", NOW + timedelta(hours=3))
+        assert scheduler.seconds_until_next(now) == pytest.approx(19.0)
+
+    def test_scheduling_wakes_a_waiting_dispatcher_once(self):
+        scheduler = make_scheduler()
+        scheduler.schedule_many([("a", NOW), ("b", NOW)])
+        scheduler.schedule("c", NOW)
+
+        assert scheduler.wait_for_work(10.0)
+        assert not scheduler.wait_for_work(10.0)
+        # A zero wait never reaches BLPOP, where 0 means block forever
+        assert not scheduler.wait_for_work(0.0)
+        assert scheduler.redis.blpop_timeouts == [10.0, 10.0]
+
+    def test_pass_dispatches_due_posts_then_waits_for_the_next(self, db, enqueued):
+        scheduler = make_scheduler()
+        due = add_schedule(db, 1, NOW)
+        later = add_schedule(db, 2, NOW + timedelta(seconds=20))
+        scheduler.schedule_many([(due.id, due.scheduled_for), (later.id, later.scheduled_for)])
+        due_id = str(due.id)
+        dispatcher = PublishDispatcher(scheduler, session_factory=lambda: db)
+
+        results = dispatcher.run_once(now=NOW.timestamp())
+
+        assert enqueued == [(due_id, 0.0)]
+        assert dispatcher.next_wait(results, now=NOW.timestamp()) == pytest.approx(19.0)
+        assert dispatcher.next_wait({"claimed": 500}, now=NOW.timestamp()) == 0.0
+
+    def test_run_exits_when_stopped_while_waiting(self, db, enqueued, monkeypatch):
+        scheduler = make_scheduler()
+        schedule = add_schedule(db, 1, NOW - timedelta(seconds=1))
+        schedule_id = str(schedule.id)
+        scheduler.schedule(schedule_id, schedule.scheduled_for)
+        dispatcher = PublishDispatcher(scheduler, session_factory=lambda: db)
+        waits = []
+
+        def wait_then_stop(timeout):
+            waits.append(timeout)
+            dispatcher.stop()
+        monkeypatch.setattr(scheduler, "wait_for_work", wait_then_stop)
+
+        dispatcher.run()
+
+        assert enqueued == [(schedule_id, 0.0)]
+        assert waits == [DISPATCHER_MAX_IDLE_SECONDS]
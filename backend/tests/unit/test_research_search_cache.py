@@ -0,0 +1,150 @@
+"""
+Unit tests for the research search cache and concurrent DeepResearchAgent runs
+"""
+import asyncio
+import json
+from unittest.mock import AsyncMock
+
+import pytest
+
+from backend.agents import deep_research_agent as agent_module
+from backend.agents.deep_research_agent import DeepResearchAgent, ResearchTopic
+from backend.services.research_search_cache import ResearchSearchCache, normalize_query, normalize_url
+
+ANALYSIS = {
+    "relevance_score": 0.9, "credibility_score": 0.8, "source_type": "news",
+    "keywords": [], "summary": "s", "insights": [], "implications": [], "trending_indicators": {}
+}
+
+
+def test_normalize_url_drops_tracking_and_cosmetic_differences():
+    assert normalize_url("HTTPS://www.Example.com:443/a/b/?utm_source=x&b=2&a=1#top") == \
+        normalize_url("https://example.com/a/b?a=1&b=2")
+    assert normalize_url("https://example.com/a?id=1") != normalize_url("https://example.com/a?id=2")
+
+
+def test_normalize_query_collapses_case_and_whitespace():
+    assert normalize_query("  Roof  Cleaning\tTrends ") == normalize_query("roof cleaning trends")
+
+
+class TestResearchSearchCache:
+    def test_entries_expire(self, monkeypatch):
+        clock = [1000.0]
+        monkeypatch.setattr("backend.services.async_ttl_cache.time.monotonic", lambda: clock[0])
+        cache = ResearchSearchCache(ttl_seconds={"page": 10}, default_ttl_seconds=100)
+        cache.set("page", "https://example.com/", {"status": "success"})
+        cache.set("search:serper", "query", [{"url": "u"}])
+
+        clock[0] += 50
+
+        assert cache.get("page", "https://example.com/") is None
+        assert cache.get("search:serper", "query") == [{"url": "u"}]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_call(self):
+        cache = ResearchSearchCache()
+        calls = []
+
+        async def compute():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return [{"url": "u"}]
+
+        results = await asyncio.gather(*(cache.get_or_compute("search:serper", "q", compute) for _ in range(5)))
+
+        assert len(calls) == 1
+        assert results == [[{"url": "u"}]] * 5
+
+    @pytest.mark.asyncio
+    async def test_empty_results_are_not_cached(self):
+        cache = ResearchSearchCache()
+        compute = AsyncMock(return_value=[])
+
+        await cache.get_or_compute("search:serper", "q", compute)
+        await cache.get_or_compute("search:serper", "q", compute)
+
+        assert compute.await_count == 2
+
+
+@pytest.fixture
+def agent(monkeypatch):
+    monkeypatch.setattr(agent_module.settings, "serper_api_key", "test-key", raising=False)
+    research_agent = DeepResearchAgent()
+    research_agent.search_cache = ResearchSearchCache()
+    return research_agent
+
+
+class TestDeepResearchAgent:
+    @pytest.mark.asyncio
+    async def test_overlapping_queries_and_urls_hit_providers_once(self, agent, monkeypatch):
+        searches, scrapes = [], []
+
+        async def fake_serper(query):
+            searches.append(query)
+            return [
+                {"url": f"https://example.com/{query.split()[-1]}?utm_source=serper", "title": query},
+                {"url": "https://www.example.com/shared/", "title": "shared"},
+            ]
+
+        def fake_scrape(url):
+            scrapes.append(url)
+            return {"url": url, "status": "success", "content": "page"}
+
+        agent._search_serper = fake_serper
+        monkeypatch.setattr(agent_module.web_scraper, "scrape_url", fake_scrape)
+        agent._call_gpt5_mini_with_search = AsyncMock(return_value=json.dumps(ANALYSIS))
+
+        topic = ResearchTopic(name="Trends", keywords=["roof"], priority=5, research_depth="basic")
+        # Two industries whose generated queries overlap
+        for queries in (["roof a", "Roof  A", "roof b"], ["roof b", "roof c"]):
+            agent._generate_search_queries = AsyncMock(return_value=queries)
+            await agent._research_topic_fallback(topic)
+
+        assert sorted(searches) == ["roof a", "roof b", "roof c"]
+        assert sorted(scrapes) == [
+            "https://example.com/a?utm_source=serper",
+            "https://example.com/b?utm_source=serper",
+            "https://example.com/c?utm_source=serper",
+            "https://www.example.com/shared/",
+        ]
+        # One analysis per unique page and topic
+        assert agent._call_gpt5_mini_with_search.await_count == 4
+
+    @pytest.mark.asyncio
+    async def test_non_json_analysis_is_not_cached(self, agent):
+        agent._call_gpt5_mini_with_search = AsyncMock(side_effect=["Sorry, I cannot help.", json.dumps(ANALYSIS)])
+        topic = ResearchTopic(name="Trends", keywords=["roof"], priority=5)
+        result = {"url": "https://example.com/a"}
+
+        assert await agent._analyze_content("page", topic, result) is None
+        assert await agent._analyze_content("page", topic, result) == ANALYSIS
+        assert await agent._analyze_content("page", topic, result) == ANALYSIS
+        assert agent._call_gpt5_mini_with_search.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_topics_are_researched_concurrently(self, agent):
+        running, peak = [0], [0]
+
+        async def fake_research(topic):
+            running[0] += 1
+            peak[0] = max(peak[0], running[0])
+            await asyncio.sleep(0.01)
+            running[0] -= 1
+            if topic.name == "broken":
+                raise RuntimeError("provider down")
+            return [topic.name]
+
+        agent._research_topic = fake_research
+        agent._synthesize_intelligence = AsyncMock(return_value="report")
+        agent._store_intelligence_report = AsyncMock()
+        agent._update_knowledge_base = AsyncMock()
+        agent._generate_content_opportunities = AsyncMock()
+        topics = [ResearchTopic(name=f"topic {i}", keywords=[], priority=5) for i in range(6)]
+        topics.append(ResearchTopic(name="broken", keywords=[], priority=5))
+
+        await agent.conduct_weekly_research("roofing", topics)
+
+        assert peak[0] == agent_module.TOPIC_CONCURRENCY
+        findings = agent._update_knowledge_base.await_args.args[0]
+        assert findings == [f"topic {i}" for i in range(6)]
+        assert topics[0].last_researched is not None and topics[-1].last_researched is None
@@ -0,0 +1,141 @@
+"""
+Unit tests for chunked, throttled and resumable retention deletes
+"""
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from backend.db.models import ContentDraft, ContentPerformanceRollup, RetentionCursor
+from backend.services.data_retention_service import DataCategory, DataRetentionService
+from backend.services.retention_executor import RetentionExecutor, RetentionTarget
+
+NOW = datetime(2026, 10, 18, tzinfo=timezone.utc)
+CUTOFF = NOW - timedelta(days=30)
+
+ROLLUPS = RetentionTarget(
+    "HourlyRollup", ContentPerformanceRollup, "bucket_start",
+    conditions=(ContentPerformanceRollup.granularity == "hour",)
+)
+DRAFTS = RetentionTarget("ContentDraft", ContentDraft, "created_at")
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://")
+    for model in (ContentPerformanceRollup, ContentDraft, RetentionCursor):
+        model.__table__.create(engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+
+def add_rollups(db, expired, fresh, granularity="hour", now=NOW):
+    for index in range(expired + fresh):
+        age = timedelta(days=60 if index < expired else 1, hours=index)
+        db.add(ContentPerformanceRollup(content_item_id="c", granularity=granularity, bucket_start=now - age))
+    db.commit()
+
+
+def add_drafts(db, count):
+    for _ in range(count):
+        db.add(ContentDraft(
+            organization_id=uuid.uuid4(), connection_id=uuid.uuid4(), content="post",
+            content_hash="h", created_at=NOW - timedelta(days=60)
+        ))
+    db.commit()
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class TestRetentionExecutor:
+    def test_deletes_only_expired_matching_rows_in_chunks(self, db):
+        add_rollups(db, expired=25, fresh=5)
+        add_rollups(db, expired=4, fresh=0, granularity="day")
+        executor = RetentionExecutor(chunk_size=10, rows_per_second=0, max_seconds=0)
+
+        result = executor.run(db, "metrics_data", [ROLLUPS], CUTOFF)
+
+        assert result["deleted_counts"] == {"HourlyRollup": 25}
+        assert result["chunks"] == 3
+        assert result["completed"]
+        assert db.query(ContentPerformanceRollup).count() == 9
+        # A finished pass leaves no cursor behind
+        assert db.query(RetentionCursor).count() == 0
+
+    def test_throttles_to_the_rows_per_second_budget(self, db):
+        add_rollups(db, expired=30, fresh=0)
+        clock = FakeClock()
+        executor = RetentionExecutor(chunk_size=10, rows_per_second=20, max_seconds=0, clock=clock, sleep=clock.sleep)
+
+        executor.run(db, "metrics_data", [ROLLUPS], CUTOFF)
+
+        assert clock.sleeps == [0.5, 0.5, 0.5]
+
+    def test_time_budget_leaves_a_cursor_the_next_run_resumes(self, db):
+        add_drafts(db, 25)
+        clock = FakeClock()
+        executor = RetentionExecutor(chunk_size=10, rows_per_second=10, max_seconds=1.5, clock=clock, sleep=clock.sleep)
+
+        first = executor.run(db, "user_content", [DRAFTS], CUTOFF)
+
+        assert not first["completed"]
+        assert first["deleted_counts"] == {"ContentDraft": 20}
+        progress = executor.get_progress(db)
+        assert [(entry["target"], entry["rows_deleted"]) for entry in progress] == [("ContentDraft", 20)]
+
+        remaining_before = {draft.id for draft in db.query(ContentDraft)}
+        assert all(str(key) > progress[0]["last_key"] for key in remaining_before)
+
+        second = RetentionExecutor(chunk_size=10, rows_per_second=0, max_seconds=0).run(
+            db, "user_content", [DRAFTS], CUTOFF
+        )
+
+        assert second["resumed"] == ["ContentDraft"]
+        assert second["completed"] and second["deleted_counts"] == {"ContentDraft": 5}
+        assert db.query(ContentDraft).count() == 0
+        assert executor.get_progress(db) == []
+
+    def test_partitions_are_dropped_before_row_deletes(self, db):
+        add_rollups(db, expired=3, fresh=0)
+        calls = []
+        target = RetentionTarget(
+            "HourlyRollup", ContentPerformanceRollup, "bucket_start",
+            drop_partitions=lambda session, cutoff: calls.append(cutoff) or ["rollups_y2026m08"]
+        )
+
+        result = RetentionExecutor(chunk_size=10, rows_per_second=0, max_seconds=0).run(
+            db, "metrics_data", [target], CUTOFF
+        )
+
+        assert calls == [CUTOFF]
+        assert result["partitions_dropped"] == {"HourlyRollup": ["rollups_y2026m08"]}
+        assert result["deleted_counts"] == {"HourlyRollup": 3}
+
+
+def test_service_cleanup_runs_through_the_executor(db, monkeypatch):
+    executor = RetentionExecutor(chunk_size=2, rows_per_second=0, max_seconds=0)
+    service = DataRetentionService(executor=executor)
+    service.cleanup_targets[DataCategory.METRICS_DATA] = [ROLLUPS]
+    service.retention_policies[DataCategory.METRICS_DATA].retention_days = 30
+    monkeypatch.setattr(service, "get_expired_data_count", lambda session, category: {"ContentPerformanceRollup": 5})
+    add_rollups(db, expired=5, fresh=1, now=datetime.now(timezone.utc))
+
+    result = service.cleanup_expired_data(db, DataCategory.METRICS_DATA, dry_run=False)
+
+    assert result["errors"] == []
+    assert result["total_deleted"] == 5
+    assert result["chunks"] == 3 and result["completed"]
@@ -0,0 +1,151 @@
+"""
+Tests for group-selected, per-module router loading and the startup import profile
+"""
+import sys
+import types
+
+import pytest
+
+from backend.api import _registry
+from backend.api._registry import ROUTER_GROUPS, ROUTER_SPECS, RouterSpec, load_routers, parse_groups, select_router_specs
+from backend.core.lazy_imports import LazyObject, lazy_import
+from backend.core.startup_profile import StartupProfile
+
+
+class TestGroupSelection:
+    def test_all_and_none_select_every_group(self):
+        assert parse_groups(None) is None
+        assert parse_groups("all") is None
+        assert parse_groups(" , ") is None
+        assert select_router_specs("all") == ROUTER_SPECS
+
+    def test_comma_separated_groups(self):
+        assert parse_groups("auth, content") == ["auth", "content"]
+        assert parse_groups(["auth"]) == ["auth"]
+
+    def test_unknown_group_is_rejected(self):
+        with pytest.raises(ValueError, match="billng"):
+            parse_groups("auth,billng")
+
+    def test_selection_keeps_registration_order(self):
+        specs = select_router_specs("content,auth")
+        assert {spec.group for spec in specs} == {"auth", "content"}
+        assert specs == [spec for spec in ROUTER_SPECS if spec in specs]
+        # FastAPI Users must still register first
+        assert specs[0].module == "auth_fastapi_users"
+
+    def test_every_spec_belongs_to_a_known_group(self):
+        assert set(ROUTER_GROUPS) == {spec.group for spec in ROUTER_SPECS}
+        assert len({(spec.import_path, spec.attribute) for spec in ROUTER_SPECS}) == len(ROUTER_SPECS)
+
+    def test_spec_paths(self):
+        assert RouterSpec("content").import_path == "backend.api.content"
+        assert RouterSpec("content").name == "content"
+        csrf = RouterSpec("backend.core.csrf_protection", attribute="csrf_router", package="")
+        assert csrf.import_path == "backend.core.csrf_protection"
+        assert csrf.name == "backend.core.csrf_protection.csrf_router"
+
+
+class TestLoadRouters:
+    @pytest.fixture
+    def fake_modules(self, monkeypatch):
+        healthy = types.ModuleType("fake_router_healthy")
+        healthy.router = object()
+        monkeypatch.setitem(sys.modules, "fake_router_healthy", healthy)
+        monkeypatch.setattr(_registry, "ROUTER_SPECS", [
+            RouterSpec("fake_router_healthy", group="content", package=""),
+            RouterSpec("fake_router_missing", group="content", package=""),
+            RouterSpec("fake_router_healthy", attribute="other_router", group="ops", package=""),
+        ])
+        return healthy
+
+    def test_failing_module_does_not_block_the_others(self, fake_modules):
+        loaded, failed = load_routers("content")
+
+        assert [router for _, router in loaded] == [fake_modules.router]
+        assert [name for name, _ in failed] == ["fake_router_missing"]
+        assert "ModuleNotFoundError" in failed[0][1]
+
+    def test_missing_attribute_is_reported(self, fake_modules):
+        loaded, failed = load_routers("ops")
+
+        assert loaded == []
+        assert failed[0][0] == "fake_router_healthy.other_router"
+        assert "AttributeError" in failed[0][1]
+
+    def test_each_import_is_profiled(self, fake_modules):
+        profile = StartupProfile()
+        load_routers("content", profile=profile)
+
+        names = [entry.name for entry in profile.entries]
+        assert names == ["router:fake_router_healthy", "router:fake_router_missing"]
+        assert profile.entries[0].error is None
+        assert profile.entries[1].error.startswith("ModuleNotFoundError")
+        assert profile.failures() == [profile.entries[1]]
+
+    def test_missing_optional_package_is_skipped_not_failed(self, monkeypatch, caplog):
+        monkeypatch.setattr(_registry, "ROUTER_SPECS", [
+            RouterSpec("fake_router_billing", group="billing", package=""),
+            RouterSpec("fake_router_missing", group="billing", package=""),
+        ])
+        monkeypatch.setattr(_registry.importlib, "import_module", lambda path: (
+            _raise(ModuleNotFoundError("No module named 'stripe.api'", name="stripe.api"))
+            if path == "fake_router_billing" else _raise(ImportError("cannot import name 'x'"))
+        ))
+        profile = StartupProfile()
+
+        with caplog.at_level("WARNING", logger=_registry.__name__):
+            loaded, failed = load_routers("billing", profile=profile)
+
+        assert loaded == [] and len(failed) == 2
+        assert [entry.optional for entry in profile.entries] == [True, False]
+        assert [entry.name for entry in profile.failures()] == ["router:fake_router_missing"]
+        assert [record.levelname for record in caplog.records] == ["WARNING", "ERROR"]
+        assert "(skipped: ModuleNotFoundError" in profile.format_report()
+
+
+def _raise(error):
+    raise error
+
+
+class TestStartupProfile:
+    def test_report_lists_slowest_first(self):
+        profile = StartupProfile()
+        with profile.measure("fast"):
+            pass
+        with profile.measure("slow"):
+            sum(range(200000))
+        with pytest.raises(RuntimeError):
+            with profile.measure("broken"):
+                raise RuntimeError("boom")
+
+        assert profile.slowest(1)[0].name == "slow"
+        summary = profile.as_dict(limit=2)
+        assert summary["steps"] == 3
+        assert len(summary["slowest"]) == 2
+        report = profile.format_report()
+        assert "(failed: RuntimeError: boom)" in report
+        assert "total over 3 steps" in report
+
+
+class TestLazyImport:
+    def test_module_is_imported_on_first_use(self, monkeypatch):
+        monkeypatch.delitem(sys.modules, "colorsys", raising=False)
+        hls_to_rgb = lazy_import("colorsys", "hls_to_rgb")
+
+        assert "colorsys" not in sys.modules
+        assert not hls_to_rgb.is_resolved
+        assert hls_to_rgb(0, 1, 0) == (1, 1, 1)
+        assert hls_to_rgb.is_resolved
+        assert "colorsys" in sys.modules
+
+    def test_attribute_access_and_assignment_are_forwarded(self):
+        target = types.SimpleNamespace(value=1)
+        calls = []
+        proxy = LazyObject(lambda: calls.append(1) or target, "namespace")
+
+        assert "not yet imported" in repr(proxy)
+        assert proxy.value == 1
+        proxy.value = 2
+        assert target.value == 2
+        assert calls == [1]
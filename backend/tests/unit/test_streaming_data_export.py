@@ -0,0 +1,150 @@
+"""
+Unit tests for the streamed ZIP data export
+"""
+import csv
+import io
+import json
+import uuid
+import zipfile
+from types import SimpleNamespace
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.schema import CreateTable
+
+from backend.api.data_export import DataExportRequest, DataExportService
+from backend.db.models import (
+    Content, ContentLog, Goal, Memory, Metric, Notification, Organization, Plan, SocialConnection,
+    User, UserOrganizationRole, UserSetting, WorkflowExecution
+)
+from backend.services.streaming_export import encode_rows, iter_csv, iter_xml, stream_zip
+
+EXPORTED_MODELS = (
+    Plan, User, UserSetting, Organization, UserOrganizationRole, Metric, ContentLog, Content, Memory,
+    SocialConnection, WorkflowExecution, Goal, Notification,
+)
+
+
+@pytest.fixture
+def db(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'export.db'}")
+    # Tables only: importing the app extends users with a second copy of its indexes
+    with engine.begin() as connection:
+        for model in EXPORTED_MODELS:
+            connection.execute(CreateTable(model.__table__))
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+    engine.dispose()
+
+
+@pytest.fixture
+def user(db):
+    user_id = db.execute(insert(User.__table__).values(
+        public_id=uuid.uuid4(), email="owner@example.com", username="owner", full_name="Owner"
+    )).inserted_primary_key[0]
+    db.execute(insert(Metric.__table__), [
+        {"user_id": user_id, "metric_type": "reach", "platform": "twitter", "value": float(index),
+         "metric_metadata": {"post": index}}
+        for index in range(1203)
+    ])
+    db.execute(insert(ContentLog.__table__).values(
+        public_id=uuid.uuid4(), user_id=user_id, organization_id=uuid.uuid4(), platform="twitter",
+        content="hello, world", content_type="text", status="published"
+    ))
+    db.execute(insert(Goal.__table__).values(
+        id=1, user_id=user_id, title="Grow", goal_type="followers", target_value=10.0,
+        target_date=datetime(2027, 1, 1, tzinfo=timezone.utc)
+    ))
+    db.execute(insert(WorkflowExecution.__table__).values(
+        id="run-1", user_id=user_id, workflow_type="daily", started_at=datetime(2026, 10, 1, tzinfo=timezone.utc)
+    ))
+    db.commit()
+    # The app maps users twice, which breaks lazy loads in this process, so the
+    # user's relationships are provided directly
+    return SimpleNamespace(
+        id=user_id, public_id=uuid.uuid4(), email="owner@example.com", username="owner", full_name="Owner",
+        is_active=True, is_verified=False, tier="base", auth_provider="local", two_factor_enabled=False,
+        email_verified=False, subscription_status="free", subscription_end_date=None, created_at=None,
+        updated_at=None, user_settings=None, plan=None, organization_roles=[], owned_organizations=[], teams=[],
+        sent_invitations=[], received_invitations=[]
+    )
+
+
+def read_archive(chunks):
+    return zipfile.ZipFile(io.BytesIO(b"".join(chunks)))
+
+
+class TestStreamZip:
+    def test_entries_are_streamed_into_a_valid_archive(self):
+        chunks = list(stream_zip([
+            ("a.ndjson", (f"{i}\n".encode() for i in range(5000))),
+            ("empty.ndjson", []),
+        ]))
+
+        archive = read_archive(chunks)
+
+        assert len(chunks) > 2
+        assert archive.namelist() == ["a.ndjson", "empty.ndjson"]
+        assert archive.read("a.ndjson").decode().splitlines() == [str(i) for i in range(5000)]
+        assert archive.read("empty.ndjson") == b""
+
+    def test_csv_and_xml_encoders_escape_and_flatten(self):
+        rows = [{"id": 1, "text": "a,\"b\"", "meta": {"k": [1]}}, {"id": 2, "text": "<x>", "meta": None}]
+
+        parsed = list(csv.DictReader(io.StringIO(b"".join(iter_csv(iter(rows), batch_size=1)).decode())))
+        xml = b"".join(iter_xml(iter(rows), root="goals")).decode()
+
+        assert parsed[0] == {"id": "1", "text": "a,\"b\"", "meta": '{"k": [1]}'}
+        assert parsed[1]["text"] == "<x>"
+        assert "<text>&lt;x&gt;</text>" in xml
+        assert encode_rows([], "json", "metrics")[0] == "metrics.ndjson"
+
+
+class TestStreamUserData:
+    def test_json_export_writes_metadata_and_ndjson_sections(self, db, user):
+        request = DataExportRequest(format="json")
+
+        archive = read_archive(DataExportService(db).stream_user_data(user, request))
+
+        assert archive.namelist() == [
+            "export_metadata.json", "metrics.ndjson", "content_logs.ndjson", "ai_generated_content.ndjson",
+            "memories.ndjson", "social_connections.ndjson", "workflows.ndjson", "goals.ndjson",
+            "notifications.ndjson",
+        ]
+        summary = json.loads(archive.read("export_metadata.json"))
+        assert summary["profile"]["email"] == "owner@example.com"
+        assert "metrics" not in summary
+        metrics = [json.loads(line) for line in archive.read("metrics.ndjson").splitlines()]
+        assert [m["value"] for m in metrics] == [float(i) for i in range(1203)]
+        assert metrics[7]["metric_metadata"] == {"post": 7}
+
+    def test_stream_matches_the_in_memory_export(self, db, user):
+        request = DataExportRequest(format="json", anonymize_sensitive=True)
+        service = DataExportService(db)
+
+        archive = read_archive(service.stream_user_data(user, request))
+        legacy = service.export_user_data(user, request)
+
+        def section(name):
+            return [json.loads(line) for line in archive.read(f"{name}.ndjson").splitlines()]
+
+        assert section("metrics") == legacy["metrics"]
+        assert section("content_logs") == legacy["content"]["content_logs"]
+        assert section("goals") == legacy["goals"]
+        assert section("workflows") == legacy["workflows"]
+        assert section("workflows")[0]["created_at"].startswith("2026-10-01")
+        assert section("content_logs")[0]["content"] == "[CONTENT_ANONYMIZED]"
+
+    def test_csv_export_honours_include_flags(self, db, user):
+        request = DataExportRequest(format="csv", include_content=False, include_connections=False)
+
+        archive = read_archive(DataExportService(db).stream_user_data(user, request))
+
+        assert "content_logs.csv" not in archive.namelist()
+        assert "social_connections.csv" not in archive.namelist()
+        rows = list(csv.DictReader(io.StringIO(archive.read("metrics.csv").decode())))
+        assert len(rows) == 1203
+        assert rows[0]["metric_metadata"] == '{"post": 0}'
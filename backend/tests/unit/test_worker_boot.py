@@ -0,0 +1,74 @@
+"""
+Unit tests for Celery worker boot preloading and the per-queue boot report
+"""
+import os
+from types import SimpleNamespace
+
+import pytest
+
+from backend.core.lazy_imports import LazyObject
+from backend.tasks import worker_boot
+from backend.tasks.worker_boot import QUEUE_PRELOADS, memory_usage, preload_modules_for, preload_shared_state
+
+
+class TestPreloadSelection:
+    def test_only_the_consumed_queues_are_preloaded(self):
+        assert preload_modules_for(["webhooks", "token_health"]) == []
+        assert preload_modules_for(["research"]) == list(QUEUE_PRELOADS["research"])
+
+    def test_posting_preloads_what_autonomous_content_posting_needs(self):
+        from backend.tasks.celery_app import celery_app
+
+        assert celery_app.conf.beat_schedule["autonomous-content-posting"]["options"]["queue"] == "posting"
+        assert set(QUEUE_PRELOADS["autonomous"]) <= set(preload_modules_for(["posting"]))
+
+    def test_modules_are_deduplicated_in_order(self, monkeypatch):
+        monkeypatch.setattr(worker_boot, "QUEUE_PRELOADS", {"a": ("json", "csv"), "b": ("csv", "zlib")})
+        assert preload_modules_for(["a", "b"]) == ["json", "csv", "zlib"]
+
+    def test_failed_step_is_skipped(self, monkeypatch):
+        monkeypatch.setattr(worker_boot, "QUEUE_PRELOADS", {"broken": ("backend.does_not_exist", "json")})
+
+        loaded = preload_shared_state(["broken"])
+
+        assert loaded == ["settings", "models", "json"]
+
+
+class TestWorkerSignals:
+    def test_main_process_preloads_for_its_queues(self, monkeypatch):
+        frozen = []
+        monkeypatch.setattr(worker_boot, "freeze_shared_heap", lambda: frozen.append(True))
+        monkeypatch.setattr(worker_boot, "QUEUE_PRELOADS", {"webhooks": ("json",)})
+        sender = SimpleNamespace(app=SimpleNamespace(amqp=SimpleNamespace(
+            queues=SimpleNamespace(consume_from={"webhooks": object(), "default": object()})
+        )))
+
+        worker_boot._preload_worker(sender=sender)
+
+        assert worker_boot._worker_queues == ["default", "webhooks"]
+        assert worker_boot._preloaded == ["settings", "models", "json"]
+        assert frozen == [True]
+        assert worker_boot.boot_report("child").boot_seconds > 0
+
+    def test_child_counts_its_tasks(self):
+        worker_boot._report_child_start()
+        worker_boot._count_task()
+        worker_boot._count_task()
+
+        assert worker_boot._tasks_run == 2
+
+
+class TestMemoryUsage:
+    @pytest.mark.skipif(not os.path.exists("/proc/self/smaps_rollup"), reason="needs /proc smaps_rollup")
+    def test_private_memory_is_part_of_rss(self):
+        usage = memory_usage()
+        assert usage["rss_bytes"] > 0
+        assert 0 < usage["private_bytes"] <= usage["rss_bytes"]
+
+
+def test_heavy_task_dependencies_are_lazy():
+    from backend.tasks import autonomous_scheduler, lightweight_research_tasks, posting_tasks
+
+    assert isinstance(posting_tasks.twitter_tool, LazyObject)
+    assert isinstance(lightweight_research_tasks.AsyncOpenAI, LazyObject)
+    assert isinstance(autonomous_scheduler.ProductionResearchAutomationService, LazyObject)
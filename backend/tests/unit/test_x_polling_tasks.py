@@ -0,0 +1,130 @@
+"""
+Unit tests for the concurrent X mentions polling sweep
+"""
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from backend.services.x_mentions_service import XMentionsService
+from backend.tasks import x_polling_tasks
+
+
+def make_connection(index, org_id):
+    return SimpleNamespace(
+        id=f"conn-{index}",
+        organization_id=org_id,
+        platform="x",
+        platform_account_id=f"acct-{index}",
+        platform_username=f"handle{index}",
+        platform_metadata={"mentions_since_id": "100"},
+        access_tokens={"access_token": "encrypted"},
+        last_checked_at=None
+    )
+
+
+class FakeMentionsService(XMentionsService):
+    """Mentions service whose X API calls sleep instead of hitting the network"""
+
+    def __init__(self, rate_limited=()):
+        super().__init__(settings=MagicMock())
+        self.rate_limited = set(rate_limited)
+        self.requested = []
+        self.in_flight = {}
+        self.max_in_flight = 0
+        self.max_org_in_flight = 0
+
+    async def fetch_new_mentions(self, connection, client=None):
+        assert client is not None
+        org_id = connection.organization_id
+        self.requested.append(connection.id)
+        self.in_flight[org_id] = self.in_flight.get(org_id, 0) + 1
+        self.max_in_flight = max(self.max_in_flight, sum(self.in_flight.values()))
+        self.max_org_in_flight = max(self.max_org_in_flight, self.in_flight[org_id])
+        await asyncio.sleep(0.01)
+        self.in_flight[org_id] -= 1
+        if connection.id in self.rate_limited:
+            return {"success": False, "error": "rate_limited", "backoff_seconds": 120, "retry_after": None}
+        return {"success": True, "new_mentions": 1, "processed_ids": ["101"], "since_id": "101", "total_fetched": 1}
+
+
+def group(connections):
+    grouped = {}
+    for connection in connections:
+        grouped.setdefault(connection.organization_id, []).append(connection)
+    return grouped
+
+
+class TestPollConnections:
+    def test_polls_concurrently_within_bounds(self):
+        connections = [make_connection(i, f"org-{i % 4}") for i in range(40)]
+        service = FakeMentionsService()
+
+        polled, backoffs = asyncio.run(x_polling_tasks._poll_connections(service, group(connections)))
+
+        assert len(polled) == 40
+        assert backoffs == {}
+        assert 1 < service.max_in_flight <= x_polling_tasks.POLL_CONCURRENCY
+        assert service.max_org_in_flight <= x_polling_tasks.ORG_POLL_CONCURRENCY
+
+    def test_rate_limited_org_skips_remaining_connections(self, monkeypatch):
+        monkeypatch.setattr(x_polling_tasks, "ORG_POLL_CONCURRENCY", 1)
+        connections = [make_connection(i, "org-a") for i in range(3)] + [make_connection(9, "org-b")]
+        service = FakeMentionsService(rate_limited={"conn-0"})
+
+        polled, backoffs = asyncio.run(x_polling_tasks._poll_connections(service, group(connections)))
+
+        results = {connection.id: result for connection, result in polled}
+        assert backoffs == {"org-a": 120}
+        assert sorted(service.requested) == ["conn-0", "conn-9"]
+        assert results["conn-1"]["skipped"] and results["conn-2"]["error"] == "rate_limited"
+        assert results["conn-9"]["success"]
+
+
+class TestPollAllXMentions:
+    @pytest.fixture
+    def redis_client(self):
+        client = MagicMock()
+        client.exists.return_value = 0
+        client.zcard.return_value = 0
+        return client
+
+    def run_sweep(self, connections, service, redis_client):
+        db = MagicMock()
+        db.query.return_value.filter.return_value.all.return_value = connections
+        with patch.object(x_polling_tasks, "is_partner_oauth_enabled", return_value=True), \
+                patch.object(x_polling_tasks, "get_db", return_value=iter([db])), \
+                patch.object(x_polling_tasks, "get_redis_client", return_value=redis_client), \
+                patch.object(x_polling_tasks, "get_x_mentions_service", return_value=service):
+            return x_polling_tasks.poll_all_x_mentions(), db
+
+    def test_sweep_batches_since_ids_and_audits(self, redis_client):
+        connections = [make_connection(i, f"org-{i % 3}") for i in range(9)]
+
+        results, db = self.run_sweep(connections, FakeMentionsService(rate_limited={"conn-4"}), redis_client)
+
+        # org-1 polls conn-1 and conn-4 together; conn-7 is skipped after conn-4's 429
+        assert results["connections_polled"] == 7
+        assert results["connections_skipped"] == 2
+        assert results["total_new_mentions"] == 7
+        # One commit for since_ids, one for the audit rows
+        assert db.commit.call_count == 2
+        [audits] = db.add_all.call_args.args
+        assert sorted(audit.status for audit in audits) == ["rate_limited"] * 2 + ["success"] * 7
+        assert [c.platform_metadata["mentions_since_id"] for c in connections] == (
+            ["101"] * 4 + ["100"] + ["101"] * 2 + ["100", "101"]
+        )
+        assert redis_client.zadd.call_count == 3
+        redis_client.set.assert_called_once_with("rate_limit:x_mentions:org-1:backoff", 1, ex=120)
+
+    def test_backing_off_org_is_not_polled(self, redis_client):
+        redis_client.exists.side_effect = lambda key: key.endswith("org-1:backoff")
+        connections = [make_connection(i, f"org-{i % 2}") for i in range(4)]
+        service = FakeMentionsService()
+
+        results, _ = self.run_sweep(connections, service, redis_client)
+
+        assert results["rate_limited_orgs"] == ["org-1"]
+        assert results["connections_skipped"] == 2
+        assert sorted(service.requested) == ["conn-0", "conn-2"]
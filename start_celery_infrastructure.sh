@@ -53,7 +53,7 @@ fi
 echo "🔄 Starting Celery Worker..."
 nohup celery -A backend.tasks.celery_app worker \
     --loglevel=info \
-    --queues=autonomous,reports,metrics,posting,research,token_health,x_polling,webhook_watchdog \
+    --queues=autonomous,reports,metrics,posting,research,token_health,x_polling,webhook_watchdog,weather \
     --concurrency=1 \
     --max-tasks-per-child=5 \
     --max-memory-per-child=200000 \
@@ -73,7 +73,14 @@ BEAT_PID=$!
 sleep 2
 echo "✅ Celery Beat started (PID: $BEAT_PID)"
 
-# 4. Start Flower Monitoring Dashboard
+# 4. Start the Scheduled-Post Dispatcher
+echo "🔄 Starting Publish Dispatcher..."
+nohup python -m backend.tasks.publish_dispatcher > logs/publish-dispatcher.log 2>&1 &
+DISPATCHER_PID=$!
+sleep 2
+echo "✅ Publish Dispatcher started (PID: $DISPATCHER_PID)"
+
+# 5. Start Flower Monitoring Dashboard
 echo "🔄 Starting Flower Monitoring Dashboard..."
 nohup celery -A backend.tasks.celery_app flower \
     --port=5555 \
@@ -82,7 +89,7 @@ nohup celery -A backend.tasks.celery_app flower \
 FLOWER_PID=$!
 sleep 3
 
-# 5. Verify all services are running
+# 6. Verify all services are running
 echo ""
 echo "🔍 Verifying all services..."
 echo "================================="
@@ -107,13 +114,19 @@ else
     echo "❌ Celery Beat: Failed to start"
 fi
 
+if kill -0 $DISPATCHER_PID 2>/dev/null; then
+    echo "✅ Publish Dispatcher: Running (PID: $DISPATCHER_PID)"
+else
+    echo "❌ Publish Dispatcher: Failed to start"
+fi
+
 if kill -0 $FLOWER_PID 2>/dev/null; then
     echo "✅ Flower Dashboard: Running (PID: $FLOWER_PID)"
 else
     echo "❌ Flower Dashboard: Failed to start"
 fi
 
-# 6. Display status and access information
+# 7. Display status and access information
 echo ""
 echo "🎉 Celery Infrastructure Successfully Started!"
 echo "=============================================="
@@ -136,6 +149,7 @@ echo "   • Daily content generation: Every 24 hours"
 echo "   • Weekly reports: Every 7 days"
 echo "   • Metrics collection: Every 24 hours"
 echo "   • Content posting: Every 15 minutes"
+echo "   • Scheduled posts: When due (publish dispatcher)"
 echo "   • Research tasks: Every 8 hours"
 echo "   • Token health audit: Every 24 hours"
 echo "   • X mentions polling: Every 15 minutes"
@@ -147,6 +161,7 @@ echo ""
 # Save PIDs for cleanup script
 echo "WORKER_PID=$WORKER_PID" > logs/celery.pids
 echo "BEAT_PID=$BEAT_PID" >> logs/celery.pids
+echo "DISPATCHER_PID=$DISPATCHER_PID" >> logs/celery.pids
 echo "FLOWER_PID=$FLOWER_PID" >> logs/celery.pids
 
 echo "✅ Infrastructure ready for autonomous social media operations!"
\ No newline at end of file
@@ -70,6 +70,17 @@ else
     fi
 fi
 
+# Stop Publish Dispatcher
+if [ -n "$DISPATCHER_PID" ]; then
+    stop_process "Publish Dispatcher" $DISPATCHER_PID
+else
+    # Fallback: find and kill dispatcher process
+    DISPATCHER_PID=$(pgrep -f "backend.tasks.publish_dispatcher" 2>/dev/null || echo "")
+    if [ -n "$DISPATCHER_PID" ]; then
+        stop_process "Publish Dispatcher" $DISPATCHER_PID
+    fi
+fi
+
 # Stop Celery Worker
 if [ -n "$WORKER_PID" ]; then
     stop_process "Celery Worker" $WORKER_PID